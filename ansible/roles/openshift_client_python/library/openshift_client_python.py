@@ -72,7 +72,7 @@ if __name__ == '__main__':
     # When openshift-client-python/ansible/rebuild_module.sh is executed, it will read in this template
     # and replace the following variable with a b64 encoded tarball of the openshift-client-library
     # package. The client_python_extract_dir path will contain the 'openshift' package directory.
-    REPLACED_BY_REBUILD_MODULE = 'H4sIAAAAAAAAA+29e38bx5Eomr/5KSbQ2QvABoYPPexwQ+/SkhxrY1m6opzcHIY/eAgMyAkBDDwDkKJ19N1vvfo5PYOHKMXJ4ezGIma6u/pRXV1VXY98ns7Ky2y8GAwnWTpb7CbDRZbP4vnt7+7s2YPnyaNH9C883r8PH+9/tfe7/YeP9g8eHzx5gu/3H+4/fPy7aO/uulD/LMtFUkTR5wD1W3zGRT6NBoPxcrEs0sEgyqbzvFhEyXmZT5aLdMC/d3bkfbk8nxf5MC1L9WaRTVP9NR9epQv16x9lPlN/57p8oUuPkkVq114UyTA9T4ZXurns3c4OdTBeLrKJ6tvbdDr/LpukvSgrB8N8MkkJZQeL23m6s7PzIHp7WaRpdJ6U6ZNHUTob5qN0FA1zqD0DDC97UTtuR6N0kk2zBXzJyiiJFvlVOouj77KiXPSicTYbRcnsFsY7vIymyWJ4GUPDf8uX0TCZ8ef0XTKdT9IyysfR4jItU26jjG6yxWX0cz6MyiS6SBd9eh39sUyL62yYJsNhvpwtolkyTb/5eYc+Dor0In0XHcHkxNhPGFynaJ0m/V+P+/97r/+HL3cHf++fvd/f6334exx4HX5/AK9bXZyQ7/Rw0un5JJkNU+z0FbyN45N0WMCalfRPuCN//+sXWPbvf/2SC8PvVg+LvPjTj6/ePH96fPKcwLw6Xi4uj4eIHW95KpIijR49jIaXsMW89SgXRTa7KHfyBCqtOQGPHtKAdkbpOBrA4pcAI1tk12lnmM8WsLYDaLV7uLMTwZONI2tyY1yzZDLxSkbywKiWxSx6WyxTXdueki2qWwPbtLa8+C6ZlKkabpGOmDQPeOY60oCUXba/+OLN82fHT98+f/bFF2231kDghqbJegXzb88Y7PVOAGzPrtKL9rqBZuyxr91McN5p7zXPW5ux8jB6/6Edj/MCqoQAdp25tVqEuRpOkrKMjqlCJz//B1AUNT80jYNsli0Gg06ZTsa96DotzqH709FgkiG1yJfwn7QocE+M0wIwPAUiA+fKYkn/jjLqxdGPQH96uvf6AdiLQbJYAFlbHCESAGGDzhWzZHJEKACNT5J5mY4GSC6P9gJt4AfohpSvfk/fpUOpbU0gDifmfsKi8R/uRxwqfMJ/3A8weniv5sD9Bh1BHID/5kXUbrsfYZ7gI/438FHPFXVH/naLmCkmcqF+uIVkOhCh+S/3sz3jUMb+6RZU6wCF1J/eaKyFwWFZP72CagGwlPp7R5chtHdHB8cSIsyhs5jVKXj/weBpUg5G2XAhaLoolrMhnLEwhyPEjf4+IijRAz6pBNnkHcx0mky9lwYUvVebggAicKdzbRwTYNF03j70Ru2iZNueJ13WeucVh1MYDxUo2XFQ9gjIRi+KHkRAW/MbOG5mUZqUt9FFkc5hwYijgJPrAnFxbiEBN0qNKOiyW90iiPaqAG169zNgv/oKf3ofAaT6iPTBG39R6GED3XA/ZjPTKdkCXgmzKqqkRXiqS2J1RX56hewNoEra7yod5K2giqrfptgHB7MdpHPxmT+liEunZ86XWfpugWc8c09HchjaJYDUA4NxgQut1sBtXMA7LVVL2N2IkznIQ6Pw8RGquLqX+ACrOaauAsa2+8wQtsM98RskpmCdLkPz1S4qwIjexaJEzrSjO9Bdby6WqsKRw2GEgJXpek1W+jo6pc10RiSdy4YwyGC5j0VjIYX2W8SPzlV6Cwd2MgHaRYiSvYuB6S/gf9Oy420dm7qp50E0R9ZgcVnky4tL68CJaEqRuBC/H0PTyFcvLnOQBJDv1WdHAsz3KC2zixng+SwHQScPgEGGJIEezovsGog297mMQwgNY3IWNK5fynF5CqVxXqm9YCmEnM2WaWjwb8x4r4G6nqfCt+PhjYz6BLh2eLMcovgY7m0GEwO9hTY61IceLQI3QzJbWdN7Ki3MQLj39Rj3IHoBiG+6hvJOmcPpiwChB4AByST7lVYp54I4qsDKcGvDy3R4hWIeyC+LrMB1xvKIYkoIyRa31fH740CZOB4tp/OSJ6NbnfTMl210/TVW2Wf4Td1NJw8RVfehBzLwFaw9ziTM11UK56ue2/Coq7jn73jrFOONPy5Dm174ErerlUlSZ2lgjgAUnreh6dG1nErhmbGaUdWq/Js+sSvddUdDRCEwAl0/PA5gDaxh2MfTGgNYFLcN6424nc2ASyINB2z0eVIAOwY8JSFtLxrlsIOC9SuDp90973QdKvW+jkrpsQ1A8qLx0S6Z5Mmo9GelvoF0oiaoiunvhul8EQaO1L0B6+rWCXgobzQAHPmsWizDGrpCdYEA8iSdmaLRNz7/Dm/6+0GsUHB17dNDr+5Z9GXUjuNYvR7B3+27wRlmrbdHGqi/EZpA+Vo8cea4UpcxhCbrI1BE9AcjR+rCjojUlc1GsOZHj+5C1vJgWodHVShUsp8L1fkVglR5E1AemG44nXd/dvXQ+R+lp0vLYTJPB8DyEdvHg3oQXS4W8/JwdxeWfniVg3A1BgkOdX+7vwDbg6St3H24/+ThwcMnu9xEH6ovp6jA7cOx2wdMS6bZVd4vy0u+uuijtNmHJqawaW1dT6v9H2W7Ff0HbJBFQb0Apm8+SYaoZGyjKrPV/nu73er2tHJxPEHRZ0bKjc5Eet1qtejf7/gjqo3xO/IW6SSlrkWdm8tseEnbAXbHFJbmGngn2BlYsuxqfgOI9oRfUpPInrBClE/TQxpeNDmMjhkGNztNbjWjmEP7BTcbR88VfFJGJwuuhMUBNKoRpFmeEWyVe9CLcKRUOqZyZiTjfAm0L6NxRGrugdmdTIg3OMfjYjhZjoCY6NlRKrxJVXshawFSHr1KLi6MzEdcoq/K19OODzJaCBBmxMFPaCYGiYlkNmfNUhHYXLLmsqOTXnSe5wAGERL/YoU1IGJaDBNg4xEqMXolzBDwP5PkHNpzOoCqobaleJx0Y6rf8Yg9gnipeagUEP6WWUi6feC1X9Gw/oyDFklq4mo14YtgcD4cMIfAutN3C1ttCatZsjYSNScDvIoo5wmSA9E3znLzUr/TL0J6TIukcMN8ZgOldn5rNWhA6+m1+MUXVzfYUW/zPYdNvlzgtcsw4n1PA2MpTJOIGCQXnBHSCbFel0uAlLKcLACTeFrxqtPecDJZh+oPu6CgQ0r6uyW+sWtiJw6jt/AZJ0ouhbhrsOO5SuqAkoXQW9zQgP+Dv//IP76RrU8bDzadYDneWyEpgVnQg7Zbd9f1kE5rOmz6ffjUN590w2o3qy2fza7zYeIP08YMq1X9LkggsMma5kxbP5omzIDxZCiyUarXwwBCBmKeDrNxlo7sJi0lAcwsnok4syxO41JIp9QwtY6wutK4NYd+jzVeY+t4ImthMjkHis6XBwinXM7nk1v6C6to7IEVC8+FkR1wXrkSdAHnMqmFFEdPk5lMt54OHBtM2D+A2TOYrzvunjDWNiS4stszkO0znDA8TKyp0OgCFKdAUOe30WV2QUcRULUJLVSRw8rBiJNsouVDgcd7+tA7jfQelUHJZzwGDuWTQwRg76DC51SwIr5IgSkcDuYJcJBdpnRn+jBq0qkHVelQx274anmewu9xdiEA1Kq4TWGfFFlu9fum1tF/lMh8NDbZDUJO5tkAr43xOAkDXRZ4TtTVMVwrsetw8AEVKlJgu7A1jS5AnK+yefT2hxOcOXhl4ab0CuDYXHrLaqrl8evcpZZi8FogesCrU5RuvGouG+7Nnyrax771F5OyT327bVmj8qrwsGW6AWZ4UokXXmcRtd7TOoUDDdWs3TAZDNNisTbKALRhgjXqwLkNWlA9Ul83Oy7Zbyn2CBXkmgjX1TVnP0+u/m21Yvd1XuS4j91xkyyNP5wzZF2QweZlEpC0XsG2r2p4HQIxJ7ECah26+yLh0yG6AbG1TIl4M4+SLaLyMl9OuNtAEhMk7Zd4GpGQAef2LLW3CRa7drdDVbsq5a5cpbwv9opC4Ao1AQGx/yqiqwQLV67Wkee5mlsrjI7vP9iIiLOrOdswwk/yCzoB1qSPqnhgeU1LYUhIEQZAEQZMETrdWiCriMiD6FgxT8J1kACAMhX95TFb7tKL6EYggzKI4vDUMOYAO8errr14b59fmYtqMfbQSKmPa2QnPGrtaq+xV8wrxmq2DJOiZ8a+WrcUCbqkFt9x1fT0nMB2AHEiAZ65JK4CxSKQ1UgLM+YLbejcQt1SiaoK6H9L/eYLf/nNJ/4ATYDgZV9mgTaCuh3Hf+ieUkQo++YcxtvpKLuxWP8xy2/MW/zPryjxLhfDbtSPKsU7+3/4aq8X7dP/L35Fvu8oXLsbL/JFMoHzFNBvBJQj+iLa39vbq0HL8lKMKOu2gOE2TtsxFx1c5iVr72DH/XcN6ceWlyXeJuGssOFErwIbW+ISXQuPbvg2iqwxxjS5qJWbtRcohOIV+a0ln8Qy4/OsQEQT7Bwo5tvlNCwckKUSyib1Dx2St9lM0cbinSYqbsYhpwCS/QzmAREzncE2LmAVcdeFbpQeEH6/i35NixxhtvNhG4QhgB3NUtjgOAmkZ6rURKUBEOG9sHZwiB0D1rGlFs5SeA27gfsdb1hfwqS6hYI6Vzz109FAUR9Al9fHb78/+l/438P/9f2rl893z2EaHASy4QQ6goaSuHeFBAHVZI4fRaRRdp2NlskEUDYZRbvRDZ6naMc3mwGPn89xqvEwFao5ztEAo3oRRBioNHUkD1D7ygoBkaIE6a6IlqiOiubQDPx72KAdTHYfPf760aODvYcVYEU6TbIZ1F+FuNMMTdyksNnclQYRTYk+9tSf1Gn5m+laHVqz6YusgVqLI3cVG1StH/0ogzAzKZ8QWDq7zop8hufo0ftPCAef9g9PB8c//NA+jNpwzv50Ev/09rv+1+1PObwPn7DtKtbp47tyi6gejZcxbcvOiusxU3w8WZaXAUR3S8kuj8vLJWD8zWzAUIIU5MUsmt8uLvPZQY9IBdDzQhRvJLzjZaAp9LAXvYjOQVqAoweZa9IliOqSip/fLkJWBA+ib2+BDQGugXa3HGnThPQ2pJ4uS+BmSINACotceTX05WqA4SvlRQAAHK/j5YSVNEgx0Fp5xDYcrPgoo04aX8QInI9P1O+QafuQTk9SsgQaBqqcwBnL12TdGEcCNANI2oKVTnQdAFM3iZazjPgiZYtAlgqXMBTo2OQWAc8LPLMXASjQRDKmEz6boV0GUOfzbJItMrp8WNykcNQfkAD2sDq9mmkzVC7mxYxp0tNOe7kY4yZDu828KI/a2cUsL9KAEZAmjIZKbt2WyyxanVMYWqTD60H6LsNLKDTf83GUb/XELUEbhYKUR6ADt52aGw+aXYWZVwJEwpZTgXRuylVBGTAfma2K3eBfYyhQ7Ytbn4pD18IEIVAWRlh/jfog+uslIEQ+A7SSnUkiBmM0cn44wxdk68EnM96YjJJiVLGn9R84CtD2FyQiPhPg0J7f1pAcKX+qSDpxwTZRr60lPiiIFdohJX6Nu57YP7ltODLzG+N/tjojxHgW0Y7aEAw/QsTmFzCEI/hfgD6qB5ikSao6HSOXw3xvleetTM+2rHjdA6eLZs9XDb328r9SsHnfhB41GVcZTsZaVc6BjlytLCl7/tXJ8/AeD3YGTfxQQiBK1FiFhMRykqbzDovzzX3XIj/wnB0QN+X3l/JHF6G+BnwA3rgEyrSIxuyAdA6zWQLPG+EBjNtwfxf4VLoOiVzLcf9BmT1FiYpuOAzvjY3BCahO0dr6+jD4mFPAakzb+6/dmNOaS3MV1vBbfOnrzAQVq+veQLxnozrdA312Tfw7unjf0ltIr12lW822qPSkBlJ/nzmsEerjUzz/ZymtP927AE4US77CUh55RuhH0wBSzKBFPM4vilp0u06XzSBUEaczSs+XIHUti3leigsF3ZeY/v3+yJZ7Hf0FNUM0Wzvuieg5oE8doyXRJ+9sVCFkgXfxGJA2HaBipga2V0HpTw4t8be+zdO9swo9tT/vn6meG+8PvrZCWouXGPy61WOlHaNKAqXEgUhftPNBxEIj7QTXQ8ia6MrRZK7LjROAe2deb6Bvdf1I2+a7PkT1zhaR7Sxk/De0QBn0IIhQkGFtqMxnkV5kJYBWVghJ19L/RcnOP9vv9f7hJ6/4f8/K7BwYpjt0AG/2/97b339U8f8+ePLw3v/7czwPfr+7LAvUHe6yJCAe16tdwqnY4hJPdZJkudQkHyYTdAb+qWTjgDpRfJqPlpOUzSPg3Iez7QaYoCG6Z18nRYYmDvBnuhhCW6NloSR9bXuDsm4SzSfJ7XmeX0WLpLyKdwR50acP+9FR9nzyXlH7QZGWQMmVv8cDoOMAmO7+yCoEDk6yG1G2DvgBZCrdRWDoU7EeAbARSqB8eqrNAyUHXNJYFYDQJc3N8/lygla4LLjp4RIfat81YetOu1DUbfJYO76pocu8lsMimy+UMpcYCJbpoPMpKU9GNPl0pTVZIql2IHHhkbmYUnMb09zB++CcuqVg/v/Z+H3/ND9V+j/PxAjnzk6ARvq/v7//8PGBT/+f7N/H//gsz4bxP1Cbo8Nz3Jb6/W0ynahYHaoNjNkhr8R2TD58IW+1jaW0vSwUMZECQMvSiV9rBgKtOW8wMMWAggSAAMMFlImnW61MUfzBG0Ppvfze2Rk8e/7d8U8/vEWZ95ztSpQZOPweLPLBvMBQIej8AS88e9SnrMwtpW6pqXdWiG4t0tVR6JrGEeqRhX3uR8evX7ziS37o20sacP8bOn50EbIG1eX+DxX6BkvRByz6jZRVPhnaaiCZ4Pl8iyel6kRPa97Zig/4cTmJUEQjadGx2CNTx7eXtmkjCHyzEsfCg4XTzxsj11fmfW9JRrW/K/NYblLPp5IXLRttskzQY6/6RASXiBEntl5aliR+4zSd6za8XpO4LlaLE9e7WduyO/YZVFD7H1eAp5YDsvRwUgsfUaI6IvgkxuJJVqbRX9DmiZRkndZPs6sZKpou85vA+mJzh/YVN5nn41bo6p2SlAOa9MAOqccjJQ2iCTwtg4s3b+RmyNQxJWPE9RCe09de9A+g6/oqKlvETo8CU9aRej/A0jFGNEzg6iWXGro1mhbFtL1C9cxNhma2dHGVmu0u9ew6Mr8UAWEwztLJCL06SW82mJYXsJ3Hg2lWopr+SJGynnFiYPN97XfTAeS7RpXGUdRud42FNnsvA2W4TPDGCG8HzsmecsQ3asbumj29pDlNP4jIon0iuqbAfo1+WaYF3j4lrISazhe32kpJTSJ2BBbvJfc+srvm+mzoEWJxNUjPB5yQmiaOkVrmp8npTmbbNC9KPLS9U/NnalDf8L/aw8NesmsUe1QgGUWv6mPI4IrjDqdNo10k2CfafStHIttluTY1XoV6Uxq/4JH/RnlsusrXAIgjNMMJWddgvKt8SkZUpd549rI7sohGCSd6jHqcyamEGVFPC1jVv6RFCZxF6zBqXe+3whc8LeQRsATuxroy0PNklCySFhK6mjJkUgoFTqv+g66JAGFQdYaN+fR732g6NGrbu9Fty7f0BGitv89aZP7qliS/o2MmMsSjrQKKheIyGacDhLwKsDg2CYCf3vxQVbsHzhpyX8BzJV0g+Z4mxdVyHvHZEnUQg7EXSA5wCrq2xfeD6CkQekQg4ZWKdI6i5myRKKWAOS7MTTd5SKohMnF1Bu5byicziy/LkKdDWr/ISGg/vyV527a61tykYa7I0DlFog3i/eQW6Op1agFJtEcL6QCQhcIDWLcY41FZpDApQAKQddY9yNCv9qJIzqmN+S2OOV8WkaVQt+A4fvvQ2hCnzkDZcafIvl2c3/LdrebStQ0fLbzNrtvRUex2YjHUpolSfvMaeKe2aDcc0sjaM+okx8fjF5BFEMablDhhDNHLG0dPRS+CNiW4amidhbYYuNgGn/F+gxUmmUXg22XEuzvYMzkaDPY5/OMqD+L1h/s/J69+jJpH2dQ/2xw43FXft9c9LnAISGOl/4b1kGBmVf6kZmgWw4csRK6mGBsnPmARzfOyTPH/I/Qo6MDL23wZ3cDWgD2RL+eOG5fibnpo3hP9gs10zUy8oAZHeUqnZs9wi7q/MdtJWOwHRcUwltgYFuZG86TPjexEC8V8r6l9yHTQ4nyzsYyND25ZQqTjL12sUt5amivBnpEDMNUXLwVboENfWVU6riIPMuJUFSViM+AmNHF5UAtTsJ0VthUtoaVMg9Wca19maqLloIr508Yo/ZeFer98Utz7ZZlM2KmOpouNwPDP05gQ7qxLooi9jNCpbIboEcAoDe8eswxmtd9jhQ/vaUItpxN4eUR4Riu8AXKsa+lDABkE/dmBeRpn7wajfFFFILS5DwGzCbnmSD8ZPhoQIYr4W6Nu1Fvu7L8CItaSODPrH0noLJllS3LHiMroZaGr+O3ePcLJserhGnLABhNpvupwTw/er3D3SPli7OwPLDbLZ30ewrUsoK+PwHIKpyroaGbYMFzt+JRJf5t0eYDRwH+zKz2w8vSpZBOudlvcvjEonKhYY1YZzzK0AjHIRNEMSfsnsjK1k452lzP5SwNi/v3fdStaCygSg0VVA1vDwXF2XlNNZT46VDUja2qXiEb4GiZLlOWA4RYs5creWscrs6qHsiQ4S1t4k5IYGdp82AkKvmQPvr3bZs9Vu3xQBdZuG5C8W46sKnE5n2SLDjTXPd07syFY2yPYbGxZZFG7lqQtZei1IW9ZObD4uUVaLuj3IC/4X0/R6mEO6uhVC+15Pmp3I8Q5/9MpfetF7VHZPuv6eB8GSkFzFhS22AvXgXNPV1D1MtqN7B+OpECdMYJpyS6cOnqD2ikKzJWJC+QPWebQvgXrGI6pWzuBZr6XmZrrjz8qYqVFi6HVfwX2hLq5khraVIyDu3w8Q2HP1EeyFHZTtUxFMwj/tsCghzpzBtcOX3uXuKJA/AuxtZUu/3NxyOvOXeGT1+yd4xaGKrlrtPoXFI/+mSh0V3LNGmLNtlhCLu13T3VoBv8FUIT7+c+lL9jgXREVbOuT4Ii5U7gLRHHijP0r4Ih0dmNE4Xp3jS3U6l2iDDX40XhDcVUN2ox/0cSlBj0oQoK9BcVPeF7kF7AweM8wTCa3UXKR4A0dXz4qk0rEqDh6QTeIXE+3S66XcgVaTLMZodniJkdC+koMyVAbkBS80mpBSVDA7qizObCySubAsuw6bHTYdmxCsZ7pzMpDS9RDGWGXLuFWqGxn5YdDR2+7+x6rGXlvVh55F36OMnVtJa39rFLYbtWop2feqg0cpBnumh6N7mNfaazCy+BiNy+zfWexxgLTWPhqpYvRo3fb8F97gLqzEqRoAH8rbx87T1KyXOQD0p2IStKJQFo3Pj+oZiiQplXQAKEghgwIM55hzBEMSG0FLxwmeBuISkByFaWgATlps7D+iNqSjT25rZBiK2znLOKQYslEi+rJaJTJKx2Wk1UzJZ4c9cHDHLr8hixYrW8cCNF7bc/XA2WHKmYRElfAMiPVKbq0Vk1u1i2NDAY9oMGhAwVGsOpWP6lQV6etfn4kh3mrP6b/ts5sI0Wywj2SXpNTnP81hulSKGMC1tpmAZWotae6I+bl2Xob1kSklZmwY9rWUyrCUjuQD/LtBt08tRcNC5FukI07LTrNlfuKbETLjpLmpKoR41bMBsO+DZSFyYaWENrsmaz4+FfJaqj0XULmEcM0u06LFbTAwI6ZOHU5w1k2VEYgR/a6WeQhfYfh1IQk5LMB/x6Ml7OhZa8IH5JzPOLcD41cm61Ws/VnMtEMKMKEi4VSqis+j0NFuhcH0VjFS5VYCBPizyxraSE+pNqySCsDqlAKd6y8szUIQ8qCjQXasqZn3bY0T0WNVtHk2zyfpMlMm+WNnAl1OtSTGE9s/2RsHpd0zqiu9EQnXNpRSuyFwx7xrCgy5CJ3N6bsmFyEElugxeG+s0WgJu5Jez+aZivafXcVFBvXoOUnAG4t3nO6KBncuSvS3K5u06ohbfpbzYyEhAmzjYZk9ybbaJ0jlA3lmDMgFtvsDFwkkGfIUetzn2/HciDYtv9cYOUhZ3MmAaajxVPUsqZHR2C0FZoc+X/9iXzDNf5vmkmZpBVTyfONFwt3PqmZojv/KVBKzneA92D/ShM96CnWU2UN4tPQOwcnyfR8lOhcfjyZ1alfzed4x6jTrlCQarNVKiRhz/VKj1L0Jz1XC+yx9M08fJA1DxqIowSN4QZJcCnyG3xns+kOxZceCbNEwUlVsIsGmVhn+qKregnHrtuSXDY5GQD7NsTO/jF8bVvVtsKgFOswti1V0d5lpzaHtZqvvXP+VbOubWFduY+GfW1XkaVTYOIdlhL/PkMxscDkWJ1uwEx0kl8oVlAnC9VZJzC8WZYv9W/ySVHpItAWdUDx4eTNAnpKOU3djBbulC2K28Ekn12Ul/miklbHXtFjDqRBlEGFSsHOsmNLsZzNOEDlCD1aynyYGf9tYqa1PiY64ShahoUbJek0n5Xpgjlm1APRjxHs8/wW6RGHgrff9OickkDsElJ/khbOa2zEyGfLbDJS7dCPHvbWMvAmFlebkGTVcUxRXsYRUlYQHmt+M2OOj8QHXdvkjFCBQie3GhBgTILmKmjRglMYR9+hxxunSycOMTFz4oU2TuxEEbgRMY86rUMcxz9X4veRFzv50yXDS+xxYHGShQWt3+flIg//MYViWUQSycDa/xqABj8qSWfyszuhLnqJfoPKD8lFoCS9guATB+0hOx+YaDnrOH7qKAMxbGHNIcx7KStABkZzDFEaSR5ciQeIw2up/mm1Xcvq4Qk5dVEzKj+X2BdBq/o8jZaWR8YEZUFqkldKSCpOGGZuX2I4GRgIi7QaEBRrS0/a1gL2JDY1BYFSOKNivpJnWRq1uZLruIEhIzm/0Q3IbtCVfOhRHXU2UOe0wwUrU9E/hFZZiSXWlHwalsFv3sELRyMVqbTTN2YXqVgMAbpjTMsITxDwJDsvMKIkSgoaLnmbJGisD5ixnMH0UsQ+6jTfXMhWVBk+OO6S4yuMbQAa5hez7FfZi3w827EwvGVIbQoTOG1V+pX3fySk7WsVJcX3JyfmP0LHZOd98yEWyTagtfY7kESXS1gBCjuK+NvDAJq/gDyaoYsCVizUXQLduuhbCRlyj6ZASqQFdQjTd6UzDoU8xEZrdKTQ5UFycVGkF4kwd++tlMd0tw0MAHSjQP8ZldYKQwUiZlBOWuYJPDcw+o6mV4y2fqBF3JD8RTJgu+G53Fa+PIqWcB5/A4+jhsLpNn2KiuHR+w9/hOfvs/cf4PhWuikHkOpuIFem9Jj+1XkfFQvb/nsBTfaIL3DrmR6c6kk5U+00aiRtPkZxDO4cGF2lzq0xb7sVibVYWavPHIhlw0YvPGbKYk1Wt0iF+8zH2Nm9TBte64ZNWt24KdsOaXXtksg82dHS4LcNGM4MMhRjz3W7P/WmZmxv5/ZStaNAe0oP0qTUt3iK9nk9TtUubFP7rA6C6KX5bghjYiLrIkaA64NsGx7MHwvZ+pY63bgFoyhDSSv9nhXlR/VrGOzPMNifStlgf4Yf0Z9THDR0C0B94hU5bZ8PERIxtRVgWrquFbPw3GutuEHoRZ9K7nI7qw8F7wAR+GOtWpfTwY8wbDeWeexnyClb4oGQQaniMQ1vSQbFyBiS9TLxFsR5ILtXdcpec1n9apITQtWuyyb7PxivQZJROHwQHtJliknhEgxOgGSkDLbxz8EE9WyJEbrzG2OG30JTOu+/qpjlmr1jlMC55WDq+HHB8dQ1QtXl9WY9tXd1iEiD8hfGnA0u9TgvDLMlxcRyBOW/WH8LIPK6S7vOYq1YfeyVnut2fyh5Vqhn69hB+U/bzmRlHbgIxyBJd01Mc/JyokiBq2sSJ5Knukm5aEY1ypXxivLhXgdaFckwHC1nT3SwEjftJF0QK45OIrP8hkLJIG4NF6QdkHSyJJYhnrAfJQk5ICUMu1VkA4aQo7r2v3n/ofP+Q9cwYe6OcJbMXazqCBo2ms2WV5RcXmmj0ZoDU00pq5Rei/MhH5W3ZayCvt6Vqiu0aF4+17UVXq9hYCDbUfdLS+TkqzitjCe5F7WhrBrhwWGmcT4sYO2n6eIyt/2qdTpLLHoYvXJqYrxHOD1wAjR4cm2ioFwdnWsKy+kZ7MafXec/202C04ZBzWJ7zWlY9ZuXcJVKWkhg/rQwQf2hkIH+62KD9fc65ILQBv/jo4XzK3THY2lsgURn49sBZhJCsfhWsJxeg4hN9ww9yQZaHh1UEgx7aXz9+XwKxEFfApkWJWUpTp571y2+Z9wrc3mk9EfiWqMW3VJQjdROJrLJV0wYNkCMIRiLOfgVMSEJZ2+9VHEzo+ssUeYDrNEs8vOldauOGVMpdTYrZ3vie0j5pmbL6TkQxnysJop9DhEFYTO4ShTGb2c2DmmaUBFLAUFY26kVSZT42JorSwXKc2OCvY2LtLzU7biCfEJpy6EkcmwSuOQ2ViykXgDkFUsdS9RMYs6hRsTGYsrRtHQCRQcUF7xMp4Yn9dYn9l1IKcCDgiHA7fyMUpeo6WejFSrfMK2oWNTqheZASGymi/N4bKwl9gDbklnJRqCUGFMvpVEIVkYhmXPxmEKlqNVZCRurJ5OMvxwEWnmnaWvKEsLMgu7hEB8SdTVy/OMz+HjORiOMa+eeBYlhzdU2S9T+weyanGOMtpl1F9HJYlhxy86GNZTZ2KMJ5fIClh3xepZrOFbrGmuNiQqOh43F7UtB+9qWc8CvuuVrETmwIxHJUAYCX8XJVZ9JzS/LmqGSEh1dQEwiJVaBVTqKFHwZ7Xe7XS99zChncoupI+xJEPKrqapb6wGa/7Hqs7p1FMnMVKxKvA0pF/mcUZRs1VFzS5NGCVtlc6kUphoTXGaN7G+kt9A2zUOVh+fsHa44jFUGq5l7nntbcNMGhxsbAa4vqNkp7F2DyTUhOdH6OwoZjo6iPT8toHNfbM9KNR6b/VVpgY+CWuAKggZzswSWBaFIZ8P65QfRnzAgdkSniY5B5bpQmEs1NrWrNCKmDtRGJ2AD2fMGYLuNGTZkHVOTY0lsiLduOgY2XaeQMzUFO7TDYdP1yQT3g5yfxm7QIP7f8qXaHihV+VwSK+eIQYgokYYY5i2gsylSMGumpsmt1ZPlfOQEnlLZu6g2JgZxA1AR4WPLDpHn8QIDYyLRWU6d+VcymIF1HyhbmQrryeYs0eDQWJEQ17kXtFPyMco2ZwFpVfsKUd6ZAZDKAcmoSiTbwEzdb+KQ74axi7PcvqM0RuauoeYwmSGpPk9ZTP7cC+aMLXj88Yy1AvbgeEOgTcHdqwJ/WvB0wIVbcZGBeZupZh9q9qmmffCua1xDHV5JqsOWN71oKzPzTcxxzHB8a3HsuTG4aTUhsqKfDTbhb4TpL6uR64bA8vtuIpkVMK/0iXjAsAohr2SepJtN6IMx6Gz0WYN/+kO3610GFGswE0B+11EUrsSLdfiN9XmN1W1tyU0Ug5DCGF3Y12IiAoEzrbCkuo18uQgotgO8hZU+bd/Z094mEIyx3CbEZ6O6HQgD9Y4YLgu06Wmk7TU75adSzFGVS0S7DFsiAGnF6Ma31s4Qsx44vfuLvD+idBsWX+TbElonJSYVUUWtUx2FeqcxGj3JxXhS0Giq46NTxohG5OhEnLw4OInNxn8a45+e6wilTimyv5ytNH5syXSv3NnIrFep+v1+r3/+OfsdE9eIDu3IoKMfBvjI2fjBKz/djgnHg0vZ7hKTysFxdZGUFWdlJ3Brjc8DQOLFpbjwMBIHywV4jvoEkEI+HFcS5zuFe3oFLMkJOvO+ppCyz9VO6bRN8CdmQ69TRXz0fn7/4T+NlkMQIHyLAZhWBBKISh/NVK1FTO+m4wBQcjPWdXndm7DCUifjhfEkOYdzhCk0XalVIng1cttYxQ50wCSWGq0w5s1+87qe7zfv3ENQj1b4WWvdnuuJxo3nvoOatK7vxhlqmNpeW9KQ7WVPTZenOAVORK5rNRaJqh+My3Vdkbf92GNkrG2tE4PrUQZSygcecubtqXNbyET1+smM6yRFPTJqAeEsLRdKyJbjFC8Uae4U01o9QiVGHfULD1LUzaAQVBAG83tLkZ+79qVjWTIJCicDtFTlUxhpVRDTwzch8ZSghc33+7qAFsU+uzraWgGnl/Il0hmeRL2RjBdo8qv2gahdgghfEdstNBJ336BTH2NSBYcaxfZs7I3FQWRPfeRhs+9Bi1SHROzEck+/M9JjWt6C/pjKn4oIWRA+CSUy7X9aciRwtBOSAfs5yZLqhU+Z/KW3ulelTtbHDUiUtZD3dGozOmXQq4lMaQyz1ueoBs+aidh2VGwVGZujfaQK/Yt/04UEmZxAry9uj1ryVzZsVRWYQQGOmqkR32pDQBhFHepzj1oYGUS60GR3bEtWplkZCAzvyM5EYI9Pkg9wcNfG/lAt6pBudlO3PJ6Rjw45sZVrXlUPohzPsFO4rcQqp1ErqMUpuSOZrKPDhlJApobLcoFGQMtzzmTkKCWss2sWkYG/870M7UQvI4eiHqYSETqlcZGU5Vp2idqYsweTxKN1goyr6gkyGvGdMitvJCQx2aoq8wUbAJ5GuYTH/4Ec7bEEyf1nlcR44aOQCAc1IJSEJNxKfDJVPBubGjEeMJQFiMfWpQw6ZA0nCYqi1ut8pP78EYgG/e3K84t0asOnv09rUfKw/+gMoZB7hswpTAFPDfQn5jhXeBE1SfEmqt1WrALHojU4xQlyUzdvU21mLZ5Ug991mfAMW3HapixL7TO3PRxoGsieop4HSjHmxfbuUe5ePRDpvHXDp07bt+IVeJ6y1kwp7kYjD84NTBJ6BSajKXpMJheo0BrhkYpT0idnuz/im2+ifn6EiYx+1t7OlNbIdlfkKOESGNwDlERt7HNbdVrfFmK2pDg6yclB7yZF5hYLC9K0vSGLydCUjXs5LpA6WKsX+RqxAumpTrk/6KWji1VujpGM1KYhw4dVS1CsM1onNLaviRp5C69TJpoEe/goq03bTjNH6xB9egLNw9hrikOsPSydm2TKc+XfpHCcedTPTTi12QjJdome5QJUh4fLqlyW6YnLZynPOfOdbCKX2ixNtS1M1ufi3ozmWrel0UkYFkQ0ujmSLpLiDqdMzZFLVG0yaY02GK7d+u763Onpd2QUh2CoopuxOKLA9kzdr3oo2cys/sREt3wNZqDBuRcSvlLkCriXFvEw127mM4nwJUepurDjSF/YSaF5YT6Pl6K1MTck9Wqsb4KskWU4o5al6cLTxhIpXmVvGnTRHH2ga2mRrZv+fJChg4qSGQlV7e39IHqWy7WPTOhlwqYi6NZSvEnJRxz69182more2hOEvRpWasvg4SiJ1dXbdrut/37OzvJ2Na9x+1Pfju4fXe+76DXJh1evsPIzuljGIgvfEshEGAh8pOOAArZI4IGnurRTjpUjxfL8tn+ZTiZ5/yYvJqO+251lBm093nv46Ku9g0f95Mn+4/7+fvp1/+uvH+3395JHT4aPvno0Gqd7zrw4e6/ALAGz9dag4jJV72cGzdLfXXE50pEO8aoEP9L46lT0ZFzlI621wqTAmAIyonf8BET2u8TIgoQnZ0IUGN40vjx6l6jJ6PH82ja3ji2DfbcnNjgba4H2lbGOnBpn+a6DxwzkmfbNfEqRLqwCjHzDIp30p/ksA3m+7EObfTKNAgh9TITglSd57NDEa1U1bRoa+bHeD6PW/v4fnny1t//o6z/YXDlh9pOvHif75wd/6I++fnIgmP3w64f9vYPR14/2vtp//IfRfhizPx433W/iWGQX4PGG1nsd7DWufoy5aAhOPGAdt2SEvwCnwAZ4mHJxlIKoWaQm5A7z3pkV08JIerQvsoK3QoWX0l2yMs6gP+FlOrwi0uHtoBBX05nneNOekdMSiRLdgNRqB0bR9rRhroZLun7UZKmAveIZHZzfDmA1NS2wV0hkx1ifZMFSGpBiIqSUk9+T1Vx6kpoDOOKd3wDllE6lo1U+mz66qJJeaxXEiiCOQfzg6oImOm2wbbycmOVjnHAJjYh0EveEjBxwn2MGeta8F+T4iNDRJlO3ZSz4pQvksZQUw8ug+UYTulADIf2Igx/ipcviZxJJHlQngzmZ4Ut3RBq0UrhamNLkRS0Noyu1rlxxp/YDfrYZarsby8I4ARhkwmuROxub464Rud2TsRbDVYnVSK76vRmOW/2t4rj6YlvfIa8aoofN6D66hQXIhiY2qxDDCbkxJcFsQGM3YBC5DxF0lZPW0BvvotQKvmQ61udNYHaT5EobpRwWRQ/m6EhSJSn3DM50peJDVcMtpdRKvAKSIy3bwKw4VhZQnik7yJUxej6/tehAUMgMd8FqzOsFdwKRh/+wQHEzdlWlMFR+k6F4OMf+Uqs4vIraKXWk7oN1Pnrr3BiXTm69PdH4UkxwHGWlkbD85MwdR+p8++rZq0PUF0QF+vmhMzF5LQqVAk4v+q96LkbDRqoDeCH2P04Z60AKhRCpkCTCx1pdJz5Obm72gm2uQMkM9E1QefS+TT7p2GP0rm4f2rPzwQvQooboZHg3kqw7GjHbMN9RnebwOBQOI9yoHzGurvFKue2ArG5+o4atXVPXsiMAUPk+V+C0IZtAs2LG1EGzisRXSzj1ZylICQgaUKy/McR/5Od1kOBTbXsV1Xmz+VYFj1s/zdDhfkYe9yoV4fsPVuwwurfRRIT5YysKubX/9MACMUFDDCSP70gZdqwbEJxiVVsePIt8gC9FFUvaI6WWVe78tJ/l5XrhR1+nBQ6QLpTyIUFFUa8QS4gZ8lq5jjnbJ9UnuT9OjDexUo0G78al16RgTYoiuXWcKJFjU3cm0pxSqJp43QGneRg7tohenOg2z2HbdcJNdjen8A5y36VjkosardpVZwoP1Y0Yjh0VC1O8HQAoM/JE1YV7mgMppe9W6A4JRsfDqAC0A76+IWR2TIwzdzIKzRZpb2m2UA2y20XQr8jXIlurE1Yj2wVc5hUVoWK87Dqz8Mo4rUhZE1Yr86KMeVPfXLmvS9txQtwmnG1paXdxIHWq3QrUoJ6XWrCVvNI/Nx4OmXG3nE1bexPOSmBA2CP6a7NkC9Ykro5VWyWJ7uU5EEPe/TP885Qi3p05JNAdozW6070zYHrEZpo0MRLatun+fTAAAZgOl8GgSQB+KpftaQHiY/areBHMs+HVhDwKl3ZQcVRoOJ9MwAFgSDOyLAISsMiH+YRjOKl2OVQm2nr1nVfRa+ciAVZqOYShWDBfIm3IZuM8QnH5MLpcLObl4e7uKB+WMV9DxHlxsftwV4JS7nIP48vFdPJAGFV7NoLTIBP43lnGFh2Xh0GDs2oYnhYeR25pOqDcQoLtqpxCfl3og72EpbuEEru3eSW9Gf73XM2yeTU5cAcWONUTfuZz9MYIS1iK1nuuIlfMH3bVb1xr+N1SCogBXnR56ZVoNQcgumcLXC3/foigdXd+d/8EHs1xD4aTDLBvl270MDEN4sTdwNiD58mjR/QvPO6/+1999fCrx7/bf/ho/+DxwZMn+H7/0d7+/u+ivbsB3/wskYWPos8B6rf40D39YDBeIq0YDJAMYSCm5LzMJ8BWDvj3Tk0xDoSkYsPs7MhrxKEnj9SvLFd/4d5Vf+el+qu81X+iR4v+uwDe4DwZXulmy+yd+hMtaXa4V7HqDCrVZhfeS4zXJK/EV0zBV5yQ+qqtTaWA1ttKASFm6vNwWQw0+6TVIbN8gP2+Mh1h21Wp9JLD4sjVW69WypO6Qiilspi18ietUJKPJ/K7p4nqzs4OSVu0Rp0vmJnzojE538bZJHXClllBRnb4UERHJNFZyewZ81kvUZcly5ElAP92AtiJo31YnFNniiXGjVCOk1Vk0QHD1FhaNI40pp2WsUfURqICFmkLMOVPSZ/XSjZXNaux08D/H/z7j/DHNyIcKbXgeIKuezMlsdk2NUa8tAHoGeOuUBjvpBgpcRDk+9QYO5pQ685I7FnWAl82A+DG5K3kmBNW6tAZM8MSdJJgUSwmu+VgMg/2EuN5z4c89KIi+Ek7AZ3oWGwNAbsmt1rZmluXJlrAK8kR+cTBuZD8IcwCI8uRkXqsXYvcvJ9cri2BDNo15iz6r42iQDpIb/8QKaJGyIGxmnQcpNARy1YV9x5FmLadS442PwsoKhS3khiNEkc2M/sUzjuhMBcq1Wvjfm/BR7xir0kSpIGQGu8jwVAbTYBID/fRoKiV1cDwelMoPq1lEKKiX0FPHdt7SFoygRfPJeyc+GTKd3H9Vj+pbXUkoR6HgsdgVMFzIEWXGL9faVb+/NO3z5+++vG7F3/SsJak6fqZLRTxzc+xu8+kZTVMtNi0d05sTUFHI7FXyWCyzL73XRDTNVLDD6wq5WZrrNS8faxqemZqv9jxobqqQW1+9pOV90Kl4fVmXfVCZHw2NTNpbQgdbi5z4DyakeCT2WQ6eUNV55elmGbp9bRnmfu72fxKnXCsyA2mFXu2zpwCNzZYFpPf0qSyC1i7jN48P3lLjl/QwU89y6eYhOAyv+kL9K3xOdj7dVaCXCeXi0sQqK/S2W9pQRCX2lgX+vUZ1mGx/eRTF9edbFypbJhi2lLMhGnNfZkM2Ge1aREoiglSdredEtvuUztR9Edp6ZufHc4zGYT9W6WlSJpiRs+6A0CJhz0OzFp8JlwwZhJeJ8v2KsSA4Trrsh5qeLPq4oieYrQ78RdrTZxxAWyGOnxXqvv7T92rpcvxqIubMSWKEtsJ2R996XA7UkyOYmykgCTGUploKaINWcDYPlpqZIHwNArAZkstV9XOCvs9ri4vGtjq+wIvgKIdciSworKSQNcqK6kUDU1LepIuSodzVLMIK7YsXTlOPglBlXIquBEtL4mrUE0NlZZGCfFKCkdzmwQQNF5jfT4dxqkJECd2NTZv2qsUwBrdx2OG1ZjkDHAWrLr7JcMixWvk8KuyUJE78Y6Up27TXamOzXd3JMFiNuvg0cjUBycOwwU3o85zVnSQLSY2YF2Ua7MuQ2pV66SEUQBiCom5LDnavwo6iwqKK14lNnGk3G+SYROZPOZLYKcoNLNxRQFiNNVgLT+oXKUtyZxjR3WKK6pfa1T8hOdVLZGiTmyGgFzF5U+WgHZm3THlVWj118VDgtDu1mAZStFK/GN4OVlPMgUIRtDsSS5RmlP1Jivnk+TWse0YTZ0gbWrCVDbrhAKm2UJwY2gOJb+i6o1asKvYfT6MnnGODKO44ryHbjvJBHNc3NpZ2j8h5nDL1rwJPoslb2l/MmZFqpo1uZV6/K1SB2bfil3aFjdX1MCoulqxCaim/IaT6zwbmakWyzbW2A4T3l88+6hwvs4m6YWE0mMDPUkGYvwwvuhWlIXqjGKX24LtYsS4G7vCdKqN/23z9aOJaaHZPzK1xj2Cp1N+ZWhbcHnFfVglC8hKO0p9Np2mIzR8xaDXY+LfhipsL2aHt1FLH0Rs7qzMGBnmrkXd2cQjZsZf9QFo4zd+qDbphL0F5USgwH6WCYuAtXFIt2TKqpxOKG5aRdvOpj0TENicjVur2uOyfdGr2lVVizY1tJCtZdSjgJfmOF+LRrahTtuhkDYaq+g/JkWO6bwika5p3pqU2e6+Db0eHNLqfnmVzcXUsU9RRdpn+owPyQuynSxa6NiziK1QParsmDDIHiGvC4d8gddxA2ALsnwktBqAmVucJvaCPA/FkExn59QUI96IjHOnhWToTfTOcWugn0C82+/kBKuN0/wa6W81MiUCosTgCMtuwZ4FopRW7uJS8d/9PhXrczHfilD5KuHkWZcoc+4JvTbj/FyytEp3E5SUuSverhz08P/FdpyvXmPY2RlM7S8zRjMkuMeTSa5xdPedZQWGP9LFMObUbyAASa4oKsFTVZf9szHO4ybxpKEhe0XDkQtCDdoLfGRtPLu1rgHCi93YIhVp6T2/FrFRQa5tpbchPryfQx7azZoI2l8NVEWO0j+hK5W6S2V3YAlQD+SJkoIs53rjamNknoSbS2ACrLPQIMWmp6EXA5PvqRc5BQ6iLHRoD8S/6CZ+oO/5B3lBBQbkC5aPPZr1I3YCrfJ4T2tHf+VwbwW0+SM2/42zu9cFqgQU1ThdEZObfxw9VUa/CZk77Fou/nz9yMGRxKZAgyDKZ/nUzSQKca5VAFbwYTXIkTUQ9gDSiV6w9o1E5wreFlMKAsUAqQt21vd4/JcBZyWXpQ+q3YFu58j2PyXGTV9gyy7lMfY4J1CmfkdlrtJaXgFWRM/e/M1WDmQlBuJIZsN0bcToUbuW5d+6FXF865YVY2PKvUkRcdZFIDfifo25syRwccuamch6xtrF99DDaC9sxNJQu8zexcru7naellU3v0znhrZcJtrvQ3lqMxUIjIOMZ+uEicE6uEniMhmnA6yI9ewOe4uf9Wj7+L5GJPxRpEaSiu1gubIvIxwgEwFCNwr7QW05ihosBV3oruoE7d7AnHOsdcIAbcmYOY5Zx4tIsilCZyiVq7gJkF1Hwi3onFkgNk1uf+VILKmxDo3SpMzSwm73JJW8TQRUG2JwFAI0jgXmYdQja3070hKhLu3jZD5MHVRxLXd1qkorKiRRnFA5d2KCZML1XSdKcaMDfiEd4xhf9jWFFf+Jlk/kWJk/SaEJpW4KOJ8les0MuJBJdpVakNiT5sUUBNIT8stASLE7dDfkF0f46spwGXWa4mM+QDrW5sSdUpwclyk3IMvApFSDowMTKuJwcZEkmV2hHN3dSXSJsBLVMh15y4maYzZfdeP5LQkzk3kN2GKIV6UXWFIlnMBenA3QA0/cfOlvEhuRBv7iSCujJJ3mM2TAw85+IulM8mEyGSCGSZhQR4JBVgLY0EGZwlYfidbKb8lm8NySvrorbNZm8dVtGqJyGWnidQ3FaJiKEAXX5XR4kEBV5fRZXWTh8a1GKox+basVVt2sUQMj3Na8uinetvQO/joeWtsROSnSX5C0QmUweULSRiO8Cw7uhpt5hPlNMJyAFdzvgWRioJLIz2TI046WQ+ZoTEDCR/FXUcdAIQo4ygoG1I297oxzFH84q/JFRs5ICzLhuUYtOBq33qBtH/A1c2ClzjOYVU4dBRWvStrgVosYn4/S+FKKKIl60M6HbfYYoBxXkwmThXy8SK38DdccvARWkO4JydR7IC8ta/p5hin0oJR84oXutOO2KTNN/pEjFqPlKJc/3TuzPmcz//P+mXNw/YAro1yrgUt69ZSPrJ+Tyfwy+Vk4SBia6jQfMHGEeazRI/oityO0PKAIuhSZjYcOHC9eQBEAOfA4YohukG8hRZc5zUt7kpHGTyQhF8eHx8gxuxesf5ZsXqx9ZNesUtkuEvI45L9NI6IIfhp0IRP4TfQIf3RkOo/gJ54KPH3fHEVfrYokVouEDRS7oRFrv6wvt7ZFbrWqeFTUFqlpgP53R5oLAZAKIGWbRAReI92wOF/bh2Chb6L+fnNPPKG/HRL6/S5tq6zks8EivnWx1iopwa3JCFmVVi5+Rkti3wgg7gyE6LCyugveWa4szFkXuYE41aQqfCORE0XBqQInWsGBCi3aqiCWRGp1YCG5n7BEW5bYqXl08yaGUEeRoZhJOs63gEVj2i3l+WNkzi5AZEARZpcifqpQpGFJncA0SOufXvlnIpN4YSpQiJbQG6S6JQaU4tIoI+0OCjU2Uz/MC8xC23UWlSqGeD04J7ZU1lh6gZnkhgHodDJIsqOEs5jPlCGsFRpWLG0dvQB2sWKpoTVUp+oIm2JwDV2M3dUOVZhi896ENsOv1/v2NyXltHGXWe+Z/T7krtDrD85+W2G8zEuyTq4j9dxJPlV8jIF8Qyb0yuOaxVdww72l2IC81Nxg2B27i8sMPEzwNEevSttXYVOK8Ru/oHjt3UsEoX5K6oRjWA4xtMF4OTFW7UbD6WZnKzUpT0gl3ZFLYo7N5eojPy1d4hhjzHuo5FWogbBIkk2P8mI1PVIxCf4ZVMhJ7GY5yrT7Y/pv+2yby5l2FbfbH3U5syaftsHljM/kOiI8bYX2RsY766Qm/YjkA+sS41Xkt3r9zJTPsg3DL6m+TAubp4oIqag5G4QNhGf0VCZV70CfO0wpkzOAlt1tSdMlRvdDXW3Yxy6OBGVNjkRkEuzUAYY4IeOMlxsI5faT82E1TntKLWVZaCIyWJYzzOxK5mCEgQrAST67MJYtFQ/Brf3vrCVekxOxzB3qXeAcvGhyIsVIIts6kb6g1kv2TlT2jEtOIFNz/G3qDXrH2KDHXOcG6hoySvCffwI+3VHMH+0iNkp9PHVyidsxlpzwR8cS1qZr+ir+wMNkjlcd9WbibUa+Tah4E2FFfDmq9UxVT8WRag2iroPp4F8bEPe1XU4tYv9jYGXY84NnS0zAPdcE20MyHw2mmGByWHbwb/SaXbFNjSCK2SxecuW2lWlBcEARLGOSDADEBj0WFdx7iQnTMi21ei3DEcEX6V189XXJAafPgSfah1KKN2odvpc4NK3ydjbs/3r99fAKvuvZhA/GahH1JPARo5H8kM2u4NsugCt3w2B2jf3jrtsGRp8rdx2AKor122yKLp7TOTR+sLf/dX9/v3/wh7f7fzh8/Phw79H/bn3otRb1ZR4dPtz739DcDcxMfgPf96d7OCs6yFTZOjx1hgwfl2VykeJMDOdLeLtH8wNSzy38ePj4yZNHf85aHz6cfbDJgaw37l6YfiuUglUm6EpedRv3aQciKBzmz4GWKayTq7PKARdGoloqUCQ3fVkrIQVqayLHazjkfh9K2qz0usv8/gMvrcWSykTZEbt7kf1S3cCdbcBhEgFCZyRbpVhzFm+kMWwgCpiEhiaGbpydqWipq6U1XGNe2kn/1k794FKdEqNUN18c1tIdsoLRADGYQ0qX5MNLP98Lxs9TAcbkLDfkyITAVche15OqrSNlE+q03t3+2kL9QotIAv7qkrpQSZ4+sldjaMes6MRbIyX/evY4/8y7xQfRHD3eFpEaH+dCIn0spanC/FT0TVe5g+vIcDDZ9QPGrg4Uq0F/MDGzKxop2nW24553IbdGCAHrLot4naEKG8aXnGQTL0ayD+P9/fjg67an/bBpn7T2cCNJlumMVG1XHUtC7o26tFKUSD4J64r1oTBuh1IChnZNQ/j6QN6YYK3R9T5+2fty9GiYDId7UmAMxyWwfMCXf5uU2bB/vASW8E8nJ+j3/GfoNZCwMjp5/ePzP72iGmO6VZhRLjItvyJS4UsnqQ9sGXznWDFhB2uiFnNZloBP98/iCUvF7euQMkHm5tFHLIIfzAQvIdoBn581lkZ+ktrLtcjSZNcuxnGOwoZLdlPQQ9RoANVBeR1tRGQ3yOw67cW8MYRliy8y9Wfl4FivWmD+10uWrqyH1K6jMw+nxLkpUxPju3OnxUdubUk/y1s7IWWobO/73b16dz+Qeic8iyruIZlNgXCOob94P6dFf1n206Rc9A+sZDTAeh4+evRQdVi937DfDo1JcabSUSdEbFZRGwN/TaKjNHE28qsqxJVVYMhM6ZQ3PiC128T078gFeVAB6ZpwiorbbcSBr8xPXszGedBG1Nv1kvjM6N6xfTpqe1ZqjUfxXjScLEs0tGbGjgPqs5qA1gZNf1ROZeLMzlXaoAfAJBC+LCiFiLtTdWgmid0DmBjfDXmvWgYUwHwABUWdOxphk+69ntBLJFzqHy6V1Cb77d8Upde2n9drUXi/+EbUnEKku9ZFuCtX0nPK073BTaTJFh30iLWwepxitmLlJaFOi7J6ddmsQDkmlWbpSCOldr5A5ZgSVWiDf4TLAtkBZws5puy7UJMS3dhCPeU7OJlqS4VHPg1QE+0kesargtEnmRliG4vxBIpA9mstmRhg6IeOl34wdeZ2QK4LLdBTzFSJZxMfs4A3Ol47OuCTjZ0zQVZOdaAwdgp1Kz47h3thTKm7OLDUwqTDDcYBrMEIS1cimV2Nz3aic4NqdxucUxTNbX9+478LlXY09pHtiXKz8bOeAeogPczL1P9iLG7m+XzJWQZ0cHru0Ty5RXIiHZarFwSiZsvCSDI/Vyc0MG6Xy3M8f3fN4Wr/mZXlEv75au/JV4/ogL25vNUEv8yBSKAyjCDO0BSxBAHp88UzZBzSNykk277x/GJoMsIJSdGNWKOcxu7Q9aQupq9O/9Uutn8bhjbKeQCNTPF+Jec9ogxuFearo6NUW3DOMUrVnQRhfU9a5OzMJiTL/Fbx9dqfyWTqQAwx1r26hOI8tYmbusJSQb38PSlGMNwh3LRszzXK0ZmA9nisFUBk1EWa1RqK4zhXAPDykrfYUBE9HbocZisdj7NhRjF7oo5YwsEeMtdG0hW5ArKalpCsvO2SIfDwpaHRRjnTZT2RIhHny4tfYX8mcZGOLhPi1XcxYNoAPsTDi+y/stHR/lcHX/1h/ytb9VSobGrWuUG+VzAbyAp4WEonL20NNxm1654DdfzA5CT76ZqSoVOQoU4tZLdQTQZKq+ce4//lVKEgAxbcKvOMl7dqb0gybwzo2DEbpgcbpttYD/lQB+coL7gDOPZRqVNtEmGfGriUHseCson9G+26jzZ/29jcwn0+iSXcBi1Z7KH5U7GvRTqfJBs5PtYbxa26yrtnKtdjKsXK7q/iYEvJJtG8j6z02OhOsYdifSeruAZzqW0OFENSMWv+jbM/G7sf3LM9n86+WPDunsI2UFjyOZLgfdNkTijWMT/5Mm2UFYN5srhEXMN/dXwseI/hkcX/VL2FlRxAZfmJt1uSdS1gm2yiZFk0z/L2HVNoAN0hMt8v0il7MTlms0KIqFV8TY4MjqjGbKgY8nW74kMrrqcj5FrIV61Md4v0l2VWEB/IpvnAGFAYGGpdWBnpMHCrbkAYd/b4nHD8hDnMHE2ZXa8yy4cYi4SSHDAHnfmXtlCDUB0YV8vJRL3NUjItYlFX4IkHgU4pwB2Nox/zhfiI4QfT7hRdJ84lpSeFz8jtsSMHkzGXTA13MgpxJfZYlPQgKoH75tsNmqpu7I/ZwqBD8XQZ06gjcvRluUUUFkZvoQYkV4an7Xh+i5rFGI619lnXBH8kcJTczrRGaZTR0dEL9ahQl08H6shVehtdo3t9NE+yorTWrjKNUUfNNvD05+h0zhinFpYgwTyQ3yPg8TlQZZbc1Iq62hu9cZxDUjKmVvvBASyEs5Aeabzzzz57t1EKX1NHMcHVq3c1PdWYDfqLSeSaja0RVGtY30ydER4mRIJUg3YEL397NPrQKxcmjn22UEFQcJPYlxWWNUEFwMooEZUaaHZTeWll5UNqpr7jsjWNSZVHhMHcilFexth7qKO7GrhnoKaPsDD+Ff8jz2a6eI8b6+5UauFiSY2sxL3XqWneWgx739aeRtgWHyL410DvQauLdAmDlwcEsralbOw1EeP+xUCcxK3M1u8TPtUAI/ZD2zbL6UatwzOHbNdRG+OZp7Nhjm66R63lYtz/GoMjAO/ZPAUD5CHEBESNW71aMe7R9NRpASXOcYxR/5TD/SjMgT2lHf0ymW/Dhjnd4Zxmh97J5rIgbd7MUMrsbCtRnQVGQIymAY5u5LAlZQqH9YJ5Evn7N8KQcG/ovPuNcyPWvN2zIv8UVuSjGQyFbB/NXbBzAMIydyDnTx4RQcNDs9aHZHtWRPq+Ph8iFX4TTIiWpTk9HFN+V9FtgPK8UgWkEVe96JrCYgELAcdbQTKsYWusXk9Pr5CmM4xYr0fn+p73+Vy8z1qsw92wMnfHxtSzMBtxc791XqeyLxTz08z9nBAduTPWx2Y/PhHfM5yglxUF53qTXgC2F7doJ4YWRZ3ctmXW6RPoGkt4E+2mlRTkbm2HO0zOMVhphi0DQG4aqf0lBraVSy6rvEdzOZGiylVLmYVVI5jxyI7hbqK3I1M0sfkrfCjtrV0Xls7+6RbU0fOPNAS3gI6Sf6QB2+QN9xN1w0VXegVV2u8//HfKxn6YRFib0ChYXReYqkb/BrnUfHiVFszIUMpfh2OlyR/owVKOHJzy8m740bYxMUBXDr8v7X93hrV2esnPEc/fhB1tJ6gcluua4Fb7rbI9G7MxOAf8m4OFIY+Sj83+h/1GY0joC61toiLByBUQ48YISCe01bbifRYJXTnXTrruGVDtgdpQA2u/Vog67MZDy44NIMSGrOAvVbkbSw3AwFHKf2lwNOZTLG6TlTPnhCBaTAM6DHfPEG/F/in7HO2IClNzmy+jGxYEOPzkLd230QdgdKwNyLd7eK4xObU/OUcX9R56Rf/uOD34Ifn1NiKTJFwxyl4wKpKLC3KcmGlLIYwUB5sYZigTVtTOYyxt/UhpXqosLR4GSFAylfYdZ8enJKG1I/PL0XI6B/7WKg7rhl1ZHD0Krpn05pjcZ7LhlWZUjciDeR/wTp2mja/+remKK1TuMNjlnj2V/zLcAvLcCHkFYQ/wF2rGmjQrdKVIWZT944ZjxpaU7aY4zxYFopWS543dj4gURMDoRpLs/E20KvfSli5639pik7nqlWgnfvCpksPdlj3Hh6ysUNJgD/ClMyx1YehcqdoZUnla0I+xJK6K/Byto7vmvk18PMORN/kxt3gNhazzv6YEUCbM0Q3dL5qK4W5v+o7H7QDQCZsLhBmyuq28wppaK1JOYzvPJ9nwtqkk+1sQezmoxjIK15HEcgOVWHBVb0yqlsaR0RRMscXGYpjrScyAjtz97zyyf4TfFG5BF62cypYVk0WGhGxonDNfNL2waYVRbgTCDht7J/2RrZTUL5Mvlzyo99btCu0DvI03+8F0BPHO9AF/uT7I+LyvzGBb9+I11CCwxcKdaIsmnum/TOdP2wSLRkh/6R7J1rT9N1/ot25EdkqJngNzWSJ4HZ6daFw+c0JDE4u7yCYgWA8MN0kako607cnZCiLMhvwZHod8pJHI33os1uY/DFaWAs+ygupb5c0KmURGQFHNJgg3CCfYssgWt08lQVyAhzINwsK5DqgGL1bBuc4ncA685ASYZ+ugjCBoG1vuc/XA3mwTzNcJsXntXSwcKoWahFezyW1lBDwK9ZeosVCT6u4WE4cAWjg1Azvz94dLKcORobB5slLEkq+pIE2JW9fELa0hqU2NW3X+hFVeU40TjgBKwOpa1WBDVNkHI2WOuQj5GStjS7+qiylyMvnt2d+oJfuFIYbqyPKr6w9MCNWvRiTlmoxfd4uZ+FkQs9oIlZgrtA1U/9CMoujk7woVNh9rnWkWYVdM8Gv0LA9yuepP6yvOD3K68I+D6yp7U+5f5fHSC3elflY5ZOdRtlwNRWBncBQF/+BwnrWYMJq/Il/kQNiP2m+fvq4787lrPIJVDBc+q7k7GgmcIUftp+zu96IRuM+buEyI3TVb+Wbe4j4387ZjV/44Dia8rp+Oi6lSZGYHDtffrXYKDDMngYBJ1DTyP7NFx57MYFFBI2Rp5M9AKYb32jRb3wFro9ubUPYHzby/VZQIif84M64ST29LJ064/p3RCunPKqXqZ1WoBsXu8cW/tx61SaX3b6FHfcA2BUi9tJU72b2j8x3XpOQ0ohh1dGSj6HySnyu/pJRfTfL8irOsqOgA7+Vfgrv/1UH8cC8+2Ps63t/76vDx3t5e69ApQsWUChK+eenaWz2/rNJSYtk/SgfVu28qpem2otqsffFRBYGrbjevkxprOC2ryge7fot3Sl9hUAw7OkH7+fJ6GIsne0yB++9iMuI4Jl8LsXr49LpyZV6BCy5+asl5fp1uqxpv0og7Sm+n1h0r1LdQn6uW8NiyG/YERIEgell9OeiWIhSVhuhv7/tmqvrPpCgvVDXslsKeJsU4lbE04neo/x5fyPQwDPuA/ffQdsMAt1Rz0zYsKdOVkjzsVyukD3zWFhzwWY/Pp5KUDwhPj+VcaU+blJHqcRh/GooV9YVi+LXvUiFZP1mfk6XnaRKFSAUJaSqxH9UptciD3TszqK1ZYCuF2p2xwVa/BInZHw19vbSTc+nHY3qZXBEzO6RESnn0M6ZAn2d9XeFny0e7tFKWsyFknzmotuRkQ7bsOktv4PSTrmlH72sgzcj8Cb+KYWhmk1sTpUDdgSZ0INOBnZKfYzlMMddTXnIIG80ZC2vAbJV3uaTi5M1FVYYhpJYFepnjIUtXrCouzi7lmsPALczs9fvoNFgeoRv7BJO6lcJTSsAbA4ZoLZ7ht8pVktL5wqAwQBpGo/QC8FKiKYn73HYm2QtjZrqg7D/VeDjqsbukA47n04EXbnhIPDqQazDefh0uiordWkqBYWvrvtGEWInN8EIM9WEriNYkvxjoKK1N0Qa5bDmgdH8r2ywH3J/z28UaPYDOok1Rf7+2EEfqxFx+iHtHKf0h+0UZpOkopfSWVPnTKzIStOaWP86LdJy98w0KrRWIrDiNSvfidMHOwGq/R7/RZHo+Sg6JOxXC5xTptP+UoP8mR/oxtlyI/xZfh+MZ/yJxV6UrJF/O8gEGgLuiDMRuzlWsk5UDpGWdU4kn2aYDE7DVs8KkWFs1OBNWNKvnAcfBVaGsUDHJWXqn6RQOeRbXdKs9piYS2coacF27KbUITVshTRMORYpXOpwFr7brVZvJyWhmsvvaD2UJ1RE8mxoNm0VCw8r7V4gAp/+4pQY7Vros0lO3uzXuOdai0ZpxTk587cWXym9mafFGZdIsY6BsA5jL4WWnRt2sDrVnNKQTIFqVch9qjEdl8gc5J740AU6dMZpOOrFH9YiDTeOlide6WMjCjNZboHq7qJGdap9cZZwu1d5hlnKDbJbVQhPC5TOKAC9lJHCuE4KrmYGLiD7bW7auGB9YLi64trpMnr4ESQCpY7x4h+GT2Xb3ZgPbXewPTdcAm+mMV7oWWyeBezCsrMnHgjkhVoNCiq9p/8ri9nHiny/WtqqbRtjDwyI7T7eaynFMAY0I2VVDHcv3mrODVLMry4bBTcjbFHg8bIN2OsbTE1nQ24F1Y2CroC3QwO5/Ug7IhLXKiVCU6mYmBIuE3sOMkG/J4B/A9gCjOVjOgDkDdilZ5NNs2HdjyuOZBDUoWiDLge2g0305mlEI7Vr2YTxZAp87ai40W04Hyq1G90/k/KP9PXhqa/mjWlmrkUvB0wDmFW2e61gTxW6okVd1XPrLkc6/hG4H1kRU6zhfTb1FcXvobRyPs7CHFmBY1Yg4DLZ3ttFH6S0F0nm36KDlFRFeOt9n1jDHlDQhcJBgMlIKYC5EtUdjC4TwNNCq+C9JNySMhLonluKxZO2g/D+wpfEnYG42X6BIVPbL5DoN4+c6j7YbYBOnNgBtuv1rfCoUp8pNOKTD4W3NYumhES3sBglKmwhKu8knRBEVd3LtGJ1r1kiLouNzRmTQM89LSqLU4xiZiUJkQh+Vb7wEqjpaUmr4mQ5Zz+5wdnEyASjlFsIDRRYkZSS73PZsBIkzKnN0wZI+V/j1UYqxvaqYb+25Oux3N+2d7ACrycMqcvhSyFPhhiisgPgdqknAgDuVxKtxLWezFt4pILEAgZ1H965hFFzDLSm8r61JCO/t2u3Xlo4NF5OGTdruP8OTa/c6KXaBE9mVSo016KyT4TaVoyy7DQdWuG4DdarSjFCp5r0ckNNezEgtw6HIZ2m+LCMJYoc6ovEkpzXswQbNMQqnqOCTmbZgKHFZb9LJpNI42vcF2YkwDjQhtTRjYG6J3fish+EC8c4wHB8LdyumSv6zHgZTyTosxuX9K0WXUvRTaCeSST2FK9p28J0T0GfaHnzIhuh47Zrg5QjejKgZ43kub0HMn4768rKPUbAX6QqYeu/UsG3Ujx+XSkOBTrWAj4K20IULUspUsaYW7Fl1Z6jngb73Jt0tBiCbKXUlclJWDFxxNh/nwyXqXWubxJMDG8GjY5MNoh4LjWLyUEUNUX8Jk4aVzwLbXNfcisxaf2/L8NjPeoQMn/UZk2pOenx8imJyCwTYEBXkQDTWSqNUT1sIHAeui3QwcKQAaZ1GUcVNHxrKRiAsVgRp2d9nYZi9CFn6FLeafIU1GVqBxDVnPy9yiSRap4GWEk23ayjbUs74ksS7oVFAorwLA0vHS5j2BX1N55P8Fm018JdoKwuqWFBFHTuilgHfSuu9vs57PY33GhrsTVTiTVKkurB4LfGtKVF6IFSHdvq7mMGnIZ68CdFxit2Bl4JsDHWRAf1T6+oHzWDjIlHc6rbtQjZC2NmjCi8RsgozLOXtJghh7KRR9AK3myA8d5eihevoJNJO1JGbJibgKchZdMkjN/7cElp0EECDbiXlNcOgfwrB4O90MYydiB712mCrt3TFWR1wGXv5rplYeMKDblqU+3BWkK78XNthpSNNU0pqWEhOVlIPTCw0OmhIlHBbjkxoEWnQWWV3KzixP9UJZj4jaBwHIrPXiOySQ5CY6A/qRT6kT7h22LNKFdwyWAP/XauCtYGwHv3s089V1b3Lm+gl2+SxyddCLlrFRVaCuFJFzCYTR39Vc8hOs8yjUIvKpQ0puNEuyx1TPkzTEWDCMwtJpzZg6g69LhcjkINdIzi94VVzeqvVKOMd8kyWqviz/amusZY2s424zdItQ3XYa7tj6gx0lGD6Yq7xgsvcD8n21yaVFIi6F/0DAwkl0SRNrjEgLoX3KRNKSXCDyQmy1AkjoOOJOv2L2YNBZR/odFEC32tQ0fpBSejyQ+cP/xiF7bL9/gOlgdEpZOqm1K7tXy9QZ9Xh7tQ7bLiDCIyK179BbbTmsDD+DLoesW+VunXn1ttdk+fEqYv7+/wfpDZUy0b0fVVmu+CtiChiq2M06vkqgxm6s+emeo038/ZTz6/UflmvXcOobHAHo2tueBmj6zXdyqzbymD7Syd8PG7J/VnhcVmy7FDc31o+F0sPhohLsluaeEQqjH5cRYanq6nSYPRlknGvZFatorrltUpr26vRgHny+lpy0oPkrMo29H27+5Rtb1Q2YNbX4tVXs+obcOrrMOrP0EZU5UswMeWZAyVgfH2iFCvCiEbig6/4ee3E4HBvCo0lYr0unanMFshFkzeC0Tzolhxmv4LxDiuoOHGHgaWQ7BJOHQCifWeft1cvci/8eEgVeIFNszFU5HoJ8hcW0MEX9En2Al92YXPe7Pm78DCaJiTFM7eNmkzDhZ/fKqu2ODohtv7WakCqmE7HINzPsZMEMAmICywl1PTHzIeZJHWEb9gzXct0jpGZpUCYT93XTXvpkxhYvRTXY5bfzET4crvqhCEE4W1Iu8ASwwhTuphUhUAq672yOiwtJWpFW+lPs9PtCo1zUE10f0/fPItU4Dxi6aEutWdYe4piicrDfDpFM/NRtJxN0rLEvvJaw4iV4RK0wDviMBkBuw4oimBuMH3Bm2+Pn7L51Cy7uFxMEw85m8jsYfR9fgPIijmyxG2B9gXu8fESVkApUzu4PVjzqNrqVqHUEOU6KFpBKirNPJojTAkQ8yXe7H8ZvPfvNkqeLyxx05c2rfn/r1WCpxbb9F2b24BKRPz4st2ttOVIpKta8ofTJJ/+JmVRFjpZCq3mrP9x99iVQDElu0cyq8YGlRKOoUKAxDU2oQvVteKToOYO+YVNq440qo7VOxOcFTTg6zt3rxrtGhgxG4N3GgZt3FOgo8VFaukFAR8ommAZXeSSUwQQjdVqctKwETt+JE0LEQTSOvX70izn9TpfFqN0hgahyI9gJlKdGbBcoGMXX2SQmJ8WQqpXWbdWabjDlsGQOLIwkhDt/MeEetGjw2SWchI1mB+lnBua8Bm0KTBuBBwEsFWe49UQWY33PDjCJyzQz0DubyjnAB4g7E32bl7goXCjjpjL9FbZgkQ6BakbyXE28qBw7lcehWID6AQ6hq2+HF5yFFjOqwZFxpPkgkJdKONd95ACBA+PIsH9lbNS0bVkQLKHc+3L3W142TZyd0DEpktcqmibNJRDOBBQm9L+USNlO3xrxdgMy9RR7cgNikEIxxQKx/OaE6mpnEGAdEukopIIh1iDbMzGHIiidJsDjRhdIT5kFWX3xNGemITHfbTkCYz8QfQd3RIpbSyz3zoZL8LTMn5cqW2Nycz2qNwlYDLhnS4mSBugLbCyF151h7Vsf0eRQ99/0APGFZdbK61TmqSzjuqBfQ8euq7CcjDR7gRUwJq7M0n8aSaPeuFoCaVJe40fRD+VdIdqyBgmOhwm6BgCFOhCjFfmQGop4pgJ3I3uQ/S9HXXyCRx0XWRorQU0n2fpTVqY4Xr2cmYhmAyLK9j7toaLFtZSqf2h53WXtVBms9Td8llrZF0w1q6T3UlHWYb5N9HPJ2hraOu7tA4EJkXqtK1Fr1cG2hDE0Ltk49SNjcm0RlDPMbWmcd3Yqm7cLZUycvtOLdsnmBpdZdjkS1a9CLgHJcWgTinoKQ1NQ085NH19S+yy5bRkbYITDBKk7vRw3VSEeVdgRbpD7ggVydRQGrq7Z7FOGBJ37m0E/z2+6Bf5JI1d700G22YW50M35vZsnWnFtaIibDszZYqGbzb0dxVSWzsY8EF2hTlSgasA4n6Jun/8tvvu9tcqEJFo8WTRjdqHir8pjxcLPD+EdxE5kVwFSGPgLKQFwJoKNjalLOV6qu2SO5VJIy85qVV3ynpm2zUbW1bUsR9sUKqyskbbXas/eq6ltf2jsbUmjV+jpc6qRuvUj5ubzoVW3dMhN1W0Fs8SVXBXmfXPxgH1Gp5FtUowB6B6q1h7kB9YhFtlR2yOuvVL9tewT25bmr4NWmaBZYMKjLubtF8CpdqgBmyfIllV/qzr3T/yxrsIKeZ6JFeIqtFSvFlZj0tDyU1HvuiJDrOCM5tjB76Qra6vY13mXVWxOXgA2DwNVrMxjaHEMXRshhilUhoGcBHurJHeWU8HWzEAP8xhdSobKCDDqk8erXSuxDNtxlLWUErFxNcRS3Vf3nMabiSY0Vo2UerhuxX676ogArXXhNbJsTIQwfZXa9tcJ25+kfixV4hbk+2IKDfdDPI5W14KB9bhu92B5g0wh8kvK8LTUqC4g4PwRxXZpKm+xDxpKHKV3g5UlpKm+z+0koSNM0Bj3Ya7MiCWM0RaRIh8uTh6Unf7trgs8uWFmp1VzQJkVHvQvf4APdeOWs/fceyBZz+e9NTfL173voeGKBRQ3YwUwAVe5QPVUTI0b7qL867d3nBKd/ROlqbsFFHSKuuCFmK1NtJWnMaFRCJ/sQIGhD3yR2G9yCQvWfXCF2nSJErH/T7FLaALiSEHWZ0ms+RCNaS1Mu69Sh3i2XZ1Y+3iEkliY22LgLmYoZPpbCHd4mILHvgi99JmskKf9F0UooKUE3obQOfLfJiR5oJjmnGa+MjCAzW2HqlkZ25aKQpQSB1H6BSK0Pqqw05RCZ0NBLNSl869pNoZbsF26WYFUZaE1h7hCuoXZfCe6wux7BpvRDE7F4hMu7iYaUFZVjAgFNlFOglUnFWyN5hzhYRfMJYFakp4eqBRsr301P/e3jvEwOwKdeSdXTywA6382Cjz2WuSoXqEIiKVaHWIk2+Ss8Fxiiu6Y21ssV42DdAu0R2KUf9Cc76rI1Jhy7IFTDUCAkfhPAERiZdQ7sVQLC+y0Sid+deILqnAeZhOkwjDvcMBgBHY1GUe4rGUp5CHJWxO/EcPjSy7YIAOZcCRQX9hdcJJWGtoDIXD08gyYp0rBkFB09QbSg2u8vEI8VjCXi4mpN4+OfneozG4qmzz512vWJuNWUPxjqDptWlHJMTDvYx5EP0PECvgYfuk7RaLVx0Z6zKBldKRsG5jTPKX35RSFVXhvNk4tg5GRWnTRkf9P0jQ+s4JCSfdiOJlE49AQKnPzh1JPRHTSyP0BgjKQAYoCk3rEDYXL1Yis9q2e9Hx6xev7DRKdBZRcZDGauuJLb7jBPBLgxKioQN+tAMNXLPdv7BtoVLhSnA62QTqflV1VinN2d5OSllR8Px6sOtfZiWeR9Y8o69E9OIVOQ90WuxDgDpvuphWTfqEHjUaLaXPkM54MUiIQFq7V7Q77m7mfGmdds/WkYtunK6pswJNNWVTa+twDG1R4LEM7ThXeFRMHCmdXd6h3G9qjtzUcpVpGvO3GJvXydmOjpzuq/eUIW8ecLg08+8pv82GPtK7IwaK8FQhdbh0jDHtxDCNiOkATqay49k/IlTn7Knq/E2LIDIMpowQukUJnNXRPTuG5o5HIw6+VfHzo2qAGlcwmB/tSPnmoz3eFdvZG0ngTKOTzGs3dLvyglClSNl2wkr52dMHHB8Y7kEmV5XZotIkwUQvxlLCJ3udoMHo753qXQvRA8QIqNsRzOgRy1Mty5HMVOH2/sFX8R783z7InHvV0vYauN0k9fdgeJnA+CadFlt+9RfDeTZv9UyPehbAsB8n3YehycoCQyhOmHVkziCZ5ewQpyexx3ytm11OLE+S6sw+cBgJsrpQiQ0jvkQq8pzu5OhftHOmw48UKFSxekGm8jQoBrJR5KrFS1XA32QWBM15NkpstRBUAR9CDdNhUQz/CwWFqiMdUrZzKeLUkYN/RxQ63Uig4WCeDcM7Mln/HAHU/rFWTBmUMT2+F5hTwOwjjeMr2/nii5opqsQOeM63jsA0zdBsHpg2PPSC6xBTofgY//sm/WWZlovvgRKB0NepJwG8++D0lLsaF74Kfa2rSyhA9zz2vQpnt/qYI4GLTtbO+w+kxXNPZf+s7UXVg9rVbSQ3SbaVakPWCmN2YxqJWj1BkwZktQJktf5jPfXHmtqPjXQad6XSaNJohMr7/n6UqUMMJxO+kyotSsn2wsSFlnT08dXkvYbhXsNwr2H4v1TD8OPucQ9NqWklbjj4wCQpF2LPg/V0ZnFkyhkzohzjsZZeeH3vIKBgqYuO97brFqWrriP6HeN/FC90c4l+eYhdhrkKm12tr5yvl81XsRWRxSqtLrs5LxXiplbX2Z7d8o9B59catf2rgYPHa1QKHamBd+t0vnLeVvmddaY8fNrWcZBk0dYgd/oulSsCONCUINqXkzSdd/b3qhKw2RTRN96W+dLfbYH+IDMZvsGiiBtbXWPRg2E7ykVjIkp8ygWw1OsUbLwbo2eNCzJuafUtGT1rXpXRs+59GT1rX5rRs9nNGffmrq7P6Nn8Do0ej/F8zqFdLJcElfUwVxldMDYPMyTXWULHO34u5AauGPbEsLynvNyjp5McdY+SdHlmOSokYxgjCmzlvzHrKnuM+66mk6zGaa4DM2vX1lvvMDph7xAcxnI+B8mAnTqyWdSBGcDxsDpDqS/vWed71vmedV6Dda4SLZcd/gzc6Tpc6Sbc6CZc6Dbc53Zcp3+m+krCzc7XzVjOj2M174rFxHdEs3vqT8Y6/hv9845sjS+eEQM5MzpykLiRp835UNEa0ydlcq+KVe+luNh4siwvA7dW/FXuHuLycgk9vpkNuFXHlJq8yY6sYcXoXNXpxpxjrSM2+D3x2DlqcwSPtu0jYc2AcA+btsF7ejDkIPZWZ9QQQAi+xnAvxH8vls7VmzAAVhsVwrCzg2ThrbmUKqfo/TPTkQaPX78oOV4tWucnBV1NzvB19CfA17mJZasDeSWcgmUHii1nQxDaS36v0tZwmrLW9X4rjnTSFsxzjRGyLoxrGxDBV/N0doIGmtFfHrE6YIf9+tBgFtMpoG/cC/brZrc+rIc9uiRFeMneZcmwyIGqKq+KmAZ98tPr16/evH3+bHDy4sc//fTD8ZsBjGrwpzevfno9OPnpu+9e/H/PT9A/C3t6JvLKICN7wovlJCkoW8oFTkKH/ivMJx5g5XKMgc9hrtaCcmhvAWorTkF0IivVdmx7GVG7Xc+cXtYZz+0d6zfFwZB+4yUA/I9iJ7P7oZ+wxxidqdMRT6C2qtSOOlmcxhFnoIn+iG18w8ckJjvuipsou89jfvJwQh8+qv4mrvHFcoaJgeJQQqGf5ZpdZetA78dSvDrTd8lwIUHgVPY+9wzEMfyRXYq/4fw+UZoML9X1Og7zOplkI+q2Mw+Wc61aTXxlJf/BuXQT5TgTKsvY3m1TZIls5l3DiXcgp97AH8rcYLfdPd07szzXKhEes1oExHYCDn21sGIPVhhesImukx2KPu/87v4xATwY4XfZZyCe394dDAw08+TRI/oXHu/f/SdPHu39bv/ho/2DxwdPnuD7/Yf7B09+F+3dXRfqnyUqgKLoc4D6LT5kSjAYjJcUt3WgLM2S8zKfgFw84N87O/LeRxc6NYfqK6ds3HGSP2o6jn4KknrYo+Ga/CliTjKYCPimGlvoWTlqnUZkY1OSSLTuKTtAoVWcs/UcYaLITjtGzpmbhNFt9/MjzheyUaV+kWwGZ43ECLPceMMqZ1iM8KYNrBRf4C7MgGzgOoOrIf9lJ3xGIq7eVywL9Rf64FJkKQKr8ZJax5VD3wqG4GNGN4gxAzkueVThDmpsYmnWdDZ6Ibn4JrfG2AVO1dTGLfRWicPYaFgLFVhaG62TS6fERzWNuXnurjCE+KqJ1n/p/Hapd5qrGdCWdlc6BbClrBZPSz72nCoxe11aK0Jla6abN58ysmFbzM876wtPx6gVfmKhCzNAiQtNax8964o3GJ62BVpfoLXPauZJjJDseWJlb/RpZ0trzjRYpdnk2WE9apGl16SYJbWk/S4wo7XYr9KBk0ZWi0sKEqKm1xDbnb0X9DuM47hnZTCN6TdqT+jPDx+9bBj4wpqIajga5+vRhrh+NbRscFUZZxPyu9Jho52CnCL+6Mhdr5As5FZT84nuVVOKXtJxuViOdtO4gS26+U/YwIpQ+tr7WvT7GDwILeRWy23N8Dr7PdSivf+hSSAoEk+ijpDw5469XhsQErvaakIwru5Zw099guMTGJxIIkYjt+lUq6cvgjp2X22ZmRgNojNsdgXExL5h6OOVRV5ki9s+Bt07jD9QFLmU1SwctgwBcr8ogFxyg9cHImvrCOaEWVa72JppPLqh6CcqxtE55uFFjdVIxV95/fwlz/HsDjAcCYu10gFKZ3+tR/0wUXAp3VrshtUhj9LZCBmkdE41tbLrULrSHVQ2K9Mhyi7lVTYfLCYlBvTIxrcdzEFxDftn0y11knKoAA4FhewdA+gjgD4A6DMAmqYwznbki4e4yuObIpupSm6EPu60dZ+Vss3qyk5Y1HYFYbB4VwqOno+gHbqMdfrVCxHpdqnrq6smqu9fJW1NPdQiiEV4GI0+CsutLUUNrpYSLZkQcK+vKHm9FGZDbso81a9b1SNbd7ooBJW7yk2mwT2+IhtWJUHZRozezsQRlRuSSlPRt40PpL9epsSYaw+2QussLSpq8o4n8wxwfDTPMxUvbpoAVcXkGYucr005pXihcsax95zdmOptRheheTTKicr3okKn7SW0M1WoYataNMUo9uepzMqIDypPvojvN9YmG+sBUlLJU8BozkOTEHtofS/OLqFT24TKtUkbTBMdGARg3YOACamDyM4OjZrG8GN+Q4GfsgVnzkLnAQrUzeNQpi219JnPT4/v2aj7HBd88/4H2Uwz1WaPD3CqN97oDpsf2Iyygh22xenWn5YbbiuYpzkFe67ZVwnDlV1k8RBipNG4+e5mr2kWGPuPDCBFQINq7x7v/UFS6xhTIVtOGmUj9oTK2VG0gaNlTi1LJ6M74Ss/EVHQPKX6Tsx+tZWA+OOJUNQKzd2R0xjea8HRXTtPbeVLqkZK4oAe3QOO0o7toqkQKbD1esHaocuU8PRAA4zoIXwpV4jPnzySu3FsaV3WtWk3JvTvltzrij1JeT1mJA9OMWqS4uvrNJlqb3KfZFs2bHlEeeZeuhLS4xJjsKqDTc0uJiGk9mXWz9Mx9obNtYjmNndnJalIxuMNKQVCrSESd0waZrvJv8K2fUATaw1FzTGfa8irUfA/lJsleU/NeU6JgWBqsbg0XXto4jKQ9eEyjaPvsf1hQpuZviSTfHZRZrAh04xDAxIRLVEelpahO8DUE9dJQZ71opqR9CTLMLnXosHc8OoQm3c4Fr9n0jyhzHCCdiWhUVsbQtzgY+aLb1Kfl1gQb8LxcaXxMhmngExzEEl0qkMevSIrmzPuTXSVt+CTRwMhroak8UZVtMhhibjHTidhupeiXoGvqBFZU756EF0uFvPycHf3AtZzeR4P8+muCX5Jfw4Xk92sLJfw8/He/gP6U6JM9x/tPfn6D3sHT/Yb5bamHMCKAMbvP8QNJ4kSyezZbJDF1Jx+lLD2qe9/Q/f/RO7u0ACg+f7/8cPHD/f9+/+Hjx7f3/9/jmfD+3/hvrU5QLmzQy2gIZQdFEf97pEF96/IAgXL4d9AiGCTiKiHloZEgfk7CfsCIy7ScjlZqE9v6NfODgYhB0EMo/HqzJRkzGacB8ydIca1QaNvtKfbefb8u+Offng7ODn5fvD9q5O3Px6/fM4ZyuC0TGfXndar189/PPn+xXdvB09/ePH8x7eD1397+/2rHwehmi3FaNoffzp5/ma7ZlXNYLNomyf+gBs2izWhydbBQavrtnn809tXg+NnzzbvqqqJ7ZJw3NKqKjwcOjut27TEj3ja0b/4n1v8z37LdOKHV8fPBid/O3n7/CVN6uDPz/92sllvgk1oyBv1aocidcDB0YvqFXWWLwGlSSAPHbQSyIfIgORDwbQ//fDq2+MfBid/fvF68PaHk8Ffnr958d3f1hubV2nLSd7BEA3XWZHPphQVOykyUizbqX5MMtdLOOKRyzL2PiZ7NucUV34zwrTTG3HM23l5DAvwZvD2xcvnr37aAE/detDz/r62B3FCfhza8pU6sGBrD69O+/t4w0bmu+hHQuVzO04Vmb0M0PdjMMA43GPL/hB/xsDhc3wdJ0wAfcqHA4xiGvxm8WO1ZdDwkW+rgp8XwCXNgl+ABUO+pL5lL1NptcAkv5ik1+lkwGxaqIineAp3UdKEoBE7kPKLcCkrnwh8Z4NetxlxttTHQXC254xuR1ZWF3weKJ8cmOtlYTySzEDsKEmBccJnFbyl0rguIZGJDg6qn6xYN+HWrVA14QLK7/soAn6n+tnx5AjPIBYLBrGC4mRRbU2XjgDGhr8RKTMs43jSjpMYpzJnkOmybB8X7hiTIg0o86w3ODxz6SuSI6Wlo03px1EH2WM5SYkucCkgDPyuQw1UTHxB0JU66N7V4b/jAfv1DCi7ic/Htlm74RS0oyhXKsRt3z6dJ++tmTdrts5TkxobpooB/WeEW0gyw+BAKs0NJRaTG72mOrHWxNB7fF0zN+ewZFc7FmlLUSFRpW0wh5jDwqGW6AftZdl1SWCVttoj0V+UwRmBdPEFQ6+yT07peLaoiD1QxnQeA7ySe5ff+QfRifi80N7HIIXkvQHzv7R2BucXtgmA5x/uRzzQ3bTjO2EnPB8cPtuqdXGjV6evSn/0CN3p8EapdEH4AO+Bl2HYFw5LqT0i2ccOpHQOD6by9WHYcjjRM5weS0/pJLb2gfDZoie9G5xIRSoP/ZBPWwfDNE18VFBM3dlQcEwDI6BcUEXNH6Jb2P/qsatbOECp9NFjV7WgA1nNMZPWIn5N/2S/pkX85jlwnINv//aWfHDm+U3noBc98mIRrKz/+vjpn5+/9VpYgWfB6IfeVJxw3qwbnO1kxF4vtL7lf/n0tvmQWb2L1gqwaPcI2FaKSBgtZ+yNg7Xqu7UqMKPXnTuIzlihE34cuMqOkYhwDkthhYar8BPrGYFrp9IKu9HTcd98RmObcG12fEZ/7E3xGdcI8+bFVPSjusk59k6z6D3ycu6xirFHGexS1KB2Kzaech7N83mnW0/mlGr71bNXh0ikgCpzvl44UtBFsIN53S5ImjuMHu0efL17sHfwsKs7p1yplsWkiYYj64DNXSbohA6svWoWWSUFlpzKo9eTFFMMISFUjYuggEQvTUZBANYhGrvVOtZUel+kwxVab8PkZHaubZkP0JSvNCX8w1rNcNlq972yan1FxWOVdQdKMlTtGFnCWqtfVPSuRsa9WjkohumMx5b8aofliIdr9c2ucVeDdLq6cqxOD5whi5QdYGAdIXyt7knhuxqi6trK0Sm4zsA8FUHdAH1Nwlqd9Crd1YD9Lq8cuN8PZwKswA0NZPOwoECcmo8Jl6ry+usNzooRekdzFIy67Fz++3OgY+HWYICjZFh7VKrGXY7Litq71sh0DN6GkWntyNojc4Lb3NHIrGjBa41MMXVNI9NapbVHpmrc5ch0T9cYmcrPVDMoN9vTWn2xaljiuzEUx2YwCgTmAe1J5uLhZTq8imTIVpYpqwE7JSxbayaTm+S2ZOU7WQNwXCjfRyDM3pDxFSqTPmay1eStJIpqOO4xx+pNYXBRlFnkyqLH7j1/qdr64yPfjjBctf4APGaRYtSh6EgK2MpAK/w4mo3ncxM2K6F4VtJpCflT2l0hKxozCV5fFFiVTKxyJnKDTZECHkSv0KLjJkOLRzMOMhRGM94FWi6JWrjAG5kyu04nt3UarNieZ5lh3aqTLg11nUV2vlzwtCgYJqE1XyB2JHgTma9y3A+6mlSdK6sqFGlqxVzZRauhUHRxF4OUTr9u93o6/7XQ261zV2RJ93TlVlElPQLs2cTW0WDvBmM9MuxWujNK7HV55cj9frjEYgn/G5M438w6+c5Xs1ulx1cpbyZJNi1Ff0rX7xEG5tE12Fxa6nQllB5mei0wVTLZO8vlhb5VLzH3elakI2Vq19ORCMV62c3moUN68d77aUaRdaZWCD+JEFZqjYZ6QRKydReoxGPcqbQCVrsUo4dyxJc6J0y5q+MT4j3mHK0eKEgKOcgKrPNJztZZKjUQBQ8iY3XT/tDPQ6C/zPIb+KautmL42VFGEPFyMbTSPVNQ3mE9auGpWb0rs4rTEYbwvgkUrAupKp5FQ+czDUfw18dUsUCvcg/TbDYo0mmSzehKkCOnboSf5OWtozapSMeJjtCow+eMAQaFjYzKZJGV1j7VFngeXnJyZgTgbgC2rSZTTfgGQ8imy+l/RhQmCPo+BKRT2G9W+1gVxG7uS0cpIA9zIdrEHPdLZYdQF0vZHTVfjfKvQ2a+tGU4eR03Hf/fsn8Qq3Ad/AvGtfcVxUtEjFSD9Br6+H1X3VrEHa27D629te9vRELpCd54qmkIcn6ByeoE+tzHXnXjRb5IJnqDVrPe1MxaTc/WBxT9UXcw3P21gN7NOB0KZ5/y9kQ7hFV/+GO0Hzzz93uVAVR4N9VIXVFFS9m4bS3i+cLlSlWiS0zmo+nQ+W30M7vaiyFGp/uzPpZ1k0gB2Y4ukqC9TCNRY00VMS7eZBJlYuTu2TXFFrvujZtxtpZmPSWJT+WZ48wryimbRoa3QnDsEA1J6M4EvXSgL3hv4Uh3Vrq6sIlKT4YYDj8XrtMgo1Rk6QfR8QizyZDzLkoNeAkKPJNqVArpYymdWYlMw24G1KQVzjUtAI3IMoPOF9u+xubCZjBvuFLqsOAb54uMrJW5d0rcpB/2/Ync8mxIJK2erI7grmtVpjtIT62FDVSpWVU9nmoNTFinZkHGH6BvoWByNQ3qVlbQGeX6I1RLlkAlcAhvdu3Ho7eeOl3ZlcESSl2vOs1N6aYUVyV2+mzqa1wr+WwjBBry7br2aSFuAYNiWvYEEhBbouRzKPAKA0eN43lIwbETNvRFbOVkFy4NUWHAnWDP6qmMFv9EzwubIbLTbwRnM7N4S1L68N9h65eAcVo90yGZA8iGuaNSNjm5OcJo1WgGZ7zFvPuEDv6nzuNLKW7GSww9jTcHElQDJvw8o5DNVsBzPbFsc82TyQyqhPJlhb898Wxu0+N6BEFRKGTzXD/EmhsRslTAe4HKEP2rBmuoKy4ZTJtb3On63VD3uvA/b6K3u8712w5c6yoA4aLUk8B8OVe6+E/NZDlGp+rKtNKa0mWST0u4IaV9pUytISTlW87rmurKuvU6UFPrh+oqqwI19X1lyyinVzWNVQ1dpby0fD5JZle1QQqtwDZUUG+QakphtNVK0TopKbLJLSZEmCRoRwh/YQgDE8ksYeU1+apNdaiYlyDRsVshbGnBsvPlxQUZRRX5BRDi0jeWQpDJ+S6wAck5Rq5LigsAOEW+AMkBmn56+xSG/9SRwZR+Sllem8DextaFCTaZt/jeBZaFS8ifobcqqYgb1DzkZ9CLgtZFR41eAFVAw2puET+YBVI3zlbhnbJkmEve6BJSH+MsLTHKoVJd8MHm3wgZH1QCgI2mIbP8TRxPXCIs2VrDzYqDJPYEljabsS+sdbpSU2QKDOdASv6zWo2iOFWT3wB587JcTnXwIyhGAKhIPpMtAZOiisMcOY602riQqKueLUD1F69VsPg4eqb8evD8+ujpysaebCIn38LuQaYzJKPTX9RGnP5vikDC3sMcpFmPi+IT65nCwvxpkVxRjuVhimaQKSV/cG8CMAllcbGk8eyGR0eJRirZGioJRdx5WtcZiIYzs2ZknZQkm4EyWz8MaqOkJlsmHNl8cgy1oV6Tz43T7bBlpO6Rb2Lp9qCZVjFI8n+2IQ7XzZRiG/2GCT29ylwC5cp4lotEaBtVW0Dsb/83hQ83NsOa2LqWjvLbgqH+VKG+/xs22j4fSC73XFuzBhaU0JYRO+azWDbqTDxD33PDQb6h57bhrYRVxvfdcH5b5eqcN4LvdxoOZmKWhbv2RQM5bUoR/JRcIMeZkQuUH4PilJAcLmdWwASyyyYJAF25UdvB8wJEr2QTXrqHj/7X6+O33zs4Kz07jL5bomeZgs9iCJE33Y2NcHdoeWPZVl7eJFlcsnD2wrvY9mfyyhMrQuE1nisje47OYjg4PukywIqCBVyQoEUfRBXlNCgwJqDLSphkEShcCKfe6fflL3U4lHIb8VSpkYTRnKWAKiOOs0FXANkUzmPKya6vzJXphVI86g4xE0AdsoBzN1mJqNVafm4wnEom2DDcSm/VOWFX8qbXqmzH+A42YAfUUZPOCss4esrzIGETOBWJJYvWMLnDgMNeyIZu6DrtycDlk+eWVzGq9HBR5KMkGLjl4zBL/E891GKRS1KbqSu1Ca44iRv9PhVwFgl6Zy0MN/D51kTLiMkkNIEBIfWOpm86x9QcKua0vSkFZqyNj5Qel7u8/ib06gc3oSpD0mPt7gsn4dMd1fo0sVxQk6Ear+psPmYtw0spxkIuD2BWE389EKY5K1lLWGTz6JdlMkHURWXimLR2Gpc7ben/LnBzi3bU/yZq018KdzwXWIuXaO22utp5zd+T6nqE53nACXgkxSZf2WyxW/nOBFFO3QngpFNNys7GNysdyQiXSNmQWh9kh2uk/iwuylcMq0RtFN4xAFuWYNsIPk8LFGEk9DIpG7gDdKNiy31W17hnSkZVWZZGaTlMZyMMzhjqK4+dbn9L9/aD9MEqG55SU9D1suyOShBUsxR032WxIpSuktPiwH7mskqw1WMVsZZvvfXoWL9tQlAfc2XBdKMBdWJF4XweW6to2aVhBCtaPRUCiprg+7hR8GJNVgulFDJBoK6Y6z9XvkDk80ePUiZfyeOmEcf9hMsKpWcRX+vkFQbiNAtViS6ya5Iv3AVU5jusjNQ7D2gXl08kxg8h7QKWJ9qjDtGsUPOIN5Ks0HQg5xtdm/L2tKjMHed2tTDNPZX7CmcaA/RKkNm7DaWxuIgkOhh3dD1CCmsJOGI2peiGAXtriKuVyEZWW8VBonINwuiht31JQeG85JLTo0j+7SVmI47+gvP2HLOwddrP36HLMPLm7qgl85i0aiVpC9xoIYfj1A7KX6FqPFGdtvrWFuLZDYouFvXw9ayvmeDhTRF23l1cuVlSd5qKvGg6oC65MlNTrYtO2cbqVD5+LwmrfSWpigZ4kQupYsI4K8dpUUhYK0q7S0npdiVh3qs33B6ygBjuTvVoiiqgYVKIfEMM5ijFKDQThsQRyVmKQgQwGetkDOWnOqWHXqQGPxWbWi5lQvsFhtPamvHSV356o6OILfOJnE5xnkFnCo7/pjPUWktHrJWowzOM1F4uCzIjB6LPmPoumc4ndEOF0Q30Wggni6FckhL/q22e08WwF2WldIUkUzhZFFaZTseMx39GId1IvBQjhRSE3FdOc9HTSnnW/OHkXt7OATlKzo1BTb0H/gU71T6M2pgII25HHyIBY5t0SZBc2QC9SMfFwONzNKJo6UTt8pnbZXUopkCIRyNz/i9uct2Iod9KgjjP8SIiJXM1Xru5jrChdyHV0LbQJHQg14UZhK2EimoT080NtHccGaPinJlUlSeX97wxveZ9zqEgeWlkZt4Cl0iRJibJRXkYPb+We7iS0zM2hOrho9c725ISO31E/TqMGqofLXRQDcWlFNgBHBPg7IXOEYQxSUujWyaEyThflYX4AIBc44UDaPfbxO1ytu9JuuDMB7qVdp8LTIHGZnNThMjFBO9vb5WWWVpMBONk2j6JtGYCtCj3A7qjogstnBzryFBbWczdR9Vj4UH0nDfvIQ9AXwm+A4LzIHpKkUmQxMzSG4ttFU7OrCjUY4SLiXRVbhbvRmBUt+jhDjB8/dfWIqPfQFBm1IWahcZrXntdWsIudPb6f+h+uvOlEnboOiiEmZtbznfAwQ/vcsEoP/VlDt3e5c4j0IiAZorCW7PF3SDmW8J9rxEEzJwhXvivTzW71YtsJAjc9+A8awMk2/TooyeY3LG0jZoRM82eALksywHZfRPt6oYgwYCEO/k9SW6toPjpDEjMMDXmKorLwstXPI2RZ0TJxFOESWprN06ZRg66uSzyGxcHVtg4qchnSrxipoDMeNCh4tMtumNJZhkaWYvN8c/ekmXPDxhYRTVCUVbWjYRWNd3ZIBTfq6cDvAvA+HP5sNUlm0a6KyYUKvVlAVIsARSGXtXTbtCLp69+/O7Fn1RPXDcUB4qj5d0AAGZFPnn+5i/P3zS3b8d2w7l4lqdiEbCc01VU+L5+9g8T9meUlcN8WYB0y8oNnVZhTrtxmIYhe0rqTSbvePD0+Zu3a8yeMQ3aoPnXb179z/Onb5tbdniMYAnLNGgz9Pzh1Z9+eP6X5z80d6BKYzeJjlmJ3WjFoqc9m+cLy/bd3et+AWfru8ESHWfG5ygXoRoFg0yLgwoarQFDjnZpC3LWmKZE0FCLlAHbxfEfOfo1EI+K660T/Iv95qj5o+jU7uIZcXLHlCcTiU9pWZQknqIQxJMHWllGailuEmjsU4dUouiAZRNpNDKhrlgAymeWOdUSuWgo3cZ+t41NVakMNxAG8wTL8nL3Aui+tC81RIEJ7Hm1Rj7fLS9B5ryKd8yqBejspw/cfEdPJf4z5jEoEnT1ubMQ0M3xn/f2H33l539+tHewfx//+XM8G8Z/Hi9nw0WeT0r1ogB+LZ+qX2wVpeI1q8ZAYlMnRA/OepBdU+MSz3mIs9GAo88C4nXK7Nf06EkPwwQU5RG3GSflMMsGFPF2iLa1XwqweJRdZAvFywoP1G7H/8izWYd7Fw8v8wy9CLA9zkQzQP4Dvl6kBM1OiEy90B3kzAhu660UJOsphsrtS6n++w8tFR3eHYtuWdfRprYDnEy5aPqiF9kAj+r6YbFueqN2sB2Ld/tvvUjxTZHMS/6uP2NdfA88OSv0APoXVzeWak89RPitxevYfQn4XSgZD+Gppp1R2T8sqE5DLn64IF0NOC+G66cuL2V82kaJprpq4iSl9UwGtN1+EV61fxnyvvKp0H8lEdxhAoBV9P9g/5Ef///R3lf39P9zPOvSf6boWinApb6Q15gyBPnj89L/QmlG1EttVPH6dnGZz55rQTxQlnLF96KXHLNRSigvZB+K9kn2P+gTKJmaViJ9WCWLZem9ZElTtTsrMxLDZFL4J3K4J6yplcDAYx1rGDVKGMtwZ4As/8kLkAUGQBHbB/Fe/Li9szNDGzwjBVJQ1KgcFtl84dzoUrlM3Sqyui9jjYsw2HgFzDBLTiSTXaDyI8XLwJJPHLoXnJYXFQLPl4d1y+FVIYDA116ns4xsmOVSHQfN99jKldGbAh0lgF4P5LV3llrz9G9DU/+Vngr9p114l9lfVtH/g4O9/a88+n/w1eNH9/T/czwb8v9l9k7OAvgrlgTJWhK4SLXusZa46L9UmKuKGrIXEQFicwzFH1c51HI5l2im8WBAQAeDHqkmurFuD1ry9DrwBggw/Nd9LcYfRwLW/ciw0UKU/jD9ThYSNaoS9UTxjZkEV4s1NVV1N3T6tyOmuFYpMPJ8mJF3OHLshkkmLaFWd0sonxjO1ItLSnZb9dD3em/NjDXmcqBHZXUaTearo9VfT1sw5a0zFUvYnn8VaEml96lzOIc2uIhpxlssNek2YoGUGAyG74Fsjutkd1cJgactlEEVSn0Ztc7+PsNXRToXtOTWu3pPEE/D1jpr74JPjvgV3FadZc6L+tzBha3t6aZdM/2i8PlWo7AlcEfpGcAf1T1FYQrsFfZqXaW3Eirarkssj7UCrReSIBDqptM52X2h3QnU7vxHSTl1JGB4dA6kbUje1HQ4tqL/wFJOsGp47fdhU+As+G4JH2YuQ4+RjWfOqfVPmjm/D59p5tDiYI4OhnzF27+1enWe55MqetvxsFa3MUlntU3srSRRisx07I34LY2n27JrI735iOqj7FrPPZkarUYb9GbasEq5PN+0ynQ52azKMJkNpslieCmVvgBEKWtXTwtxi9zccI/YWVBFvWOJVB/yFGHH8p3dkbkF4ulQy6729+A0m4O8QPuHzjUam5YppfoGURINt46oN9JJN+YJlP4hKxfUZBeNcN1v/L4yuutwS2idVC2s2w92zX+hnPEqjcvp4DW+ecMBvZty9h/AFp9Swlq9yNMETUB7EToBrJ5YLo0nvSxV0652yv8oqZIRTq0K0RTHYjuBRVDdLR3CLPWOiJ1G1coAQyFJYbo0f0uIvijY2Hw5y9CF32Zk/JG7XIwGwH+olHGhHvJEuv2jQfu9w5d30TdpHP9x+8UhgLMpkvJTJMU9hNBzu9GLxpM8WZw5XF1gwrGhcOgnNTfcBVxjGIuee3iNP2mwTQvqYX9oTr0iVheIlR5kJRJIOENXIXV451R3Ty1aB/rvkYZQ/70idv/x0+fqf5UZeEbho9HJmlIWYu7tfIpuT9F/cKSf/yjxzO/QQlobq9uL9Cta4K65AVKUJpvR4PSQ0hVEhpSAxHxQBWdGQ+Qr3GJlhoKT4htqqzONBrDZkvhD4HzOqZ1URxwTNpqZ9cZhEtvZA5Nx1GwN/rnGSK6Al8XBcIUYucyy42J6M31C64YrTZnU26khpsB1d660krpbO2HOqq91Iq7cCs50scRmTnPZr3WCJSGIYk5WTCQ+LNXp5hsEOiX5eS2Sb6z7yp4rpz/18j81DtQfM805VbobyzTNcqppwqq8vszS3Lipu0qGA3Y0fecpLRqbZoEDk/pRVXf2rvEYb6xu4DNkp3qF6fP5Tw9XryvA1+GGa/CnW8UDe5Wou7BO4fth2zLKii6vLkwoIt04Osfo1qVnHGo1s+HU2VsvmI4RCVRmjBD2euutrTfht1k64RwGp9mZBRR5Hpq5jVWLepeja0QSzUl7SzvUqofn5qH70m4Yb7hOz5yh0qmCfanEkLSwKlVY5Uk7qS0JVTEOyUsaW2N28WCislNaaCSLOqkXHonAAKYC+S5uaybweFbeoAvujYpBg/pW8gMhb1k+d5R7tuUgACV0mCbtWy9kL6HPJlhVtogoaNiIeWyURXA+mc3JSlib+bKY52Vq+Zw852NHRzDSMKhvYm6tp6vkwcI/6LxB3ivRCwkZgIY2OR5ms75dnh03iWXWQNnBhUzB0UkF5hKtmtG+maaBOuMYIMrhqNw8xeey4OkxyKZ8Ya3lEE+GjENwKY4PryPNqHaxP+wGRn2iINs+rHbpQ6tsiQITJ4w5p7cE1lKzq+5qcUIJdaIOBRHHzphBd00FlU3ChenFqUQksHDfGXgvot+wAEvycjO7wtsWKs3HDbpuY4vimiDYFRH2o++94JS7YWyQuJWdF2eVCMc+wxnYQJuQekdb3qx5ZslK8wE6ssta/EwdL7MNM2MvoNOlem7G5lCdKlVG1Wq8pk/hkLVh/tUe3unV2Zonc2CdzJLU6O1rZEr8yrI8W/CRNO/bnmV8ueakbB7Qkg0G7e4hojh6UkbqXS1/qZGVhMdjpcsjAbISmnjt6cW+obM0dtFRXaiGQiiG1jMJNAvz5Onn8VnFoKGwQdXW4cuq+sKmE3QTnm1DFk3wgte8jkNTL2qVAMoMyOXzV9/6wOzA+7tBIocR9FbWdKYiMWyCWeg/e0Q9ruBUhemtEU18IcK7TrHuNO1t64siGwhR1ZmwO1hBIM7guvZpsIHYZSYZjiJqSDeDdH3VTDeOqlZo257RrjLZeApUmGznpd3oyHWJcRQeQFpR6uCDxOuYTNXHEw2kD9f1bPeIz5ZrH/dG9Tz3dTLZhNPmGaQGUkpU4nFahvGtsJMU5eqYJhcHzS2RubPh7lKbfTxHthskRO1DT9Fl6Ljejnm8Q6axRpWs53QT5uufbY50/3zmp2L/x6ayd2oA2Gz/99WjJwdPfPvv/UcH9/Z/n+PZxv7vgSadY45A1/8Gw0e+SdkcOoYCVxz2gkOKlJdQVSKjUBBS+XuJPhpD+HsS/TlDbzsKT6g9fK7gHTTFpDaZUwAY4y1o8prMM7SjI9BYPB/lhxx0R7wF/x/tGoiu1v+149QYTPL8ajmXGBY4MhXIwxpRqdPigPhHof8V9P/cFB6FeMXLEyPoWoDqBV12mbko8uW8RzPDr8o56oZ61hSLEMzxmxC02F1XpWA8A6xgee4HBIEcUjYbuR+oC8r+Dt100AKchki8XUe6WIHfrQLmzgt4/uHyzHpQYQs96zspHF0Izlfzw4FAnQ3cMiCWqkCC7fcf4vcf2sq9y1qIlfk97GZM/OH/RseDbMhm9DYr6U+lMMvVqXSYXo5d4/N3lUpBdUJ7l8I1B5pQj1puKqJiM++2u6d7Z8HywoxQtaCwF3LXspKeBLd1x/4ho3d3ldLxOgWr5WS3n9rvzCqdSYBXTU3Wq4975COqKgkk2ASy9Rp3KbCOXd1gtVm8IFBdsAJkR7tpOPM5wJ6Vfmw2k/lCEck2+oxTXDnhY/MhNkZ0g12mb/Liqku/S46GTvFRFNfRZ66jzyJQHL1Z8s0LxwnyKOc4K1CHKwyxTg2JYUHeYfhW8khxM0Brnhw7/EfWN32DYgSw2xRlhJWcpK+nPndUCFI6ZBj7kYW/TjKKn9fVE0J/8LiQGiqnfeqE1W1cNHccZq2oNqal6oQRUhsqLmeLbBJdLhbz8nB393x58StMbRIX6QgklHiYT3dhhW8G8CEeXmT/lY2O9p98/ejh/j7M2TuJsLacqbVy+mteq+BMODi6lcJAkypLE4WayBa3sV66OMvXLLZ7vb+DIdg57N3iFg7zOaxDGeNLt8H1imGD0EvSH847XSFLSlkgRIUnd5SNx7DYKM+akXZ1GEIg6ZPs15TQvYP/8TD+R1WChXZCEUn9oIVLCkNj7VI0XposCxS8OD6Tw9AQ5bWyekbf4fUYh76K2vOcI9vO81E7jtrPZ6N5noEYyG9T/dMNrA3t8p2I3T/YGXp87l5wkq+qIiO7clzFcmEG9Jw7GqoHnJduTCHezQ6iejBYlcBC5XvnpCF4QUGmO+cUzGxHnUkxnUk0KP+goBk0EPWSZDq7GfKlPZXhfKSuNlAPSOVmQfpo4DyIfmB+kFOoIG1AplTA891RMuHGHKZJCeEh6ksHhEPrd+xexbCsrJxslS2bQYOFWE6SYmBN/+mhHYdDQsaZQivHt6qrTnOhPtO838i0jwkmzPc/UEciq6oToODaIuecUGC/W1kRFbPTWdHAbixpO/oxqn4qKWyOXdBBdNyI7Jqpl4gvBtWBpV+XlS1E0fyktuwhpyq/U0eO2ThxeHeZiuE95oWKVRNrYs9SXBbVlR7aHJUY+0eCDlPjEoNKWEc1ta56j4bWeN+iDjFC1FL4aKvT+jaflIxqc1rnmDUXwof5lNWjzaaCrD2WGogqr3O1DyLOAaqMLcPDq30Kb+Y2u6+xkmmws3gY1bPIr+E4GXk3nomxXfDmSkNtnjBdjGZN/zoz5qtXB3Tym2927TQwlIPUsR/D4R5RUWxs377CwJdfIpkkhS38cj7uy7d6u0F7IWzDwV9wW+hF+GUGq/DLzF8GeF3tPLy844WwADeuhFUOl8L6KWsxYGl5n8Vl7DsxC4PxLzOr27hiUJeWzGrD4qq5mQNu5sBr5sC77BFQR1IYTxAXwblH1OI2C0UH7C2HBKFFg/7+woLpIh8E2JjvSHal6JlCEc0hTW+oS7vEc6qV0SWYHFiZBqy4epzQhI4Jm5w6nbJSFZCjOgZShv7Y5aXXFhODXQCmwc0JA/TZ6zcGfT2MdOddtsUIuG5/DN2yX4uMrn/bwq6XPKD9/sOupRKQ3vfc+jpno0YU+F9PxbobWGn0dKQ7aMR7pTUjoSQEJ9hyGeC7eEnbuvKhnqC2LC/WQ8MZaHS28ONLY1hgM6BIGFxdnBRxfCHLHK7lgKpykGqTIzeyu05PLekv3SOwSKcJ2s/hzTrMFeMdHkyV2dDLe0jLqytaS1sO2ODZblT/rdb20CSZUluX67mbkjohXxyO2F45D+UCfSIasEavdiu90jW9W0zDGFp9E2S2J031LTRRXFp/cc9pBxNMFhatqDIKg3y5mC8XHf5HGX+olX1BaaO8nAwSOZdrIG35GeO4z7O+bvRnIp0qQjWLp3W6gzYHE9Xpkpc4GDxNKPx2TpmgIi2Us15wV4TEujYR59NSBVQ+X2boK8x4KZZ9lpIRu4o5dvKZkjWYPIBcDEeY5LugtIKLdMbZUVKcx6S4dRNm0XxIEp6GuXH37I+7x57Q9gDdxCXb1MUkP0/wrnRecleAJ79J6RKySOf5HFh+ypWbMlWW4iEJoVaxZa6jQ7XLgM7O0oTjR8xLhO94zK5sT99UBgU86fF6u0Nv+eUlEBPaTDOMvpctus69/jCfLKezwTznOJI4NzQV/F4dTWraKFYr3tkCnQyg5PASlR4jlYkApx8x7Pj1iz+9efXTa6wFf0tUE4ldP0woODM0gQGYsyFCY2AUd5bW6MUrskkCMokxYSgM7rvMCgs9uY2j6NuUmuI4v9dpcUuhHJNbzuejArHgapaL3QuOmb0QUKIIFmz6Gc20JJMz6hRIgM6QhXjRnlJcRWhMBSeFMbFC2d6xNAHfvnr7vWpZzpGK6hkm3Th6IArIeigFO7wiRVvbHNumMucTpOU1RCsEQvvE1ENRTe7YWKEvEOi8BNLbNpsafnktwWdzW4GFca+3LcbfhprNHCCm/4yJPKoYpeiOVc6h/FTyKOrve2wiWbMJynTaP1HIZ1wmEsm5sUNEdVYZa/yVtdOsiwU2puu4DnpCKShm35xaBc8obaLluI/aY/nOFxe4MXv20Lu2huUfy+kcu8paWMk7SBuR5RihpPPbaDlXqQpBplTcJzZudCSUXP6IXp7WdPfwzALOWiOV0IiWUe8D6QXUz5hqc9o0enlJrr/e9QXqX7ADjoFZVCN7tdtWN3LjiMBZsNgJeZFKj2C4uM0pbSNpvYWPSmmBdUPwFkUR7gMrQU/3zhTt9JVTmFVNHw3JiOxSmOpyTiVKgEs4SaWgP4BTuK0sf9Di1h0cZZOzyK4PWqYJ6RUWrV4y4V1pNlv6tna4P6yL0U6lHvHPNZjHO7lbTflMZKaulrfTA9WJQa+DSYQgUMmQi6P2gqhZU6+FsOjzq9qeddVb15BFwJRyvN0L9a16S1x541byDThDl3VFagV+YYea6GSRz19g2PhF5SryHE6pK/LHJy3iHF3rVjGGUb9P4eZwBn7W2Ut12OwOWx5Q3hXC59930SjhxcJKwJFLBq5cyM5yHisqgHHcKSHJEnN6sdwiThgUYOcBsQekCOz3i+SGzpbd6308DuCvchezueDvOOb8MudLdHxY4OXYiOkZ3orRcbGEQ1OnsffZI+TlKGV143Py/as3lJL3RF5oVqT5oSqvj58+fwY//vzix2c7RiKk0HjQB/8ZVl+t9VB0DPXjqQJzwhH4OOYecWQ1z3C6HViywDNgEczLZL6j71FqK6bzOwCob292OIdfU8X0+i4AIpgdyrtFN3N1EKnEFivpAPsBG3lDQb804aptc3YXePOjFv9n+ageFgPM7wIghjOYIx0EmjRbXCOpTYeTJJs6wOfXw61gOdP5WoP5C4F5imAqwKuDnm+JOM5AfeA783y0YsXmW06wO+h8hKAwkg/JLNs1uS6otwJmB8m5ZH1B9qPIJxO0LraeYrsVdUG+MWCeajA7isD/sswXSXDE9OXjgTOY/xcb2ynTYZFus+U3A3pCYHYwkUY2TJPhEFPqhaCW24yvCo3AHDMYBbVhkOVdbFSBujNdLiiX6U16fpnnV3yILQtJcRd8khHpTfMZM05cNr76uowzezc5W/OlgPkrg3lqg9mhUFib9WKbPvxFgwn2Ygh8Wz5VeG3FqtWtDYtRD/5nXgCnQ578rDaoQA/24imBUXj9TIPZQZ5r5dp7szDPmscfgA9slVp7QzWK9Dor61fchljP3liPz7EImDcCZmeUpFOA1rCXK4R7G8jPCMwJ7OURELH8dtrAv3CJjwWowSjq3DDG4i6GKNQZx0g5QsbLST3I0v+wDcQTAeNOK2/ZamMjn1YhSMcMag2QZlp5y+6IdRxgVXqekW58NeYuFyBPZr/yTqntgLtXGcwbAPMtg7Ehr7tNPxLyjjVKoE6LIhs2EOeNQLqYZEb5xoDZ2WSO7wb6ziaT+5Egd6gWerROgIODVvISpGKHjbqce6e8KoWCecPjwPpegwEO7liDUegUBMzP0OcxLPBN+yiEThbgaTK8zGZpA+DploCdcb9kMPaIi3z2j/y8YX2H//BenJOH2crHPXQAzP/k5zvNoILPNuAQFN6sjeroILfsE0OqspoaOqC+xTpCB6n+ZuPbGuQO5l/jPJNpmV3MiBz9skytQ2VYFm4rdpV6/sjDVVPnhMG8YTCAOqmknC59yHXPcJIvR6Ze3bg91NFgFGTkzYaY+Wb9uSbITLLLWDx+AuAdyMibEZid+ZIygyHR5ezk2UrQ2wB8rcGcSBL0nbK83BCjtoJ8cvL9M8XyBohPPSxC/JX4G2J5gfjgMYFLO2ySb+4AoANmm126DVTZpUzqoSbnPwu1fQfA5ER5JWAUWHWH+qnGKGD/Isk5oIlyQ2ZhK6gMZmc0C2mT7xzcsx9PdsZpgr6MFxvok7YB9R2D+RPqk7JpUq9svTuQLxDMTjYbFwnQtuUQ4X8yfHnhgNkRIrXJKLeDSmB2ZukCr0g+NXr+yGB2ciRvn34BXyF521EE5nK5NoO1FTAB8/3yfEeyqH3q6XwtSf0A3LvVx+5dgHsHxy6c+5hg6BMfhScKjCKdw0k2ym9mkzxZfUJJlVUQQ6Tz6Q8vngkYBRk1Z2jjhplvs1nzJvkIyM8FzA/5xQ8ARkFfCfJuoNsgZ/lCp2lfycxtD/JHC4wCfZtMJyU5Z60e80eA/tvxyx9OCMwORsjb+DDJixEmX29QZUb+9R2CMTehk7W1p5SGGk3PGiD5wNRN6AmC2eY2lKs0Q6wApdvQ1QdXRRthNNNNfXSBqYNrjInZUBIJX+2EHqwiCuVY8/UrNPLfQR0SeBIgtlmOLpeUBHudW4jtIL4WMD8gGFf/f5lOpphbdYG2pGUGZ85K4o9V1tBlOj34Huo8RTBvFJjbbTgvqrIadojzImAwymRaAzcr6cPGwFxUwjonBKYCt2aomf/+I+HaIBdJUCmTlfDhDkG+TS4Yag08AeIB3R4qwmtUOdV0AOvK1RF5OROPVemAT+NR5URV58Vytj6rsg00Gt1rAoNiV4GZazeQoZU2ohYYP+4tw48nbwiM4tv7yWKRDC/x3qHv3QdCCfmKX+AFkp3hLIP/DccNxN0BKHz7sYZi3QaKfvYyTSaLSyCRwwq3Mr0c9uB/5rVUWYVGIf3s9wTmKYJRkDfBp4+ArMFtcK//EeDw0koCWKZFgQEJpml1/wwXxXBs71CB6JxLAfD+fmEwbxiMurrSt6Fr79ttoTMYgXu1PMcEU5sQi23g/pnBCFCnhTkm867AGHo2atsAlcVloK8BjAs4ONqpr4v/aMBiQTDK0QdpTWSu15Y6T8CC4BmB2cG4fhcJ2mFvsH3WguluHwDzJwKzUy4pYSMQVjHBWA14G4gnDOa1BrMDHFta5ORcO6ki0p0B/guBecFgds6TIp3CaT65zGuuG86nlz34H3xWQLH4w0YOvwL0WwDzEut9D+3skJ8xjnn9S9c1gfqaBw1mDWPEEMwiG66UZyrGiC+53hrmeduC9G3mFETYOAWxhOurVafZRbN1DT+uloXBkKWEgimacd1cE/iPgCma8ZeqhR28dF3wPliXREwBI1D8mV3EwA6leYmxearF3KsrCwwurLSxPlHaAiYuLFfDHXO+IfpuBRHBIDB0/0yDtuV3CkzAWBCL5ZrXHR8H8Q2AUaaImyzlNlDFHE0t5eIymeU0zrWxZxuobwnMm6VlhbGJul7KbnZwMxilrk9JRJGG5vkkG65UOKwJ1VUgERgB+hrB3O7QYbY8n23AdG8zYDzMTggMilSr7es/HiIM09jXK+FvflXRLKwBc225UV1RvP7zC6Wno5CYa45TQCLyNlH70AXTUwSzjW5wTZhB3eBqhIUS8PUjwbkIq0S1TeYVOI2VqlZvXpWoRvNK12nJED2sFvlVug5LT1U21MrRddoxgXmLYASuGLSla4HeHq4CY4Hm4AGORV0D/K1BPyUwxzYYG/66O/Yj4W9jErKCOARBeiYhnl3SOmC3gfoUwRh7JnXQDctsVGTr2d1sB5bAPD158YzAbKOi3AquVrFsahWyJTSyCoHZLGfJvLzMFzV+OHcD7uTFiYCx/HC2MEnZBjiapKSL4aby2jagngMY1jJTAGqgBOQpsZJB2gYWaZmfMpgTAiPnjTrH11zPDeCHzlRrPVFNt6FZ3DYDRzWdMYtDoGaoawmL2wI1Q30pwiIC39D6YVvgxvqBgAYE8wYxZ2ugAcEcxJwtbIO26YG2DVJV1keubcABLzw7waIGuXTt9THsoyBXMUzk2OH6l9lb9UDk2KfHWs20NrgtATKYHeApkkl+oTzuAw+UKB1nUG0e2igwe3bRDIbppGIlZG5Ddp/D8roH/zPvtgLKYGRuld2nKIHnk6SOY8t81/dtgIsS+DWA0cIkBd8IAs19d5BtQCph8k8Uer7BirfuWRNo0MgOdfvlsMjm9awwlOiVtsnfNoM8scDsgKh+BVgMNCEbr2PSD49UMde7YeCubovrvBQwqKMcZWWxpE6cL0cXFV3IfHTuvSDeYGXvfB3lMw3mWwJDem+JMF7D1cxLD33XBO2q9/PRiYARrmYLA0qpspESRhlQJhwvW7nMrfQYj8RpfENDiGMGo1zmHI/x1bClhPFWX7MLQXe9IOwNHOiK82QYu75sIQ3GJ3BS/EjI27gJrgnyLt0EtwUJsJabBnagKhui8huss420LMadq/SWIWlZWd7V69bm/lW5sOsbqSyV5R3r1vyUC+sMUSVlUMExw2N09XkI5liD+SiwGzBmPljVhmRUQv3Eokjs0D3l0JvjbcAqav+UwTw1YHYk7opSU6yjRlWFY+Fma5baDbFAYLSagpbaAy0y/acGzWA84GttqTWBuzYDDvCdcj5Zzq7GeXGTFKP1hFqvSp0bnctGUZ3vVJ2dTdR6CmzjGPXjK6KUWq/MNjUb2BIgxTCSug3YW1Yo1RbgRKyysdcYAq4x1m1gMgIZS8Cd8yK/SgsVUkhFlG+ErgpvQjK+JTAqpNALAbOzEdyNoLt3sHVwN8Coj4GLDPE424yLWCxnqw2KqvfqCGaH6m7GRWwD7i3W2VnOL4pk1GQCJyUqLxp8eKvAfuI6wkzUS8e1TyUvUriYg7YsHUuKpU18tLYB9kIyOQXTOn0CeD9BHQXzJYMh0BvyutuC3gEe+WrDRWTTvE1N3hCMgsY0M8iYnZcTt5ntoQlp/0ExZiO0VU25C2uGFNgG+DMCw11QIQWU1926kQy2BS1gFNh5PuIjbf1V3gbs63zER5qssgZbkNp9nR37UWDfMBgMU7fIhut79GwJ9w2BsTx61h/mR8PFYar7kw3gbQNO3Z/syA0CBT4NI3DphwLZCh6B4fiqCoFdjn4tSW4b0C5HrwlGNg9asTc9FCA8OQfJvtFDxFU8vyYrdnRQnPAJQJJrBkQKp75hyNtAe2XAkOT64vUbA2aHUjE0ZssIR/79nGnY9TGn8n9DL6BDnzH/N37aq+T//urRff7vz/FsmP/7HyXg9Q5ViqcgWU5UBX2J+JoypzynsN+4CVSW6zeEV52cfBMkQn4gz/VldnE5IFfWAWvkOBB/AYch5v+iyMV2LiR8KNdyqCLmWAi8disOBomEhdN57vDhVAEOXHSzhJMCE2cms2iP06iAiAtVlzMqgSmxnCp2qoBqYxgVH8dC8f69z98cRXuBlNL0caDLmq7XwK3JTF3bDKdiVosj72ltrAmf3uqMa4lk3c1m/mxK1P9Eax3P/HwE0ozJSaASJ55nC8yNEL16Q4l7JpLNZ3JLeVep/UiHKO8AoL0elVKgdZqpva4eCpf3R4JD3tO/aCjcfGU87iRSnjscHqdbweyXC5SnKbUTDY7hRaM85XWeYoHiPyO8XACBJLuYAfshCbAsJGFoMTY5kCarORPK6P8cYaajjpRmWJV8D2VlZi8uODAO9G6UqxQuwfkt9cRBudCsLa18FuvPmxkhNBsa2JdHVoHKd8Gp0kqZ+vdZq1ttSDe2bP991q6ZGJW7BA1XA6NUyavw0XmWOIkBpQMGSfri0sE7lYiAaZ2VOba0Mnkc80QxITT0YUGZPUomKnhPQ6Hf8D12D3MHcabhWa6mWr/vaSi4e+PgALZZIpmX6uzKNHIxf3INBalBPNgBayEelPsUiAfNNiMeFPgMiJeUA8xVLMcecJUzXPABb8yj/j4u6gh6NGAz5iPMw6LfSTAA92WRSqZrfq9ysOEzxbxXTl9b+jRsHdYfoG7yjxbTGVVBKKqXVqQl0w+lTmVC1VD9QXq//RE7v6q5S2qe6mRU3mzalppt92e3EfvMYfdhx8eCqYMFyFIJFmACvtni6NGnwgevHwg5Hi2n89JNr0Mj+cSLts4yrZh/t3WZO/6na83waCRrIpPMP3z2US+cymAsxZxcTw2ck8/NTVKGZxruRt80tRBg0kyf5vm8s+cNigU1GRT/qB8UhbQZdUS4M30yTQ6gwXkhfHgVVxROELZa1cZJNhlkY+nGtLywqqops89Yj2RCBSSWrajzlgtEoyV6o2Husm5LZSmrtqLRs3vaHk5H7TM3Aa9Dn6LfV1hpTp9WJ7N0oFc9auNzSuL/nKci/8OwgS/JizvUADTK//t7+4+eHPjy/6OvntzL/5/j2Ub+l79xM6q/y9tSqQWYxqiGmBWWT7NkSvnA+ZObRBzIvfui5yYkDykdvpCXy0Wm33G6ZfKYhAO1xPxoiNCwrSl5uNRQxzbXyYdCEOWrWJuoz8NlMZBXUkB9QcCSFXdges+sPcm2nXwiFG+W3gzyidExcMpxyRKZT9wswT2VlhfOug5nk5Y8bq3dVtcpGkglj/m/dRmGq041L3O1gSVZH1XeX6qkdTcnQhM6b9Qxs5H6psoFUMbivOCF1xmz9R8lZ8Gu1psk5+mk9us4SyejgSJgtcWs5VlRhJGiHtwEc9+NgR+qKwISjklaXR5RFtRAMTypsqHCMaXeMmf5EhNzyolOKzIYyPkU6/kPzbx1KFJtATBA7Tjex3LuSAu0W9yaKMzLa365xXhRMAkn/eF+9NYEM3u7b/ziek6pqP7lFnPnFUq6LxxewFnLAJdlMYhOUTfVIb8Tvb2ZjRpdRWD6nAbc7MadAPNiV7Z4y4pQK5MPxGTVngqI8cQF/QUzR3Ie2dafkX6U3V1pdZjMEPA5iO3zdMi55Smn7ewfsCREQSk3ttXZlp8hEulJdXgCoHZkD6K/5UuE315EvyzT4layG0s9hIrMIneLtQc0ATFexEdtQId2RbW2aoKwN9We4LOyJnCwALJVxQGqUSHRZWdVixZGpJOt+/4gOsmBYQaR5CaZUWLdCBWKt5Haff8VvRoOE3QMoUyXyxLT09DRtKAI+tEku0oxTy5eIc4wffA4Ws4yneq5Ad9Pz+wh+EroB9ErkwEXzUpvoqS4KE/3zgCEVzJq4ahb/ttTed+L4jiOzoKVdnFy6mryR1XdKcSauqOV077jNf0Djh3m6JclLDZtFy5ml4LVrLIlHYIY0CepnhAzwYV2KoWQDoC8yZ8xXfReWDH1IPofTLE6pLzgVWwIK7OCSxsq6e91q3ftXUp8Sx2ENT7ErpgZwBnTCxLB8bacpqN1O1PDd8lU+Q0QJiL0Y4IS6ERZD7huM4eWpYryMhXAwBHNU9NBvXmaoNcdJZk2lLbD+F0dxLodqh28gLNA2TsiaoC41tyfEvwzR7mQ4UHeqFzgFkBej3VpaeG/55SUYXGr2xN2pam5Cq+jjp7KB5wWm8e31RvCp+A2RfokXO4sTYEcwCQyR2fzas6lwTwpkqkpfQiM9AKzBqM6Dv/lNMVp1O9jwDRdTd01mAuxidAV6MOSbWmRRudDzNE9vOyh7QJs5nfpEEQ2YOjLS8phzH2nqwdLzS7zbDNU8BuQ4PyWby+0BsAZlP6B8+DRd7oNo7qcVZ14St1OjxM7y+Lky0IPh4ijAbMR71NFHesyUfVTiz29dvyPPBOVHG2SboDp8ljTCrMIw273+1Sqr0odtZ1S8yQryiqNxOW66kXXpCjO3sWI4PC/KWOUDzhwDsz4+uQoIowLEZYrJwv97/0s9GatTpD3JKyAUsEyV3j0ne4fhum87gqicZDcZ6Uyf+5c96LzHIVghIx/0XV5xsrnXYyuTvsDdwOwmZT0HFP/BQFf4/xb0uu1zpJe7cWDyF0mFKJQZCdhAaTm3x9VqtDSWYIy/p+RlHswW0dtugji8RPZaB+1YVW7XgcQVb6Eviqso5Y9ecLCTigeQMZVLLLGxzvFRIZqUzT13GPgZhgIvUD1UBxg9q65M3gnKbQQGO7lfIJ8ekmYim6ZwAnRHF2jgNZD5hx6vYu5EGY185rGF3HUxnjRfCXVWZb9NCkXeHuk/jzohmfcx/4I/r/z/kPX2QEEvLoJ4F3PYDtshxDvAZWu67G5rhsbbcIq0BATxnP1Qu7qca3lhCrTpBhe0g5J31E67GEaRz/kF3SYwRaBQweNN/GIPV/i2QTiaVzTfvQe+kq7CU+5dnTId0Mf8KuczxSc2gX3nwAioZXHuY50fWTqsX547RjausCS89IDtSaY6trolWlXF+X3sChXd0EZzWoSCMVMeaIX4X4LWCK2TI/QVbwV3WSTCd1RoYUWmm4Rq4VoqJnfWuAtKtuyRqDsHqCQYRFZElzLeOSNZQxiRETmXpgZijqaD+82cGYsaE6TWyRZJMTVMGvbsFTEw/u1qrPA+khSzrDqzeabt5uT5axuVrIYduIsj05xes52o3mRjrN3TVNUweB1p0xpdKxzE3eNUtXTsGXNvQOO2VnBHvwh6j2Qfrun/f2z6hxaSgSNSmrWPhKV1sWkl+niMh8BBZo7UkH6LhkuJrcRkhFkD+R4VA31olzpb9BEibYZWkTdkFZBXaTWzLBWmjlz6SAtqjNEExbQZ6y4vm09p8HAcFFnCKcqNsQkW7OD2kQQkEobXrfqO/FNtP/p+jBdThYZHv/BngiucE9O984MvhTJjWvbAKfTeS/6AgkU/PPF1Q3+VRWQ9X1Xx5aIVXXv0iKgcG+w6xhORyQpH50yffDk526PqOeZ1TtL2LaJSdMueDG7zq8Ag4DaA1qyfhj3KAjxBUjHSsRdhzo0CNueEi/qTHwK0q1BcLkCPVJGzy1rYK2uV8y5gKhZmPZFumh/5MoEF6ndz4+IZehF4fU6s0/wB9HbV89eHUZviXEihgIPkxQdHBLU0c/wIrbfZ+PWPpwy/XG+BGkLNQMYZgF1F8jYwiug4MDYosOuah12nMyIY7lBpVudH/PFd9hWt4VUWAqiiWA3eIi56glL2Sz2t0mRAl+wSCb+aiiDltZPs+R8QmqaAmOgA+fnnEmtqrmtuXlWhjZkq+IciwD9RjarUi7j9VbNKfmUNLWIlLP0xhAOQGe+GiN9ztIgPN1O45FQwJqgo3kA47/TNYdAqwGVR0jjoUm6TebWE/KBtBSEQ0AznA7TzPN3FDijIpPGrF3uxHHcjWW8LWDGWt2oL5vMDAR2GYWyx+7O8LjhyiO/Ub59bqkoPC3d8iSZno8SFWvnUAfdwaD+I1jemG6w2OvntPXu9tfWmeJ/XmJyhNmFWUZR19nLchgd4xU8TpZ11YQTTJNlqfDI9DcVJEK/02r/0Zw90TPJqjvFnQsKkWKQVHuyoHzqChB7Wnx41on+Ft4bKHgyn/MLZBDwEockjmR4aTUnmO0STING3KjSPmKvFiEggE/Hr1+8orYCJPaYsdjVDqp5oJ+kPVyCfEIE2O5BWxHverbC9+AAeqJ62KnZa/jIdGveTuuhg+p7uyG8L67RcRg7QijDLE6n64kylo7CbrVHahnGOlIX+OrAeqsPPUKXLaV5mTEXW2FhcVCdma25ofa/xIuKLpKD4Le41e2eWcPx5ezq1fKzHO9yr2bAIl7C/wCFeAvzDTKO8zBqQdOkIHEGY1sxwEi0MUqLG2jVnHm2mUetKapneeGcuuEaq8/gOj8MMpcs0vTXdCPBKLF3zYneNTRrl8iR015RBENYoMltlfnRm1nDeisqe7n3BUw4x2t2lJMnpPUgabvmAgE2vKE7rD9Dsjq8REdI+Li4SVOjqEIOKNOSnEY+ohzJ5Ca5VV47PCgUYOgKmjI/GjMOPrhZxB+Z4469aoEdMyziOLrNl9ECuBLoGE870ifPcsTcUdhyiyZohMajODqGn7qWGouGZZlJ8Cqdp8ME1XWojVD+P6J/1hOBN+uHWAJYO9ZK9K1+wam4C6dVs1DvjmXFBmyLQQX2RU1HeC7KuF2VPsyu48p1uy5yN55DauqrbL4No/V2ot54ZLUgjNcXnlQUuLPDEofRK2CMYK9NgZk1s4P4RK3RHmyUJMJHHSGXdTcXllYsHg4Z4GR2K0dikDcCjMHQPmSek5TmnrDmqHwQEU03VOQ8KTUpcU0W0BQQP/jSuvo+FmKkb6+oCzh9TkcX+YAn7cgtXW1QNaqNI1XV6kkLjP0MKB0IUNrbcIJKzVvFHlG90DGOZR3zUhb0e2q4dcc6f1VnO1tmNuwVgr/mVpG2/5mbhDw1y1R7JX38RtEt3u1mEYnc2zGeHCi75/jHZ9HxDz+s3BMG0UkBug2Gm9FujuUNekV8snEYX22od4S0ur1/HcQFmQH9aRTeOnPfjL9OURL31CID9qpmN0dbJc4wnuZjlwOLptlsWYaRWONpsNew3KpTq3GsEaPXQbwmQmn1JGiusBnOqab+pVAOeiAIR6cpG4FHMF4/QMEK/n47idgWiKOTS+AtL5FRGFt2fPkw1soTzf2LHpm6fAidPeuGPYb9NWpzN9pbMH4WsH/mkg3z5WwxoLtWkCw2vp2aLafnaWELW+6mVgtGHtyAy0uyqSVwUT4LsG6FI4wF5t44ETrXbNaQZMptH1LSvQ5g3w5I96pN1EJwNA7CIbuaDUVc/J+TVz+KSozc0fXVhSWfGXFd3xaBdKWvSvgmjjQJWs6Sm5DYJ8/+aA4RJnu5znLW5XIjyutobPq7IDkLyTizD6qHvL1QjkTiRoGBZk0kXjMg+oKtjKZJUV6ySi0p3dHRDKEvJbWbNCisxGzOsEx0L83EALcyW+eqS2dlrcvXE170gOZrXtcj1b7VDV2uVZyD31e2XyuZZ5JRoHUYta73A3SbrVfhKy536LvS0bbQ2TPwnayS0I3cNQL6YJ0jeGGFxvcgQ1vzqq43UO3V6udHOJSag6Xm0sORtSs46LSkgFlWA/71h3OZZ26FsPOWrmide6C1L+jMFY/6o2uDCl5yJAq9W86VT+A6R4WbMBbkrCNHfSY1M6ZPtDuZhyBVToZmq1DfnlxE0YLvSZRTzL8uOkpfZTw+lW4k0LBi4ti2ilSrC2WtaecDR1Oc0iIp6UhfKTvU2uqxyn2C9NDT6AVVYnTLT6ZlmuajHu/S0vXhZVvKpsDzvCyz82ySLUh9IRsNgPjnRnd90k/UDKi/iIJ0wALGE6HzDxQfJauWCQINZv9Q8oNbM8vuj3wFiL4NupK50nhJDqn5uGbWg2sJPdfmD2oOcfnhf07AASTZWDZEplcSJgshKSSL835d4wWNbdxN24ABwyu1vCsN0+Ht7SWaQZKKgeJvwZgCVhII3bGRUPNbs/mYl1h7782p29pEwGCKYQntvRhGijKOjg0uMQXNrKhVLslU1dfbIAsaz5TvNknCtODy9iCSS6vxaXaEmhzZGTIxek7UDWrlZs+ZoeA6iO/2PJOtL17Yunc79g6DDUaHBsZwLR3Oh7jlCib4LzwHgWGTLTaGb1QDPcKidDUYp2zxQJvb3in+bZlbXQ/HayRgiGjqWYIpylqD82U2GQnSa17AQ/HCvk1rW/XaDgPwfXKdcqt9+hqJE6yxlFF9z5RvmVEfo2JZMWOeFkJ/MqwTG6PY23pN07u1uKeWNYiWNS2nYpul+mM+OdYvFttEVypRsZzN6MC05wZWZQF0MCGhj23n+GITXfmdETgcmetY5ZiSKCsSb/ELyw4sxX2gQkllUGuRAKckxA0TnA2AHAxT0VAsQJSc5LMLSuzQKB9+i2NCuoexVnClsxkb/CJHQLFS622tbNsBkmuK5RCDTKhdhGrG2Sh1NRbzIr8A4jMlGWhZ8ll/ld6Wu2QFX5L5lVwx5iTkwWiBtSFxZ15kIJdlEzLQQk/VkjhbaPAcTxWJSGs7mCK/RygGfMqiD2cLWjqWGYjuHDYnOkZzfPSwQsNvEObHYyQ4GfZjRI0nS6CP2FsS9hf5hMLDaSsj6D0QQUr5oDc7VIYm3alkz6lrwC/XykaT1SrTi88fx4RM3xyGP+PD6xPmafU0pJhU7Bxv4OM4btWWQ0ySMuHGPkTh9yv6CQ2Gm6u+/RDEU7SHeP/BIRprmHQAXrEnfzwWCw3nM3ygGENQhkMNBb+etrn19pm0pSMT1RRXk60rqBcdxKUBncyyKX334mPZ6UhlyhwEFuIRxEe7zfkKpsm8rayK6D4eqF+CFxa0el6DcK4Ut3F0kqMRWHtB1+WaMjD20ntl5YQMA1Yh7nNBl9v4Wd1tIwR3JYn2yCTiWPF3x6JQ5k80e0ESZaiVT6icX+7sIuupIFW5YDP3WIjmXZd2Co9OASVkWfirT3RHhugCtZlhuDKL9HJksqPytow5zuHdUuPX0AlgFQkwEmVBBqRCM3Uocxci6FCqjoVuNCUb76qIxYUPo1dOXdKYsYWmBke8GUHrSMhq1qzpkXbjANGa7SbBgZBflDt/BFqMUOVdDZpYE7gurliiOCFg5aAUERxtUrN8qX/by8RR285vFyo6TQTbakKB+Rz+6qOOV+wdUa+QzPBnOAbZbnWJZ41vnsxRG4BTo/K+sQC13OETR99HAdkjCWMpeoRcjtZuHD1P4IiiMxdLUJTb/AKkBbqlsU1vjKSrYb0gWVt4dKFOo3Q+yW/JehD6OUrSKZyvKR2lyrqRY/iKPSgmmRmxoWGimAwt3asacs1vDzK6SFD9QHZKKgyO1TUl28iKgbgCHSX5J5kYL+vRKJNXxuEauoImFqLJB7IKTApqVTNLtJbWHQQ4jJ5ZG4awQTgiCntRRucFCCj2rTkOWN94UxQOFe6EFnGRa3gcgBiN6ITf4OB5vLi86ddnJWDiIz4HtYGoOjzS4pvD6I8AfcCKvm/qjnnmgdVh71QJ1wie/Hd5xo/i5XyE9sirTh+999UfavsLfbH3v/W3kAH8TyMNCmtkVx4vFrlqPlw+joIFSFa92Fh/JDH5QspQuTCpPaRohHd0RDGRW+OA+rRUYIPjj9fXPvx+mziKGKn5VMZHi1sVJdoa+PJmOSO3HdVWlFwkqKJ1FWX6LtELoC3XDHyBxzd+ZWVVTb+sy8IG605yw1a3FflwuCxK0pV7wdr4rBMNneoINqQYbEazz45k2kFB+qHUa/YkS9Cx4IpYF1ItVaG14bWUqXgnPkqrfchs/Yyqhctolt7TDinNTZs1N3JOalGsSomV2gWN3f8+Q/1Nwd5G+prK3hhojrxCw7zG5ljjztvX54auskNaXhx1BTW1wguwyOCh+E9rdPRr3SQZdqyAbhmp8GeMRQMfon4fPh1JG3C6/2yYCdVtZb79uXdKk4efY1YoloepsTQPb50VbqzuzsJ2Av6l9T6uVT+2Bl3qytuggLI1dE/dULyqm12XNtDQPwdlMHGZKOD5Fipd6qzl5LDCy6/i4EeRFIQScCiVHukpbzDGSg0pCOIWp2an6142/ZJwMNqcxRyTlX3NRfFoQLkS90xx6zaB+eVvK/V0R62bJLQ7VxZTJvoin5+q/CKd0Yk5Zr4xWJwcIowOlGIyLIv0cx2XrnuutTGpjyHEN3vM3mRmilbuLl3Uv86YBKPv6MA7drsqZko4XoqYT0yspBT9upwUFHYDPnPoE84uAig9zUHGx5mzZ015zklEOrKrl5A02EK5HI+zdxUolTmYuDq6cDCWSq32+w9HVmCRiRdeaT2aw6v6r0Fy1C2Sj4lWmA0r8D+7s2oe3Hi3rqYzquFGMmO1uBatscpXCY7X2JZUx25lXdJTqfNbpT9qQX8LJMiatLAh+PU9DaL1W4sG6ZX91yJDAYQMUiKYmwGy9UKJ2HO5PvKIE9UA+ilepeEoA66b+krndN1w0PNdHOMSsUdRanJplPxaIxADl0A3qsRJBQHwvPYxckIyRH2CbhevcDECA8XrpcrA9RYxTwlpMtSsOEstDrBlbncVNTJB/3nf4EIrJGRKqmEaKoTHC2u0hgq1UNtC+bxX17nJOKGETqnzqkhhCw+TstkmRdFGqtlMGCuf9Bbu9xUweyurd91NNRzcl8+7lfnq6GMMU7wJDG5kCtoygBNX5fDJZgN07oGDoBzfHu2HxlMuh5TU1uQ+0KYPAzlZy6O9njplG3MkRP61d6jMeoTlda4ICztXSEAabZDjDs3So/AbZoRcmqTbliGjmo15ALzH4vaNTWJlEsRdfSEWfIZSYRY/OO8AG8tLuq/pmYWI5nAi5yOxKdF+QAEfDYP/AZfhzE9VCCWmcfRdDVl1VZ01lLlTdq1bOIzCJDFFtCex55lATiNMITtVUlhP/mxffvFcZ3seurdU2QeA9SKtkyLqOo4ic5+3srC3dkAWZYzdleAqPg09fv0C/ySffSu9ADYmKADAZH11o8OC2KjEXmJzCcfD/PHVW1LSZrMlhiecTMjAc2yZS9vmmPowQ3fBpZVzA7282Pxbbv2q15sunh9Gf83wItG5rjU41OMNY+1oFx4+fngaWgXjD2UaPU/HvBlSa6NkZoNVrVhtwIc6jrReYaX+J9BoKYV+8HgEMXZrdX65yOdOlxHNzI4SHyFW7bJ4xHbKlPWbDbIT6bjeZFXcUbtDj02l5HSmz44uybMraHCeXibXSBRKvnS4dRqW/WiPuDJbFQJzSHhiloI4eYtLodiXlHzUIsWyTO6w0gLQJiHpSZAzjr69jeQ2rcfroi0CSo5kDjS+zGlRpH2a6WDDqVgR5PMql2X17TPhgNxx4sLTfx1MyFyvr8AqMRlD5gn7jpYKMDagtYuPuI4Sz4qxIS+l7b7APcflYSOCKn+oMNsg7oBtpUvmW+QHRfVRE4CQagsGD1lEjgGfUMCH7ev3gHNAlrAHh/6EVZwdXKlME4fB+W0gYDVNcPiTYWARSlA6dfDe94mzP4Y527Akq/tkRXlqyMuhSqNbRHUHByE03GbZzwqvivZ3DARPO7nz0vuhHegwNck7xMIP6jvvleAYfeJH00sh1837TWbXxoe1Jtiu0MXM6d4B2DROe8tktSMlM+NykqbzjoX/Lhq7G2OK0Y2tN19G+71o/3G3wnhPJhbjTQwM8NwfwWFX+ek1uee/JijAMkurGCHt6Wez0OzSbLmOzYj+zRwSEeDDMQpH1bBNkasNWe/jH/8WXWf5hDLZ+OyqOozMOb0W643mZ/estxdGy9/dhjEm9sZMnX2+6v3EqUmq6OOx48x9GVen3woXTX09jF5ms2y6nAZCADCnhU2Lp79wwDJruxoTMVqq0V8DmqFGonoJviE7jFvKx8yN+CJv3SzeOMAhZ04uGtsvXvssefbfL8Y+viSW9EaBEuzgbzIwNUvLMiAw3LPA8NtSOSDjWVE7cM6IyvGkjZYQJZrQwD39DWdoo4T1kTDDgUZY4pskOXtGGGcKbiYt8yotJ3zhQtfwY3WEKD83G0ita+RnZLo7mFJE7ZjzZKRmB1/jtNCKZWNbyLYOMsr3oWhlZY8STFW5cqZhgIuLC4A1ivX2JPySDerf3bl6Z2PjQqSJg3SMcAR2ONdZPusTO2c8QDPbupsXsSofY5P1KQk4HqJF6NxVtQ8czCpKIX7fHXrZXu5eDnEdmI+sA6DKeTbLLPh4ckv1+yrhRbq0LRft97KZkxZgddJSPQiv0qY9dGbK6WJTjfMiTa7+peStyaQdHtLm4lZV4jk6Moj7GxN2KDe2DkK1Xt7nhjTPwRTP4TTLNVmVsRUl9eh+SXQQyXzov9Ydeh+1r9qHUfu6HX2olD1VhenfA04serZJXUrWsa9aoF+qmXDPnHyNXvjy2jTA0THHXuq05/mo3e15jkT8fhfdC2lO26guMjJFbXaEU6qWnA8xFRT+CQvfPovtrim7NGOHVqS/LLMiNb5LWurhLmLsRo5EjAwG3/934+gZhxrmjFiVdMS6s794+QX7yAsQcB4px7Vm+YnSFaElZIoDE6D6IBTLAzbS+v0RcVddr2Hy4dLMIU/ULgapizDRwZLFwZySZaH8qnJp6dhP6Tu03y2dUAz96L2V1omzOn2Ioo7K3GQSN4napRsp0aKM2v1JZGeg4vRWTtu/rzYebludA123eVPdXmc/jaKXig+dp+ekOEcH3PBK/P4ovAQOPnnxj6O/XqYoBbohtdxcmOScktjRnEunSZdmHEY/lRTFrUcGUjr0tglJSu1lJu62ykwqsj7nSDA0LIeDo8SDw8Tlw71StrtOq+QDpz3sTCXJbtCJ4y4iPvNwGalishG6CKpoDk5sap3ZDrk8ssNS+2youotKDOuyC5pEHlZmxpgfqOZtTcNhwbHb1TeHwFbjPMpfrd5KQqUpp9jRhhWx3nng/Q5X8o4LP3SWH4jQ+dnd+d2/1aORazCE/TUDikW5V+L57d3B2IPnyaNH9C88/r+P9h/u/W7/4aP9g8cHT57g+/2H+189/F20d3ddqH+WSHui6HOA+i0+RGUGwLpjaI7BQIXUSc7LfLIErpl/7+xw6J0paROljCRQER4vKwdFjjWS0RTtMkcdvkUSlstErEFHTGpH0vzEQKI4uKwV2Q1OyQs8DeFYOnX2cNV5ta0F4mrp+lq6NlIv5MuOpdsN8U3b3GEsjYx0Tclq0AovYNyO+/5D18wgEP6BGO+sPX3zS4zdDiJA+w3XbLvtkfyYjjZYENPiiaprtTmDogOKsr7+CusVCi+2WoM32Ko1reEJtyeMfbzhzOAO6Z+6Z1TjAUps9IHdoii+gPjMScei23TxX1RY9BNeU3UDquRW4+y49PYSmJZblaUWX1COMmMWMVsfiK09MZcaOG+4Tq3XGDYnpe3YIjWOKcONUSnsR8uVD1UXrV7XQ/mO74rvBMKD6Fl6USQjDiwxgZN3FLUFQBun5lG8v6I7qoFPOOJjFZGnAQY1tBqIoAd9Mfg7LGB3zRYZlENZKC0XA2DyrjMUA/wdiyqK0G415b3UVhXcXFUdE7zpLO6SKtnuvAxHU5fr4eAcHce2oCzfYj2LqmTT5CJlR2g5c/zhK55SufFp5ShwuFZt2d10DwTTIDuPmyTelorG0Ayam3MEKrqIwHQxQHulaJ/KcWIWasF2VLbAxSF+l63Vq8NfJBc2Bfw8B9sLGs8JaxHXO91oasM5gNc73f7duOR/36fC/6MR00CHWLwTOWAF/7+//2Tf4/8fPXm8d8//f45HePnlDJnfUjH6PlYolv8pC8E7qwNx7nCg0LfQJpkgdBSEGF89TUrt+YoHACEdBUL1o/JzIE8TEtNoodn0vizTYvGi7Ij+m+lttxftBQs+R+Vex4nS1ovef1hdlkKGQtn2+w/tmi6geoyKKxWQaGsGVu4LPVYp449WqWOO1Exb4w01i7HPp7d9edWqnTWly9BKjMbxhiD1gvCRE4cTeEA/QHrEk30Ap1s2GwzaPCy97vi2c38w/MaeMP1nruWudEDN9P/h3kP45tH/vf3H9/T/czzr6n/C54SrEPri7sg+B8U+YvO1WqJPpXSu3141pW+g+KkJ9H+2Xg0rmfCGFU5bLhB34OSzXBk5hu42A491mM9YYnqHAKOY26GKILlVeggEGr9VMjWPyW3MirzOHeI7rECoEmyEU3KvburXtMix0sXisuWPG8P0glhzXUmDShHenKZbmI3B80BrncO7A+/dNJnvt0Kh7VpDeP0wkM4Bc0E8ckUXr028wMNGq5LX42p7T6qvvnJfnQWaPwg2HxbqWikUDkCmb2P49qTyKRDyt6bti4a2L9dp2xqdERGnGpGR10KLbKIXR5YtwegAzQdiCykcxIXPgHCjOoRrv1bVolE2EuVeuSDjuBxvVBkbUbJ1gjz5e8dKxTztcZe7wS1OkrFdfHRw2kbka59tXo8wACtiSpItK5/uWYDdfZaQxF+hLwGqOtUU634H0vMvvgOpUjJbTiYtvtb3P3HIOMyGs7hMmd5b27dOvll0pmsftm7pNU5Oq/DxJoW/bS7MUo1V/rwXHYQpQaXTiNKbjfOUt0HlzG8aAdXBsF1kwb4GU+L2UNdcAbMyEdjTeNiLHq43b1R81Iserdet/Xi9DhFjYWrSju82d8qtcipU4mxFLR8IEc7HG1ToRaePe096X52tVUd3y6qm6y0Kzyep0rmHrlbVYrGe6XOO/E3MIfdiNkrfkf+/nZWHTBOtby5cdPtYby8Qrdxw01MdPqA2r7a/bbX4YtuKl5tsPV0rsP9qoM5ShyQifV5zrwrB7ln0ek0sVKT+zK1rHf04kIdoo9xO0HTvvH3WNGtUeq0J5h3wcBVBky7r0oQvwHU4fUS+5LH1m5L+XaaTSd6y3g7tu1Z+NdKXcOYdas0oI1bTDCariAOcI9KDxmJAYCkiT1MZoKqS76GhUMoZzsJM3mCIIUKAP0xnZVC0MlyfX/LI7V4TK3i8Lit4vCkr+Gw1K/jiU7OCb++MFfzuN8cK/ljPCp78xljBGoZtnZZX8I2Vlr/9zKzgOoBeHr/ev+ce1+UevYmLn67dISr+bL0OUdnn9+xsHTtbM6SXz98ePzt+exz/8OLk7XqzoKqctqjOGrPgAlljFtwK681CpVv3TP09U78pU6+66CDgmrPv1ll79r1q685+pVr8p20rfr/G7FdrbTj7ugE1+/cy1b1M9REyFV1WsImeiFG6kZGWo1zeHda5IhvBsldko/awHRKM2u+q1en9bbUJev8rWgS2f91H7Pr1gP77sF1nZ/6h4eZjZFtk8yg+NN1CVMs//NDdrP2ezMyGcFS9R1vUK1S9bfrZk1X7UAN43fq8yHWtrBq228zB3XSmJxh2N51SzT388LFT7fauJ/h+dreD7lnb6BM2zTu0FsB2U1yB8FgguJQM6X8NJZvsAynTF48dNFXooTqnh1qaMDtMczHZt7o62W+YNafk6dnaJU0n1q6RbFgDyq5dNGnZyDzL6fVgMvWmb79m0nh9nSZNG00o4fZiv6bDgbLcl01Kw+QdbFCFDt/wBg+Ufk9XyAcOSZgcuLOHLTbh3EEVej1wuzDzADbkhy5k58gMaCwD19/0PqD3pPek4WzSZAZgjGpgpDUwxlvCoOgPYTCnQFAeMlt1th5E/atGE8AL93B9d4fQ1OlfTbt1YxiBAdIy/zNh16HYRn2SDbBJp5qAe539BNC3gLL5vDeg/vizjDL9HKOkXfzw7LOAQWLx+SAFydInWKb1SCQ1/MkHvzW5drpiTr1Hd3fq1VxaJfsNt1bn4ftAUxnv3gK3dqaBg8YGuJGHUOar+ka4ISz0dW2Zqntb+G3gMq/56G88JR99HMFeD/0+Egi9X7n+1Yn6rfb0ozB1XSz5Nxv8OrvwrjZYA1W7dzm6uyfs/1NKAJ27cQFaFf/l4eOK/+fjh4/u/X8+x/OR/j8KUVQ99Vs+wx5ln3v6yAGeiLSlpeMrdKICRK12F3Ia8c2cfGrqFm4v0ukcA4bvvkOdmfWrgSA3NXFq/2xSPq3ZyK3XrUaVzHZtHrSd1FEPopMUk5px4LTx8tdfbyNqUoLvUnAu9Cq6yYsrCvaz6RBH/0hmF7nTp1j/YUKbZbkqudWgN4USH2y1Xk1gPln/3S5v3PbBZ12Cgw3BuJu7TBcS0gejXlR29z7H72VScWorDA+cL34oyne3v7abLDzK/bhcni+KBPNCHXR1Lm8YyopqQK8wV5xbpwa8aehhsLcHa3f3wOruwzDoFfWz2SItyrSmAb/D21OJhbtkFYS3urk4CBdtxiGLuDUWPGicEbQ+WqjVXFir2a0zPnTqmdn06u6vrqtX0qu61/2Ms7jt3Kwxvk81N/dCwJ08Yf5/ucjuzv1/Ff9/8OTA9/9/+OSrg3v+/3M8H8n/I6KoOuk72qyD2XKaFphBZ0CWUeuEjhxOcuAskl50jjliJ4NFPjnaT/t7f+hhT+jnXrznxRc7LztJ/7wb/fEIDqN3HakXfUG/6GuXqnfOu13dTndbuaNmdD6Pog2IKu4TFEY/gmF4FkHt0MsM33rvXgZLvsyCr/fCb2sKz2peh4vvpwdoirAX/EL92d979PXjr56ES2QNlfkTP5UC8cP9R9Slg/gPB48ePj74+utHB384eAIUJO3v+6UfxlAarVHg3z37eUiIVS28lMLw+Ung85TnYg86EfgqdQNfsvpPf8ZP0LvKSPHjVdPHl/IxNE34/U/me12Rt06RulKv/VJ1BZ+r2fty/2v/8/6j+DlPw5ODvf2vYOUePXry+NEf/vA4/fJgTxe23E0wUmaGYSD1foqv0ttKampfblOURNc6zc56dYSpk3UtOecBgYryYayI0yogdc0qy8weostvXV9ZOf/v9uinp/n83z94uOfr/4gluD//P8Oz4fmPUsQ4m6Tqd3lbqj+zXP2V63dpUcz0a4yhputl72BfPFBhzuDIniUXFLo/WUgo/JtkHpWLUb7EmOQjaInTA5wvx+MU07U9iI5ntxQah2NyzmZQ/xyj3EfzAqQOk2xtmMxxdKOIcyCXKdSVZjj91DWnopIUyUl5KAHuY2EVXi0X8yWwBdRMh7/ZDMJgkMEWHgyC6kgYAPACWR5/ewub/MUrP5oRjsz7bjWcovgUaPm2jHlydEqj5cL/yi0rIPprMAv8ADMdqSEgyRwOMIAo/8XZxCIkd+l5Mryq7Qj8GAz452BQ0x1VBn5CGcONTeffwSqY2cWaKq7q0yKl/BkJIWBeJMVthGjYo0iFdFpgAGjAhd2bIltwmjOd81pFrqOmXoz5NwY1dPI0Z/QCq8NHwIVFzmm3MJsUJTEcUicoYxm1pL/O81Inui5SlRbORIYN40lP9UOS2JSAkdm7o1a8mM5bPhLxR5w++sP9SJ0Q+3vngxrokQK1DmZZLardHr9Vs05LJD21OtaDLZdS7/V50ufzpD+nFEleOCm7d+6JXvGicvoU4/Iwz62qx+lsCKJFp71cjPtf25p8t/ZkWV526j5i02WaXnX2AKPK+OT58z8PTp6/7SJbgO8jQYbz9CKjGOuo9VLr77Qpvlk6JVTNYEYYPji/DXSIMkztNG9WHkzdwumx6vK4N8LFvVlpno1Qp7g0AbAAquF5MNXKE3rVZhdbgQLMfHU3nHVyiqs05nitBMggk8Am8ucupqS7mk8yjo9ZdnI6Ojxy9iwts4sZJ2OhwtFyHnFJTvvSz4848w5SIU6sWGaYSiaQfklCsKosTDovFKpG7R+YRopaklQ3DA/TuiC3OsEkPIXExFdJGynvLSO69A66A7XF9cfKDNPcLWfwgATSmOQsqoQpl2R66te7GHs273SJzr+juPnUgHof0xx2Wn8HMoPNmwq/PwKwZ1a49XyCAj9gCJ1unUrQcivIFiWy6+DAYOmXmMYHVnvR1ckHZhi4fTDJZrDKeLwADUxGeAQdtUHmcZttt+N/5JgjjUt8ibVoNPQHiTlwPtEwuEFlYk2giJ0ZTPKLssNBx3uYHIkD2MK5BUdKBsKHdGiYL+FIgZ1LdJG6I5RRoshTMUD8NvzfF8HaVG4GPRp4hTuh0tGXSkUu6Q0Qe+BkGf8yo37i8IDdizEpLaVm7ejO2xuJo6kzfV+23384xVKHRHDP3n84kufvs3aM6aeSRYf70HMhWuSfdu1AkJrSSWl8kYwDnfbfC2gQ9gn8t1vflQpQWXUbQs+eMFuurBlYOhttNiwbFTjEPZ7gxa1GidFvDRWoez2VEs1HglHT4n/x/sNhYE6oxa7LStA7kqpxXtueK3R15wgxr+u+NVnqD8vxeuLnhszGNsmQthm1kXfAaWgzJayG0/cQFMWjeLSczsuO7iP27ejAO+smQaA4u9wWkbbS6gCcT8MiOw9E9Pe6QD/X3CXh+Qg0iuupV5Iz57npJu9mv1X3h15y2S6flFxSAmGkeKMUtu2krCK81Yt61P/7DAgEl1yH9rkUr4k4cK+2xPuGTq6kYzb1ml6NsmIwh2NwcSlz4DB7wGxOk6sUCpVchr4Ic/fqhGIdYGpCeEPYzelXo28O4scOSXg3jEnzgGSB/oifP///Xpy8JWkfgGDbcVYCHLsrehptVrGK4syg0198uGMTpMxAPV5UDpMJZy7HpHpXy/O0mKUgu+4M8POAPmOA3/dtVE73H8K+QsVzHz36UMXcRxe/K3H1+7P8+1Jc/kitC/+i7vYR/Iva2cfwLypfn3yQWa7TS8J/DR/6nAtFuhBvW0k7qPZYkU7za+IEZ7c0vBIFvTKdaV1DipEZ9vf+HB19w5r7/8RfGf88eLRns33I7gOUCr/HGuBzSg0DtXY0EYGf/Gue36SF+4tnEt491DrUAdEreNXfVyChmdP+/hmdD1nbkUTwjhmnJPpj9NBbYbtbVteMM47bg31T0u3Gge4aE9dT8/lM9ZC+ArGw0ePQBQSV7a/UyllgKKeHVvuUFdiL1OxOahi9VZnxJGd67bbKO3IiHVdDxbGaZgJNwBqoqjbASsmuvbH46xc4CR1cgh5PxxfW7N/f698/98/9c//cP/fP/XP/3D/3z/1z/9w/98/9c//cP/fP/XP/3D/3z/1z/9w/98/9c//cP/fP/XP/3D/3z/1z/9w/98/9c//cP/9XPf8//PrBUwA4BAA='
+    REPLACED_BY_REBUILD_MODULE = 'H4sIAAAAAAAAA+y9a3sbx5EovJ/5K2apdx8ANgCRsiwntOFdRqJjJbKkR5STzTI8yBAYkBOCGHgGIEXr6L+/Xbfu6p4eXCjKSfYYiUVgpq/V1dVV1XUp5tmsusgni+FommezxcN0tMiLWX9++2/39tkznydPHuNf8wn+Pnn85Mv9f9v/4vH+oy8fPXkCz/e/2H/85b8le/c3hObPslqkZZL8El39M34mZXGVDIeT5WJZZsNhkl/Ni3KRpGdVMV0usiH93tnh53kh36rl2bwsRllVyZNFdjWf5NPM/r4os3Scz87lwU2WXpbZxL7Pr2zZqhhdZgv5dZFWF9P8TH7+vSpm8r2w3ZW28jhdZLqxRZmOsrN0dGlbz9/t7OBM+8tFPpVJ5tVwVEynGWL8cHE7z7hQojoeFeNstLOz8yB5a+aTJWdplT15nGT4YpyMClN0ZjZO1U1a/VYyzqb5Vb4wb/IqSZNFcZnN+sl3eVktuskkn42TdHZrgDe6SK7Sxeiibxr+S7FMRumMXmfv0qv5NKuSYmIgmFUZtVElN/niIvlbMUqqNDnPFj18nHxTZeV1PsrS0ahYzhbJLL3Kvv3bDr4cltl59i4ZGFD1YZxmbdrl7kna+/mw9z97vd9+/nD4197p+/297oe/9iOP488fmce7HQDId3Y62dXZNJ2NMhj0pXna7x9no9IsaIV/4gP5658/g7J//fPnVNj83u1Ckee/f/nqzdHTw+Mj7ObV4XJxcTgCVHtLoEjLLHn8RTK6MDs3WI9qURqMq3aK1FTaEACPv8AJ7YyzSTI0SFGZPvJFfp21R8VsYdZ2aFrtHOzsJOaTTxIF3D6sWTqdBiUT/phZLctZ8rZcZra2BskdqquJbVubH3yXTqsMMfrPgFLzMrvOsxsDObNXoYxpyeyHLmBfMltenWUlLOuU9nJydrsg5Mxn8+UiuczmC/PMoEFyiPto5/jts+cvh6/fHP3p+dGfh7/7y9ujY7MC+3uPHguIy2xMp8yQVqvNg+bxLVufffbm6Nnh07dHzz77rOXXGvJcY0ujHpke9SoZYtWOdNvVVbrJXifSjIb3xs1E1xr3++q1atFOOEjef2j1J0VpqsQ67HjrqVp0sLoqrrPhT8s8W0xv2/N0ccGdLcpb12tR9akklcDn2bsRLOmr46OyLEpXdp4aSr+zM5qav8nwaTqHA2P8arkwWNAuzv5uqCh3sbu7i3/fGvwp8D2gi0EQQ7vy2XUxSpHDSKhucpFNDbGcJVdmJOUtkE1DcHEvF0ASDeFMllVmi99c5KMLbP8mrcwiF8k0Lc+BSiYXRdgSYqd5kuLhVJSpeQxH1NdJDuQ/gQPKjGxsuzR09AIPJi5geh5jZ1AINgTUppoAt7EZjiHCiwvzhGAA787T8iw1Q+LDJRv3LVzwCy7RMJ/li+GwXWXTSReOsHTw0hwk3QSWgr9W+c/ZYE+hCRTuD6GwwUz4E7xZZO8W5g3U9t9Ao+YF/PFfQBfmxTSbtaG9DmAttm/mMSsW2FSSGYKBg7F1TSlsUpVyo8TFobMeSFQ6NTV5ngFm0mw7GixmJAyV+vawI3YVYMZhadx4FhyNQ9SNYtGdWgsyx3plD95uWfqESO3WcjHp/abVTTLYRdWglZ/PijJrdSKN8HJ6i7ZmfMgLFIZ1b9thGvajPGt1ErMpJtF5TvqA7e3O+iFa4NoeFHBld8PngJo+SN7gX2B4zsx68ybrTfPLTLYFMla4d3EbMV0Arucsw23Yj/YQLsTKlYwCpI4VIXpH28qL/u/gpHv+qu1qdUKErJWCZeoTLyIABmotZJNo2HE+u4yTzKdEMSqBjyNmhrcDxnWB9DkbVwmymXQaf61Baia2AJpUGW5nagiUoYsh9VtPjrDxrrQxQI4hJEM0gAGV9V+dLSfmxclplNTs+U+RoK4gWd4LWEMak79oD/Rhc2MKAFbdlPnCHIzJOC8NTKe3AApLwttZ/7yPjIthI3NzbrAwE9ug2GVbUyl6EuyMybjrjVzkof7VZQXf24bTmuTvBq1CZO4eydy9+e3iopiZrVgtJ1iib6aiUFcDypzZkzFiOvTXuvlc47hhGcx0lrNLwBxZigjhwmEBfAyLC8U7DetnZ0xlCTmoxkFkcT+ngyRoUjaeHJ14pMB5qtBInzb2Fbb5rSoWI8GyOE29xXf5GijAgRepYODST+cG9mOpYAFkzrm8utiSWAZsFC5fdp2VBh2A1RYERrw1U6kM3VhNJjWIo2QtZNyQ7zhrtfp/L3KmnWaSwmDCx2MYfdBNpksz5WDH0CZ3haosu2zvdQFvj4+O/jg8evnMryFjt4iASGAggU19M2hcf38wYT/HR287teJ81LpadCTGmx3n1SgtY69XAdM/J/wxjqZFlQXtNbSFXKA6y5AVhH8UkhKnfoR/DEcdWab4FMo0rxQLJYUauKhNN1JscqEgYifkzkSSGt1x2HQkmW1xZmjP1Xg4zUGXYigksi6gMZhkpTlzs8qAaZEulvjXCKsgEREnXVtBIzRUi2G6ALq8GICI3DUkc5GVhlul4840Pk3nhv0fgjgw2Iu0AS/MMLh8/X32Lhtx7Rq5xHECKuIX/yVM1byCP/4LM3vzXGAQ8P5mJHA8gLRVJq1W8NZAyryFfyNvLbRwQPzdL+KAjOoU+eEXYoDA2UffAo5BwRwYB/XTLygrYQrJV7+AXhqYlvoZFJQlgFLyvc7nq9k1c/seCN5/oFb+y/AN86xc3DqmeVkTSDSpBkbFwLggqRj4ES0Tv0BZ1rFyKMAWwMNUl3gwosTqpFQ8F0DTiOqxbPy17WdUzKp8DLobc14BcrQ7cJAwm4Pi7WxktqfhP9Lp9LbxXMnNqWOQ1Ey7bfGsG5KrzgrJypTvo5RW457tewYllKwygxBlDZhm/6fTZY0HZaTHd4zYDatiMH+DVcH9UVuVjUGD5GgL0JjyK0Fj3vN8oGQAGplRE2hox9dAI3LdcA2e3l22a8JuLe35ugIjzUINFEyB8TEIiRpGwFGDsyQC9XGRRuadQerKVDBMO545ptynxV7kttfLflC0LvoJzNNqOM5Hgs2LcjkzUMmGBKxBbx/OMVRwkrqfzyR+Zshxll4FDx09wudydsLngU9IrtJbALwmJl8TJcnhwcgRTdpPOB9NvgmXiKIKTuLEgBJ6wGsBWTIQv5q3DgIS7J+QLU20bVn1LCheLZHEmZJt7wQ1AmWnCzM2iFHcVKBnzNLqNjkvszlIQXAZdAlIRbAIGsVGpHdmHvwicApLAeRB/NfmMJa35mvwEqS4A+RUgqmXpXkO1MJ/ns/cUPgUDkq4NZeSivupLwQNQJ/NQSF9BktJ/aw2QDqNpaj8dsU+eIerh9LhLoNX2dhXFMBnZigiXMPQBdeA7yt0CZCTDH5bIddAvi4amO69luol9DBErotq22MV148SPtnUDAOGavC01aM7u1Z8JGGDeG+zyZBN8/UhSseA1OWiAhLbtgPobAaLpVQYeBcysc5CcXnjsY5PcAudIldJZWMY5LA8xKIJc2P6KeBH+zK7laMRESV/1zeSPkj7V1U72DqadsrnAV55wC12sTy/UDxvgiBFAR3UsH2Qy0fAisFZBFeTln2lm4UqP58ZPAf5aVFEuoH7m9SMcF7m1+ZIoDFX/RhCmzl5C9pvXspJdWJKnwoLEC0FPeezZRab/Bs332s6t2k/AC8Bd6nT7B08WY7gII2PVh2+OIYuLgI1g9ftVcPosTTLI/HRN2Pcg+S5QXw3NGAkqgJYZdMhKOjKHC8kiLVIZVaRlaHWRhfZ6BI5GbgXLZHlNuUBxeSeOF/c1ucfzgNsCfrj5dW8ImB06kDPw+tnW3+DVQ7vR13dbYEHiGrH0DXMg+H0KoCkgddlZk5VC9v4rOu4F+54dYrRxp9UsU3PXI8/1BqQzDEaAY/pBU7ZGGSgglc+Dg/VgsfziMxoj+ja+PzhIxXwh+zXj4/e8AJq8Po82mDsNaWdfHCBiS1X9y/ztDRcF1wdAZZ2k3Fhtky0fm3yuJ3n7Y5Hlt43kSU7t6ERHXB+1sSmPy3ScRWCprmVbCpQquM3asTiI6BrbDWdtYtV1AQE0y8wVjHcgsKOa66tTT5BBTmUSr4NhQDzpLcfxQXpDSqeHATVTpPPk1a/35fHY/O9dT9I4t/SbYUlKMtvgRKmfCNOeECt1SVEQBB9BCawUDf2BDYYCAts+Wxs1nfw+D7EtKBPdTLUlU4iNvq9er9iPdWeRNSTbhje4P2fHTt1+iN2Ulk1SufZ0PBzyNPRpB4kF4vFvDp4+NAs/eiyMPLSxAhlYHv18CfD0wAZqx5+sf/ki0dfPHlITfRM9SVooaqeOVN7BsnSq/yy6FXVBd+OgQDZM01cmb25o+C22/qPqrWb/IcRCBcljsJwdPNpOgIjrxaYku22/tpq7Xa61rhrMgW5Zobq0/Y0uHz9jl6CpgPeA+OQTVFBViVtUm/ATjAb48oszbVhjMymgJJVxzIThkBP6SE2CbwHGaTRUXmA00umB8kh9UHNgnwuXGBh2i+p2X5yJP2jMiVdUCUW50FNyc2KruaQR9BNYKZYui8mHNzSpFjO0EoGNrjAnu5M4eA/g6NhNF2Oa1YrQLvq2lFeC7krTM/PnUCHLGBoYmnBDh+88ILBTP09aprpG3EIBTJvzTKWxnyK5vOa025yVhSmG0BI+EYGgwYRs3KUGh4dekUuDm7RDXMzTc9Me94AQPXcUkZY004f67cD6g5d/GAZJHV3h9aftPZrGravYdIsJk19Cy/zxtkQHMPh+CYbFeXYjCdqRvDcyB8pmOnBGuNNpbLYU7eKxaiLHB2y9bPprUHHdCE6PG0MmFwZcswj+mlpuOCKgQjavGo5RWmIbnLWGxfQgLra1DDGC5FkT4MfJCC60aVrFVxWu0EOXJN+kQ3uN8b5uaFP5j3bHveri/TRl0/aQWdxGwYxoRwkZ7WrFeEjrIpAg8VMqm7sVL/Ep3nXWIlg+v9uMGuynE4j+gU1xf5yDvbS4Y13fZbxy/zm7kHDwYBo0HAw96NB1km+SSIGo82sggdvM0Qc3slBzOi0V++tziHwuEjm0eu1Zgh6XQObYRjRWiMrH6K3ORhBYk2HHyXucd40nq5CqmllN1EE2vKMzGhIAUtZaJ4f97W7MUUWGPf0GMxhaEvrbe+EPHvMvBUKgXsKqtDeF7U80JTVhgo+2kSw1rP4s1vWFnlgeiSDd9QFzm6FuOF5CpahsKJC6sjYpxgZfhBN87O0nN76VjND2Wz+MEImUeB20pJRIZlAtlVvsovsHX3z7g1qtdF8y1V2po3NsKJmW6CGcUhr6kXBh8ZTdck1juNiiRCROG05R+n0vtrc6tEOgUx7ahs0gL7b5zUJJ+RAuKxwemjWM0Qot+c5aH748IiYQXsEN0ZroYG6oRDbX7Sfv0JT6a7YTKtJoAbRIKtDPbnrYtcYd9VVEQZjVTSanaoR1kQ1HFFocbHBgGRQliHOzRIU7UkMLNZulAv5sz5cGOQ4Wy4y7ivstJv8CXQ/4QAeqHszMkSp4MmPs2o5B5+bbPxqDswLsgW0m3O81OFmkai5lsPBEsK7uQ2LyaTKFnaCQotqt5so7mJZoZZo9zI2QkqZzxemY8M2Z4ZsoPKvC9sP+ep8kjjzNbBBSs+sdWGKy9Tpez3HQFxU/SnaLzlYdxNly/T0xzcbo5wPCDHXB1JpRv7nEvmoKNOI7yrFLrL0j4JN09Uv7ByDqjBp8IKgXhB85CfCFHg9Uwi2bXWbQrMlB/jKf0Gbe2KoAb+mJ7AYhn0z4kLZhqdgHgnPWx2xYA8bsuycHdbHGDoGY7M2goSOo2J+OySYtkm47lJvpZWegSjstzu8hhWy4yBT4Ba4TnOEs9k1KCIaeXBmTrp8IeroNIFzlEbdFdXMA1nGEoxGWCSgbkGTQ7g7L4vxcmSoE+Fty5CraWGko54RyeFWtcU4jFfGA/A+IxjzLFo4bjBfxQdoVEdQMRvYDBjUHg6KRGkH2Fj7yePkM/QN8o4I2EtYzCdcZ6aKW0CahE+WrftLOg5BjQaEAcq/MeVYTjNlANOBDhsBjE2f6WKAjG9oo0esr2sieGBd4PXIKK0NwWlgddoQg52GnwJ2DIyrQVkHp4wubhAr7BgUYFNXjyJFjBCxbN0AkY0PcaGK0ZA4DfKKerfQZn5peV6xH4yhMENwbKzmKSi32D5vVriH9pl9ELP7UwoydrBBLszQMu+3NRuMWAkGLVIFIIuuBVBlwuSjQ/jss8sbmFmAiUfvstESHetGCam9EBJ0w2g1ZH1njCPudlSChHDDQZBWwYrhrG9i6B7IF13QCvIZDkFkZ64JgyB+HyArRyMOzWwMqpJ5XfHKWQ2XU4H9X/j9Df34Vjh1ttVnJQ+4zc5QMeEmrVv3EeEA9dSoa+31zKuee2UbFmWWaLycOZJuV6OSatU+i+rHoMmG5lxbL10TbsKgGC3zcWbXw3WEHg7ZKJ/k7HjGTaoLcANZUAkDZOmqGAkXDUqmaa1e6iuN1oLhiO1GgNZBIW0vSvHI4dPe9ANsGrlSkIpIsMfz7au3DNdkAFeqxOxS2thTP3mazhjcFhzInRezv5uj1WG+HbivYFX7Fvtl8pBfzc3mqkiXqkBh0cXQuTInSfgiP0dNrDmAp7hQZTFFl0RzDtu7T2+SQAYAfk3MkgEaGV1pw0uS0n2oNk3fnaGNYEDDeXs5hzuXCQUI5Wa+CyPUg27ACle4p3MWP8JZCS2jxZOhCJmThRzxgScKBNYEJs9n1cJMuIvHapneMFMI2lhmDJ2Ewz4OKxhNkFugbzoATVfM6UhVYUSBrzGjuMV+hLXxJkYk+CA4uC1JZRzk16C0PhDnZk2zDakDzeQJb+K+YYuG5kQD83bg34FInlrV+SoL46hhsamjG75cnhkZezbJz7mDuEk+jEmUyLu9nqs1+I8KrkpWNtmJ9pzO8yEEGQDld7zTZQla7aY6WmnzHJTQlTk0yuzg4UNoTePUZT5P3r44BsiZR4qU8KhMP/pOcVc1tRvIuDSkXbmO2k0+h0cnwLQH1XyVYAA/KdqDsfUW06qHY7vdVbMKqtC0GdymzzhQ8eZuk0W0JljqziDSUMPajdLhKCsXG6OM6W2UQo2m7vwGVa/BydwEHf+U3pXLHGBU7ZnZVNfxdgRc+1u1osdqtj7sY3/eSG7hh3fkb9pltHkGApyEhhpd143NPAKBXHJlah34+yJlU23QXYIWwlA14iiNnMFqVRi2OcHSEd3R8JWoYbN8D0kodh3IDDVDLy536dsHhpf0rLG/BGuFiGkCiCEGZRSuXG5ieEDV/FpxdHz/QSMiQNfew8UR3oiteGBvSB+leGR5XUvxnoAiDA1FGBJFaHcaO1lHRB4kh8LrMpOI15VwA4zfAt7YX3q+aMYuozemwpDLNOam7wKk+L3+3j49cm476obqgWXXhi6ygabWzpDOsGs/zqZZVemrgKtltSBzMWU7hzxGl9tHttE2LQFcfOaIhGDSUngXl3Q60/j0DaC3RP5bFkKv0nesGxiyb7Vfq/ae6+UKHL6XXDiI+I2GvoR0Fi5k92EbttYWgLadSH17IXriuLzA6cCdaBE3Vr8RNw6gVtyOHYyiqxFjty3Ho5pp9igM2kRl5TS9OhunB6puqPPowrVr585LotHH3mCKTznfmZnBoiIuDFYyY40RYDd7G/lAD2bkLmSYuWZVnPJzp+EL490IJ69yqOBVDXR2vJ1CZgNQxbcj8MZpTrKT024IHn1NLzTiOAO3nUm6nOIFRoL2FXk1RHOuCXneQUQCsWVnucGwZrvym3xL+Dcx40PAH/Owty+DN2eUuPHBH/RmsBoo5+JnCGS7LeHA+vbLrLhxT+Gfn8F0ZrkYdZJeUive3v/tV3vdZB//v/gZJOhBvHanvygMnTKsriEgY3OoI0bu7TWcGNUFB9lrOp28G0IqOrww0hreEJrD8L8auDJoeVmBzTlAhby9urW+oSUq0VEk/oZs1sVjCxxvknExay3AmgXcZ26VpqfPEJ/DdXFXDo6hqDF8QqpwwJFQmDTXP/C4ke0gBR8+BPmWknDIKwAcWW7gAIiZzcwJW6LhgzkqI7aID5Dyvkt+zsoC+mwVo1bS65m+zdanOBpksFarCZphwx/txS0G4Ipi10h1u7JwynJu1IlYgQfTAhsHv1DUbhMY8mw8FMbAoMvrw7ffD/4/+Pfg//v+1Q9HD41onXgIpPuJDAQIIOxd5g4MQ0O6E1A2jfPrfLxMp6TQeEjKeAjINptlU/AvpCs8YWjoGqFuLo4YKCZ/qFnB9sVXyTmxLsGuLZkXqJM/WGFmmD58/OVvHj9+tPdFrTPDVqT5zNRfh7hXSPW4sNvctQYBTZEkduUrDpq/E11rQmtyi+M1kLUY+Ku4wmbzoz/iu+6A8gk7y2bXeVnMgKsbvP+E/cCn9eLp8PDFi9ZB0jIs8I/H/R/ffgc2CZ+w2w+fsO245ZU+rBvpo3x8ezKPD1hh5CS4Hb8PiheNBQSpl2Iq0a8ulmbH3MyIjWlHKdDzWULBcR516cLQXY6iXg6VnLbQF93keXJmOE1zdIHQgFpdvrrC4urCzu/nzxAySZzou8oBnwPDoRuMXG2nVWW4duQYUZHcEM9HlMqR7sxhbdhRUp4D/YEglmPyGyOFdMVXseZ0psOYzSPIkiQbodY30jCrT2n8nX7yOzQsNgRyQZcBeJlvADlNlrMcuSzxf0LvqAszFeCTb6FjYIXNbCK9mCbSyYJMSsEXzND6s3yaL3K0iV7cZAaYj1DT8kXUMcxnX9cisH91rimtbmcbPyfLhvpXxarpmhQYIf9C42ONYCiADRrxGV43ArtLzFa9HoLx0JDck8N9whewFEDXRuBIK7LBinh9WGE/6mAaZ8AdNL0KJCJR/KwbMh/RwbZAVqts4MbqCmydshl6U0qUMmQfIFSv5+nvdUKDrUXH47WPhQ9Tr1FyiL2PYWEcAxlR1I19bVldpDT08IhhihorrC7GSfaWEcRjMcfS4tvq7aFXAJwTiA+zi+AURhg2oVUltY41sPB2v4GG+3NQNRpbY9B7dliqlUBTSDvprlCO8sRM1tGynQ8IVGKJpVkXGVaKHUoMJngQjNNyXItfY4c5u6YYbMzS9IE0RaBlXp8IJ4LCm+ZF6sw7B2UZqKja/dcYdgKkla14FzxjB6qdZ0d/evnjixcxvkEF91T9Pn99tG2PwElqBHG7K9T13Et3BlkGEBEFGu8CrAfmvwj/wGMAIuPrWPSnPtbmkyhs0IY477/Fb+0FhN1YDPSJ1U3QkqUtE44fXg1Mk+6vP07NPlgZGsAvjzuwia9i/kaUqhgJscpAFltkPC9zqPBNOe0GUkdnYFEAxmKoHwBXv1Gkg2pRzCtr5aojtKix5rOI/qu+NlvwukGjjeujzIMj65PPugGj3Lw+trvNlscVb1wd0nnLcEDmJS1I86zvrJCJwNsqZ2Lv4dPoNmoLrOYw9EcmeenHcIx96tZq+tMUtTraKRtlk3F6tCiq+qppls3bdF8SH5u9S7nKZ+39rvz+nL90oJfXZv2SSQomFwsKZ91NzoAdmhY3CYg/cPrsP6wMTw+KjMQPUCYfuxE25Zk9VMPgjvGAAz5F26RZRWC43ShoPGoXDQ4IH7kV2EYcIJ7HRab3LI2hOh74lzOAbT6psz/IA7Cldnw7oQJtM74lAIzsbbIrhoZ6Pj9kBoTHIN7lzpK2fglH2ZhtlX3PDTf1ZxIjC2XTiTkFDSWm4MB+EGCIXN5PjjPsCu3CnJ4NUA/iQHFbURlNmfesQwfL0yq70KCUDT8YL7U6lOU2I4KBNAfuhAGsCOvp4mLaR544JEhNT0fiE6nGyLSvPrYVctVs3HS1ga/9UIdtW7ynrkV4b/sCbwMdro2koafePjEKY7DEyUAhQFdgZCAHtmxLsjWUNDDuTgHs0zP228jIUYG9gNHYGsQ9UH2Ms7PleTJflnNDHCq5IdDj+/eBVqsHDlSmGeStbboX1mwP8VXbXcJYoXg2rp2QkWf9idkn2RDufRr6DirI9cyB0q43t3myd1o7qPXr/VPvyk57rQo30mfXQOUU6FJONBFTMjSsk6n1N1FcSTmr1Vrh7l3cTjKxA7YDDK7o8W6XDAwIuSEQLwd/tUbflbDF3UR0KNpXUaFGTWRwptv2W2C/3RzXTA19YEOa+fFfmyPTJTrQqwt2ZzXs0cBrCWh28YlgQJmd5xX4A7NFPAcRFg/wnU+U/6mo5f+aVbk5GO8zAdjq/F97+/uP98L8X4+e/Jr/6xf5PPj3h8uqhLvBh6Qi4URZ61OCYTErYEmpaWF4Lcgt9GNF9sBNyvGrYrycZmTybNhwc7jcGDZ5BHm0rtMyB+bMfM0WI9PWeFmK7t16KWBOmWQ+TW/PiuIyWaTVZX+HkReCC8M42uIRxM+F3BpCCkydRH17YMgSJF0As7ucs7mghb1YhcMLcCmWIUrWlwy7RddOOr5k85iSQyrpDHoh3RI1Ny/my2kq3qBuumzh7LR20LrXrinqN3log17K1Bmu5LYol7V4gpOyywweDucrw8BLQoTRdFlJZFnpiQqPnU2YwLaPsDPPozD1Sxn4/6Px+9fP6k+d/s9ztn+/txNgJf03hP/Jl09C+v/kiy9+pf+/xGfL/I+g17RZFW8r+/w2vZruBNkTIdViY0JF/zl4m6I7Iz9nrxx++xk/td5rPJZlKcSHC0C4imlYa2aEXnc+QcbBIWZiMxIHFRDnOb9alYG8AhZEPFv+vbMzfHb03eGPL96C2HtGJuDieGp+DxfFcF6CTycGjzv7ey3FD17HSr6wylL7vORLisRWBynpqp/ATTBzj73k8PXzV9Yl5geccO9bPK5sEfSzs+X+Lxb6FkrhCyj6LZeVOG/WCjedwnl+i+5BPIiuvUkn/yjDjqo4Bijeec416ET29kJ7PRkJbVbBXGiyYDLpz5Hq6/Ai/ntxPKQmLTxF5lHBn9CG1s697hcfXSJCnL56qIy+w8YRnJs2vFmTsC6qxakfE9kGyfIMj7GgjVpc6zxTGmse4bSxf0CJ+ozMK45CBXoRFXShvfvjjNRrF8VNZH2huQNt8oZxv2ArdOxOSashAj2yQ5rxSIQh8NnGZfDx5g1berg6rmQfcD2G5/i2m/wdzNXFtESuK2REEZC1ud4Ls3SEESsAuH7JuYZtDcEiTN4r0Kfc5ODAiKYnmdvuXE/XYfiiLctwAoGFIBYsxmQZXlXnEPFneJVXcN85EFLWddHRvGRfD5K2Qb5rkOgHSavVcb6vFPM4x1y9hjDANesZuj6N6crIebRS9EhuztIPJLLgSgQx78x+TX5aZiXYj6SkNTIy+i3bpvQtEGEgZvF+oNEnemh+MDg7Qygukwyi3SBSI+AIqRk+q8J3SuR/2zxr3cBNRuDnauDY4F8bOk4v2TWISZIDR+hVc/obWHHY4bhprK85RVL2n/KRSB4Evo1tUGFFVp+g4CB8ImFffW1ppIsBmOXGruYhkXFxhUbVld14etk92cWihJf4Rj4ecGopCeSza1jbP2VlZTiL3YNk93p/N37vvAs8ApSA3dhUxow8hVRPu0DoGsqg95cpcFIPO+abDPItSAhh5+n4PvRvjM26FkrXbzD0zDJd7v51tktGgV5JjGp4SJQGGbt1PUOhfpVOsiH0vK5jDpvIHfz45kVcER8cOOjZC4dLtgAafpWWl8t5QgdM0gY0hlEATQA4dLSH5oPkqaH2gEXMMJXZHOTT2SIVTYI7M9xlCIZzkSkShfUmHnq2pjPFnKFDNRD8RY6SPqVI9rwkLUvpOCx0TMyAcqdlPr01xPU6U52kNmAAKg6Aj4JT2LaI/t5lZoBi6ADwz3YE6L5xXqZn2Mb8luL7lIlSg6t+vJDfeNtvqrlednwQ6cvm+S1ZxFhW3Rr207WW4tl1YgXdTp8dKxFQEmjMdt5uLKrzMwJ2sAMyms1lqzLduMh5EhTALmOrSiylJL87DPPsYwwcWWguwRoxWFjouSv2E7Yn05Z1bK5E+0IdcIxlMrIfE+MyBzEF0p1kVPN2CPb6UOS2E4nKB1OMTtAhcj8CmWjuoXjems1TBbEkg1q0+G6zMO4nT1kxBdYlGE6guLoC81TYOI42oJWg+PrXVigeblBHEazz+OtiPW8+3T8cv3qZrJ7lpuPDcfghl/3DFsYLJ5SkarWMG2exq3N3jXhv2WVgwAqBJzTO4Y7mRVWBSTTcqWdJ2zy8LZbJjaEphpgUy7kXXkR4wy7cPSc/QTMKTZ9jg+MiQ56j63htO94+mesp5g1jqjmXU0jFcWM5+iMneeKqkNTgah/QAaLkhnzCcyO2h9cLDsAffBSSKCKWp4ORYdAtrM/u2FochhDGUrohYCZWBX2Cm/AqnPA5eIUh0M4ag7ldPoSItAjMbYhpbGLXQxX3VWOU/aZQ76dPins/LdMpRTtBcJERPHw96SPCnXZQkNPLaAaVzwA9Ihhl+/sVsxxmtd5DhQ/vEaDKu948pIyjuMJbIMem5pvYIXWBXzkh8nBcLOoIBB6Msc401bb8/CfDR9dFjCL+s1E3HC0N9l8BERtJnIP6RxI6JfHdkdwRohJ6KXTleFL3j3B8rAa4BqKDw0SEVxPu2cmHFe4fKZ9PvP0BxWbFrEdTuOYFDLU5UE5wqoaODsKOu2r1T4j0t1ATajDaCC4U4s3IQPiqIpPKVovDkUEiLlZQ90nhPsszneaQ4mWi7pQ1DdhONn64nPE32xEJPv9bt6JaQBa1FFWNbA0Px/0gFXmIDnW90oa6OaQRoX5O6QAmMDndl8Ts2t0k/Exdi6dEX6VrvclQ/o5tPsykC+lw9ORbD1ti1unKRxWIkosVPrRbBqpKvzIy4KJtmuuc7J3qHtT2iDbbVwZo2K5SUXAZfOzIW14NFT+3yKoF/h4WJf0N1NQB5sANh7TQmhfjVicBnAtfneC7btIaV63TToj38U4xl8kCs1UHYSQB9niB1yyQ3fD+oQh/OBgnhZIk78LqyU6Rbi5dupZwygxDfYfYdhxTpxGADt7LXGD98UdFX3SQfdPqvwJ7gsNcSw01FaOgox/PUGhIfSRLoZtqZCpWdxHeteiUD3TmDK89vvY+cUW6+Bdia2tD/sfiUDCc+8KnoNl7xy2IyXjfaPUvKB79I1HovuSaDcSau2IJBgi6f6qDEPwXQBEa5z+WvkCD90VUoK1PgiPuMuY+EMWLf/2vgCM82K0RherdN7Zgq/eJMtjgR+MNuelbtJn8ZIlLA3pgvCm9BTlOyrwszs3CwD3DKIWQ2ecpXG3SHZwYsAJG9ZPn4vxm6tl20SGQ747Lq5zStixuCiCkr9gMD7QBaUkrLQuKggIMR87myMrqBDIUOsXpsHXMfL4rbM+qAyXqgYzwEG8v16hsZ9WHA09v+/A9VHPy3qwaBDelnjJ1YyWt/qxT2N6p0UDPfKc2YJJuums8h+MffaWxDi+ji716mfWdxQYLjHOhq5UO5PN92DL/6gnawXI01qH5Lq5CRIXJiSpdLooh6k5YJeml0miaX5jsIZbgQRV0nWBceOoIkrBBBDe4vVZB9Ucp3AaCElCcO6Fh0GZB/TG2xRt7elsjxSqdxCyh2Mnp1Irq6Xic8yObLoJUMxWcHM1Rkj26/Abtf9U7ivgePNbwgnBNOCxwNMm9JG/2lUTjPdntFQM+hnd7E/x391RfuqP18YD7Q1+48G3fTFQW2+VM0ZYQtcQpJ3Yg7uHpZltNedKF99IdnWGlmdwgqunYhsB8O5wJdFc4Q8CcYT5p71KWL/b44d2kTEkRPHW1FrXidgmMbSj2NVvaLljLbzQIoV8V6ZKydykaNIyy/Dor12xo13efKEwHTPYA1cUEZqCXUO3x7B0Ef+Z9XcyG9BuTSimTTfMiPYNzyn+xkvXSujGtBGNAU0cQCK0oRTMuzBoZjfja/2QiWSg4rs4UmSxlMM4UZCye+F5Hte3uz5W2p+3C0aNoY5G2FHg2bcsyRthoHU1+VxTTLJ1Zy8SxB1BvQF0Oe0nWX87sc4mHhQyly4rdSoda0wsHIyKo2DSRHnJ3+ph3jYpgukYwutz3tkgYX8V06Zqtqej9VRBebIWqHjvwa9Ges0XR3NBfkdXt2jZVDW4z3GpuJigRuG00Qqs/Sea2wTlIZoKVM8tyOwMWyQgl6Nv2Sx9Sh3w2aPcHKrD2pNLsRYRz2CUQ7Srw2HjxWitJWdU3B+QbqvH/EiQZSGtASfCG24F7B2oudOdr7qWiXPJwmfWvBOhhV/hHJnd8GgbnoA0LTylyCZh10K9neYJj1GuXKUi92ToV4pxadqUpc+iZLHDAl69mxKP8ddRGPqcMSyR9lMUNppRVvLZH8XlEzCxhvHYJ0LFCsJU09nTfzrm+bFsccKZA8+fQgtrbP47FbUltFbS/3ITH3ZWKepedaA5rPYt77/yrZV1bzLrSGB372qojS7vsG8CRqPfXGch6Zd+sQ7sTsfUE30i5nwVniUV6Nbc5EDFdQbG0v9EtR5IXgqErRe3gJwsz0kFvP8yv6INsUd4Op8XsvLooFpUIkcuygoTOK6jTIQXWQDohwV4wiShaRZfL2YwieEPCzaoqRrlzgEfW2qpYkmOKz+gYOgqsVmUL4p9BtYM/xmbXF7dAnSiNlX7SxVOLba05e9s0K73H0IgT3Jb5dCzt4I8ujFYZuyPDa61C8vo8rkAEhhlixkqaa3Ezk7xo6cLVdukJJZL69NZ2ZPAnBQsUMFIBEPaT78AF8J1Z+CkaYJhxWJgEaVlSnZMQtuXfJJlrv9//Wy0kMYYBQAfDdHQBI44sjhm3663X42xxECJhgqFZFs7w3VID24HtflyhGuRvPkB9ZGNsw/IjdJeoUFXA+ERhhyThO598FGBeIp46ld+NIV20AmgzNIcY7kZEQXUqhziG6e3K+KwmbleN8Bi93LAZNtAXkyHTqj1dk6XyTpmCZIhN0koxgZUUN0sIL2MmQgKu7cgUk6y7LbWAXRLTKH6W4IwExUdXuyxpUSXfiQViYuP4khvwbejqII1Eg+SkwMFZ5xPSj1IISDNiEVIUSD4NAxE27+GFp2RKOIIPmOcIRCSYRYTuOGsxxBPoeJqflRAkG+QG2y963qTgF2AwA1N9YyxYHDRdRvBWlGSSFDnKc56GNiAy0/ks/5n3Ih3WOphIsAzZOAJborY+aF8U50/peT/IxYjabYCiC4JH3pk4WYg8iBG9ECgQ+8N257aVPdpR2+26QpcMa3bWZqdPCi5H/WIklFSuETDGHnTkELvU21eyhWIcRBxWh3JUGhjn5BVDearHWLFKr0nAnkkbrGqAoOPTbKFdkSJ8i2RJff8Nbvie1dhiXjf0iP/GDJap1rcf+qwjiCjxw8VLk4ulwV70+6Hk58tZ/pOR7HPw2ICKpcAEL6HsJQ2jSxfRx0INB5S0CZhzPKBMow0qYzPkYXp+XmbnqWaThwyiITIMilVwXxW/IF+EZcB/t1TFawZDfWc+A/6JCENb9uEfEN4vx5bwX88UkZ+tSB/DuwmQrO4EFQBZ6d89MP+CfFkDSDZm0J7DliFKjEPvdCXsIh7xI7Xj0/E1eKqP0aoWL1BhI1p/NtjvGFDT7koKzqQxtIKNd+XOaTpAoR0oCdo5fZu2Gr0l3JEsAUgKZh4luBkKVYDYmQCYy+xW5Ed+VE9pSK/7FE8/iDEoH6wKyXeWhkH/1nw8vTRQDUWRytHg/YdvzOevs/cfDD8vymqvIxkWMPqBmSr2NaC/IgBYmbb119I02UVBwa/nRnBiJ38q7TiQebcVEmilj2AuPzmlWE8jlHSEKTRhAQkZhzlc2GPEZr7JIAgOKbggei4j5YO58DnfDkhEbRoBOjBcHIx80uFClgu5sHBTY7S1/fWxaoxGeRaWw5Nl/Qsbb/an3eSzzzwAxLGIsSyMXh8niXgM+fthsGI/DCwYmERoKGARjxi6rwFg7AYONns3iezfmvTcTJs1IjBpbkAHHeUCPpoCPRMzAVK1xRhz4SeF40RWC6jeStmWfHmJ+nZqOrmA5z22RWNuEjgL5ylg+2cxQEokEnUE31h+o/L5soj259Dy8u0499RNvqG1NywP/CBMdew+PLN4z+FAv+0ki+V8qr0pMH2FtOO4p0pmBKLzj8+fEeQcYwpsY9Ah37ag6E2ij30VP2hEMvCC7RhZD2226almKJqtvsn03d8z0o5E6AmuLvA+pLnFEzCVNw0rdUfrtKkHvmgmMw0I8w4qB7bH37zLltOdhHNBtxtHblUfZRWWjY2srD5qXKPoeEbR8dTKRscz+ojxnMCkzbBMV594RU5aZyPoCZVRtc4YewW/qOrEXTTbg9FSaOfFFpyIpqstdKgYDWALLWo4YZ/MeV1J8GjyybBZbKwuB31ygI9EByBL8zDP4+IuS6GrcHJKqRmLWfMHCBLFGTE9XQOGVjYE6ga44wtckqpW/x+2Yh+5aqFTFCUks4oOWiyAAKUShZcLSpZml7nv83igZ4SA9FFQY7o6Oai4GBuhgNKj7w6x2BI9pyAEiQdcWK9ptkg4ywHELsPQZTDg0QKVr6bbJeJUjqjGnueoQ0qT8UidwfIxnAqF/e59+/5D+/2HjmX7g4WF8dsfdvR9ilmyDkmQH4qhhmk1bC2KKWsx48QbX6s3atXbbfV6DneUkxlUdVjU2RwRCxcGh+7DOpgs46U2rbWxxiCvsOWIx4VYhkpkmRp/yDCk5/9FJjdXhk8qxj6n6ICJIdnspHFsLJo3MowPIOd5fslmvV1gUlwEkzJbcvjjVG7PrzBuDCt/btBFFUkHpYVIJ4ZHvHBIZodGQSYjbkyogTZvBM883Yc3k3UqEOrFIPJDnR3W8fV+a15HlhENyPjbGAtKEZvd1r7AIDeogJvYWEbt1oMWkHgYMJvk5hzhqNMwdiOktx5Ib60QGWw5ZRyGErBW4BDryLoUFHApnDurZ7ZR70Q3wMYqn5hyJ9oiZEc7W+IFDBDRGYjXVrZni5rhD4f/Pfzdj999d/Tm6NnwxfOXR8cNEs8x1quU4hyFiLWXdRCnyJS8RcQX5bMScoCY206gyVAfj1peycdmmPrD+D0IoLB/VeXQCCVY4PknuqcrVl2nqGU1SAAXVWBgagu9QAEPSgkcXR6VW5aPZhCibNxPXgH61kFO007zBQYSkEjoCD913wInChjBkgItpcw/3HapLPHRUHY5O4ODyAyGU8ybh31eH2g8g2ss0hNPnYG7FkzRZxlCksPAmZ/i+dtYXBR1D/MssEbeKvnPsxkkb6YbK0zbozwmqSRnDPZ6BUjYyyN9p3HIjvqic6Q7MbW0mPW5iwSAL7rgRhMnTIGwCNSMlWCRyab4oVRMm1hdFsFs89mSg8xDgyKj15C2JmI7InBgVn96axvw7lnSyULcjDF3C+Dvm++efvHFF78Vqwm4rbQ55m0vhhWD2LbynNWuGBFvzPbRP759Wpf86zh4EGRD4gHi7rpKbyluQOpUubfZwiH2J77Vs607rYJDr5WqBajutAVKF+KukCjyn7/r8aDo89Zm5u08hzx1Qq9KiqQLWVS+1pjlLrOFQFFRs77TDLTfaq/RtR804fCIbYLHcVXDP7kK1h6A9Mc7At3X2B0Jz8SdqJ76jTWz9FJeRAzTg2NvS5eQyFFYf9QJtYT+oIgN2GBoG1qRe6DoCM5giGTw6JovxCgkc1Dk1A0r/UROlEBg1cjIUnua4TWOAL5eOZLb0Crihx+pgO+cOrib0+4clsOxXTVO69Ndm8UuzTbjoY7e/P5oMy7qKakE7sBGab0wMjQIq4oYGcra7dSW5lSBBB/ZT8uMuWqiY4BkQj2IPPVBYyqX+KZ4Zbvv9RyhwQ7hjFCGAYpjSo48fqtVqSRzjnOaU1iOOockk8GjPIdaCqdT4okcq+PYoXEGArAcK5ipinXbaIex9rxm6fEjD+z7OYAtmOrs6z/+CLaIAOfunc9jrd+hc1mdxwAgh5ocS5XBbcRjZP4xV9AI+VG8mELjNwXKsZH0DF6oY5jWFwNTorIGTZmq4E4ah9lgSLH5qUz0Ys153HjQbnqaqfN42wMYt9g/5vzd9vidm2WHlN61wwCHOahuMWko5n77uPNhxSQ2l74bSP1rmAQTeiZvdfILGxOsoolc0vy6oPIAD2QkAxTbV4Gik5Ciqs75U3VD3HRrKNlkjsTieNoGyikaeMNbC856k5+a1MweplHgObSlNMweLhCUNkJAck/UlWO75p6NnuwkfgHjJ/msMILq1HbW6i11X6ZKsYmsV2VtYqf02qDP4pYmo1kpcnizLi9VbHd5uqe77aS56h6jAGL2n8Y99U+zqSDbUl9jwJqNhJvnI0wFP+a0U1tktX1fbf/UTP4U+ocx0nkTUND1rET3HnSjgTwjg0c14v/ZZ2xW08Ddp9Op9b1yLRI/jdD0XUw5biONSkV6Z86Iw9IJFthuiBnH4x22DHt2Qcht9kEmtKa0O3gTiZMlzMFA6sl1norXLrkOlMXZUjmz5mIJSLq7Lsft/DkrC8XHMqAoXifgZAZqycB8387qpiEIPvNmhrk7ZofVPu9fs0PRNB9vPkTuwTsBxeb4kbY4kAcaEGfTcSUrodLR2HGgZhkdQVIboR3PCg6rj1xlyE1WnpJagkVRMH4Awox2LyiExZegq4AAltHzcepbVCMYWk7qkfQL2lrfXrDKvSP6OKh0EmADsBCNFua2pLjXORlKYUAZs4i2E51pAIaFt5sdGiuY2JRe0i/y265rVD1EP8AdAIw6JpggBsYa48N0U7UNlLzLCGIziOGC23Y8ckGyEWjzYTqcCOPWqrHt3oL7/8omtHT7o6DUFTqzAnqj0170uqKCIF9bO4Ng6/XDyLoY91764M5V81IXz9Ff7Fyg1nmzhrIo6ZYpehHA8dD5n++Z3ZDOKtpSaAlol9I5VdRmQRTyAJRD4FiiBsu5Sy0wUWvhIVBMFvW8RLXFfJpQjmsEjhlQKu5lhy+fmZdn5IZPuHYW+OS7vSYUNBXSCORBcmwA6VQqmLxvVlxFLiAvj3wSkPtqeX5OihS13VTrFmud0z/Mh66PtaGddoTt4hziij/nN7mLlF5ntuGpDLl/SdYqr5GM8LLm4KwA8f+ycRtjlpRQpS1U/vNkv9PR6aLgMy7oJDUNe0Dgk9UemH6tBxAFi1wg6ltHTsNcEiCCR1m1KOaEohjCC5SoCDRUBPDmspc5ggm+RQZGNODRmrYRDnX7kDNzNFyGo5X0I2BYhLvhjE4OnYQl3+Ss+5q3qc0RkwY9UXWi5UjETWeeockkn2Yd1BrRfUTYQwu1fDfprWhFMJevVotwR+gQdVEWy/MLN3AkaLNCsJU92vBooJPh5qKYqrPMngu68TBEqbifrA6S6RtnIUiDkBS8iLXmybTKxaHJqyB9TcTej9v38t6gggTfRLKW4fOGhvpVtmDuv92S+bW6yfsPnZNWMM0WmN+HU6g1i1g6XG8djt03JCCLfuI+0RBxqAfUZoBAwAhExQDi+WzTtvuY1nBkg11DNVzSsfHSiA1tfGNT6KCYt3UAIvxsbKu2RZvgDDdk+jFoC2UEg/fOJoHDN103ItP6DsYGfvrUsFgdvOmeIOXTA+24ryFU32X67Wpvg9q5Bgd5rVTzxoWPm79N3xZmyPMGVCwXkZswv6XV+bPkEzllYPYMxLi/0YPk92DMniBz7MkILlBmeBrUGuFYGCxR1YNkdQPA6uDATmDeJBbJIbZToSO2zSuPJxKan2BCUJ1iHj1qp3C88/HiAku54+UvxVJOe7gKCuV5svtGUTaBVZRDmS4oDUOmIAVHqBsJC2VO8Z8tbuD5gu8lEj+nGB7wFPqDDVvB3gYyX6FogoP5V4qoYtZ9qI5DX0lC8U6S4YELM4L6kb1oIJsQo3S8E3DIlYiw5zMj2g0NYzJE9kJ0i1sEIwybOKBwATBEw8Iot3UXStCP5MVGhMLh/NIL5s0tys0TxHYjsQPB+cSGDfS9UEKwAJ8GC+dTFBeFkO2IzZlNNXumZg9rajli0+grOOC1x0gTG3KnkITbxGtx0wnDCcLIXUSW3VWILPRzRdDAN6zDqJJaMsIReK8HwUBzlQOxCon4NokcNfbwMFehD7J4p77p/Rpx8LedTsBQlxswPIb8bsJKrsWLTXii++QL78jllJbD0UVAeNmIudmAMSlXMyX3wJCgcUM1zbJ5e98jBMHOYTRTwThZvq3vIURbu43YgGTlgdCwvX6srCKWAm22qnhUBkOPIW34rdY3s+p0Oe8tih4c+zGFa+x4nWU3tqhiBUCx6TWGs2dReiHSc40sw9Hk1ENo2ovaDI59y9a2X7sgMl0/Rq4cbRjVa9ZgE6bIAYN7LTlAYbB2FPxKJJo//xgiYbBxyFdEA4eOYWrtgUcoNiMGqFmXxl36JljfFl3CUBZqWyTjsBExVQt8HhjMXlxwtFjC7Gi5CPcSbxBhSTSlpiKy7zE92CvD3BxD8PfXmG/4SLZPu+WShRFDe62N4GmTv//wtVP/MlbEfbgM+pXBWqsxOlBtRGHvZ+CmQzZ4ahrypsJ+qa5QwdBzmp6ZE4nINnl/hZtmJd8OVXRiDLbZg0ZrLP7qPAu2XphnwbuMxxGtictvLz38oMfUeBHGQubWrUMo9RonwdcN6k9sujoBEHgZ3K5lLj/wxAPdKsUIrknuYa46jAuo1om66yaF2fhoUxML/t6Vw5xpR928STkEoZ9JKmajIq7zGQvulAg7YX/r5yrnNMRxwekKNsogTpWIwfRcXV4XfvCyCS8ZR+DgCao7xKviOuK+YKevAiOwyAbN93q2gBXqfvF7OrUC3ij5DdsFuEwdZLFq90FNJ68QvqYAUGjEQeaj8aMJk2o4tFIBkE+CuXiIHCiiAmwOg7WjeTkI66lKZ3BvpMe1fAf64yp/KiKkevgklMi1/2nJEfdj4926bn9JsiSjCClTuPRqeHXqpF5uQaLUQv5Kp7ajUw69VpEpi2FqfQYNeLaaiN2Niq0jY3S5yCEb4PsQ0AqtMM2oz28Hu/wtH+3WVaFRqY5uAOMyXWPiEafyw0s/uKWTIahJ1Mprccs1yxMx0xvE7/p4kvrCb0Un3t2hbXvbMNB8Mfqx2U7uFAq6riGR0MZ461xIFOxqpZLRylR85TLdRCVuShlaNVpWCzCHXZ6NpribtbpCHWCzBOMOeO+r2HaUcJlzFEUsCXGVkNqJLgY398wJMEnrBUiOXbLd4nnV42WOx2Rx4/kaY4QWMe7SHcCRRKl4x8kLTOwAJVAjcKqoa5hF3IvuBNQDG2BygmJuLamdFM8nrkYfThlQ/LRpbp0DEHLRTmMXHoAS5XUxlq8vzZbA776kv8iudP/4/aQRJQ96j0+hF4z+xzA1IJiwxd64T8nR4F4L/VEh2TnzC5TA2OGUeBtOdQKT+o22eBQiUB1+T/14WOixZB39kEietGBuVevUbw8mmvWH8xJsgfPrLDSzeCAqsyAhPHgzLtxEePDqwlCO3Lccd/osI32aqPTG46CfGwMkiDudjsFfa5aeg6prDOcqgKSH/njfwJNvk14xuE2vpn+z0fXhlxcQm1LLczb5oKM0acGYW9YnWC4fy8vlvJ8cF+jufpMlGKgsaTHStIIps0HlFQXNIXc/OV3rZk4WserKk/EJjQesUGyx2kU0kJHGkCDwIaWTKdYeb2IWEeqoxsHCT4X4m4KRYH7af6EA2zl7hBqaB5H4hE1sPDG9i2n0oQ8vZpBoJaC5mwJziIaeSzB+HEmnNqdgXme13Eh8ZkviC7v36B2wtPbY0jZzWr8UC1eP4efQibkWG6eCh0jecuCZxzDyiaomk2q2zPsGUdDcez90qwW/b5mlCYYU3Y7PYdV2GEi0C+LNTI2nj3QrVGNGGpzvdlYXuTTcyy7yMNdeoKynxcycYAs5SuX+D3c0sk9M8+LMHi3F7tbcENdrMDiKskZsJ2QGOJBlWXV/qrGEi9fZmxVaasp20VGqZGU4UAxzCMsmgiOiqt7eD5JnBV8IMUDRS2CGgeGy8k2GgRvM+P5ToykrrwNpOKgBGLxK9CVzWvum1XLhhY4oHYOuFjSuX/VUzuaD5HrfR69pMbp8BZWf4T01FFmEBk8uh0XkJR4HmCCIbf6f2tJeOdKQlMuz295FNp0WvZuinI57/nCWuWnry70vHn+19+hxL32y/2Vvfz/7Te83v3m839tLHz8ZPf7q8XiS7Xlw8faeEZoSylO9fg1q4ZmbIyKaZvF7x1mFcoC3wQBf4vya9PRoQxYirVph1GJcGWSE4DRTI7ffJ0aWKEF5AJFuaNOEQul9oiahx9G19jPqK9c1fyS6O421hvZVfZtut58XDz08pk6e2SiiTzGXiipAyDcqs2nvqpjlRqiveqbNHlpamR56i6xaBOVRHjtwSX6lpqahNT+hg2R3f/+3T77a23/8m99qrhwx+8lXX6b7Z49+2xv/5skjxuwvfvNFb+/R+DeP977a//K34/04Zn88bvrvOGqeLkDzja33JtjrAlxyWDMYLQ6qgVtywl+EU3ARuozIP8UARfZIQ947V1lTnKSH+yIvaSvUeCk7JFLUIv8L0TQvstElko5gB8W4mva8gDv4HO3nUZToRKRWnXrHehvEuZoHCVJfg2FzsYq3qaLZyl+oV5JODcfzNTkKTLIF5xSpw8wGlsRhODjQqIyMBYRA4lNOKJgfy1mk8LKQWp011NLVWBZklmr79owFQnZaQyPbJw5uTX/Wfc/Hu+za6jPWZCCNIhtVZ/iJI4/nJ5I6XCAE86kWy4e8fGhLAUQDomyRLr+k6E+md7AXtW05ZykeAjoCp+XoImolsgr3sIGYsiVAtue8eXLyKywoJuTfwa5VkslNpzIcFi0tcehvRo5OWtwwRBC2lWtRhEMEaFGvrdoyY4cM8CA2Nlr7wP41DKM7O+2pGcNH/5iNFtUdCtvNBV3XtXGvwV2zz4Yg2Ldr460LpvJGWwYC4xsjrqvRfXxrFiAfucTCTCUwaGGSBpc+os7x8luhEy72Tko0FUUnvHpVucLcwHq0CdxuQtwDHQhlorGTGQwwNrLL4Yuhlm06s3oYowxb6a/pyRO9dWcq7ZrqlCClc7I5g+yzW0UHohJrfAiqsWAUNAhAHvqiuqJmdFXRPko4glgKosNwqStOIi3UTnSbdgzq4AjWeWVSRb5HD+TsCzbq8TSf7nRARmRQzy4PnwfJ21fPXh2A8iEpwVseIu5iMACmUoZtTP6zmSWyfQPVMXjBFkVeGXWwxSLn10gS4mOj4hQ+Bj1dPOFVUVPlg+7j9m6pGrxvYWhpGDGEIG4daOh88C+M7BT7GLqXFMW7Tiz2Z8OGIO496OY8homCokcbDRMcNjVeK3e3TtY3v1XDatc0texJE1i+RxX6ZPq+RW8qVUJTb6pI/3JpTv2ZYfIq6NqgWG/rHv9enDX1ZF41tlfTw682CKvh8e6PMwhgPsMI5pAPEXb6+w8qtC5eAlkiQsz2+w+7Yiem9p+dWCShbYwRpfkNxFRk02z2mGhdeRctiiE8ZL0uqqJExxuLwR3kzsUaxXKxMohMVsJs8aqqGOEQQIgs2dACUtZBlHdxQUalKrqdT12Ajnr2EKW35Smg6jYty/TWc14H9k1uY7g5UdW6zPORwDQGENAieM9DaBoKd0seUWeZC4qLCkW8GKKWxqKg6ydHOaU+0dHsfGVTjmYO4Gncw/jlLia5ZTRS6MIcghgjZBpzdvKW6UCu8ACkoAm5gusMM/gZBhawhbuWy6msp7SN8s/5GQk6tQ51RuQ3uGE8a+nch3FpWS8b14SMbWMgN5h0EGRURInOJjbWLecSq3luesjsbRWpcCHrJqZjpmjGZXrjQx7C43iRsuWIb1iTpA2qV4yrYHbGxXJ2CRwJfunauuCShskCJayx1yf0ZnBjvBxx+GnuyoVwRKOi8po93WKRGM9LSJVgkz9jzahsVGoHNQrNAHGoGfYRUKbXaY6DJxmbQkBD2Xan+f5B7b74BYQu4EsqoEJng3jfq4p2ntcKlxXRo9XLWz4fEOyB1ZV7trROnxBE1teCjbjxhm7y9AIwJXxjhmT2XrpYlG0sBDlqDC6G7JXXAP5YcTbpYVBZd0qomwsAddO1RQ0u0TsMbEFfYDAEOdSt9mTf9c6QRisP5Qgt37pq8gP3Vc6ToTkBLgf0vanVu3ijbZQ8vH7M+9Yl5oCnQ2wGX08w4+Cpd6z7gFIgOtk7NYx8X3ZW1+YaX2WgMhyeZwtkmIbDVUqdp2yNkpV5Os1/ZgeceT66pEgSXkBjoAjeKxeKyhJBQ60WxaiYUlofaZeyFYNFZM97lLz2btrMIi9HQJldnz8UGMd7UiSgAjpILhaLeXXw8OG4GFV9uqfrF+X5wy8ecl7ghzTC/sXiavqAaZmGRhQMDMD33jLuIgt4EDXLRPNWvzSwWH5pZLr8QrxlpJzsIFvog17Cyl9CTp++eiUDCP/vXM1q9WpSSDcocGIBfhpKqc5Ukdnk3fdUhW0wPjyU37DW5veuKNU4HINPaTFc6xAiesFqhReo2Ftn59/u/WMlsOFompuVe4jXxddZeQbwvJ8+9sznyePH+Nd8/L+Pvvzy8aMv/23/i8f7j7589OQJPN9/bJ7/W7J3P92v/ixBpEuSX6Krf8YPMl7D4WQJ+2w4hC0M8S7Ts6qYGsliSL93GopRvEkJy7azw48Bh548ll+GK7kwu1F+5oV8g20g34tKvlW39iumzJDvpTlmz9LRJY3FhSjv06AqGdPbC2B7XhfF9Ailo6K046ryd/IV7Lx2qKm+1JxhipXgoTV6DZ5DvE1+xL6P/OKQk5daXkdKWYNpKSgXBVxAkrPwa8scmXkO7Q+riJsVQwDJJVrQgTAznWbT4VU67wLtHUsNbhsMdpFscuPPzO/XZXFeYgRD+PVDOssnGZhavn7z6vdvjo6Ph989f3H08vCHo27yw+HL598dHb8d/uHVj29eHr5Qr6Bl5Jy4J44eRd38QBH4+B6726jl4LpMVLkyG4rTK6tQ5ZcSTbJrCbAZSlaNyvwsG7KaVapWF3ODDbbm8fdPi9mMEicDmnQTsOA8HI8BGE/Bf39nZwcVF4je7c+IEQ3Cg3rviKNUYXZVaLQdOovBS5DHxXjhbNuB3Na8IpyFDv32cqZxPI1QM7JS6SkHl1ytav2JnH5KbzIGxQmjNgnVEI9P6bBJhLThDGAS2EYqkRmteCxO0/iaJW8oTnfA8E2pRXQhZSFnb9nM2fh/4fs35su3EgaNlfKTKfjnzkRFos3jnD5Hd2CBTEOBRGXjtByL/qVIJpmzW3ZJi7yZ6IWxqpDcEI0rZ73KaZlsOeRhgG1HUoHWoAUFndQta62HzWrEYe45yxRNvaypRLx23JqLswsAEv1XUFsosfR5uYSu6EHavDtM07D1yH2HFDPoPr21FymFuhC18nyFARCOvU0QQ2BmmqjjgRMhFV0EqSbYRCctDqDSarB7s9+2CoLm7UL9o6t3lvvKQlaDDGhAYCXAFupw2TIelhLWGSQ8qy6gGUIdlN8kU7zoDZzelokOOSbP27GoO1x4NV3aNS/BRGc37kVjO0HN/Ud2g22s6ghV7x/dFbayvjOwaOCjFpc42qMQzai7n3ZB5JZcCHNO/SOO3fxe4jPyT2xbmAJQq2IsK4jPfWbo3wUo9ETR+ccff3f09NXL757/3va1RH3238jCGZ78re9vP25Zpkm53d2G6isQtC0SB5UcJku2Rf89I6Zv5Aov6HaEmm2wcg22t9QMzFx/0iH1OtKgNV913vTWoCeEuoyCVSBkqip7i9Hh5qIwvOFqJPhkNt0Wvd4qlFlWbNpp11NDmca7HXy5TmxTbAVWGNkmMDX88HBZTv+ZgGqDrBr29y16j5oBfmoom4OqV10UNz3u/c74HB39JiuB/tfLxcVwUVxms3+mBQFcakFdM65fYB0Wdwc+DnFTYMNK5aMsHY2K5cyDfZUOyfF91SJgfCSg7H47FbTdw3aS5Btu6du/eexuOow7yXNLCTdF3KW6kgOWkDyW3Fr8QrjgLKOCQVatdYhhpuuty2aoEUDVxxELYjA1CxdrQ5zxO9gOdcg8wo73H7pXK5/jkeu/CabwZXMp3h89HnArsUGombGxieaw5eydGVfVpVhZeBetfTxlZpHAV9LBdkvN1ineCocjri8vGOjb65QgnquOWxRZUV5JQ9dqK2nVPSuW9DhbVB7naBP6Fpgo2Ft3esUElctJ2DRcXpSRTTWZKi6NKBtE9AcLu/RSMuSuXp9Ph3ECAI6EIXMLwF6nAGp2H48ZqrFWN6ktWH33t+gOD8PHUnB7XqjEB7wn5YkBjS/Vkfk/Is+0OM9nbTgaifoA4CAZw2rUIWVoxinXIQeuNYdxuUosqZXWUfMjHfQxQu+yIrt2CekPWpFLWiWyap5V+ZiSvaMHEMcjMztF0EzjinREaGq7VX6UpHvBMeuKMiiqKL82qPgJz6tGIoWD2A4BqYrPnywN2rl1b/Xmrdjqb4qH2EOr04BlIEWL+Ef9FWgwTRQgGtBXNLAIU3mSV/NpeuuZc42vvPCPArCnqCxCq53sxhOCV8b3EfkV9H3Ygq6ix3yQPCuQejhtGYIl99tJp3B/cMuk7lNjDrWs4Mb4zMb7lX7lLAmlmgJurR69q9Ux0FehlFvsJg8aGKlrtamQs57dKtLrIh87ULMxK6mJRyntL4I+KMav82l2zkE6ySaX01w4P67P2MJH6RDljCKX/ZKs39ifA4ZCdKoF/7bodtYFxrHsH3pXwB6B06m4dLQturwcfkCybOWSC5ccAK6usjHYukNKkQnybyOJIm5+e6hlDyLycBDLZerzoaLuZOjTJ8ZfxmBo47dhEEgehN6CfCJgyFBlyMTdahyyLbmyfQNasEUCcVMVbXmb9pS7gOY0bq1rj8r2WN2qq0qLmhoqZNt16lGDl+4434hGtkydlkchNRpLCDGXO84NXkikb/G0IWXWw9e9N3cHtLpXXeZztm7uYWii1qk942PyAm8nRQs9cx+2GGtGlR0XlT0g5E3R2c/hinVo2IK8GDOtNp2526ZV7AV6LrNdZw6hgIiPEM3mVmScBs0kw26id54nE/40xLv1jk+wxrDxr4H+1mPeQkeG+FFfugUNhdAwtBL+u9fDYj0qFtoKi68jAE/d3MxpJPjYzfOXkqUlcWRUUqahBLtyiPnf2V2ELsf7ZmfnBrQ/zQjNgOAeTqeFxdGH77qJWqRuki1G/eQP4NtmBCD2iqS00NhHJNKDUITmYLHbhLc3DekVjUc+iTWoF3igNp5ureM6ocVe2SIW2bV7fiNiIzH3tdLbER/az7EID6s1Ebi/VlAVPkp/D96TcoFL4QQ4X4YhT5hybTm3G9f6HxAQbi7yaabOQocU256GQSBduk9fFBh4bIg4Uy1K+oXGB0NraTEsSiwwRPfPYhLQrJcwCDBapD1tA4VIwA4VEOsbaP5bb3dv2qkIKNI43ktjmJB+8lRM+1M0SHmoQoTQrSQFV2MzCttFl5LUW7ow4/jmhVUBqLDmMsmxmgg5/dk0elD7hkP8Ra+oMSOKMEByTUz6noD/ct0hEByHYtsd2nYG2n8dGTd7a867lObYpYyLufwGO/Ybyl92abAiefbmL1o5kFcQyCedjbKNEaOL7SrDyE0rwvw2Lcsm53BDnqOn96YI5CcAaTB65/R4flkHibzr7I1Cp1yIFkV2OytqV/m7vpgl3s6zqu7Zm4u6UntJtd6HBujSZZjzIN8k1hRUhJ3Sr9IJ5LtPx1BPjzrAgLyLeyj0MUQJEGO+omisw27z5kxglkQJEOcwdhC25WlroJQZQmfdIHALRwBP+R8QDay1Z+45ZB4uSK8yL3LIZntjMyKiRUlKLdi0pEZ2mt7+TOGcMmdBm2RplWelbvc449SY2Kk10qBQJpRdFlge8KDR4doQf3Ezp/OR532Q+9bNTES8+LJIdmLlfMBEaYUfAAPJxY2NGgjEjAIF6rsKFUQOl4+FWYafWL0sZzelOaQ5BNbMsCLgg6N6Ig+651dGKj1GFyzoqe9P3Y8bSGECOzxdQp1VkXYfADFr4X1XwsUxYAGlNUZBGDVr5vyA/OQwXVgkTgVtrU18IPqUWOS13Ibv80Jvuc1X33hhS8zR5EEDWhYJqnQjSyoSitmLsyF43rJ7P35H2REI4U+eyDJOs6tiBlx43N6NxR3MrTkEDGOHQU+MAX4C3T0woTOrrsKWNJfnlwx1XoENnlijOOa6hVMU76FVDK+jGCtAESPjtpyNMRSpKs7e9UVmRl81UuP2G1ut8etujVZwwy3LsLviLaV8CNfxQG1HYKdQiYEiC5bpYU5OMP87pwiRsJnHkHMJwoio6CsPONELlgSmJgfGFt3j4Eh2UU0f979K2q4XpIDjvKSOOv1gOJMCZCDoFJSq6Je2QDuea1CFg9XyDVgVGuZmbvips9xAldLZmYqXFW5w1SIE+QRSQWnrONpJqxi1yKsC8+5Np0QWiskiU+lhXFJWvCxEk37JQ6o8DuY5ZCk2pfgVLXS71W+5Mlfp3wvAYjBzpfIne6fqdT4LX++fegfXC0xTziEVDKv06ikdWX9Lp/OL9G/MRpqpyaDpgOknyZ8pVMt5ocM8PcBY3BjekaZu2F64hcIO+MCjsEO2QbqKZIXmVVFpIAONn3KSQLwnAH3m4uE5KaE5wyCpIMlLrxK7RkQej/y3cEYYBtR2XTIAv00ew482g3NgfqKjJYLv20Hy1bpwhI1IuIJir2hE7ZfNhdcWC6+qSkBFtVyNEwzfeyJdrAOuYERtl9IkaKQTl+kbxxAt9G3S2189kkDyb8Uk/3BId9VY0tmgiG9TwEbP8BQPGgeMmGlp7fZnvET2DTuEnQE9eqysHUJwlpd8UpNCcguZapW+8A2HX2Utp0RfVRHGSivfSiRcJLU20hZfUij5lsR2bB7COyBDaKNHYeA1mzGAuwWL2jsK9YfAnJ0bkQHkmIcYNljiGcfFdexmhcj+6TWALiJREJ4GJGkOuYP6W2RAMR6VGHC3QajRTP2oKEvgQbxFxYoxXs+cE3fU2CjlwIyzTJne8WTgXGopdgBm9BI8y8aXZnNbTzkAQ6yZa1g11YkcYVcQVMcWI5e+A4l17p67+Ijw9npfv7O5wmGXqefEfh/QUPDxB2+/rbFgpiW5W1rwj8xD7Yznr7bJXu2ZzNdww7+q2IK8NFxj6IHdx40GHCZwmoPnqfZj2JZi/JPfUrwOLieivX5K6gRzWI4gislkOXWm7U7N6Sd/rCwpT1Ev3eabYorJ5yslPy1dotiCxHtIGjzQQCiSpOlRUa6nRxKe4h9Bhby8kcqJptWb4L+t07vc0LTquN36qBuaDfm0LW5oQibXE+FxK7S2suDZJF3yR2Qw2ZQYryO/9TtoonzKQAzeZPZGLW6jyiKkUHOyChsyzxioTOqujCF3mGF2edM1724lTVcQ1RN0tXHvvn7CKOtSsAKToPOPOOIEjDPccIxclKNPbutTcxcUtZQy0wRkUOYzxOxyNnMKCIRxaM+deUvNN/HOvnlqiTfkRJTNQ6N7nI8XqzxeIWTLxh6vAd48x9Yr8osUo8YlpaJqOP629UO9Z2ywc25yQPWtGTnO1z8An+4pDpf1ExtnIZ6+0eGjdDg1L9LZIccP6oQhqWxQrkZb8RYh3zZUfBVhBXwZNHqtyqfmTbUBUfejFm1O3PV+W+l3qoj9y8jKcDguhBbbgQf+CdpNshgPryBV7ahqw3fwqF2zTZ0gCilxfqDKLZWuhXFACJazSzYdsCF6n1Vw7zluzq5rabe76zgi84ZH17/8TUVR688MT7RvSglvtHvwnmP17Fa3s1Hv5+vfjC7NewtN88KZLoKexLyEiC0v8tmleffQdFc9jHfz0BlBPvTbgKiT1UOvQwmF/za/Aj/Pq7lp/NHe/m96+/u9R799u//bgy+/PNh7/D+7H7q7i+Yyjw++2Psf09yNgUxxY97vX+0BVGy8sWr34MSbsnm5rNLzDCAxmi/N0z2ED0SDMz+++PLJk8d/zHc/fDj9oMkBrzfsXgN+FdFClYk6sdcd1kPaAQgK8QwNLROs46uz2gEXR6JGKlCmNz1eKyYFsjWB43Uccq9nSmpWetNlfv+BllaxpAwoHfa/m+iHcgN3ugWHiQQIPJK0SrHhLN5KY7iCKEAmKwQM3jh7oNiVq6UN/GN+0OlDN84f41Odanh2u+bisJHuoCmM7RDCSGR4ST66CJNGQUxLCcLGZ7kjRy70tSB700jqBo+Ykqy9++72513QL+wiSYBfHVQXiuQZIns9dn6fFJ1wayTyb2CU84+8W3yQzMHtbZHI/CihGupjMdcdJLnDd7bKPVxHxoNIbx4oen2AaNv1Bxcrv6aRwl2nvfeCC7kN4giouyzkdUYSWo0uOdEwni1lv+jv7/cf/aYVaD807ePWvthKkiU6w1Vbde+SmI+jLS2KEk5Ko65Yv2DG7YBLmKld4xR+84ifuCDNyfU+vNn7fPx4lI5Ge1xgYo5LiP10kPwurfJR73BpWMLfHx+D8/MfzagNCauS49cvj37/CmtM8FZhhpFOrPwKSAUPvcxgZsvAM8+UCQbYEK2cypIEfLJ/2p+SVNy6jikTGDaPP2IRwkAncAnRijj+bLA0/BPVXhGzLEt7dVkK8hS3XtLtmWGCWsOQHhDawVCEtwSD2GuvT7uD+bb+eS5fa6fHZtUii7A61LZAS0yIZOvhwQdw8a7LBDChY3dWfuT+5mzWtL9T1IjyHv91i6/f4g+43jFBUQJEou2UkdAhDBtt6qzsLatellaL3iOV1srwnwePH38hA5bnW47bIzQZQCobt2MUZx3Jcf1vSHlEHaeRX6oga1brgyFlk2eFHcluY/u/gd/lo1qXvh0n67n9Rrz+xQbl+WxSRK1Fg13PKRSdAh7ax/O2q/LqPO7vJaPpsgKTa+LuKJsG6QpwbcD+R1K0I3t2JgnIHhhOAfFlgfmD/J1qgzRxFB+Dif37ofF184DScCCGgoLiHcyxUQHfTO05ZDCOD5aKa6Ml9z8fubdWoNcbkfmw+FYkHZMk+HZGsDXXEvUhptH9CTOowNdNKDomeu6fl8Vyfspu0KzPQKNaVBWiIbGvqPqJU7ZANxB8qU3XPWbFW2ZrQd5q3lngU+3svFxxdQuElQTqrYctTsY4rEGaOv18kLT6reRzXUZMwh62Oid7p5qp/omyCmv4IPd/F/g8FImoEUhdde+HGj+IEm95eDuR9qw6sMnoOqJMUG251APFLPMhb3O7aWjaezMKdoBC2XtSfvzEUknLCPoKd2q40rUtSwxguyYWmbEvOx3pTC2Q6+tA9eU3zLm9ugmLQHqx0P+XF0s8bAzNmS6vZlWbL0bn6eKiqsnKhhyQHFS5II82xtComKMFC4rMtZXrO/MYc+SDzmCUztD1ms2D06vg5oGS7EFmYuAgtOOwnOBny/Of8+k07ZfZ+CLFg/ohxE0amhf90Xn+n/l4sP/Vo69+u/9VB1MdSBS2itMqpYRAtIeUMtzhF+UzsVLjAd79s38T4FAbXIUlYGGfgdgBAdc11wVtgeQdhpishGvPLGwkyd2YnNFxTaxmgY5iGK9yoqRzJi8hKi+YebvlIBccSDWBvjuQcgN7O8PI22dirk+LNPNVFXTzrDQK8f3n35YgppAuA2gn/IREexA5FaeGqWcMoOOQqmnusGsBFAaTIDP9Ixiwmb8Rcyl92BKwwsWsxKjkMBTYlRSLhNlnP8ujzWERg3KbtctqwuD7MCtwMTuhYxNiknVnQi8eM1hY6eAOf1tyorikGu23ZeFtnWjU6QV8xBcI+BjUDJxnM7jKRdXF19pMYVoUl8ly7nQ9MEm5D6/Rdqc+hNFg2brlAoznNPksmWYzIi9WPGhrwk/WGJ2k963Fv7baQ7TOHd4qkdUjTRPTM0qAJssC6Up0Ik1stiNI2D5p1d1P4MCU09Y/Rr2yrVNzRmpiaWFGo6YkSeoQtd6zZkwnewePT22ty+zWPPbOjPdi38G50TyrDn3og9tz60OHQei4e4ZGv8oWBqdT4ENNN12Dsh1ZUw1jGNPjA+uETvZGnwrBHbkdrDv8bB3e7EGeE04kcM1ZU3gyInlTlXzmoAGdrDqb67upgyCr+be5KYDy0v3690FtPHUZxvrn6Yd2gt7ovSJnhpxeqrmbNZK15D3iKTyxgBz3mJ52KH65gj586oeBn4v5kkJ6wB6zsAkyKzef+HIbiy4JyKPZzYnevVlpyDwRZm8f97c/GaeZEYeXM44xfbczDU6wW2zNCBd0ysKRPbUJVgUusg2EJEGxn42Qy5xTI0ulqEwAQxDcPKGfGwakoq+G3/YR6C4bTtcDOTIYA/h+SGc+opsO3OCxoPwwePUgOQQ+jsyC8PYRbW+tVbZhPFKwV2hDtIuhXSQWA5++evn26OXb4feHx98PD1++fPX28O3zVy+BvXVXo6TO65Hz9UMOHd6DJAItQWx+OISHG4kdkA4N5UCo0SRu9F2ktBllLUhSN1mzPOqs83cF4BEe3+RRGFggPEheQbJosmKgAsJXE2OKGghkWQspiFga2EBcYXHDeOeir8AxcirYB+hdtPQys6I7OeVmgfxuRWVtJSxjNM6AlsguwzuiKTiD/uHYrAspBrB5OBlgUATuUGzCN+NVeOlX6c+LebuGlJr+O8hX0r5PsFWBWE/qNXbWgHq6S7gWdbXqx92J1ydsDPWb+BHv5sufbGS80msD4FxL46YNqSg/Z9noVxfpoy+ftGHpMetD1UbUKhdDwwtUkkAxA3qJN1vtVhf4nINWp9PPUBXUbi0Xk95v4MFF9m6cn2eVs+sb+hsbz9X4iXIM1KFac1ys3G9O12xPBndWYB/kAs0RnTA8dkrGXgfkWsFIz4cHyqyjtCwlAWEFzBl0/IkOkRodatvECHRKWDjSg0787LknFszfUhvupljtk4bNBKgZoc132EhrDyIoIKCzLKuDpn2EAupAsfGaLih9SsOMOh/HA0Dvm5z24BYYTjcAUiPMfU7BsUXipO2tQN1TMFpc0xUuoHDVxu/Gc35jdw1zyJUY9yoeO1CNqoFvrft3rEh/EvAfMSPjQyQVlWfSUdmzHSwMfU5V04jtgr8oygHkRDmUwC1WmOD7KTkysJZa8QB4nJua4GzWdfFpSEuaztxlVZ890MCORD+25h2uM4joCZ4TBj7OxJp9LlTXVjNH15SGptr8thDKFB2VPQDZ1Uajr17P/tb5bClwNmFSk/W1sq1FQ9hoGpcGjFEGZ2fZBJPS2uiX1Bor0ShwEcAUdJU6MqqLhGgq7VjsRAc+K+EEjIxBHTgbiioL3zi3xTnLWyqZL41ont7CTQwPmLR5eBMs0NKyE8TwEP3ouTlRl2eoFnWXk/prXlWG3Dz8au/JV4+Rpt1c3NoLs6owpAcsCknZBf7cVVreNhr/fkw6Gn9v6rYUr5BXVr5AXiG1vHvOnDHAo+2IJMmWG4gRFJbD+pHWOAThJ6KcAhz3BKJiEV2Sl8WC/cYXwqGX2WTKfZnHcOs4TcHXle3S0Q8+rzAOy9dMb82vFPzPCeWUAIwjNFIWBhc0B2I6q6z4IS4dBi8MhOdOw85yBuRvcuGbeDuhZrtFy97q69MbWT3TSssFGCGMO1tOL4dUHRWxWdkTp93lwuBfVtUUvTUfBCIZaoRmSSSL8p8hTq2PJIAOS8yDXPlTI2Yfk0KyaJUL0Z6S1t7nqSLhN/hgdhTLEseYi5AtZt2X/tWcy+rOrgJTHU402KQeW+ZxroOVMoGtp/qoKZY9Tte24/QS8ekQjF46r+D6diRbQ/wd2RGGeAOx4n3htcvBzwfibtBCdG+BYhDuVum/9w375UB6+9BN9nxrCD/FTpmd52CgIOYA9KeWGFRnybIDYdQBvBkQdlGfnVp1bXoQ60HnjYLf/winQwnnhMuynM8LOnAlBIoco3KFX8l5Pqd8deIlgsDpcotwlKcqUv78VoysbJg5e/Qj/XHxVmwJbsoFHRCnIrkHDQ94dkumAZEESipNCO+EDENfdhi52aOtewP7YgG3RpWr86mt8dlCCG3hPB71Hd/aV9H73MmLfI0X4+YNKZnBfd28ukrytn771+koSmBK+wPbU+1kCdIle1kLYi6vW5mhjmEL2avZ6X2dq86v8s5m8g570f+Zo2iC4x7oVckLn5zqRXJh73pexQ3kHutTKMxTLWzJx3Pmd2PVNmSttg4v9K/PUv3zxg9hvPvoACIfdwh8mlgiW7QUPQdEy40xxThDz1U6RxRru5/kLDPOyyFo+ADX0CjAprwoh5ADkSUSeWpWEtIz80/wXpmmZ+Y4iMUecakwFM1T0TwnGP/XDgjD85TZFUUp88JiMCGyYiQGKvJ4ZGJq2FG/0+EYmRxa0t4TGeHrYZn9tMxLNOmi0DuGH0EzJRK9Se7iARvex4/67kOPzgnPuEIlotX1alA+gIDjmHGZ+LE8dMoyNRDVb9HCR5T48jRHsxLWwojQSDvcJiumgYayvGv3CkIj4fynZCEs3tk0dxTsR04pYbg0sX8zlfBuI6kqA3NUUSCoOv1wzgqDDjiS1QRnnSCPQFww69KcSs1KweQSdNLqz0FYaPXNsdY67bgMTyQ3Gyio1oD5TiGQYXCrLqhLpwMOBMxXUH2dzNO8jCURVsgp0DYs9RkElSWMk4Wlm7PZAnUtBo/PisUFyQGyor5i0W4c75CkR5FxkIkccxY8Iot34dmndxvcEqs6wnvXXesEPPXAzPYN2idZRYOdQb2GeufqjK/sFSs3qNN0hNtjZYxcCVFGCU4WEukcNomWtpW3YK2DtaGgazVA5q89PHXjBGom72HZVs1JyrNxoOH2qj6M3tSxQ424EPA9kCkM3/p/L/KZLd6lxjo7tVqwWFwjr2DvtRuaV4uh923jaQRt0SEC34Z2D6ohovk1qAmwy8aW8knQhJiKs0HC5mOCTz2KuP6Q+XWBzjJtghywXYMWJC3Fu2ODEoNdvD2G4MeG91wNgiHwEGwhJ/OWR2vmPb468VqA68FJHxS3ElB3HOfAnuKO/iGd34UN84ZDNmMHwcnmsyAt2symlNvZroTm6riL8VWEoxt7bEmVmcN6QTwJf/8nYUhoNHje/ZNzIwpuv7Ii/xBW5KMZDEG2j+YuKPgPXctLY2dPHpMxzHhFjKi7syI89s35EK7wT8GEWFkaaO+Tx0T5fbWp61SZtAKNuOwm12icbVgIc7yVdFVg2Ro16quTS6Dp1Effrkf7+lfe55fifTZiHe6Hlbk/NqaZhdmKm/tn53Vq+0KYn9XczzHSkXtjfTT78Yn4ntEUoqhh8o03eF1W3oILODgLtwsdq8TaHebohE68iQ3Dlpbo3qBzGqVnkJEsh5aTkpsGan8Bjld0ZuryAc1FY8ghqLmHwzbEguraRobLcqoTtboUrcAUTQeBdSdU7uu64C+ifvoFbYrcge3BL2BT4Q5sx5q8oWU9DMNHV3xEfob/lZEff78oz62BnPTV8TuTavg3yqUWo8usJEYG9Pk+x4rAH9rJAvCHAPLqfvjRlrN+gVBN4Vha/9sZ1kbwYhxDOH9TCqQ5ZVsJYDaiW+2fle3Zmo0BGNBvSgYCPEoxcfvf7DecQ4pv2PKIXVn5CohwY2xIp2mrpZJ6lSla6jYC3Y7MUO2hbKih2q81oh54/Zoe+o6swC+pbG23DQaOM/pmu8M5n0BxTVZOvRMCaTFO6CA+PEe8hf0T0zFtxX1bLJMbEgQovdQt3rfhC8PoqA1It3twrhE51a+8owtHDx5w8HfHG8GL9OfbBK3lYMUwRfG4TM/PMTDSzBqxsZODgVDOrKg5IopygUOQtl5iLvc6SwuHARAUM1DOWGmgE1KS2NppC3xV3KwbDGUxeBxdMx7NIYbHykeXllF1Ig8kdxbjf7YBV+Dq16jcQXTIXQ3KfxluAXhu6HkNYY/wFwKxVZoVvFL8DG6ywuOGcsJVmNK+PMsXJaCVyPPOioRFCiRgeCOJIXxcNgr/0hYvet9qscld9XI08zC5REXp7KquFyOubm8XHQE89KYlF4belSpO3wMLxCmskKvCOIbq6G64b+MYjvHMWvRxt3grCqnzv6GEoUyXIIsZ8WBVMdjtq97DcTs06ATNRdIIqGFL1LdVrZUZhrcxcJvmo9tVJcm9BdnLYT1XQbwOsB25KZmOKG3qutG4fOwrZ4YguIIWVxZTfsgDf/97H94/zG8yt2CL1k5l5c6iyBCTDYtz7o2lF5pWOOVGxA83GjCDIgtyJBEsaiOk7m06FNwHcBvv9oMbCOCdGwP88mOMwud9DYItO4rXpgZ2Wy58QCua6Mwk3eBPWtgXzhC/2RHx1tTxGZ/bp37aVSBtYBaO3mMuByvSOO2QzYu8XORTI1gPHTeJGpI2t12LUUA9Gmjw1/g8+CXOhL/buajNfxCtzAWe5SXWV+XdCtndARTVbYJ4g+YEW5b54vYpmXC2IjyUa9AsnO+V4vBiXT/X4EiU/QAFaBHXogwjaAta7lH1yN5sYZ+vU2TzWg+hcKwUaBLAZ7U2A5qFfGM1FmhS/d3i4gybFk7cxE7D/eFTynjmB2geHZih5GssiCDx67q8ZA0kdVXjqs7vocprrHFMGb6ws6ZWbbcxqhx2w2UOqchLCigxiFb1MYVPprA9/Q5b0g9UrA4+ssLq9gURQvm1EkmpJuHX/WImvGbErDeCJeaCtpHqH1ajKATx9YWKhtgairALE/waIsdGuVz5qt4CfIDTNX88XGdOa16EV3m09Mxdyc86h+x9xJZrRRGzMyhKcnhweJ+NmDCEX1ksCkPYB623T183nfk0NJrBOoYLPuu5O5yJOUMGracUye/5ys5D3sRnQvTQtPLNPYV97uDmBbv5OA4mvq6fjoupU2RiBw423606xbWDSSQhAjYN/M9s0dbAjBZlNAKWhr9GSlF/r12zzQNQG11vQt4fCPlwq4gICX88iPPg70wnjqn+vdEKHs86peovqlCNit2T8//detRVKr3/FXrUB2RTANTLWrmj3Tv6VGFNTD7PilFPRzZOzqbFmQ3PQI8grBhlUZfAv+/5L/a7/9Wj/hd7/Ud7v+nv73118OXe3t7ugVcEi4kK0rzb5c3ALNJuNywrWkoo+w0PUJ59WyuNtxX1ZvXFR70LWHXdvAzvwPazq6p80PV3aaf0BIP6HJ6rX12P+hykto+Jee8DGP1+H30t2Orh0+vKxbwCFpy9ntKz4jq7q2p8lUbcU3p7te5ZoX4H9bm0BMeWbjgQELkH1svay0G/FKIoN4Tfg/fbqep/IUV5KdVgWII9qxTjWEZpxO9R/z05Z/BQH/qA/d+h7TYTvKOaG7ehweMsvRLJQz9aI33AZ2PBAT6b8flYEkjgEE6P5Vy0p6uUkfLxGH+cigrojjl6WvepkGwG1i/J0hOYWCFSQ0IEJYyjDlJFHvTo3KTuzAIjy3OMbdwbG6zGxUhM/mjg62UdYqsw1cIP6SUys8B+As37m2EWTYWerfA35fFbNYWNaOGNDuYNSK7z7Macfjw06zZ8bUgzMH/Mr0KEeYjh5kgq34GmeCBzKETk4UbZLC3zoqLo9JYzZtaA2Krgckny4MxZVQbZIZYQ2BUPWbxilZD3D4E/wXDsxOz1euA0WA3AKXqaX+WcIdjGsnfdIK2FM/xWXCWNBAC2j0mLYjm3ggR7GMGS8zq2PCAHaUrcEMT+U+ZDWQ39JR1SqLq2eeCnf4KjA7gG5+3XpqKg2G2kFJCWrukdAmQ4TrOrYgbJk+FCDPRha4jWtDgf2ixsq7IJUdnKENvZOpKJ5Wg8Z7eLDUZgBgs2Rb39xkKUiWs4LxGXBxl+aSxtZj0qc3QNjcmJfwaTzSqIm9zVtWBjdTGYHtken0HwQRioF3fRN6S1y0cymQQpFCtnuu0EM4xLtiY27RyWo4v8Ojs2DzuAtBRdaFH45stuXNz0iJ+d2W7Ez5UG1iXXfAwF7UWWY+mOLbRpGGe3tjVxuFQ+VqpV2K9SchzIa5IYrJLwBGxQbuazyNAn1Zl2O0j5m1AMC202OTo0AGAD3DCAe5dqn3BkM+xpYPNNi6rMwxilLPOeg5tvenU2NgtzQCF6d+qF2q3fY2xySrjgjO8mGF3OMuIw8AlFBOkIF4gKgVkxhGQ8cG8DNN4OheQZuG/CmL4nnOCrhRxO67QTmM1i3pOGTR6/GZDPAwotLmlFQJMMJ0dqjrIrw5WRfG1b7RL5Z8xSE25qN8MWTdMqx1xKueHgDo7i2TQOvW7kOh3PXBgX/ZlgEHFJqbaq0bgdq2lY3LWZalPc/FtssG2bNmsA31udBn8qtWi4ZjYaUz9I81HczLLyjQ230DdH0dDAcnTRbrgfEC7kGU7p2JwytXIfGqx9GfjDYoYgSGzGOW+ObpBeMjg742jTcMsVtM4mzQaizSbDwS5ayf+2MNxTuMOUNgqNzGWhEeHMQ0jJa2kaooaXCWU1x53ggaq3bFMxCUwNlMbHCNzfQJbIyBrx8nMjwMFZ0V+8W7SazKqhZwTMEIq2J2u9vtUh7Z/Za2vSie0O7/VdwWFsj+W1xfVJHx79PkwRgGoHhrDySKM+jmu6HvjoAnRsyOnUVo7xFDXRkX9YKzxm3QCkGg7C4wNcvfjQvZr+8Dm9AGxA2NS07Q2TD+NEygG5klgZEOzo2BjJJAxnmVZDtELubAJcrBfEVyc09vlQzEG6mgWFIrHnBgLoWTT8u2F6jZgxXBqOCpjldFFc5aOenzEYDjhTA9NAkRagFQ25UI1nmCC1kXmcTJdGyhmvLjRbXg3FqcqOj7U8g/0982msFc5qba0ojxpnPesm/HRedllfjnTQiDfcN3KiMmHJ5opp2fNPzoRa7gwOR9NQIy8mzJcsXH3T2jces6bXsV7He+vqLcpbxR3FuCy9MhFpS6bTZbgHi+f/DNgArMuTgWMW3ILAqpAiCRbI7jgoTDDhd+TMhYi5mHyXz58wdQTDR/dWP0d46jQZOoRahnaBxFIxPaNcqxQYaYWTD6eeH9qwcbrjPueub4MsbGgr/DQ7XHrqVel1Ft/Hm36shQ0ZA7ZMx6vuydd+wiPgY9qqFmOD6YNJnEOYMK32AdjPyrJdD0fuYxIars2LqspRwsQMb/5GR3dZuMMyhwfEwLdh7hFzcJPr4mjqUvFtW9AVWko5mqI8eJNeDyL332SCBDUxZ5xBhqr6LlDbs2kn+Pv7XnaDavKgzqGHwttTZiIxfAb71woQILCUxzLqIdSX+wECPHuHFwpUA9VLjLyS1pgyI2A2hJyjwILuj8IBinScLGcScn2jXS1j7/PY+zSMzTd4CLr4nm7cJi3ud7SYrtiYrd4zONkfXqflQ8PYPeRKK2sgLyCzWVEOGKBVB3q87gqqtDmNcBQgghPPZ6ikpJy7s6xYVkl2jTfQoDGdTAt0tDRne1VAuGS+kEpn1p6nglW7yabTWuNg7Rplr+JLvAr1uRnX5x33AHyi+Mkd3Bk/4aNQsWaXF342Q0gs2YSUsHp/xlBqQkSZgAKttBBa07aHvkQjcuv8MCKvC7AxSOEmEK4BBUIsPd5Wi+xq3OOHPcilssjW9Gm3QgOXiuN4uRTtDniQG3RjrDRDOKdkezWkaOz2tI748nlgjTzwogKi7c1ENw+cl4pFzpEVJsVoCexrY5NwfEAjcH5sg//yUWgk4ShPWr1lq4utnkZ2sXw2IpLq+x3YinvgTOIMST0zApX1aYJLgx1hNyRoB9/AiMKtmTpgdxSIMbEpa2GTZ00qV0nxO3K0CbtQLAdQo7/O4n12E+DyM9hN/Nasw0inu7XcPme9RJcgkApAZOlKLkxW9IEoXoXsPxTKrnNDyDmwzFU6yydZtdYcFD88Ma4qmSHz6mrFXQQPKpmaLTqtc1/BjFDdCLOqlHoe9zX37ee75LmQSPjMtPUDT4cUv/Ieu0HNv40r0rVtY9IyUuYi1bKXy6Ar/tre/JEy3uabkZw3UNvFj0UtFOmNddfcx+wScktBwM+cJqqDvstCBGH5cNJoyFbM2QQNbk0R0WkEJWevwR2HQPVHOMtQgbggmi0aRb4hyUbpsrLXm7fmqC51KY7jnNIsKCN3tTTsnh+GRmECm+2l7/Kr5RUQcqbT5rSQWM/6kgcuJkec9QazktYvbPzrGJf3p/0N6wAA+b/tJt/YeLLwI7hG+rZDWUqr4D5JgMSBenYUlkPsmVcKR+wFEazWGem8Vo5ZNkJAJJaadwHcJ5GC8N/jVvR+dsY3cjHBG8ZPotpN/g4zSc12w+RLxI9XKebVuIEMG8KUo1cERx31OuqTn4Okz2h3QH7ZUzTP6fBapt8eJjWE86f1/gOiiE343jQRaUmSkp6qGyUu6ldRopDunQDLugAI/QJeP+TWJBfeVKTVcYnDpSH0LuI9GlXCmsWk5I8MJKSnHY4HXbUxkHg2NJMd4mRVLvX4iVXLfiQfHax/z1d80mb28qXyMIRKNYwjHmcG5iOT7ruMAEjaQH1bZ4kBSlgxCqJgaqKiBVWuXD3Ey8fSbTLMh3wtigs9usinY6VYrjcnuYYppzNG5In1KA33p6jci0Z4oUzb9S4sZSZyDcPpJie2RQzRw1dQ0XY79UGe1ntxWPD5INn32bgaBXmTLSHqAdh+unpC0aCTCDWxBX1GIYApp0OcZTd4QoVtU6oSoCLXRAgny0C2C7cNt7Bu46A8qKOwn5x6e5WJcvNtMPcL66L3DT529RHLVctCgtpxdEMuoeHeRGNgWEpykEHv3dr5wI81/6S+d2B8/hWGEMVmCxqP9YsXQcIxOGmNK7ygGLn7eLiuMRiWmbWswMTSvM3m0+IWbM3hF1/el1ixxIo29l2javROVjub2+xsZrGzgQXONiY929jqhNxx48Ipdrwx628ajVpo45+cGwJlBEnDW6Uo5WMYQ2BhyS/kPDfSsaBIGD/wvm16NCY66xlojm7rYQr0xONjdBOIqZrVwwdKCEiYP9dhHYUfarOJHikDMLU6WMexqTS1BKbw2KHDc9iPBchLFrPN92wx6nuhEJutMtRo2VoonHAVCiAklQbykG2aWaLplGxWPOZdhNcKG3Y5qjBJhTNwAqUF6qb9lhMXk1EYXW+O3h70kiaINsS9xsOmGOMuChrh7XmQ9HokFiGhHLGxGVarV4G9CjXg70YV1M6Fevizhz/XVQ/MqJIfyJmJ5IEFW6hybCHOfoEVIetpP/mzwJCiDZG+C1uUWCCgKnBWHju02YuRkcYqTKttkfRKd4zDwcfVYpyV5Wo5y8lXdUm5hltOBJve+iOA/bO4AGs6TjUmZq6qQxJ1KvBvo5dDfWatEMsdvarL5AER2FZEx05xe6SczSMipYOx7DIfs8BdTw3tGKhQSq/J8SQ4zcxA0jF0Qqn/3L5Mz9N85keDBcs02jWk0RBTS9cr4KUv5NpDQJDGEtQG0ydf8dPin63OPZoNhraK1khRuGPzVitg2MZRwDdsKNYHt5e2lOp4UplNxrOBwaGwS8xitSluZo1DpHvxGrc2oDibvuzFxpcxe2bd0KYqzmZ+qPHN5m07ZmgLYyiv9paWUV7dVWZS27Q0vLslmHxWGjts3Iq2sm7k/ZvFQrg5UlLhhATACYpLgFVaSy/eeYN70e5upW+3rGdtkyq1sH20XdMNos1OWADiCrfVxu0m9pqnsQ2P7PTBPgMhVHNAoOunNmbCaZScsO8RCKQM31VSBxaGyCZlDvTeVVlx25Fa3+G14o8qalveqLT1RhoPScprrsWH0XBUStkVY7+bjdldrcy2EP82kv7WC39byH5biH6bSX6kSF8F/VWiIZyhlXgvOFcPkmJwXmT+JRe9LMwkHABPODIXQYCSs6Uk4fVpjz11Nspg6QFxouma1wDjHLYoZgSmWMzglH4DTHYxBfZGM44Q78bwWwe1yzDsBNgyGeTX7raISN/X5K6CYbVV9mHiBbvY6wo/F4QDsVYvUVpKvcsNw3BPLeupmcyul4LYr5RCMma6BzTsXF568it4paA3CrXTT47S0UU4J4aH1QpVOA3h2SqnxltQ3GJI0IfXDYlhKInlhT2CNjgphBE0TNUXyWceyI3Yo29WyuUMihaYI/jPtBz4UMnPIMhIhj/0ITbNV0ZcABUdpmEzfaISHYHj8WF8a4L1KkndjVLFVT95BaJfKtXBwshgn8GdRVpdyu3LBdxVMI+KFgWYAoCyLFpcBE9YeEcVw5zJIFgU56blynGkeE9DxJ8vavho6MP2ec3lySVIrvSJY2bPwnI5R3SAK6MchfoleCAtnAmEDOrs1gJwoSJjoEBAO4T3O9C0Pm1fWspC7TuV/IHv2Xj2aAz3E538TbKM2XV6jyiUrYFKQ8ibeB1KwqgTlPSNidZk1PdQ5C6VdpX5gl2BhhmE0oiC2Q79a1+mq6u610psDD8WTAUbQsEU1ojE/oJjnDgTD0sitUrMKr9yjGEuGjLsS2nJuq5gisgC+IYoXLLhnJYmzWmcX+fjZcpJS4JUHzVGxVPNRIV+zC3pbgXAUb1HXFE38W3X6Xio9RfhdbbuFbRQ2PNnqtPhZ/iKWRjZCTA9PwhrwDwdGNRF841ZhJ6jux9F7kiOETlvVQNcRVkSJEfv5plNUh5R35HWrmE8Dh4OSP5G2HhktpYbHDEEpMM18LRj3XaUIWdoVi+D9ZjBYU3K0OB80/lUkvZ4hByFUosipnQgczd2KW7IVX1aVmtrjaiqEMzesGusqYdqbNf19M2zRDKAoIrN1F2QgYEwK6iAQYp3dQXxMsaGcEzhYDBjpbUGgsgOfXCe4444SMdXueEhCujmBvKwvvnd4VNyK5zl5xeLqzRAzlXc8UHyfXEDdPbWSniWQMGVmTVRbMP2IKsyaatT76WBl27qxRq/sblakcyhT450/Tk4qXwedWHprNQEP1fq31D7q+D/n+sUwVaNao2p/QaYnra+vGh1am15GuJ1LYXTWaUv/qfUDZMSmLTCoPbbUBvMLDesD/IEyLA363xj+l7HD2yk8yV+ReU3JjbN8h04YeKWgByGemAIFSasmsf86flurFYOE3KJ0hUvQxrttugUitpuldmycrZbgUnSy4eHvsa2piyVqYlOlBjPIaf+IbsEjAQCT9qv37z6/Zuj4+Phd89fHL08/OHIZmomICMf5TdSs86gTNJ/gvROaJPYbuG1Psb1CYVAZmaZ42xZQyNDfGf0FG285UivWYdRailml2H7UpA5YS6F2VylLSY1sJhPmKGJWtvNsdNREEDVcETdjOrjADB1c4EHyRFTS8qpaiQdJqyEqGgJp7lmFIbsUwxRA1JX7sQG6Ogyh+1ue7EaKiCxQrnb4WL/cPjy+XdHx2+Hf3j145uXhy/condFZKA/965PB8+7gL2q41GthOfgFmGHVjZhCzW1ErIrqwcUFvZa1eJwrRX9ciCiaz9C5Hbqpa/Sd+19Tz15j/csMhFDc9v3b6rRcX30KbhOewU8JVdVNgG5d1hMkBnQHogkzJvtMQQoLsshQ7Ld6UNIUK+WI02cxJ3q2pBiBhzleaYMGMgSHNbuvOA88IZK0Y0+M9UkQ8FLpPBInpHG93rc7LiYtYw8vTS7eAYxIYDemYqL8pabrBZAwsgeHzUa5tjsc+W3inqhxJuC0RO4GoRbH1NE0OEGmn7DmlRMM8DHbRGQ2IbrrG6i1RI+9QuJAXK+XKDrKcPlwiAIx1Fnrj2do1kAOiphsWx4SeKgF13k8tGOGI6O8Vhk/5EL0I6nCnAThkM3PMwR+GNgXKJu0A8LcAsQftlpArNaA2dP8QrfoZgMgZeI9we6K25oFeSfw3ArnqPxbBz0Aq4mEJMFZiHyGYoGh2YZl6MLyjNo1TWTaXqOfIscGL70sMin8VmkQMwKsr7wfQjxwt3AOjTfbJmHLWcMFzHURMcorKidCauROUbAErf10m7TVtzWkfa3Waa2tCO2mI4WaX9lmM/rEj1okgyYhQq2CBkYZlfzBadSySfkRgkbCv0rTCPOqAI+6LqsR+JZ9LacqAEesJGZP0i+Q78NMVshVQzudIwvaPqzt6T9Wm01JwftcfUQO2OAC2G6MWIWBziptxMaW36Huenef7AThhVnPxJrXTnNZm0ZgfYtizmQQDkD6CA0Qtit82aBqGAe8HAUnnEnN6nX+EHyY4WOS46wV2LwD/TynN1G5+bwwZw2LjUsBKjD962kXUyNBNIBsqYW0L2eZTdZqYJJ+E7tbiHoYOJgg+9btl8ICcOVWh+6wXDJNNRtloazVK+RcvlpXCc9yNAmHDa/EFbKl0F03aDvNXiSZTch5spzDiGgDElVlcYazpLecFcSC8OBDR9b9LXRMeq7zGuT3BY5EmDVGKlF3LuXreMMYjxzBfJRshCDDUNBoCW2YNR50jX2lLIVN7dGUfy81rzmeBkamA752FWKLZHeBsdwqSDGkiCKSRZjX5cIlAft12tKQ0dr0IeONG7MpPlLpVH83+FBryymWd+PEErdtojt+9AhU/lKG7fXokHV9KAeNFzRuHmQfS9pW21MJDrKLjO46cmAvPNNzDh7+O7253onrGyEs8U2qmCt+HuATUdvrLr+OmH/r6iW2etbngrTajhjYtXXxVFwJGvzkr0N4jO0lCp9i5aJFd+iAuHUNu1XBt+2qGG4qDJdV/7U2065mFicxzTfXeQPWZevNNtohkeql8rtRzeQz7p8SVDDme2xAx4wz2N9q3wmTKpoTsx0uBoMqtk+zqGCObQ1YwPyFk6j1en4UENJwYKDzHb50jAraxsoIp3Jq07E6A1DHKH+1ocM6OAgayyGD2twdA0pb/Twg4aQB1hDk0m28x77cZj06cgE0wuNsWIFOJqNBE+SL10/XJL+sbK1VSYqK/3P1zXaZC+zfXwH+tzZpC0SYeQOhyouvY9zzIzAG/Sn8Zth+b5FpQ6awkh+SttNxvtwnJujehNmo4wYNrPRniD3XH+UobgEn/s2O4VPs+mpOtS3a/GjDE5tC3c0OrX178XwlFu7B+NT+NyPASp8NjJCDcXLtUESlvUYBRIDd0WUAr1zPybcVOOnMfJBWLBxN33ERvwoS17dUBP1jIwCCYlHAkHJYj39AvfnoBN89dNdHAI8mDN3IM6iEc/zn4jBD+B8DywCdk6BsNbTRFBPKbsKifvMhkaGi4pYG34t9nWoxVJmeM7CLtKPdpGRyEWcMRvM5ZZ4Ual6+z+PQlM7MbOrNb6pobdwRzLcwFv3brvPW897MR53LX8yI3L5SNQRvi8xq3fQrKYJz/y7AkzZ8O7fE8kV+0/lnO0RWX/TbksRGzbUAy+GxXo71oTdCOFWB/lFNN+cKiMlZ+PnI7nZIEPFxkFuGYgOK1dC6lWUINL4T3j9wI64Xy3PzHHeDhomF4FbIsX4Fc0caHsp124UMN+ihcNr09oRRjsywt9V+m7IRMLzK0gwdMU4w767yV9rgN6yLTWTIJRfDT8OFwtQtPOVFFs6YRBotHnzFGiKZQuQwcKJg2TXwY8iYl2rM1mCfSNeBlgA1IBP4he24IInaaFaD8xJ1UF0LYy+givN4JG+MTKC8gnRp2EXcxxn47aVgZu9Q2Knx6FGbndRJ5gNppeLStuUxu5kwvE6wwJSHU6n7ZNJn7LAtRWf4Nc7bQhxvlbuEuBhm3rVYmpdGcXOzs6D5GkBKaTYEJzsWMyRSSFQqwtWxrZhzTOOxdAN31LUOrL75hfwBEj97c7QPkPj/0FyfPy96xO2CwzkASTRQ/NXm0gh8GAGVQheAAadcweprT5Aa35u7qk52rO2+P6MpkWVuQGN3NTDFDRPoWTFIf5h6ompkKgKMhKO8RMMqtNPXomhYFda0LUFi3BEY0I2vMlEDSs6CeTjKTlFv3p99PL4++ffvR0+ffH86OXb4eu/vP3+1cvhs6PvDn988XZoADp8/uzF0fD46Omrl8+O0RAZA/4s/EhD/lL0sW8LGw+Monhok3jJwAleGkjTa7mIpHg7diW0BYdXz2yOH/IKLhBDi6Tnr8gcaZeORLhHRCtMu7hpVRWjPBULciB+u0L6eDBBIgobwgPPgj5mDqVzQUYaHBXBaE89+ADwuAD3N7Sa7mFRCgclbUBvhkxlk9A/J6Oc1IxiXBxwaslBusBm1sM4MstywW9TvV8IE63JPfYBuxhEADzYYRsYJjXlK/N0Rpfx1uhUx71Ddth1HJiztb/hniGMlgwc208uDf6a+kD0vu148wULg0rsclcBzgbpUoSQiltsi9SzRUXo8VHBvsZhDmGYA58V0tRj5UbgsH9e9KZVktaKqYZ5J/Tg2nVrGdAb0wUBWYYZMlwvBDmY6DIO3gfiWeMkswoqt+0Aumx7dNAAC3umUwf28ly2HOKv2gF6V9kd0UeHsXarqy9M+Yqf3DpKiFTGCGYDAUBKkRIsTUw7B+HUJBKzd+a15aXd5UMiAvLcjS7DWECujFyIgWGFnoA878PVw7ymmPbjNzsCGFWE8ruuW3+mWz5BDINXzm7t+JGTRTi3339AYuaTxRDyghhC+cOzvhFnV7grYsrwR4/iLyXH5ar6nP1yRREDGQxFtqYlDDJq5jyESLYrfESZwA3Z82zwpMnrdHFRFstzy+usabYG7cHu0TvKQvfs5XFXvj9/3f3eNARz2W12E73KLwvhUoYYZHmVDyrzaCtcRoNT6A2HhkxtZ3Tm0AU99+tidxMrJieFO4k4SzSZUs0NdwMx3cnCyXAYZEQloRPtadbr4VGHPh9Mwwy7mJ5LQ9a+ynddaUJNHUrIsY8JB3O0SnLTMFiPZbMFD4uKLWjii8JFx8FeiV1ByzUSQsHMyG6UkBlJJIKlwhTnLwlkYHbrW6xDMnscOPSOaevVW5uiGEvIL+YRvGZ47/gFW1XipZSV4ElqF1EF+YVhUSSIKBjugZ8bHEeGsX8Ii5mV6M0GbBJS+KUBxwwuwayTgqyS3oKelw68gbyHoCEh8JhGMThV4GER7M4DJaaIr6guHtmjytcAI9WpNckrDs0C0k4XgS8xj9BXOJU8cdwsc0iuAZ8z64MlFcL8oc1eTP4AuAVcNezEiHLz1MjwtITsegSWKWU+Hmez0FPLJyYAh6urNDHsNlxlZGPnLwV4bPlIU74ymxP+2KlhbE8zQV+hCsG9yrFZHcs81pxIIlTIjzg7JuvJlJwtLm8gZSRpQivrS7I0e7mcolmtkVcCGgOrSi6xwf4AgqadRi4yXcWsIzjbsE9hSt7l5Psqcmy1PKuyn5bYFwqQdFjClhO+0XrmsChnFhfFo5qcaoS613VJrgKToMssmxuu71oMhdA5AO6Hzsz6AOdNBsF0DYkaMkhtj1KmECKbzJNBI3F7gzkzOHGqmp0XUltzP1H0iuwr2NgYIaTJb8L01x4R+OVB8gdD73v5rIemvxwnzSaivkgNstvE07f95BCMdSuuCnbBLNOgTwMkIW3hEoDp9gVaI7uzB+UD8JGgGXBX8tozom8+B5xASSS7ziMrTof51ToLZjnkO8t71DJse9Vh1AzeG4+aYztC1BC7gkYV+1zvzko5vsiC6VduSDZcQA5xdk0ncpfOCgqSb9GuS4e1R/FFeEwXqllNFdFLT2K5JqRMLosCTYXxL0QDRjREeyCs6HTGDAV7Cnpky56GTQCVAu2I+aYcl/61mcs7H29RCkiLDZQRQug2vMGkmc5pgt/qSzBv6aQZJEQaP/yS6NLDwWwQRwB/q2De/onsa5tdS+DJd0WKGdsSp51u29EcmqYOx2NKXe0ZatQu5wgdi9FlKG7zqAJ0jelmKfRCmZGjLcMG6nXtUU1HX6ieY1+8WpPYJ2QrqZC6DMJB4Hrb9+36fYqViEFMt5QDCtfLkiOXFG7tP/qqv2f+t9/qJnv10hpc/jDJRwy8Ec1Obe+Sb15vMZrn892uG1FXdRjohtUEBe8uWP4YeJMYwD9dJ7LJl7X3ZFaCky9dX2LTPzbK+QhCWcAGgqZ/dDmwgFrbzmefNWzGZgv80PHlLQsJhp8W9uoqZT0t+4eGeG2PkTpGh3qXfHZt+AY05rO1gmsb0ANoU8Ej0gSYo3oGgdQNtwU6UlvAblQs0D+Ef98AC1Qtvjenh5HU2s3YTohmBsaW17VIyErvrs8q5tRqh6+QOCaZppQouDykc/jWTeLo0/VJWH3h83E7PBcjJMY5OdZbANGwLTdJcazpG5b7Ckyx+WqNpxnq1S+y0SXEwpH5dgUQNY1LepPmd1K48IYwS2WaHleN2otVepn1apn1WpnNlDIb6mS20rTcl6JllZ4lVj4MwpyVeTHmeBgpXdRWiqFxantDQOCQIvXsr1qNX7Uav2o1/h/TaqiIEF2IkIMrccOBf9NqwbwIxUgYZfk1Kw44NloxMluxcle6tJj+QWCO1twICsHTjl8UHSwG+LvP3tdYgCLeAXa5kzzutLn5lUGz0LyOd0sUP7q+7PYMa4xlXV/n7jxteAyuYWhqn/DC4tGXG1SKHamRZ5sMvnbe1i+WNgF5/LRtYtPREG2FhMgeJY3cfJCQDUECaF9Ns2ze3t+rGa+qTZF8G2yZz8PdFhkPceuxezW0ibnT5Rp+IPVetSjXFasWRhrYpODKGzv8bHBtRy2tv7vDz4YXePjZ9BYPPxtf5eFnu/s8Gs19XerhZ/ubParmTLBWlArYUzJF1PGo4GKNIi2y2hmSbhLbcp2nyASQCp3Uz+Woy6E2upJyIPmdjVfXjV3tGUaELZ6adfE0iAbjqa/RXmSh4qUie2KDMOWkOsQjk5gdSjbsq9xV+CGZc45hTf8X895MJGjsMmsMmoFoEFl0XdvSjoPkmKKWwTSWErAVXydttvAh0V8MHX7l/X/l/X/l/be50SQzDdANZDcB9dRUTPJRymamlUej0XRijh1Q/wX5QSI025cZtrzTI5obu41D2+nwShTVo2cZ5XiEVp1JK9LxG4gbl2qazGGdv2YyDpuQm/cpumRxkao2HDTlVeEwzT4sqwUgSzrCoEAUOBJpLmphbC8TuYYC/ae9/2I9KFDNfNHphkeJ172QVrhW9i7O8NKVO8orinTsT0uMfym2KEddrDjCDqSCheyiQHE5lDotiNU1DZJH6HXljtzGM43Un/vKSo8aARO4ElTZbWlVXUr9QgLfpsLetoLetkLeXQW8uwt3IfsaXnqsrn0/Et7HS3dbSnZrsQGZXfqzUgqMugRCYWRXuvKViCF9h5CpA30lht4KvLPbzENFvbrcNagh+VbI7CZHr75DO03zbXadl8UM4qLhk3gEL9l3nyf7aFvKuy7u/EEyZWyKcqOHhvzjvBoZyh0kmpWPzakaCryO6WuGIsfusUUjUbFs0cl0WV1E7k1dCb7H7FcXS7MuN7MhtR7eWFJ8v4FawD4QxnanPzbS9zhrt5aLSe83rS5HJRu0KHVo4MbqrTdLMHdphw7X4Yicp9SgZDplNrqGtMioLVgsq3BCzPGrdmqndKA3sE407dX5nhhjG99vqBPYMCXletXBZoqDzdQGmysNtlAZbKMw2FpdcJ/KgjupCppVAEr2x6jg5DbieTWDDqDB4ykmqyOOdnQSFZeJVDugQDaK6bWItVYZ8dMyK30Jtp4uEzYchaAIM2aio5MI4pUviavIXJvLxuj5AjW3loolu4a0u1pKbo7MbbMQyKg0z1nMfsEkjb9K8v8rJPlfhW8lGB9i24b2zeeiratnHbZEAFO31GXpjpI0aV9SaEwjNGJvZ5g9Au0dqRkndeLPcZGRc7DhFQDYpatPQYDRVw/ie48kMnVC0i4yMjYv1I4AHNmW4FrQBiE8iXmlkbO2BPnT7toc55usepTLHtVw3nmn2IuN+Y3Vo+2sbYMNDk0r7z+QpmHCo9fmqm/o/NDekuT5CB7a5JjCcRo5JoG2jeZ1gPxYuEFtu6SiUHFIQ//0eDJ6v74f8BHdYtjv0IMIlvVjOJJMbt6F89VgoJWYeX3VWXWG4gm+PwUDK8rx3DJsrQSYoCOFw7rKgfL+Aydeg26wDxtKQLzEpA86Us2OzYyUxNORkwZQPgwxV5PMmAOO3oshcqy/P+SPXIat43xrH8cK22+bV97mPpo/d7mWlt7ucDvNn4+5pObPx91V8+fjNBvqc3/X2DK9e7nN5s+2l9q24Q1uq3nPbLGbw0COEpcryaxHfIVM4wBPw/bP+bx90ki2cNOfuoAaGH3DbHYyO16Rh9WaSGJnErGS6ZRnPslFjPQLx9dbZ+5dXSF1t8yxOToqipkPkXjTEj13Z/A4+b3BhTnH09cySEoa1x1TbDkbTc1OouccXLhrGJ7LLNm93t/tQwSXnFLXFcA9AGhtIHvDCryaZ7NjCOOZ/Okxme/sUM4BCKsKAW8gEv5zSq9FKQegHozoAu1uK4oln47KwvAxEn25j5M+/vH161dv3h49Gx4/f/n7H18cvhmaWQ1//+bVj6+Hxz9+993z/z46hoMWRmojEuQYWe98OU1L9Pw+ByC08V8mw7CS1XIyyd8BrDbqxaGfOYGwrb6h9xTLtNXXMcWx3U48vKMNhOhFVaNxg82x+Q8U4BklGwijbzjHVOFH4dxvSaVW0s77WR9ia0Hs82+gjW+JMYVoOx1Ok0FZzFipzxFwkVb05reGOWTe+C+coQx4tr8VI0ZUhKekUKz+xt7oOSc+gFwHFWecyN6lowUJHeIbG3CdMIdvKLPTt3D7YdAbeUyOOAHTRCNwHLYHB5W3RFYTHuG+JLZOnP7tUH2A8jK2HrYwwZ955a8W5wLAuNZt+CFe+Q9bnZM9Fb7Odx/iZhsQENqJqD0b++oHfcX7izbhx/jA1zv/9v/Ox+VLJMR+eLacXvbnt/fZB6RjfvL4Mf41n+DvF48eP37yb/tfPN5/9OWjJ0/g+f6jJ4/2/i3Zu89BNH2WcAeXJL9EV/+MH3RyGnKop+FQLmnTMyMsLQ0Ro987O/zcpZSr5FFhv5WGPGN7/ZQvT7nEaEgP+C0mKzOn11klJSBeLHASGKewa6gCeKL9BJvR/Jhki9GFJU8S1N/wDUPI4Ta0OdawVsV9iEeqjNs55PmMCBcnWiiloWPz0nSbYZZrc1hN85/ppOEKxHFIhTf4i1+JKCgv5TeEqMK8cqxVc1yJqB9B84iaO8yyq8M+SoYS2J3DzxIE3o5Eb/rdjy/+OHz6/Y8v/2hO5f85YgPeAkOyZLPr9u668E9BA7vdZHd/b2+3g1G1/ognCDn+0vWyy9N2dYWX0XTTn4DVh44FiAkHKR1tbqrBFMzfr239YmKapwMKM55RtE2/Jqd4m+Sg1oHqoLKE8GWVFOKkQpyMELLMlFXW3xk684MhvTWHIJL6kxZKwJD/o6VCl0IiK0MMiivBNJf3u3Xa5Zpw6Z+PzPqMIIkUJsvKRiXlyXJpsCAzFkbJNw/pPJef8PeMQlIFb+1TOrJaqE7DG3Wsx2P6aVksUhp1XpT54hYZUkraVZTpeWZ/z2GbIEt5bXbyVRZ7ZgrnVzC5U1ho1DHtumxfcEpWDw1Oz0Bc5/yshkqMd3eGmILb7NZZZjbmefbOALfMMLScERPbZev/tP96/PlD81/nr9Xn8L0DGTOOf3z69OgYuNBWtRzB4rV2vjt8/uLoGTyCpFbZuLXz48un3x++/D09tLu7JSwrLGYbtjozCMjODIJdigUwJFELfsLkWyxOAAuUc4RSiutoIAEJv9o1lPFZIOGbIsmtmHvINSsBeWDqLcosDA2qyLqhahs5lnuykcbIYY3hxeIUa3rgwpCDBjH70zn1W8XF8Vqdo0+azwbC4tn2oB144LF9kIuuttJ9pItteGBjF2koXYWQob6F5WqbVUEWb9+Ik26loSK/eISxktTCk8mJwCKQ+6h1ixvpJQyTHrblCxh3WnQRxvg7Sk2M5qWQyYvoCDHUiCKmigtuJkJEm7316X6240BriFsxCrh2vPqgrKy2nBhjYfPqhsdQ+3E+5sxgeGyEoffYWV1htuQ+b1FU1g65h3foJV6SdFUgqZ94o6jDlbaR3hXh/Lz9IZNQKMJHdNdOULLEYDt9SJ2MFBTFAY0mQfkB3/PNxt7h26b2f4rIA+Nsahs5yU9j25EmofGF0iDuIJFMfmfO0lfLhSFaEtRXMtohLg2B+A+HEKpswlkBqMFuYjZtZWgt3qF6ocdgxdmo150eSRtYmw5d+OUuGBKc5XiS2wagqz4FqjP/qnYZ+bsJU0uzWHbv+LUZ3wZ68tTGd5w3EEJ6dp3WP0BhvzWeKOSkpG8OPqTpgVIKAoKr3jZ4o8KQ1O9KFg5kuNonRAZOH1JgOMtQSMiP1Ftp2QKY3oOvSSSB40toQAt2tul+dMCSVuL9h4dKR6G3i6yPIV32++ZbEU8gC7/J3QBoWZc1oLTlDupA5VAywXay6CqqL8xLLs140UitlWJaMR504iB1ox1sDTFh0Gqh8NzUYpveLJ+XiEYKdwmjbXKQoJp+qYkAWAQwEVDL5PoyY9YKLWjFpjHQO9Is/0HSSj739xUYT+nfeNK1gFVSNOoNbtA2yRjBKQYEh15QkmolH/ST5y6tl9Acc8ykbIthmEEYNfs+UGICwrGCiKLcZGJHjFchDaOOIA0gkJYhIFbBcQfTmXJGJEcDaYU4veC+MUJ0L/Lzi+HUcPTTYTGHPQ3ZKVSsk6V52HYgIoB3+raVaH1FEg/1GeACl0oUcJY96DbabS4I2g8JxBkUAfWmxnSqYJwYkC+x6qLJ8RFbQ6qTQo1HvuezoHlKRgHfLckXmq+6RS7bCDLjBgTGNr2xCZulCBUu1sYN0Aml6ltGbuMm7NHW0aFujLxVbUUuU/+qXtLUA6wkHGFNAufYXunCQjfaF40GLpwZXgfJnhzO+NVOwfz64N3YNq2oT8yogxN/iU+TzwfJfgg/KqrWXG6it4MVdJGPbG3LqFrIoAJAeFRAin7yEm+tMWN5/Vjy5kM660WMPfLuWtSBs+qMtnO0EJrom6cmGDdfx9W3078PhNkiYyx+u8WJj/nZSC6BGPeji+Xssg0Ek+QRCBYGj7p4FQ0WKqiZgvN1ObPssZweeVVM4VJBODgyIwjuPJa4ktAFeRRAtC/qROF4GIyZz4Nu8h5lEsMtZO8ONGH84AdiVicqqCxGSOuwE8JBVLNh+Kn3Ft4khJsD8IWRo1QywFY6z/9E+jx4e72v31kIw4Wkeo7AMw9P8Ivh/Ul4gdXmAZE0wIGyWBc5cGpIPzRyN6E1kVUYnLR6E2DXINeePDzt8r2/AeKAZ9h4u2shNLDfOmooeDbQ11O5fLACOmIArwngLVVUpwqbuDgU8aV6DYYwMzwIf6skZIClx2lxtVpye38AItrnq+56ZAawXANP9JKe7YnohQVy3dQODou4dntLRQafOxj3XGULpFjLm460tkFp6pmhfKj34QVATcZ+gnfhi9oWvucxEbXqyuTBSN3Tz4Th+0DjIHZkVXorGl7R7abkz3SRidDYh8OivNUsEjCOvtZCtQ8wuM7HmKIdDtyxBKynXBjh8crDBo/cofg2DIJUWmvhVMIIhxYx6KfaPE2EWIsJsAnqNLn56Fj92YSU4yT9y0uegphKefPqRFFDzCP8Ofu3m5EdQ+cTiA0MEYMzdBWDGRlcckBwwsKUKRhMr5hoECFEh1X+c+YZc2igIRQHWu0Z2UUDq+dgNT5HoqZlEnWL7HJ8WCdOvKRDpHbqWqm96cwcAXLzqnej3g2ShosUcXHE64/et4pLMj9O3HF72k+O0PSbjmq4UoEzBk5wuyE5QC1bvbuWqsIF0HwAG5KDs4IxAnKzvV7AU8ltCJ8krPnj0Sh1HwJSMZCeML+FFtIT5EXnaVvF0UDcSL4WaysFf1ffN/ZfgRyWjZ/lmChAV9G797SjziN1ujLdZGG6hYKyktwB+TtNhy3ywrCGwFDSyUnDpjiZDl35bydAE2WAIc1FuCgQN6HVE/j3VALF+QQOrXEwkoj1tzTShj5y9G6MmFDQeKw2vj6ME2z+QMKVuMZOw4yqYK+Jr+P2Ox/N9Kru0DZGiBcNyUnCs4hlGU1z0yROrnm0B6OOYpFiMJImGDEyI0l/VhNkf7geTnraAn3G24OOlhjXF3cjWzx71x9MxBGj6epncxoOPvboOyeUtuGyvSElgMMO8ieqO4A5tpp++lf2fPT5Yswh6lUq8i8S8gfBP+CSSmJkAK2CEHm0vYh3wdSNrJ9SWMFyKmA5XvhgJ0/xqvcNz/OZkkZ1KyoAiC8Hg4O6vfXG8XhOCpsuwIEYBIjuFcS0GYYIuYKOwS6RajpG6SnRd7IGk3MCvv69ggbK5Da9mkJUADJRQyUIOIk4G7b+DzCqbkI5gtxja1fvOhPTNrNMBVy4G4YuE5s61fWVocL5fCpa6Ao0mRncIfv+Uxbb0Hul17O/k+oCHRhgXmwDgZjs1W5AzYPkOKMVu237DkgOOwnOV+m7/Gp5tZXhRc33xPO6qrfovKvCvJ2bO07JljmAjGacnZ0maJDzfIlw9bDN21PKM8jhbFFlVjC/SCtAYLxg49SMFMvAlJjfkjoHZAKI0Cp4wAozLodTYYh3ag4y7phVtze0QXEOVnCF2N0yatSy2OUwE5rj9kMxhLEqd1nsvalgcAgYnbtO5jxiHlm5L74QzNhxHgNq0mdH0c3GXw8FRKrJg4hZLzGZtxyo7QzabdoAtoMmU6m2NMMNowEW+kQNcCu7qPFuh9pGbWFhGlpq47ZCHotEiRb2xjyfYcpsG55GpUls8IUFAllM/iKpIJgbS+D2KSjy3PmpU4IRiWcT9nY+1jq+jpWRahrF4OjWN0m1M507QV44HwtTaxnhUJBXemOyJ3JI7swh6n7x6mMtF0ALBDM+9QTAOsMwKrMU/fI3lvq2PPLDrIjY3x0Pdxrsxx7u0sqnP9wPRVyDo/khnMt8bHcTPoJtZTqN7dKKvQlCCahfUWX/28425a9pp6vOOznprN8mh8cRXxWwQGo+ejykE4mEaBOtf2sbVcdJq1cM+Bo/TsDqm1KDQO84swenBlu32HIGTUeWQV+//+pDWbUh39Bw7rgjeTL+lvyn2ywIQM9TG1PuADb1evjSohs6e4xkXr9uubtuOc1iuN1zKkc0rchKHgOLtHwFJu9gXp3ttvBaHmTzLTxGC+QtdnDNCZg38zmkYB/OMQA8b2e92ePam7sfvmI5faetTpP+2MNXWsHIc/+iZ2+4mgfJa9gsvR696JkXPRu6Dq5ZcM6hMIRGJNZl2koxdhhxaYaHoBEHBT57hw5GMIuKaRsW61Ext71jtJFnQMRQD/tXCnjPFNDKiyEWraSGIWq1nLijcUFnjV/doEaNgVKE69Y6rpOPI9iESr8kvY7dLnnm5iH4PStzp9GnaA3/aC+tT/ep+f+Rm8e9egCi/9+TJv+//Sdf7X8R+P99Yf73q//fL/HZ0v8vRBf0jh/JW9iyTx6LE6C0BQcwxKobKedtl4o8dNyOWj3LCeCqUd5JpeKOCXy2Z8xwV7WLEWTLKi6zNjtrtTa811e2Qdd5drNpNfcB+g+juUvNXpneocfTDWvMiqGzV0JqBxoslZhcbASCDPJIwNvDyxF90+wm+HXL85rVjn2DL3yjFC5ilglZNPSbAF0t9RDiTSeKT0P2qWPfqugALa4Re+AGmzyfUWi96a1LKwnBlDTm5bNJ0Y/jqos2AGEnKK4W57pO+a5y4TXmq6gvR6BBXQNo+40UgTZKk7MBEwhwdICZabfPz6rgOl+Ob68KOlN4flZYtgHctDXFno6iQ/2yUBe/CPGBsCHvxQd4BmlkS9XaR0NdvEpGJy3urce9tU4b4MT2hhpOLLJ9WmjZiHO2W4lfSNChTAJlbhge65Cmn0Ug2oj9aHDNq+CseqUnQM2gIXI6fc/od9Dv97vKv6OPvyHuEX798NHLlk88QESsevTbwZa4fjnquLjYUsbbhPRMbUI1ILf1wGrQWy+PkrvEiKqawHM4L8FvOL+2biy+59uqDazo5j9gAwuhDPNXNKLfx+BBbCHvtNwKwpvs91iLev+bJk/EKbyRkNDrtl6vLQiJrraeEEzqe9ZxW5/g+DSsTnJ2Czoq5CG9as30hVFHj1WH0UFGA+kM3V8bYqIjc/Yg1Cc60/fAju2g/6FvJo+BU1POGUP+mjgu1HqnN2hRQXsb4j85AqLahdZc48kNxWjMCC5noAsD5hR/QRCi10c/yMX2x2M4EBa10hFKp982o36cKPiUbiN2Qw0ooHQaIaOUzqsmK7sJpav8SeWzKhuBmIM374tpBRfk+eS2Tbkdusm2W+oYNG3oQkse5NJBDzromQ561IF1pqnjbFuSc/iIa8BF3B0YYkglX6lFg1bWHhll9V07CEVt1xAGxbsCkho4mHYwdqk3rm6MSLcqW1/ivWL9MJ7rnamHteug0cTR6KOwXG0pbHC9+KjkRIN7PaHkzaKY7rm5FOj/GlZVq+6MxMao3DEC7405Izqd5kZrAmJdEuRtROjtAQ6p3AijnAl92/pA+jNkcTGMeYLhXadTOPw5jJmiooi2yL6n89zg+Hhe5BAmDyrCZcFNippmbBFshbAoRHI0CIi5zL3GZLQ5RiMukjFZT4O+b5IZXBhR6GxVBRtW1ZIrM0uKsgtQGdNBFcgX/V831jYb6wFQUrx/EjSnqRGI6SIGb26jp3YC56wL1SGbrqLjGTvY9CAgQuohsrdDk1VzeFncQEdgg3+Wji4ByhO65sN5SLjoRvrMsUd8vmer4YuJwLbjj7KZDtRujw8B1FtvdI/Nj2xGXsE2OYl3mk/LLbeVgdMcrFmb9lVK/fIuUjyETprVtPnuZ695sWKAAcxmxBO++3LvtzQ8FSRGy0nidzUvMI51uoKjJU4tz6bje+ErPxFRsDylvEdmv95KRPwJRChsBWE38Bojl5RmONlgEzJTFAfs7B4g/LFdCLGPum67XmbtuuCLQzy9Dd7jcIor9M+ePOakMdDSpqzrqt2Y4t87cq9r9iTaPiqDdOHrmzSZsjdpTLwtV2x5QHniXjp9KnwBmdDkYBPogkWCvVQ1UGfTPUpzgDR39XDWkop0MtmSUkCvDUTinknD7GH6r7BtKfqRmorAmM414NXQxgHjguQVxZ2OnucQahwwDopz042HJiwDZu1YZv3ke2h/lOJmxjfptJidV+CzkOUUulD8E/KKW07B54e4Trgmzuyiupngxr7B3CMQ/r/MR5cH0LzHsYQj4+YRZUZTCDUdm7XaEAAmZEuRL77JQl5igbzJDUxQchtW6SQzyDQ3IonsAJ69kJXtGfdVdJW24JPHQyaujqTRRhVa5LFENGJvkAbcS1avmLegEdlQvnqQXCwW8+rg4cNzs57LM4g4+BCmZ87sRVbh19Fi+jCvqqX5+eXe/gP8CuYboKN/vPfkN7/de/RkP2jXl9tWyGuinKv67z/0V5wkIpJpaK6QxQSmHyWs3en+N3b/jzTsHg0AVt//P3ny1eMvw/v/L548+vX+/5f4bHn/zyy1iv1Ll/3g6agzwcrvLmZL+Rn4mmg5+G6oi8F8lt8g+5SKxIsSPL1zhmB9Gq2NHvwWa70uiiklKoNQuyui9O48SF6TJ1slsXgrcqx1WbTd1SFknoGcSRjyWPy8j4+/H37/6vjty8MfINzuFqF2dc1d4Tf1yx+Pj97crVmpGW0WovZvHxhYakJE4EePICCwfnP449tXw8Nnz7YfqtSEdlFG3rUaKzgj2ju7t1kFL+HQw7/wzy0GJt51g3jx6vDZ8Pgvx2+PfkCgDv949Jfj7UYTbcL2vNWoDF49R8a9mzTr61QqLnM2jDF3LxoL+MaNO79/8ep3hy+Gx398/nr49sXx8E9Hb55/95fN5hZUuiOQzXRUJlJzZpc56pfhMCf++JZDLQJDe2FOemC2nIVQYkOuVVhH0tEx767Dw+38cGgW4M3w7fMfjl79uAWe+vXMyHv7aBbyoMk81bcgbcjqwMqnpZ8rDxbqLLtIpxMKtcfmxYY+TS1Cvj58c/jixdGL58c/bL/ZVGVYg99g/O3jt8+evxy+OXprKjyHGb96hmk82q3JcjqlSNAZ2SQlrXF+nlWLFq7d92ZBrpZgfTthtdN8ubB2uQUmBruE1DFnt8khR1hAT1qKc1TCoNHHvdN3m94fzJb73q+MWGmmQJj2armA4aHVdRD5fGoYM0nDRakz7HLSjZxMBA3BqkuahVl78Lk3jQ6vDBdc3up5/HD430ODL69/NF+Pfnj15i/bL1atiV00bm1/8Sj5LNnfe/SY/3SsmZIXdMoL9ywslzlqRpcnvf1TG/7xKZe34WmhVi1Qog6JCOHOjOBJAbi8QBsUCW00nKeLi+g7JSY0loEUHewEHHu9MMz7LPrGSAbALje3zGHYRQitF5gW5xTKkaSHWJFAHxofYmmAbLYu5O0yzMh5vJRhr6VgLQoRNUP5p4aWoYlCey7xviJj9bcZSlnRgjVMHhLac1mlnuK8jRil3WWtdD069iY6IPP6gtPJ1hq3JdjN99Gj+iubw7OpdclC1liAgWreGzGg/tpLIRZfFigGtp7D6raCuL1QcghRWkxxTCikwAURwEnPjJ4qCSruVG4ovAlClYV4jCL54T3p9zspzcSHoLwJJweMJb6lwGykkcadHsZ2MRiwnGZIiqiUoUX0rI0N1DLcQNB0qoMhCul7f4hbyLDyEEU9FO9apMnzCvYx1gunZwor9FtheiYC3lsHNwWtswyNdnKm1NTR1+gQT09wIrXmRtHM4nXAKsDgc3jcAJszs2SXOrBsBsq3OsFkd3GPBHeSb3XEODsWS1frBFvPxL4R40rs0scXCLdLCd0qL9W5iomqYp9CcnYsGAz+QXLMCdBx72MQAjgOIUKa2hkSZdgRAH9ytSyLdpi1DPGxlPb1urDR6+Cr0x87Qx8cKwKXGgYbLn5hLJiM2mXN5ZjqabXApGy3kpPLMESGbc0BPEonL8rVaCd0YFmgd6KAFFJ54CPtg+QPy2ph2P+eJ+YWSXpd5ODlZcifSwrRTw6nhiWvgiZg8JQIma+wW8WoZSOgG5IEx5KkBrTX5+O+Tx2oaykWDjOiSJOi7gvr0fa/+tLXoz0CZc3jL301mtQy+2R0mS36r/FP/nNW9t8cGbFq+Lu/vEXedV7ctB91k8d7ne3qvz58+sejt0ELa/DMNmrEzqf4sN0JQXFMwWduANrpmJK+4fpW/xnS29WHzPpdFK22akRGNoMorhDykJLRQa3mYfm5qdcOB26ZOJ+iHY454qf56LZtIXdo2jwcj1/T485qkPd5T7ZlfwxqO6ZLWVA9lqLr0pzW+InNHBlsrtMau9GVlNqDkNGowf2ITKjSc0CeSXFjdqsBTUAsU3MKERcUzh1uTuz7dgN2Y+P9Q/j3TfaT2V6L7zG5Y9m2VftwChs+u6pQAPMC0mfvVIB0yDTaJXV6F0Y2yuC2oFOzZ+bzaF7M251mMifXOK+evToAImWocopmkOZIgUhU7ck0PT9HlcVB8vjho988fLT36IuOHZxkElyW01U0HFgHaO4ihUTlRl6QZoFVkm7BUzRJXk+ztKKLF2mcpQ8gelk6jnagA4v71XRs/+AND7hG63WfMd/KsENXvtYU8w8bNUNl68MPysr6igus6t2bKApmjXMksW2jcWHR+5oZjWrtpKhPbz5anGyclidzbjQ2XeO+JukNde1cvRF4U2bRPcLAepL9RsPjwvc1RRna2tlJv97EAr1D0wRD9cRGgwwq3deEwyGvnXg4Dg8A7gRZHbMfqH1i+Zh4qTqvv9nkXPn7gpGaVQ08PvcvpeXAb8IAT8mw8aykxn3Oy450w5kJK7JqZlY7svHMpMZ9zsyOdMOZCVO3amZWq7TxzKTGfc7MjnSDmbEysmlSnq5ys7GoGkp8d04R0AxGeMMIJeNi1lqY39noMuEpA3PEragG0EWKH5Nlcjq9SW8rumFCyxcsUvOHibM3aGiIIQw/AtgCvLVEUabjH3OkM2UGF0SZReFF/ubR05t4bgJ+h/Gb7QvDY5bZOTC0Ay6glYHPJyBtpRwPblHMZbRdjlopWVt5fHooFC3TAiEYi3Rr4wGHZ+I8iOpeT57wQCffcvNAo3gwWYd8LaJrLuHascqvs+ltkwarr+HMELatdjRUQNdZ5mfLBYfJ4z4KTmIut+RtiAdZYmjY2S2lvadw5Ty4qq5C4abWwEoXVQOTcPZS3McguSho2r3BRcJG6O3XuS+yZEe6dqtIyYAAB/bfTTQ4uBbZjAz7le6NEgdDXjvzcBw+AIK7yiYAxO5aNoNCpOa9gSK8aF0LCr+CD4r6hWcDMJrukzYafkPl+wJJ5NZ2HVBqVYLjxDwvJqjw2S4h1uxWbno4XhcmS65Yw452S5g619Yg5xGu05GMd9WyLCG8EHp/8PWWNS6qkuzdPC+zsRged3mWpjXy5fCTH9pcefB5kPw4A9fT5KqoXJtX2eKiGFdW5yUPUIeirqBFgQK0HFdBtfsWaHuKiml4h5m2qoc2VhOYc8zBAAtjwWG4AO7rbFqQrepZRhbO4LQ7Q9cd1z5YL3t34fbNrLiBcLx8o9o3P9tiPdZfLkauoFkQsLxoRi/gq+pXtKo4MjnQ37eRgrHI/4h77B7kvcbpMA6HuMr+OHX+8gr38RVFTzf8l4HFeLvkdn76Om4Br0QoUBkY1eKVHITfqy4w5mW6yCtFya09coCXFMQaOvA3AHmaSFYgMwUwrvk6yftZH2KxjQzSCfa71T6UgjDMfR5ogviFfKp1uIH9UtshOMSKd0fDW6cebqPTA0VXzl3T/f9X9g9gFaxDeAW98b7CnPOAkTLJoKGP33f1rYX886b7UO2t/XAjIkpDAi4LhqhsEAFWOzLmHoyq018Ui3RqN2g89HYEag0j27yj5Bs7wPjwN+r0fubpUTh90mtAe4TVvvgm2Y+e+2bxwgnUuHtppKmo0FKy8d2IeD735RZDKFMwLbtJFR06u03+RoFH2P6n3fmbPZZtkwuVd5dSoRGNhDsNrAghTqdTsCpDl5/A8lBnUw7mTTjbSLOeok6AzJIhLgWoBCVEBc4M7g0xW8cZ3JCDogp8Fs1Y4GbLk//zSpppxy2juomXczhYn3idFVJsTdvyAPJbwN2m5EWEa3LDM0mjXMgeS9kMbqvEjzbqdIVNVtbIljLOUcx4OF+0WZfmwmaYRBWyS/UtbhnRMkffDc71wwqJUZCEeMT3gFsSSTWSJnZjJ0JaQ3BH6ala2EiVhlW186nXWJfxKL7cKxq0rayhM+IIyVRLEicTlWrY7Nar0W49OV3JsUupLXwfY8tN2aaEq2KvJfI6cI7mdLYhAo3I/sJ6+CG3AHnclMUJBzCmNskLsc7AYeNwHgK/him4TC+ArTCBkIYYckZunjxDD5q12cJX8EPTDJGljC8fHkahmSveEtWC9D1uHxWxiWxmOpLPnfNHm9sdyNKuoCJNPQW+s5GYwG3ZtjUH2LWG4ghIck5pMA6/Aac9yqakbC/bGHZIfFpSsmUOUy0js4ohuCnydgWhZ9Opv9bH5Oe4j5k08wqIOfYg82PzehtgWeZY07k6eBigzRhiXgK1yXI2stnawgDjYToP89Jgralh0H2kcqhTOpNlRfOeF8WUtIYAi6qLyFQqUYYOcbvVKOV6wUl1aEaUITEl4FfOzpBM8OlUgNZblVPdUtIqivHNONO1x0s3yRajviRWqiTkDk7mIh2TbQLtbOAK6j3hDoQDi0YFWe8rz6+hy+QBX43FRg2b9OMHQJ8QSlrOaXPMYBMIPHY0wIyLuhLCBkNam28lVvMhdqcg2zAEg2/PxDGKB21hK3pw1aoTwDaIyO3iZkuoTOsR6nNhAJNIBidJWRQkStJ4XeP7faRfsSWizX3DOXxdFiF8VAtbegIjphw/jXl4kLOs+6u1QYt1U5SXWVkNDL1ve5GsVfq/DiBqxrVqI0DAyNs+7OWzfDa2kiKMr8M727ol1EpAJshZVkZ3u1YQWNc5ujRB2ojWik4lliY3JdjAlqJCc9Sivn2xB7eFg6Bz0CMCD5IHS9fAl5+n5XiaVZVgEo8EvkrnBh8g4W7pNnNk873lkeA+MkgPlf3tBlDxI8iLfgQC3Vsz0w0IkyOTUCISCYRHHpByipEUk/7tWkg2q8tuck1YCN8AC6/TspK7p44kFwVUv/Tsv2VTtDo2cABOPM7O4itlF40jVGa9y1n7Mwrh/tlnlzfwTXFtenQygXjWU0NS0sWibFu6jtNzLHjM6JrG4l08rZhIYzNYx7VSM5XmnYdbP5yqm2mOUR9qYsCaAdUH5RvwNb3fUQMzSxDhisRgB/5pYoqE0IOTVoIWN7zDDG9kiEZaYlZv8eqz7CYfjdgWqe3ICIQNZTQ7SmbqXaqHPYjcBsqv1XyMc2Qie5raFEMTHTXVNcY5rs072EKGwxB7SPNfAOi7mUGGbUfMIaWDeFEcSQRenikk/GkAlucBJqaGdbabbQAw7kG8IbFaGGAQlkgbZB143VBdXM2uIzXtvWpTZSnQUD+8pBwX+KihsbrXGZePtRzc+cF9YmwDXmzvveny2t16OzHm1OkdbDCGg6TmTwosj3iU+mwYuh1R7hqzhaMeqoo1Ad43+RPwd0dlaVid1o9syY5jSuyYeBwqniECpxOHuT8fA3O8ma0DvH6j2CgFhn6lIAaSW2obuIhqYcBpWDvD4BPEGwBu1m5KSgPqEBcAe6qNxVuGWagTwFGspoK1FpVMdzZNZ5eN2RUUj4YFLV0WTm1mLyFAAsjAmSQtc0rfCsm3IFhvBtEVXZD1lDg0DKNzZaPY/lBUC4p4ZDCMidvZ8vwcfVjK4tzMvQp9W6DL9Ozhcmb+tWJzegVKOhJXxlkAGDPxpx5LJNfF4n1LhxAYgTnXBM6hBd4IYcQD5ZAQi7HQdf4G8Zx7niPGIBb7oJtEnUEGKyMTRFKCseOU+Dg82dsL42zCoVrRHaCv8kI/SgyUxxI3hIBeogM23yOSlik04HPhsZhph0hdkVAB2wTD8M9+UtU3NMuxm2AkmDqbwnQpVRc2hZ6bhv3IMLSXvdMUwQLnLn2atVxe2bjMkoULi0A4ANwSxcgWNzDytq71BcMdbKFlUP35a7A1K4184ovUHw+ufBJcFDDDtdAjyK1YBCQ1aQFO/xcGR6XAZpxEXOZFSiiBFBSmV4v0MkuAIcnAay3DLMFev6AEsRkUH8ZnVy05Ga6nmzB7j6AGCEo5ozWcNg1QgtOZKYhw+7KJqQ9rPEzOddt15bZ+vCshCH5XrSrxzHQleLPnp6UzU8IbVv8QAqooU9X2wHHUBkeNcUC8Yccd2eyIQo84fwSraRV1iaHZdI8BxToAwm3dOJUm2/PRjBN64Uc0wvtylPJoj22jeguA/a3/agFNdC6eltj6jmn8W/UhX/u4ldqmoW6yTweSr8purNnQlylhDdl33Gt2RLPJ50aho72HfKPAyz5YCVUmdLX3fqtyTb720ec7Kw5mlNFYqAsZND5tKr6FEXGUjzMnjorbuXBJQA6XMxXLEd1oUfCEKHNjm7LSEL2KPC7RbDr5/14fvv3ew1ke2UHy3RKi3Uj/JP2S6lWGsRXujlREDu2UEwBJCWcsUEq2T+UuxI8CaTamxzsSZRUFjnUcHJ10pJbAKxBQLI+cwTOfBiWkK/BZiVfzbHaMYX9ApmUBsd3r8TebWJHVwFaTyIzmzEgZcOyjehpQLr8y53GOERLFwlks5cUKwA6ImAAckOqchknsub1j9iPoEyiJYJvp1kYr54SuFIBXVdbJyaINaA2fAJ2sB/rJU4IDR3Sk5IRKBdLA5I4iQVtiLk8jP3ALT5xfBaFZaj5wAS6yWJ5GY8p+HGZxTKwAtUjSjyTiJHGj18MC3iKZ0amFoQZ+uTWxqol0GgNgRDdyT+C7mptnNh2W3pTcZ9/6iohRBWuWN96EQf3oJpQyKD027j7HluncXXag9nKbtcsCDGm8rir8mLWMLyX7dvg8gFtN+PVAbm4rurIv83ny0zKdAuqCFD/BK3SLy+0Wj//hAvQqSe/bpLWgmF2EO0EYJMVL7D7c7dhYI+GeFFslgvPwgjzK+URA+6k77FYyYAKUEwMdADrWBCmJzZzayxnev6RcNmZjAzoloP4kLvJbiPiMbZTBMWC2LPatEXyelSDCcFYoVDbQAMpWIPepodHIREYtkT1MDaZWo2w2hrwRsbHS3NEUs/JNkdA4wyzQPD1PF6KmQFtP3h21/CxuKcIkzZT/WtIjU1kRbO1cWawlE1Q7O77FstmxWBvFmO4U714Ya4DnoVpF5UaERgeptZdhvyEyjhtHrdx4tUBKQXtgHIqzxfPlC0C+cPYgZZJ9LGwaDiaYUlmm9CTiW2WYYCCAmalKcp5fo3zhL6DY0pMO3O48Q7uofMrhhxFpMarcHg4IoYLNA97ASLRREGQ5RZKgKG/Xiso0cGrXCtM0Ur4K9MAYoVeMzIFpIlkYeIjEOhh/dl0yQXBLQMm8RlkOAbfDNYTVSnkjy1bxkCjUOsYIY4DeljxKpHG+Sg0oUmhKWFMOH72DCE/Am/uzJs2MtNpSl3/RiG5+7aj8FatGgGq35F2LiWcnKroo6hHqWV8TwQMFMgzeX1w28xIDQyEvlg6IGUzuasq6kG15XrE6lY5fND2qKUklUcF5waSKCOOsmmRlyRG3r/MU1PBmlA/NH/M8efWG2gMWECLxy4iuQAU0SkuWb5DBHIPyPZ1ST5QsjaQoQACKCoYzYSL/qU7pURCtD+O8RZZLPB4/U/fQ2zNezihMNjqI2AxP4HTKs9wMpqTQ9IXt1i0dslasDs8hiVy1LNEcyRB9wtR36dV8ihejEIzOrgVzshBeNq3gX3sfni3AbKPioaBkak4WwSo36D7h8R9BSHcSL8ZtRQUhjZUycHatUp40fwDci9u5QY6K0nZiU+8N/wKDah0kLcjR2W8lHxLuRvtXcP4e3gDdxMZGhONzPMZEbkjtijD+Jx+KmSHE47E7/xc3hW3E0W+RIM4KuIjI0HeE1m5ujfLsLsQa1nUVhQ7gui6zW3VupLKJ8cLQtHeYOB/QgphUaomZHOUpS/ucslTQ0jBk3houEQMDTtPz6iA5uubr3wqTCa4KH0xHb3C2pXAZeDvAcR0kK6oPFjYGonApJQwA5mRw9tzaZIEVSeV0y4gwOSXaVohvOsBIZswBtHot5HbJXm2aLSgpo22l1aMCV4bG5nNXBMnFFO7ObkXLzC2mjHEMtk8irbkgneItjndUeKEFwFFHhmxl9k4e14+FB8kRbd4DmoC9iX5nCM6D5CneGAKJmWU3im1lTs6tqKlHCNdH0lW70L4fgVGMN+IDoP7ttzuLjGEDUZnRFlotNF7T2tvSHCWvvdf7bWhgeI/nSy307HVUCHMGA5SKkfIy3OeCARFJLgoz7Ic0eOg0wU5zofAKWjQMZL45E9kGgcndGRKEJP9U0K3bTwBBoLHH4LyBDcVdjvPLLJujzT5oHMQwNS/Z9ILZeOKuhWMjprmfvEDWa57egtq7YqtvoCJoW9yRsBIztiGw0LW33sV0zG4tV8pwQC+lNtLAoYqTAwzO0H8eCsHGdNNXhhyu+JlhOWcz9CdQdiWWwrXNeqUj9pbJXRzcypz5OeWVtCYh3Cp4J5r2+smf8QSwfeI1Chflu8aL9NGXT6zOHU+w/OfMt3DB7LrZCG6jrehEU2tVOkejmXFLJovtco/8DE0nWvdDEP4h5i6xbRIPGG0jEgS7ZL3hy5pNQvfDY3Q8AesXFA8oQHtk/+BVM2yei2wKK0c6BLJJsXFpDS+Fh8SMbVto45RiZiM2TaTdYZMTSgfVlZ1bJeSEccFR6BjvYZQP5QcMFHoT9QQ5G1C2ThRulNYEBCTDshth20BgOkXZc2OznE9BDZvDfc+ih451jdJOUR992mAoIes953RujkGYG2JdmJM/dB6vcwcIf9R08e9pequSl2Yzg/+jzJmMisgJliggmrjg/96tgLhzeIkk7EmJZhyl2XfeYq7xvpLUFKJrIgkJHYwg1MOnOwE9HzflAqUWmxICkOvACzCzl0bQ5n7T1AB189ktch68ejqEi1HI3FCMdjvobYmGM2yQKDenwL5xR/He65dWW4zi6auX3z3/vYzED5Dh9eJdeW3RweHr58Pjozd/Onqzun2d7ABg8azI2DxqOcd7+bjx0uzvLmT1OK9GxbIE6oOaXpv+do67cZTFew5u7LYB3uHw6dGbtxtAz5nnbpPC5M2rPxw9fbu6ZU/gipZQ5rnboeeLV79/cfSnoxerB1BnOLdJY1JLrrMKiJ7jUSTRS8MAa9atDUlU4tVjVqGNeUuU331RLFQ4AZ9IhQU8muWn4fEiiB2BdgtdHkeXEvMDLN4NKwBG7QuMf3GVISWGu4DcCM+UWYjSKxqqV4t350Xc5zBN0PwgOdFDPEV5/BAsFsjtUNkFpsF1T16ZonLlgZcL1KQ5HJ56NB4UQFA2FWtf5/hDaix0DJLG0f/RlG7BuFvOMrYS8zvogyS7ZXXx8NwcWNw+1+BrqGw2rtco5g+rizKfXfZ33KpFDoiVmQFr+f8gOW2ZQsSSe0sBuDr/397+46/2gvx/j/ceffFr/r9f4rNl/j/wc1oUxbSSB6Vh7oor+UX2pJJ9TxqbZTdD64Y7zqaGrrnYj8jFDvPxkHKJgTMkiIWDJ12Ih1lWA2qzn1ajPB9i/rIROMN8zp31jZCZL4TxZYap1er/vchnbRpdf3RR5BAMAdojr7ghMCvm7XmGvVlvSBmFHSClu/Vb383mRlAHH+0el+q9/7ArYpw/F9uyrWN9Y4YATL6i/6yb6A4HTeNQfJ7dqOTX6Ri9/7KL1Ac/wore29dQl/0LVzjnwQeJrVq8th5LJHyEaMe0M5w3K/0j5idHw9P44Xfp3x3SYvgBGfkhz89adyKo68ahXNpCMnJPGBahVbtjstV/wk+d/i+v5piE+v4SwCL9f9xE/x/v730Z0v8vHn/1K/3/RT4glh6zvCKZrwUFhp8RvUduHX37IeEzcM1nYMeJtypbnh/MqEzzM3mSleWskB+GM7xQ73L74u+VEe5d0lk5bi6Wi3wqv8w6gqrI/syu5t5vyS27o3LP2oFV+bvw2MK2DSv25zJfLCA/wkxSDBkQ5SXG7rjFyzKBFxk8s+0F2F+jQ3paGQ5OwkNdownjHGjcuL9j5KXfvzk6Ph5+9/zFEWd9bbkdCN5RWVW1NhpFiuMIOpeIczmBPs1lJZ+Zsj+ks3xi+Fezlj8cvnz+3dHx2/hArrhgH5Zhs9E0w0Qak4TnoMs1bdyi7tfq4DB2B9x/m87wrREjrnNKH4/aqnI5B10Szrk2I0qg8ncjWhtuXE/vD69+fPPy8MW6aVJFM9OhrWnEvWPKeblvtTHQ5WteJD9Ho2h73uCcK4UIbqViKGGn7RdC1YCbNKvX4DLiii0P5CqhzOYZG6cZfqOfvMVOAbRkroG6MyPgEPMkdxWtGSijv4FD9lty/KTZHHwz+Ykedti+YZyQYzzdYaSsnE3JHheUfF27njIpGcRVeos2PDJXGIYKPMJCWnBjW9NoddH4vsuTH2CIzaa4b+KYI2baMFin/ZTtRUplunPQdqfqNWq2xVQquKBRPdGY8L6NQoXSkusLDdRWctxNHA5hPYZqB3MxBzQd8nsWidpJkwETRUOj00UY51K+c4hd59buvcCAkwNHG/tGcrys5QiyKwYe34vwNQ4kiBSJIVQoSUdT8F9XVmF2mNQxnzBQEfWKCmfSp8Cf2qVfPhQipMD93yZEgQuSQatsdTHMG0xy0FouJr3ftDCYyqTOx8I5iPhs1ivyGj4PMH4Nm6DDvsMbfXqS+puV4sGREcgNkc1okz4YQI8IzfXNXuPQHH+dtTrxmhO+nLINxAdtV8ydQOl43IZuTg56+yqDIhx9/atLQ9GH87ZA3fxCIUR+mzPeRVboxJEithRpSy0rcNtJ6ya2OhoJGudmO+sDbLP2ksBkaUdeDWW2kjPL7EmFNeSyLHshGtwDagAu+LBT+Rnv3IGZGTbOd4t+B/VFjCwedlYrKGG4hUY0xxeJw/D9BwNFEWixizjmuZqT6dLlELNJK8M7iDWw2HDMrldJSqmOioY8n9HEmkE2tezdaEgZ1eCbESz50Vl4i2K7Rckezulhlc8u2+RyFLrc09lA78DUyvFJFFWlpBhfl3wWQ3yBcnRheJ1j8zC0atHxn7GSMO3slWXZi4CBr91pqyCRVLWbDIGfwU5rcKMiWgnyTGZxrGZuOSPbVJwteovxZeAco8tjcVI2a1oJkZSYazFppJ98h0XrfA2AFE7caQr2CtiZuL2b0cg1MrAiyHhJrD3YVAbXZgvhiMwCTMfWWwPiYrxrdXh/tECPu6z6i3fwot/vdzoRroVaIMz6DC0qN44971aWIeJCSpFjT7U887htvDyqUBUc64GXbPgUhoSrQsNqPWQ9GQ1P7SMk2lSIlDXk27iS3XLDF3W0BNhFUxhiWCw/m47HLiQezhcDCOLWGtc4K+cspCMRYYuy1rqtWn0avubMpDq5WldikaC4LjCA4ZeGW1YWCHhSkdnlj2+/6/2mAehoCfKyWDwHeg1a/2xMJiEKzoRQGtBgTN0AYAxty3BcNdmPBRYMQd1vzxa6iQOCVJeMQsptocKuugNNf6C/LjWrYvzbowJx0cNC+hNj3ya8RRGKDsxTh/PUEKWuHgYc5AbAdraSCjY1pp4twDAHDtoF58WyQkrWuffVUlOpN+MPi30oKacwkhYUzuMr5bHSqhPLUZ8RA02vuk1rhTaQkZUi3Y3hZua3MBJzTLSlpYlaOVAS3A5thjFav22SJGhoEPGMghZtvNE4iY5izGqAFn9FYfE/WMAIiXX++WS2OwJ9vyQ1vOPg04WyyFJTyK03VMO64h5F64R8YvHH3QNYcwX0eYK4inTa5LNxfp2Pl+AK5niSlHiS1dPnILzMA7jjRnMWzWI9qAFA7s4m+buQ5bIxBoNMG5xdDarAS/yy4RkcyUHjynObttr2R2OkeVu1r9AacSIkbVuTLt2NrRLpRtfefJdF5qKqGHHhobJj9MCHDXU23xKRnoIqtUk5rtPnSUN21sZDghNCkB2VWJaX6tsmcuYuJcaXVlJCbhVQ1SHDAjqvzXRW9dX6KKUMD0xUMttCWKR45P/seBjfJXzJw5aXfNosKqxJvF2ejsxAxuBf3DmudZCEegXCSSm5RlR0DXmyMwGlLjJ6Cg1bty7U6lZQvo6UZQD6eVw3pQoaShaePozyibCrMWVETKNyc9aqDS9aLqpm+Rgu6fu0xFgMl5XjWsCMR7MLVZEYuQ1yW/LJVVFAqVmhTWaqeTrKOO5XutBergi2oqryM8tZqfZJPStpctTp11FMPgaFmedNOtLNFkXwddqsfjRFyNA4QOZa2FhTkKCtAeXXIaPW5NUxCg0Y97m2C7I+Xp/JHmjjr/7Rfz87+lM34R+vj978YH/88OL5yz9Gru5RWFnFn8VGiuZVxBagAF1SwnoM3g1QxxgG1XICR/Lw8M3T75//6Wj49NUPr+HKi+5STrDPdqu/SMv++c8gZ5t/O137OPbMFP0Z3Qpa8Md70WJzvO7OKTpj8RVTdUWxk9mOOCfafmaGlpVao8/KWkvpWRXxNTnXlu7KCkzaIKg9ibDjvDJ8uczw+PWrVy+Gv/vL26NjuC3ae/Q4+Qz/OM7orZGO8Rgq4/qRI5SlKhKwWB0CcfoWVrpimZrFKVSGrT2EqPAQCodnkXplxqx+xUXVakV9lsCqPgmEbaEzitCQsjBmn6zbsSpFhprSim1xtsPtPvOuWvtz5lDWBjD4OZ8Dx/wziKVjIGxt97XMflqao6CyoQncK0O4LtNz8I0B6Yv7ApIjK1eZuuQqPb0le3XgYBK85INLaLwyQwN5S6xQC0KIXeG685gVMqTsTSQsejLP5xhzsDLnZbbo4I0JkNEMQxqZeV6dTUlYAHyFPjXnQ6vzndU3sV5tJNaMhvmmjqyfLFlwX6Vzd2tLIq8o1Vh5VpEDlJVVRkzHOCY70OVKl0jBQtQdKwWT8bJa8CAVIiQu7CoY3VOSEuvYTGBM2gYo6FaYRpRTHehBdOrYFa/g+v0kelNF+watfGZoSgvs3MbLuecCqPEUPoFiOBTdBZHCfd5DF2GO5YCB6vMF5qFZFDXdgBrZAVJRppkiGOJ5a4fM8ZUsHc8h0j45gbgUGETPeZD+CdpmKt5NgG7Dv0SpoTf43vGDB57/TPcfqLdmhX+KLdU1UghMpb5zelGLnQ5f7cW09Spm5amA1EM225dDujiXkE886AwGArkwjLwqg0APT+2I6r3K3/XpSh5vIEJLvHq7M7DsbY/wGKAl6ULOqVkSPWgtnN11IlXqdPh03WmaprAWCnv4jF0XykMc39I6i+D5vannHTUONmmHhYeQ2vjlDnIS+SCStwGGayI3REp6gojT+9aLQIWUhkk0K/vShRQOZDCgL+DVAc2fnLqxs0YLBucuTu68+q41YeqlYoT9jwxOchlwO81rDSgNC+x3/yD5w7Ja9PJZjzJesfWU2WTXRT6mbTPO0ChkNlJGEdgBFbaHZcO87Pv+/1SL8VMeEqjK+3TIDW+IW+IqXSLtkzHLVytnD0415aK9100sAHRx9qNs3fxft1HraadcKbMPYnCDx3yZbRry8QR4kIHYp9EK8lAGdkK4lOgCSpX/y5nK9f2gQFvLnMipwgDYIq5/TKzrW3GxhFMfU9Cg5XWEj10hydzm4PBJXVjJlSCh2VwsEFknCCrKCuOgSDRpBpaJXPtCK57kim0pEICn8YCrL7KpTrlOD6ssu2zvaU0F0A0IzEo2iX0iHKoekN7RxXJ2yUl+yvY0vTobpwfcIlCl9hNh/kHF12oFO5s6kXgS2FhkBFzqIntH3xrH7vb1bFIojHubls/Nk1CkRZs3Tp+GSdowS3ZYgBB/r3jy+LHrYJV2hgjowCO/4F7Vpu8de9PPxB15NlgfRBrPjAhHMeEWV6eRhbFiNkw37Rcv//j2L6+P4mXhoOcge9h8XBUEHIzBLZSAoZqPwfGkh9i8IJz5s1nLNfz3SgsYq2zBXl4MTVbD3YPdBRCpxoy5gcmWNwvZjbGXoV0YfHDfCHl2qjtLsCOsj7z7xxt8OMNPsTVdb/hJNpTdZJmLLzopU/6UlRVbP1AgQOLp0dEarpogal+B4dn5ytGzj9gRWOYLCEpULc9YziTDUbARhTOKY09UmUTUucoWKUbsQqPGKd8PMvMjMXZpmBBaRbh86hviWbFJsTJfxYBvrOBTebFZLLSRLdJziGKFxroU6pPvRZHHB0EDO9LGw+KEivnGfIvimMlFqO8Aa/UwBrJeJPiIgYCUJUEssK7I2LYaotyI+TKEkSzzM7gKpwAHNpEPL9AKe0zbGyhb5Pt2zO2DRGxzgYF93zLI1TpIvjF/vjVseoBi8CZ4BKVwTc27k29wLPpOFOb7LRq3nAZOurL+dfddNpu2yTjhxX9RsksKYek0zYU5GtFuygB69cJIqci6BFfrkbSm+i7VLpxaUZtnApcXFnBWuIKk74DQYikdPaImINWy7c5WACuIq/niNr7yttjApx8OTS1EQs20d1kjpbpJzWo/qq/+xNay6NRqxgi+AX1c2Il/FsABA2WQB2hdM0Z2gGuumdfXm7dG+Q7vsLUTNlGvWkruchpfa3NNgVY9BIDlBL/ipEohJAgtM8d+sMgQmPG6KTGWDzdcmtDjYNUS6aZXLZUu94kMnGt8vlefDzQSktXSV2hMHLcV5fsMpyFobv8BBfn6GGtq+IDYlM+WdQYMPiFendCkTs10cFohIyHl/Ss/8THZ1jXhECVy1voSGN0BjkmWGH2VLsscuUZwcR4iaN/D6B56leROraWhx0gOeN/uuMTVdKsNFueFAQhR505CPvPQixB2fRbmCyxX1XR1cUMkaQJP/+bNsd6lQl/BeK4oygaLOwt9KGoFNJjWuFH8KzopbOdR8FE2/6sEjIA3uBeXAAb7SpcH3W+Dd8CdhSWHQOvs1GUAMSkpAh3HOWECVSQDTFxQTYQs22qOyZTDNLWHr5+/0lG7LX8K+zdiY4tNu52L2XV9I7nQFq4bN9wWk3Qd7DocK1FbOD/P/t6nHwo4crC898DFPC7UMN/a+WR4lVcQYWPAd75e4ToLDBXl6ZD5kHWtCIuMqZUJ+K7Eh83xf90p83HIxVeu+bs+6AlRpm3joQyrVLVPvAP7tNNJPk+WcX8ir9maU4e148Ab2soh5pYY+TUJn2BzaMVR9MLDS9ZxhJNnPt3ycKWSr/E2skm49pGx62WdJ4NJRHbbYyNGg5itzhNpx0/CFtwXBcLeCm84X02yCp1kb2i0QtZa7ySPy6Qa3DlcxuGDk9oOOd18gNLqCe7J0+TfB43bcmWHXG/trlw/InL8GCQndcM2uwAR6zZcWkodNpNh0p4/PdWzpRjF03bsdMc2aIHJLCy8wImNV1mRVW6DIWfGNha+I47GLLZy8DZEQKLTUCRmY3HTKOfbQ5cLJQpHe1pJ11jwe29luoO6QNdNrJx24KHsB78tsGwnKlYTaruJImXYKaSoh9vewSPghktOnIlX7ZvfnlSYanQ9sJvdWjgZBhzsPp+MGm2zkvUlIhcCiEFp+GfQRUKYdUq15ygQR8RWcQ2ROMIFawN32nQrA8pPeRS/T9HazdoLwkYAzf+aeCe/fvxPLf7LJL3MitE9Rn9ZF/9l/8nj/Vr8l/29x7/Gf/klPhj/BS7fITC4Y5YkmWHXxmOHx8sZmBnhRdSdor9sEsUFCLz9flvVorlwkBYby9aLK9P1cn9LQsWdB8kxxAGtYF5gbIRi+oiic9OtRLXwwqW43D18IYKRT4z0VNlMEaMyny/E5I+TG5rz1PSFOh0XGRnyekCuIwdGyQ82pkQbcgpL5y4AOyVDwmiQ3VDhYToC5U1FRm1/OH71EmUUw6Pa+xlD1bkHjPtNh/lZivFD4IQ5wwYhJ+/XlHeiGHU5FrcN6zxJ8ynEI7RxDgBmfKMTXAXRNDnuyDHCp/JUNGh4Cywo3E1Rah7OC4IhhWy0RPhF95poFN7l+NDdZJqeZdNKDO+qrnddZU4stEFsd/o7w6cvfsSQlMdP3zx//dYwKWWr1bJB7EazxZS4CtM2yrldxLUdTBJW90wItR9DFH+GQ8NtQAAzYMZvq775en2yf3C6A+OHHETm1cne6Y6dCAabIdxs7XDMa5b4aWZkRcSzox9o5lueSzYKaJ9OcEjBVJ5D5MtyweqcXs92NdCWBnoAWIfY3wHmpj3hWJrZNNZi4TVkx2zKnXxxsKpij5ajKL0G7DRjw5AH3VbHNYycUNi4bpKhZRjyBdg4qYa7aHMMrB4JRQXXOi+L5RxW+aSVznMriyipwKwawNd8xdTofjnWT5GxkMQbfP/B94EydS4Nj2paxYiFbTCz67eM2E2dm8bpC7fVhU5EEm6dnrQwdfSpGb7hiK8q73YFUA1JQuekhW9bNNjepCVYQs2eoAn8c5XiACJqu4g709uvzZYEIsFm0cUYIq/qa2BITCCS8qU2jkeLW9h1ZLpiKNWOGQMhvsFypBJsRsYXmajz82Qz2GwGLPC+BfC54XXH7dmfwHMIbn3Z5ScvXj394/Dovw1QkJA1NohkEVtMPe2p+AYraQKB9XlyQggC0OywrE+JGBC+p6AuIW3Jmo7VWQGipeta4BncknGg/sXoIqvahTMonlVa6gVEspaEPpbq9+9bY5CxWuM0uzKLnaGDxHiEj7L5tLiFI4pstuFNiYVL8yaHeJqL1gdUIkBjXWzSZnqr4TJI7fBExtLHsdRML5yS3O0ltvbFAziG8dB0faL7axr3mqJrRkvzWgDOhIV8fILjb9ceYv6IXs8gjyOjVUvsX/1UQLVBmJNwaIlbZDj0zozl/QcvsjuqFGxdLItfHXEE0OJdae35Pu37AQIW34baPCQD+AbpmBsjXh7Ic3rG2OhO0QM9zpOCeEM21paFpJYKxShhuowQozun1PgEpFJ4rC5FoAHIuMWqE41T9qxDCANgCUWz205gSGuahNRUncCEzEaDRSSxGjAsVC1KcyLseGTLtM5Ey8CqIh0bQ8OiGh+BpjRirBughQTU9aXseZnPFm05hdTpxq3hdsCv3jkHtALtAvR5l72blzC0MusbiX4MCFS23rf/2j/5Px9OP+t8aHVtU8H52tlkqHy6QLoDDnby1wUHCbGrlxGRJJUZDMcRSDuzqbVSrhB792l/aSpQeUQjnzQCThFsKAIbQnrS9ne1wu+Jbhky9yInfzF1jpun1/vwzG5VMEo3v+lMxduC6gN3BFABbQ0aWTYddCWkdtizSO2dIWqe5qdHH5RJn0+1LGnSMAqrC+H0EMfw+KGlKa9rVpayruRWyA47kCUB5k+RBq+NfDJWEaDU8RgEgsI573uPzgxvcKnQla9cB0JDVlAL1U+3YaYEndOOU86y8tEbB6inuWMfDK4w4IqUMRjl91RTVAOG+9OsD6+u3R4km/dQu9oE9Bl4LdQvgQjlDffpbmY2WDT4RG0jhIFhH1bVdacRf+PzBurKsFapWrl5dkfAoQW7VzNiEWrL/LKZLzEyy3LlhLdh14gBDS7bLTFpc2EMTgJvLEUoR50dkC3FNPS79DJ7NYobhT6H8wpldtYfcFgByZbi9C7WHtMUJ2kbOW60noioODpm/Rf51Iue9NZqKbQvIvlE2txK1p6uq7ICLch4FL3g+SLMRhljPTaMZr0BJnW/+m6QykTDDdGrLif1BDDAhWF1kZ2lkBkib7p4Y4vpUrs8XF2O4XvoHRQz4pLqcHUxagU2Di6EB10oRZAGPiJrMAQcF1P1RxdG0NJNFECZbdwMWE3zm9J7/V9Uh/WPh8+P/vvoaTh2MX4c2NTXoebLla+hjOpOOeaip/dHxdlha6W6qizaVGMwCoR/YNoOK16p4Q1E1NtimNiGvxvi4+2qtGEquIEyvvIWHPzxKAk33mzL7bDfnWFYIcbBEdiISkwebNXG4kGSuz5IAa5TLUABNLDe+kg4+tMIYhMtqaMzTWNg0BqdWjrEW9J6eMgdjX7APWLxNbY3zYjKyK72AAUoKK8WZZZZpPmHuwYA/X9Kh0WbzoLgEDjkI4KpbbVeM53atLzsIYB5U3OKhLiWCLOSVqjxoNW4X6yxBpQ/wAi3Dd1yImD8hWGiOAKVHKlNRP717eKiAB2U2WqgjIJjhXS/pAfG+AwCBwRCH7JIYxRme18a01A3HATLOa/CUzm+ERX6FkStB/8OsU7lP3uq73cU+0tPIVUu+KB0k0C77FsMffSHj4zGcwf3/ibMC3wcA2PRQEdX44fhBllLRet4mFilYiMu1OwKVs8pNh3eub4STSaDh8HWU9GXN+HVDRFsurewRuNkMrviVsc/Fza+4Vl5QJ6EJtae/ScZaBA1PuWotDY6A3tXuqsBzjjzmYo0aWPVxiCktj2e70+x5R/SeSxvNDTqx5ol3WRM8hbp3DYYiuOsYsGxg2jOz+HPB1HI2Hm5NR83io1gBiu/tIZo/P+sfUPt/l9I433nf1mR/+vJo3r+l/1Hv97//xKfTW/wo7fun/FjlxYmfANSzFQevjK4dgy4RmzAkc3aGin7A/zoJj+QESCXkDvFsBdDXMR30n9huMYxJEbP7MBuSPhHnXeXFNJcFigsMCYjKQq8KDwc4tMu8CXqN9eaFucchodrvSjOny7LqigrLiF+i1JARa8R8C2nl/IWvg+R8+nSdxLD+Qdc1+CNOP6iVFnd5Hfmx5sMqtP3V8vFqLjKwixs6ZWDZKKsLZZV8JCODoHtjAKvCWLQT7SpMM2hRATKHzyPzAouzRNW/OwMxQjQ4NUgaT3q7/W/bO3szJZTsXTHRApoNVCxvQDYyOFhcptgOVJSB8yGJHYsbiruk+IElfk5RukCzWZFWdcwFMlVdV5LckbxSppQMqiCHZpj6jqb5ZCAPCF/RgrChWmmxSQiAAGMAfCGHlvzVv9yRcHpFz+HavTfboP7OwDW2X998ehRSP+fPPryV/r/S3yAS0PjIfG1IV/rjH+I3m+e3iLzCUIwO3oTCz9CF9qiRPsoymC8YAaZcr4vidPdMYJgRQ5SZqfOS7MfRhQSKDV7G0bwNcmAZF2/oFynFGBtmp+hshL74A3GLfeTQw78SESZMyPZUYgBs6bcYCC0Y6RKsHjCfpTO4TP4tcDMSKKBFaNf7FeCZOExUUFhB6KyAEJgCIsVZXfkna/G7RtSYhqoLBjA7eE6nYLqE3ygpiitkz03pa7EgPlwU7KghOVGrEXZ1JCiHdUfpqfPLtLrvChJfyWZb/F2yMkqAlF2fb1NJFHx0AgMaLEPuZkwZmK1c4Ph1OzioJqJIwMwJOSaVJpnbTUrOLhrtAvb2XlFKn02OYE082e41GcYi78sqooatYkYWCcMYViyqiPR3eT+ArBJBqPw4z7tE80RMAOM8HPFPUheqqBRBAceC93cch6tkqRZ3CZLMMvoqt2Cm0PMwQV3sRPQ4kvOZtgdw6evnh099VJVt9alqnb1JGSX1VIdL8YGB6AAouLqKJSWIpjvSCuc3LdiiwaaKXb3anEKOXgExkljFL1hnxBGgGIJO0TdU7U8w/Fmgg3IFlI8Qck3gGtsBpOXBr7jrETzRG4f7DjTcwj8yOaLINtf8lltKrA+ipKN05nOqqQZOr4Ncx7gIPFDLIMcXg+FGbveAD0ahPE0M6TAnTJuSjhRV05gmIOMymBy00bvImUAYQhGm/MywJ+0LNPbTngFDNrjPjXdrnlUhqoVMz81Y3a+cH6I7ICxKrBGqEuAUF8qSQQbrRrYrNR8+Jf/tmP6E4zw7H5HSOuFowwWa+txhsFQ7UZ8hbSANmGwKbfajURT+kJb8BKioryeFeVMHPPN2iNqQW4cKMUJ3WkaoYFQrgrpKZWnPTgrZj2KVgeGO2hGBX64hvOuJE4uHkZPHidnkJnZkD7y0acwNGBtxlrcyIEu8WMaqAeT052GPUqqrUedBmW4wgOh8tier9EfMgwH8nbtvq+53+go9tyc21RSiAMieIVgQZ/h4kZCJDxIEP4v05ddlRFCA5Hz1fiOiijoWD/JTKJJ107M2ARQga5wVBTocQqxwf5Dp21ExaivYUHuTmJHg2CaujqDQfKooYIHxlev3w6fv3wGZ+Ij1VAYrWvdLGlOjWRn46VXZIHGO6A/63GBNn0EFz5y6FvQdAd9CQUqu2z7EcVpeAx0jeOvHWA7O0NmGMVfPKCjfcqwEzylWxs1Ti6mR77zQdLCi3zAAsQGWnPiCCldi2GLN+fVwKckx6yjGdDidMEsokM5p2bIK8suosSQcrc2KdOSY7BCyDXr9CFVkgkao5ylo0txH/WoIXfCccOYDdbyDdIWiE3lgcMgTH1WHj5FGFvGLV7KIF4GM+B9+OLiym4O0uT9v5cfzOn1bk5iCrpBT8AW9+vEj87rf1rokYJAsZeB9da7CdxbsO0CArbN0+jUzOUIw0Pue0V4TVERUYMn9d5P2zUq8hzXtyltQADNbaGISJVep/kURbb2vQEx2wZWHpy4pGal2D60Bo9apXrzQk8MOQm3/Y7YSHvqhFGEWTsG22hHBsSJDuxDRCQHNYjViVRZmadTiBkJQ+GcjxLD27RwwIJT17JAmNwptdrReVlc56iykaO5m9QpLjnkmw7dXVmNzlIZTxiKG/yI+RFpC73pn0+Ls3TKWCtEQYkrrFFfEfcYI+wiBV1BGJpjTiNjTA0A1n6d1Pe+ij+Ng9loE1vM4P2If8wWBObsDYym8nZfrlVjNBNWTGGLyoJLgcqin3skwQK4POPheaDW2vhUYp3cGvyThjwSxF0LkgVdbiHzrpN3o70rvnPHsTANzEsjIJoF0eTPVk8wxmRkC0oNBxorzCFD6sqzpYrovQClKDwldOJQ2JU1g6jvDn9KK2TbHcdYf+QcQ1HWaURQNoQg/9k4B3tPyumYqcED1YKblnyxbhoNDCexUBAhmaVgLGXgZG3TIKET/Ey+TfY4b4Xz7cDC+UjbkVJ4g7PWe3fwoMl9N2lfdpPrDgXzWF5lJcRVhggjaIXfDlUikjnb9Xa5USx+cGhrKRISpGCm4bXPgKQg5SO7ZYj/nHzOC3oJX8/A/MGr6gWV1jC7ZoglvWQ/MiLqEmvWoPSBukBBajWYQekWAfOJG+MD8jIe4tCGQ4oBDztjdp2VEurVdJVZm5o0Ae+LH+hyd2aoDn6twoW79tfM6wUGF1m6vAkMCPhPDtZTAasWK+ml3QyC/VHkh/Al2DTFXXehwuOKH9jS+WxUImjB6g6y1Y0WlVWXVglayiFnTpNCxSZk8cjmns6UvKCwoSQlWiapaKqiy7mFYNm6khgJ9NqGAp4Vy9lYJQOBE6OYIBFE1Q8EQQXHBS0kiKmsFOa4hbkZzwtr7aojRcGJgCcBnFE0ZK8Qzo2KGXw5oysRuBBI85n5wZO2dQOgebyVhb6RDyFHlIWQxWBMAlhcnWEOFMRfrESovTCdpRg7wMDmCkIMxk64Q3NSzwCtCxxp5Egkga2LzrkG+2cpCnQcupnIdplBugGYhFhiAVnzEOVsOSGncQtt7Y8URf8aJeZ2xEcjCEmPjX4+QO+u4BVEu4K33w40VCNk0VBBYrNMNz7Z9MbvdSnzgAQDy0mdQOkW/9E3qv9an9r9vzVo+aXu/7948njvy9r9/5df/Xr//0t8MP4L3RMgleBo45rxLSY2o1erGCWAIC1lJFt5IQXYRYmStkDRNsmb5liHsIH8pNDRKeH4OmbLLnLDRnLlgsfjZcYsu2E3BL4l1iNoO6urzt2ufjnLh/2ZpfOfVl8Ll1ktNo38lpjt9kEu1lgQLEFn0ZHfXSxj+CLIhA5ff8Y4oOSdafhR8kLhSj8ts6UNhGMkDwwQxsMbDelB3GDvqYTJMcfZeMgv4S7bP0vZa0Uny8MLfWwTfNSWpAy+zdBYDKK22tjCgkA5mDmjiYa9x/7h8L+Hv/vxu++O3hw9G754/pLzI+7tNY3AJmhEd2OwzWZjMxRQAJfwjCTcUv0cvfn9UbQn6Oj74sZMxEZaTnHEmUpkf5PmC7F9oRFQclJzrmWjy0ritfEFONr+2dCq4oA3fP3j2+HrVy9eDI+Pnr56+Qz63+t/ydwgSQ1DtC4fYtIV97VBpLbvMZDmm++efvHFF79N+BoO2TVBJbgggpit8ptDJVe0SoZ/Mav549unDZod15EkTZO+WLylKyZiAYUcJL0e1sMEUa2aNljfU9vmu3aAvtbHlegvfia7ydhFkRrnQNdhC8k21R3IVuovF6P6RYOrZpg4Ltn2qoAgOMEVav3HX3r/cdX7j/Hb//j+4D9+OPiP4/5/TP6n5UVzcA1aNcn5EAwIsVEDAiPpU1jwrtXlyG+sy7b50/wqXwyRM+QnhrWdDnr74nXAlXxxxfW+kYYA1tbRc+cGITZLzqafLqsqIu2WbqPpayfgQMEQmEMiYcRcvm6CHD44cMVkSlFhNVu9HpVpuUoCpJXV5qoCwmB1JwRona8cHnSCNmivrW8IUV63tnJvq17UGq/uBgv2CBlUP6q+atXh2epGXTkBXrQUYJ3qE35LZ4zytppLbvvC0O5j8A9sTG/7JhtlubhVUrQJFKdmUQaDJRewSMMvwCHMySgIzwSbvBPdYUDsu9KqKvwS8YuDUqEzHzwDr33z5/9v798X2ziOBWH8/M2nGFPZBWCDI4K6OKEDn1UkOdaJbivKyZ4D88MZAENyQmAGngFI0Vp+7/M9x+/Ffl2XvvcMBhCt5OwKcURgprurL9XVVdV1sV8IKgyebpCupdMxmwQjOdUkiURGuCt2m+xabXzD5ThAx8QOxOyAwybiZbF0Eo9J1x98H4jpCUPgZAyqt8G0uzJKMYOsa8osE4gU6syPvDQFGXMMvaCuWFbP6L9tX+b22XR72MnOc8FMdHpxCUfcstv5ueyQFfZbIO8zeTghK4Q3K/oYJ2s6OJLBYLy6ACvRHwxnLSuwKviyJ2gnAVHM8htxdD978/o5BSYXmGt4do5PkPl4h3CqGsxe51UtHjtcTF+6m6H6BG4t2G4SEBzUs5lUwhIPZ6RctQwsOV09h9cj2hy9JFZZnPxLNWE4WRgwsPtHzBzUj/4Iq/B9L1qtxRaqvsPsvFFCCgRiteAe+sNFAp55s37UxdkR9fQMcirZ73tM4lu4pFLTVZ97tMGCjgqb/qi6+8zQwlfF+kZktK9G5XmjElRokNDHWZc4+p80Ucz6VhdJSZgjxSDuUkP0Ac48bOZven4ljlcrgdNfMmkVnFrSTAaKvDOMs6AGdQw3WFlJxfEqgjl5wgHsPu+AUuCgAYUwSRAn4MaR5C6YC7zM0ET672CEC2lWdMiJtOwoEGInzUg6AYEwdsYJXN18nrARDi+HG2VBXnlayh3MXMsbgQilQNFfxV6vxw4D9c2ZfY/fONzQ0BRtiGyN4fVYwsryPC2HXu97bd14AbeGvDm+iZCwVX3n7prtvCkUm+grhKb2iSZPizxw6adBr9Fy2qXXxJ7hHEjPT24nNE8UFsi0Xa1xu1c4C/GI3PUz5wmTRApEGCtRdqhFj7y4tvlngwQs1yve/jRlqCg2+nAv+hNE+wMMxzCc1apYVkqclFa+mOVcYT1sqTU6oE+gLrjRawSlcIUgp5rDy6oxjtCZrVC6Iz57Rb+hqySXi5EPPeHOD68TyJfIxgiI1PEP6/ncBwhcjTFjBtrayU0pVr4iAUQhxkT2eHrNiGF4Fe0kYvQGXDHHBnfRFgdHSU2xVY7gjkvJi8jexf5Z75q+MG0eapLWdcexDyfmfp85QmChL4eyW+CMZY2zF+y9SllhvrwXPeFc4bbwItkNPCbLlI2i2DRSK7+QSeWT4T2hAFZxYFwU1xBMRDIa0isQ7v3LBeIoBsKVnh03MumSkzD5jGcqJtc8iFVId3VkrGtuQR+B6pZn3flefMgmYbYuyUzkXOnYxLqUU8Ho/1F8FLNvdSMUQspkQ7kwhBeTErhg2X5GgxVgb62AIX6/m/pO2KSxmbaR8tQLWDhJhHfShVttMx+DRXvqjnomeMFclpkW69zl7+rudABHapgqyudJnAZHaYKGJRNB93KSw7LFaaJgWNyO5kuzosSDc4tks1M8oB6O0p4cAn7gRm3Lzngtm3LOkL0NlHOadGKJ0bWM7qi0m1JaYaZqlT7rIfu0VPchFamG9WrDT2C6bWU17CvsbMUOIbzrcSomN0aMqedOZAhgsnzWvW/x7ZbTl2aoVNJJwiW2BdLoBNwdnlVo4mW2JDkyUusVa4yNpflGOhQTPDsFawd9RItNeEK8nnX5eUeMNbfmL6B7Q1unVQ5pk5tvUGt2mr15pPBNBy6y9JDjHK/axd/uIIR0PanPQxkPzkJb6FP4OsLip9HXeBfKj3sGv8MdTk1yF7DuxGYVl2a+k4lp+orI2uTJgltnuWDsQdVuKA+I7IiVX5kFdT0SsI18/+LV85P3T169Hb998v7983evKRYpKGEgiEvZ+X+6P88+Prw9+Hn28wz/eQ//HKt/et1/Pf45FoW+6fX+tfsf/3v0zcGpfvm7jiTGaJw2VooqrUJ1dv9bKFdZqmqt3YLbCgoflzILYOq+MLiQcgNFXTp7ppAXjDEL6Uz653FS5dmx4ElpX4BEKNgfMPpivMZghtL7FMwC9C6YZefZyt46qkMB3X6Nmj4hlKfNoC+VctDs96UxN3UKtkme5AV38fteX4rsUuIjSKRCrGTuGW8u7d2FUTthf3j4EOMrY7mkbhIaxneeEa7iTLmPfTW1kGHuDLxsh1Q1xrDplRGPl18Po85/GMF4V79yTnspieAb21Snys6BHz0Y6HYg8Ds0dcCRJgfhBrtY9Wt9Z9e9EBuxGkIES25ocPzgVMz0QpyLoLg13jw8fnwq2alFgSY4hgQl1mJJWmM5Ff7FA6jFnGuOX3u1VxjmViZ4fQx+2pVzjH6qh53e6PgPp/EctAHdP/TxCWncTtCHjK/3AJlxZ840ZuyNnz959/KFQAPQdaqhiLE3Xsf0o0PFeKm20lnXlF+UPTWwj7TJVVGSCfFsDx8IUgumTB2NuuTKhuwfAqCDnzxLIfNqSZIA7ZAb0oFYwJnpoyS1eKYty3SazljFsukAAxtjcJ+DPhuNsi4Nt+zGEw7CZosdKCd/L3xqOBpiBUwIbWDdVVXJueQkSY2LslknMnTSvODDBppscp9cPHhvR8eS6Dl5JPdDJ5TvqEUjpXbrmjMGRm3y2BjF8JJ4e94zcJW8gfu0TpjtWFHso82KEp3LMVBlxQFXWLLMTWwElI2JS9WKW9YSYZwxYlP5Ppts1xZFtWJi7k4Aa4LP1pBw2NHBJFJ2oQv+iqUadEuCAUgmriKzQJRQEMwry5QQ7tCJpkijwjI9T8oZ2jDy7roq5mvtZA+zGxNr8l4BwxACcDEJJTAKJyI+BHO7SiGtMnWVyRe72RPakFIDBXIpjFF0AQTBzlJSoL9j1hlHYDLvMA5ebGRXbEblkzntOlOKTXRK9aGeJiFwjYpZZTAVSq2CYIREBSmGJPshFQiV8v2fsZMEzQCUMeh0ZdoESXxwLqD5imMYjbZk+7EzY1Sp0tqethQEWEl9h4z/PbI+igm/s4qjYyCeztWBBkFDBONpsLriz40eAJMET6QYByilPCoMuN2vR9ahbMseg17PWD11tXS6eyhMQcKHrGmk1K7H/BeCj9dJN8GB3JGgA0uJMZzHpuka0d6+TD/rHAWcl1PmpuXwLnh15B8/PYo+LFskYoRb0yY1+B52Jor+bJtplmBwKDyAaS/65bXdvPb2z+8n1oDwsqEOWyRc8+i3yEDAaod6L5Nxjz7enkYQd1UpHcMqP48fcNr5eBv5TQX7zSwt2wqqxNhXKZP7NCfnKLplgYu4ghUos6yaitNJxmvRBoekcBFNGBZoT396d/Lm3fjd8/fPX7+HwF7aCuxbITccgaX/40P8R4jUVPpERgHDTAbMF0Ofx0JkFCMJXKGz0WJcXSRHjx53Obu75R7diy/SD9yA4PAHj0/VfbYeQq2VBqIxKLbPklKRXBUoVZvc4wySARyRaFCAc6RscQLQ/bShbe7ygY1wpjyPiM0pRzgiQ9GeCqSNNqCBaNquK6IEEUdvi4pD00pd/SUojlEbW6GtP9rVg+FmH8gP7dNlMYt+evEM2TE9PnnvQsJAtS6vwMJORXxKKfkG8yZPRCMEWp6FvtQATgO4j9R80TFKYcQNtTzYKaJnh5gPbN20O+JQ5LL174wpoZQeNG0XRU7IXsxTLWLraOh6zehuAOEQn4eF+X5kkQJ/QdNEGEWug5fZcpm2yAZA0e5LCF6E9zjck+GmTdNsHgCtEv+DkdRVFoOlufyc0DGOXpAfH1tMYJqN2uDrirw6HT42UKslASEuhpKtgQ4IAzdqSUYgXdULURkVIB64ACIxoakwUxk4cf/nELLdGQBq7JxndhXO2aav2F9CMjbTduGPtGujbPZ9dPB99LGDpp/H0R89vZE4czpiu0Pc3xEePow84nkcx6d9cBBPIQ7wHwWriAHRSU91a3dJUomhoPLmibM54P3m8PZ0pFA2ayu2tFkgO6MylNBLprzG5EYuBa+5mNNDwIZGHX7QOTVDzLDFKFuUYYlxNutrS7vm/aBqHEcvwP8STDil768kZ44hp8mW9Dz8V3Bpl4VMRmkXUJw4IWtQVDOldKEeBSJdbbJEZfMmok4GvUrOVmx+TU13KrXbt89izng8tJYI11jNpMYDNm0dQUZOIzOnNnulVJhwaWsbWZ5aTdQYYqITOcQCLMlQO5ldJZKeU2dMxJcbsO7CrqavspuBxJraOhaubS0DV8FInHqt72AL6yqQaBAjoh6nmOuu59lpk3mp3CE8K/4GkVliXVvr2rzuOrWHKYUiMU/mQPluXJ6GHCB00jbdAq8Gad4VDHXOe7vqzrcp9Yr2qLZdsK9EL+WVhKIyfjuGBTHcU7J1uiFmMjMgRq5j7/EEyquSDXtdu/JAdF9KVvfb7lv4wBmExVcK6/BYOu0Zu4lSA6auSK4YOl8F6mCw2xZebVhtidGP5d2k4+s4TzC/kmOqg4iPR2agimmEwVPZYIDRxe/+8bSLUljNzRbKYfnZoCQ2iqHZUa1WQc2lJEVk8RwqGkx4pqcWNDyesFVTVkEjcjbr8/OAjQyMgBZVJp8U68VD/37I74Kp3eCj8EEBap5THgraBaZ4r9M1RRF5TrAFPXbijwq3a8xyauctOPe2DwJtAUannr0NrJmpNzlhCcSYKpn21uqkJAYfg2OQzCm3MajRUyk2lefxTK1V35hauRUVDvOlIfU00PStO+5NJ7ce0Yh441O+e0TDr66/9CYJHCnyB7WYbXBP1DXQAfKZVstoGp6KI7ApkQrruVD0VqIQXzqTPE00iFK2RcmqWGRT7XzvNtdM5lfF2Zk9/uigRrBx6L3FckMEkS5HB8Gcsxxywjo+OEoILNIV8fk4/3BTiY7t2BnnWGG54aMSCY49eQCSDTKrf2wBtFFDJeNrkYJeZ29zrEaASCyWY5YGjfx3Fea/E+0NjaR/yzI9yz4MO2APeSD76Ngyh0xjSaaq4rMZClYAtSYDkfzoTEQ4YyqRovnBBGJ8Ycxj6Gvh1i7v2gH6UHU6MtlYwE4XLNr+bw4Z4Pn/YxaOO0z+8i+b8r88evTtwM3/cvStKP7F//8zfLZ0k58Wyxs7DnrYRb2EHAF7Tl4RlVpCRz+uS7+hvokTqE6fiCk6KF6+ymllpfhA8ozhSMn+d4xAx2MvC5xoyfF4EE/A5Kg6d1VpAA31Z/DFfkmwxUv6Ykisq1WZTcAOqCYTIZ5NRhvWbeJqTMC2zmz2jjrLAQLFyItplkirNE0JUUup3bnYDS56lZ1f4AU4TG1j5GtjZowxV2M1KqPTM3kSW6NVb0f7Ysr3T6VUZ86/9FPkJahlnkQbVEQ34yyWyvllIFa1CuSJ9EH64Mw5MLvLz/dH+9E3GqW+ifZPf87hEYTz6RqtazdDDI9F4Qxb74LfHPE93JadpfxM2OcuB2kL93TbrpnWR5ZXzFhsCdhRagbgx+bsnpVTC22G0MzTrIsG7sYK7L+gZOgARLBP6JMH9oaidve/VRhnbkFTEE0EzZtiClw8Qvej/walrFDk4rHbh22B09XBjvDFzAGHu/3MWbX+QTPn9uEzzdw9wWJC5K0KoiVX6cGN0atJUcxr08ui5mxzG/M0r23icCOJkmSma27EP+F4etZNHNCbT6g+y650Qlmw3NqMNslstm2Vaj3ZtspiPd+uyjTJx2ShTJW+FohS1a6eSnO2KlR69FyllMOjkpBGH/KYKRTOJkxYls72eG4F8bSopTQyWRWY63s+FkK76AtEJIQUCYIOVoI1zyDFgaXHtgOqiNIqvCIm7rHf0XNvdFfhlpzwj1xYtR/smvuAIy/PvcadEJ7c+PYNm7YgajhsLpEIcXQFyjK0ciZC5Vg1vMwgeF9CgGHCnOiUGeZnhQaUBcNivZIeNuTdo5P1kA0MX+VSWvCoLArlNwi5qePoSQgae+uoiwa4KK7IJmiWoXGa6IJUr9B6gekCtMj3yYt4Amd1nPQoOO0SgrWYkRdRSd83c5ZHq+vC0NnMCvKPvZAmEmR6KnMusfsRDZKHJF6r+WiK9COWtMtJHDWCGuvPlq9juVjyN5n6XsX8AnRTl7Zzm13TU2x2w+/5F0QWMyB9NXSOEvhcYezl5U0McTPhS/dKd0D0DOJ/U3MmqlmG9gojofp4WUKwFoHDXRcbA44dGKwTqlHwVEH211MQzsh5BFM4U7BP1OLKlmXeFkF7lvMkkxm6VWjQDUsV3pwfL4+9EaRKfUaph4XkB0ZnpDm76t1uQ1lGNY1jy1enwQlVhcdXWXq9eULJf256kZqTBReTNL3+xqTA6jyLah0Enac8c4EQ1dshvhxQ7A7FQiAfcfQEpIB1Y7kLu7mA4MzCK86rRrmqpfFzjsFQMWUmBnaK2WymrMiISFIXo0hfU7RLgZeVjA2SJ8vqgsgcEMx1Liso2oGiP5sgoyHrEg7dVAVUXa5r3F0hVoKeLbnBIIMo9L+BLuj97otpVFV2Wxy12TlYhzq6dMdrH+dryO3K6SdDTqDQXdmKIl7OKjwlT7EKia7ax1WrjQyuaWpOeW8b/p0YkgSBTNLVdcqmQgYMTp7nIj4gGpsaAVU/z7NfDVuNSUpepuTg5tiGdjnxY59WskepdOmHNHRDizpjuaPuux+eRt8++P3jnsxYJJjLCrYf5I2i6dNriNF1aSrj6C+QW4pj3uLtJhdX/qKwPamwdOCnwmShhmoL3IG2sz4rmGdkDlclc38zK0iZSmsf5g/7+qLWpgEaM5CwurG2uVGP7C7Zqc6wcLKuKixaa+OcsQ8u5ezIXoQCTQhAo8tTSjzgEhq3dPAKUGEDRWoeBneGAAEcmNtDrtvYL2zWnob6MZmj9lYs0Lh1vy4jmQlhrkuozSguFxaiwKshocEXPpELgKurcGY4bI0z/BgIXt9bB9m6pDvEhNlUn2wqa8x2FcunA/lJC8w5Jk4DXpNaUeEr7ZMB75Ay6QVLjK6M/O0yudJsBQgIElu99QSPe53cVIGdRwTsxj4gOJGRHCgcvURpmPlOyOUmq3SfMIkDIZVpgUPlVqhoip6GeACkxUjmcYciLZ6mYCxa2eaYmw8qOmEy0juQE4FGPMUk3sUpxpgwy8rVTde/1nIOMZswya5ozsSGwNeGZk4hz/helgHxCpIYWBan4TNT4MUimeMdHJloeplDQmwb5WFRHlZYzzgEYb/naSU12oAanAuY8RIr2CtHbQy5ae4KvuE+agsbuv1fYYA2LGcphmVxMqVYXYyOwR+fn44OBqc9NAowHrhhOByayiWlMYVeV+m6S+/llGLel2WBqTtMo1cuLSOijzr3O2KJzFwVqfYe7vy/YB70/x4aDsWiPDwadAxOHJo/VYSII+OPtSJlkVQYoQeMKzYrL6g0IDirQ5o0Z1Z5aT9j2tN4lXVxKKZaMfaA7G5lKT+53hBPWXC1weQfXBhNM9+jMmlVEp+yzjO4y7IEU2fk9oorAPQlBq/C0giQavSQJtLuH1sC2b2Dh3fRN24c/tj9wk0gSCagwQhOSPQd79vd6Edn8yJZnR7XEB054dBQOGmgnBvqAqyxGIuaezCuET9xsE0L6nBToTl1ihhdwOuqMUQHW0/AAHADUoe1U/CpTTNpo3Wg/46QHOq/U8TsP7z6XP33Fe7PirwjZMS8uEZ/IWDkSYyI/hsJOP+tAr16FxfS2Fi9fqQe4QL3eh6lyXIcnBpSuoHIANIixlIFa0ZD5CvcojdDwUlRkf0cvTF7b22zJO4QKAK3KGsNAE69rWam3Tio3+7AZFis8Nagny1GogQYrCCtrI7b0ydwRrlUlEk+XWhiCrZaAgqfKL3aCbNWvZXWeeNWsKaLPeuUxpz3K5YMXN4igsgLgA0TCR+6OTVUVbWXpvJ21WkRNJvOI7cKM6COkMQviYUNvUF2lO2rA90QzLct2PIbLTfZraLprzE59Rf+NXMiDifgo0Z8J0DzTWYibAF4RdExDCCnPfvKDLx3x+kH7cFWFqtiWphM873oKejdWVxIVyRloPKLQ6WgfgL85MDRQqlalOxCIhdHAXCZGfeOnC/NtZTY69ettDkUQ2EtXfG02vq4FgGYiQ+igPjXjO1pSDPhK0ar7b7RlhXv0hBstM+g30MsESczySbrJvANyxnb2stIlj4odnQ5mJ94AEnPe0pUVj6XmW1+SlgLd4HS2xCc76fzNCl5hD18iy4ipKeNwYMbrqtvOLqTvmokHwstzgZHJTkBW9wy58ycKrMroXCwcpqxnL+l3Y1rYJunZa2xqzEaCXuLe5Ac9Jd6c2PTtjJW8HXo2MMazgubqObZ1D0MpOZrE43Bctpo3WewlAot0A52ffMBoMdtjFgP2NUeEYhubwsji02TVts13ay6JWvTp3sRGQVGR2A/KNOx4TqAMVt2ni8kaUXTDtAVoVmy2CvodYAJbG3UwNpqfFk/+jtPVeVjv4FJUKsLpXuquDNvfsOB7aSnVzdoNZQ12UxgK3yq0bsQjbWaM40j8i2Wku8bOIdHPdNByRl7W+EAjR0TlNgZDTD4CtqNdl1fFHCL5CACTl4+OHqtC+4beTOv6DOkIQWVCoZZ2oZzcK+AW93zkcvLlQVnw8emE9WpPS3MOG9YAk8dvsWFpFr12GcUcJ3abFlZJIiKrNOi0tsS45qxc5u1JHM74sdrbvSw+vQutmRBvWVv02Hg9ErZJqD4hzubWW6aG72jCYYMJmxw5RiqbiRGcO6HewqNfm2bELdH0SvdOXYTuVP85DZ3OIiJ4XJ4pjs4fYOUt02HgCE2Fy9ob7xjB7Ftt9WteldCnDc/pcHOy0atbcs7uaa1uHscnrfR7JnsQHvR91TVt0hqrq7hE+Tm8yB09WNtDRd4GyPFWkHUbAzkZZUqGjLxcBZiFYSFr/HgLo5NSfB8z5Qhl33rJ1elzcFu8nQN1M3xqLPJBY3hDfBf15g2aCWkk/MUwzWCcIixDA1/Cu9g3G4VTW6OjnoHzTF7tuacDvvt0MxZewqnBmVGmRGMxLzODIuIqNhRIqKhELBFtG1E8URZrRD7j2Kvn/0YJGK1wnRfLe+FDesY+cFgDWAUxVEd1UW30Q/QQR9jI8GOwkCUCMoDRxdRNdaOJUFi+aBcyy2N3Fkyrd82cnxOlmSjVyOjR2hJIdr2Dj94FliurZUm2p4Vt6OxZu1ntsbkLSzsmwelY8qNujxBoASalDc1g3iSV9dpaSbxhBhNjDgJa6hV1g9lOYHp6GXcfhmhRkXLxtfa8VvQKpV0C3I4cahLuhDJKjE/y3W5LCozg9RzKdcUDgzsG8s0ai6k6RjaKqItmeiczDpAMabyIj8wyysNkhFFhmxEcV+s56tMzGU6p5RXOA12jnMzZzxnOCgpj19J06MXnCKJWMtxrHeocTdElpayl/ehP9LkuuJ4XC6sTuVC89CyXGMcAgjxJtPNK/UBrigJiRTCvJvFaUxGdWrQPV0BG8hcmCZG8RWDccBaA+9H+LtPKr0GEeweoNd1Kv5j2wbMcTiT2BXhHoFjkHHKqmyBBNpiPTj1AgC4V1OBDbTNCW/5rjX7gdEdrFK5s+dmy5uPulsP/1j6L3rtoXRPEL1vLGMLGNdNjHHWHNbfjZiXb1YV/w7OaLxmEsN+/eGrucZlM3SVDgd22W/FaXoI2Ps/7+IGfcaExJZBcHB2JeK7Bu1qNC+Ky/WScvauc7h9zzFWpQzFJC9EjcnBQ7bOEczu9o63TWOpM9M+qkIWrgdGJb/cV/0XvK965XpGzT17a5pTnVvNMdRsOFi/XGcJ7ra8tA6DJiTxDH8DXhmSnVHnhkowm8sUzBwvAHMHADlU7euwslrjbhFByaaixb7KQYNxaEk4wAwuwb6Hzz0yqlCzgakb6+fC3rlmSaMNophjFUPH27KN265Lttqk1JPpc9BIlMKPSmZ1Ib2KuobNd8+JNxueiSvGC0vCv5RmmJ6e32E9lW4HgKNrn3kAX/WQ3qKhNtD3y3oVkGurbnbvanR56s46T4yJu+gOsFTyWc0c/2mdQfq1pIXvSLIUByJfhtuIt0hmTFAUbq8KBUJgpbUVljcxR3/E1CGQihQzDoBKCn5Hs7KAkMYUgzdBzonszUms67sOJZ7fiY9BT6gVVVjmMDAGTEoMCYzsAGiFL6A0EN96tQVUqxNPWlEn6fKnWdVxXzmkmL4dTmv9Girm6dupLYGWAoTGErJj3g5JDPR4/IfDo83oYTsvGAefRJUQioTWUJ6xRjeKJeQM0N6w5qLUajwgs62XDFkam9N8mpyBs02J1vQVqYgtquZ7BDCZoGr+jhedkbdpHzvFsnMcdejyAizBoTWIaObbm9+2dBTa8TKSnYA172kVCfRZsFfNHRYvkXCLt1e3HnqKFlsEGTG3lTEqeEtG0ZT2BM2i3czVGUUCMiPudsY4AeNxp3cMLD867clntRKr6jla4T6R0gBa4npBFlsLc9A3MenYRcsGXDYUEuWMw8QJJiIXsUkdDepTrNaMMHXBDeqcWIxVbXWTscPFBZvs/Aa3FrWyMuGYJS7To9oLC/mg1qJbSocG3rcKk5OhUHE3iGzdi/iD586YRk2Bo22D9bCUAH28VsxiyHrKJgdN8WcszvPc7PXdG6dJYzEPkeH5Ltdym3Q00ElbS6O7vfmaFL3EtjAz231R205gcLxbGqkFR9UQ26l5x7TeEBqI1Usp4NpjUJ1bL9UNXtMNfr2rMUZscyv6p1vro6ZeZ4hXkOT/a+mPCz2xQbs4HmIbuziB2eJPIiPqMTrzI1RH2+vmSVGBs8+PIUIDSW9gKNx2qFtYJGQlg51yTWV27k09TgFEA1Z7KqSO9lBzrTeQ08ErayoA+bY167jsN3QNG2zRt0DPLi3hdicTHRQtpU0lIC088K0nrU672iqlDIC69ho3jsZQovwTXOnborB1pW9c50tJeIvr/O8wuaQpNYBwV0xgZ0AvIJoLZxVBVdUWcvSdX/9jcB0vmk0DFcYZv/WozD/k2t+/8rcmbuNs7nrlj2KdYWKVexTbhHIipk4g+69pZeIW3+KjDI/haGHjLTHJcbbqG8MDLQwGrJ1xaO75jb7kVzFTQDXBxkwobC7SGYRZxbETIuv4obwNdMJUBSig2aFbdBrlMecLnbFqdQ3KOTOPJt6oi/3iptMIrh4OvWn/eQspxNrgDBMX1u3AsnTkkhi+pDx9gX1jnRJiv8iiwS0DIiGNPYM0jchfd1U4YWiP5H38CddUnRxDXIypVtVBez2fEdH9041BjPLKRjF3WFjVE6rgcw/XCRqDFV2DD88Kc0oaToGwBmWxPr9QRl19GVoQjDEgBRayRlv21t83jf23SAczKgzA3aXysT7+HMMbcaJsY25DSL+Q8aDmc8fcQlu/eLtBQFK6VIH1HEkP06EqE4/UtCHBDL7rXIWI0BriHS1I7tBypMbzXM3pNsLcrvG/vfjvebKAhG93GQC+Mf774PDw28FjJ/77g8GDoy/x3z/HZ8v47xjy/Z7agWdobQAJAJ+8ffEulSml7xGvK/M4VxeiKpol9DGjeMTfxambllPxfR79RZCoPkUrBNKHRmyX4ploinZsghllF0menJMev0zPM3D9HifLDCKkI2goXsyKY1HwMuX0hdF/J5UcJM9NztJ/3bNqsOqcjHRwZFLHb4zISg2GgZIk9O+2hackAG00ZQCqN5qiDKTn4txY9nFm6FG1pAspPcVsUHUh5nKeAmhOS+JbVAEpweUbYlP2CwABUjqsgfUCu2DcXWMKVBwiaoS63EUPfs8HTJ1n8PTDVu6pQdVcqOv3eJliQ7De6h8WBOxs4JYesHTMc9P5eBsb4XOMhWjMUOw2g1OMRf4H3ElnU3JQNJlxdypZo+dPpaURwFIeu+RVClp6QXQg6YEUNu+Sy01hLzmJ2P1OL5SFCT58pmG1oFbaCuvGD8niYo+8OQLbumv+4NHbu0peBlkF/XK820fmM71KwAJZ1KRdfdgjn1BV6sGCTQBrr3AXAwCb1TVWG1qIEFBV0ANCsw4MtDWfY+iZunjUoeWkPC+JZEfUxOz0HWaHiik0hnRDsFyC1l8X5WUPf1cRGaiBRC65jgPiOg5IiIyjd2u6EyF9nkM5KVJpxnxVnqYzjJcsWLz0A8g+mOUyEmcOhgTBdhRrBx3+I13Ofc+RKzGHNRnMou039rn7y1pIjHgLLA4Zwn7gBK+SbA7j7KkJwS80LtP8EzthdBsWzR6HXiusjXZhYYRUpoAkMF6sVsvq+P79yfr8VzG1SVymM8HoxkL2uy9W+HosXsTT8+xfs9lw8Pj3Dx8MBmLOPjBDv87lWln91Y+lEhUGh94kgv0t+Ao9rtLpusxWN7FaujgrWha7fzXYEwJrmWGiy9WNOMyXYh2qGB7aDbYrBg2KXuJl67IrcxtKPYHU2OHkylDagojokcoIQzmQdNAPILp34R8H41/LEiQ4I4oQFmkZBRQKibFL4Sp/vi6Bf6eU6RZDg5TXSJUZ/QAuHx8ScHGPOsuiA9yU+DvrxFHneT7DK+yKnqbqJ2M3CUXQLikIzP5hdEfuvb0XrFycssjMrBz7WM7MgJpz6yrtHu4RZO5uIr2DsB5o8NZomgFp9DBMlOB6xNSBsTsGjJqIZWFxF86kGM8kHJSnhYUZ1BDVkmTK8gr40j60jGa9RnRWKpcH6aNpFfyS+EGU+ZA2AFPK4MkPIZlTYxbTJGW5EPXFA8Ki9Xtmr2KxrHQntF/tmwyaWIj1PCnHxvSPjg8G+uAFHskqtHF8m7pqNRfqM877NU/7GcIU8/13ELV5VdHyUOxYXFvgnKVjPq2ItEa2VjSwGyvcjm6cyJ8qvHA3C1qIDhsR8zXoJSInE3lgqceVt4Uq0Cxwbd5DVlV6Jo8cvXHi8O7SFcN7zIlMKSeW/VxwIEgTqHQfIl1hVlb0/+DGObA3s45yap3wJTC0RuMUeYgholbMRxudtkJiXsrNaZxjxlwwH+ZSVoc26wo1DEiIFv+A3QT0MiSmOlaCsY9YAjrZIZtyiK/oBYjpE5axFFXvK5ouWiS2wKZz9+k9B97uzNLlvLjB80FMSdXp1WCJNxzW6TrUDe45kHuykWYjYa6jp60JYivapjGprwQG6hPJC3GnHw3sS6y2LBJ31uKPGMSQYQGBRqzs1vLWfbsB5K1qbYY8Jtx4p23DrQEMg5NDem7EIx1HwxmMimuKo7BOg05lmgZsAw9PCQm0DqqVNMOfX+tMzC4FZk4pXWhastG4IDy0AGwmK3FVOqugKaOQPsWmwHIyKP3zK0sZjbcXog94J9kCFdDcSpaPNQroZ7QrbEEntvHfWVZV16JSAUEpE5IRbMNahtFVePO0qHQxVTEHs+M1ZgSqoV2diu4IC1y0SE0FAmggY9GfA3SpqqVIFEQZVggUVpVgu+U1K8lp5CjiHLbolIhka6GuMYR0UqzhYqsdIVX8seyZYHr7yPLCPU3nrWB966jle1bMm6TxLsliMFJrO0JpxYE0Hvh7Wm113KZ1LTPCQbkxX5V0Lwf96PIIDL6MOLCXAwwqbp+3A8WukXBicTUZ5FUorsSCzxy30kSbLDtMhILazEmoYshOqF+nOprw5RFucv3OrJ0GhnKUWveEMNwhFoXGBqZJFTz8BhYWbUXFL+vlgN8FzzZv2cw4rr8A3qpF+CUXq/BL7i6DeOx3Xjy844UwADeuhFEOlsL4Kfm7akCK5AFpkqH3eFyPz37JjY7DmonauGhGKwbzVx1RQ0fU0JHT0JFpsnkvei11veR5WeRCYpQZR2Csk2J1wT6MSJ9kcYOsdfPqGFku0pGYZ0M1wN0l+sR/B5DiSfy0V10ZqluVaRaGPAq5S/Xuo8nCoe6CRdj/G1TsoBYZpvIXIomrYhxieFHjDJKElGP0HOCTrp4FiTaqBC0y1nODGYhNIXV0FsW2OkUKBWwAHGtk2hazPPfaUD1AF4Sof2NT7yduv+eCnziOVOdtZYNWS9v90QhnPmbNuvptqqilqCxj4n+8vW8o8rn3fbu+VA1pDBb/V+aBuHh8wyIfQSPOI4W0pnGKXNUTaLkKaEtoSTuqssbxTk/npoO9IhrNZUovNct5ZV4MRayWUsXx+ozsvUkvZSQE5n7roBNkY4z6W+RaSFcFQcdWaeIkwyjTRQIGBuA8IOaKiYs2e9SzwYTwDWz5JOocd6T8ah7nibHlK7CnS1ZF+R1TBGCj2NAR63OWI9L4lsU8vV/dQJ7742S2yHLFcENRCJEje6qRBOSS0eGpSc3GFJ7bHJZX8dgWaJDyjO1Q3Woa+I2lSTNxx0F6BcuWz9v06r7XK1XTsZ3W/JHRN95O5rLJvgU6xaXVG1u+t3CRt5R5waUvGshgqUt/pIeNxK0X+VVxmfIVMN6XqRCfbOkE1O0/iykwygeq0f/kdC6EwcQs1zPbNEgw3QLnuDUMBg5bNOpyWHBGw/usXK5VPohdl5JPtMBnsBCDYx3hcHQZ43ISZZdisShyyWkSgcqKnP1sM7z/LM5Wac5JT2Aek/LGot40H0SMm+bGphqv7z9xlL0QbJNsaIR8Ny8mCZjqCOFNuvxep7gNwad7uZ7DzIIwgFW5eJCdhff1N+91tSu/nnmDDi/nQtiEZ2z5Zt0J4Du+6MiAEQJ7qy4+pYcXgpzhZsrTD6tutupZVunTYr5egBdZhb2EucGpoOfycJTT9v6CEu7BKRhASU56RSEmaPoBw568ffHnd29+egu1xPe/Pn938uLNazAcRHvBNYSAEU1E8+I8m0qv1nsoe13jGr14g45fmEH0GrEp/QBs5IINEec3cRT9KcWmyA9QSHw3IPgvEgz2Q7IoXlWAodrq/jkGAGD2817EF8iMTf/ZpzynwLvCXQQq3jNgYl50FlEyw23DBpUwJrqINncsTsCf3rz/UbbMJ5l3Za0in8BbQAFeD3kxLx6h+N/RjIOujMSUllcTrRAIlcGhHopscs/ECmV4gCc2SK56U3f6bktokiitHKAw7PWOIReZUDHxpAai+0+YSKOKQfveNcrZaaSg5DA6GDiMKroMMsp0Oz/leB8olglV+dTYMaA6XTUr/OW1U8yTATZGM55uzzBk1/tmZBSEu2fxSJu4gNKX35PBA2zMvjl0K17L39eLJXSVbm8RA3kjkpjHlHR5E62XMvxAmsu8tUgnVGsU02WID0c13T0+NYCT0qFMOUwYsidyH3AvZFrdPuvH8OEFJoN2zB7g3gY6YPkDRTWiaadjdKPQgQeRwEWUlnrFDBPMAGzzlcrryZxcigusGrqi8BPUB7o8FVyQpJ2uTuMK0k7JoyGZoVkkUd3kbMXqQMJJLBXKjgYRwKzBQX2T7LqgeZqAXkFRX3MX9DUucUca+vSuVw85+BrMo53c63uVkMzU1XJ2eqA6igh1MJEQBCppcjHsrDps+FzbayYs6vzy2zNMxOoaMgiYvFTv9EN9863LvCd2JddDNWTkU6aG/xEF0IxOVsXyxYo97G0kmIhT6hIztOPt4xISwWxiDKODA9G9Cc7Af0bSHPgqKTOkg10dB4Lw+aseGDO+WClRiHlYOJOZ7KyXsaQC6/kMDtd8JUQ6iqOnUx6KLS5aAvYALxAPDsrkGs+W+1cDOA7Et+p+LD7wO46jdDXtY6bTOTCMU8jUDWMDaxqK9iQOzbFk1V32CHi5109ePXeXzf6c/Pjm3XsodsIPFCvS/MEqb588ff5M/PjLi9fP9rRMukpWa9APu5+p/6jV5wzOf/njqQRzgmAE2PwsO0eOrOYzXewGFg3ANVgA8ypZ7in7i9qK6fIOACqrjz3EpsapS6/uAiCA2ZuD9wBa9NRBxBI7rKQF7CU08g7A7CnCVdtmfhd4o1SOe5CdsrlFcVbfAUBIvrcEOlhBKIArILXpdJ5kCwv48mq6EyxrOt8qMH9FME8BjAfcH/RyR8SxBuoC34NLnOb6yx0n2B50MQNQq3SxRJlltybbgnrPYPaAnHNQGWA/ymI+h7s+41PutqI2yHcazFMFZk8S+F/WxSoJjhjffDpwAvM/obG9Kp2W6S5bfjugJwhmD2J2ZdM0mYqzNEz3ql3G50NDME8IjITaMMjqLjYqQ90j/9z8/DqdXBTFJR1ia44hFG4HtJkVMFXEOFHZ+PL3VZyZu8namq8YzN8IzFMTzB67AG/Ti1368FcFJtiLqeDbioXEazQbyGz403LWn5YGSRGcDmbVILWBBz3Yi6cIRuL1MwVmD3iujWvvzMIyax5/AL5gq+Taa6pRpldZVb/iJsR69sb4uBwLg3nHYPZmSboQ0Br2ske4d4H8DMGciL2szQ3qGqESnwpQgZHUuWGM5V0MkakzjBGDC56t5/UgK/fFLhBPGIw9rbRl/cZmLq0CkJb5dAuQelppy+4ZdyyTDHXjmzF3vRLyZPYr7ZTaDth7lcC8E2D+RGBMyG236SdC3jNGKajTqsymDcR5K5A2JulRvtNg9raZ47uBvrfN5H4iyD2sBXd4c8HBiVaKSkjFFht1sXROeVkKBPOGjwXrRwVGcHBPFBiJTkHA9Jm6PIYBvmkfhdDJALxIphdZnjYAXuwI2Br3KwJjjrgs8r8Xk4b1nf7deTBBB+eNH/vQEWD+rZjsNYMKfnYBB6Aw9kIdHaSWXWKIVTZTQwsURp9kOjihSJTbfHYGuTeFcHNnlAI0O8+RHP2yTo1DZVqVditmlXr+yMFVXeeEwLwjMAJ1UnTGEaVdyHWf6bxYz3S9unE7qKPASMjAm00v0pDk2giZSHYVs6dwALwFGXgzBLO3XE/mWQWRVpG5E0zeRtC7AHyrwJwQmJu9qrrYEqN2gnxy8uMzyfIGiE89LET8jfgbYnkF8YFjApZ22iTf3AFAC8wuu3QXqLxLidRTINgiNLNTt6ldgPGJ8obBSLDyDvW3GiOD/SuBAQmm2pJZ2Akqgdmb5SFt8p2De/b6ZO8sTSAGwvkW+qRdQP1AYP4M+qRskdQrW+8O5AsAs5flZ2UiaNt6CvB/M3x5YYHZYyK1zSh3g4pg9vJ0BVckvzV6viYwewWQt99+Ad8AeduTBOZi3ZrB2gkYg/lxPdlblgUkA/itp/MtgQFwHzYfu3cB7oM4dsFjYR3iw+8U2IkEI0nndJ7Niut8XiSbTyiusgliiHQ+ffniGYORkEFzBjZu8+IcMp80Qv8EyM8ZzMvi/KUAI6FvBHk30E2QebEyosD/ZiBfG2Ak6JtkMa/QqXvzmD8B9L8/efXyBMHsQZa2rQ+TohRsZKMqM3Kv7wCMvgmdt9aezgRDX4DpWQMkF5i8CT0BMLvchlKVZogeULwN3XxwedoIrZlu6qMNTB5cZ/PiGgWe8NVO6ANVWKEcK75+g0b+B1EHBZ5EENusgFANczFH8za3ELtBfMtgXgIYW/9/kc4X04ukXIEtaZWJM2cj8YcqLXSZVg9+FHWeAph3EszNLpwXVtkMO8R5ITAxymRRAzer8MXWwGxUgjonCMaDWzPUzH3+iXBNkKskqJTJKvHiDkG+T84Jag08BuIA3R0qwGtUOdV0AOry1RFGR0Eey+uAS+NB5YRVl+U6b8+q7AINR/cWwYDYVXI2qdYDZG1ELTD62LcMr08oaZXk2w+SFSTig3uHA+c+UJTgt/BGPACyM80z8f/pWQNxtwAy3/5EQTFuA1k/e5Em89WFIJFTj1tZXEz74v/6MVfZhEYh/eyPCOYpgJGQt8GnT4CswG1xr/8J4ODSil120rKEQEaL1N8/01U5PTN3KEO0zqUAeHe/EJh3BEZeXanb0Nb7dlfoBIbhXq4n6Tytvae7K7h/ITAM1GphWRRz/5Zh6tio7QKUF5eAvhVgbMDB0S5cXfwnA2YLglkBPkgtkbleW2p9AhYEzxDMHoSVPU/ADnuL7dMKpr19BJg/I5i9ao0p+QRhZROMzYB3gXhCYN4qMHuCY0vLAn2P5z4i3RngvyKYFwRmb5KU6UKc5vOLoua6YbK46Iv/i9cSKBR/0Mjhe0D/JMC8gno/inb20A0bxtz+0rUlUFfzoMC0MEYMwSyz6UZ5xjNGfEX1Wpjn7QrStZmTEMXGKZElbK9WXWTnzdY19LG1LAQGLSUkTNaMq+aawH8CTNaMv5It7MGl64r2QVsSsRAYAeJPfh5DXJWigph+fjH76soAAwvLbbQnSjvAhIWlarBjJlui704QAQwAA/fPNGhbfqfAGIwBsVy3vO74NIjvBBhpirjNUu4Clc3R5FKuLpK8wHG2xp5doL5HMO/WhhXGNup6LrvdwU1gpLo+RRGFG1oWkF1709K2hGorkBAMA30LYG728DBbT/ItmO5dBgyH2QmCAZFqs339p0MUw9T29VL4W156moUWMFvLjfKK4u1fXkg9HYbSbjlOBgnI20TtQxdMTwHMLrrBljCDusHNCCtKiLefCM5GWCmqbTOvgtPYqGp15lWKajiveJ2WTMHDalVcpm1YeqyypVYOr9OeIJj3AIbhskFb2gr07nAlGAM0BQ+wLOoa4O8M+imCeWKCMeG33bGfCH8Xk5ANxCEI0jEJceyS2oDdBepTAKPtmeRBN62yWZm1s7vZDSyCeXry4hmC2UVFuRNcpWLZ1ipkR2hoFSJms8qTZXVRrGr8cO4G3MmLEwZj+OHsYJKyC3AwSUlX023ltV1APRdgSMvMuWvJU2Ijg7QLLNQyPyUwJwiGzxt5jrdczy3gh85UYz1BTbelWdwuAwc1nTaLA6B6qK2ExV2B6qG+YmERgG9p/bArcG39gEADgnmDmLMz0IBgLsScHWyDdumBsg2SVdoj1y7gBC+cn0BRjVyqdnsM+yTIPoaxHDttf5m9Uw9Yjn36RKmZWoPbESCB2RM8RTIvzqXHfeAjSlSWM6gyD20UmB27aAJDdFKyEjy3IbvPaXXVF//Xz3YCSmB4bqXdJyuBl/OkjmPLXNf3XYCzEvitAKOESQ4eHPgUrjvILiClMInBcxXQLTCpJdCgkR3o9qtpmS3rWWFRol+ZJn+7DPLEALMnRPVLgcWCJmRnbUz6xYer6OvdMHBbt0V1XjEY0FHOsqpcYycm69m5pwtZzibOA+QNNvbO1VE+U2D+hGBQ782ZSWq4mmXloG9L0LZ6v5idMBjmanYwoOQqWylhpAFlQnk2pMvcRo/xiJ3GtzSEeEJgpMuc5TG+GTaX0N7qLbsQdNcLwt7Cga6cJNPY9mULaTB+AyfFT4S8i5tgS5B36Sa4K0gBa71tYAessiUqv4M6u0jLbNy5SW8Zkpal5V29bm3pXpUzu76VylJa3pFuzU3V1GaIMpmTDI4ZHqOtzwMwTxSYTwK7BWPmgpVtcCZG0E+sysQM3VNNnTneBayk9k8JzFMNZo/jrkg1RRs1qiwcMzdbs9R2iAUEo9QUuNQOaJbpf2vQBMYB3mpLtQRu2wxYwPeq5XydX54V5XVSztoJtU6VOjc6m43COj/IOnvbqPUk2MYxqo+riJJqvSrb1mxgR4AYw4jrNmBv5VGqHcCxWGVirzYEbDHWXWASAmlLwL1JWVympQwpJAPuN0KXhbchGX9CMDKk0AsGs7cV3K2g23ewdXC3wKhPgQsM8Vm2HRexWuebDYr8e3UAs4d1t+MidgH3HursrZfnZTJrMoHjEt6DBh9eH9hPVIeZiXrpuPbj5VMMF7PQlqRjTs24jY/WLsBecAbIYDrI3wDeT6KOhPmKwCDoLXndXUHvCR75cstFJNO8bU3eAIyERjQzyJhNqrndzO7QmLS/lIzZDGxVU+pCy5ACuwB/hmCoCzKkgPS6axvJYFfQDEaCXRYzOtLar/IuYN8WMzrSeJUV2BLV7m127CeBfUdgIEzdKpu29+jZEe47BGN49LQf5ifDhWHK+5Mt4O0CTt6f7PENAgY+DSNw5YYC2QkegqH4qhKBbY6+lSS3C2ibo1cEI1sGrdibPhggPJkIyb7RQ8RWPL9FK3ZwUJzTCYCSayaIFEx9w5B3gfZGg0HJ9cXbdxrMHqZiaMyWEY7829v7l60/6rgakxHIfdDw5+IcW95s31jN51B8Hj98iH/Fx/l79O2jo8N/GTx4ODh6dPT4MTwfPHgw+PZfosM760HDZw1RnKPoc4D6Z/wArp2I3TpdQaZ5iDW9TKW5dHedYzh7VP9UKSRWrtaTVZnAtzwpIQPF5Aajm/cgQDUEaxcko7yhfFN0GYnJIVX+XwiADUmvX1AmoT69IV+zKBGbJMV8VYCEaE5WxZhWg2LZg6EYJa0Gg0NBEqHblKidMjNXYktg+gk5IMpwmFJ+NVEE288oiZIQD2aUVgl7u4CeCSCUoGXvPzmR/UExBGgQLPxKUb7ri2x6gVlQEkz3GGWYYOeAJ4XyQmJ2t3V1AfmVIJ2iAgVTBMfiJM2FmHsBiUlkbhUM789pG3V2Rqb3lF/xQNWnXlCCc8qjxouBVcXBfy4HqPLO6UFw6iQYouAU+nyp2CMIxHKLtVKwIK1vgjnrFjDHkJcYVkOl3caJVfnc0g/pdL3CIOnTNDZnBollN47jXg9yhXB66AwzesqcDQcHav3uix9nWTqf6UeYzaGo1DTGRC4xqch4fLaGqCPjcZQtMAFJMqnEsbJKx/R7b4+f/70SdJYqQTZYTMZHb6wMn30rA1zfzgTY10nCOMMR1hkXZ91fjOQVnETBTIkHL0eDU1nrTEzer2lXpn/LzqKZTAvr5Zd8LVOa828YSDxbL5ZVF7JsihGML9ObagjpF1RCsiE8T2cyt9lYTPYY8cPKsX0veiKxhnZxRZnK4P8cUx9YWMiuwYgGmzPBzGK47GU6pzj6uOcxzQw3HMyBCpwExMknTATi0RG/O5h0O4/WOWUhffrumU5dwHlBMY8kZ+V0UlFzzojaPK3OdOr8MlYKvz3UeEVwDQ16sG6BnlEyOxVl80Ps6wq8PDOalomr4NOQERwyaPxPmOPXqMyTiQiQuqZpHGyOOzg61Z1IIXtDskqxF30mgFVddyhNFBeCrHyzbLqKWKyO0kQQE9Una19LukUZb4BcMeWN68dKGVdotFzRpteYgXhWN1ZMU/O6WL2ASxZQz6UzSlnTM0b/QRwTWT6mJE80BYi44wwSnkNWsnxlTEZjo7ziwPlmU1xzufjmqo/H4C08HktoODADBDyOf5GZgTBLFZfZYtF4obG20eCnjJxRp/PxtsIBYoofTERZ9VROH6rWj+ZpbsHtnarpUfjRZnb47oVoqOjWPJmk84pTJSJVH0uqLp+KfaHTBVZD3J3u9HKzYn75m/1aJrPH6SPyZhegbkAJ/GK/dLoFKQ3tJ3Zxu7+itP1ATw3k/0BaJJfLJLzGEukJNsfqTqExDn8mQ+PwM7iojzPlgWEZiIfKRjhgWtE9g8KprH0V5LeipN2iGXkmEBtFpCHArISJBNQfRt1sZs1Vrx9amr46ZY256zlPnUnr2QkexaliHJwa15yD5R5QGDpH6SyEkRt8HWV18TksmIlqBWlmqgtgpJI8OAFy4N+Ika/Wgo6ZPel7qZtE0Y1nlqQO8Hibw8WkU/yW2rgbSkU8yL2Pt0CsPCKlGiGQ/ajT78R/L7LcnA+Dcv0EokxrynWRzWdlmnukh58D7eGvrWf3F8ryBtXgcLXbwyTLmPYNnsSyqd42y5Gn12MQXoZ225DXS9WVtVSl+j6NBsenNmZTJmiZnw476jXs5+mS+V5nM7mLknkpRL8byWKgkOlV47Ju6m3MpMcjDQAz5gGS3KeYgttKjScTlFKh3RFVZp0ETMUROBjaO20xx35KtCrGIFKzLs+v1SuvP5DRPIo6PW94WF7h/gspv7fF/0kCCeaQaHncDbwT44Y/9gsqDok48UvbjaEa1VgvhsXbheimnDaGoDYL/r6TzYLwm3dJqCv2+q2KsdKUyGloaNTuxoh2lrXH5NvMT0Evs4YrgAa+/RYoruDUo7mFvsasbovC7SbbgsZTfSeb5YQ1XDvsle22ikSRT9souj39eIt9IFBIqvTkXtiEt+pA8xG2YS81EnSjF9Yu/gSEle399vjqt3OX6PgXUfqHbA5O7NswLyQxBPkXybz4YhOnBN8KIR2GZXv2cUTcT24fjmEEMpVxXaVsyyXLj0O+I/whfWWQ9TRh1SPB3RzgMAzqCmmyQGVira0UiLSOSenOWUFM8gyr6JT2XGbFrZbpNBOCzywSbYthzrNf01kvUonpTaUN6muiv2Ea3GVRVZmQb0ivTsq4Gn03ZlSf34CSifGEFG4Y3Aj03gIDEMM5DXVWylzeaoRSL5pV0j6KZ0Lra3zMMnQ5zi4yZlEj2sfbXq8ekJJlDTi+VEge8AGpkLtU3w9V+h4WqiJEc5YeS/wrJkUsL8nOpDPVyYAw86/+Ccxv1aO7k0VRqmWeGmAYAVbXBawcrYyh0ZN6lBGtLW0+M2HxJSBv3OlFKZizUFbSS2Rb1CR4e/aSR3vqzqGjxTXebNTk0mhwPhLUFhPa6ysozHMObZB2AQ+rQuOevJK56VTUDa/19otHfXkvW+ScsHSLQzuJNJ9Q6zvINQmXU6BfTapLo8dxCHcMdB6d+gINTLqhZWLNVy0+K3nY3zdaVB6ZpMc8V2yZBmFLmUZK/zQNTL0Z2QSeGNeLoOUAx6ZUvRc7XzFLoU5bgozfcVvOcclmTJwa9r9PfWYJp4G8GMxggMCYrGJbcAxtM05ZxH9ZpjNM0MJF1G/nGHgLBJi070vMiQ6XDbp0FRP19rYIaJ8kJfRuKrFleVuplfaezp/7BperYH0l6I/8ChQGblZgkvFeiHahf4MLDaWaNcFjDPYLXgWJXlUCd6ozKq1GpagjjwBv81YRGTREVSY7vPNJQiWAGuHoSS++3VlRo61FxiibrTEfuxoQ597WhJQRSDaCP1xtZb0qmfanVCWbrbI+uU6VvLMWGWE4WmSaQDnc7SiToXgb6bNDYdeQru3k83riZJ8cTNHwz9hozNtzXFBvOr8Z0bjUOOFvp4huXH2FE9sGXU+IlUJS7676CayjkkSQmsZp0K3AWINUlkqb1LRNF2vo6h310KLLbgdb9c8myy4ituhiPcaECT+XV3vT66VFiejWWoqIT9mYBTd84KrakQ9ze0TOnZpJK+wy6t7MIEV2Cf/yLESo7DreDVqAdPiSamUTAnxOfjFD64I8mc0aRk0GRrxrsYBFQqSFgSaYHoOKRZBLzY3O+fypfifB8RkvOypnxxW170Uv0CxFnJF4cAOreFVkYCs1zcrpep6UbLiiu45GLcpehs1apI2Xt1ck4A7IjR1Duv1Nrhs33zaKHuBJPGYkHFqXe8aM4RFZcw9vXhOekBULcAxsxYLMJss8N2TTolge31QBDSOIEVnxRWUVMHxAYwrRsjahOPge78b+iL37Ptg3yR4Po4+3Fu7lbIOh8TQgHCkxazhsxD55OQc1Tl27BLcwzHSWr5nsaDx8l4IP2GIyV7YhBbjA0aSJhoX0BDwazek1yj0XyZXm6aDgIupKe0FbxFHzbW1reoOnvhASunZf2+xQNZtQiAYcvjOC6dT7OM3xcK7XNtVIoWafYyA9uT+97ogV+bGLuksmi7vbl8tZFkubj4CyKFYuMYRnAhD8cc8GtpW01obdjmoRF9rRakF7rujiHhdNGxT0XPyGUrwkBMyfcHo+EiVhjuxz0KbnwRHJuTeasWsYL2g9sU1LPYrqPJdqZ7PAzGR90+w0SnPwzZAKUtUnZ6rMKVXdDtADhqrwJYu+iQYusogCpnIUbTSbDDnerdmQS/VbmYOK7SHFRZY2QetoG69tbxNGzdSZv9WQSnNSral0NXBYP14vZ8jSy8mkc0T/lOdhLx7T+mJHuz1fR6u2TeCyxNVBu9OsUEfeumhccm4WZAECVKdO7nTcCwnG7U4xNU2XLYW2MvRSyOdcw+2Eskl5Tkr083Ql+IkOW1B3TgVKBqeZvovejaGqTwj0drUYBX8DQHU17oMDUfxAF+/Y7dqTFPl2JrCBRO8jtiqBtgM40Pk55wLY4C4eGP/Yj+//oXVFd+UCssH/4+jx4IHj//Hw8HDwxf/jc3yAxD4DB3/Qyl4ZSjWysyDp1vSpqOLop3yeXaKFWlJOMiFqg6Zb7LYE74MMdSOmvl6hem6PLP97LFR0e3iGoNwgvrMZoO2W0ewHIDbkmsIDSOcJcX6wm1y0TEvYx3TkqMslZoiKqSY/HYgM1fEMT0Gd1IvZZ0HteVGRRiG+0Cg6goB0esB/dz6IVsRzGlGHHPXi5UVSpaLAV6KAOE0h7QNc9u29Dehmg0pZYICUXhYU5vKHkADPIenJiivwMUqsH0Sojt7erC4K4HzR02ZLNwkSIheCm5jLMq8gKUh+vrd3L/oBBgnm6kuWTcXp7S3QGdrxs6PA3nidY5yMZD721QTdDiTTEOdyEuNRIeiu9QBXRRBwAfrJbIbpmpI5IU+bXsjLL/+KUwhyxNj7ffqIyw740TkWHYQ2kPF6zR3EB+B0KpaSgn2ppyq2plWWXWyeTKfFOl/RK+tIspGmr38Xsxdvjd95sYCcjenstexOjxrqYLZD7C4c+eBk8QbxAWUjaMF5rOc2/C7weJ3NOq5475ZJlhmHDQw0IL0V60vgWrxNVhc+oFIIoVQHHIxL0PQD11/kMG6YIWwavq1ulnpeqnQqzmucGHzely/0BOAaW/OvyoBwq1BAsMS0ukDsdCHRHYECot7KbEk+9coBBuvgnM1V/l5MzALVGgOXn63nWORW+vTwNqgcVO6yKmcp5lP7Fy3R7yyP6neldweiNOzNzjdLuiNCsS24tWLBFnbJt0ow1Vs55eA4yxTMCbpXejCG9vaqH02KYt47Bo0FfEshXGVGblL3ISerunEVx828uE7LqWmdJbk6gxG86sVYjvnSYAktfistsC+DS00CieBij4giza46VOYYL1KfvH1B2wO9cQTZaZCz5E0bKmmoEt2bZSisgZ2GumkKy1pt3G/A1sN0ZujX3XHVDPLJCgLJgGauACkJojI7nYuSCm8x6aCUd/QIBWwiEIzBl7jTR8iJs6fpPts1qEt/aR7j1abBgJsUK75Rwddl3RctfQS5CpZ89GiRpsdH+TVY8ws8I5ETN4wQ36apB8vdewKoeyAh9NbNNmGEwXCI+U1mM9oPmo0Q4L6jPYi7axVBxjMAqHgP+27LvWb1sMnc1YZKClhGpZLy9oMpZMutw4XMRgQXqdpwjTC5CeLZzCJqv76EpdWb9q1xq157fYIWi8WyH8FspOi45F0swOX2EIvaL4olWH0u7YfYjniOf1vTiyvwNsKHQFHHxI8q6JbrigItuNDhsBOkuVcROuSt0MEUefMrKC/Jre5obctfNbWMrYo9ewWs8BaNZnn77op9MJJNp2SionXoCOa0DgwkCm+CpLvPR9uugNIPWbWqWozJRWLdDXGyCXYdIpZ9EinehBeX6Q2juNRAEeY3LV4634QTVqudrzrSgnmHtr0Fq+tx67XyQITQonkEu8MKYkYzMAtPwAqv3XxgNRMPQNMuusknnnPvA8eneQKCqM5O/nRmA05ChIKsRE4BZG90OzOb8Y8A+FCzUn1P5M+pQZwfPCBSLNjjkklxGJfFOLpyLoUYQDulE+YzO0Q0P35V3vbij7dd7QprzBY37Gv+jMrgTQtfGur3IxOp5fmDgvR25w8w2Mb54x49yH8PsdTuRw/z7Pi0xfmDagJLcazRHjrCOnYwFrXXAdq4GqX2jZ9YTCR2rG8IXWfakRCMZ1dbHZ/YQWusksGQpe5FL0HTpXUypBBHy8UV2iuTmgkOIMhGvmLSLHUTgsECHldvBrFP0NRLiTFquOowQ3PaDmmVtjgp6w52hOjOE6qVflFmWJ9whqAB9AbZUyFCk7in3tDtoEZmf5w8RZocWtiuCVqtSFsP3KkiaVPTOmxFqSTxIDVhA/Ggbd5IPNCUsx3NUEpdj1xoda9hf1i13kaw2Zd6s6sGgqbcS5eRr93bWgNQO8Om/cdO8udJCsLXyrWWdURQHerHFIDkdSUralFbilFpVOuqnhj4bySZuiczG/RT5S4YvU9SJCm9OHqxkjRGEGv099gshFLgpYAYujMgz2B4o1Vsj6Q3OU51Z2B0ieIkXVuoBN2UAZKyfDpfz1KyOxari04mglKTbb7ouem0AgCURW5mhmwxNocJiWB4EvJmqViZ00FfeSJAxPh426ujRrKw+9ipZVgUj06336mGOk0QHiQygY1av3JASPjE37AvA7ufei4dqUq7CPLMREjwtGq97b32+d7X5+r0OgTDlOgXth1zG5JPagixUIrQA4NKl8cjqCq6U7tKpz1N98eotXiXnrWw9dRhqODjKSeMeukvqpbLWAKLgoyiF5TKGB+2TdxP15tWR89isMdwnkuIZnfy9A66Q3LAVt35Ktydi6S6qF1aeNntkkAgLShx5o0mstwaTm2QJkkinxhnEElX7B3H+k/SYGN0ynzFbmJ56nv1EbRGxVzDbGRw14LmgtxrY0RiI47ZsOVuB8UstNgJaECY8Gqz5gVKEzQ9yl2HR/J97QgZfcKL3tAsi59GS7wvtm5Jiq9676PE2GrvOwy3Jx222/uSIbMFVYNF3WEDb27zE3YhUuyOKXRIVyoS2A2SKJElcJfvP/8q/DyGjT3C2//OTYftB60CvE8ay1iEynpjUVTm1GAIzD2iL+MZmGLwRQ9WdvyznogpOhOHjzjSbX6WZVm6D1uDw4xpjwBnEVttxNZ88YTrc4g0zjTLJNkYyCdrhS0jhoZlhFXMum+n6e+YkwAQMIhdsQJ+i280+SKDJ4O8ZB2QcfTEktGlQC9k9U7nM82c2sU4TzxzVONrT1iTlZ8WiwlaBBpCW/fJ62fRvDjPpsitUl6unoz6WSPGLMGSG7t+wowNm7rE1gRrFlHfa1aGSU/IksebP/YWV/eNLCAI+Q46KK2G+CINTgPRRXXXaU/e2TxZaZ5WcUohVlb5DpusrCkpR8aHbjv/CtSGLjk7zz8syZwmZMmkhi2vILu970Rv1vnMMiBcmraUoucOz8mYQDI8vP8HmQ569n9kwnqX4Z/J/u9xnf3f4eNHj734z0df7P8+z+cT4uZa1mEqGSyZnT3/gPsZCjPn8g7xSrMtNVzLRXZ+MZ4LWX0+Vq7i/Qjc+YS0dz6eZ4tsFbxzDVUU1CL02K44HidTcki35OV7eF9uwQXCNSczBUGlDkmNsEATk3WOJYCqWlVMiuQ3Zl1gOq+/H0aHNp3C3uLLsSqru14D178Wam5GXw4h30rPXY5rcTNGtYiYsITs/JTIqmdTRntT2eO8CFXcjIwXoEOYTLLVNdDkN+9ksFwjhgi1H9GhDkegAHSIFpyyu9rn6LCn9YVY3h0JDPnQ0pFw89543HuxFzQ8El7EXCRkztJXAijCE+xJyuowKFB+F0GSyFLMznlelKbkwkhC0GJocsxNBtwJo/89hDO+y6UJlu+g4M3s+XmZnsNxVq1m4DCPGzk4v5WaOFEuNGtrZse2mzcAOpSDhB+id6xAhKCA1KFZVl268yLKhubhmyG88V4w7lWxOHEpWsn+z/l+jcsWtrIGS/6aCcTIp6nYLtkiDcxGUNR9sUqlcrks1ucXFn7KeM9EE1npqH1kKNr9E5pQIpiajgDfSnpiiLydS7Yso/D4M5iOmJBTLol63ldQYJeHheb2S6mRleelVptPxdzJ1ZSmBkHFTmmFoKLc3SEoAFUICj/aIqgoW4Og4s1nQNCkGqNymI7RVbnOATHGtNGHBwNY/JkY13hVXAqWjwPE87MKLi8XzkMl+rA9/LG+JlsoA2n52Ven6/5x/YFsG/TuE92SFZhC95xCvEyi1IiXRQ7VHaTz2x2x9ashloX98SfDe7JtW3K27Z+9RizVh+ftnosFCwsLgEVjLKAgY8OHvxU+OP0wchH4HMdvvGhtlmnD/Nut89xxkDgrpACvibwTxR8uO6oWTsp9XMxkCJs4MZc7VL56quFe9H1TCwGmT/dpWSy7h86gSPCzwvXVD0pe0JCwqPvU+jpE4gRiq1HtLMnm4+yMu7GozgNmPuZZ7JBMUQGI5X7UfU8FotkaXX/ghmzfumG3WlHo2Rt1potZR0axMsFK+gS6qMOQCqFOBuqKXpFC8p/PP9CT/+Vd1x1qABrl/6PDbx8/dP3/HjwaHH6R/z/HZ0v5H6LpPH4of03BfYW5MVNBwN/LVH6DfSa/VzcVKRCmRT5dlyWEKyTwlYT+/gJ4LUjI9hy91IuSdQ5V9iFeFFdpFa/L+TybxMukBDN1qiaeCUIPeYtZQ0HkSb4mbjuY9EdZYYxVuC3zgZf4B2iHmXrNzROkEwMFVCVf88P1KlPPqAK6I/Uh5KGe2TF4LHENyRxQnWLKZJffyiA+cnHW5VgF/VJfQLcrmp6Lvi77QtDOZ7IQt8L532QrEFDCiGhmxkkzQnU5QafsAE99M4JpP/oZKacbNklC14pm2QH5hG0R+qQn5/Jq6cVcOo8AEwEZps7zeXFOJ77ynNJzD65gVvImKRqxTvwXunp5EoHtHF2w4hUMmiLcx3oRes1yW1459eZY17BV5jqYnixKyEVlY6NtaRAuw4NLniEA3Vakiwqd446KiSLNM+93+tGgNzo0wv7nMueV4PetssdY1j3Uc8NA4hfl/WDIe/Ixz7zeZSTlojqoC/5bhCPp9biY2yp/FWu6mIe76S2nWGxeUt1fwsTAwPbv79ulMFCJSQu6dsRPEOQcXou6rWILfLw9/nh737gZgN7qDvRME3dXV+c1ZbbjtWEEfi/me+AtezJNIEKUdKaVV16iYJmlV2THpu6AZCnBjo3l9zHXgHgO0iPU8hpFf1Dwa/S8Os/TnKU+z4+TPp0pWMyK98CqiVN4sYRqmCDYeni6Z/QHLsyoO7aXqfRwVX7DZMljPSquRY/eKXkAI1L8HOjaSFcxpvuMBLQz9Gx05ueUZhtJo/aiogingFd0IVeBCVoyj+yQHILZXqPAJ0lzP9I5E6ktjOErAFDMFI5am+Fmk0UzpjocemmRsNnytFgsUH7IcnB4zM9l2Nvx9GKdX4pj4MN4cgPRHvaMJzKD1dGjwz23oHj84Cj6OhocHj1UCeWwCEVKMWNxSYrDMbi0NR2nEoNZEcdPBYc8RB/Adsz8ihh8S19ZisNPpQcyR+ZdO0o48LdSAOPoOVhj46alDrB9tk0fuReK7uBv/bMSpECpjc+Y3GMYKjvAFIQuwZrQSwy2gj97oNr35hrc1KHdb1DSo5Pkm2ggZDx3/h2JhzqrY08CBL9AILCWOQpVToWjsnzIqGdDu2vyKMF6x3Yzof4wdaL3uF/EPpil1bTMJio0GwUNkPf3k/Q8yzl5VEIoLPm2FQYiz/WeosAHuOVkozMBQxA4PCPVfuvzbqmYcaVNyrbASBAnguW55AAxe2PZGK4TBt6BKFmpjH7TLTv/D5goHP9cfdP9+eSb3s/V17/r9GzeQrXB6XtRz9GwT+xYdTAfxkwZOTwxuIEzAegry1uE3bSVd6fWw6KTBuytwrhoZyYHVLloXaK7YMC3ihLGK1MUwbXIULwUJrownZArvTDefvVTEeKmEj2H+eCe9yV3oZybqYMcJ2Miie1a1J1k5+tiXc2160WXQ4RTJ1AwR7YYomhQwslUXvvjghK+WfgoyMWCvFKkybfsg2PnISM3gTKeOaafc45ARCHUba4m6xM0K8gSRRQybt0wIrygHT5KkmE91rBYE6qC9CcDU5tD5E7FXGHboyw6iAanMbiyLD1nfOqn3Mhd0UVsjUK2dQc9I1o+pRftqoQg476iidQK6ky4FITyI9z3tULmncDrgoy1QfsuxIJpOkuN2xETmeEmIr/B0cuxYDfklNJgj6krgr8V/502wVakQcUag9a6WJ8Zrr5AJ+C+xmBrE/0qQFLrfR4wZM+CNEZI9mkhyfGud2op1QjQCNoEPxMnnNQIGzsWkE57cmQmLZX11TFMkhzG05uuPrgyjN5u4CDD1vEV+yRRKDWsz5dLZmbhTDIZy7IwTKuIw1hCXIELcMYntwg1PmXIU9HlCWX3Y/YIsnbItMdTlRx2nWPSYDjpJ+lFMj+TN8BEShb2PiNfIWMjkd0kmwfnEuWukrLCCYmzVbqoLFRnXoAcB3l0Y8nqnpWww7L8rHBd11SYTPlgVd7YJdAe0XViRZVg9F6I9Ghq5LjDsTdeNnPriXGqjWgM0eb7KR2gKCpPH33s0CKA8UWlVQBZtTAtKbSZ2ZwThoSP5wUE9eEW4+idkcWjJDs+q6Jz0JAkYB7WSE7o4MXjCoiVlmAx0CBUp7QXmXGG1OSKRABdyCElNj/4ohL/I1nAPlGGpDxn0DJNBo8ww9M3N9l24+yEygjAPDujP1MsTLL6g01lTgAFqsETBq/+5TmkDhWBJzAKMdgJRB5F+SdlCRNbhGTXbU46m/eh+FAGHHBOREVc3xQ27JNf4IfJPev9G1MWP1PQAGjs9yuOlypNQ5JkzzYp1JhHTINgarPFWvAR68UkxdzeWinoiElx9IySWVcyWsUKtYSdSma5VrvFAEMdE0fOmAuNjZe+taIcODl3quzmFOkW+CDcQLj4iWFmIjBR2yzKFegm61UxxpsBTmRr0657UVdq7NBT29H39CB+8EdWOI3gGuoDqj2wB3Ecn9LJpOKwGrrY+A30N509wwsNk8kQtW0eA5ozKBupFMbAuUz+TnkOuj1bP2TSJAjdZR06UEvnYYVfWg+TnY2ZeSKq4+ZOoZHEYq14qbo4LbXj6plFje72xXnQk9QyYyZlQppZ+7Dojq1ZH/f6ZFBBGbm5P3xi6Dm6Fz0BAkgcKBbqVPrkxOAss0KLQ6sPNJvikBcFuqK5sstQyKETY4sCS+KFXVf6LuyPJWSjokw2AwnfoRH7NOEhq3ND9MQa7i9S20ytmI4P6uDANrr4rxkEv6alMSa7E2U1ayWesOFfRzZqBOIsY+M2Vamzqae6vMCBxQxjgw4lJAV8qL7Z2XrLxtu6egfyGoGtjPGWsM9Z7xyN6eDUVk1SL3UaXCVvIP4B2NPoaxSmcfsRPgqihJHIPQwd+0vV1ywqc58TefNg6ve79jr2I68UEEHHm9cZhWfzoyGHvK/Moag9SL2mqXMiLPsqT9mPDPpgVw1bx5jzO8ooWDaz1eHFOg0gOp2RbJ06lvPsyQi4j+1CuHPraf6eWku7Wt+SQ3kV5czVLSPzUJFfLrCQGR8XBlB7Av2JM55YWSfMkqTplCc9kLMxsTgQxlOxjszgiR5cC9jFtXatttnHN7pgwkU9Fc6qOE+RycSz3GNqe+SAANRYwoIWuC8cH0txO9zZMcMaRoNDHNGrRJyi3cv1JBVU+CzD+3oK+IAkHk9jjp4lhCJgefA5a6DBImxaXGEKc5h7dTTEoumfKtNPpEyuic0gTTaUVrO5TM7hOBC9pLjoV9Q6C6Is5NEV51gKIGQaA+KncmzgVaO7WrgprZIzQQMeP6SqXcNOB6v1UU6CA1xGPuWCnfXq7OD3HXHUzlLrgewLPXb7gv9yXyyxyLQTmhfJrOr6fWRI2MbGfhAxYamqq8SqvuHNYW5iz9HjRS6O4GympLkIwVp+HDQY7YEnF+utWCvbml0ydk8iWEdmF1n41Yyit9hsKoqWjVQzk7ajmd5KTgargOU8F+xH9mpYnIsVSVDboQJUQykBMSe4xFBFlNWNvIVpMJ2HeCTwDG7cxfGRnK1QKOS2vzO0dlnFMhaZTcPr2IZt9x9ZW/OBNQFAfupMjJDVMkdjWSeJ47e2pjK20hWd1e++kwZSdcux2fwRP5RWoiS7A/hClgbyS4W8cqAep2apeesmaakpZty6bihCnFk9OIiwPD5b59O6Ik6AZTwcA8Wc3C81jYGNglRdaNxZL+V6j8e4WuMxW13Fam1Cq2KYein8A4EG6HmZzTB6ltUtu/gYUx8MsVPOG2N+1U4ilwernAoF0S6pUmM+JWMpsKj6ZRfz0i45GZdMXtpCgYBZocnDm0VtTo+eMUOtZ0O7AvgN29NnNSC1oczcBaz1rMk3rSnxzkStm/HGY3V1MIhNuzRg+u6eNfuQ8atb9e5zq6YqRzrrY5KP/O9itZArJK9+PYx9e0aJWPkjZwC1I7sX/XuxBvidFcdwWeOVBteTNzjULbK4pyDewMlEHYEpHc9tZdME1UsLG2sOo30Bct9HD5kIzDHe6m5q0UAWjCiyW98FE1wsUkCo6yRn/R5eLsuN+a/Rm+k0qTBW+RzmOD1bz5k7ROUSBdEX5cUioMr7LFrnqOfYtBVkijMagitB3YveALsMHlToFoUs9TkIKgKEUzLah1Hvu09H/Bw1TdFpsBIaJNXVpJeyulWI7m+GG6fdTUD1UmaOsUyqKhcTfeO5LkIM+FbInqAyhQrteYWADgh2gF7jHVpYDL0X/RsEAUKbltTHhmCd8NKGSrp73eidEGwp2JnoIBhvQVf0DMCMqQWJxKEo2LNZ287UGGjxVLkNICaifgyhBDrhp1ZWgOs2c2hZwkoDMRX79/dlmBCsh715CpJfSWp2neyc8Ducn6tNh2oHz+AMUOaOiBogtpr7EcI/7bXmgk0+toucEJXmFv7HsgRGiEMUQnvM5DQ153FI8ujxXmCkPsMStR6sOcgGB7v3Rg4pos6VkUIqYU5Nbbuoi2c+UN3ZDdiOGOZZQvQ68Zgo2r8c0HvlpavG1vtClF95dyGAeGAUsobq6xyMe4nAQMT5uhg1ddyK8vtow6qEmE1MBKcrQ4gRyvcVTmNl1uYVMp6Apl1gTe1a1cQidbrkBhmFfo0hxEcrh0rtHYyTgUnR6LaNFhSsxhJOrw7WApnOua55GmR3ZMwhN9d6m3UJL4DMpakztHuVQxxq86pay4PChbtyOsOzufl+6xSeLXJ49pxVztNZk1QcKUwI5FiXAndLeZo/KCGqZuvLNeQa/ZQkppsTwJnI9oxVmlV0IXi1cBZSG69lCgBJb47pQrRMkYu0CZcCI7Wk9r0qZkonWzYyyIx9O1baZxSNaw6Xrjea0iEZVDCo43wtDD7I5g2uv6mfRBfrBVgOiDYxDgxdvNKNPOdYyCDFj0p9Mb1I8vMa32WkCUNrc9VtNTqY9DuiQx5tRCqKiClT75m+am7mOkJxIPfVWOAD3wAYKopAjg9V+ligOo4QczWA4RvHrcREdk30UB6HOiMWXjdMadnYmpjJ/0xQhwu0EGbLYkAIw7fa1fZ5KKjcw6xBaRzj5H8Gz4+hEqTezzug+9HfgW2W9yvr0j7dY49qbkOQ3Qp2P5VZfZ9trjTd7AXIdWM0YfEYzLfc9FPDjlVqmWRl5TP5mFGnTxkMwMMJODS6dg4BDggyOfnMD524ucYILmOyS0NX885XrjWTXqsT0KsgVohSwTJwRXkJ9m3Bt6orOlqv05U7TNdjfiCgd03eHq/8vcjJEiYDWIOaSVDJr4ZeFVw6wxED/qc9MShkHdqS0fgpQjVGses5HQBU+Ub0VWIdtuzoygzsFMUDyLhJx6Pw8U4xkaCaFE1+vmDgdhgoegEua3FAW3FFnQGjVqaFJZn2Yb4ewFSI8Qb2RyoUZh+0S6LX9zGgZc28Uiy8Mj3nC+fuujpIk2oFoQDk16NeeMZd7IeY5VYo20sVTdPbBBhhU2H7lZlEVX5QDXdVj8113dhqE/pAQ1oEmqsXfDEGa80nVJUmpWCC0J4RojWCyi6OXmLovSoVW0QcOnBfC0fsBA0J884qrmk/+ij6irsJLU2jY2JKbuEtn8/Ti3R6aYP7jqxoIVAh2nDL+qCVgvrhtSNobYFhvEkLVEsw/troOMf+onwlFuXyLiijXk0EIZkpR3eIuL+PZplgXRlB1s994qIh4ACE74K4XshqIcMptTe1wPex7H7PE8qgUJBFJMeXWiZRNvPb8oimV6nqmuYce0RpKjK1cPhbTmum5SJpmNE3mUl5c1zPOQZcWHn+ob7qi8OD1jrVVmGv2j5LLY6NsSoq9i4YAWsoG5z3aPm+Q1UCWqsYM8kOY2R2orzZ4uhJ7qT/cLVTMh6TUhejtqVRIxFQFAV531GXHG5JxnEkFY1+6luvZ/DsLa1K4WPZjLk9dLxZm9x0f7FdznQvTDNPaMGw7uQ6WnnnOO7J/uXSZNDna9gGPOhTx0FORgiWfffQTQItyl2TTLpbOvVkSOnwpkiCOPMXYjCZ6aO8hQJM5/KrEano3pDGi25K4D1KFvpFnpo7gIwYbK38ORr0pxzpqlrDFtJNy0QHZVoQNhAwCIQgXsPtzWyTSq0tAgdzgJBlxqo7qsEfuORqxMjTHsTNGRjLYXWdybOgP2UGRnqX6Q3entflEEGhgcJMVM7U+euiwxNLe3Kt6wFjR2XtM7bJAB8D3CmynJcwwa1YdMJPMcIdBx2LirJLkwhyvhtdgN2apP8lgLoJ6mvylMzX4ug5dYfJ7KxgBXgperYscmSZiUgiXcQMlTO0+Qmjx7KoMsfrSm7frK/XU5uuuyvb84mN5eavYnKESI2CblEb9LQx6A04wcl2TeYF8ydxC12cu02dkcvDpT0hTACaCkk0gwyfYyQ/6pfMvau7fJ4afQ1ejHXNxsyEhtZzwd9BWCmQgM1wJhxowO5BjfgmTa9CG9qxqnLV4lJnQy5b5g4cyqGaujckq6m0PJF8leDAJ33kwXB6PUarH3399eU1cjPhHf1uTcex4BWhLZVlHX0+lCvRCncgKWM7lcFJeZ418OEtCe3R5sWWMe0tKuXcgqr71uZldgYDZVdGulaLgSP3X+12boSVdFlZQ1eYoS2gVNR6HW/Jf4Zv2TzChLN/jFaEIMZCTAJoSkezURV8vxyTbFF8TMWxuq466JpI53gjw+kf/Jp1rWU5wyQM8LJcSzd/nwLYTBhwV1DQEVVe43GgrYN0rI5kWhZVhc6QhukWuZMJdBVUgNbhwHgrBJ37H25+dYQo1/grZBKmLh8D53Vod8MAtQuHfSHFu9K+NrF/Wj4dbSIqKp8QtVu6jrhi7HWPylj29WLNfD6ZxbUgp2yQIYUYzAUSGXKIU1vWTrMDbCbXPSiGdDAL0YUblfFP+x568s0m+AsisbBRG52zgTEJYTXvlPC1CpthBZhqHa3SGfGxd6IphkzzbV1t/BdSauNGs6LoWCF0aF4w/g4pFRxhQN39BPhtd3PyCKm8zRCy643iHnxcMqyVACV+0YiwzbrrtWB/TZZtjchSDSI1GkdxnFojoomE/Em3KOqaf8PBjZOHN+y8vGayoJ3mZJ3XzUoWC/ElL6IRTM/pfXTLyD40TZGHX22nrA79TQGD1zyEVmZEFe2K1BsdDE7boZKctU9EpbaY9CoVFGQWUSwMfXqnH8RmnXMwFSE5s0ZcNsSZ1TFqe7YizRpEvr5GaUIGwqyZ4V+s/feLhTyMtMA7svVmwAZvQ/jNfZXPg73FiVkGLa2jiYHzHZ0YMJhVtV/fCSFD/nZ9QHK1RIEt0BPGFeqJEHg1vpTJtR2blg7er+EMbM35JuUkW5VJeePxwPXqPc0Nx5QxF7EBa1NIDCEHO/o8FPXkNW97tR65ncsoEeDfr/UZn8RwCzZzNkMpI5lr9lhqEc8KtKO1uO474Ww5BDwHopEJcFSwAZI7Qry5lelMu9nCSG3l3LjvBZV2ZSdCk3mymMwSh0s9jkb2A5KuToPohH0x/QFcRwBG3dJioPSB0UTpXog5uEwxKoWYU7JbR2WcjBawUe/cRj/u4eDcPSV6NUQMMwBt4pLC098RrHunfv47zAR2XAnCFfY53KnChX1jbj3fAQzcHFgqRxx5/+bZG9hDcBmGl0TALYi9XlVAIcjM8eCAslkcCDbigOYhw/idc8wIn1JQD3FEXyWChNqOHuCrTX2xHLaxxn73dbH6Adrr7cPscUGI9x/gF1VEFmcEhjE8594AEnKWrIy02MaUyADU+z/lKHajUxuJYBYPsu8qbUQ3dYwWteq9ekbJFhywAYtjggCpRoJjsIxvUEU+RcNVwGVQ0akzRewCcgJC65613icqgJVjLGlulB9UTQ7PM4PjnyO19MngdpZO5xA7DcL36XRZBDmBe2nTFloqMzSI5x8SwBPPeiEmQ9xuHMc9zk7W3RfS7H4vOuB9qwcJ6XmLGdnH5cClsBWv2yhZEu7j7Z9qldKuUVKvfbGA+8hh7H/YZ0PJ7r6ZP24f8XOfU9btO/fKBgyKJGTA4e3NL47lFxUsJUaRn0zlRvtCaN8/laz5K4qb0fNOHAMt4DDhnPSG5w4sMCoMDWUNa0oI30WhPb//kHknCWc/47x2VMJRTvFtspGvWwXMoY9EPmIeuUMzr0cGOwqnt4YizR5Bdp8RCyAPSQ9KA4vy3rhnlNFkPCB+IjqceVsV7l29WBbJCVguojVmvcqQ4xgSksDYJzfGUGijGanGGSOAsmfKzlzrDSgZNtibIwUtKGhPQvH41NDAPlMIuXb6Ia8bev37YAiwgKsgHojGjAR0TAI7YebwsNUzyj0WJXBzGaBUwkCtJvyOJ2iRQKgbHKdOph1iQCWzHJN5oUHHMvNCK/E0ksoOVnQ1M3MTbsjyTstgElcDjExpyMDqpW/D9sjcvWZ2QgqBZacvtMuGknKbJQQLQNvUOjcMkdaRZ5v6FYKlDavRDhhNKoZeSG/D/YDNa52DzGUEzHSNGoKycg+c+ZA5aIFhrvxllsHlHL0m7RzUsIrdyxsCVjibuum4cKpwUClwdsoUfZ8e7huG6465vX7ONveb9ZmR77WtW2lvnG98Npupt2unwUa+TTAXYwY1QoBHQGAaPZSQ6FWbW0q27ukbOdSVfK9doIIXZCZexvLeS1SpuebKTSMkUBvTFKG6Bmo5dknybOnW8HFOnw1dW5v+3l0/a4kA2EwQc4E2ip7M57qq2MtrhP8P0YRAfHU1R43R0X0f62cFODVf5kJUR1eKgmET6wJdP472o2/wmwPICAIQ3OvhrWJGUKi9ttjeyaSNh4k7+abRmbHMJEAky8zGklb3EAEbBnE2Z1fSxMEWH4j5A0tUtCJAiDGJjpltYxLS+YS1PdlZSEapdF44PSPNVieB2y3uob4VcCPUBZHcuYnwGunJyZbx6LyVsl8bqY/KNP11W2c4gwk9UUwoIjsyLiszDA2rSuY3DmtseBbpSeR1k37rYh4nECYAbk0p3zTeh9X4j4gzVbPxZD6N1iHovCNerq7TVKvD5JFMWn2p/yVuNZlfJzeS26NBAWJSaGAhk+c6QoUM/o3xMzWCEvfWi/UG/wEmmlVtDl4oPBfS2WwNT7bUT4JRVTIzpSqMWVwWv6aGwMoOUhWq0y1/LFuliVxxlSqlZ9C8IHjBs8VtbvguLOAZoK1YIPcNB6fq2zch02K+XuRV18ihoLph5mkwsze04kJqPzagTsgC5hfO5IFRLKRNvlsIDO71sHDG2LXeeBw+Zql9MF2OO+J0McqbNz6Hvr+Ce8fpJgoRjWGmFn3J2RGT90vb7CHN1yquh+U+EaC6oy5yTju8F60t+ts7VmKsDD7evm6417B0/G/I7AktIrWpryBP2BpSzkY9cVjeR0q10QbaOMbw+FFRRIMqpErmvAAErPSNBGkvttUGhA/H6UU2n5UYY2vkMWanXjFlEAvTpKQRqxIFQTZfY/9RWR3Wgyp2EVdg30gq1ZVwTYOLTOaZurOVVy3e7eoHfXhdyxlGhyevn0VPXr78bRY5PNtq1A3bHT9WYq8A+74N8d4RcYzlrzivGK++VaEZC6yiqCyVcMCElpvdfvElQ8pmO2eOo/Yiy9dVC1SQK//bL7wc6r6dpC0kmNWvlrMkYJFNC4I+fhS2LRKkwuWjNzCzu2lTLWXqyUVRgqn7zNI8F9NYqeYVq8sX6GaOhaZ5VOdkh7rRwLeY56R1+BrA/pFH57QQuDRGvzLBqW5tlqOjtSt9fjDqBqnfpqs1BsBCcJDXwT/x6uNwuKbDtn2RMSSecjP5Md5JCoRdjfFurdHTSuHgfN7i9AZc/LeTN69VuIIXZ9pmwxBGtEpBmckIkUPZiJAJkqOZZ622S77c0RwDTErPnBecWQAbkTkvz3R/yU4fE5DhISV7qB2kgMwsRU3zdtbfn+qYU5ZFEM63rC7oOiap7NHhDEESYGw3YL6gftyTOnxN+ytJDDADBPpGSfHZ9JXifnjiT13wPyuVsmnOFrIq0tFqMY8kh8z96O3BfS3M7B9H+1eDwJlK8abEW1jz0HspxexD9NnAe3RXgiTothRxazD0aOUyjPbP05UxuZjfuc5G1vF7Ypta4Af3D4ohDL2BP3CsEeyLd1AnujjrtSQBGl6VrilBMOihqmhEdFA5ezhN/HbGL2qGTDe4Rrsa3W7Q5rXZDiZsZpDIfRUwPFNZvwWiOqZn90IWGJ5rIV8Og4YXAZ3plCQgX3K2pawiUwZ3LWEHcRR8GXuzVie/ecfAp82uwXIbdg6W2bB7sEzNDoLPrWP3Iu2UaMAmoXqVQuYYO0Gb4RuCLl4qK81LM9QrgvcNhDagEU+9tpSun30vJRF84EphaKwIhd02DK9daKCaBIciqalBDg6QrgOj6QRuI2BcUjRUtfGpqi7GOWoV+f8eeLzgTJoWcabNpOnSovKyrWBr1/SMSQuov3cyDpfrVgWMw/GdstyCX8cRPtTqr84pTYipBaP8J5+m9iIouEin/ciFydlaTwPmR827c9OubNqNTbtQ7T78q17dWlwpqQ6JfcPw+AEuDgPU1zJxaKdVSbsHM7YuJ7ItTEZD8zFx9FOO8VjVtRtd95+tNUOojxoUvICzwvTjM9IrgOKZHPPQ9Pc70OtKKyBOXIc9oGC7Ca4DDDISEyJEq9Umoyid3ozuxdEciY81FkzAsKnTq9PBgtoV5iOG+q/lA8O2Kag7jWOPF8WlMd2y1FDSD8DtUc6CMp2TVRjY3ep0Weyw5HQtciKkdtgcEAQfssqtRv/a/R8xXNwNh/ugY7/Z751yKTHm6C2mU7CDW1WU/pjS7HzHf22OR1OZVTLBWM95ek3pG00fLGZi2zLmK2TMZa5IGOFM23ITn44HKl5ghi3kA95v5OnWV5nNHCTuc8DoXIZREzQWDTCxMKxPHP2AOGirHiZotEM3ajpbmMBxIFO7+ZHswmdbQY0FHgXOSsQxvAMBBLQawVdDGqWZKdHoML/TQYg+dsjWBl+IM4If34ZiExntjwbHB4NTt3UUoVwIcUNTdFcAP+xzEYaurwRkGbgJuO1YrAh777OjPqeBNe58pK8+cCmYWgjywcCx9V2UzcD46ezGOkQ523JZXMfGmUEOlcOG49JECi5/7A8Jc3Z/jP1boVsgQx/RgIa/WmVuMU03NmEcZZi6pfNx/+efV/u3HC4Gy0BqYnyei+c7CUGYl7iWyRB7Vic8TEiCxwB7NpOSVWEju612jtnHANsPH3l2QE7i4roFg2VU6Hws8TqWUpyNvj69BWSDqYUpTGE5bK7YFA87LB4Cbg7NdCncfs8zVv+HSocF5hzodCxy0kI4ZNN8LR06pMswtudT1+1RkxhIBZpFwSjcLgzom6EvoZSQ/8gjnDITrpOPOChqQNmWwgUdqADuKsIIXnhFqSIuX8nkuwrmqtM7DbSgLpZkbjRMm8v7+QC3AxV0g4fBaCV2UPpTWW5vI1WSM1WOHhxT0JBS44HN5kNRxeWXgsUvR4eC6S5HA/z36NQKniOFR1FJM7cqJWaNcrKZrUVaNM/OL1bXKfxrJvEhLR4zMprz1Xx8XydWpXy9iwWWWleG2Zzsn5JnHeYi4ggThgP+Opv1FVejYJ2nuRedF83xxZP3mai8Erxtn8w07EcyPHFxLVp4B2m2IBIZ5WclWxRQvK8SgYioUJ5epMky1XwjRbiR/LuR51URIrKDwIbOzrJphnwPMO/o88gZGVQayTP5TUEQI4YXgiaMyV+A+IdZMc7GoteQzOmJNuLvo/RBphfIpipVqzR8/0cyk0Zu1yDWIVcRk60SHn8LiJCpq9lnKyrewZguFzsYQhi6lOWqPgNIKB0jrqebUdko7Co0rhzlAmUE06aBzVD1MTH5e4B6wpHo2reM5YYZ1wmq7gNnTiwTGjLosDbAuFQ7gA730eHxQ5t4qj1rRcyRvcbsqSoTNqQX1H0mUbSPzT48rgkaw3U3BWWUjY4EwFMV5t0sofIb2VjC0URdTKHHPiwFhyISVp1TP2MSrqE/ezZct4CvAnMKNPXFIVbYKbe+235H00i0L5KtNcExqgCILF91wy/t0dxTeZul+oHiOpYUOzxREbygBOowiJslSz2iWAlFHMV07fL5qnDAkJ2aeUQpq0Pyqkh03NIlJ+NdFYXNG8P2k8e5IjTdWSb45FUxxu4NfWWyaUt2bO0rvyjqy45pv/lvlf7sWM28Xeq2HwXN4OPxIikvx3STiea3aTegeoPxuVeWjbeVAhwnedt0bymlDzVtdPuqNBeVrfaS54d1dWl0V54usP6OLad5wqh7S/T1x5iyhgoNUck4nsV2oIB15DGUCZ7whuLV4/ksgLiXqL3296DsNSPZFbxtrkjV6t2uupcggQOToInZP46eCjlanIV6ZikVIDmGQlYeVUmfsq9wK7nKRjXrwbXkw8ey/ofln5pEkm+DoGxIl9JKrqo7cFuHMFDYJhVPOoyBeHu477gV6A7vHjWhGaQV4TAQKwGgW5ES5Pw2cONb7D3S+PqslWEfYe7FMFJUwDzqicM7u8zIHWpf0snqn4+F/MQdISeHd4by4uM5kc6qnoukNUOfyKmGL8NMdQzaj2xm5WzxctoUiR3OIznaIRTFm6iYVbO4w5tseO3q+lC0G/ExfqQrBg8n6aMx1to/A5SxU+xUxLxhKCfysTkJMHp8HPaauBoYyiTBKYrBWEHC4JJsrNMvI1fd7fUjrwz0koaCohh2xOwHtM05wJwsyvWqG9HmAZZtUt7UBTdjFZGKRzbqHByUyTWoMu+LhivTopu622D7ZXzyQitZST3QQnEk81BH0owdlllgDS+NkBP27b7YbTozJll6d8ew1qk36qh02JIBOxXcqJEYu+PrRUIwDHRTYxZbTTDRybVrnsZ3avKkNHGDX9kqaelwH0JLfhe0+JAu/BhOb9+03WiBFLLyvokY+we/7J/2NliBzNJVWi5AXycjm8im/DAqtj2GnkRKyCzvUc/TcZX9mg4fHR66yaHZUnPDQfdnEi+UQWap7llDV6kyizXY/kWrDH1DFLeVGYpyChRbGdzQMzd4pCCrlWDtVM50cKTEoCyLbBXdV4Pp6VA5MjoqTBBKLItUMAeo7IqMCDwTcZKKfswou+cEiLo29MPuw5R9RzMp479UC8rth4yGmtcooQMdG0lK7b3Pbk6U+TCO/oIJBdc5eCfmGBdIcD0VcD0H0zmoog6YjcDY6+slhloFaqeOv55lU6gDQ5qTivm0/QxOKoSJ7jYZEdPV4Hmby2fKTW7eN4P/1QqsPBzrU0oiT1io8e/o8DB0G1YWEE0Gy+l8224pjD2zLEDsxYJOjnOXS1FAKfzTIvmQLdaLkOFqIe9pAjMhWR4LFsZktTOUc7hnnB+IcpMV60oI3TcgcHNeQsFS/bLOKP6NEd2CU78biAkfZce5SLVwjq1TGCpkAVeQvRDNxO3k9RXclUFcA8rBLu8FwRB9ZXJQn8bP/TspE6RN9FtMeH836kRkUEBpI84bceaM7cnuOitPTuLWcuAlxMfbHYMeWk5TZu4osxDEqPjAecFTNniCR2IrHNrIKygmRMbA8n9ESYgCyAVuWNDsaUgdGGGNY6r3jcZn33SNiwyxbYo865VhyVJ7euHWFGeTaaiOdfuN3v71Yqn80AqIxUvz0OJ95Gk6pm7f4vL5k6PvkTwAuKksvEPRsh85hAA+pZM0FzE+ZIJXnuubH/vWstuDPEOejC1eWff8Zp6l4I0/AFbRoUiBKcdA14sjGL3TzmnPNZkLgnZTjrXoAFYJd8BvzTIi0+6wQ3uB0Js+sC/YjNDYFoATdhmJJdI0ThWl3WM0/UdtVUKJ2vwgKHLv4vuRrmtvHfNgFTWkZCEfYXAAxyiUHURVrdoLjXsUoV8wLWi5wSm/K+qdtipSnN7sOzGqFZgdnCH3EkgbVLuDzZuDO83yKedpcxCRTyQZxuoKKjbw6SKhi0cNwvYNlnChzFZsGdZcxdiRIOVHGumACHdfCK+w+k7bQ5Rq2S03LOrJwrXexqobaj5nKvxPYK7DNzCZGUWzFivlx9zBNDu+yBXOUk12SDApukeWv7J8WjOdWNWOnWBPQCBRGgV6FCRbUE3g+juGRNM7xaMRSFtofgFxavy1oVFNDQ3yA18DucJU9/8VTGTW5ZyOty42FOi1JUbiTvXb/ETlAnTptL9RS0CQmoIaImMpWGJDNeDmt5CfsP5MagMCdPAF2k6jfIJclxT5VLqQpBSrq+9vvCYoO0G6QOMV17Y8mO0CPlDATORhRRvQ7VhP7f0aTtnXqOgzJqmFpk9+6rPQcTv1Kr+aCqOiXuFX8Dy6zjrwYTqrTfjVbRja73+87TmHNT4OMmmsDqzfgC7NtwpJHtJrWsY9asUKmC3VcqPGdSC1KnacGt8xDsB1DSEXiQAl3sSZKu0MJJ+SitYaJc12+pgbEsaCyhg0KZSamL7c9axtX7hRUhQIT4eDSgmS6Hv+rdzdytufJJJqu5awHGorMs48LYX6RsswnbuIZQTqgrJ1iCCKGD7SwLCPIYqmTISuKLqzzqXJ5XWMerbt74+QixvfHuBb6Y2kIxnLGYf03hQaViumkiqVhpwY3L/nv9I2lxR8eN+VAXwxys65VRMSv1IpkNpkgGPzzGFtZpF9Yw72nRwixqnJwdbl4PSr0waFf8hakwK2sLliICkFdsTKSkHLA/ND3+pTYJiXOPrERvMlCP6DTgrWkuewP+eQuFWF5afwZtWKEpmpRbCUzqYahNUNnmbZiCmfgqKGsXYlrfUqviKdF+eV2C25mHFSJa/KmzEEPq8uilXV6HL9JxgEaIvBvoN0wzSRGH1nYsYqtj2xzXBVZBooxrueio4rayWIboEaXTMIwLIszgV9WaBqdF2RxcBlelPdZztWUPNyiCq8Q4HRgo4OWl2WmThUszkqgkVnob4gRqLBCShf82QJIxZvFDi0zEJyU1SrgwWktVpEVbZak3VgHD2pML1eH8JYCS4oPTsDjVgG/Zhh48lakEDoLZo7roo5Jj5TUazB8jCdZxbZ5jCt1lRSlsArgVB26GVFOcP+mX8k+8fvj8Ov4UPrU+9ySThUTctsAoH34jjery0HmMRlwo3dRuHnG/pp+i9ZzflPb4N4ylsCsJQ2FZ7fvC2MDaG/WttCf3U3h/Wr5zIIn77v+ipWWFYtWvATfJ/DmdcAybkPPQpTxo5BkiWQoUrc2x8IVQa3PeslcBc5mWooWAJCVjJSLLVNLoxH5lpYJJdw/0GXKuv5JeU0o770sX00X+bUpLTJsby2STMGHl0Lxg5MvY0zMbng6yiyh85B017qjIZkHSdbN2KukdWJeQnDlnc6hrWVf8z3Mnw6Lypp6nCu2DjB6iwr7ozMtxrgsdSYiMvS3FVgiJCxltqCAarIf3H0jGSiSkZpXl3AanX0EcBCkzWHyP0JgWrML8fGy17QzFgPDtK2yT3aj/5I60gZJr+X2dtqYzeanQhqNswCQ2mcFwe6GcSNIbCq3YG1U3qWvYhnkWUoJ3nWQeQC+6LsOBNnL2/cMb0lx4IMsxfAwdIV3L0yh+o7hU0nAnaIhQXs8lvHqYqRNRipTzTfNzeZtACmlvqKKCsxRL4wKcagFxCpRIUxHthDoohBMRRLjDrUOJnECqEyqcYbq8iOYSVjAL64Cp7ijEsFZI0EG37YWWjDn6AYd5adL5JlRzqFSpGU4kUDxQk0SplPo5MCch10VkBXI0VX2dofnstg+jJZKl5krMTLFPK+i4N9iV0DKP75g9SbZxFmBn7XHSXbnSIhUVxBq9Uz8ORDQbKqljV8dQVhndKdQe+Vn4RqyrVUoROU6xpc7jofSyI1jCYghPMG7vJjwzIKM/cUIB69R4r1tijmz/lhV+zi8XVRXqYQNdvcyrL62RrYQzej9QxEUQMfPY8DCkoGWwN2EG/4kML/KQ8jLwSoEj0Eg4cM2Q7oBCqCCF+mKZ11PACIs3oTXEdBN3gcvej7oXUgBFcWjSIIOXM5A/GyEAT3DMxGKFJQKJKE/JAki034mjlujzFBrk9crSeLbNU11rbPE9cL3YxyM34fPqnzoY6fZTnw0f4CU+MGmEBn8EU8hdDYc4eA6ZFfrFczcAO6TrIV6WINk5xSyCQ2UyekljRZDKubKq5Wgmso71a+eiu23eqGAFeKgUK5IpfqAuoCHe+K2SNvqJ7gh7TXfqeSi1FF12W2WhmG3ULAqAoWNFbRRQLRf8GFQHFQ2LzJ1AY0SNST4+iN1TGMWUW5g9RY0CAUh9KdGbyMnsZeHOBI8vtJcJbWq2wem4szZjLVpS6wBeLOPH/t3mrzaSkv4PHhCQpSBmCDFPnbRCa8URlPbgTrL9FLSInDg4GjnwqLF/bQBItZwTVjg5zhSfzQcdyCIWPovwjJnFI1rUH8daMv062q4ErpMtaJpIotd0kIVlEZxUHFXoTkICHdWSSqK4cnaFe0ILY2xke0w51LE34F68WZETeB2Y9ZupwXNxh8AYKmJ+kCrj1QupfOf2g1JfMWzRMOk42W4tyWdFtw8uSYg+Sc8xh6e8m2REbXpEaVF1Mw5qKjS05yJzWFSSDvHXQF4s9yvD50GkU5Lcu97HkWbhxbAgYiCitpEjBdErShLBIj7wsNuJLRU8VAKrR5AvUPLqIh1QEDR0klWQUyW5ckTIHSBKmWr0wmtLRH/rI4f0rP0f9FBYnpk2RJ4T+YzNGGIZQATRtqw7Fn16khCGpqp6Ovg55Tg2LJmK35kSbq/EK4hXshUapGOSPwhh1Ute0jM7dp+f1x9EfR4pjCgHxfpzhh1SSrT6wq4RpBXUpYazKznRJbZreYxWT3iHyl5B/GTeyxIm/yi6RwzCybJM74zpQO/mlkqA1CKL+0JumSIvLfnqXAf8sp7QktquTKzGdlRqE0402onJeFF/WQgdRfT3KBGEAF/AVmLqtiHCrNjMqnnTNBvZV9+ITmu8VpY/M/dNRQpBRHY1XLEdGmVPzQJ7EsdCC1YFh+W4q9BTtECGAyQf9F92FUuxXpag5GaKI7GdkyA47dH8NIJeZug/nBLt4l18UfkH8n6zNwOJ6N8fhCHhSHFj97/sOTn16+H7968r/Gf/rphx+ev3v+bPzyxevnJzU75wTrmXvGCv2qHcdMzaJ7opnz2uuRshiYHa1cO+OLD69hzuMhreMEC3SGUduxRcxNl55nuW/LTAtnRMY1LKPl9sQxJcji3SAcPub93a0W/ph8qGUDFnNARtbIgJBOXGzXdz88ffDgwR9kEC6g53AZlGKBL6yZ6pyPtK5em+eabwVuyIVXdBG08ADxJl1JzcqslRYaJIkDJUkcSJ00wNG6aC15KC4OEaaoUim0dGtChVs362oDAl+FxsS70c62dK4NiWXaRn8s6qa/en5GeiR6U4+ZBnBYbmYd4aV8EbhtdyjaliEwA0TOf2RQ9lCniMK36JqmjJLYefYOLfhZKcwa0VF3nCo/ewbVNSMMlecwCwbf5p5dd6ILCK5ZkI1rdyo9f/fn5+3OJVaytjiYgB7ifFRk5mSH5a1A7ZuT0oBITGaEKZAbk6/ynGPNnGU41n6i9FiYibwoKeYlZ6YCrdu0LCq40M8hfPlynk0T/9jyThp5t/DlqPmHHjWyQkDAbnPYKESCE+YTTh7j6vxOTyBikXbl29tSbuPs2fawwa32jzlrtj1qSGIKUGBfcv40otwwiC1E6lqJeYOo3OdDBhWRNp3s14vRFsncUZpmuM1S9D+LEK1RGGh3auOFKVBbL0K74854w/CnBcf4aQC2k+hNsVwaAsj8petVMcbwJDI2Swt8frfOK/Cqkm1ZecR9wyUjaQIWoDNVurxjrF0PxXS/DLEzGCEJC2EUF5V2oZiCPgJV0I5sTzcNrCqWHYGGpP0Cofxnx/gnsjNm3OyL1JpkogA16XwMvxhZwXCNaRmUVVdVQTltr81jTGdnPDANfrdI0wGLpRfYqSctdDtkoctciDJg8VWs0lEm+iba/zkHO90yFosIbKQXwUEZ6ADf0ZSg6dNwnKm1YnD44qlKAZ1W6fxGL+Mbw75PApvpiONOBlMVcVR7m9mK7KAeG48LzzYpeC3yhC4RF8lyKZGQr0PqAphCqr9VFULVCFfQtIDD95whVto9lvZFHLZF02eOjLb55gBfKh6sxwChjRQYa41M4xpT4kQHnoARFxqV2UQUcuFuCHLVgpC2yEHlhpQKpZYKBZqCmffImGLnxDprmkWj0aTLrQVmF+DBKLqljbP+U6w3vIgODsSrIbcRx/F/aqxXekfOHfy5qaoOJCbb1JfdhZlMkvNNpjrNcRjRNiV+tagwtBPIN8Se+K3C9Tc4lGwMSBfwOGmK8t3KQcU5MJSja+AgwdFvz+W0PXZCLifbQ8NU22MhOrNVkXzunZfOAFscdRopXJcTitCsc3r78YcqzsjHuMoeLU4fTDsVjJlM1EjFur1KS+SSa8hREL+fYCxRjHpJ6SA5wqxKcWeYXLubmcPL8gEC+7a8sZuASKU3Xj3VUSOgHqh1ZBZF2YDk92R5uFuAGmckhwWLT5N1pelCEsFKgL3ZZyJEVmYPkzhgH0ObT+9zc6PrKdq4w1VRc9tixO4+hY2vsg9odIW+vjJU8DZRpWU0e53YY/9gv8ZccA5eqOI1uiznAi/AzaZMF8WVmMsit2YNL9spDhSYumFyLg5tCy1gZPEPHhRvDuZtsmF5tTofb81kCzBZPWcC2/DPtK5b06HPSvQcmvdJpEx6z7n4bNAxTaUSiuCuJE8zoPsmaiUbbiRWRoutKJZR3idbTmM70i6zlbYEzKvzz0rF5IL+MxAyY9LC2TeuvlAyOYNtKJla2//7iFkArYP0DGK6KC1CP4IsNv3oaxrR119fXjspkKwLNwy3CDtO7OzSSKYHaIOBRJTJmq0+CCdO1pQA7l5UG5LgwA7HSM8UIlga+HKjEKFRdGFargX18UkcDAtD86lWKS0KZGmaYjII2S6aqVfRWVZW5OS2AEuTmKYEdRZyVqxVwl4KEliYXQVtZmOWDR3nmJV5PCWymzXp1cqdbptLubkwyRX6gLnr7McQNSyhRKfkqScvK5sDFUgKizWbyav3ShGCgwMJzCQI8llve+0g9eazEoS72dHuNAa38zpficri9OaVWmQ5JEeoxKFSnd0MB6FxV+spOBxhBit5uc/e5GM+pavhYV+e2Ea5QGOGKr7WIq0deXlbSPJC0UdobDqogT00Q7tET4ipsimTapuHHKn8kXA5Tu3rYPHeJCjLMwqtrulVAVSkWAicrC7wprmvFwI0mVkxYzd9QpdwJnm9C9yM8hj2TTlhl8X6HG3IF3H0Qw1xtS8Lauhzt+oZXgRXxaW0MlZG6o4GFlPbE53s+gSxngj2jMn692KNdBdDJKDfhUAnXALBxqEuTpJ25CWlJQbMJC+12Aym0hR8YMVAVoWVw4HnEIJbTyjkN43/hg7HG4UC4OJF66sVRCWyZIm5xNp8gIb5+s17bUC4FKiKYVfPjDwWZpx8daSJdYDEi6pdgWczysvB9gq+e4aN58fR3zIwgbDcTTQOUV5ac0fb8ODDhAPTYqjog9rWQTfKlpXsocgbJdMbzLekMAGTNGGtsLxcQNDgEybWAQ+iTEa6pckFj3ery4BmekdxBFy6NiFRixJIXOPkoyJdmkmoTebjjtwdamwoyOSFPX0wXu0BgolwCA0m6UUCUa6BY0D8tBrm/WiO2Jstj8C4ZieUXFrzKlCOLjMMUszLZA8LjWPJ2IiRM47+dCO99/u0LsqjCURPsX8OMSQ2zDC3jzMdbJhdXopi6fNaRt8+Ew6wFQMF1IJAaCYmkFmRT2X1KhEZAxYK+p5SIjxBa1efcKHLKW/ONHmpzEjn1HNYHjJ/8rlEidkacccUH7migNr8A8OsyQkASLUFg4csIMeYTqjIDK9J7rfQg2N3whpiHsBHEYfx5CYQfgAnOPzKvsIKSroW3rt5Uc2XYf62xhFa9imcDN4Ajz7WsjTkq/F3cBBCw02x+dmQ7qbzAwGB047vk9V+6AQ6jE3SDjHwA/veN5JNOR11iR9OLzhhGs+3mV0TH1pNsFkBPdmdA7BpnOaWyWpHivaP1TxNl10D/200tjeG6IJZNPomGvSjwaOex3jP5wbjjQyM4Lk/gcP2+emW3PPfEhBjiaWVjJAkvRYLjZ10jGNXZmauZZgPf/LyZci2VrLj27HeT17/e3SVFZh62K2pDiN9TrdivcF99gvr3bNdkd3drRljZG/01Jnnq9pPnMvaQx+HHWevRZWD6p+Fi8a+Hkevsrwm/iQb+EJmdNoW0reIZu2+wkTIN6F14QLNQC/hmwZsyQ7DlnIxcyu+yFk3gzcOcMiZaVJgWcqHkr8y/jj4khjSG9hoJ/Pr5KayByZnaV0FBIYvLLD4bagcgPH01A7Yyb53PCmzP0CJJjSwT3/NGZooYbxEzLCgUXYdx6jP2jPMOEMnZMu0Sus5Xd6gqcCZPEIKJwYrfDS9cGbzMzLd3UlRzOWOmSQzOTvwGKYFVyw7M4Vs4yC7TgzZ2NujCFNW9s60aFVm5+dgPh6r7Yn4xRvUvQe0tc/a8gdJE25NAVKMQM0NBBYq8gNk53Tc3MyMTkGL6MvH0GSNKppvnyxCZ6+qeeAMpRr1wzFO5Z7FZNytHGJnlhwaB4DPeTbLLPBx5Bb//Sbhhbu0Kxft9rKZk2ZgddJSPQin0rY9tGbK6mJTjUmZJpf/peSt+bwTHtL24pYv8QyHGnH/yYSdPbwIkvGnMS56UY4xvjp8QVtC9UU6CnL2kcCFgZuDhCUeO6eI9Huxs4gY101S6lH9ivahR/tRL/hYdehj1LnsHEedq05065UdycL490h8ieP4dJu6mAVjIFvAX7KZcM+wiN/r0b6ajGO7XfX86LgOBJ+gm1YK7iTRJrvbWRazTq/vxFOi5/chjCIuDQb316JJwDCVbExHWC2ZTCHdJXwV+NM5jaP/6ZRjlzpIF5l9kHbjibYOV6C6nbwaHMtGe9pARke0X68gcZ+KrGdnSYzNWZG2ftq2D4LPQ3I0FT1KyW00O09ePwP3nQypKVtD9OLoGaWrgBsNsLIs8r9LTg8GojpPc60P0gPgZhA4TTLlbaLBd77qQPaO1UEKc8pA1VHOdhhk+PbVEPnDntMwGsAr9pbW6L7gciGgtHhKAm0RdbK8AxJ4RwCDrxLxIE+coK+VFWv2IPpI2akQCY7xMLkVq0JZ46tIvZOKo14khaMq6hzMo690bQEpKacXVttf+Y2H25YnWc9uXlc319khM8eRncQK0G+Jqn9MDhtcia+G4SWw8MlJxhP97SJly/9UTytHG2WsVV7Kup7VpE31jqOfqjXoMvpRolskEcBoDxQ/Eu9lyFvSVlDuRk2FVY7JWNEb2KZVp2e1ilHIVIwzXUkmVI3jHgbARC40Q2US5M6MVaoCza1O8V4VZnBeAJ8akec17bOp7C6oYYzrOogbmEpTMcOMQjZv6kqOy9XNUggK8p11RPDBqfNkyWFzqqwmGqloP9smh1XJzonWKqGWc+Btyp9l/ezt/ctv+VFrPaYkpPer6mIpZKF4eXNnMA7F5/HDh/hXfJy/R4eDw8G/DB48HBw9Onr8GJ4PHojPv0SHd9aDhs8aSEEUfQ5Q/4wf2DgnHKwYDsUyXWOAcoEGsFfzdKpsS6dzMVeC2uUFpM1FXy20hRHi/qSK4elY1GI8EocVipFIVMZjCqA6Hsu8n8mkKuZrwebT7709+VygfLaSv4pKfqMo5XC3Kx8IpndvD+KoFaCWMLtKVAqubiPKtJeiLcJMX4VjPIYKUo3PONr7vEDdlQxKcXLy4/jFs5fPxyfPn755/exE8MyQeraoIAVSml9199+8ff765McXP7wfP3354vnr9+O3//7+xzevx3UtADv34PBwH4wcwTRTTCSYZCYr7i5EAU4gmUMkiMJlqjSsOYa3XnqjRC0WauQyUIya44f49Pdw6LOyEBIamkqcCa7nGs35JOeDepo4OoSc4aCwrnQfKnsm/vL8+dsnL1/89ROnw2uG5oSn5HUBDluzGbAkqQyWKJAEAuOhT6MZAMNcQN3X12+ePR8/efbs3fOTk/H79y93725dS9Djx7yKKCqNswrtvK6EDKlxn8QWUAaoZ76jgilJ4sNVmeQVIvfQqIiJzdUrVoFwXV3DvSlVb2LdQegzZVEaY/BsiOfbpYNVOtrgkMZZnq3GY9frlEPATSFHrdqO8UvxoNvDlEQQcpm0ORIbDVMMSttDU+Gk9sJXcIsC+p5DB15Srca4eYck58I/hh4ICwkKPoeMQqR/E105SVd8kUG3MwLDp0nJKbK4E9TTAvg3wjaie9lKzwRSBXcaZDJhvaxhpYsXS9yZhZhad2NJo6mq0lCEMrlWnlK1cWKtyVEYIPbjU0UyABs0IkBNyU79WEDAXuARyFI2uyzoZEB4laJBGE0NOD800ML1AgZvPaFQOytpd44ZMKiqzKIh+Mh8RSIYJMpGFt1wwL0orql10n1Sn0EySuPzGNcTDp5+RKcHaMjFgmMiqVh1GeHILkMvy3WuEmPLnlnB7OiOINJrXF0kJfdwPmf0h/A+IE0S2gD5vOFbqScaySBkiybOOjq2WHxsuEz1mBBlM8Ip4JGpedAXy0mzjzaEZR9vcBiM/ZONppbCEOM+KnkMMucKxr0t13R6zuniAw4dMf9zjtlXpnAnCKcQdaYfYQK6NNeFZcehO9/hTE31asuuJHj1xoK6UjV7lKdvjWVYd6729akVLOsdOi5Fs2ZsaAG1C3pwRGnvWStqaRfSiTyMeLn4RtQCJ3na1UDXdEPvcQ350gzmtWI+gOZba26QnxItnYOlJWcFwwqGZQPjGU+7QOO+RNm6oANGCAHGdEA+syZLdZQVg4kk0BEOtQ13vHQNi7fZgOVSJwSv9AV7IfGuK1r3Q7yIhyAnim11gVb/QD2YotzIeyy9/XxXJHoVcBxQlhQCo68x25DcpYoQAg21Bh/0BGiqiMnFcBY4JbTerSt1ER528cbJUkh27B8J4/Qqm67GgBXuIYOB/IcW9mFqT5hh94ZFRf0PXyuE2hqJdiCLiMFlBDrAJ76d/tM7NHGYVN4fJ3cR5s7gw6i0xYkFex08gN0SfKzyItYUliyBRw3qLybM9l0ODzLXjlVb3XDTgSy/OsuKbFmVaeYrmNjobWa9xTsUgymCu0KIY9KaWrzEkPhMY3qUQ0ttL3U1SdtOmtxiGH2DvFDgEuwhZpnAc4d2i1YdI0sg9o7k5MikRmqcxCmfnKdlTdw0nr0xyZO0Pc0h4hzJQViDNgipnEOjHrOejZk6TFoGthFAxNjCB5RncuY86sVtG3fmxoyJLcvUhOclRf9M0h1qhgSu8JIS5XtkK+hGS2MATLwKYdSKV6lnfjBTI5ox4U7FSwFgPBQwowfQIeQ7E0zSkINVlDUOw1wNQ1dJAzZUaFcYXUaD7iFDh91VwDAdFM0Q2bvlBYkDfMxCdyUmbU+D75LIOhlvVfNMQg/M63T9cpPoxLAlEoUo6y5UVcobePvvFanNdl1PkuX8cMuAkObo/QAlzc3R4VgJMjZbC1aPeCwz9JJ5cDqyXy6EkfBkKvZHpSxCvzdr9ckD2E2qpoanh0OBkwSsA28pv/eZ1m0GT2Oc+8e1MXx3apw5uBe9YrYN2ZOZswuii3RuCCwZuQHJQEA4tWC7UnHyQWRjs8omA/fQXzaV2gS4lJQ0RclPUhrRO1Oewsw11wrmzm5SYs0wGrmzbeWgstaSMsZ2e6HlOzW7hNGOGERjP8SyJDeckBDu52UlCBfmCyoHJhb2o0ModRgfajpgCxCO4NBFYHyo4Tr3QhVjFhidzWyWwHs0a/fACxdnNjKrlqSzDS+7cTcHdTiWjzNJT5SLh7SsUr6lcF8kRhR09buu0u3PgraY6U5uMN1YiznbjLZbE0zZwFQgpU0tx/M095WFTdMhA72muUUftXoSVMFPSBP8VAiLaVg3ha/o1Ndq4+KMrycszRSQEyli4dGurjrlnQZOGWYjcKXFJg3FajX3lA51qmNX72DUhQ2qf+2gQtDjByUCEFBgIQ++jzDer9Kj9/VEGSsITInBsHLhFqzqBrEb1oF5NuQ5eabhbLOtSHzGlvvQIJZ7q64gkvnljTpypoAmoewA7+ua2H6DEwzJ7alGfX4PI25gWU9hr8m5IO5UaHR4Gv3Rw5bgZuIKA332mDjB82nlrt1AkVV1Kc13rQPHQCSnJ+qNkc86F3Qnm+mYOjAnW5wOekKXxZKELzQNse8zlNQWpBYnK1TyZmQ7nEhaH9LJyBzN2QpVnKBAa5An+0ouRTiGBMYJllEzaoaInKr2q62ozRItl0n2dPlwOgcR1BALOm9gg4K68sZ5rjUctsJAcgaKN+LrA901gdvJalWq3uFO9m63uFTXhMZlQ2f0VvJyjfhryZtS52xJsRC3egLuRAE5dl059tF4z+1dl0h1SY02QRpNW7MYUtIZM+wJTHpNY1OxgIupJ4r/WkdyCtfL/qEcjCcxBptpjWTph+kY7Gvom9i3/GjiIptkFf7RBgxfPp/08e1/xIZdV3dp/kP2P4/r7H8OHw4eHLr2P4NvH32x//kcn7b2OVguXqB7Ipd5lVVwjrElRFaNywJqJLMFBI2bdcktnemG5A7wGbUTM6oJMWe8SFbTi67OddkRDcOZ3zmORhZR9NNhdpSHjV+6vpaqDcQODL2fcLc79YGDOtRhKA3EuqbkrffUdjbR7+n5bU/P4LKYjTkaUOvpWwouPAXFQ+cd1ezY7aFDCqhTdmjxRNY12kRDL5BGbtqvsFqh8GLLNXgHrRrTGp5wc8Io6W1RcofUT9UzrHEPXEAoNQvpYwB/OYw9dwxyif0rFuaz22mqbkA19jz49CJZLm/Mk52yBKk4K3l7IJYEobykYd5gnfbflgVuFzGmfWR2dBlqDEtBP/ZtLkR20eh1PZQfKPjEnUC4Fz1Lz8tkRtm858lUfOkwgA5MzcN4sKE7soHfcMRPrkSPQPxsgIENbQbC6IFvNP5OyxTFZlEOXBMEZzpelsVVBpcY7o4Fn6fQbtXlpVTJlNnDzU3VxaqgAze6E4BHZJrkZuelDZGkLlfT8QTic+9AWf4E9Qyqki2EMMVZfeh8cYcv+WtpfKC8LYVIZdTm3Y1Xi2IaeOdRkyh1YdFYNAOWP2k+w2gwySq6KdZoGERFD7BcdHAgrRHMvAoGuNjqGw+dQmn6w18l5yYF/DwH2wsczwm5JbY73XBqO59wun0RC/6rfDz+H6IicejCuxICmu3/D799/K3L/z88En++8P+f4bOlff75VH4D3e88m8iff6+KXH7PioABf7pYnmXzVP5e58BtV0qykFE9ud6UUbAfnbx/9uL1+O2753998fxv4z/9+/vnJ1xFKuK4Dv/sg2fUWP0AWxoOCDEWrS6T1QU43MyyXLCMKzh6AQgkd6NkLuNFuijKG6VafC/6+IQCecoux/DsaVKp9ARwhOG2cdr1TIcx0sUwGn3sgA8SUNqnRX6Wnb9KluA/KXPCiBcfO+wj15kuDoywqFnv9pYMPYFHKpP8PO2KvXLY01QYnNSHkQbxMqtW0DpCFw/w763JiVUX0cE0moJh5vSi4DuVLIfUNpNkeqnuUq7hH8ingg5uaKzBYXRm0vhXHJFLO96OzFtGVlToquash6FX8taq27k/yfL71YXhju0ZiSWibYUxXWP5QVPdOQDfVBXFdtQR4+ycShwQkzX03NdJ6VxVabl6DlcVXUDueF4ks6qbQA6nHsWg26ISQRMsg6xq1SUNuIM8HZy59LoTuK37Zxsx8NnmKOlemIKVY/3RcWAfn/baN6hin3fiOF4JPg0im8/E9059IzSUJC5TyNqYC/5n1OEmMc8dTArcQtIId2mmukiOHj2GdpgcxvSEmhSdngr2r9tZr84Ofi86Gl+kH2YZsI7dXisUoMJ3jAFiOoedi3Q+LzobxyxGIZrbUPhFBdcxFpZ/ypI8Msxqshy8YV3NuU8mJJXpORSZiXq1zDhumzGVn4Ey4ap6h0t3IAh24Op/AUYI2ywrkOuIFufUtxKYi1Lpp6HJuvPz+vAw/UMn+joawDHzySsTxAccuYlrP+cd94rbxDQqD5MaAwyjafiJQWjE0HWBUFNIYYoK38cYNqbqYmNBwNRPahb7WT8zuOZcUjDXY8r5l1TRWehq02gdTTpmsDBdr3WPlJjn93sMZADXW8BhkVfJoriStlkYHBARQNUBLS52UT05nwp+CtNre8YF2EUUCWvmy2WCUIgXmyMpb9w9B+yNWB/c6134NynL5KbLjMyjx71ej4f8ObcpTCEF/kuiZbZMZb5wmM4DNEWWRsqck5pesZ/ScmWEysBuZDnYbGRF/CcY54s3jkXNJ9BuADs0Gob57OHLAsicAAyJYS830F8oAsYJaA4EQLGZdmfB5jPDpe3QM+u8RWiffGpzK85CPssES7rCJOpqCX2SLKURwcqD8CAQ9YcMbMsC2xQ+Z5TItzsR1CmZpWUgNtBvu6ZnPsCzuErTy+6h/6aBsKgBRN8E1vwT19PdUgU784D+1HqHGRsqPwzXdnOIObfPhKQ6/Q5tNKIHPKVq1ggOR6nagG+TTif+e5HllL6uwrnCCDSb0JS0Zv3owaedjXtgbo1RIYQQDgrS8XiRCOQYd6gZJXzC0zu8dq/R/6DyEsLp3IUKqPn+dzD49uG3rv7n8eMv97+f5RNQ3ziqGRdDpL7lKe1Nqb+RGCNfqwiEXOAsuUyLqXz7g/j1Zgp+/7ZhliiBKcwoXvsU+LnpBSnrpf82hJsgU5+DA3yt8oRhJaSpFBwRKUS1d89MI0ROhnD5NhVMEhjK6NjGf01Liob0w5O/PB+/eSrIUafTufcVcxB7s6wc7v+uK/5gDKH93x3u9/b3kAnf/91gP/r+e/FXvL0PVK/a30NLs/Icxrb/u/+x/100Y1dkuATZ/514tQ/veBjDr3sRt/VRvLonH996DUffCYpXJdO9GVj+jgj4MNrHmduPTqP//t9Rm+NWE48RgNtPfNj5SAHRjqP9twXGRRNLyjMCD68wIplUUYknHzE8GbxawhtnEuH54/3b286emEJLm4Yhjlso08TJvPL4R1JuKdwK86ovqi7H16PrFzSQr+fqoVxSjTHvsij68XZzWdgueCh9vG0UVKC4ZFo5ltLYMX7Dscpzzhmt1HAO5WYzxhtqFpBgcXPAj/ZrZ01GGlIhhhrHG4LUD8L3hoVWqWPQYlXBsaHpoVZVCsSr1YOihpQiM+FzeNsZwMMJfDvq3N4G77Y6oJDEGnO4RXvQh1iHR4JT6HC4W4Gv8MLQuHZuT29vaycP8ASi1SNqDXkYegrJRGYYKezTfBHmwB1X82yadueOAmA+GhwfgZ3t6Nt+9PtTt5JoJ1wPJbnR4fHAq5It1nMfTPT1MDryiiazWaDoN6I3j5x2F+OsKLsLp+wi+t+wjjDPnQcdS7mM7t6L9QqtL3RQPWkdS9OFFtAFhvz9ZZ0JsQQj+s0h6osQJ9fTlZm8BxvjvM72rWiXg8/OjqPZiBb+dCTWHcM64pvFcbSI4UU87weuVLnU/Diay+CmD3t967HAeXg8enzqvMhy2DbdQyA29huwWu75yGkWIYG969as0CG47xQVJ2CFYhsjU99AkAAYxIQ+L7Pd1ngs2FK4EBiPoeN/6LmvRbPytfOOPUFseKfO7/CCGBvvdHQYWhxdAt/XLtT0OJpag+jg1Txed3R0h7HYeokW6LDLhx0IgblFzxVFAnQiGuR0W5aIZWLr2j5jcavPv0J/B0Z/uYiefEHtnLc8mpuhoHwB3MJt6kxsumL5o9v5ABAfum0Cngpq6j+FXjRgMBbbGh8sKFvNFxsqiKO6gwYlaDrGtm+3oTEh4jV0zaBxwLMh4RlTXBmkT/I7UTFkVhURsgkhVMdXqSoEASm9sUHgsuV6LmPMs1NImUJETkH7mL5xcgLMQSE6AgEUE0uPJz8WC1P3lpgWH1XQQqX2LQ6mq6ekK0+82rJ6yuhroOQmHsw7VWsrGhdV1jB3bcSaDbMR40h7slqV2WQNmUyqKjvPlewhqqbW+lBrijYwj9b5RdvWwOln2gi1Z1NbcU2/2FzT7W0Tc9swlxZwl81DuSPoAUhiXpflKVSvFVOXgTmD8KMhn0S2pqpjvbwZ0AILRm4eNBg71X0aeE9HwIHnj3aAYINrZmhvPaXa0wvQlFfMLKkUdKZLIwdFUOED0WkJRUmrLWJrcebj8SIpL8dUcVzhJu65hWMHlzmmMrB9v1LPb70qhBh2UyS+k+AO6r4YUlF7KcZc1KRaHay2SSdnoDGWx81iretvsZTeWlKsc1xM/irnydyEwRHA3Mk+QnhN6CSKm4/dLGB0+XN9UcyVhsPgsdGUGeNnnKfSQuMMDC9brZTfLbVYyJV1sJLfI84sE03W2XwFUYAxORPgo+wX9hfCVIPv1ZmMHleWEKTMWZs6nG2HnjFkpBASyRaYifqj7TFTzkVjWQMzEUyvjrMMUAMQWFm8ukt1cVj/a8R1vQMF8Cb7vwcPHzn630eHD77ofz/LZ0v7P9dsTyOKrDlmjmkMFjH9aHyWChI8dqkZ5CeCHdOPnr55/R4isP745OTH8ZPXr9+8f/L+xZvXYRu/VZlML8HnqE6n/JS8zJFvO8vOF8nS0j3+SXT3r9DbFvpHcxwuc5PguefzG9EWhn0fOrfilXocOP4VuImlJbOaDvVBtalJB7fuqsjqelbL7oiW8rxg+QQq1SyfKA23Z7e3t/Xspj3DcOVpP5k0mWJMbNJp9up0VNMpPLMwq0RE8ZFJpkpn+gRLRh3VZOfUOTyMTrwuthiEjVc1G8KzlBDl+V0664Lo25e/3QhC4p09G+7awUCuAucpM9jQgGmdMxXPNyL4CRarxe4E3qgg9/AkrwYdW62KXMIwGulhql3b5QYqVIuIRej1o6ZiR1js25AqhE52rokCDI2wH8mOD42n5kSC4NP5Q8ewrVVCDdMZjjVQoWTDES78xcFB1vS5ZsSyi8brBTn16EJhfnVXsnSe5ph46bUkAgditez7+VrUxUHW8oHA+aHDi9L6ZqWUUqbFEmKfTm4wOwNFBqDwV15mGGcH0vYbuciPMTe8DdAjm2lRFtQy2N3TDfz+SGATYh7iQJ95ePjXMbUjFlyis2ge1TWq/xzJPFHxTWER55QTNKDN8W11yBVqBFy0YLtPo2+iEVwqGpeLGEwVHKHKc9PwtnNwoHoxNLG46YMuitheLhE6xmtCUANsmLGRQCKkCCZgwFVQ4YbfHXVOT4PqhHF1mS3H65yEl1mtdkFuxNFp/R4kZj+wA2FrfBiS6tV4O5H7U74FuxKrO0OwHtzA7MMVpJxBlcBOADqy6zmT7G0iCMzMUK3kqyxLfYc9W2JyWRU2Hy7LDes/sd10uhGrfSrBTBWZP+EvdwZ5gIKOfdpcHu04lxL7m9DTRDL+Q0LZ6YbGeYeJ5zElgsFlwmsKGsV9HsTgWD9K3GYJa5OpuplKONJMlss5xUCvgjSBCr7HHi8cQy6JgYlGSY473dxnC5qYGNtIy+RAxowftAkDg3AQ7m8QEIVCYWmFArdBZhfwQ8fyVNiWoMtlMvVI2v/JSLYRtwykCs0/9fvYRLU2TSrcab30Fnb/l0Ncu/f/MGO5/wM/Nfqf9fzy7kLANOt/BoePHxy58V8eP/ri//lZPp+q/xGIIuvA9zFrdcbLpKxS9WslOLUxOebDKTJeZaCj+ZOo8Ga9mhZgT/TDkxcvnz/rRyc/PX36/OSkH/30+umPT17/+fmz7ZQ9mMB0vViA8wEQbSd6gAr/Z+YwIB2uwbLnktfi9JUFRRlQLLs+9YTkYnTFjgagGxwizx5XgmUT0slQkP1BbzQ43ZWJZ7ldHlhG1+H4Aq2/ggwRl6MOX/x3mqSHzn2MuyGento6M7FKLdRlxoJ7RnvrFZlSqm5Bcs9IHc5izZbz4gauUUExX90XCw7nwIwXVmDmbO9vCSb2PsZwwKsLCOWQF6v0WiDDxc2ePkCrdAVxHoQoIIQucEQF+0PZE4mCkJ3A7DD4/9XrmjTijrr2GDoGmm4Sj/jT7dSNtqOQv3VT/rCNRkzeTsMMKHawF7ae4JkqX6vhUd1u1PFZO9+YSd2hnu6xazZGxWV8aKVEKPJpGgLJRpdtYDY5eaW5qkPimo3oQLs8bV1ebVSYvVbKsFqdGWpMVZvTchZcrAxN0FDzEl/+voqzwlm8p4IWFYt3rAN5lp5BGEmo7qFVuB/X2UwwfFXM2UQFV7awFnmz9vskLa+yafpkOi3WDSj0wVMSOlOwLEJTYMNqMn/YCCCAsGJ5uzk4gNBXsQphbEEHQlU8+iOXrxL9XXTfU/8WdOBRAtAApYSXYszG2djdcr9uoh0btnN4xgKb1L8fpv4Sp4731bWkrkUrZ7oZ0YXjhqbsCdZsyCcpjczD+1M3tqP6hk+DXtiTbpNZzYvw4+kmFbFRdhZWRafGYzURtmTHtHlosH2kB+6Tf9e4yn5Nhw/6GGJ3Pk/nWbUYHnnqBjV5llYL0lUKZoNzRUFzlIgMkoctIHOaBqGUYpRpWapXVa9jCyCK8TDtFovYKPE3y7NYioxUWQDua3bL3Er3UREaUh2fUdQzGlOnEnyRYlMCCr8II0aDCyrG9l4V4G424/DYlDullbqLOj44BjNm3/bSGAxpXTqO1sLQWBB6WiqMfmMDUGAriABiQ5vTjW0e2RWcTqeoiG6cuFGANMknZLxHiCSJOARowYWM+cnmO4duQEGkeMLIfUszT4LTRpbRq9zY9HQLZrTrqLBmXsvm23S7lq3tY/G2NWv1Iu/amAPsI0cg7/TlitBGIf2ZgFAl55u0g1wRGRpU5n3kvhxHj+UiHINviRIIjqPDTYZemtfUWjXR9OMW1Uw1nduEjGGZUC6TZAX+zivY6YPall8XOHUhDOPmK5lUvWfq4szm9J2fENRVHL7KkPTM0qETpMVxeKYen9pHzabta+/VjVs1GqmVVHi3iUTU3fl8+0+rtAzr/5Rz152oADfYfw0ePnbzvz988O23X/R/n+Pzifo/xz6LnQGdGGySAxy75ljSq7GVdkk1URdWDTNuyZBoTRK+1Rg7i2THURZ9HR31I2ZiTbYVfMBG+FrHXiMjgh2giKZOA82fWi4GfyvKS8gnhclBiwlaS8j0BjjhnK8EuDhKuAImBrakw4vRJZsnW7rhdzBtNf20wi/gBZBsr1czRw1TwdCQhROdORVTCaSS7EZ6tochHM3dzOkvJqGM/grxSp6XpTiDsnA8oXdQrurqgjb29bF11f+H/7Rk+bN9wvR/tl4ss/ysuJsDoJn+H317+NC9/3n46MEX+v9ZPlvS/1Boz+pivcrmKtBnUppxPt24nyqRlXogpNjaoKCbgkr45scSc8fVTQVmjcFjKhCLhQvK6rLkM/FbBlfv469XSZ6diT72oyfl9CK7Sk+y/LKPcDHqTD969eT1ix+en7wf/yBkgtdPXj03Hv3bm5/evX7yUr3adLcFETJ+TPLZnKNyQiF1C4X3Us6AVQrTBJPvUPoao8FeHP0NsypyCCsgfLOomhfXAhKF9YomaZVBJi3IfzSN5sV5BYrY+1AomkF8UMyrVYBueJV+B9lz6K6lshu9TihxEmVxhKS94kEV7z376dXbF69/eDM+efruxdv3dDVkoYNY9IqyaWEsUUF1MzSGJTsDiro1SZlAY5SPbufnn3PxHwfxQZ3csTo9Pt6KV8+vIKuffPjHvMjT71Vc1cI2oEXF3SmL8xioX/RIHFTiqDM6AjPDnaAxQikhUYbawgowgx26XbQDqcmf2HmxfuAthIXNbKFAqoMleaLRBFZU8bL4Yeauap6my+5hfMjhFXnaxBgAi4wQsw2D8GaALUB5TBjjEJ+Do4u1POj5AqhadT926KTR+tSPnfNsZapXH8aD+LBze1sLz1r5EzIl5QaOo4fxkajtVpXRzc2aL3LJCJkToHQOCF4mrBXbC1Zr1RUitPp+2KPwJk9f/nTy/vk7FZBgg8K4mDXoirHoOpvpHwFT/F18G+ljuqmBj+5BWczT+HI9SctcbGe8TlokQCoADljw94ND4omLFQPh30O9pSL1IT0Gnd+y9aPa1ttfIPlm7EtzfZLa5ZGeFjr8SF24EeArMeJIm762iBfd3OPpp/k51gz2k+cZiZ3X8SOj402pC3bp8i7rYxtGADfwQpy8zeKr4DV+8kRWlFhmGabmlaEIF5cz+N617rOS8llx7QUSJ44rLherMuWkcKIx9yJsyXyLF/eWYqRaJ4lso49bj1IvOSFNTVaIIn+Cak+W9sRLfBpLLqGLtOY4cTwkA+WI4TvOq2PgOZabK6iGDfH5BEKeQHAFtNoRtKxcL9Fu55p5n1VSXQp+BHgdYFGkOY89YjxwKWI8BOAIBIeUgSGdXv9i9iY8eZhodb1IyTC1fibdC2c1AZA8xpuD5nja4brehNc2QjFg27Tyi9vKxoUuP/eUeeA3wm8HsmmS9DLZO3WGQUuL8gYlCG+3UzhZJWHoDR8LAWQ+68rTEqjlB/NqHcK8MoLKDDQfoJQKL+wmhIUKsk1BrXt4/orvMbC6WLlpF6yJI25QBCEA9Ajn4LxGt+A2rZ4k6fH1I6uWM4SsiH0+uaGpJR1K5gj7EQZbFnRhKMMtbxe+Wc2DvcoJyYvBNd5Ak2HtYyFZx+e/umtmSKEaSwFEbXdlEO2mtXBogIEXAn0lTk0XMTL6MOKP+xwWcHDresEblSfbVvbQMmfeOVfI+XdxuOcJBOYCAVK8o8jTmko0BvT9+cPhIUfZdgkAazJi4xiAIAPDTnkMy4B+DIljNbJIFxPQ2w4jXK10xQ82RREYLSg4DMYPwtBBVI9uve/ryepMzB8wG/fz+84U1N9SIT3kpkeDU0Gd5gJtNsViNirMxVJQ/D+jVxuqw0ykH8CVYAXz2TWG0DMiEzdg0MYWw/Ngtu6vs9qXC9bohDxwIdaEYED7kev06OqnN4Wq2cgYb8XcNoSpcXxuNQcNw9id9Q9w0e6UWOFq6g8t+3iyThsmDUuDMpi4IBdKtGtq4rp+iZgYOjDA63bWONmPgLCPfJhpvhLnLtpzSMCmdYFqsUquiGaa2QZ0aHqzQxjiIzRg/16E6sfqghyDgVdOv6HjteeZPL+8nvsUvw24xwLcJ7RxJLtsseMQXL2K2IFZRypS0wdYQlddE7jhmpPaj1LuafVXJaMktpyLT50Kbxg/ybKo5SSrrIuknEVAFSHcTs5BLTGTOAxK9wB3Sv0J7+mMdef1FqobN4CD7DIWXkOfjK1EHag3ZJVtV2IjIE1tBOZPtoJQR13HTJzrqKyTPx4+/wxElQ+7WqqK7++UrKI+xcA7nrdxM4tYe8OwE/nExCVywcwObCC1GKZyBLhxPyHECJFSs8ZE15jU15Aa7aCIT+TjMhNkYyYF/DxCuo4iPpwqqzRHHTVHVMTIs3I6oAxQd0f6l5KEOXzJAYLer42QoCWj0b4YopA270/3+9HHfYE8+2FBKZhopTXVMAkWScuzXQ+nSrpPYCvSnAlWSy61YQcp11I9OvU7Uo9VtmRvL4OsLFYI3IcDDIVHNaiCiWVTjWVTD8tgQnafJrBjoBaMKXrQVMEqPJL90zM36uDxQhavdpcN/H+NiazFUOFIJYcxsRXy9FoSjN9637u3TL4hPyMt+JJkv6Z2exiS3dGC2DeZ3kEBK0860yYxueOYk7AZd/BkGXUivjA0jCmlPxwZUFqueOKQtUzFi6m2EreAotwRONHqVRRydGRv31IHYQxFah98W5qxtp2Ulq5OiJqziF/gRdmfE7hBxlTJOd2IgeIU4+LaFsKBvqCVzos3ZKLTmWXVZXS2ns/dNYELy7FosasyHDtd4rgXmFy6ii6Ka7FJRYeSaFIWl4KUA75E4OaFkTBhlFb1mZgKCN4HYjjcfcI/3V70TfT40F4OPCzoNps7EopDamD2S1AGGm32FSw/zKx37WrzPFK1qJR/rolW4LxXZRnZyUbHV9jzsmIe+0DKrloschLyWOhKhHpLtORDRGIne8Cap9RS7K8sgagPI9KP0p0nq2cFyiEzgY+uwKssve40xGPii1jBjWJirqFjaxCMQEubcRqTKoGu3Wtu0uGTAnJz9iIH684ggXgIg8jRg01OOK/JBRimkzkMBckM4J2fMkj006bH8uMlNVPdcsiqpjT4TRySqTTtq4bIffSjZEa7Aai1fDXii0S6lVs+CDlchD6W/w/E1wQt4xhv4NNyaFMof1jph2m6XEXP8Q8QIrGAaXigtDAybn/q2KbzTA+1BVL8Hr+BNkkcUUOxdL1ADToB/MA8f4NkuOiZGiGdI1qi7GQyebWkxVnxCDPomndS4jFyr/NUMKBQ5UKIL8fAnzrgZPqaC4GQsk2ky+jIQPlu0EBIUD0KzOKA76O4miPXQJddcfQ6zdBaKCldcBQ1SNtt5kD+H/TZzQgzDMqwL2diKNHyyPazUhSeDEqPPYMXud2U7UoPhhBGKLEPukwmetEfh/RbkU9G594mLaZfoy+JT6MzCVvIJOgIkejblvvLwX0SdPTVgUOB9SpvYFyMkq7uk656p8XyBi979e51WncQ1NCW2JQtiOPYnw3zR9uLLJUbCzLN97lpNfGmMNExSfzy6FjuoI1xcELrufEI4UcGGPNg2UWQl+hwrNCC6KP79IE7oJqAX+8kT09JuB06wduZHeKvmQaxZq15vtA83l8UF43Ca+P03eDFnfpesX/E0dN85FAkv6DECR8tNssVapxW6U5JggF5ElEDggGbmvJDV1su9tl4sLc5qJ6qFNneefq5icq2sSaartTvI3b5Ug3RLcqgIydn5iDnHex0Zwx3uPc3TWOQMDjduXuK4dOBQZA6tKQZ4aOJe+WcTkf3ZY+tA+r/doeHLx/rE/b/AH0T5Jue3l3+z3r/v0dH3x76+T8ffvH/+ByfLf0/xEHuOWvw72sK0FRJ5w3ZlMIlfk4Z3/jlK8qQZ1hV/tvJm9dPoXizWeUYmwxkFYSnIJxrFD5ZzebZRLdrhHTwhGaqL2VI3cabEr5zfU2TWTp9gYNBrZerw6l0wFVWiRAIR/dZgqZrvCozz1SUcl7o6O8vBRsHhwW6sJGlaujeat35//1/GGBe2beW6XKeTROocwSHTbKuUmgR+a7b21MdnwQ5GeglcDN45MjZdlQb6AyZzzApbB51ibE6Ar+6RiUaR87AiaVsGPSd/APEgPvc6pD+cAKiFomcwm1O2rbZuo+UwxTqq3YcNh49ECvwiUBfGnFKk+wvBHYIX4KzW62X5CJfXRTr+UzJ7dEFevxsiONR17ePA7HA0ddfR98e3vYw982gYzypazTgOWlAEAjzEXQHbO9jIy/oqbCsZ9Wm7SP0VoLS8IurdBwTIm9LegPXTZ3bTfVivq1tY5WkW5FuKbB/BreY1XXfs0MK5vSuHZRO7B2A/6JqGEI/MpKCt1umul6Igdwki3ldgtptOqHvaFgdGVxuqd80V/vZ8x+e/PTy/RjI7/jpm2fPn2rKhjQV/LxuKjgV1vO0ovDt9KYJKcAY4zIvriU5FdsKtk4yvZSJRbFtajUqE+0UJ6PtoHhNh1t4Sf2eg6cazqivJJeHXzyFGHVj+bNLajJtizhN1ucXK586qvpVBsbCZ9kctNmdZH6d3LiK/Q3o7KxRy00B4gSODcTlskv9NKOjeBTuSRXNCjn9pBecYhoOoGA0sw4J2zS3vOx2FzVujGQBSGcBZ83/ocuwzpMrgaTJZJ42rIasvIEwBWeau+ZeF/GGzCqcXX92gG8Lrod9P6Jc5tqsI339IpX+oz5h+Q8UBqsyTRafQf4bDL59/MCV/74dPP4i/32Oz5byX9BbH9uAdMQYkU464vPvPtYRpGOV0NdfgXKH/fKtqDFQVrDPtR7yb6RAqZBVvhUPxkl5XiHxFM8BncdkZldB1p/yPLUfUShgACiQYbHsRy+L86frssL7jvHLLE9P4N6a/fFPVglYJWRkFFFM4+gtaJbJQR+t+GVwFulRCM7vkJaxAivRM+DZkgjtE1QcP7rAk8715IoPt31pHh0cnBVzvlIEYQ4zVsXR3+C8OzhQna4oOQM2C/3CLDRVCoYNQp5A1/ySAoTRYS1gzFKQcvEK0+5uN43PY+N3Z3DUQTO6FCMwHsaDIwFuQH/iOO7Fe5zilZz57311f5Ll96uLPSPO9P7v/sf+d2KISM5H4ifwmPuiwv7BdD86jf77f9cQh/u/E7X2VVH4gSV5Lrg8/RgOAuX0vHBZ/YDLA3gJZwY4CQ2oHmAzk2TGtT9G6fSiiPaNJa1kgIP96Pv/fvQdrdjgu+h2Lxse7tF18Cg6gIHrTv/v/y2e/S6LDgSb/CA6NeYDC3q9xjuLs2j/6PDo4cHhQPz3/vDwGP77XRb/7qPqzu1/RDRb1E09DgGMXmTD33W7WfRNNGDmAS1TIrBMoeGjI7uhiBF74AS3z67+rQUk33QyALfwbaWqtsknAqLdiuX7GlUEBjIa8AWSsdD4xEzbJ4gCBIpi+tDlivTHqqm/ak5L2sh0p307OlI/wgRi08UMmx2OiPh0yJ9SfDmA24UpxGkvxjqaO3KjPX1vpId06khdqsO+Z+CU6BYwdUxwu4ArfYhEeNSPHvQj8f2RGNuvcBE3lAS4q4hy90LMq9gTNWb/0mbRnjHoet8AP9RfrWnEITbckYw6ckfjNB1gM7h3hwrjj94fHh0fPjw+fBQTw/AfVFaD4d+CZx4eDDpePikgieOKCbg7hZjjlYx51Oi5KASJN2l/F8uybtBgwGH9MEQt6MAmneTnHGJrTjrTn/OfMZ7ypOOG31K9wYo9D3R8Nl9XF03GldiXfjSaoC3ypIOx6AUg+GfmzwEdhO7ghViUZld41/nRVv+RsIKHCegAvWOUjBfkjxEFQsB4xByr1dyTYoMskg/jyfoMUr3McEEA41ybTOoMaDFYQOlSN0anPamRtS3tvFmRbWD2RnSdiw6hU0k0oD9HnaaQbbo6x7CdUPUJVZ+0ry4D1n4vPqimiWZrtKmEKzvDfKecDgd/FB8ORuudLf5KOrxKkHw6Yeis8p3Qxnr0H52exwbZRR/IooeH3xwOxBFU42DzktylWwAdbAaqih79xwZ/HrcVQBTf0Rp5v8AuKMqZiiDo8Ycurg/wsnYgkb0PKVZPtyJ77ie4O5oRDXo8Oj4CJOvKTOPUmdYo176HDoQgota4nrF7q2JLx334TxIWOZCj49Mmkw4x57QRB0f0l/8MaF+KpwN6Sj+jI356RE837lrqwykEK/YZrUNAVLng0A8Pq6YkKtT4dEuGhoywuKzrOMuPRXEtenRtQ0//AoCbUoczuCShIcNIHqXDwYV7OG44jcPV3AO3aT5lt5LZVSLa0r0Kzu2j/4jEgem/GcRH/xFNfkbPMjpSvckil0zLKQKsbDmzaGnk98F881IYYuEMIiOzEGa5Gf7TrETd3NcySsbcSUbJWCcZnSu0DHKyQ2++/Y9oGnojasx+zoPJkTfgAfVkK4IZ7HNTz5qCUGzoGCBcx/H7hKtShRlgRzvLqmliRYyRrQq8S3MgtGPCN8Ckg0Ed7tZ20kW+eCr1ER9vXfpDvNZ4CqOZz9Ffw2MLwAzNdodQ7yjYAWlbunVcmTwdW7OCmgckOSd8euddjvMNjFqvr8DVsxamQ8cBjUsIO2bwBlYGDduzrU5fg+zqUcNigU8szwyk9YLjTLR7aCJhw/yzprXBn6ph4J9q0BXW/6KNxp0lAET97+M6/e+DbwePvnX1v4cPvuT/+yyfLfW/YIe+Zxj21EVutYx8vrb0SmQ7sTnkN6Qs8FL44EOxj6iRupttLBVLs5h+9IrsoxuLj/Zl+f3TdjUUgLglCFVhtG8Dccg5yMzeyMHGWw88VlnwYtf42wv3AhUFo+71EPz+smAkKwzBvf/8w5IcV6hD0RXYHOwbhFY0AN6v0Egv+moYHW5u6te0LKDS+epi35Nsy2whZIkrT0BD/YTVNNln2AzD/mQfLJvsZ4tkORCP7dr4ZioeP/BZjv2ZeP7QenzrtAnnIDTqZ8155Lf32H/0rf3oNND8UbB5fxRYIRWFA5Dx3Zl499h7deuXrmn7vKHtizZtG6PTGqaFQmQ7ooNx7M+ORJlFbCCFhbjitUC4WR3Cdd7KaoJTm7HXU7VC1/8iSiU2gmNA2gkb2uDeycSOEYWAS1z0qcthRoa89o3is6NRB5APeItt6yEGQEWw9duxMqakknXtfZZMp4GokIsAVV0oivVlB+Lnv/gOxEpJvp7PRUXU6TivBCsKF1rH0b4QkYneG9u3Tv+26i5aH7Z26RYnp1H4yTaF/9RcmCOb6fITnepzU6cBpbcb54i2gXfmN40A64wF6QLbtbQFU2L3UNXcANObCOhpPG2OYeEWn2EujTbdGsTtOoSMha6JO35TYA2ryoipxOmGWi4QJJyPtqjQj0aP+o/73zbpxALdMqqpep6Zo9e5B4F0hMRiPVPnHErQ+pB7kc/SD6gQ3vcN19W7gN16q72AtHLLTY916IDavtpg12rx+a4VL7bZeqpWYP/VQM1TiyQCfW65V5lg9w163RILJak/tesaRz8M5AGGZZBakqZZw9KtJph2wINNBI27rEojvgiuw+oj8CWPjN8TsNq4SOfzYt94CnYIwM4Zj2ZomiDYJ+NZKs1Km2Yw2UQcxDnCPWgsJgis7XoaKCOoKt2fNhUS+AWdDjN54ykkSBH8IeSLDolWmutzSzqesU2s4JO2rOCTbVnBZ5tZwRe/NSv4/s5YwR/+6VjB1/Ws4Mk/GStYw7C1aXkD3+i1/KfPzAq2AfTqydvBF+6xLffoTFz8tHWHsPizdh3Css+/sLN17GzNkF49f//k2ZP3T+KXL07et5sFWWW0j3VazIINpMUs2BXazYLXrS9M/RemflumXnbRQsCWs2/XaT37TrW2s+9Vi/+8a8UfW8y+X2vL2VcNyNn/IlN9kak+QabCy4oFeBZKMUo1MlNylM27k1OxzVuLZfdkow766Hv8e+eDXx2f3/hN4PNfISJA51e0GvoVzd9+feD45+lrmNuGm49ZPE1yHqxyjW64hfDLP7jtbdd+n2dmSziy3sMd6pWy3i797POq3dYAblufFrmulU3Dtps5upvO9BnD7qZTsrkHt5861Xbv+ozvp3c76L6xjX7DpmmH1gLYbYo9CI8Ygk3JgP7XULL5AEwf5cVjF0wV+qDO6YOWJswO41zMB0ZX5zXmy37J0WnrkroTrWskW9YQZVsXTfZNZM4LfDyeL5zpG9RMGq2v1aRuowkl7F4MajocKEt92aa0mLyjLaqQoV9wgwdKU5CNI4skzI/s2YMWm3DuyIdeD9wsTDyACfmBDdk6MgMay8D1Nz4P6D3xOWo4mzSZARizGhhpDYyzHWGgN1cYzIh8yHAd2kFUv2o0AbRwD4y12NTFwNSpX027dWsYgQHiMv8jYdeh2FZ94g2wTaeagDud/Q2g7wBl+3lvQP2zzzLK9HOMEnfxg9PPAgaIxeeDFCRLv8EytSOR2PBvPvidybXVFX3qPby7U6/m0ioZNNxaTcL3gboy3L0Fbu10A0eNDVAjD0SZb+sboYag0O9ry9wG3/hPA5d5zUd/4yn58NMIdjv0+0Qg+Hzj+vsT9c/a00/C1LZY8n/Y4NvswrvaYBuomplTeXUzhhyhl5A3qtbuwdHXBRNrYqbgQKa2RxhyO5mk8wrLJ5S+jSX0zlHn1qEHwWicA9Ol1kk+j36T2SI5x1/ZABLRGxbVjVpMngJwH6sgSMWo+TKLnKOhuMCwnuFnhvMVQ89j2Wsxew+Md/qeBOcCVcidP2jfQPAF8UqNLPU3A9DzANHOcODQVnbU4GgYGGlXr6NeoX5E+enqXk628IjGT5eW014+BCCfq1Vu9I4OzH0DUrr49geJb6CyboVwD9oj3NFWCIcxJHkQeKv0sVMsoR1KRYExzsUawZP7ckz3aTz3Jx0T3+5Fb2Exo1xsZcjql4GvS5RAQEeMf0TO1TqjCUUbFJ2C0P+rdH5Tj50YTfdXTrTYHqvwriSIOgbV9rfCDXrcdoyB/SW9qaJZWSyXosOTG+j8PJlmmN4KbhhwVDRhs/Y4M9I9w3l3sEQ68OuvvypadSNplbXfx9N5mpQ0B02OqhsIx73oabHM0oo9IGEhi7XOQcMLOkWn1aqeGsj4HxpRZ50mZAQ/tXiWpkv40l30tiOGbu1+tAhGkuAx158tncRQ8JvBmOew6zhED/iKXgpgHWLtbwN0dx7jamy5Dg6401t7YZ5UVXaeE+JV6wmklwH/PlisbAX5XNFPfnVdRMuiwpwc5Pus9iBEUoZVSfOVteEm6LqTGE+S+IN4drRd7/XcHd0y7tZOJY6tofVJ/IGcZe8Kwd0Fir42xyefjg6PDyHKJRBY7Lh34M3hnMu3nxx7+NT80a01DXTqMpRjHzKkUIc9JSj1J+HVwEWsd+hqJYPsim/nEKMU41tBqHDOdSUI9wWWKSJs+m5w3nOOVw5k42kyvWgwgDWG1Xg4pvmV/RTPArzs50Pl1FmHek821+TB6C2kF4ERBR421IcTuMuBzh9SbftRiDRTqAw6jTQwiOYLoXzVdpe0Ozk7g1AyvLw4q3qsI5rF05E5iWBoMKL5gt0gNnHjmhoztbE5vAWzBvXKPFGiJL+5BpMRiDaD5AyoXJaL5cogYBp1H4MyLhqOH9ikYt3hDy60c6jvPghAJvpGCHSK0YQaUB5Wk4O++2vbd/AsRAvsTmwFqGdtftz0X8L2/hf/hOM/LMt0Blsore4iCMSm/C/fPnTj/z46fPjoS/yHz/HZMv6DG+chWWacmZILPHn74g0+4AIak2SJa7LgQwGlH4mTZT7jsoIGYXZbWVL+FmQGU75AqmwOTIjSDWdyW14kVTrsvFvnOQYiI8rD0TpVfxxXcy1hd8QYDJ3O1cBI6qWyrrwtZuZjUyC35W1mCrCb9hslkbEYKsb50RStjeYpYZ3fOI5UPMa/rmM9kmMdZuOtmvgWsTZQrZj6EcwgBCZne1eTLhjz5VJpxdIc4tTjHK2E8AIpZ3g93greEtejVqeJmNDFZrvYaA+PEGgX0aLLExHTuDHGhF7m7rLphmfrtodt2q7pdixOvO6IJuQGIntF/HaVpaV4LXaTIK3i/Ny2z2DxOhYHJ7R9Wl/d75ZcFhwXWka0r0udxsm+TicdZzDQIBpHYoOmOImDpNmtBLO/WIKwCOl6IfYJxPy7TJEFqzBA24a+yEUCPgxS972GfUWr1DFA6wCnmFjawV/CWF7xCtMaZrM1Jpuux4/2KkCrNkzXzQ61GUU4L+42GsjNe2SHxkwtL83JkczaPYKAxqRdKtNzJpdpUq1g05O9rGzNd+PglfCqglLWICdf8Y8b/IFzw4rNhsbl8n7sfGVNxrGeCaM6xHPjzEvA+ENdddKQggMttxN4SzxRBCmcGsaW5l2JWT1byyB2BUPIOGXrcl2BvDGD1DWCd07FTriJ4JTR2aCyVXsEbkHLrNUDxQmkrpyiqEHnZ+3SsSE9Ad/go9MwARx3sUx/WWdlukAiUZRECiBa/mV6Y2SOST8sIbMnqpc4UCMel3B8f8LGvukE0Fhh3jYIrCttPyWKXOVJWRbXY8CGWTgIOkUORazsQo+r4AksOp7M5zqoeOW47RIcDN8nWovpZ5DcDxW5b3H21p8kEmBsd6thqlSNMY0XQidiEM3mAJmMzQcH2N0DOVdDs9tfDRUlxKCZsoyYvuGHPgx8CEM27+CX8yT3p74XCx6KoiryY95FoP2Xs2od3JKewzfRppVe29xiebdznq6ig2KImSMEtD43HdkdFkOAvt21zB2W/yTguwkBuCH+36NHj734f48ePfgi/32Oz28t/zkZXjg7cW1Sl6dzsR5p2d+Q4UVHR90gOvajcYqZsDBbQ5avUyECXqa5eD5Lw88xJD+Rrn70M+4o4i7HMlH2WEaw1Q8oyzV3RtQF7Sh35RfcqSxh9SnE//jslzyUSka12JdXmVLNSi+WGMG7OKPsLjzz0P6M2GtooUirGAMhG1UEKFEJ8lGsymx6eSNzTVQyEQ3lb5sXxWVlMOp4ZScqJqCrT0uzRUpYAy2ei4NTZa6JkO7VpoPBuaiGtWlhIAiFTOMi3n19/+texHX2f0dfInr73XdRWiVTSl2CSU/k+++/Fy0Iab9Egrr/u8P93n3M5L6/V06Hh3tnWVmthgPsA1YBSFxZdQR+CZAf8fG9r+/fchKVM0wzAw8xQQyMfR/SuIjp0SGkKQcLxWBHjCCJB8Kor36ARK+9Y5i5Kvr5Z2xB/MG5O4N3mE1GNQXB2tUPiar44CzDP6Po4FfIMAODcnLG/PxzLv7b59IwaPwqX4NEdawO1P9WibKv5XmNz3N4tC+Hy9CMwRMqOUCfJatEVBuKD8EnMInqiSz4/EqcNpXswB9zMQ/fYyFaUUim87tySllp3r55dkK3aJY+JqS6CVvwcO49xY9A6RyNPtYZtrfuRN9gKdN+os2FEFz1qIwZmAFEunb2TmGH/4ipXCvYmUDFsKhF6HA+6BKWouKDMj87u5EbXyAKbjXBs+EePFhGOr1odC3k6/NMTGW89/LNn0/GJ0/fvXj7nrYd8AkC7SbIIwBw5g+gRTGZYnMD54GsOH0Fhhu/VYDo9DVGIlDB3Q/yQvfFuEaHp3opQyHzB/8RwXwCoG/EhKhsoh1ot3Ow7AAoTMYDyQJBoifmCJIEwsp3D3u08E/fvP7hxZ9fPXnrLP/TIj/Lzl8ly22QoDNdfDw+PJrddmK47klW3awXQIpb1+gMsxxjtoIkP0+7R4+8lZVU211dosO49ySxlrQ7y68KuqPCJAolHKs53IXKtmaU/SuDZGC0BogGkLArjp5RIcCRKU7FIlneny4ODzFJ2Ly4jvfePX/75t17ByHMJG4GckiYjCAYEBwYw24hGOlkdRH/vRCcJOltVeEZhebvYELNMy27nMWYKQwFCAHs463Y1WrGGb8EBvGSK0SDZ9gZe0Ad3TAGwMasVd3DmB2GGQWJ1HSonx2bsmEHbMqGj0IESPWzMO1p1F3jVtZhrT8KASkXVMFZtzHQQ1cGTr+jNRHos2lFvE3osilJfgNID9jTR8xFZgfwszxfg3hfAR7jkRsT6h5M1tl8Rotlp8lLInzFDMNfn7/700mAbeCkZv9jv+lw57N5gGeTAdY+n+s4D/iEuA8CjQ3d/91H8QqYgYOBZkCgIh5Z4kA2U6iNn4rTHKZGhvHXPKtUv1doBzGMDo0kZ4kfowvFRSr7zdDwRqrWy7TsunD6WL6nkmMYVwInUnrdfCFgMa0NOYZQ5rcLd1bpQkiqq/Q+avSMXw1qg6YmRubPJlfOlo3cON1qdHDcrc0jbNTQgp2kqTrBz9a//noTYZOwc8QugGMNY3RfFyVYK9e7BNR1Z/Z3cTYVVp9i9UXJ+HFWyJI7DXpbKPHRTuvVBOY367/d5a3bPvqsS3C0JRjnriRdjUXJkkxkvN09MPVflp3kkfUG2cEEE8/h1w83vzYmBqoGMZoZJtNVtzrqxSRybTTGFNWmxXy9yCFhhzKvpRO5RV1W3NnwarquG3oQHOlR66EeGUN9EAa9ob44KgVTm9Y04HZ4dwqzspfb2yxGN1dH4aLN+GcQxsaCzVm6QKG+kqu5MlazVxcG0KqnZ9OpO9hcV62kU9XMOfObz+Kuc9NifL/l3OgcaVqrtjFloVV45G5y0vIMeSMsP5rinCurDQ4PD3vayA3bhboWBPy3wfNKjJQq9qLvzTm5Fz2l9uDOUEgtYgrXaDiJltMJphxYzwXDy4aUogjYY+R4syi6CAbwwWtwzpmX26lFufOoa1C/Iadsbff1Sil0o8LmVQs1i4tmjLRte/J6JNxg4NqLRZ0xNIVmpVsyl3k1OEYC2FGkcBsew66uf21zFrttHDW3EerGlPQDZTFP7wt5S+z842S2yHJssfaly5jYdIQ7Ap40oNXATt5HXVR1NaUEfLKvs+bDJ51b542sZbQ744bppmrbxgPI0nTVBzN+pJZ7Is/gGR7/uBzqZULP6F57ZPTvtHfqmqjj1jxPMKCckE3TUgvi7ILDVtF8D43bVWYPlPPeqajWhgErbK8jaqj6RaKmp9GfYGPq9aI02PAibE58Msb+dxGQcQvRQ3lRk+6GQG3GBTLevvZaYkl7xNA8k4fWst2jY7nOBvime+KWCGvTqWVy3uKcooR4BqccU70eL66uCXlm0O+MFZjS5RO0+WgKc/NvRy/+XmSTv/318N9PHpVvfny1Tv72+6vZ359nL5/+280se/H41f86bPJXC99ndcPXX13sEfSTvoSafZdklRjMX8EuHe8y6u/MOnB7kUT4q+PO5Tz59WYMV9eedWGByRHbWDnoDuJFVGVTPmnR0jeUh2DgEWzIIAL/c52W4P8wyyDTH3LKYKIzkQY5F8V6PkNLtmwOuv1VAZ5Sohz+kvpb13QARsG8GHW2hQkAXIKqBqtjzGNLt/01FWpsBvpq/JFr7qDtB/QEvMC7hmkyB/+vX3g2eNg0FWCPA2xNCg+mQSOo2v7786D2N7wzpsXqFJEYdxVETyzTKVgMIMTQ65sWSyAJlzgLO1vaZITtMcIz+oQ6Tdep2qhJqnPlaMhpFe2hUJ0awKYNM3woZ1gOTGO+NbG19KK2si2WG2N7htsEPbhgYxlGc3qg6I4VdFsNDeLIRhPPuiZADG7EHq7DnL+gkOvOPfjtzyGD6bwATfGN8hq+o76KNmuIVrifQHGzaa0mRR5RG1UM2Az3hvaTwnGePfuAdhr25g2ZU75nKJWzl9g+WRmdl8V6WW8jNUuX8+IGVP8d3Qv9EJx3qza77pPIoAvPrdrQa9lBv+u/Sa8JzLHR46Yaij2SyKKrEVPDbGDTzJt4YFXfwJH5ILHFjXA7LZkzv90QZrba0WfZfIWcvGGzG5XI3oM0nkdiaGswlCFj/OCRIQdync0EZv2ma88grCPENmZ3zY1c9qmgbN7ysjPRN5psTJHD/+Tryc95FPGPD37RBl/Gmt4UYAAFMTzwwrExmzkHqqjtqQqY0qqzNXa3bKzc3NukTkhvWRs7ii6nO7XT+VtSgjnqMYwKLCTshn1NvWtg5uIAUmsyleuyyRVe/RZTO/Q/NCiaqLpfkwLo2Fssdpca1fpLBc0swu5RrT/b2Orc3vYsOxt8f7pnAUVrc5c/pyvf+ZwtMCq6dkY2DQwqFByrJW8XeCuB02mgRNLpbXLeGDmWCUnA4ipslrBpbp2GJ79Vw+17bBws8PHms5jGmFfduBOJ5IHiLipKn2T+kiwm2fm6WFcRbSnITTyPJsn00rCdQUmOF1ssc3aFZvhGiAr4GLaMIE42rS8ZusE3sNYzr7GDQzNbxqgxO09iLaAXysoFOmgBHNTPPNTSNohuxaNNS1ahx4yxcnrpJDuQmDam0jhUvjS/85R6ihcwUxtP2WKijtixdVUXzAL7EQ1haJi/MQnsS2tj0BF2HJrHMOAuwDXUEAMUzEQqpCJ6EIPzu7vqaMznKC8EwwCPu2CoJNjzxZK8MfoS2JD/OvMMJTGgQNCOrtWaAFiKTMDLQo1+E6nlsR5M3O15L3prhXgB4xGS+FExClxWH2Um9Yi2SXPn5Pyh7YrtF0RAwToOJxKMk9lGMFK2lpHMa0x9wlBu4RhPWy+IBNZqfXabc2306E6+ftNyx8l5lN2DbbdOSIkJf+8ZoDrrCb+YmC82QtoJj91AZfARe430rQff45/utAcnOClcSZNLbybyza2DF2Sf6vZI0uWetD41iu+07TZg60OXNGWC5Iwp0thGyqTtVhV9suwx21Coe9EbPsMA+7VZqOB9rsWpVlzjthkckpEpO9nRG7jonxZz1jlN0jNMfC5NUfvRZL1yQInDB5V/uPlXmThTz9McLEQa7z+ARlAfY6s92dowslXklp7JnE/Y0aK7ovRieLTpfB2dkdk+8HX0tR+NoZcM9pSuI45NQ1LP8Ddk1bsBLjc/GgxOxSk70laz/hE/XQwGn37Ki6Majmw03e7L0UGwGPeMx/NYzLY6mk2D0LrWX0ISeCweQwSZD2Qcak7a4BDMSRuLHB5uZIfgvhjbEG099o6Ap4SmwKeX6xx8SKIFYasQyw20UDifXKTJTKIh3LoLob4kb5RqVSwrMpteXaQOIMZnWHWxOeZFZaj+4EOYaBGedtjaPPo8/bDqUj0KIehiJsxgoCMxdrG7JUtmrjseE4H1wqAN3kJ/om0zG3v7oPznApjH9gXsAsZgX7xZ4JUmw0GxV9C1+DwW0t5ZWfwqsML2SVUr/R2Z5GuJky91kRpC1jwOfhUdHNRKi+5d/ODYVdPBdaPxTN2TGs+mQEoa/XkZWlwJliztPtiJY8e65liGohuR2V3zx1SUlAEBhg92wpMgxCMTyMQG4oqAJbsvl8n1OEFiISQz0AaK8wmm8cPwpp7OGQ7ZMVX2rMa2mDwJdov5g97tNG01sJyZg+bdCUN79crHyclU46L4PqnDN/L6GWMzm2gQwXJsAQQoNJlPDgYKHj6YiAe7CZqmJ4E7+fiUiIyYfb4R2BFXa8EcWWAmCszpf+U4aDX+39XFsijmd+P+vSH+1+DowcNHrv/3w8Mv8b8+y2dL/29yHQv7gk8ggzye2rIVCNwDuDQGIwKxIfKbTY7f0p2b8E8WODn58WmR58QnvhUvIFzHLH0ym0GokKcYgXKP1AlotgBw4+jFKrpIkKNMqCC6XxdRtrLukjAAZLz3+s2z56aJTgcgbOVemHRu+2bsro4CyxFqtW/QeyF0VMhLkvxk+t+Mx5mY2PE4bH40RQtTJ/cmvoIQwoJ3urJTbkKLWTWmem6TrPQ3WjY8kdLVWDWJFfsRWgpfJXO3VyZoWcZwhELCokcK1fb3yRvY8SxDjn+RXRa45FgvVuXbzdBKTi2o9vQ8GxznuRiZKtU0JaqQrktceSNcvUaUDNXywDr5EdC3hQNWma59QLgnhv526KoFGJMeoBoOjIyqUyqMUWBGxpUJDojedV31qKwiA2/LVey5wgpOlyo+OhgYAJBpxoNE7LHpZQFXYMB/cHHk2enYOW7mCKhQbK9cT+NdPzLHuwlsv+llIGd2bbfQYFoO3Yl85ICYGCA82W5jw0fWrfjLolqhwDvLBGeNYdSnCh8qNl4FVdhEiKgXhpyrl+nwtB5ha0aQ+CNg+I6MsnE04cztZGutu3hkdlGTMAMBN3dwi0499NauTQtQktwdWozoQe2InFtfmtZxdSGW0jOQryUC/wQbHi5g2f5C4+b1BZhPyhgiq4sSFDiCukGkM62MoasF9JvgIuIVONbSdjaCogm2WtRGm43a9b9LJEYD/pqtE8RL6mATArmYsbnNO8X1o15wya4vRDsGKUH2aZKmeTQHiqOXKlss0llm38FstSpniUCJWcvCepoGLagWNd12bdleA7shFaxgJRLTlGyzprVTbS8hN+DcLczm6Ti9yki30XbDYy154B8YnknwAm82eQvXYRGUQ9vFxWSWHGM1H5vqFpaei+oMpv7sw41vFNy8M6An3mkf3BfuPuV1alW3Zk03rZMgTuB4v9MqHcaHj/551gkswEUPCNfZj412eHqVYnxKikADkhiFd1rDy+Q8ybShMjDuY8vlzjlaRDNQddOa+jZJEzHTl9ZTKwTIYdg/8XNiUBNPEO6dSXAIkYz1aIOQ27Sp8JaI4lie/e05ijasQwmOItGLN2im0+2sc5SpIf6wmZjB9yzhGg433o/Cp0DAgN2l2WLuIP7FYautjLoJltDDqUHwIQrTtqrBWARlierzWfzKmyyuIdmsQZC9GnU7P4ojl7SY4F4zSw8GGFGqdjqwt4C1XSx+H3wJGRhlRAs22DC/d94gx0TF4TvCEsHSaTkUyJ5TJNyd1jCPXCxQiqnxIqvAdBDxYrPp0QjURaf+2qJT4TCg+OqylSf2HS2h4C5wvQSKtunugvXh3Dxp2KEZt0EHlaaC5PejtITbE647MovXAWVyUk4bDclUwLoOwnDtid4gs5+y5R64ucyrQidqQ3fLYlZrdCn7YHU7wVQp/5W17f98n7D+f73K7kr5/y+b4r8ePjx8eOTo/x88/vbwi/7/c3y21P9nRZ32H1BG1k4/oJvfOAfbDPAvHKOdHAc7ZDMK+9eYT3JuDY3OZXOviDRzGhAh0uGBnvSjCRwB8/GqmA8H6cHhH/rQb/wpuEM7D4h40U0OJr3oj8NokXzocr3oa/yFb3tYvTvp9VQ7O8fPqpkB91xhdc8UlNW2KR2Qv+NIDMPJItIJPczgqfPsVbDkqyz4+DD8tKZwXvM4XHyQHoHH82HwDfZncPjw94++fRwukTVUplf08QrEDwYPsUtH8R+OHj54dPT73z88+sPR48Ojx4JVcUs/iEVpyI0q/h6anweIWH7hNRcWrx8HXi9oLg5FJwJvuW7gTVb/6i/wSvTOGym8vGx6+YpfhqYJ3v9Zv68r8t4qUlfqrVuqruBzOXvfDH7vvh48jJ/TNDw+Ohx8K1bu4cPHjx7+4Q+P0m+ODlXhW80+Kls+tZ/iy/SmcnlvT9JjSqJqjTLBlNVt3axnCH73EBQY3EnitAlIXbNcH5TIgmYFshd6JNK/suLrro/K9havH3VUz0g5C9waZrg1hSZmBNT0w1IqkrMiPlmBl/yLN6ZsanSwK0v3uU+W1yvG73absUQmOT5n2djOE9wVVkKOxdtCNpLLVunCKw+fG0y6YdbyityLnoPVFwC9MWOwGuayOUYur9BVGxMRe43YTPG6M6KOHQvR7tSITMSBNnAOQIahpTe9gsMLjRX6emIa/YGdxvtq8WyIX5jnLx/98fj/u2X98dPM/w8eDI5c/v/o8YMv/P9n+Wxr/5MuluAcJX9XN5UvGhTqmZD/c/UY3KhUvezDHpjsPOX0EIskT87JUxuShM/nUXWdLAXFnBXr1X3xB9QYqIWZrCEKRRWLyk/yG04hfAEOn+AyNJkX00sZaBjbgcBryRJGJz0ZqlTU5WbIqfCKrqPY0SGpjtmtIWbm/w36Gj6lZrY12SE/bXHs/elGkFXr8MT3pKCx3hsNp2BOE2j5poppcsjIE8G4b6llCcTgF5SJiwXpgxoCHB3T8epmmdI3lt6AgUnB17K2I+LHeEw/x+Oa7sgy4qcoo+WrxfIH8LoLmgk9FWcbpJBMEAGLMhFHNqBhH0NiI4cAV8YCF+7LgNSALLygnIOELIlenKlE1BArXZyQaG7e58toyQWoADMAhnwKptgJ9BrGltRbmR6dWIUqXYEv6uEmw6W+7AensawERmYfhvvxarHc98I/40uYPvxiv8ROsNGX9UIOdChBtcEso0W52+P3ctZxibinRsfQow57r86TAzpPDpZijxb5vnnLcWb1zmbeBDPmc3OqTxzG3KweU4Crbme9Ojv4veuNomvP19VFt+4lNF2l6WX3UGBUFZ88f/6X8cnz9z3gEuF5xMgwSc8zTCglHVCQFprtie2SLlfRc/wjcKJmMILtXpXFTaBDeJuy17xZaTB1C6fGqsrD3ggXd2aleTZCnaLSCMAAKIfnwJQrj+jFN4qo6NgGBUKOMZtn3TfkMndNHRkkEthE/uzFJA0VBX8ge3hyU3fI2bO0ys4htKBAKywcrZfKoR0OZBnThmKOYZ1KnJyiw+BQB8in/GTMLEBVNELz1fvyWsb8EccxqfyP0ciS4R3rkAkVimXS/xZTkkDUBEJ07p3ojqjN5hbHhAfQRHO3rMELJODGBAbYqy9vv05Nzd3oQww9W3bJZ+8Dhk7FBuRzTuy3/7MgM9C8rvDVUIA9VYrD8VR5m+HpBoeNrSbMKul0DO/6Ecb4E0u/Xs4xJ9OqJxeZsq6PyUMBjhdBA5MZHEHDThQ5WYg7nJqCS3yDmV5gNJTyBRQX4nzCYVCDaLAiQZFsiD6uUiJEP3lQWYBRrjh8kvmYOzQFb/bhIQiNgi5id5gyUo+oGPibi/99HayN5UD2HTuFu6HS0TfSyAXD1Urv7TEK36KfmM4i+4AedCSvq86bG4nEV6Lv687H2xGUOkaCKyTpIX+MxBXUh74N0SD/uGvHjNRD6InCF3A1Enu52/m5/BnuETs/mzeNXlc8oLzqJoS+OWGmpqhmYKQg2GJYJioYaoIbhRKzfzZUwO4x9fSRYNa0+F9/vD0OzAm22LNZCdLfOCmOFNX3dw4T87ruG5Mlv+i1hGxFnm2LQTK4bUJt4B1gGjpECTvekeQgKIhH8Wy9WFZd1Ufom+tims6DQGF2qS0kbZXRAaXj29QF/Nlyl4TnI9AorKdaSXznOKvdzX7z94dact4uO5HLRr2cjdEGmF4NnNDDBi+1ACrWkIGAtnDrocoD+iXk/7Nv6ibitE6mwFyBxBzBmMG+B078rqlk7dFJWUVddLxFXkbemlku1DLXEEdKT4Oa2ETIZ0WBf0k4Q0EdAMc2R9GSjoUUyTxZtbTo51xQbFbqtjiM7COoiVpTF3YkRA2d3HiwmMfJ4nKWleNlFxJKMRZY3Lfg/hfJZSoKVVQG3zC3/eaEUhxCivcPUyQ3b1HYi74/ih9ZNPrDNEZVENBp/BI/f/6/Xpy8R/WLTGiVVQKO2RU1jSbv7tMckpjwG3Fb0ARql0CVHZHzMRouQkzZ9SQt83QlmNIxvB7j64puTzrH0cEDMMuBL0fg5wVfIFjzJQdt/gv/hRs1KIA3Z+IvXI89FH/hAuyR+Av3W49veZbrrn60J5XA5OdUKFKFiI5WnEGSiV6ZLoorZM3zGxxeBZK3GdBQbLx+NDj8SzT8ni5Hv4NfGf08enho8uEgfwkoHgNOl2zgzyfmZUC/6Bgf8rtlcZ2W9i+aSfHsgbpGGOMBIh4dDCRI0Qy4DOCBnXUs0RBstWBKoj9GD1zDKqNbRtd0nky7BwNd0u7GkeoanXYj/fpU9hDfCspgosexDQhsdo232MppYCijY6N9TLF9aA/MntQwessyZ/OCDlC7VdqRc+64HCqMVTcTaOJgoKqaAL2SPXNj0duvYRK6sAR9mo6vjdn/cl/05fPl8+Xz5fPl8+Xz5fPl8+Xz5fPl8+Xz5fPl8+Xz5fPl8+Xz5fPl8+Xz5fPl8+Xz5fPl8+Xz5fPl8+Xz+T//f0t8PqUASAgA'
     OPENSHIFT_CLIENT_PYTHON_TGZ = six.BytesIO(base64.b64decode(REPLACED_BY_REBUILD_MODULE))
 
     module = AnsibleModule(
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+"""
+Compares the available JSON codecs on List payloads.
+
+    python json_codec_benchmark.py                   # synthetic PodList payloads
+    oc get pods -A -o json > pods.json
+    python json_codec_benchmark.py pods.json ...     # payloads captured from a real cluster
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+import sys
+import timeit
+
+import openshift_client as oc
+from openshift_client import jsoncodec
+
+
+def synthetic_pod_list(count):
+    items = []
+    for i in range(count):
+        items.append({
+            'apiVersion': 'v1',
+            'kind': 'Pod',
+            'metadata': {
+                'name': 'app-{}'.format(i),
+                'namespace': 'ns-{}'.format(i % 20),
+                'uid': '6f1b2c3d-{:04d}-4e5f-8a9b-0c1d2e3f4a5b'.format(i),
+                'resourceVersion': str(100000 + i),
+                'labels': {'app': 'app', 'pod-template-hash': '5d8f7c9b6'},
+                'annotations': {'openshift.io/scc': 'restricted', 'k8s.v1.cni.cncf.io/network-status': 'x' * 300},
+                'ownerReferences': [{'apiVersion': 'apps/v1', 'kind': 'ReplicaSet', 'name': 'app-5d8f7c9b6',
+                                     'uid': 'a1b2', 'controller': True, 'blockOwnerDeletion': True}],
+            },
+            'spec': {
+                'containers': [{
+                    'name': 'main',
+                    'image': 'quay.io/example/app@sha256:' + '0' * 64,
+                    'env': [{'name': 'VAR_{}'.format(j), 'value': 'value-{}'.format(j)} for j in range(15)],
+                    'ports': [{'containerPort': 8080, 'protocol': 'TCP'}],
+                    'resources': {'limits': {'cpu': '500m', 'memory': '512Mi'},
+                                  'requests': {'cpu': '100m', 'memory': '128Mi'}},
+                }],
+                'nodeName': 'worker-{}'.format(i % 10),
+                'restartPolicy': 'Always',
+            },
+            'status': {
+                'phase': 'Running',
+                'podIP': '10.128.{}.{}'.format(i // 250, i % 250),
+                'conditions': [{'type': t, 'status': 'True', 'lastTransitionTime': '2024-01-01T00:00:00Z'}
+                               for t in ('Initialized', 'Ready', 'ContainersReady', 'PodScheduled')],
+            },
+        })
+    return {'apiVersion': 'v1', 'kind': 'List', 'metadata': {}, 'items': items}
+
+
+def benchmark(label, payload_str, number):
+    obj = jsoncodec.StdlibJSONCodec().loads(payload_str)
+    print('{} ({} items, {} KiB)'.format(label, len(obj.get('items', [])), len(payload_str) // 1024))
+
+    codecs = [jsoncodec.StdlibJSONCodec()]
+    try:
+        codecs.append(jsoncodec.OrjsonCodec())
+    except ImportError:
+        print('  orjson is not installed')
+
+    for codec in codecs:
+        payload_bytes = payload_str.encode('utf-8')
+        timings = [
+            ('loads(str)', lambda: codec.loads(payload_str)),
+            ('loads(bytes)', lambda: codec.loads(payload_bytes)),
+            ('dumps', lambda: codec.dumps(obj)),
+            ('dumpb', lambda: codec.dumpb(obj)),
+            ('_json(Model)', lambda: oc.Model(obj)._json()),
+        ]
+        # Model._json() uses the installed codec
+        previous = jsoncodec.set_json_codec(codec)
+        try:
+            for name, func in timings:
+                elapsed = timeit.timeit(func, number=number) / number
+                print('  {:<8} {:<14} {:>9.2f} ms'.format(codec.name, name, elapsed * 1000))
+        finally:
+            jsoncodec.set_json_codec(previous)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            with open(path) as f:
+                benchmark(path, f.read(), number=5)
+    else:
+        for count in (10, 500, 5000):
+            payload = jsoncodec.StdlibJSONCodec().dumps(synthetic_pod_list(count))
+            benchmark('synthetic PodList', payload, number=max(1, 2000 // count))
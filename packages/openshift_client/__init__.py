@@ -6,6 +6,11 @@ from .model import OpenShiftPythonException
 from .model import Model, Missing
 from .selector import *
 from .apiobject import *
+from .predicates import where, label, field
+from .jsoncodec import set_json_codec, get_json_codec
+from .logstream import LogCursors
+from .dumpinfo import ArchiveSink
+from .bulk import bulk_apply, bulk_create, bulk_replace, bulk_delete, BulkReport, BulkOutcome
 from . import naming
 from . import status
 from . import config
@@ -1,8 +1,13 @@
 from __future__ import absolute_import
 
+import io
 import subprocess
+import tempfile
+import threading
+import weakref
 import time
 import socket
+import hashlib
 import json
 import os
 import re
@@ -10,7 +15,8 @@ import datetime
 import traceback
 import six
 
-from .util import TempFile, is_collection_type
+from .util import is_collection_type
+from . import jsoncodec
 
 
 # Three base64 encoded components, '.' delimited is a token. First, find any such match.
@@ -38,6 +44,10 @@ def _is_sensitive(content_str):
     return False
 
 
+# With preview stdin retention, the number of leading bytes of input kept by an Action
+STDIN_PREVIEW_BYTES = 1024
+
+
 def _redaction_string():
     return u'**REDACTED**'
 
@@ -53,6 +63,112 @@ def _redact_content(content_str):
     return content_str
 
 
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class _CapturedOutput(object):
+    """
+    The output of an oc invocation. Output held in memory is decoded on first use. Output which
+    was too large to hold in memory is kept in a temporary file; it is read and decoded each time it is used
+    and the file is removed when this object is garbage collected.
+    """
+
+    def __init__(self, data=None, path=None, size=0):
+        self._data = data
+        self._text = None
+        self.path = path
+        self.size = len(data) if data is not None else size
+        if path is not None:
+            weakref.finalize(self, _remove_quietly, path)
+
+    def __len__(self):
+        return self.size
+
+    def text(self):
+        if self._text is not None:
+            return self._text
+
+        if self.path is None:
+            self._text = self._data.decode('utf-8', errors='ignore')
+            self._data = None
+            return self._text
+
+        with open(self.path, 'rb') as f:
+            return f.read().decode('utf-8', errors='ignore')
+
+    def open(self):
+        """
+        :return: Returns a binary file-like object from which the output can be read.
+        """
+        if self.path is not None:
+            return open(self.path, 'rb')
+        if self._data is not None:
+            return io.BytesIO(self._data)
+        return io.BytesIO(self._text.encode('utf-8'))
+
+
+class _OutputSink(object):
+    """
+    Collects output in memory until it exceeds limit bytes; the output is then spilled to a temporary file.
+    """
+
+    def __init__(self, limit, spilled=False):
+        self.limit = limit
+        self.buf = []
+        self.size = 0
+        self.file = None
+        self.path = None
+        if spilled:
+            # The output will be written directly to the file (e.g. by a child process)
+            self._spill()
+
+    def _spill(self):
+        fd, self.path = tempfile.mkstemp(prefix='openshift-client-python', suffix='.out')
+        self.file = os.fdopen(fd, 'w+b')
+        for chunk in self.buf:
+            self.file.write(chunk)
+        self.buf = []
+
+    def write(self, chunk):
+        self.size += len(chunk)
+        if self.file is None and self.limit is not None and self.size > self.limit:
+            self._spill()
+        if self.file is not None:
+            self.file.write(chunk)
+        else:
+            self.buf.append(chunk)
+
+    def finish(self):
+        """
+        :return: Returns a _CapturedOutput for everything written to this sink.
+        """
+        if self.file is None:
+            return _CapturedOutput(data=b''.join(self.buf))
+
+        try:
+            self.file.flush()
+            size = self.file.seek(0, os.SEEK_END)
+            if self.limit is None or size <= self.limit:
+                self.file.seek(0, os.SEEK_SET)
+                data = self.file.read()
+                self.discard()
+                return _CapturedOutput(data=data)
+            self.file.close()
+            return _CapturedOutput(path=self.path, size=size)
+        except Exception:
+            self.discard()
+            raise
+
+    def discard(self):
+        if self.file is not None:
+            self.file.close()
+            _remove_quietly(self.path)
+
+
 class Action(object):
 
     def __init__(self, verb, cmd_list, out, err, references, status, stdin_str=None,
@@ -62,8 +178,8 @@ class Action(object):
         self.status = status
         self.verb = verb
         self.cmd = cmd_list
-        self.out = out or ''
-        self.err = err or ''
+        self._out = out or ''
+        self._err = err or ''
         self.stdin_str = stdin_str
         self.references = references
         self.timeout = timeout
@@ -75,8 +191,48 @@ class Action(object):
         if self.references is None:
             self.references = {}
 
+    @property
+    def out(self):
+        """
+        The stdout of the invocation. Large output is kept on disk and read each time this is accessed;
+        consider open_out() to process it incrementally.
+        """
+        if isinstance(self._out, _CapturedOutput):
+            return self._out.text()
+        return self._out
+
+    @out.setter
+    def out(self, value):
+        self._out = value or ''
+
+    @property
+    def err(self):
+        """
+        The stderr of the invocation.
+        """
+        if isinstance(self._err, _CapturedOutput):
+            return self._err.text()
+        return self._err
+
+    @err.setter
+    def err(self, value):
+        self._err = value or ''
+
+    def open_out(self):
+        """
+        :return: Returns a binary file-like object from which the stdout of the invocation can be read
+            without decoding all of it into memory. The caller should close it.
+        """
+        if isinstance(self._out, _CapturedOutput):
+            return self._out.open()
+        return io.BytesIO(self._out.encode('utf-8'))
+
     def as_dict(self, truncate_stdout=-1, redact_tokens=True, redact_streams=True, redact_references=True):
 
+        # Large output may be kept on disk; read it once
+        out = self.out
+        err = self.err
+
         d = {
             'timestamp': self.exec_time,
             'elapsed_time': self.elapsed_time,
@@ -84,8 +240,8 @@ class Action(object):
             'status': self.status,
             'verb': self.verb,
             'cmd': self.cmd,
-            'out': self.out,
-            'err': self.err,
+            'out': out,
+            'err': err,
             'in': self.stdin_str,
             'references': self.references,
             'timeout': self.timeout,
@@ -136,10 +292,10 @@ class Action(object):
             d['references'] = refs
 
         if redact_streams:
-            if _is_sensitive(self.err):
-                d['err'] = _redact_content(self.err)
+            if _is_sensitive(err):
+                d['err'] = _redact_content(err)
             else:
-                d['err'] = self.err
+                d['err'] = err
 
         if self.stdin_str:
             if redact_streams and _is_sensitive(self.stdin_str):
@@ -148,21 +304,21 @@ class Action(object):
                 try:
                     # If the input can be parsed as json, do so
                     if self.stdin_str.strip().startswith('{'):
-                        d['in_obj'] = json.loads(self.stdin_str)
+                        d['in_obj'] = jsoncodec.loads(self.stdin_str)
                         del d['in']
                 except:
                     pass
 
-        if redact_streams and _is_sensitive(self.out):
-            d['out'] = _redact_content(self.out)
+        if redact_streams and _is_sensitive(out):
+            d['out'] = _redact_content(out)
         else:
-            if len(self.out) > truncate_stdout > -1:
-                d['out'] = (self.out[:truncate_stdout] + '...truncated...')
+            if len(out) > truncate_stdout > -1:
+                d['out'] = (out[:truncate_stdout] + '...truncated...')
             else:
                 try:
                     # If the output can be parsed as json, do so
-                    if self.out.startswith('{'):
-                        d['out_obj'] = json.loads(self.out)
+                    if out.startswith('{'):
+                        d['out_obj'] = jsoncodec.loads(out)
                         del d['out']
                 except:
                     pass
@@ -205,8 +361,138 @@ def _flatten_list(l):
     return agg
 
 
+class _StdinRecorder(object):
+    """
+    Iterates the chunks of input written to oc, keeping only what the stdin retention mode
+    requires for the resulting Action.
+    """
+
+    def __init__(self, chunks, retention, stdin_str):
+        self.chunks = iter(chunks)
+        self.retention = retention
+        self.stdin_str = stdin_str
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.preview = b''
+        self.sensitive = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            if self.retention != 'full':
+                self.digest.update(chunk)
+                self.size += len(chunk)
+                if self.retention == 'preview':
+                    if len(self.preview) < STDIN_PREVIEW_BYTES:
+                        self.preview += chunk[:STDIN_PREVIEW_BYTES - len(self.preview)]
+                    if not self.sensitive:
+                        self.sensitive = _is_sensitive(chunk.decode('utf-8', errors='ignore'))
+            yield chunk
+
+    def record(self, references):
+        """
+        Records the digest and size of the input in references, if required by the retention mode.
+        :return: The stdin_str the Action should keep.
+        """
+        if self.retention == 'full':
+            return self.stdin_str
+
+        # Account for any input which was not written (e.g. oc exited early)
+        for _ in self:
+            pass
+
+        references['.stdin_sha256'] = self.digest.hexdigest()
+        references['.stdin_bytes'] = self.size
+
+        if self.retention == 'digest' or not self.size:
+            return None
+
+        if self.sensitive:
+            return _redaction_string()
+
+        preview = self.preview.decode('utf-8', errors='ignore')
+        if self.size > len(self.preview):
+            preview += '...truncated...'
+        return preview
+
+
+def _write_stdin(pipe, chunks):
+    try:
+        for chunk in chunks:
+            pipe.write(chunk)
+    except (IOError, OSError):
+        pass  # oc exited without reading all of its input
+    finally:
+        try:
+            pipe.close()
+        except (IOError, OSError):
+            pass
+
+
+def _fileno(f):
+    try:
+        return f.fileno()
+    except (AttributeError, IOError, OSError, ValueError):
+        # io.BytesIO raises io.UnsupportedOperation, which is an OSError and ValueError
+        return None
+
+
+def _file_offset(f):
+    """
+    :return: Returns the offset of the file descriptor underlying f, or None if it is not seekable (e.g. a pipe).
+    """
+    try:
+        return os.lseek(f.fileno(), 0, os.SEEK_CUR)
+    except (IOError, OSError):
+        return None
+
+
+class _CountingWriter(object):
+    """
+    Writes chunks of output to a binary file-like object or callable, counting the bytes written.
+    """
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.write_func = sink.write if hasattr(sink, 'write') else sink
+        self.size = 0
+
+    def write(self, chunk):
+        self.size += len(chunk)
+        self.write_func(chunk)
+
+
+def _copy_output(stream, writer):
+    # read1() returns whatever is available rather than waiting for a full chunk, so
+    # output reaches the writer as it is produced (e.g. 'oc logs --follow').
+    read = getattr(stream, 'read1', stream.read)
+    while True:
+        chunk = read(64 * 1024)
+        if not chunk:
+            break
+        writer.write(chunk)
+
+
+def _read_output(stream, limit):
+    """
+    Reads a stream to its end, spilling to disk if it exceeds limit bytes.
+    :return: A _CapturedOutput
+    """
+    sink = _OutputSink(limit)
+    try:
+        while True:
+            chunk = stream.read(64 * 1024)
+            if not chunk:
+                break
+            sink.write(chunk)
+        return sink.finish()
+    except Exception:
+        sink.discard()
+        raise
+
+
 def oc_action(context, verb, cmd_args=None, all_namespaces=False, no_namespace=False, namespace=None,
               references=None, stdin_obj=None, stdin_str=None, last_attempt=True,
+              stdin_file=None, stdout_sink=None,
               **kwargs):
     """
     Executes oc client verb with arguments. Returns an Action with result information.
@@ -220,6 +506,10 @@ def oc_action(context, verb, cmd_args=None, all_namespaces=False, no_namespace=F
     :param stdin_obj: A json serializable object to supply to stdin for the oc invocation
     :param stdin_str: If stdin is not a json serializable object. Cannot be specified in conjunction with stdin_obj.
     :param last_attempt: If False, implies that this action will be retried by higher level control on failure.
+    :param stdin_file: A binary file-like object to read incrementally and supply to stdin. Cannot be specified in
+        conjunction with stdin_obj or stdin_str. The Action keeps at most a preview of this input.
+    :param stdout_sink: If specified, stdout is not captured by the Action. Instead, its raw bytes are written
+        to this binary file-like object or passed, chunk by chunk, to this callable as they are produced.
     :param kwargs:
     :return: An Action object.
     :rtype: Action
@@ -281,9 +571,30 @@ def oc_action(context, verb, cmd_args=None, all_namespaces=False, no_namespace=F
 
     timeout = False
 
-    # If stdin_object is specified, serialize into the string.
+    # If stdin_object is specified, serialize it. Unless the Action must keep the entire input,
+    # the object is encoded incrementally while it is written to oc.
+    stdin_retention = context.get_stdin_retention()
+    max_output_memory = context.get_max_output_memory()
     if stdin_obj:
-        stdin_str = json.dumps(stdin_obj, indent=None)
+        if stdin_retention == 'full':
+            stdin_str = jsoncodec.dumps(stdin_obj, indent=None)
+            stdin_chunks = [stdin_str.encode('utf-8')]
+        else:
+            stdin_chunks = jsoncodec.iterencode(stdin_obj)
+    elif stdin_str:
+        stdin_chunks = [stdin_str.encode('utf-8')]
+    elif stdin_file is not None:
+        stdin_chunks = iter(lambda: stdin_file.read(64 * 1024), b'')
+        if stdin_retention == 'full':
+            stdin_retention = 'preview'  # The input is never held in memory in its entirety
+    else:
+        stdin_chunks = None
+
+    stdout_writer = None
+    if stdout_sink is not None:
+        stdout_writer = _CountingWriter(stdout_sink)
+
+    stdin_recorder = _StdinRecorder(stdin_chunks or [], stdin_retention, stdin_str)
 
     # Set defaults in case is_out_of_time is true
     stdout = ""
@@ -322,18 +633,22 @@ def oc_action(context, verb, cmd_args=None, all_namespaces=False, no_namespace=F
                                                                                               'LC_ALL': 'en_US.UTF-8',
                                                                                           }
                                                                                           )
-                if stdin_str:
-                    ssh_stdin.write(stdin_str)
+                if stdin_chunks is not None:
+                    for chunk in stdin_recorder:
+                        ssh_stdin.write(chunk)
                     ssh_stdin.flush()
                     ssh_stdin.channel.shutdown_write()
 
                 # In python2, read() returns type:str. In python3, I believe it will return type:bytes.
-                # By decoding, we are making the assumption that openshift-client-python will be
+                # When accessed, output is decoded, making the assumption that openshift-client-python will be
                 # useful for text based interactions (e.g. we don't support oc exec with
                 # binary output). By converting into a real unicode string type, hopefully we prevent
                 # a raft of incompatibilities between 2 and 3.
-                stdout = ssh_stdout.read().decode('utf-8', errors='ignore')
-                stderr = ssh_stderr.read().decode('utf-8', errors='ignore')
+                if stdout_writer is not None:
+                    _copy_output(ssh_stdout, stdout_writer)
+                else:
+                    stdout = _read_output(ssh_stdout, max_output_memory)
+                stderr = _read_output(ssh_stderr, max_output_memory)
                 return_code = ssh_stdout.channel.recv_exit_status()
 
             except socket.timeout as error:
@@ -342,30 +657,74 @@ def oc_action(context, verb, cmd_args=None, all_namespaces=False, no_namespace=F
 
         else:
 
-            with TempFile(content=stdin_str) as stdin_file:
-                with TempFile() as out:
-                    with TempFile() as err:
-                        # When only python3 is supported, change to using standard timeout
-                        env = os.environ.copy()
-                        env['LC_ALL'] = 'en_US.UTF-8'
-                        process = subprocess.Popen(cmds, stdin=stdin_file.file,
-                                                   stdout=out.file, stderr=err.file, env=env)
-
-                        while process.poll() is None:
-                            expired, timeout_context = context.get_out_of_time()
-                            if expired:
-                                try:
-                                    timeout = True
-                                    process.kill()
-                                    break
-                                except OSError:
-                                    pass  # ignore
-                            time.sleep(period)
-                            period = min(1, period + period)  # Poll fast at first, but slow down to 1/sec over time
-
-                        # See note in paramiko flow on decoding
-                        stdout = out.read().decode('utf-8', errors='ignore')
-                        stderr = err.read().decode('utf-8', errors='ignore')
+            # The child writes directly to files. Output small enough is then read back into memory.
+            out = None
+            stdout_file = None
+            stdout_start = None
+            if stdout_writer is None:
+                out = _OutputSink(max_output_memory, spilled=True)
+                stdout_file = out.file
+            elif _fileno(stdout_sink) is not None:
+                # The child can write directly into the caller's file
+                stdout_sink.flush()
+                stdout_file = stdout_sink
+                stdout_start = _file_offset(stdout_file)
+            err = _OutputSink(max_output_memory, spilled=True)
+            try:
+                # When only python3 is supported, change to using standard timeout
+                env = os.environ.copy()
+                env['LC_ALL'] = 'en_US.UTF-8'
+                process = subprocess.Popen(cmds,
+                                           stdin=subprocess.DEVNULL if stdin_chunks is None else subprocess.PIPE,
+                                           stdout=stdout_file if stdout_file is not None else subprocess.PIPE,
+                                           stderr=err.file, env=env)
+
+                stdout_reader = None
+                if stdout_file is None:
+                    stdout_reader = threading.Thread(target=_copy_output, args=(process.stdout, stdout_writer))
+                    stdout_reader.daemon = True
+                    stdout_reader.start()
+
+                # Input is written by a separate thread so that timeouts are enforced even if oc
+                # stops reading it.
+                stdin_writer = None
+                if stdin_chunks is not None:
+                    stdin_writer = threading.Thread(target=_write_stdin, args=(process.stdin, stdin_recorder))
+                    stdin_writer.daemon = True
+                    stdin_writer.start()
+
+                while process.poll() is None:
+                    expired, timeout_context = context.get_out_of_time()
+                    if expired:
+                        try:
+                            timeout = True
+                            process.kill()
+                            break
+                        except OSError:
+                            pass  # ignore
+                    time.sleep(period)
+                    period = min(1, period + period)  # Poll fast at first, but slow down to 1/sec over time
+
+                if stdin_writer is not None:
+                    stdin_writer.join()
+
+                if stdout_reader is not None:
+                    stdout_reader.join()
+                    process.stdout.close()
+                elif stdout_writer is not None:
+                    # The number of bytes written is only known if the caller's file is seekable
+                    end = _file_offset(stdout_file)
+                    stdout_writer.size = end - stdout_start if None not in (stdout_start, end) else None
+
+                # Decoding is deferred until the output is used. See note in paramiko flow on decoding.
+                if out is not None:
+                    stdout = out.finish()
+                stderr = err.finish()
+            except Exception:
+                if out is not None:
+                    out.discard()
+                err.discard()
+                raise
 
             return_code = process.returncode
             if timeout:
@@ -386,6 +745,11 @@ def oc_action(context, verb, cmd_args=None, all_namespaces=False, no_namespace=F
     if timeout and timeout_context and timeout_context.frame_info:
         references['.timeout_context'] = '{}:{}'.format(timeout_context.frame_info[0], timeout_context.frame_info[1])
 
+    stdin_str = stdin_recorder.record(references)
+
+    if stdout_writer is not None and stdout_writer.size is not None:
+        references['.stdout_bytes'] = stdout_writer.size
+
     internal = kwargs.get("internal", False)
     a = Action(verb, cmds, stdout, stderr, references, return_code,
                stdin_str=stdin_str, last_attempt=last_attempt,
@@ -6,6 +6,8 @@ import sys
 import yaml
 
 from . import util
+from . import jsoncodec
+from . import logstream
 from .action import *
 from .context import cur_context
 from .model import *
@@ -90,7 +92,7 @@ class APIObject:
                     "items": []
                 }
             elif string_to_model.startswith("{"):
-                dict_to_model = json.loads(string_to_model)
+                dict_to_model = jsoncodec.loads(string_to_model)
             elif "\n" in string_to_model:  # Assume yaml
                 dict_to_model = yaml.safe_load(string_to_model)
             else:  # Assume URL
@@ -106,6 +108,15 @@ class APIObject:
         self.context = copy.copy(context if context else cur_context())
         self.context.project_name = self.namespace(self.context.project_name)
 
+    def _mark_server_state(self):
+        """
+        Records that this APIObject's model is the content of the object as read from the server, so that
+        modifications to the model can be applied as a patch (see modify_and_apply).
+        :return: self
+        """
+        self.model._mark_server_state()
+        return self
+
     def as_dict(self):
         """
         :return: Returns a python dict representation of the APIObject. Changes are not communicated
@@ -117,7 +128,7 @@ class APIObject:
         """
         :return: Returns a JSON presentation of the APIObject.
         """
-        return json.dumps(self.model._primitive(), indent=indent).strip()
+        return self.model._json(indent=indent).strip()
 
     def kind(self, lowercase=True, if_missing=_DEFAULT):
         """
@@ -269,14 +280,11 @@ class APIObject:
         :return: The Result
         :rtype: Result
         """
-        # Convert Model into a dict
-        content = self.as_dict()
-
         base_args = list()
         base_args.extend(["-o=name", "-f", "-"])
         result = Result(verb)
         result.add_action(oc_action(self.context, verb, cmd_args=[base_args, cmd_args],
-                                    stdin_obj=content, namespace=self.namespace(if_missing=None)))
+                                    stdin_str=self.model._json(), namespace=self.namespace(if_missing=None)))
 
         if auto_raise:
             result.fail_if("Error during object {}".format(verb))
@@ -354,7 +362,7 @@ class APIObject:
         return (r.out() + '\n' + r.err()).strip()
 
     def logs(self, timestamps=False, previous=False, since=None, limit_bytes=None, tail=-1, cmd_args=None,
-             try_longshots=True):
+             try_longshots=True, cursors=None):
         """
         Attempts to collect logs from running pods associated with this resource. Supports
         daemonset, statefulset, deploymentconfig, deployment, replicationcontroller, replicationset,
@@ -378,34 +386,56 @@ class APIObject:
         not natively understand to possess logs. If False and the object is not recognized, an empty dict will be
         returned.
 
+        :param cursors: An optional LogCursors. If specified, only lines written since the last time logs were
+        collected with the same LogCursors are returned (since is used only when a container's logs
+        are collected for the first time). The positions reached are saved when collection is complete.
+
         :return: Returns a dict of {<fully-qualified-name> -> <log output>}. The fully qualified name will be
         a human readable, unique identifier containing namespace, object, and container-name (when applicable).
         """
+        log_aggregation = self._collect_logs(timestamps=timestamps, previous=previous, since=since,
+                                             limit_bytes=limit_bytes, tail=tail, cmd_args=cmd_args,
+                                             try_longshots=try_longshots, cursors=cursors)
+        if cursors is not None:
+            cursors.save()
+        return log_aggregation
+
+    def _collect_logs(self, timestamps=False, previous=False, since=None, limit_bytes=None, tail=-1, cmd_args=None,
+                      try_longshots=True, cursors=None):
+        """
+        Implements logs(), except that cursors are advanced but not saved, so that a caller collecting the
+        logs of many objects can save them once.
+        """
         log_aggregation = {}
 
-        def add_entry(collection, entry_key, action):
-            entry = action.out
+        def add_entry(collection, entry_key, action, entry):
             if action.status != 0:
                 entry += u'\n>>>>Error during log collection rc={}<<<<\n{}\n'.format(action.status, action.err)
             entry = entry.strip().replace('\r\n', '\n')
             collection[entry_key] = entry
 
-        base_args = list()
+        base_args = logstream.log_args(timestamps=timestamps, previous=previous, since=since,
+                                       limit_bytes=limit_bytes, tail=tail)
 
-        if previous:
-            base_args.append('-p')
-
-        if since:
-            base_args.append('--since={}'.format(since))
-
-        if limit_bytes:
-            base_args.append('--limit-bytes={}'.format(limit_bytes))
-
-        if timestamps:
-            base_args.append('--timestamps')
+        for key, cursor_id, target_args, action_kwargs in self._log_sources(try_longshots, previous=previous):
+            args = base_args if cursors is None else cursors.log_args(cursor_id, base_args)
+            action = oc_action(self.context, "logs", cmd_args=[args, cmd_args, target_args], **action_kwargs)
+            entry = action.out
+            if cursors is not None and action.status == 0:
+                entry = cursors.advance(cursor_id, entry, timestamps=timestamps)
+            add_entry(log_aggregation, key, action, entry)
 
-        base_args.append('--tail={}'.format(tail))
+        return log_aggregation
 
+    def _log_sources(self, try_longshots, previous=False):
+        """
+        Determines the 'oc logs' invocations which collect the logs associated with this resource (see logs()).
+        :param try_longshots: See logs().
+        :param previous: Whether the logs of the previous instances of containers are collected.
+        :return: A list of (<fully-qualified-name>, <cursor id>, <target arguments>, <oc_action kwargs>) tuples.
+        The cursor id identifies the log by UID (see LogCursors). Target arguments follow all other arguments.
+        """
+        sources = []
         pod_list = []
 
         if kind_matches(self.kind(), 'pod'):
@@ -426,38 +456,110 @@ class APIObject:
             pod_list.extend(self.get_owned('pod'))
 
         elif kind_matches(self.kind(), ['bc', 'build']):
-            action = oc_action(self.context, "logs", cmd_args=[base_args, cmd_args, self.qname()],
-                               namespace=self.namespace(if_missing=None))
-            add_entry(log_aggregation, self.fqname(), action)
+            sources.append((self.fqname(), self._log_cursor_id(self, previous=previous), [self.qname()],
+                            dict(namespace=self.namespace(if_missing=None))))
 
-        else:
-            if try_longshots:
-                # If the kind directly owns pods, we can find the logs for it
-                pod_list.extend(self.get_owned('pod'))
-                if not pod_list:
-                    # Just try to collect logs and see what happens
-                    action = oc_action(self.context, "logs", cmd_args=[base_args, cmd_args, self.qname()],
-                                       namespace=self.namespace(if_missing=None))
-                    add_entry(log_aggregation, self.fqname(), action)
-                else:
-                    # We don't recognize kind and we aren't taking longshots.
-                    return dict()
+        elif try_longshots:
+            # If the kind directly owns pods, we can find the logs for it
+            pod_list.extend(self.get_owned('pod'))
+            if not pod_list:
+                # Just try to collect logs and see what happens
+                sources.append((self.fqname(), self._log_cursor_id(self, previous=previous), [self.qname()],
+                                dict(namespace=self.namespace(if_missing=None))))
+
+        # Otherwise, we don't recognize kind and we aren't taking longshots.
 
         for pod in pod_list:
             for container in pod.model.spec.containers:
-                action = oc_action(self.context, "logs",
-                                   cmd_args=[base_args, cmd_args, pod.qname(), '-c', container.name,
-                                             '--namespace={}'.format(pod.namespace())],
-                                   no_namespace=True  # Namespace is included in cmd_args, do not use context
-                                   )
                 # Include self.fqname() to let reader know how we actually found this pod (e.g. from a dc).
                 key = '{}->{}({})'.format(self.fqname(), pod.qname(), container.name)
-                add_entry(log_aggregation, key, action)
+                sources.append((key, self._log_cursor_id(pod, container.name, previous=previous),
+                                [pod.qname(), '-c', container.name, '--namespace={}'.format(pod.namespace())],
+                                dict(no_namespace=True)))  # Namespace is included in cmd_args, do not use context
+
+        return sources
+
+    @staticmethod
+    def _log_cursor_id(obj, container_name=None, previous=False):
+        # Unlike names, UIDs are not reused by a replacement object, whose logs start afresh.
+        cursor_id = obj.model.metadata.uid or obj.fqname()
+        if container_name is not None:
+            cursor_id = '{}/{}'.format(cursor_id, container_name)
+        if previous:
+            # The previous instance of a container has a log of its own ('#' cannot appear in names)
+            cursor_id += '#previous'
+        return cursor_id
 
-        return log_aggregation
+    def stream_logs(self, follow=True, since_time=None, timestamps=False, previous=False, since=None,
+                    limit_bytes=None, tail=-1, cmd_args=None, try_longshots=True,
+                    max_buffered_lines=logstream.DEFAULT_MAX_BUFFERED_LINES):
+        """
+        Streams logs from the pods associated with this resource as they are written (see logs() for
+        the resources which are supported). An 'oc logs' invocation is made for each container and all of
+        them are read concurrently.
+
+        Lines are buffered until they are consumed. Once max_buffered_lines are waiting, reading from oc
+        is paused, so a slow consumer does not cause unbounded memory use. Streaming ends when all
+        invocations have exited. If the current context times out, or the returned generator is closed,
+        the remaining invocations are terminated.
+
+        As with logs(), if an invocation fails, its stderr is streamed as lines from that source.
+
+        :param follow: If True, continue to stream logs as they are written.
+        :param since_time: Only stream lines written after this time. An RFC3339 string or a datetime
+        (naive datetimes are assumed to be UTC).
+        :param max_buffered_lines: The number of lines which may be read but not yet consumed.
+        :param cmd_args: An optional list of additional arguments to pass on the command line
+        :return: A generator of (<fully-qualified-name>, <line>) tuples. See logs() for the format of
+        the name. Lines from a given source are in order; lines from different sources are interleaved
+        in the order they are received.
+        """
+        base_args = logstream.log_args(timestamps=timestamps, previous=previous, since=since,
+                                       limit_bytes=limit_bytes, tail=tail, follow=follow, since_time=since_time)
+        return logstream.stream_log_sources(self._log_stream_sources(base_args, cmd_args, try_longshots),
+                                            max_buffered_lines=max_buffered_lines)
+
+    def _log_stream_sources(self, base_args, cmd_args, try_longshots):
+        """
+        :return: Returns _log_sources() in the form accepted by the logstream module.
+        """
+        return [(key, self.context, dict(action_kwargs, cmd_args=[base_args, cmd_args, target_args]))
+                for key, _, target_args, action_kwargs in self._log_sources(try_longshots)]
+
+    def merged_logs(self, since_time=None, previous=False, since=None, limit_bytes=None, tail=-1, cmd_args=None,
+                    try_longshots=True, max_buffered_lines=logstream.DEFAULT_MERGE_BUFFERED_LINES):
+        """
+        Collects logs from the pods associated with this resource (see logs()) and merges them into a
+        single sequence of lines in timestamp order. Logs are requested with --timestamps and read
+        concurrently. Each container's output is buffered up to max_buffered_lines and merged as it is
+        read, so memory use does not depend on the size of the logs.
+        :param since_time: Only include lines written after this time. An RFC3339 string or a datetime.
+        :param max_buffered_lines: The number of lines which may be buffered for each container.
+        :param cmd_args: An optional list of additional arguments to pass on the command line
+        :return: A generator of (<timestamp>, <fully-qualified-name>, <line>) tuples. See logs() for the
+        format of the name. The timestamp is the string reported by oc, or None for lines which did not
+        include one (e.g. errors collecting the logs).
+        """
+        base_args = logstream.log_args(timestamps=True, previous=previous, since=since, limit_bytes=limit_bytes,
+                                       tail=tail, since_time=since_time)
+        return logstream.merge_log_sources(self._log_stream_sources(base_args, cmd_args, try_longshots),
+                                           max_buffered_lines=max_buffered_lines)
+
+    def print_merged_logs(self, stream=sys.stderr, since_time=None, previous=False, since=None, limit_bytes=None,
+                          tail=-1, cmd_args=None, try_longshots=True):
+        """
+        Prints logs merged in timestamp order to an output stream, a line each (see merged_logs() method).
+        :param stream: Output stream to send merged logs (defaults to sys.stderr).
+        :param cmd_args: An optional list of additional arguments to pass on the command line
+        :return: n/a
+        """
+        logstream.write_merged_logs(stream,
+                                    self.merged_logs(since_time=since_time, previous=previous, since=since,
+                                                     limit_bytes=limit_bytes, tail=tail, cmd_args=cmd_args,
+                                                     try_longshots=try_longshots))
 
     def print_logs(self, stream=sys.stderr, timestamps=False, previous=False, since=None, limit_bytes=None, tail=-1,
-                   cmd_args=None, try_longshots=True):
+                   cmd_args=None, try_longshots=True, cursors=None):
         """
         Pretty prints logs from selected objects to an output stream (see logs() method).
         :param stream: Output stream to send pretty printed report (defaults to sys.stderr)..
@@ -466,7 +568,7 @@ class APIObject:
         """
         util.print_logs(stream,
                         self.logs(timestamps=timestamps, previous=previous, since=since, limit_bytes=limit_bytes,
-                                  tail=tail, try_longshots=try_longshots, cmd_args=cmd_args))
+                                  tail=tail, try_longshots=try_longshots, cmd_args=cmd_args, cursors=cursors))
 
     def modify_and_apply(self, modifier_func, retries=2, cmd_args=None, **kwargs):
         """
@@ -474,6 +576,12 @@ class APIObject:
         and return True if it wants this method to try to apply the change via the API. For robust
         implementations, a non-zero number of retries is recommended.
 
+        If the model was read from the server (e.g. by Selector.objects() or refresh()) and has a
+        resourceVersion, only the fields modified since it was read are sent, as a JSON merge patch which
+        includes the resourceVersion as a precondition. On success, the model is updated with the server's
+        copy of the object. Otherwise (e.g. for an APIObject built from a local definition, or if no
+        modification is found), the entire object is applied.
+
         :param modifier_func: Called before each attempt with a self. The associated model will be refreshed before
             each call if necessary. If the function finds changes it wants to make to the model, it should
             make them directly and return True. If it does not want to make changes, it should return False.
@@ -496,14 +604,33 @@ class APIObject:
             if do_apply is False:
                 break
 
-            apply_action = oc_action(self.context, "apply", cmd_args=["-f", "-", cmd_args],
-                                     namespace=self.namespace(if_missing=None), stdin_obj=self.as_dict(),
-                                     last_attempt=(attempt == 0))
+            # Changes can only be sent as a patch if the model was read from the server; the content of a
+            # model built locally (e.g. from a file) may differ from the server's in ways which were not
+            # made through the model. If no change can be found, the whole model is applied.
+            resource_version = self.model.metadata.resourceVersion
+            patch = None
+            if resource_version and self.model._is_server_state():
+                patch = self.model._merge_patch()
+
+            if patch:
+                patch.setdefault('metadata', {})['resourceVersion'] = resource_version
+                apply_action = oc_action(self.context, "patch",
+                                         cmd_args=[self.qname(), "--type=merge", "-o=json",
+                                                   "--patch=" + jsoncodec.dumps(patch, indent=None), cmd_args],
+                                         namespace=self.namespace(if_missing=None),
+                                         last_attempt=(attempt == 0))
+            else:
+                apply_action = oc_action(self.context, "apply", cmd_args=["-f", "-", cmd_args],
+                                         namespace=self.namespace(if_missing=None), stdin_str=self.model._json(),
+                                         last_attempt=(attempt == 0))
 
             r.add_action(apply_action)
 
             if apply_action.status == 0:
                 applied_change = True
+                if patch:
+                    self.model = Model(jsoncodec.loads(apply_action.out))
+                    self.model._mark_server_state()
                 break
 
             if attempt != 0:
@@ -559,7 +686,8 @@ class APIObject:
 
             r.add_action(r_action)
             if r_action.status == 0:
-                self.model = Model(json.loads(r_action.out))
+                self.model = Model(jsoncodec.loads(r_action.out))
+                self.model._mark_server_state()
                 break
 
             time.sleep(1)
@@ -584,7 +712,7 @@ class APIObject:
 
             r.add_action(r_action)
             if r_action.status == 0:
-                new_apiobj = APIObject(string_to_model=r_action.out)
+                new_apiobj = APIObject(string_to_model=r_action.out)._mark_server_state()
                 if new_apiobj.is_kind('list') and not new_apiobj.elements():
                     # Nothing to return
                     if ignore_not_found:
@@ -659,7 +787,7 @@ class APIObject:
         base_args.append("--type=" + strategy)
 
         base_args.append(self.qname())
-        patch_def = json.dumps(patch_dict, indent=None)
+        patch_def = jsoncodec.dumps(patch_dict, indent=None)
 
         base_args.append("--patch=" + patch_def)
         r.add_action(oc_action(self.context, "patch", cmd_args=[base_args, cmd_args],
@@ -784,15 +912,11 @@ class APIObject:
         :return: A (potentially empty) list of APIObjects owned by this object
         """
 
-        owned = []
-
-        def check_owned_by_me(apiobj):
-            if self.do_i_own(apiobj):
-                owned.append(apiobj)
+        # Ownership can be determined from metadata alone; only fetch the objects which are actually owned.
+        owned = [obj.qname() for obj in selector(find_kind, static_context=self.context).metadata()
+                 if self.do_i_own(obj)]
 
-        selector(find_kind, static_context=self.context).for_each(check_owned_by_me)
-
-        return owned
+        return selector(owned, static_context=self.context).objects()
 
     def get_events(self):
         """
@@ -858,14 +982,18 @@ class APIObject:
 
         return selector(find_kind, labels=labels, static_context=self.context)
 
-    def execute(self, cmd_to_exec=None, stdin=None, container_name=None, auto_raise=True):
+    def execute(self, cmd_to_exec=None, stdin=None, container_name=None, auto_raise=True, stdout=None):
         """
         Performs an oc exec operation on a pod object - passing all of the arguments.
         :param cmd_to_exec: An array containing all elements of the command to execute.
-        :param stdin: Any input that should be streamed into the executed process.
+        :param stdin: Any input that should be streamed into the executed process. Either a string or a
+            binary file-like object, which is read incrementally.
         :param container_name: If the pod has more than one container, specifies the container in which to exec.
         :param auto_raise: Raise an exception if the command returns a non-zero status.
-        :return: A result object
+        :param stdout: If specified, the output of the command is not captured in the Result. Instead, its raw
+            bytes are written to this binary file-like object (or passed, chunk by chunk, to this callable) as they
+            are produced, so binary output is preserved and memory use does not grow with the output.
+        :return: A result object. The exit status of the command is available from its status().
         """
 
         if cmd_to_exec is None:
@@ -879,10 +1007,18 @@ class APIObject:
         if container_name:
             oc_args.append('--container={}'.format(container_name))
 
+        stdin_str = None
+        stdin_file = None
+        if hasattr(stdin, 'read'):
+            stdin_file = stdin
+        else:
+            stdin_str = stdin
+
         r = Result("exec")
         r.add_action(
             oc_action(self.context, "exec", cmd_args=[oc_args, self.qname(), "--", cmd_to_exec],
-                      stdin_str=stdin, namespace=self.namespace(if_missing=None)))
+                      stdin_str=stdin_str, stdin_file=stdin_file, stdout_sink=stdout,
+                      namespace=self.namespace(if_missing=None)))
         if auto_raise:
             r.fail_if(
                 "Error running {} exec on {} [rc={}]: {}".format(self.qname(), cmd_to_exec[0], r.status(), r.err()))
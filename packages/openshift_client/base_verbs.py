@@ -2,31 +2,37 @@ from __future__ import absolute_import
 from __future__ import print_function
 
 import base64
+import hashlib
 import io
 import json
 import os
 import sys
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 import yaml
 
 from . import naming
+from . import jsoncodec
 from . import util
-from .action import oc_action
+from .action import Action, oc_action
 from .apiobject import APIObject
-from .context import cur_context, project, no_tracking
+from .context import context, cur_context, project, no_tracking, parallel_map, bind_context
+from .dumpinfo import DumpProgress, DumpManifest, PROGRESS_FILENAME, MANIFEST_JOURNAL_FILENAME, dump_sink
 from .model import Model, Missing, OpenShiftPythonException
 from .result import Result
-from .selector import Selector, selector
+from .selector import Selector, selector, describe_objects
+from .sshpool import SSHConnectionPool, NodeAddressCache
 
 
 def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
 
-def __new_objects_action_selector(verb, cmd_args=None, stdin_obj=None, no_namespace=False, auto_raise=True):
+def __new_objects_action_selector(verb, cmd_args=None, stdin_obj=None, no_namespace=False, auto_raise=True,
+                                  references=None):
     """
     Performs and oc action and records objects output from the verb
     as changed in the content.
@@ -35,12 +41,13 @@ def __new_objects_action_selector(verb, cmd_args=None, stdin_obj=None, no_namesp
     :param stdin_obj: The standard input to feed to the invocation.
     :param no_namespace: If the incoming objects have namespace information, set to True.
     :param auto_raise: If True, errors from oc will raise an exception.
+    :param references: A dict of values to include in the tracking information for the action
     :return: A selector for the newly created objects
     """
 
     sel = Selector(verb,
                    object_action=oc_action(cur_context(), verb, cmd_args=['-o=name', cmd_args], stdin_obj=stdin_obj,
-                                           no_namespace=no_namespace))
+                                           no_namespace=no_namespace, references=references))
     if auto_raise:
         sel.fail_if('{} returned an error: {}'.format(verb, sel.err().strip()))
 
@@ -263,7 +270,7 @@ def _to_dict_list(str_dict_model_apiobject_or_list_thereof):
 
         if isinstance(i, six.string_types):
             if i.strip().startswith('{'):
-                i = json.loads(i)
+                i = jsoncodec.loads(i)
             else:
                 i = yaml.safe_load(i)
 
@@ -509,7 +516,7 @@ def get_client_version():
     r.add_action(oc_action(cur_context(), verb='version', cmd_args=['-o=json']))
     r.fail_if('Unable to determine version')
 
-    version_dict = json.loads(r.out())
+    version_dict = jsoncodec.loads(r.out())
     version_model = Model(dict_to_model=version_dict, case_insensitive=True)
     if version_model.clientVersion.gitVersion:
         return version_model.clientVersion.gitVersion.lstrip('v')
@@ -548,7 +555,7 @@ def get_server_version():
     r.add_action(oc_action(cur_context(), 'adm', cmd_args=['release', 'info', '-o=json']))
     r.fail_if('Error returning release info')
 
-    version_dict = json.loads(r.out())
+    version_dict = jsoncodec.loads(r.out())
     version_model = Model(dict_to_model=version_dict, case_insensitive=True)
     if version_model.metadata.version:
         return version_model.metadata.version
@@ -556,9 +563,142 @@ def get_server_version():
     raise OpenShiftPythonException('Unable find version string in json: {}'.format(r.out()))
 
 
+def _item_qkind(item):
+    """
+    :return: Returns the kind[.group] of an object definition dict.
+    """
+    qkind = item.get('kind', '').lower()
+    api_version = item.get('apiVersion', '')
+    if '/' in api_version:
+        qkind += '.' + api_version.split('/')[0]
+    return qkind
+
+
+def _item_qname(item):
+    """
+    :return: Returns the kind[.group]/name of an object definition dict, qualified with its namespace
+        (ns:kind/name) if the definition specifies one.
+    """
+    metadata = item.get('metadata', None) or {}
+    qname = '{}/{}'.format(_item_qkind(item), metadata['name'])
+    if metadata.get('namespace', None):
+        qname = '{}:{}'.format(metadata['namespace'], qname)
+    return qname
+
+
+def _existing_columns(items, paths):
+    """
+    Reads fields from the server's copy of each object definition. A single oc get cannot return named objects
+    from multiple namespaces (https://bugzilla.redhat.com/show_bug.cgi?id=1727917), so the names are read with
+    a namespace qualified static selector: one projection (see Selector.columns) per namespace, run in parallel.
+    Definitions which do not exist on the server are identified by their absence from the results rather than
+    by probing for each one.
+    :param items: A list of object definition dicts.
+    :param paths: The jsonpath expressions to read (see Selector.columns).
+    :return: A list parallel to items. Each entry is a tuple of values for paths or None if the object
+        does not exist on the server (or the definition has no name).
+    """
+
+    names = []
+    for item in items:
+        metadata = item.get('metadata', None) or {}
+        if not item.get('kind', None) or not metadata.get('name', None):
+            continue  # e.g. generateName; nothing to look up
+        names.append(_item_qname(item))
+
+    if not names:
+        return [None] * len(items)
+
+    # (kind[.group], name) -> list of (namespace, values) which exist on the server
+    existing = {}
+    for row in selector(names).columns(['metadata.namespace', 'kind', 'apiVersion', 'metadata.name'] + paths):
+        namespace, kind, api_version, name = row[0:4]
+        key = (_item_qkind({'kind': kind, 'apiVersion': api_version or ''}), name)
+        existing.setdefault(key, []).append((namespace, row[4:]))
+
+    found = []
+    for item in items:
+        metadata = item.get('metadata', None) or {}
+        namespace = metadata.get('namespace', None)
+        values = None
+        for server_namespace, server_values in existing.get((_item_qkind(item), metadata.get('name', None)), []):
+            if namespace and namespace != server_namespace:
+                continue
+            values = server_values
+            break
+        found.append(values)
+
+    return found
+
+
+def _fetch_resource_versions(items):
+    """
+    Populates the metadata.resourceVersion of each object definition with that of its existing counterpart
+    on the server. Definitions which do not exist on the server are left unchanged.
+    :param items: A list of object definition dicts. They are modified in place.
+    """
+    for item, values in zip(items, _existing_columns(items, ['metadata.resourceVersion'])):
+        if values and values[0]:
+            metadata = item.get('metadata', None) or {}
+            metadata['resourceVersion'] = values[0]
+            item['metadata'] = metadata
+
+
+# Annotation stamped on objects by apply(skip_unchanged=True)
+CONTENT_HASH_ANNOTATION = 'openshift-client-python/content-hash'
+
+
+def _content_hash(item):
+    """
+    :return: Returns a stable hash of an object definition. The content hash annotation and
+        resourceVersion are not included.
+    """
+    # Only the excluded fields are removed, so only the dicts containing them are copied. The hash is
+    # computed with the json module, whose output does not depend on the installed JSON codec.
+    d = dict(item)
+    metadata = dict(d.get('metadata', None) or {})
+    metadata.pop('resourceVersion', None)
+    annotations = dict(metadata.get('annotations', None) or {})
+    annotations.pop(CONTENT_HASH_ANNOTATION, None)
+    if annotations:
+        metadata['annotations'] = annotations
+    else:
+        metadata.pop('annotations', None)
+    if d.get('metadata', None):
+        d['metadata'] = metadata
+    return hashlib.sha256(json.dumps(d, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+def _skip_unchanged_items(items):
+    """
+    Stamps each object definition with the content hash annotation and determines which definitions
+    have already been applied: those whose server copy carries the same hash.
+    :param items: A list of object definition dicts. They are modified in place.
+    :return: Returns (changed items, unchanged items).
+    """
+    for item in items:
+        metadata = item.get('metadata', None) or {}
+        annotations = metadata.get('annotations', None) or {}
+        annotations[CONTENT_HASH_ANNOTATION] = _content_hash(item)
+        metadata['annotations'] = annotations
+        item['metadata'] = metadata
+
+    changed = []
+    unchanged = []
+    path = 'metadata.annotations.{}'.format(CONTENT_HASH_ANNOTATION)
+    for item, values in zip(items, _existing_columns(items, [path])):
+        if values and values[0] == item['metadata']['annotations'][CONTENT_HASH_ANNOTATION]:
+            unchanged.append(item)
+        else:
+            changed.append(item)
+
+    return changed, unchanged
+
+
 def apply(str_dict_model_apiobject_or_list_thereof, overwrite=False, cmd_args=None,
           fetch_resource_versions=False,
-          auto_raise=True):
+          auto_raise=True,
+          skip_unchanged=False):
     """
     Applies the specifies resource(s) on the server.
     :param str_dict_model_apiobject_or_list_thereof: The definition of one or more API object.
@@ -571,7 +711,13 @@ def apply(str_dict_model_apiobject_or_list_thereof, overwrite=False, cmd_args=No
     being sent to the server. See https://github.com/kubernetes/kubernetes/issues/70674 for why this is sometimes
     necessary.
     :param auto_raise: If True, errors from oc will raise an exception.
-    :return: A selector for the updated objects and Result.
+    :param skip_unchanged: If True, each object is stamped with a hash of its content (annotation
+    openshift-client-python/content-hash) and objects whose server copy already carries the same hash are
+    not sent to the server. Note that the hash reflects what was last applied in this mode; changes made to
+    the server copy by other means are not detected. Skipped objects are recorded in the apply action's
+    '.content_hash_skipped' reference. See bulk_apply for per-object outcomes.
+    :return: A selector for the updated objects and Result. When skip_unchanged is used, skipped objects
+    are included in the selection.
     """
     base_args = list()
     if overwrite:
@@ -583,6 +729,18 @@ def apply(str_dict_model_apiobject_or_list_thereof, overwrite=False, cmd_args=No
     if not items:
         return selector([])
 
+    skipped = []
+    if skip_unchanged:
+        items, unchanged = _skip_unchanged_items(items)
+        skipped = [_item_qname(item) for item in unchanged]
+        if not items:
+            # Nothing is sent to the server, but the skipped objects are still recorded
+            action = Action('apply', [], '', '', {'.content_hash_skipped': skipped}, 0)
+            cur_context().register_action(action)
+            sel = Selector('apply', object_list=list(skipped))
+            sel.add_action(action)
+            return sel
+
     m = {
         'kind': 'List',
         'apiVersion': 'v1',
@@ -594,24 +752,16 @@ def apply(str_dict_model_apiobject_or_list_thereof, overwrite=False, cmd_args=No
     # get a current copy of the incoming resources and update the incoming
     # objects with the server's resourceVersions, ignoring those which don't exist.
     if items and fetch_resource_versions:
-
-        # I wish this could be implemented efficiently (single oc invocation which returns
-        # content from across multiple namespaces), but https://bugzilla.redhat.com/show_bug.cgi?id=1727917
-        # prevents it.
-        for item in items:
-            apiobj = APIObject(dict_to_model=item)
-            server_apiobj = apiobj.current(ignore_not_found=True)
-            # Does the object exist on the server?
-            if server_apiobj:
-                new_metadata = item.get('metadata', {})
-                new_metadata['resourceVersion'] = server_apiobj.resource_version()
-                item['metadata'] = new_metadata
-
-    return __new_objects_action_selector("apply",
-                                         cmd_args=["-f", "-", base_args, cmd_args],
-                                         stdin_obj=m,
-                                         no_namespace=namespace_detected,
-                                         auto_raise=auto_raise)
+        _fetch_resource_versions(items)
+
+    sel = __new_objects_action_selector("apply",
+                                        cmd_args=["-f", "-", base_args, cmd_args],
+                                        stdin_obj=m,
+                                        no_namespace=namespace_detected,
+                                        auto_raise=auto_raise,
+                                        references={'.content_hash_skipped': skipped} if skip_unchanged else None)
+    sel.object_list.extend(skipped)
+    return sel
 
 
 def replace(str_dict_model_apiobject_or_list_thereof, force=False, cmd_args=None, auto_raise=True):
@@ -1104,13 +1254,21 @@ def dumpinfo_apiobject(output_dir,
                        logs_since=None,
                        logs_limit_bytes=None,
                        logs_tail=-1,
-                       status_printer=eprint):
+                       status_printer=eprint,
+                       description=None):
+    """
+    Writes the definition, description and, if applicable, logs of an object.
+    :param output_dir: The output directory, or a sink (e.g. an ArchiveSink) to write to.
+    :param description: The oc describe output for the object, if it has already been collected
+    (e.g. by describe_objects). If None, the object is described.
+    :return: The names of the files written, relative to output_dir.
+    """
     name = obj.name()
-    util.mkdir_p(output_dir)
-    prefix = os.path.join(output_dir, name)
+    sink = dump_sink(output_dir)
+    files = []
 
     if not status_printer:
-        status_printer = lambda: None
+        status_printer = lambda s: None
 
     status_printer('Gathering information for {}'.format(obj.fqname()))
 
@@ -1134,21 +1292,26 @@ def dumpinfo_apiobject(output_dir,
                         status_printer(
                             'Skipping information collection for daemonset pod on non-collected node: {}'.format(
                                 obj.fqname()))
-                        return
+                        return files
 
-            with io.open(prefix + '.logs.txt', mode='w', encoding="utf-8") as f:
+            with sink.open(name + '.logs.txt') as f:
                 obj.print_logs(f,
                                timestamps=log_timestamps,
                                since=logs_since,
                                tail=logs_tail,
                                limit_bytes=logs_limit_bytes)
+            files.append(name + '.logs.txt')
 
-        with io.open(prefix + '.describe.txt', mode='w', encoding="utf-8") as f:
-            f.write(obj.describe(auto_raise=False))
+        if description is None:
+            description = obj.describe(auto_raise=False)
+        sink.write(name + '.describe.txt', description)
+        files.append(name + '.describe.txt')
 
         if not naming.kind_matches(obj.kind(), 'secret'):
-            with io.open(prefix + '.json', mode='w', encoding="utf-8") as f:
-                f.write(obj.as_json())
+            sink.write(name + '.json', obj.as_json())
+            files.append(name + '.json')
+
+    return files
 
 
 def dumpinfo_node(output_dir,
@@ -1159,7 +1322,11 @@ def dumpinfo_node(output_dir,
                   num_combined_journal_entries=10000,
                   num_critical_journal_entries=10000,
                   status_printer=eprint):
-    node_dir = util.mkdir_p(output_dir)
+    """
+    Writes information about a node, including its journal if a fluentd pod runs on it.
+    :param output_dir: The output directory, or a sink (e.g. an ArchiveSink) to write to.
+    """
+    node_dir = dump_sink(output_dir)
 
     if sdn_pods is None:
         sdn_pods = []
@@ -1170,17 +1337,16 @@ def dumpinfo_node(output_dir,
     try:
 
         with no_tracking():
-            dumpinfo_apiobject(node_dir, node)
+            dumpinfo_apiobject(node_dir, node, status_printer=status_printer)
 
             node_sdn_pod = next((pod for pod in sdn_pods if pod.model.spec.nodeName == node.name()), None)
             if node_sdn_pod:
-                capture_action = node_sdn_pod.execute(cmd_to_exec=['iptables-save'],
-                                                      container_name='sdn',
-                                                      auto_raise=False)
-
-                with io.open(os.path.join(node_dir, 'iptables.txt'), mode='w', encoding='utf-8') as f:
-                    f.write(capture_action.out())
-                    f.write(capture_action.err())
+                with node_dir.open('iptables.txt', binary=True) as f:
+                    capture_action = node_sdn_pod.execute(cmd_to_exec=['iptables-save'],
+                                                          container_name='sdn',
+                                                          auto_raise=False,
+                                                          stdout=f)
+                    f.write(capture_action.err().encode('utf-8'))
 
             # If possible, find a fluentd pod that is scheduled on the node. The fluentd pod mounts in the
             # host's journal directories -- so we capture information for debug.
@@ -1188,20 +1354,21 @@ def dumpinfo_node(output_dir,
             if node_fluentd_pod:
 
                 status_printer('Collecting combined journal from: {}'.format(node.name()))
-                with io.open(os.path.join(node_dir, 'combined.journal.export'), mode='w', encoding="utf-8") as f:
-                    capture_action = node_fluentd_pod.execute(cmd_to_exec=[
+                # The export format can contain binary fields, so it is streamed to the file unmodified
+                with node_dir.open('combined.journal.export', binary=True) as f:
+                    node_fluentd_pod.execute(cmd_to_exec=[
                         'journalctl',
                         '-D', '/var/log/journal',
                         '-o', 'export',
                         '-n', num_combined_journal_entries,
                     ],
-                        auto_raise=False)
-                    f.write(capture_action.out())
+                        auto_raise=False,
+                        stdout=f)
 
                 # In case extraneous events are flooding, isolate important services as well
                 if critical_journal_units:
                     status_printer('Collecting critical services journal from: {}'.format(node.name()))
-                    with io.open(os.path.join(node_dir, 'critical.journal.export'), mode='w', encoding="utf-8") as f:
+                    with node_dir.open('critical.journal.export', binary=True) as f:
                         cmd_to_exec = [
                             'journalctl',
                             '-D', '/var/log/journal',  # Where fluentd mounts hosts journal
@@ -1213,9 +1380,9 @@ def dumpinfo_node(output_dir,
                         for unit in critical_journal_units:
                             cmd_to_exec.extend(['-u', unit])
 
-                        capture_action = node_fluentd_pod.execute(cmd_to_exec=cmd_to_exec,
-                                                                  auto_raise=False)
-                        f.write(capture_action.out())
+                        node_fluentd_pod.execute(cmd_to_exec=cmd_to_exec,
+                                                 auto_raise=False,
+                                                 stdout=f)
             else:
                 status_printer('Unable to find a fluentd pod in the cluster for node {}'.format(node.name()))
 
@@ -1223,6 +1390,56 @@ def dumpinfo_node(output_dir,
         status_printer('Error collecting node information: {}\n{}'.format(node.name(), traceback.format_exc()))
 
 
+def _dumpinfo_project_listing(sink, project_name, kinds, status_printer, previous=None, manifest=None,
+                              collect=None, parallelism=None):
+    """
+    Writes project level information for dumpinfo_project and lists the objects to collect.
+    :param previous: The DumpManifest of a previous dump. If specified, objects are listed with metadata only;
+    the files of objects which are unchanged since the previous dump are linked from it and recorded in manifest.
+    :param collect: An optional callable which returns False for objects which need not be collected (e.g. because
+    they were collected before a dump was resumed).
+    :param parallelism: The maximum number of concurrent oc describe invocations (see describe_objects).
+    :return: A list of (<output sink>, <APIObject>, <describe output>) tuples for the objects which must be
+    collected. Objects are described in batches (see describe_objects).
+    """
+    status_printer(u'Collecting info for project: {}'.format(project_name))
+
+    # if the project does not exist, just a leave a file saying we tried
+    if selector(project_name).count_existing() == 0:
+        sink.write('not-found', u'{} was not found'.format(project_name))
+        return []
+
+    with project(project_name):
+
+        sink.write('status.txt', six.text_type(invoke('status').out()))
+
+        if previous is None:
+            objs = selector(kinds).objects(ignore_not_found=True)
+        else:
+            changed = []
+            unchanged = 0
+            for obj in selector(kinds).metadata(ignore_not_found=True):
+                paths = previous.unchanged_files(obj)
+                if paths is None:
+                    changed.append(obj.qname())
+                    continue
+                obj_sink = sink.child(obj.kind())
+                for path in paths:
+                    obj_sink.link(os.path.basename(path), path)
+                manifest.record(obj, [obj_sink.entry_name(os.path.basename(path)) for path in paths])
+                unchanged += 1
+
+            status_printer(u'Reusing {} unchanged objects in project: {}'.format(unchanged, project_name))
+            # Only new and changed objects are retrieved in full
+            objs = selector(changed).objects(ignore_not_found=True) if changed else []
+
+        if collect is not None:
+            objs = [obj for obj in objs if collect(obj)]
+
+        return [(sink.child(obj.kind()), obj, description)
+                for obj, description in zip(objs, describe_objects(objs, parallelism=parallelism))]
+
+
 def dumpinfo_project(dir,
                      project_name,
                      kinds=['ds', 'dc', 'build', 'statefulset', 'deployment', 'pod', 'rs', 'rc', 'configmap'],
@@ -1231,10 +1448,12 @@ def dumpinfo_project(dir,
                      logs_since=None,
                      logs_tail=-1,
                      logs_limit_bytes=None,
-                     status_printer=eprint):
+                     status_printer=eprint,
+                     parallelism=None,
+                     previous=None):
     """
     Populates a specified directory with a significant amount of data for a given project.
-    :param dir: The output directory
+    :param dir: The output directory, or a sink (e.g. an ArchiveSink) to write to.
     :param project_name: The name or qualified name of the project
     :param kinds: A list of kinds to collect data on within the project (defaults to generally import kinds like
     deployments, pods, configmaps, etc.)
@@ -1246,39 +1465,43 @@ def dumpinfo_project(dir,
     :param logs_limit_bytes: --limit-bytes for oc logs on pods
     :param status_printer: Method which takes a single string parameter. Will be called with status strings as collection
     proceeds. Defaults to method which prints to stderr.
+    :param parallelism: The number of objects to collect information for concurrently. Defaults to the thread's
+    default parallelism (see set_default_parallelism).
+    :param previous: The directory of a previous dump of the project. If specified, objects are listed with metadata
+    only and the files of objects whose uid and resourceVersion are unchanged are linked from the previous dump
+    instead of being collected again. Note that this includes the logs of unchanged pods.
     :return:
     """
 
     project_name = naming.qualify_name(project_name, 'project')
 
     if not status_printer:
-        status_printer = lambda: None
+        status_printer = lambda s: None
 
-    status_printer(u'Collecting info for project: {}'.format(project_name))
+    sink = dump_sink(dir)
+    manifest = DumpManifest()
+    previous_manifest = DumpManifest.load(previous) if previous else None
 
-    util.mkdir_p(dir)
     with no_tracking():
 
-        # if the project does not exist, just a leave a file saying we tried
-        if selector(project_name).count_existing() == 0:
-            with io.open(os.path.join(dir, 'not-found'), mode='w', encoding="utf-8") as f:
-                f.write(u'{} was not found'.format(project_name))
-            return
+        def dump_object(entry):
+            obj_dir, obj, description = entry
+            files = dumpinfo_apiobject(obj_dir, obj,
+                                       limit_daemonsets_to_nodes=limit_daemonsets_to_nodes,
+                                       logs_since=logs_since,
+                                       logs_tail=logs_tail,
+                                       logs_limit_bytes=logs_limit_bytes,
+                                       log_timestamps=log_timestamps,
+                                       status_printer=status_printer,
+                                       description=description)
+            manifest.record(obj, [obj_dir.entry_name(f) for f in files])
 
-        with project(project_name):
+        entries = _dumpinfo_project_listing(sink, project_name, kinds, status_printer,
+                                            previous=previous_manifest, manifest=manifest,
+                                            parallelism=parallelism)
+        parallel_map(dump_object, entries, parallelism=parallelism)
 
-            with io.open(os.path.join(dir, 'status.txt'), mode='w', encoding="utf-8") as f:
-                f.write(six.text_type(invoke('status').out()))
-
-            for obj in selector(kinds).objects(ignore_not_found=True):
-                obj_dir = os.path.join(dir, obj.kind())
-                dumpinfo_apiobject(obj_dir, obj,
-                                   limit_daemonsets_to_nodes=limit_daemonsets_to_nodes,
-                                   logs_since=logs_since,
-                                   logs_tail=logs_tail,
-                                   logs_limit_bytes=logs_limit_bytes,
-                                   log_timestamps=log_timestamps,
-                                   status_printer=status_printer)
+    manifest.save(sink)
 
 
 def dumpinfo_system(base_dir,
@@ -1294,10 +1517,30 @@ def dumpinfo_system(base_dir,
                     logs_since=None,
                     logs_tail=-1,
                     logs_limit_bytes=None,
-                    status_printer=eprint):
-    """
-    Dumps object definitions, pod logs, node journals, etc. to a directory structure.
-    :param base_dir: The directory in which to create the dump structure
+                    status_printer=eprint,
+                    parallelism=None,
+                    resume=False,
+                    previous=None):
+    """
+    Dumps object definitions, pod logs, node journals, etc. to a directory structure or an archive.
+
+    Collection is split into stages, each with its own pool of parallelism workers: node information
+    and journals; project listing; and, for each object listed, its definition, description and logs.
+    Nodes are collected while projects are listed, and objects are collected as soon as their project
+    has been listed. Each project listing worker describes its project's objects itself, one batch at a
+    time, so at most 3 * parallelism oc invocations run at once. Workers run within the calling context, so surrounding timeout() and no_tracking()
+    contexts apply to them. Once a timeout expires, tasks which have not started are skipped.
+
+    Completed tasks are recorded in a progress manifest in base_dir (see dumpinfo.DumpProgress). If the dump
+    is interrupted, or times out, it can be completed by calling this method again with resume=True. Dumps
+    to an archive cannot be resumed.
+
+    The fqname, uid and resourceVersion of each object collected are recorded in a manifest in the dump
+    (see dumpinfo.DumpManifest). If previous is specified, projects are listed with metadata only and only
+    new or changed objects are collected; the files of unchanged objects are linked from the previous dump.
+
+    :param base_dir: The directory in which to create the dump structure, or a sink to write it to (e.g. an
+    ArchiveSink, to write a compressed tar stream instead of individual files).
     :param dump_core_projects: Whether to collect information from objects in kube-system, openshift-node, etc.
     :param dump_restricted_projects: Whether to collect information from objects in all kube-*, openshift_* in addition
     to core.
@@ -1317,9 +1560,26 @@ def dumpinfo_system(base_dir,
     :param logs_limit_bytes: --limit-bytes
     :param status_printer: Method which takes a single string parameter. Will be called with status strings as collection
     proceeds. Defaults to stderr printing.
+    :param parallelism: The number of workers in each stage. Defaults to the thread's default parallelism
+    (see set_default_parallelism).
+    :param resume: If True, tasks recorded as complete by a previous dump to base_dir are skipped.
+    :param previous: The directory of a previous dump. Note that the logs of pods which are unchanged since
+    the previous dump are reused from it.
     :return: N/A
     """
 
+    sink = dump_sink(base_dir)
+    progress_path = sink.local_path(PROGRESS_FILENAME)
+    if resume and progress_path is None:
+        raise ValueError('Only dumps to a directory can be resumed')
+
+    # When resuming, objects collected before the interruption remain in the manifest
+    manifest = DumpManifest.load(os.path.dirname(progress_path)) if resume else DumpManifest()
+    if progress_path is not None:
+        # Entries are also journaled as they are recorded, so they are not lost if the dump is killed
+        manifest.open_journal(sink.local_path(MANIFEST_JOURNAL_FILENAME), resume=resume)
+    previous_manifest = DumpManifest.load(previous) if previous else None
+
     if additional_nodes is None:
         additional_nodes = []
 
@@ -1329,17 +1589,24 @@ def dumpinfo_system(base_dir,
     if additional_namespaced_kinds is None:
         additional_namespaced_kinds = []
 
-    util.mkdir_p(base_dir)
+    if parallelism is None:
+        parallelism = context.default_parallelism
+    parallelism = max(1, parallelism)
 
     if not status_printer:
-        status_printer = lambda: None
+        status_printer = lambda s: None
 
     kinds = set(['ds', 'dc', 'build', 'statefulset', 'deployment', 'pod', 'rs', 'rc', 'configmap'])
     kinds.update(additional_namespaced_kinds)
 
+    def out_of_time():
+        expired, _ = cur_context().get_out_of_time()
+        return expired
+
     # A large amount of stdout is going to be generated by streaming logs from pods --
     # don't burden memory by trying to store it in trackers.
-    with no_tracking():
+    # The manifest is saved even if the dump is incomplete or fails, so that it can be resumed
+    with no_tracking(), DumpProgress(progress_path, resume=resume) as progress, manifest.saving(sink):
 
         if include_crd_kinds:
             # At the time of this comment, you need to add specific privileges to read CRs. Eventually,
@@ -1363,13 +1630,16 @@ def dumpinfo_system(base_dir,
         fluentd_pods = selector('pod', labels={'component': 'fluentd'}, all_namespaces=True).objects()
         status_printer(u'Found {} fluentd pods on cluster'.format(len(fluentd_pods)))
 
-        overview_dir = util.mkdir_p(os.path.join(base_dir, 'overview'))
-        with io.open(os.path.join(overview_dir, 'nodes.json'), mode='w', encoding='utf-8') as f:
-            f.write(selector('nodes').object_json())
+        if not progress.is_complete('overview'):
+            overview_dir = sink.child('overview')
+            overview_dir.write('nodes.json', selector('nodes').object_json())
 
-        with io.open(os.path.join(overview_dir, 'versions'), mode='w', encoding='utf-8') as f:
-            f.write(u'Sever version: {}\n'.format(get_server_version()))
-            f.write(u'Client version: {}\n'.format(get_client_version()))
+            with overview_dir.open('versions') as f:
+                f.write(u'Sever version: {}\n'.format(get_server_version()))
+                f.write(u'Client version: {}\n'.format(get_client_version()))
+
+            if not out_of_time():
+                progress.complete('overview')
 
         # Start with a base set of master nodes and append additional nodes.
         node_qnames = set(selector('node', labels={'!node-role.kubernetes.io/master': None}).qnames())
@@ -1377,17 +1647,6 @@ def dumpinfo_system(base_dir,
             node_name = naming.qualify_name(node_name.lower(), 'node')  # make sure we have node/xyz
             node_qnames.add(node_name)
 
-        status_printer(u'Attempting to gather on nodes: {}\n'.format(node_qnames))
-        node_sel = selector(node_qnames)
-
-        for node in node_sel.objects():
-            dumpinfo_node(os.path.join(base_dir, 'node', node.name()),
-                          node, sdn_pods=sdn_pods, fluentd_pods=fluentd_pods,
-                          num_critical_journal_entries=num_critical_journal_entries,
-                          num_combined_journal_entries=num_combined_journal_entries,
-                          status_printer=status_printer,
-                          )
-
         projects = set()
         if dump_core_projects or dump_restricted_projects:
             projects.update(['default',
@@ -1408,17 +1667,134 @@ def dumpinfo_system(base_dir,
         # dump projects named by caller
         projects.update(additional_projects)
 
-        for project_name in projects:
-            dumpinfo_project(os.path.join(base_dir, 'project', project_name),
-                             project_name,
-                             kinds=kinds,
-                             limit_daemonsets_to_nodes=node_qnames,
-                             log_timestamps=log_timestamps,
-                             logs_since=logs_since,
-                             logs_tail=logs_tail,
-                             logs_limit_bytes=logs_limit_bytes,
-                             status_printer=status_printer,
-                             )
+        def dump_node(node):
+            task = 'node:{}'.format(node.name())
+            if progress.is_complete(task) or out_of_time():
+                return
+            dumpinfo_node(sink.child('node', node.name()),
+                          node, sdn_pods=sdn_pods, fluentd_pods=fluentd_pods,
+                          num_critical_journal_entries=num_critical_journal_entries,
+                          num_combined_journal_entries=num_combined_journal_entries,
+                          status_printer=status_printer,
+                          )
+            if not out_of_time():
+                progress.complete(task)
+
+        def object_task(obj):
+            return 'object:{}'.format(obj.fqname())
+
+        def dump_object(entry):
+            obj_dir, obj, description = entry
+            task = object_task(obj)
+            if progress.is_complete(task):
+                return True
+            if out_of_time():
+                return False
+            try:
+                files = dumpinfo_apiobject(obj_dir, obj,
+                                           limit_daemonsets_to_nodes=node_qnames,
+                                           logs_since=logs_since,
+                                           logs_tail=logs_tail,
+                                           logs_limit_bytes=logs_limit_bytes,
+                                           log_timestamps=log_timestamps,
+                                           status_printer=status_printer,
+                                           description=description)
+            except Exception:
+                status_printer(u'Error collecting object information: {}\n{}'.format(obj.fqname(),
+                                                                                   traceback.format_exc()))
+                return False
+            if out_of_time():
+                return False
+            manifest.record(obj, [obj_dir.entry_name(f) for f in files])
+            progress.complete(task)
+            return True
+
+        def list_project(project_name):
+            project_qname = naming.qualify_name(project_name, 'project')
+            task = 'project:{}'.format(project_qname)
+            if progress.is_complete(task) or out_of_time():
+                return task, None
+            try:
+                # Projects are already listed by parallelism workers; describing each project's objects
+                # concurrently as well would run up to parallelism^2 oc invocations at once.
+                entries = _dumpinfo_project_listing(sink.child('project', project_name),
+                                                    project_qname, kinds, status_printer,
+                                                    previous=previous_manifest, manifest=manifest,
+                                                    collect=lambda obj: not progress.is_complete(object_task(obj)),
+                                                    parallelism=1)
+            except Exception:
+                status_printer(u'Error listing project: {}\n{}'.format(project_name, traceback.format_exc()))
+                return task, None
+            # Objects are collected as soon as their project is listed, not once all projects are listed.
+            run_dump_object = bind_context(dump_object)
+            return task, [object_pool.submit(run_dump_object, entry) for entry in entries]
+
+        with ThreadPoolExecutor(max_workers=parallelism) as node_pool, \
+                ThreadPoolExecutor(max_workers=parallelism) as object_pool:
+
+            status_printer(u'Attempting to gather on nodes: {}\n'.format(node_qnames))
+            run_dump_node = bind_context(dump_node)
+            node_futures = [node_pool.submit(run_dump_node, node) for node in selector(node_qnames).objects()]
+
+            for task, object_futures in parallel_map(list_project, sorted(projects), parallelism=parallelism):
+                # A project is complete once all of its objects are
+                if object_futures is not None and all([f.result() for f in object_futures]):
+                    progress.complete(task)
+
+            for f in node_futures:
+                f.result()
+
+
+# Connections reused by node_ssh_client(pooled=True), node_ssh_client_exec and node_ssh_exec_many
+_node_ssh_pool = SSHConnectionPool()
+
+# Addresses of the nodes named in calls to node_ssh_client
+_node_addresses = NodeAddressCache()
+
+
+def close_node_ssh_connections():
+    """
+    Closes the pooled ssh connections to nodes (see node_ssh_client). Otherwise, pooled connections are
+    closed once they have been idle for OPENSHIFT_CLIENT_PYTHON_DEFAULT_SSH_IDLE_SECONDS or at exit.
+    """
+    _node_ssh_pool.close()
+
+
+def _node_address_entries(apiobj):
+    address_entries = apiobj.model.status.addresses
+
+    if address_entries is Missing:
+        raise IOError("Error finding addresses associated with: {}".format(apiobj.qname()))
+
+    return [(entry.type, entry.address) for entry in address_entries]
+
+
+def _node_ssh_address(apiobj_node_name_or_qname, address_type_pref):
+    """
+    Determines the address to use for an ssh connection to a node. The addresses of nodes specified
+    by name are cached rather than read from the cluster for each connection.
+    :return: (<address>, <address cache key or None>)
+    """
+    if isinstance(apiobj_node_name_or_qname, APIObject):
+        apiobj = apiobj_node_name_or_qname
+        qname = apiobj.qname()
+        cache_key = None
+        addresses = _node_address_entries(apiobj)
+
+    else:
+        qname = naming.qualify_name(apiobj_node_name_or_qname, 'node')
+        cache_key = (cur_context().get_kubeconfig_path(), cur_context().get_api_server(), qname)
+        addresses = _node_addresses.get(cache_key, lambda: _node_address_entries(selector(qname).object()))
+
+    for address_type in address_type_pref.split(','):
+        # Find the first address of the preferred type:
+        address = next(
+            (address for entry_type, address in addresses if entry_type.lower() == address_type.lower().strip()),
+            None)
+        if address:
+            return address, cache_key
+
+    raise IOError("Unable to find any address with type ({}) for: {}".format(address_type_pref, qname))
 
 
 def node_ssh_client(apiobj_node_name_or_qname=None,
@@ -1431,6 +1807,7 @@ def node_ssh_client(apiobj_node_name_or_qname=None,
                     through_client_host=True,
                     address_type_pref="ExternalDNS,ExternalIP,Hostname",
                     paramiko_connect_extras=None,
+                    pooled=False,
                     ):
     """
     Returns a paramiko ssh client connected to the named cluster node. The caller is responsible for closing the
@@ -1449,6 +1826,9 @@ def node_ssh_client(apiobj_node_name_or_qname=None,
     :param address_type_pref: Comma delimited list of node address types. Types will be tried in
             the order specified.
     :param paramiko_connect_extras: An optional dictionary of kwargs to pass to the underlying SSH client connection method.
+    :param pooled: If True, the connection is taken from a pool and reused by subsequent calls with the same
+    parameters (see sshpool.SSHConnectionPool). Pooled connections send keepalives and are reestablished if they
+    are lost. Closing the returned client returns the connection to the pool rather than closing it.
     :return: ssh_client which can be used as a context manager
     """
 
@@ -1459,58 +1839,60 @@ def node_ssh_client(apiobj_node_name_or_qname=None,
     if not apiobj_node_name_or_qname:
         return cur_context().get_ssh_client()
 
-    if isinstance(apiobj_node_name_or_qname, APIObject):
-        apiobj = apiobj_node_name_or_qname
+    address, cache_key = _node_ssh_address(apiobj_node_name_or_qname, address_type_pref)
 
+    host_ssh_client = cur_context().get_ssh_client()
+    if not (through_client_host and host_ssh_client):
+        host_ssh_client = None
     else:
-        qname = naming.qualify_name(apiobj_node_name_or_qname, 'node')
-        apiobj = selector(qname).object()
+        # If we are tunneling through another connection, use authentication from that
+        # connection. e.g. continue on as root if root was used to connect.
+        if not username:
+            username = cur_context().get_ssh_username()
 
-    address_entries = apiobj.model.status.addresses
+        if not password:
+            password = cur_context().get_ssh_password()
 
-    if address_entries is Missing:
-        raise IOError("Error finding addresses associated with: {}".format(apiobj.qname()))
+    paramiko_connect_extras = paramiko_connect_extras or {}
 
-    for address_type in address_type_pref.split(','):
-        # Find the first address of the preferred type:
-        address = next(
-            (entry.address for entry in address_entries if entry.type.lower() == address_type.lower().strip()), None)
-        if address:
-            ssh_client = paramiko.SSHClient()
-            ssh_client.load_system_host_keys()
+    def connect():
+        ssh_client = paramiko.SSHClient()
+        ssh_client.load_system_host_keys()
 
-            if auto_add_host:
-                ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        if auto_add_host:
+            ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
 
+        try:
             host_sock = None
-            host_ssh_client = cur_context().get_ssh_client()
-            if through_client_host and host_ssh_client:
+            if host_ssh_client:
                 # If there is a client host, initiate node ssh connections from it
                 host_transport = host_ssh_client.get_transport()
                 node_addr = (address, port)
                 local_addr = ('127.0.0.1', 0)
                 host_sock = host_transport.open_channel("direct-tcpip", node_addr, local_addr)
 
-                # If we are tunneling through another connection, use authentication from that
-                # connection. e.g. continue on as root if root was used to connect.
-                if not username:
-                    username = cur_context().get_ssh_username()
-
-                if not password:
-                    password = cur_context().get_ssh_password()
-
-            paramiko_connect_extras = paramiko_connect_extras or {}
             ssh_client.connect(hostname=address, port=port, username=username,
                                password=password, key_filename=key_filename,
                                timeout=connect_timeout, sock=host_sock,
                                **paramiko_connect_extras)
+        except Exception:
+            # The node's address may have changed
+            if cache_key:
+                _node_addresses.invalidate(cache_key)
+            raise
+
+        # Enable agent fowarding
+        paramiko.agent.AgentRequestHandler(ssh_client.get_transport().open_session())
 
-            # Enable agent fowarding
-            paramiko.agent.AgentRequestHandler(ssh_client.get_transport().open_session())
+        return ssh_client
 
-            return ssh_client
+    if not pooled:
+        return connect()
 
-    raise IOError("Unable to find any address with type ({}) for: {}".format(address_type_pref, apiobj.qname()))
+    pool_key = (address, port, username, password, key_filename, auto_add_host,
+                id(host_ssh_client) if host_ssh_client else None,
+                repr(sorted(paramiko_connect_extras.items())))
+    return _node_ssh_pool.checkout(pool_key, connect)
 
 
 def node_ssh_await(apiobj_node_name_or_qname=None,
@@ -1578,10 +1960,12 @@ def node_ssh_client_exec(apiobj_node_name_or_qname=None,
                          through_client_host=True,
                          address_type_pref="ExternalDNS,ExternalIP,Hostname",
                          paramiko_connect_extras=None,
+                         pooled=True,
                          ):
     """
-    Executes a single command on the remote host via ssh and returns rc, stdout, stderr. Closes the connection
-    afterwards.
+    Executes a single command on the remote host via ssh and returns rc, stdout, stderr. By default, the
+    connection is pooled and reused by subsequent commands (see node_ssh_client); if it has been lost since
+    it was last used, it is reestablished before the command is run.
     :param apiobj_node_name_or_qname: The name of the node or the apiobject representing the node to ssh to. If None,
     tries to return the ssh_client associated with current client_host context, if any.
     :param cmd_str: The command to execute on the remote host
@@ -1598,31 +1982,121 @@ def node_ssh_client_exec(apiobj_node_name_or_qname=None,
     :param address_type_pref: Comma delimited list of node address types. Types will be tried in
             the order specified.
     :param paramiko_connect_extras: An optional dictionary of kwargs to pass to the underlying SSH client connection method.
+    :param pooled: If False, a new connection is established for the command and closed afterwards.
     :return: rc, stdout, stderr
     """
 
-    with node_ssh_client(apiobj_node_name_or_qname=apiobj_node_name_or_qname,
-                         port=port,
-                         username=username,
-                         password=password,
-                         key_filename=key_filename,
-                         auto_add_host=auto_add_host,
-                         connect_timeout=connect_timeout,
-                         through_client_host=through_client_host,
-                         address_type_pref=address_type_pref,
-                         paramiko_connect_extras=paramiko_connect_extras) as ssh_client:
-        ssh_stdin, ssh_stdout, ssh_stderr = ssh_client.exec_command(cmd_str)
-
-        if stdin_str:
-            ssh_stdin.write(stdin_str)
-            ssh_stdin.flush()
-            ssh_stdin.channel.shutdown_write()
-
-        stdout = ssh_stdout.read().decode('utf-8', errors='ignore')
-        stderr = ssh_stderr.read().decode('utf-8', errors='ignore')
-        return_code = ssh_stdout.channel.recv_exit_status()
-
-        return return_code, stdout, stderr
+    # Just-in-time import to avoid hard dependency.
+    import paramiko
+
+    # A pooled connection may be found to have been lost when a command is started; it is then
+    # reestablished and the command started again. If the connection is still active (e.g. the server
+    # refused to open another session on it), the command is started again on the same connection, which
+    # is only reestablished once the other threads using it are done with it.
+    attempts = 2 if pooled and apiobj_node_name_or_qname else 1
+
+    for attempt in range(attempts):
+        with node_ssh_client(apiobj_node_name_or_qname=apiobj_node_name_or_qname,
+                             port=port,
+                             username=username,
+                             password=password,
+                             key_filename=key_filename,
+                             auto_add_host=auto_add_host,
+                             connect_timeout=connect_timeout,
+                             through_client_host=through_client_host,
+                             address_type_pref=address_type_pref,
+                             paramiko_connect_extras=paramiko_connect_extras,
+                             pooled=pooled) as ssh_client:
+            try:
+                ssh_stdin, ssh_stdout, ssh_stderr = ssh_client.exec_command(cmd_str)
+            except (paramiko.SSHException, EOFError, EnvironmentError):
+                if attempt + 1 == attempts:
+                    raise
+                ssh_client.close(discard=True)
+                continue
+
+            if stdin_str:
+                ssh_stdin.write(stdin_str)
+                ssh_stdin.flush()
+                ssh_stdin.channel.shutdown_write()
+
+            stdout = ssh_stdout.read().decode('utf-8', errors='ignore')
+            stderr = ssh_stderr.read().decode('utf-8', errors='ignore')
+            return_code = ssh_stdout.channel.recv_exit_status()
+
+            return return_code, stdout, stderr
+
+
+def node_ssh_exec_many(nodes,
+                       cmd_str,
+                       stdin_str=None,
+                       parallelism=None,
+                       port=22,
+                       username=None,
+                       password=None,
+                       key_filename=None,
+                       auto_add_host=True,
+                       connect_timeout=600,
+                       through_client_host=True,
+                       address_type_pref="ExternalDNS,ExternalIP,Hostname",
+                       paramiko_connect_extras=None,
+                       ):
+    """
+    Executes a command on many nodes concurrently via pooled ssh connections (see node_ssh_client_exec).
+    Nodes specified by name are resolved with a single query.
+    :param nodes: A list of node names, qualified names or apiobjects representing nodes.
+    :param cmd_str: The command to execute on each node
+    :param stdin_str: String to supply to stdin of each command (or None if none)
+    :param parallelism: The number of nodes to execute the command on concurrently. Defaults to the thread's
+    default parallelism (see set_default_parallelism).
+    :param port: The ssh port
+    :param username: The username to use
+    :param password: The username's password
+    :param key_filename: The filename of optional private key and/or cert to try for authentication
+    :param auto_add_host: Whether to auto accept host certificates
+    :param connect_timeout: Connection timeout
+    :param through_client_host: If True, and client_host is being used, ssh will be initiated
+    through the client_host ssh connection.
+    :param address_type_pref: Comma delimited list of node address types. Types will be tried in
+            the order specified.
+    :param paramiko_connect_extras: An optional dictionary of kwargs to pass to the underlying SSH client connection method.
+    :return: A dict mapping the qualified name of each node to (rc, stdout, stderr). If the command could not
+    be run on a node (e.g. the node does not exist or could not be reached), rc is None and stderr describes
+    the error.
+    """
+
+    qnames = [naming.qualify_name(node, 'node') for node in nodes if not isinstance(node, APIObject)]
+    nodes = [node for node in nodes if isinstance(node, APIObject)]
+    missing = {}
+    if qnames:
+        # Resolve the addresses of all named nodes at once rather than a node at a time
+        found = selector(qnames).objects(ignore_not_found=True)
+        found_qnames = set(node.qname() for node in found)
+        for qname in qnames:
+            if qname not in found_qnames:
+                missing[qname] = (None, '', u'Error executing command on {}: node not found'.format(qname))
+        nodes.extend(found)
+
+    def run(node):
+        try:
+            return node_ssh_client_exec(node,
+                                        cmd_str=cmd_str,
+                                        stdin_str=stdin_str,
+                                        port=port,
+                                        username=username,
+                                        password=password,
+                                        key_filename=key_filename,
+                                        auto_add_host=auto_add_host,
+                                        connect_timeout=connect_timeout,
+                                        through_client_host=through_client_host,
+                                        address_type_pref=address_type_pref,
+                                        paramiko_connect_extras=paramiko_connect_extras)
+        except Exception as e:
+            return None, '', u'Error executing command on {}: {}'.format(node.qname(), e)
+
+    results = dict(zip([node.qname() for node in nodes], parallel_map(run, nodes, parallelism=parallelism)))
+    results.update(missing)
+    return results
 
 
 """
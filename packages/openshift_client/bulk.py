@@ -0,0 +1,332 @@
+from __future__ import absolute_import
+
+import collections
+import os
+import re
+
+from .action import oc_action
+from .base_verbs import _to_dict_list, _item_qkind, _fetch_resource_versions, _skip_unchanged_items
+from .context import cur_context, parallel_map
+from .naming import kind_matches, normalize_kind
+from .result import Result
+from .selector import selector
+
+# The default number of objects sent to each oc invocation by the bulk_* verbs
+DEFAULT_BULK_CHUNK_SIZE = int(os.getenv("OPENSHIFT_CLIENT_PYTHON_DEFAULT_BULK_CHUNK_SIZE", "100"))
+
+# Kinds which other objects commonly depend on. Objects are processed tier by tier; objects of
+# kinds not listed are processed in the final tier. Deletes process the tiers in reverse.
+_dependency_tiers = [
+    ['namespace', 'project', 'customresourcedefinition'],
+    ['serviceaccount', 'secret', 'configmap', 'role', 'clusterrole', 'rolebinding', 'clusterrolebinding',
+     'limitrange', 'resourcequota', 'priorityclass', 'storageclass', 'persistentvolume', 'persistentvolumeclaim'],
+]
+
+# e.g. "deployment.apps/frontend configured"
+_apply_line_regex = re.compile(r'^(\S+/\S+)\s+(\S+)')
+
+SUCCESS = 'success'
+FAILED = 'failed'
+UNCHANGED = 'unchanged'
+
+
+def _tier(item):
+    kind = normalize_kind(item.get('kind', ''))
+    for i, kinds in enumerate(_dependency_tiers):
+        if kind in kinds:
+            return i
+    return len(_dependency_tiers)
+
+
+def _parse_names(out):
+    return [(name, SUCCESS) for name in out.strip().split()]
+
+
+def _parse_apply(out):
+    reported = []
+    for line in out.splitlines():
+        m = _apply_line_regex.match(line.strip())
+        if m:
+            reported.append((m.group(1), UNCHANGED if m.group(2) == 'unchanged' else SUCCESS))
+    return reported
+
+
+def _take_reported(reported, item):
+    """
+    Finds and removes the entry for item from the list of (qname, status) reported by oc.
+    :return: The status reported for the item or None if oc did not report it.
+    """
+    name = (item.get('metadata', None) or {}).get('name', None)
+    qkind = _item_qkind(item)
+    for i, (qname, status) in enumerate(reported):
+        kind, _, reported_name = qname.partition('/')
+        if reported_name == name and kind_matches(kind, qkind):
+            del reported[i]
+            return status
+    return None
+
+
+class BulkOutcome(object):
+
+    def __init__(self, obj, status, message=None):
+        # The object definition (dict) supplied to the bulk verb
+        self.obj = obj
+        # SUCCESS, FAILED or UNCHANGED
+        self.status = status
+        # For failures, the error reported by oc
+        self.message = message
+
+    def qname(self):
+        """
+        :return: Returns the qualified name of the object (kind[.group]/name). Objects without a
+            metadata.name (e.g. generateName) return kind[.group]/.
+        """
+        return '{}/{}'.format(_item_qkind(self.obj), (self.obj.get('metadata', None) or {}).get('name', ''))
+
+    def fqname(self):
+        """
+        :return: Returns the namespace qualified name of the object (namespace:kind[.group]/name) if the
+            definition specifies a namespace. Otherwise, the same as qname().
+        """
+        namespace = (self.obj.get('metadata', None) or {}).get('namespace', None)
+        if namespace:
+            return '{}:{}'.format(namespace, self.qname())
+        return self.qname()
+
+    def __repr__(self):
+        return '{} {}{}'.format(self.fqname(), self.status, ': ' + self.message if self.message else '')
+
+
+class BulkReport(Result):
+    """
+    The Result of a bulk_* verb. In addition to the oc actions performed, it records the outcome of each
+    object supplied to the verb. Use fail_if to raise an exception if any object failed.
+    """
+
+    def __init__(self, high_level_operation):
+        super(BulkReport, self).__init__(high_level_operation)
+        # A BulkOutcome for each object, in the order the objects were supplied
+        self.outcomes = []
+
+    def _with_status(self, status):
+        return [outcome for outcome in self.outcomes if outcome.status == status]
+
+    def succeeded(self):
+        return self._with_status(SUCCESS)
+
+    def failed(self):
+        return self._with_status(FAILED)
+
+    def unchanged(self):
+        return self._with_status(UNCHANGED)
+
+    def counts(self):
+        """
+        :return: Returns a dict mapping each status to the number of objects with that outcome.
+        """
+        counts = {SUCCESS: 0, FAILED: 0, UNCHANGED: 0}
+        for outcome in self.outcomes:
+            counts[outcome.status] += 1
+        return counts
+
+    def selector(self):
+        """
+        :return: Returns a static selector for the objects which did not fail. Names are namespace qualified
+            where the object definitions specified a namespace.
+        """
+        return selector([outcome.fqname() for outcome in self.outcomes
+                         if outcome.status != FAILED and (outcome.obj.get('metadata', None) or {}).get('name')])
+
+
+def _run_chunk(verb, items, chunk, cmd_args, parse, unreported_status, isolate_failures=True):
+    """
+    Runs a verb against a chunk of objects.
+    :return: (actions, {item index: BulkOutcome})
+    """
+    namespace, indices = chunk
+
+    content = {
+        'kind': 'List',
+        'apiVersion': 'v1',
+        'metadata': {},
+        'items': [items[i] for i in indices]
+    }
+
+    action = oc_action(cur_context(), verb, cmd_args=['-f', '-', cmd_args], stdin_obj=content,
+                       namespace=namespace)
+    actions = [action]
+
+    reported = parse(action.out)
+    outcomes = {}
+    unreported = []
+    for i in indices:
+        status = _take_reported(reported, items[i])
+        if status is None:
+            unreported.append(i)
+        else:
+            outcomes[i] = BulkOutcome(items[i], status)
+
+    if not unreported:
+        return actions, outcomes
+
+    if action.status == 0:
+        for i in unreported:
+            outcomes[i] = BulkOutcome(items[i], unreported_status)
+    elif len(indices) == 1 or not isolate_failures:
+        for i in unreported:
+            outcomes[i] = BulkOutcome(items[i], FAILED, action.err.strip())
+    else:
+        # oc does not say which objects caused the failure. Retry each object it did not report
+        # individually to determine its outcome.
+        action.last_attempt = False
+        for i in unreported:
+            retry_actions, retry_outcomes = _run_chunk(verb, items, (namespace, [i]), cmd_args, parse,
+                                                       unreported_status, isolate_failures=False)
+            actions.extend(retry_actions)
+            outcomes.update(retry_outcomes)
+
+    return actions, outcomes
+
+
+def _bulk(verb, str_dict_model_apiobject_or_list_thereof, cmd_args, chunk_size, parallelism,
+          parse=_parse_names, unreported_status=SUCCESS, reverse=False, items=None):
+
+    if items is None:
+        items, _ = _to_dict_list(str_dict_model_apiobject_or_list_thereof)
+
+    if chunk_size is None:
+        chunk_size = DEFAULT_BULK_CHUNK_SIZE
+
+    # tier -> namespace -> [item index]. Each chunk only contains objects from a single namespace so that
+    # it can be run with --namespace.
+    tiers = {}
+    for i, item in enumerate(items):
+        namespace = (item.get('metadata', None) or {}).get('namespace', None) or None
+        tiers.setdefault(_tier(item), collections.OrderedDict()).setdefault(namespace, []).append(i)
+
+    report = BulkReport('bulk_{}'.format(verb))
+    outcomes = {}
+    for tier in sorted(tiers.keys(), reverse=reverse):
+        chunks = []
+        for namespace, indices in tiers[tier].items():
+            for start in range(0, len(indices), chunk_size):
+                chunks.append((namespace, indices[start:start + chunk_size]))
+
+        def run(chunk):
+            return _run_chunk(verb, items, chunk, cmd_args, parse, unreported_status)
+
+        for actions, chunk_outcomes in parallel_map(run, chunks, parallelism=parallelism):
+            for action in actions:
+                report.add_action(action)
+            outcomes.update(chunk_outcomes)
+
+    report.outcomes = [outcomes[i] for i in range(len(items))]
+    return report
+
+
+def bulk_apply(str_dict_model_apiobject_or_list_thereof, overwrite=False, fetch_resource_versions=False,
+               chunk_size=None, parallelism=None, cmd_args=None, skip_unchanged=False):
+    """
+    Applies many objects by splitting them into chunks which are applied in parallel. Namespaces and
+    CustomResourceDefinitions are applied before the objects which may depend on them.
+    :param str_dict_model_apiobject_or_list_thereof: The definition of one or more API object.
+        Can be string containing json or yaml, a python dict, an openshift.Model, or an openshift.APIObject.
+        You can also provide a list containing multiple of these elements.
+    :param overwrite: If --overwrite should be sent to apply.
+    :param fetch_resource_versions: See apply().
+    :param chunk_size: The maximum number of objects sent to each oc invocation.
+    :param parallelism: The maximum number of concurrent oc invocations (see set_default_parallelism).
+    :param cmd_args: Additional apply arguments
+    :param skip_unchanged: If True, objects whose content hash matches their server copy are not sent
+        to the server (see apply()).
+    :return: A BulkReport. Objects which apply reported as unchanged and objects skipped because of their
+        content hash have the UNCHANGED status.
+    """
+    items, _ = _to_dict_list(str_dict_model_apiobject_or_list_thereof)
+
+    to_apply = items
+    if items and skip_unchanged:
+        to_apply, _ = _skip_unchanged_items(items)
+
+    if to_apply and fetch_resource_versions:
+        _fetch_resource_versions(to_apply)
+
+    base_args = list()
+    if overwrite:
+        base_args.append('--overwrite')
+
+    report = _bulk('apply', None, [base_args, cmd_args], chunk_size, parallelism, parse=_parse_apply,
+                   items=to_apply)
+
+    if len(to_apply) != len(items):
+        applied = dict((id(outcome.obj), outcome) for outcome in report.outcomes)
+        report.outcomes = [applied.get(id(item), None) or BulkOutcome(item, UNCHANGED, 'content hash unchanged')
+                           for item in items]
+
+    return report
+
+
+def bulk_create(str_dict_model_apiobject_or_list_thereof, chunk_size=None, parallelism=None, cmd_args=None):
+    """
+    Creates many objects by splitting them into chunks which are created in parallel. Namespaces and
+    CustomResourceDefinitions are created before the objects which may depend on them.
+    :param str_dict_model_apiobject_or_list_thereof: A single json/yaml string, Model, apiobject, or a
+        list of any of those.
+    :param chunk_size: The maximum number of objects sent to each oc invocation.
+    :param parallelism: The maximum number of concurrent oc invocations (see set_default_parallelism).
+    :param cmd_args: An optional list of additional arguments to pass on the command line
+    :return: A BulkReport
+    """
+    return _bulk('create', str_dict_model_apiobject_or_list_thereof, ['-o=name', cmd_args], chunk_size,
+                 parallelism)
+
+
+def bulk_replace(str_dict_model_apiobject_or_list_thereof, force=False, chunk_size=None, parallelism=None,
+                 cmd_args=None):
+    """
+    Replaces many objects by splitting them into chunks which are replaced in parallel.
+    :param str_dict_model_apiobject_or_list_thereof: A single json/yaml string, Model, apiobject, or a
+        list of any of those.
+    :param force: Whether to send the --force argument to oc replace.
+    :param chunk_size: The maximum number of objects sent to each oc invocation.
+    :param parallelism: The maximum number of concurrent oc invocations (see set_default_parallelism).
+    :param cmd_args: An optional list of additional arguments to pass on the command line
+    :return: A BulkReport
+    """
+    base_args = ['-o=name']
+    if force:
+        base_args.append('--force')
+
+    return _bulk('replace', str_dict_model_apiobject_or_list_thereof, [base_args, cmd_args], chunk_size,
+                 parallelism)
+
+
+def bulk_delete(str_dict_model_apiobject_or_list_thereof, ignore_not_found=False, grace_period=None, force=False,
+                chunk_size=None, parallelism=None, cmd_args=None):
+    """
+    Deletes many objects by splitting them into chunks which are deleted in parallel. Namespaces and
+    CustomResourceDefinitions are deleted after the objects which may depend on them.
+    :param str_dict_model_apiobject_or_list_thereof: A single json/yaml string, Model, apiobject, or a
+        list of any of those.
+    :param ignore_not_found: Pass --ignore-not-found to oc delete. Objects which were not found have the
+        UNCHANGED status.
+    :param grace_period: If specified, sets the --grace-period arguments.
+    :param force: Pass --force to oc delete
+    :param chunk_size: The maximum number of objects sent to each oc invocation.
+    :param parallelism: The maximum number of concurrent oc invocations (see set_default_parallelism).
+    :param cmd_args: An optional list of additional arguments to pass on the command line
+    :return: A BulkReport
+    """
+    base_args = ['-o=name']
+
+    if ignore_not_found:
+        base_args.append('--ignore-not-found')
+
+    if grace_period is not None:
+        base_args.append('--grace-period={}'.format(grace_period))
+
+    if force:
+        base_args.append('--force')
+
+    return _bulk('delete', str_dict_model_apiobject_or_list_thereof, [base_args, cmd_args], chunk_size,
+                 parallelism, unreported_status=UNCHANGED if ignore_not_found else SUCCESS, reverse=True)
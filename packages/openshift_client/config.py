@@ -2,19 +2,20 @@ from __future__ import absolute_import
 
 import openshift_client as oc
 import base64
-import json
+
+from . import jsoncodec
 
 
 def get_kubeconfig():
     """
     :return: Returns the current kubeconfig as a python dict
     """
-    return json.loads(oc.invoke('config',
-                                cmd_args=['view',
-                                          '-o=json',
-                                          '--raw',
-                                          ],
-                                no_namespace=True).out().strip())
+    return jsoncodec.loads(oc.invoke('config',
+                                     cmd_args=['view',
+                                               '-o=json',
+                                               '--raw',
+                                               ],
+                                     no_namespace=True).out().strip())
 
 
 def _get_kubeconfig_model(_kc_model=None):
@@ -6,6 +6,7 @@ import os
 from datetime import datetime, timezone
 from datetime import timedelta
 from threading import local
+from concurrent.futures import ThreadPoolExecutor
 
 from .result import Result
 
@@ -26,6 +27,18 @@ GLOBAL_SKIP_TLS_VERIFY = os.getenv("OPENSHIFT_CLIENT_PYTHON_SKIP_TLS_VERIFY", "f
 MASTER_TIMEOUT = int(os.getenv("OPENSHIFT_CLIENT_PYTHON_MASTER_TIMEOUT", -1))
 
 
+# The maximum number of oc invocations openshift-client-python will run concurrently on behalf of a single call
+DEFAULT_PARALLELISM = int(os.getenv("OPENSHIFT_CLIENT_PYTHON_DEFAULT_PARALLELISM", "8"))
+
+STDIN_RETENTION_MODES = ('full', 'preview', 'digest')
+
+# How much of the input sent to oc is kept by Actions. See stdin_retention().
+DEFAULT_STDIN_RETENTION = os.getenv("OPENSHIFT_CLIENT_PYTHON_DEFAULT_STDIN_RETENTION", "full")
+
+# Output of an oc invocation larger than this number of bytes is kept on disk. See max_output_memory().
+DEFAULT_MAX_OUTPUT_MEMORY = int(os.getenv("OPENSHIFT_CLIENT_PYTHON_DEFAULT_MAX_OUTPUT_MEMORY", str(32 * 1024 * 1024)))
+
+
 def cur_context():
     return context.stack[-1]
 
@@ -45,6 +58,8 @@ class Context(object):
         self.no_tracking = False
         self.timeout_datetime = None
         self.options = None
+        self.stdin_retention_mode = None
+        self.max_output_memory_bytes = None
 
         # ssh configuration
         self.ssh_client = None
@@ -240,6 +255,20 @@ class Context(object):
             return self.parent.get_skip_tls_verify()
         return context.default_skip_tls_verify
 
+    def get_stdin_retention(self):
+        if self.stdin_retention_mode is not None:
+            return self.stdin_retention_mode
+        if self.parent is not None:
+            return self.parent.get_stdin_retention()
+        return context.default_stdin_retention
+
+    def get_max_output_memory(self):
+        if self.max_output_memory_bytes is not None:
+            return self.max_output_memory_bytes
+        if self.parent is not None:
+            return self.parent.get_max_output_memory()
+        return context.default_max_output_memory
+
     def get_out_of_time(self):
         """
         :return: Returns any Context which claims it is timed out. Returns (True,Context) if any surrounding timeout context is expired. If not, returns (False,None)
@@ -330,6 +359,67 @@ class Context(object):
             self.timeout_datetime = None
 
 
+def set_default_parallelism(n):
+    """
+    Sets the maximum number of oc invocations this thread will run concurrently when an operation
+    (e.g. reading a large static selector) is split into several invocations. Set to 1 to disable
+    parallel execution.
+    """
+    context.default_parallelism = n
+
+
+def parallel_map(func, items, parallelism=None):
+    """
+    Calls func once for each item, using a pool of threads, and returns the results in the order of items.
+    Each call runs within the calling thread's context, so project, timeout, tracking, etc. apply as if
+    func had been called by the calling thread. If any call raises an exception, it is raised to the caller.
+    :param func: A callable accepting a single item.
+    :param items: An iterable of items.
+    :param parallelism: The maximum number of concurrent calls. Defaults to the thread's default parallelism
+        (see set_default_parallelism).
+    :return: A list of the values returned by func.
+    """
+    items = list(items)
+
+    if parallelism is None:
+        parallelism = context.default_parallelism
+
+    if parallelism <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(parallelism, len(items))) as executor:
+        return list(executor.map(bind_context(func), items))
+
+
+def bind_context(func, inner=None):
+    """
+    Contexts and defaults are thread local. Returns a wrapper which calls func within the calling
+    thread's current context and with its defaults, regardless of the thread the wrapper is later called by.
+    :param func: The callable to wrap.
+    :param inner: An optional Context to establish within the calling thread's context for each call.
+    :return: The wrapper.
+    """
+    caller = cur_context()
+    defaults = dict((k, v) for k, v in vars(context).items() if k.startswith('default_'))
+    if inner is not None:
+        inner.parent = caller
+
+    def run(*args, **kwargs):
+        for k, v in defaults.items():
+            setattr(context, k, v)
+        context.stack.append(caller)
+        if inner is not None:
+            context.stack.append(inner)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if inner is not None:
+                context.stack.pop()
+            context.stack.pop()
+
+    return run
+
+
 def set_default_oc_path(path):
     """
     Sets the default full path of the oc binary to execute for this thread.
@@ -370,6 +460,25 @@ def set_default_skip_tls_verify(do_skip):
     context.default_skip_tls_verify = do_skip
 
 
+def set_default_stdin_retention(mode):
+    """
+    Sets how much of the input sent to oc is kept by Actions created by this thread. See stdin_retention.
+    :param mode: 'full', 'preview' or 'digest'
+    """
+    if mode not in STDIN_RETENTION_MODES:
+        raise ValueError('Unknown stdin retention mode: {}'.format(mode))
+    context.default_stdin_retention = mode
+
+
+def set_default_max_output_memory(n):
+    """
+    Sets the number of bytes of output (per stream) an Action created by this thread holds in memory. See
+    max_output_memory.
+    :param n: The number of bytes.
+    """
+    context.default_max_output_memory = n
+
+
 def blank():
     """
     :return:  Returns a blank context which can be used to temporarily replace a real context in a with statement.
@@ -587,6 +696,35 @@ def tls_verify(enable=True):
     return c
 
 
+def stdin_retention(mode):
+    """
+    Establishes a context in which inner oc invocations keep only part of their input in the resulting
+    Action. Large payloads (e.g. for apply) are then streamed to oc without holding them in memory.
+    :param mode: 'full' keeps the input as Action.stdin_str. 'preview' keeps the beginning of the input
+        (redacted if it appears sensitive). 'digest' keeps nothing. With 'preview' and 'digest', the sha256 and
+        size of the input are recorded in the Action's references as '.stdin_sha256' and '.stdin_bytes'.
+    :return: The context object. Can be safely ignored.
+    """
+    if mode not in STDIN_RETENTION_MODES:
+        raise ValueError('Unknown stdin retention mode: {}'.format(mode))
+    c = Context()
+    c.stdin_retention_mode = mode
+    return c
+
+
+def max_output_memory(n):
+    """
+    Establishes a context in which the stdout or stderr of an inner oc invocation is only held in
+    memory if it is at most n bytes. Larger output is kept in a temporary file, which is read when
+    Action.out / Action.err is accessed and removed when the Action is garbage collected.
+    :param n: The number of bytes.
+    :return: The context object. Can be safely ignored.
+    """
+    c = Context()
+    c.max_output_memory_bytes = n
+    return c
+
+
 def timeout(seconds):
     """
     Establishes a context in which inner oc interactions
@@ -613,6 +751,9 @@ class ThreadLocalContext(local):
         self.default_options = {}
         self.default_loglevel = os.getenv("OPENSHIFT_CLIENT_PYTHON_DEFAULT_OC_LOGLEVEL", None)
         self.default_skip_tls_verify = os.getenv("OPENSHIFT_CLIENT_PYTHON_DEFAULT_SKIP_TLS_VERIFY", None)
+        self.default_parallelism = DEFAULT_PARALLELISM
+        self.default_stdin_retention = DEFAULT_STDIN_RETENTION
+        self.default_max_output_memory = DEFAULT_MAX_OUTPUT_MEMORY
 
         root_context = Context()
         root_context.set_timeout(MASTER_TIMEOUT)
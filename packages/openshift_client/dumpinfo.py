@@ -0,0 +1,472 @@
+"""
+Support for the dumpinfo_* functions (see base_verbs).
+"""
+
+from __future__ import absolute_import
+
+import contextlib
+import errno
+import hashlib
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+
+import six
+
+from . import util
+
+# Written in the base directory of dumpinfo_system to record the tasks which have completed.
+PROGRESS_FILENAME = 'dumpinfo.progress'
+
+# Written in the base directory of a dump to record the objects it contains (see DumpManifest).
+MANIFEST_FILENAME = 'dumpinfo.manifest.json'
+
+# Written in the base directory of dumpinfo_system to record manifest entries as they are collected, so that
+# they survive an interrupted dump (see DumpManifest.open_journal).
+MANIFEST_JOURNAL_FILENAME = 'dumpinfo.manifest.journal'
+
+_MANIFEST_VERSION = 1
+
+
+class DumpProgress(object):
+    """
+    Records the tasks of a dump which have completed, so that a dump which is interrupted can be resumed
+    without repeating them. Tasks are identified by strings (e.g. 'node:<name>' or 'object:<fqname>')
+    and appended to a file, a line each, as they complete. Tasks may be completed by concurrent threads.
+    """
+
+    def __init__(self, path, resume=False):
+        """
+        :param path: The file in which progress is recorded. If None, progress is only tracked in memory.
+        :param resume: If True, tasks recorded in an existing file are considered complete. Otherwise, any
+        existing file is truncated.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.completed = set()
+        self.file = None
+        if path is None:
+            return
+        interrupted = False
+        if resume and os.path.exists(path):
+            with io.open(path, mode='r', encoding='utf-8') as f:
+                for line in f:
+                    # A line without a newline was interrupted while being written
+                    interrupted = not line.endswith('\n')
+                    if not interrupted:
+                        self.completed.add(line[:-1])
+        util.mkdir_p(os.path.dirname(os.path.abspath(path)))
+        self.file = io.open(path, mode='a' if resume else 'w', encoding='utf-8')
+        if interrupted:
+            self.file.write(u'\n')
+
+    def is_complete(self, task):
+        with self.lock:
+            return task in self.completed
+
+    def complete(self, task):
+        with self.lock:
+            if task not in self.completed:
+                self.completed.add(task)
+                if self.file is not None:
+                    self.file.write(u'{}\n'.format(task))
+                    self.file.flush()
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def dump_sink(target):
+    """
+    :param target: A directory path or a sink (e.g. an ArchiveSink).
+    :return: Returns the sink for the target of a dumpinfo_* function.
+    """
+    if isinstance(target, _DumpSink):
+        return target
+    return DirectorySink(target)
+
+
+class _DumpSink(object):
+    """
+    The destination of the files written by the dumpinfo_* functions. Files are identified by paths relative
+    to the sink, which may have several components (e.g. child('project', 'x').write('status.txt', ...)).
+    """
+
+    def child(self, *names):
+        """
+        :return: Returns a sink for files within the named subdirectory of this sink.
+        """
+        return _ChildSink(self, '/'.join(names))
+
+    def open(self, name, binary=False):
+        """
+        Returns a context manager for a file which is added to the sink once closed.
+        :param name: The path of the file relative to the sink.
+        :param binary: If True, the file accepts bytes. Otherwise, it accepts str, which is encoded as UTF-8.
+        """
+        raise NotImplementedError()
+
+    def write(self, name, data):
+        """
+        Adds a file to the sink.
+        :param name: The path of the file relative to the sink.
+        :param data: The content of the file: bytes, or str which is encoded as UTF-8.
+        """
+        binary = isinstance(data, bytes)
+        with self.open(name, binary=binary) as f:
+            f.write(data)
+
+    def link(self, name, source_path):
+        """
+        Adds a file to the sink with the content of an existing file (e.g. from a previous dump).
+        :param name: The path of the file relative to the sink.
+        :param source_path: The path of the existing file on the local filesystem.
+        """
+        with io.open(source_path, mode='rb') as source, self.open(name, binary=True) as f:
+            shutil.copyfileobj(source, f)
+
+    def entry_name(self, name):
+        """
+        :return: Returns the path of the named file relative to the outermost sink (i.e. the root of the dump).
+        """
+        return name
+
+    def local_path(self, name):
+        """
+        :return: Returns the path at which the named file is stored on the local filesystem, or None if the sink
+        does not store its files individually (e.g. an archive).
+        """
+        return None
+
+
+class _ChildSink(_DumpSink):
+
+    def __init__(self, parent, prefix):
+        self.parent = parent
+        self.prefix = prefix
+
+    def child(self, *names):
+        return self.parent.child(self.prefix, *names)
+
+    def open(self, name, binary=False):
+        return self.parent.open(self.entry_name(name), binary=binary)
+
+    def link(self, name, source_path):
+        self.parent.link(self.entry_name(name), source_path)
+
+    def entry_name(self, name):
+        return self.parent.entry_name('{}/{}'.format(self.prefix, name))
+
+    def local_path(self, name):
+        return self.parent.local_path(self.entry_name(name))
+
+
+class DirectorySink(_DumpSink):
+    """
+    Writes files to a directory. Directories are created as they are needed, once each.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.created = set()
+
+    def local_path(self, name):
+        return os.path.join(self.path, *name.split('/'))
+
+    def _prepare(self, name):
+        path = self.local_path(name)
+        directory = os.path.dirname(path)
+        with self.lock:
+            if directory not in self.created:
+                util.mkdir_p(directory)
+                self.created.add(directory)
+        return path
+
+    def open(self, name, binary=False):
+        path = self._prepare(name)
+        if binary:
+            return io.open(path, mode='wb')
+        return io.open(path, mode='w', encoding='utf-8')
+
+    def link(self, name, source_path):
+        """
+        Hard links the file to source_path, so unchanged files take no additional space. If that is not
+        possible (e.g. source_path is on another filesystem), the file is copied.
+        """
+        path = self._prepare(name)
+        if os.path.lexists(path):
+            os.remove(path)
+        try:
+            os.link(source_path, path)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                raise
+            shutil.copyfile(source_path, path)
+
+
+# Archive compression by file name suffix
+_ARCHIVE_COMPRESSION = [
+    ('.tar.gz', 'gz'),
+    ('.tgz', 'gz'),
+    ('.tar.zst', 'zst'),
+    ('.tar', None),
+]
+
+# Entries smaller than this are buffered in memory while they are written; larger entries are spooled to disk.
+ARCHIVE_SPOOL_BYTES = 1024 * 1024
+
+
+class _TextWriter(object):
+    """
+    Encodes str written to it as UTF-8 for a binary file.
+    """
+
+    def __init__(self, binary_file):
+        self.binary_file = binary_file
+
+    def write(self, s):
+        self.binary_file.write(s.encode('utf-8'))
+
+    def flush(self):
+        self.binary_file.flush()
+
+
+class ArchiveSink(_DumpSink):
+    """
+    Writes files to a tar archive, which may be compressed with gzip or zstandard (zstandard requires the
+    zstandard package). The archive is written sequentially, an entry at a time, as each file is closed,
+    so it may be written to a stream (e.g. a pipe or socket) and is never assembled on disk as a directory.
+
+    Files with identical content (e.g. the same configmap collected from several projects) are stored once:
+    later copies are stored as hard links to the first.
+
+    ArchiveSink is thread safe and should be closed (or used as a context manager) to complete the archive.
+    """
+
+    def __init__(self, target, compression='infer', dedupe=True):
+        """
+        :param target: The path of the archive or a binary file-like object to write it to.
+        :param compression: 'gz', 'zst' or None. If 'infer', the compression is determined by the suffix of the
+        path (.tar.gz, .tgz, .tar.zst or .tar). Defaults to gz if target is not a path.
+        :param dedupe: If True, files with content identical to a file already in the archive are stored as
+        hard links.
+        """
+        if compression == 'infer':
+            compression = 'gz'
+            if isinstance(target, six.string_types):
+                compression = next((c for suffix, c in _ARCHIVE_COMPRESSION if target.endswith(suffix)), 'gz')
+
+        if compression not in ('gz', 'zst', None):
+            raise ValueError('Unknown archive compression: {}'.format(compression))
+
+        self.dedupe = dedupe
+        self.lock = threading.Lock()
+        self.digests = {}  # sha256 of content -> name of the first entry with that content
+        self.closeables = []
+
+        fileobj = target
+        if isinstance(target, six.string_types):
+            fileobj = io.open(target, mode='wb')
+            self.closeables.append(fileobj)
+
+        if compression == 'zst':
+            # Just-in-time import to avoid hard dependency.
+            import zstandard
+            fileobj = zstandard.ZstdCompressor().stream_writer(fileobj, closefd=False)
+            self.closeables.insert(0, fileobj)
+            mode = 'w|'
+        else:
+            mode = 'w|gz' if compression == 'gz' else 'w|'
+
+        self.tar = tarfile.open(fileobj=fileobj, mode=mode)
+
+    @contextlib.contextmanager
+    def open(self, name, binary=False):
+        spool = tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_BYTES)
+        try:
+            yield spool if binary else _TextWriter(spool)
+            self._add(name, spool)
+        finally:
+            spool.close()
+
+    def _add(self, name, spool):
+        size = spool.tell()
+        spool.seek(0)
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: spool.read(64 * 1024), b''):
+            digest.update(chunk)
+        digest = digest.hexdigest()
+        spool.seek(0)
+
+        info = tarfile.TarInfo(name)
+        info.mtime = time.time()
+        info.mode = 0o644
+
+        with self.lock:
+            first = self.digests.get(digest) if self.dedupe and size else None
+            if first is not None:
+                info.type = tarfile.LNKTYPE
+                info.linkname = first
+                self.tar.addfile(info)
+            else:
+                info.size = size
+                self.tar.addfile(info, spool)
+                self.digests.setdefault(digest, name)
+
+    def close(self):
+        with self.lock:
+            if self.tar is None:
+                return
+            self.tar.close()
+            self.tar = None
+            for closeable in self.closeables:
+                closeable.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class DumpManifest(object):
+    """
+    Records the fqname, uid and resourceVersion of each object in a dump, along with the files written
+    for it. A subsequent dump can compare these with a metadata only listing of the cluster and reuse the
+    files of objects which have not changed instead of collecting them again (see the previous parameter
+    of dumpinfo_project and dumpinfo_system).
+    """
+
+    def __init__(self, base_path=None):
+        """
+        :param base_path: The directory of the dump the manifest describes, if it has been written.
+        """
+        self.base_path = base_path
+        self.lock = threading.Lock()
+        # <fqname> -> {'uid': <uid>, 'resourceVersion': <resourceVersion>, 'files': [<path relative to dump>, ...]}
+        self.objects = {}
+        self.journal = None
+
+    @staticmethod
+    def load(dump_dir):
+        """
+        :param dump_dir: The directory of a previous dump.
+        :return: Returns the manifest of the dump. If the dump has no manifest (e.g. it was not complete), the
+        manifest is empty.
+        """
+        manifest = DumpManifest(base_path=dump_dir)
+        path = os.path.join(dump_dir, MANIFEST_FILENAME)
+        if os.path.exists(path):
+            with io.open(path, mode='r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == _MANIFEST_VERSION:
+                manifest.objects = state['objects']
+
+        # Entries recorded after the manifest was last saved (e.g. before the dump was interrupted)
+        journal_path = os.path.join(dump_dir, MANIFEST_JOURNAL_FILENAME)
+        if os.path.exists(journal_path):
+            with io.open(journal_path, mode='r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        fqname, entry = json.loads(line)
+                    except ValueError:
+                        # The line was interrupted while being written
+                        continue
+                    manifest.objects[fqname] = entry
+        return manifest
+
+    def open_journal(self, path, resume=False):
+        """
+        Appends each entry subsequently recorded to a file as well, so that the entries of a dump which is
+        interrupted before save() is called are not lost. load() reads the journal of the dump it loads.
+        :param path: The path of the journal (see MANIFEST_JOURNAL_FILENAME).
+        :param resume: If True, entries are appended to an existing journal. Otherwise, any existing journal is
+        truncated.
+        """
+        interrupted = False
+        if resume and os.path.exists(path):
+            with io.open(path, mode='r', encoding='utf-8') as f:
+                for line in f:
+                    interrupted = not line.endswith('\n')
+        util.mkdir_p(os.path.dirname(os.path.abspath(path)))
+        with self.lock:
+            self.journal = io.open(path, mode='a' if resume else 'w', encoding='utf-8')
+            if interrupted:
+                self.journal.write(u'\n')
+
+    def close(self):
+        with self.lock:
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
+
+    def record(self, obj, files):
+        """
+        :param obj: An APIObject which has been dumped.
+        :param files: The paths, relative to the root of the dump, of the files written for the object.
+        """
+        fqname = obj.fqname()
+        entry = {
+            'uid': obj.uid(if_missing=None),
+            'resourceVersion': obj.resource_version(if_missing=None),
+            'files': list(files),
+        }
+        with self.lock:
+            self.objects[fqname] = entry
+            if self.journal is not None:
+                self.journal.write(six.text_type(json.dumps([fqname, entry])) + u'\n')
+                self.journal.flush()
+
+    def unchanged_files(self, obj):
+        """
+        :param obj: An APIObject; only its metadata is required.
+        :return: If the manifest records the same uid and resourceVersion for the object, returns the local paths
+        of the files written for it. Otherwise, returns None.
+        """
+        if self.base_path is None:
+            return None
+        with self.lock:
+            entry = self.objects.get(obj.fqname())
+        if entry is None or entry['resourceVersion'] is None:
+            return None
+        if entry['uid'] != obj.uid(if_missing=None) or entry['resourceVersion'] != obj.resource_version(if_missing=None):
+            return None
+        paths = [os.path.join(self.base_path, *name.split('/')) for name in entry['files']]
+        if not all(os.path.exists(path) for path in paths):
+            return None
+        return paths
+
+    def save(self, sink):
+        """
+        Writes the manifest to the root of a dump.
+        :param sink: The sink of the dump.
+        """
+        with self.lock:
+            state = {'version': _MANIFEST_VERSION, 'objects': self.objects}
+            sink.write(MANIFEST_FILENAME, json.dumps(state, indent=2, sort_keys=True))
+
+    @contextlib.contextmanager
+    def saving(self, sink):
+        """
+        Returns a context manager which closes the journal and saves the manifest to sink when it exits, whether
+        or not an exception is raised.
+        """
+        try:
+            yield self
+        finally:
+            self.close()
+            self.save(sink)
@@ -0,0 +1,205 @@
+"""
+Stand-ins for the oc binary, used by the unit tests.
+"""
+
+from __future__ import absolute_import
+
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+
+from .context import context, set_default_oc_path
+
+# Serves oc get and oc apply against the objects stored in cluster.json beside the script. The arguments of
+# each invocation, followed by the qualified names of the objects passed to it on stdin, are appended to
+# calls as a JSON list. Objects whose names begin with bad cannot be applied; like oc, the invocation fails
+# without applying the objects which follow them. Scripts appended to this one can handle other verbs using
+# verb, namespace, output, labels, targets, cluster and selected().
+_CLUSTER_SCRIPT = r'''
+import fcntl, json, os, re, sys
+
+here = os.path.dirname(os.path.abspath(__file__))
+args = sys.argv[1:]
+verb = args[0]
+namespace = 'default'
+output = None
+labels = []
+targets = []
+for arg in args[1:]:
+    if arg.startswith('--namespace='):
+        namespace = arg.split('=', 1)[1]
+    elif arg.startswith('-o='):
+        output = arg[3:]
+    elif arg.startswith('--selector='):
+        labels = arg.split('=', 1)[1].split(',')
+    elif not arg.startswith('-'):
+        targets.extend(arg.split(','))
+
+def qname(o):
+    group = o['apiVersion'].split('/')[0] if '/' in o['apiVersion'] else ''
+    return '{}{}/{}'.format(o['kind'].lower(), '.' + group if group else '', o['metadata']['name'])
+
+items = json.load(sys.stdin)['items'] if '-f' in args else []
+
+# Invocations run concurrently; those which modify the cluster hold the lock while they read and update it
+if verb == 'apply':
+    lock = open(os.path.join(here, 'lock'), 'w')
+    fcntl.flock(lock, fcntl.LOCK_EX)
+
+with open(os.path.join(here, 'calls'), 'a') as f:
+    f.write(json.dumps(args + [qname(item) for item in items]) + '\n')
+with open(os.path.join(here, 'cluster.json')) as f:
+    cluster = json.load(f)
+
+def matches(o, target, ns=None):
+    kind = target.split('/')[0]
+    kind = {'ds': 'daemonset', 'dc': 'deploymentconfig', 'rs': 'replicaset'}.get(kind, kind)
+    if o['kind'].lower() != kind.split('.')[0]:
+        return False
+    if '/' in target and o['metadata']['name'] != target.split('/')[1]:
+        return False
+    if o['metadata'].get('namespace', ns or namespace) != (ns or namespace) and '--all-namespaces' not in args:
+        return False
+    obj_labels = o['metadata'].get('labels', {})
+    return all(obj_labels.get(label.split('=')[0]) == label.split('=')[1] if '=' in label
+               else label in obj_labels for label in labels)
+
+def selected():
+    return [o for target in targets for o in cluster if matches(o, target)]
+
+def field(o, path):
+    for key in path.split('.')[1:]:
+        o = o.get(key) if isinstance(o, dict) else None
+    return '' if o is None else str(o)
+
+if verb == 'get':
+    objs = selected()
+    if output == 'name':
+        for o in objs:
+            print(qname(o))
+    elif output and output.startswith('jsonpath='):
+        exprs = re.findall(r'{(\.[^}]*)}', output.split('=', 1)[1])
+        for o in objs:
+            sys.stdout.write('\t'.join(field(o, e) for e in exprs) + '\n')
+    elif len(targets) == 1 and '/' in targets[0]:
+        if objs:
+            print(json.dumps(objs[0]))
+    else:
+        print(json.dumps({'kind': 'List', 'apiVersion': 'v1', 'metadata': {}, 'items': objs}))
+    sys.exit(0)
+
+if verb == 'apply':
+    rc = 0
+    for item in items:
+        item['metadata'].setdefault('namespace', namespace)
+        if item['metadata']['name'].startswith('bad'):
+            sys.stderr.write('Error from server: {} is invalid\n'.format(qname(item)))
+            rc = 1
+            break
+        existing = [o for o in cluster if matches(o, qname(item), item['metadata']['namespace'])]
+        version = 1
+        if existing:
+            version = int(existing[0]['metadata']['resourceVersion']) + 1
+            item['metadata']['resourceVersion'] = existing[0]['metadata']['resourceVersion']
+            if item == existing[0]:
+                print('{} unchanged'.format(qname(item)))
+                continue
+            cluster.remove(existing[0])
+        item['metadata']['resourceVersion'] = str(version)
+        cluster.append(item)
+        print(qname(item) if output == 'name' else '{} configured'.format(qname(item)))
+    with open(os.path.join(here, 'cluster.json'), 'w') as f:
+        json.dump(cluster, f)
+    sys.exit(rc)
+'''
+
+
+class FakeOc(object):
+    """
+    Installs a script as the default oc binary of the calling thread (see set_default_oc_path) until closed.
+    The script is written to a temporary directory, in which it can create files for the test to read.
+    """
+
+    def __init__(self, script):
+        """
+        :param script: The content of the script, including its shebang line.
+        """
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'oc')
+        with open(self.path, 'w') as f:
+            f.write(script)
+        os.chmod(self.path, os.stat(self.path).st_mode | stat.S_IEXEC)
+        self.previous = context.default_oc_path
+        set_default_oc_path(self.path)
+
+    def file(self, name):
+        """
+        :return: Returns the path of a file beside the script.
+        """
+        return os.path.join(self.dir, name)
+
+    def lines(self, name='calls'):
+        """
+        :return: Returns the lines written to a file beside the script, and removes the file so that the
+            next call only returns lines written since. Empty if the file does not exist.
+        """
+        path = self.file(name)
+        if not os.path.exists(path):
+            return []
+        with open(path) as f:
+            lines = f.read().splitlines()
+        os.remove(path)
+        return lines
+
+    def close(self):
+        set_default_oc_path(self.previous)
+        shutil.rmtree(self.dir)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class FakeCluster(FakeOc):
+    """
+    A FakeOc which serves oc get and oc apply against a list of object definitions.
+    """
+
+    def __init__(self, objects, script=''):
+        """
+        :param objects: A list of object definition dicts initially on the cluster.
+        :param script: Python code run for verbs other than get and apply. Unless it exits, the invocation fails.
+        """
+        super(FakeCluster, self).__init__('#!{}\n{}\n{}\nsys.exit(1)\n'.format(sys.executable, _CLUSTER_SCRIPT,
+                                                                             script))
+        with open(self.file('cluster.json'), 'w') as f:
+            json.dump(objects, f)
+
+    def objects(self):
+        """
+        :return: Returns the object definitions currently on the cluster.
+        """
+        with open(self.file('cluster.json')) as f:
+            return json.load(f)
+
+    def calls(self):
+        """
+        :return: Returns the arguments of each invocation since this was last called, followed by the qualified
+            names of the objects passed to it on stdin.
+        """
+        return [json.loads(line) for line in self.lines()]
+
+
+def configmap(name, namespace=None, **data):
+    """
+    :return: Returns the definition of a ConfigMap with the specified data.
+    """
+    d = {'apiVersion': 'v1', 'kind': 'ConfigMap', 'metadata': {'name': name}, 'data': data}
+    if namespace:
+        d['metadata']['namespace'] = namespace
+    return d
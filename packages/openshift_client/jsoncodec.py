@@ -0,0 +1,222 @@
+"""
+JSON encoding and decoding for the payloads exchanged with oc. If orjson is installed, it is used to
+parse and to produce compact JSON; otherwise, the standard library json module is used. Another codec
+can be installed with set_json_codec().
+
+Unlike the set_default_* settings of the context module, the codec is set for the process rather than
+for the calling thread. Codecs produce equivalent results, so the choice is a matter of performance
+rather than of behavior, and threads started by the library (e.g. by parallel_map) or by callers
+would otherwise not use the codec selected by the thread which started them.
+
+Output which must be stable across codecs (e.g. content hashes) should continue to use the json module.
+"""
+
+from __future__ import absolute_import
+
+import json
+import os
+import warnings
+
+import six
+
+# Name of the codec to use ('json' or 'orjson'). If unset, orjson is used when it can be imported.
+DEFAULT_JSON_CODEC = os.getenv('OPENSHIFT_CLIENT_PYTHON_DEFAULT_JSON_CODEC', None)
+
+
+class StdlibJSONCodec(object):
+    """
+    Encodes and decodes JSON with the standard library json module.
+    """
+
+    name = 'json'
+
+    # Indents for which dict and list subclasses (e.g. Model) are encoded from their underlying
+    # storage, without invoking their Python level methods.
+    native_indents = ()
+
+    def loads(self, s):
+        """
+        :param s: A str or UTF-8 encoded bytes.
+        :return: The decoded value.
+        """
+        if isinstance(s, (bytes, bytearray)):
+            s = s.decode('utf-8')
+        return json.loads(s)
+
+    def dumps(self, obj, indent=None):
+        """
+        :return: Returns obj encoded as a JSON str.
+        """
+        return json.dumps(obj, indent=indent)
+
+    def dumpb(self, obj, indent=None):
+        """
+        :return: Returns obj encoded as UTF-8 JSON bytes.
+        """
+        return json.dumps(obj, indent=indent).encode('utf-8')
+
+
+class OrjsonCodec(StdlibJSONCodec):
+    """
+    Encodes and decodes JSON with orjson. orjson only supports an indent of 2 and does not accept
+    some values the json module does (e.g. non-string keys or integers larger than 64 bits). In
+    these cases, the json module is used instead.
+    """
+
+    name = 'orjson'
+
+    native_indents = (None, 2)
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, s):
+        try:
+            return self._orjson.loads(s)
+        except self._orjson.JSONDecodeError:
+            # e.g. NaN, which the json module accepts. Otherwise, raise the same error as the json module.
+            return super(OrjsonCodec, self).loads(s)
+
+    def dumpb(self, obj, indent=None):
+        if indent is None:
+            option = 0
+        elif indent == 2:
+            option = self._orjson.OPT_INDENT_2
+        else:
+            return super(OrjsonCodec, self).dumpb(obj, indent=indent)
+
+        try:
+            return self._orjson.dumps(obj, option=option)
+        except self._orjson.JSONEncodeError:
+            return super(OrjsonCodec, self).dumpb(obj, indent=indent)
+
+    def dumps(self, obj, indent=None):
+        if indent not in (None, 2):
+            return super(OrjsonCodec, self).dumps(obj, indent=indent)
+        return self.dumpb(obj, indent=indent).decode('utf-8')
+
+
+_codecs = {
+    StdlibJSONCodec.name: StdlibJSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def _default_codec():
+    """
+    :return: Returns the codec named by OPENSHIFT_CLIENT_PYTHON_DEFAULT_JSON_CODEC. This is evaluated when
+        the module is imported, so a codec which is unknown or cannot be imported falls back to the json
+        module with a warning rather than raising.
+    """
+    if DEFAULT_JSON_CODEC:
+        if DEFAULT_JSON_CODEC not in _codecs:
+            warnings.warn('Unknown OPENSHIFT_CLIENT_PYTHON_DEFAULT_JSON_CODEC {!r} (expected one of {}); '
+                          'using json'.format(DEFAULT_JSON_CODEC, ', '.join(sorted(_codecs))))
+            return StdlibJSONCodec()
+        try:
+            return _codecs[DEFAULT_JSON_CODEC]()
+        except ImportError as e:
+            warnings.warn('OPENSHIFT_CLIENT_PYTHON_DEFAULT_JSON_CODEC {!r} is unavailable ({}); '
+                          'using json'.format(DEFAULT_JSON_CODEC, e))
+            return StdlibJSONCodec()
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return StdlibJSONCodec()
+
+
+_codec = _default_codec()
+
+
+def set_json_codec(codec):
+    """
+    Sets the codec used by all threads to parse and serialize JSON.
+    :param codec: 'json', 'orjson', or an object providing loads(s), dumps(obj, indent=None) and
+        dumpb(obj, indent=None) methods.
+    :return: Returns the previous codec.
+    """
+    global _codec
+    if isinstance(codec, six.string_types):
+        if codec not in _codecs:
+            raise ValueError('Unknown JSON codec {!r}; expected one of {}'.format(codec, ', '.join(sorted(_codecs))))
+        codec = _codecs[codec]()  # Raises ImportError if orjson is not installed
+    previous = _codec
+    _codec = codec
+    return previous
+
+
+def get_json_codec():
+    """
+    :return: Returns the codec used to parse and serialize JSON.
+    """
+    return _codec
+
+
+def loads(s):
+    """
+    :param s: A str or UTF-8 encoded bytes.
+    :return: The decoded value.
+    """
+    return _codec.loads(s)
+
+
+def dumps(obj, indent=None):
+    """
+    :return: Returns obj encoded as a JSON str. Without indent, the output is compact but
+        its exact format depends on the codec.
+    """
+    return _codec.dumps(obj, indent=indent)
+
+
+def dumpb(obj, indent=None):
+    """
+    :return: Returns obj encoded as UTF-8 JSON bytes, without an intermediate str when the codec allows it.
+    """
+    return _codec.dumpb(obj, indent=indent)
+
+
+def _iterencode(obj, depth):
+    if depth > 0 and isinstance(obj, dict):
+        yield b'{'
+        for i, (k, v) in enumerate(obj.items()):
+            if not isinstance(k, six.string_types):
+                k = '{}'.format(k)
+            yield (b', ' if i else b'') + dumpb(k) + b': '
+            for chunk in _iterencode(v, depth - 1):
+                yield chunk
+        yield b'}'
+    elif depth > 0 and isinstance(obj, list):
+        yield b'['
+        # list.__iter__ avoids converting the elements of a ListModel into Models
+        for i, v in enumerate(list.__iter__(obj)):
+            if i:
+                yield b', '
+            for chunk in _iterencode(v, depth - 1):
+                yield chunk
+        yield b']'
+    else:
+        yield dumpb(obj)
+
+
+def iterencode(obj, depth=2, chunk_size=64 * 1024):
+    """
+    Encodes obj incrementally. Dicts and lists less than depth levels deep are encoded one element at
+    a time, so, for a List, memory use is bounded by the size of its largest item rather than the
+    size of the entire List.
+    :param obj: The value to encode.
+    :param depth: The number of container levels to encode incrementally.
+    :param chunk_size: Small encoded elements are combined into chunks of at least this many bytes.
+    :return: A generator of UTF-8 encoded bytes which, concatenated, are the JSON representation of obj.
+    """
+    buf = []
+    size = 0
+    for chunk in _iterencode(obj, depth):
+        buf.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            yield b''.join(buf)
+            buf = []
+            size = 0
+    if buf:
+        yield b''.join(buf)
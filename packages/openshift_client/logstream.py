@@ -0,0 +1,401 @@
+"""
+Support for reading the output of several 'oc logs' invocations concurrently (see stream_logs() and
+merged_logs() on APIObject and Selector) and for collecting only new lines across invocations (LogCursors).
+"""
+
+from __future__ import absolute_import
+
+import hashlib
+import heapq
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from six.moves import queue
+
+from .action import oc_action
+from .context import Context, bind_context
+
+# The number of lines which may be read from oc but not yet consumed before reading is paused.
+DEFAULT_MAX_BUFFERED_LINES = 1000
+
+# The number of lines buffered for each source when logs are merged.
+DEFAULT_MERGE_BUFFERED_LINES = 100
+
+# How frequently a reader which is waiting for buffer space checks whether the stream has been closed.
+_PUT_POLL_SECONDS = 0.5
+
+
+def format_since_time(since_time):
+    """
+    :param since_time: An RFC3339 string or a datetime. Naive datetimes are assumed to be UTC.
+    :return: Returns since_time in the RFC3339 format accepted by 'oc logs --since-time'.
+    """
+    if isinstance(since_time, datetime):
+        if since_time.tzinfo is None:
+            since_time = since_time.replace(tzinfo=timezone.utc)
+        return since_time.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+    return since_time
+
+
+def log_args(timestamps=False, previous=False, since=None, limit_bytes=None, tail=-1, follow=False,
+             since_time=None):
+    """
+    :return: Returns the 'oc logs' arguments for the specified options (see APIObject.logs).
+    """
+    base_args = list()
+
+    if follow:
+        base_args.append('--follow')
+
+    if previous:
+        base_args.append('-p')
+
+    if since:
+        base_args.append('--since={}'.format(since))
+
+    if since_time:
+        base_args.append('--since-time={}'.format(format_since_time(since_time)))
+
+    if limit_bytes:
+        base_args.append('--limit-bytes={}'.format(limit_bytes))
+
+    if timestamps:
+        base_args.append('--timestamps')
+
+    base_args.append('--tail={}'.format(tail))
+
+    return base_args
+
+
+class _LineSplitter(object):
+    """
+    Receives the stdout of an 'oc logs' invocation chunk by chunk and passes each complete line to emit.
+    """
+
+    def __init__(self, emit):
+        self.emit = emit
+        self.partial = b''
+
+    def __call__(self, chunk):
+        lines = (self.partial + chunk).split(b'\n')
+        self.partial = lines.pop()
+        for line in lines:
+            self.emit(line)
+
+    def flush(self):
+        if self.partial:
+            self.emit(self.partial)
+            self.partial = b''
+
+
+def _decode_line(line):
+    return line.decode('utf-8', errors='ignore').rstrip('\r')
+
+
+# Placed in the queue by a reader when it has finished. Followed by an exception to raise, if any.
+_DONE = object()
+
+
+class _SourceReaders(object):
+    """
+    Runs an 'oc logs' invocation for each source, each in its own thread and within the context of the
+    thread which created this object. Lines are placed in queues as (<name>, <line>) tuples; once a
+    source is exhausted, (_DONE, <exception or None>) follows.
+    """
+
+    def __init__(self, sources, queues):
+        """
+        :param sources: A list of (<name>, <Context>, <oc_action kwargs>) tuples.
+        :param queues: A queue for each source. Queues may be shared by several sources.
+        """
+        self.closed = threading.Event()
+        # Killing the invocations is left to oc_action: expiring this context, which each reader runs
+        # within, causes them to be killed just as if the caller's context had timed out.
+        self.cancellation = Context()
+        self.threads = []
+        for source, lines in zip(sources, queues):
+            thread = threading.Thread(target=bind_context(self._read_source, inner=self.cancellation),
+                                      args=source + (lines,))
+            thread.daemon = True
+            self.threads.append(thread)
+
+    def start(self):
+        for thread in self.threads:
+            thread.start()
+
+    def close(self):
+        self.closed.set()
+        self.cancellation.timeout_datetime = datetime.now(timezone.utc)
+
+    def _put(self, lines, item):
+        # Blocking here stops reading from the pipe, which eventually blocks oc.
+        while not self.closed.is_set():
+            try:
+                lines.put(item, timeout=_PUT_POLL_SECONDS)
+                return
+            except queue.Full:
+                pass
+
+    def _read_source(self, name, source_context, action_kwargs, lines):
+        error = None
+        try:
+            splitter = _LineSplitter(lambda line: self._put(lines, (name, _decode_line(line))))
+            action = oc_action(source_context, "logs", stdout_sink=splitter, **action_kwargs)
+            splitter.flush()
+            # As with APIObject.logs, errors are reported as the output of the source. Timeouts are
+            # how a followed stream is normally ended, so they are not.
+            if action.status != 0 and not action.timeout:
+                self._put(lines, (name, u'>>>>Error during log collection rc={}<<<<'.format(action.status)))
+                for line in action.err.replace('\r\n', '\n').splitlines():
+                    self._put(lines, (name, line))
+        except Exception as e:
+            error = e
+        self._put(lines, (_DONE, error))
+
+
+def _drain(lines, count):
+    """
+    :return: A generator of the (<name>, <line>) tuples in a queue until count sources are exhausted.
+    """
+    while count:
+        name, line = lines.get()
+        if name is _DONE:
+            count -= 1
+            if line is not None:
+                raise line
+            continue
+        yield name, line
+
+
+def stream_log_sources(sources, max_buffered_lines=DEFAULT_MAX_BUFFERED_LINES):
+    """
+    Runs an 'oc logs' invocation for each source concurrently and yields their output line by line.
+    Each invocation runs in its own thread, within the calling thread's context. If the returned
+    generator is closed, or the calling context times out, invocations which are still running are killed.
+    :param sources: A list of (<name>, <Context>, <oc_action kwargs>) tuples.
+    :param max_buffered_lines: The number of lines which may be read but not yet consumed.
+    :return: A generator of (<name>, <line>) tuples.
+    """
+    lines = queue.Queue(maxsize=max(1, max_buffered_lines))
+    readers = _SourceReaders(sources, [lines] * len(sources))
+
+    def generate():
+        try:
+            readers.start()
+            for name, line in _drain(lines, len(sources)):
+                yield name, line
+        finally:
+            readers.close()
+
+    return generate()
+
+
+_TIMESTAMP_PATTERN = re.compile(r'^(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(?:\.(\d+))?(Z|[+-]\d\d:\d\d)$')
+
+
+def parse_timestamp(timestamp):
+    """
+    Parses the RFC3339 timestamps oc includes with --timestamps. Unlike the strings, the values
+    returned can be compared: fractional seconds may be printed with any number of digits.
+    :param timestamp: An RFC3339 string.
+    :return: Returns a tuple of (<datetime in UTC, to the second>, <nanoseconds>), or None if the string
+    is not an RFC3339 timestamp.
+    """
+    match = _TIMESTAMP_PATTERN.match(timestamp)
+    if not match:
+        return None
+    seconds, fraction, offset = match.groups()
+    if offset == 'Z':
+        tz = timezone.utc
+    else:
+        sign = -1 if offset[0] == '-' else 1
+        tz = timezone(sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6])))
+    moment = datetime.strptime(seconds, '%Y-%m-%dT%H:%M:%S').replace(tzinfo=tz).astimezone(timezone.utc)
+    return moment, int((fraction or '0')[:9].ljust(9, '0'))
+
+
+# Sorts before any parsed timestamp
+_EARLIEST = (datetime.min.replace(tzinfo=timezone.utc), 0)
+
+
+def _timestamped(lines):
+    """
+    Splits the timestamp from each (<name>, <line>) tuple. Lines without a timestamp (e.g. error
+    output) are ordered as if they had the timestamp of the line which precedes them.
+    :return: A generator of (<sort key>, <timestamp or None>, <name>, <line>) tuples.
+    """
+    key = _EARLIEST
+    for name, line in lines:
+        timestamp, _, message = line.partition(' ')
+        parsed = parse_timestamp(timestamp)
+        if parsed is None:
+            yield key, None, name, line
+        else:
+            key = parsed
+            yield key, timestamp, name, message
+
+
+def merge_log_sources(sources, max_buffered_lines=DEFAULT_MERGE_BUFFERED_LINES):
+    """
+    Runs an 'oc logs --timestamps' invocation for each source concurrently and merges their output
+    into a single stream in timestamp order. Each source is read into its own buffer of at most
+    max_buffered_lines; once full, reading from that source pauses until the merge consumes its lines.
+    Memory use is therefore bounded regardless of the volume of the logs.
+
+    The merge must see the next line of every source before it can yield a line, so sources should
+    not be followed.
+    :param sources: A list of (<name>, <Context>, <oc_action kwargs>) tuples. The invocations must
+    include --timestamps.
+    :param max_buffered_lines: The number of lines which may be buffered for each source.
+    :return: A generator of (<timestamp>, <name>, <line>) tuples. The timestamp is the string reported
+    by oc, or None for lines which did not include one (e.g. errors collecting the logs).
+    """
+    queues = [queue.Queue(maxsize=max(1, max_buffered_lines)) for _ in sources]
+    readers = _SourceReaders(sources, queues)
+
+    def generate():
+        try:
+            readers.start()
+            # heapq.merge is stable, so lines with equal timestamps stay in source order.
+            for _, timestamp, name, line in heapq.merge(*[_timestamped(_drain(lines, 1)) for lines in queues],
+                                                        key=lambda record: record[0]):
+                yield timestamp, name, line
+        finally:
+            readers.close()
+
+    return generate()
+
+
+def write_merged_logs(stream, records):
+    """
+    Writes records produced by merge_log_sources() to a stream, a line each.
+    :param stream: A text stream.
+    :param records: An iterable of (<timestamp>, <name>, <line>) tuples.
+    :return: n/a
+    """
+    for timestamp, name, line in records:
+        if timestamp is None:
+            stream.write(u'[{}] {}\n'.format(name, line))
+        else:
+            stream.write(u'{} [{}] {}\n'.format(timestamp, name, line))
+
+
+# Cursors which have not been used for this long are discarded when LogCursors are saved.
+DEFAULT_CURSOR_RETENTION_SECONDS = 7 * 24 * 60 * 60
+
+_CURSORS_VERSION = 1
+
+
+def _line_digest(line):
+    return hashlib.sha256(line.encode('utf-8')).hexdigest()[:16]
+
+
+class LogCursors(object):
+    """
+    Records how far the logs of each container have been collected so that repeated collection (see the
+    cursors parameter of logs()) returns only lines written since the previous collection. Positions are
+    kept in a small JSON file, keyed by pod UID and container name, so they survive process restarts.
+
+    A position is the timestamp of the last line collected. The next collection requests logs
+    --since-time that timestamp; since the server only honors whole seconds, the lines collected during
+    that second are remembered by digest and skipped.
+    """
+
+    def __init__(self, path, retention_seconds=DEFAULT_CURSOR_RETENTION_SECONDS):
+        """
+        :param path: The file in which positions are stored. It is created if it does not exist.
+        :param retention_seconds: Positions which have not been used for this long (e.g. those of deleted
+        pods) are discarded when the file is saved.
+        """
+        self.path = path
+        self.retention_seconds = retention_seconds
+        self.lock = threading.Lock()
+        # <cursor id> -> {'time': <RFC3339 timestamp>, 'seen': [<line digest>, ...], 'used': <epoch seconds>}
+        self.cursors = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                state = json.load(f)
+            if state.get('version') == _CURSORS_VERSION:
+                self.cursors = state['cursors']
+
+    def log_args(self, cursor_id, base_args):
+        """
+        :param cursor_id: Identifies the container (see APIObject._log_sources).
+        :param base_args: The 'oc logs' arguments which would be used without a cursor.
+        :return: Returns the 'oc logs' arguments which collect the lines after the cursor's position.
+        """
+        with self.lock:
+            cursor = self.cursors.get(cursor_id)
+        args = [arg for arg in base_args if arg != '--timestamps']
+        args.append('--timestamps')  # Required to advance the cursor
+        if cursor is not None:
+            args = [arg for arg in args if not arg.startswith(('--since=', '--since-time='))]
+            args.append('--since-time={}'.format(format_since_time(parse_timestamp(cursor['time'])[0])))
+        return args
+
+    def advance(self, cursor_id, output, timestamps=False):
+        """
+        Removes the lines which have already been collected from output and moves the cursor to the
+        last line.
+        :param cursor_id: Identifies the container (see APIObject._log_sources).
+        :param output: The output of 'oc logs' invoked with log_args().
+        :param timestamps: If False, timestamps are removed from the lines returned.
+        :return: Returns the new lines in output.
+        """
+        with self.lock:
+            cursor = self.cursors.get(cursor_id)
+            seen = set(cursor['seen']) if cursor else set()
+            position = parse_timestamp(cursor['time']) if cursor else None
+
+            new_lines = []
+            latest = None
+            digests = []
+            for line in output.replace('\r\n', '\n').split('\n'):
+                timestamp, _, message = line.partition(' ')
+                parsed = parse_timestamp(timestamp)
+                if parsed is None:
+                    if line:
+                        new_lines.append(line)
+                    continue
+                digest = _line_digest(line)
+                digests.append((parsed, digest))
+                if latest is None or parsed >= latest[0]:
+                    latest = (parsed, timestamp)
+                if digest in seen or (position is not None and parsed < position):
+                    continue
+                new_lines.append(line if timestamps else message)
+
+            if latest is not None:
+                second = latest[0][0]
+                cursor = {
+                    'time': latest[1],
+                    'seen': [digest for parsed, digest in digests if parsed[0] == second],
+                }
+            if cursor is not None:
+                cursor['used'] = time.time()
+                self.cursors[cursor_id] = cursor
+
+        return u'\n'.join(new_lines)
+
+    def save(self):
+        """
+        Writes the positions to the file, replacing it atomically.
+        """
+        with self.lock:
+            cutoff = time.time() - self.retention_seconds
+            self.cursors = dict((k, v) for k, v in self.cursors.items() if v.get('used', 0) >= cutoff)
+            state = {'version': _CURSORS_VERSION, 'cursors': self.cursors}
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.log-cursors')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self.path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
@@ -1,9 +1,13 @@
 from __future__ import absolute_import
 
+import copy
+
 import six
 
 from six.moves import range
 
+from . import jsoncodec
+
 
 class OpenShiftPythonException(Exception):
 
@@ -113,6 +117,119 @@ def to_model_or_val(v, case_insensitive=False):
         return v
 
 
+def _adopt(parent, key, v):
+    """
+    Links a Model or ListModel into its parent so that mutations within it can be recorded
+    at the root of the tree. A Model or ListModel which already belongs to a different position
+    in a tree (e.g. m.b = m.a) is copied rather than moved, so that the two positions do not share
+    their content or the record of their mutations.
+    """
+    if isinstance(v, (Model, ListModel)):
+        current_parent, current_key = v._parent_link()
+        if current_parent is not None and (current_parent is not parent or current_key != key):
+            v = copy.deepcopy(v)
+        v._set_parent(parent, key)
+    return v
+
+
+def _copy_primitive(v):
+    """
+    :return: Returns a deep copy of a structure of dicts, lists and primitive values as plain dicts and lists.
+    """
+    if isinstance(v, dict):
+        return {k: _copy_primitive(e) for k, e in six.iteritems(v)}
+    if isinstance(v, list):
+        return [_copy_primitive(e) for e in v]
+    return v
+
+
+def _primitive_view(v):
+    """
+    :return: Returns the cached primitive form of a Model or ListModel, or a plain copy of any other value.
+    """
+    if isinstance(v, (Model, ListModel)):
+        return v._primitive_view()
+    return _copy_primitive(v)
+
+
+def _prepare_mutation(node):
+    """
+    Must be called before node is modified. The first time a tree is modified, the root keeps a
+    snapshot of its unmodified content from which merge patches are computed.
+    """
+    while True:
+        parent, _ = node._parent_link()
+        if parent is None:
+            node._snapshot_original()
+            return
+        node = parent
+
+
+def _merge_diff(original, current):
+    """
+    Compares two structures of dicts, lists and primitive values. Unmodified values which are shared
+    between the structures (e.g. cached primitive views) are recognized without being compared.
+    :return: (changed, patch) where patch is the JSON merge patch (RFC 7386) which transforms original
+        into current. Keys present in original but not in current are represented by None. Lists are
+        replaced wholesale.
+    """
+    if original is current:
+        return False, None
+    if isinstance(original, dict) and isinstance(current, dict):
+        patch = {}
+        for k, v in six.iteritems(current):
+            if k not in original:
+                patch[k] = _copy_primitive(v)
+                continue
+            changed, value = _merge_diff(original[k], v)
+            if changed:
+                patch[k] = value
+        for k in original:
+            if k not in current:
+                patch[k] = None
+        return bool(patch), patch
+    if type(original) == type(current) and original == current:
+        return False, None
+    return True, _copy_primitive(current)
+
+
+def _record_mutation(node, path):
+    """
+    Records that the specified path, relative to node, has been modified. The path is
+    recorded by the root of the tree containing node. Lists are always replaced wholesale
+    by merge patches, so a mutation anywhere within a list is recorded as a change to the
+    list itself. Cached primitive forms of node and its ancestors are discarded.
+    """
+    while True:
+        node._invalidate()
+        parent, key = node._parent_link()
+        if parent is None:
+            node._record_dirty(path)
+            return
+        if isinstance(parent, ListModel):
+            path = ()
+        else:
+            path = (key,) + path
+        node = parent
+
+
+def _minimal_paths(paths):
+    """
+    :return: Returns the sorted list of paths which are not nested within another of the paths.
+    """
+    paths = sorted(paths)
+    minimal = []
+    for path in paths:
+        if minimal and path[:len(minimal[-1])] == minimal[-1]:
+            continue
+        minimal.append(path)
+    return minimal
+
+
+def _json_pointer(path):
+    return ''.join(['/' + '{}'.format(e).replace('~', '~0').replace('/', '~1') for e in path])
+
+
 def _element_can_match(master, test, case_insensitive=False):
     if master is Missing:
         return False
@@ -179,14 +296,122 @@ class ListModel(list):
     def __init__(self, list_to_model, case_insensitive=False):
         super(ListModel, self).__init__()
         self.__case_insensitive = case_insensitive
+        self.__parent = None
+        self.__key = None
+        self.__dirty = set()
+        self.__cache = {}
+        self.__original = None
         if list_to_model is not None:
-            self.extend(list_to_model)
+            super(ListModel, self).extend([_adopt(self, None, v) for v in list_to_model])
+
+    def __reduce_ex__(self, protocol):
+        # Copies are detached from any parent and start without recorded modifications
+        return self.__class__, (self._primitive(), self.__case_insensitive)
+
+    def _set_parent(self, parent, key):
+        self.__parent = parent
+        self.__key = key
+
+    def _parent_link(self):
+        return self.__parent, self.__key
+
+    def _record_dirty(self, path):
+        self.__dirty.add(path)
+
+    def _dirty_paths(self):
+        """
+        :return: Returns the minimal sorted list of paths (tuples of keys) modified since this
+            model was created or _clear_dirty() was last called. An empty tuple indicates the list itself.
+        """
+        return _minimal_paths(self.__dirty)
+
+    def _clear_dirty(self):
+        self.__dirty.clear()
+        self.__original = None
+
+    def _snapshot_original(self):
+        if self.__original is None:
+            self.__original = self._primitive_view()
 
     def __setitem__(self, key, value):
-        super(self.__class__, self).__setitem__(key, value)
+        _prepare_mutation(self)
+        if isinstance(key, slice):
+            value = [_adopt(self, None, v) for v in value]
+        else:
+            value = _adopt(self, None, value)
+        super(ListModel, self).__setitem__(key, value)
+        _record_mutation(self, ())
 
     def __delitem__(self, key):
-        super(self.__class__, self).__delitem__(key)
+        _prepare_mutation(self)
+        super(ListModel, self).__delitem__(key)
+        _record_mutation(self, ())
+
+    # Python 2 implements slice assignment and deletion with these methods
+    def __setslice__(self, i, j, values):
+        self.__setitem__(slice(i, j), values)
+
+    def __delslice__(self, i, j):
+        self.__delitem__(slice(i, j))
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, n):
+        _prepare_mutation(self)
+        values = list(super(ListModel, self).__iter__())
+        super(ListModel, self).__delitem__(slice(None))
+        for _ in range(n):
+            # Repeated elements are copies, so that they can be modified independently
+            super(ListModel, self).extend([copy.deepcopy(v) if isinstance(v, (Model, ListModel)) else v
+                                           for v in values])
+        for v in super(ListModel, self).__iter__():
+            if isinstance(v, (Model, ListModel)):
+                v._set_parent(self, None)
+        _record_mutation(self, ())
+        return self
+
+    def append(self, value):
+        _prepare_mutation(self)
+        super(ListModel, self).append(_adopt(self, None, value))
+        _record_mutation(self, ())
+
+    def extend(self, values):
+        _prepare_mutation(self)
+        super(ListModel, self).extend([_adopt(self, None, v) for v in values])
+        _record_mutation(self, ())
+
+    def insert(self, index, value):
+        _prepare_mutation(self)
+        super(ListModel, self).insert(index, _adopt(self, None, value))
+        _record_mutation(self, ())
+
+    def pop(self, *args):
+        _prepare_mutation(self)
+        v = super(ListModel, self).pop(*args)
+        _record_mutation(self, ())
+        return v
+
+    def remove(self, value):
+        _prepare_mutation(self)
+        super(ListModel, self).remove(value)
+        _record_mutation(self, ())
+
+    def clear(self):
+        _prepare_mutation(self)
+        super(ListModel, self).__delitem__(slice(None))
+        _record_mutation(self, ())
+
+    def sort(self, *args, **kwargs):
+        _prepare_mutation(self)
+        super(ListModel, self).sort(*args, **kwargs)
+        _record_mutation(self, ())
+
+    def reverse(self):
+        _prepare_mutation(self)
+        super(ListModel, self).reverse()
+        _record_mutation(self, ())
 
     def __getitem__(self, index):
         if super(self.__class__, self).__len__() > index:
@@ -194,7 +419,8 @@ class ListModel(list):
             if isinstance(v, Model):
                 return v
             v = to_model_or_val(v, case_insensitive=self.__case_insensitive)
-            self.__setitem__(index, v)
+            # Converting an element does not change its content, so it is not recorded as a mutation
+            super(ListModel, self).__setitem__(index, _adopt(self, None, v))
             return v
 
         # Otherwise, trigger out of bounds exception
@@ -204,17 +430,27 @@ class ListModel(list):
         for i in range(0, super(self.__class__, self).__len__()):
             yield self[i]
 
+    def _invalidate(self):
+        self.__cache.clear()
+
+    def _primitive_view(self):
+        """
+        :return: Returns a cached python list representation of the ListModel. The list is shared
+            and must not be modified.
+        :rtype: list
+        """
+        view = self.__cache.get('primitive')
+        if view is None:
+            view = [_primitive_view(e) for e in super(ListModel, self).__iter__()]
+            self.__cache['primitive'] = view
+        return view
+
     def _primitive(self):
         """
         :return: Returns the ListModel as a python list
         :rtype: list
         """
-        l = []
-        for e in self:
-            if isinstance(e, Model) or isinstance(e, ListModel):
-                e = e._primitive()
-            l.append(e)
-        return l
+        return _copy_primitive(self._primitive_view())
 
     def can_match(self, list_or_entry):
         """
@@ -238,12 +474,107 @@ class Model(dict):
         super(Model, self).__init__()
 
         self.__case_insensitive = case_insensitive
+        self.__parent = None
+        self.__key = None
+        self.__dirty = set()
+        self.__cache = {}
+        self.__original = None
+        self.__server_state = False
 
         if dict_to_model is not None:
             for k, v in dict_to_model.items():
                 if self.__case_insensitive:
                     k = k.lower()
-                self[k] = to_model_or_val(v, case_insensitive=case_insensitive)
+                super(Model, self).__setitem__(k, _adopt(self, k, to_model_or_val(v, case_insensitive=case_insensitive)))
+
+    def __reduce_ex__(self, protocol):
+        # Copies are detached from any parent and start without recorded modifications
+        return self.__class__, (self._primitive(), self.__case_insensitive)
+
+    # Explicitly defined since attribute lookups for unknown names return Missing
+    def __copy__(self):
+        return self.__class__(self._primitive(), self.__case_insensitive)
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+    def _set_parent(self, parent, key):
+        self.__parent = parent
+        self.__key = key
+
+    def _parent_link(self):
+        return self.__parent, self.__key
+
+    def _record_dirty(self, path):
+        self.__dirty.add(path)
+
+    def _dirty_paths(self):
+        """
+        :return: Returns the minimal sorted list of paths (tuples of keys) modified since this
+            model was created or _clear_dirty() was last called. Mutations within lists are
+            reported as a change to the list.
+        """
+        return _minimal_paths(self.__dirty)
+
+    def _clear_dirty(self):
+        self.__dirty.clear()
+        self.__original = None
+
+    def _snapshot_original(self):
+        if self.__original is None:
+            self.__original = self._primitive_view()
+
+    def _mark_server_state(self):
+        """
+        Records that the unmodified content of this model is the content of an object read from
+        the server, so that modifications can be sent to the server as a patch.
+        """
+        self.__server_state = True
+
+    def _is_server_state(self):
+        return self.__server_state
+
+    def _lookup_path(self, path):
+        """
+        :return: Returns (True, value) if the path exists in the model or (False, None) if it does not.
+        """
+        v = self
+        for k in path:
+            if not isinstance(v, Model) or not super(Model, v).__contains__(k):
+                return False, None
+            v = v[k]
+        return True, v
+
+    def _merge_patch(self):
+        """
+        Builds a JSON merge patch (RFC 7386) which applies the modifications made to this model to
+        an unmodified copy. Removed keys, including keys dropped when a dict is replaced, are
+        represented by None.
+        :return: A dict representing the merge patch. The dict is empty if nothing was modified.
+        :rtype: dict
+        """
+        if self.__original is None:
+            return {}
+        _, patch = _merge_diff(self.__original, self._primitive_view())
+        return patch or {}
+
+    def _json_patch(self):
+        """
+        Builds a JSON patch (RFC 6902) which applies the modifications recorded by this
+        model to an unmodified copy.
+        :return: A list of JSON patch operations.
+        :rtype: list
+        """
+        ops = []
+        for path in self._dirty_paths():
+            exists, v = self._lookup_path(path)
+            if not exists:
+                ops.append({'op': 'remove', 'path': _json_pointer(path)})
+                continue
+            if isinstance(v, (Model, ListModel)):
+                v = v._primitive()
+            ops.append({'op': 'add', 'path': _json_pointer(path), 'value': v})
+        return ops
 
     def __getattr__(self, attr):
 
@@ -259,7 +590,8 @@ class Model(dict):
             if isinstance(v, Model) or isinstance(v, ListModel):
                 return v
             v = to_model_or_val(v, self.__case_insensitive)
-            self.__setattr__(attr, v)
+            # Converting a value does not change its content, so it is not recorded as a mutation
+            super(Model, self).__setitem__(attr, _adopt(self, attr, v))
             return v
         else:
             return Missing
@@ -277,24 +609,99 @@ class Model(dict):
         return self.__getattr__(key)
 
     def __setitem__(self, key, value):
-        super(Model, self).__setitem__(key, to_model_or_val(value, case_insensitive=self.__case_insensitive))
+        _prepare_mutation(self)
+        value = to_model_or_val(value, case_insensitive=self.__case_insensitive)
+        super(Model, self).__setitem__(key, _adopt(self, key, value))
+        _record_mutation(self, (key,))
 
     def __delitem__(self, key):
-        if self.__is_case_sensitive__():
+        if self.__case_insensitive:
             key = key.lower()
+        _prepare_mutation(self)
         super(Model, self).__delitem__(key)
+        _record_mutation(self, (key,))
+
+    def __delattr__(self, key):
+        if key.startswith('_Model__'):
+            return super(Model, self).__delattr__(key)
+        self.__delitem__(key)
+
+    def update(self, *args, **kwargs):
+        for k, v in six.iteritems(dict(*args, **kwargs)):
+            if self.__case_insensitive:
+                k = k.lower()
+            self[k] = v
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, key, default=None):
+        if not super(Model, self).__contains__(key):
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *args):
+        if not super(Model, self).__contains__(key):
+            return super(Model, self).pop(key, *args)
+        _prepare_mutation(self)
+        v = super(Model, self).pop(key)
+        _record_mutation(self, (key,))
+        return v
+
+    def popitem(self):
+        _prepare_mutation(self)
+        k, v = super(Model, self).popitem()
+        _record_mutation(self, (k,))
+        return k, v
+
+    def clear(self):
+        _prepare_mutation(self)
+        keys = list(self.keys())
+        super(Model, self).clear()
+        for k in keys:
+            _record_mutation(self, (k,))
+
+    def _invalidate(self):
+        self.__cache.clear()
+
+    def _primitive_view(self):
+        """
+        :return: Returns a cached python dict representation of the Model. The dict is shared
+            and must not be modified; use _primitive() to obtain a copy which can be.
+        :rtype: dict
+        """
+        view = self.__cache.get('primitive')
+        if view is None:
+            view = {k: _primitive_view(v) for k, v in six.iteritems(self)}
+            self.__cache['primitive'] = view
+        return view
 
     def _primitive(self):
         """
         :return: Returns the Model as a python dict
         :rtype: dict
         """
-        d = {}
-        for k, v in six.iteritems(self):
-            if isinstance(v, Model) or isinstance(v, ListModel):
-                v = v._primitive()
-            d[k] = v
-        return d
+        return _copy_primitive(self._primitive_view())
+
+    def _json(self, indent=None):
+        """
+        Serializes the Model. If the JSON codec supports it, the Model is encoded directly,
+        without building an intermediate dict. The result is cached until the Model is modified.
+        :param indent: The indent to use, or None for compact output.
+        :return: Returns the JSON representation of the Model.
+        :rtype: str
+        """
+        key = ('json', indent)
+        encoded = self.__cache.get(key)
+        if encoded is None:
+            if indent in getattr(jsoncodec.get_json_codec(), 'native_indents', ()):
+                encoded = jsoncodec.dumps(self, indent=indent)
+            else:
+                # The json module iterates ListModels through __iter__, which is much slower
+                encoded = jsoncodec.dumps(self._primitive_view(), indent=indent)
+            self.__cache[key] = encoded
+        return encoded
 
     def can_match(self, val):
         """
@@ -118,6 +118,55 @@ def normalize_kinds(kinds):
     return normalized
 
 
+def get_api_resource(kind):
+    """
+    Finds the APIResource openshift-client-python knows for a kind (see update_api_resources).
+    :param kind: A kind, shortname, plural, or group qualified kind/plural (e.g. 'deployment.apps').
+    :return: Returns the APIResource or None if the kind is not known.
+    """
+    kind = kind.strip().lower()
+
+    if '.' in kind:
+        if kind in _api_resource_lookup:
+            return _api_resource_lookup[kind]
+        k, group = kind.split('.', 1)
+        for api_resource in _api_resources:
+            if api_resource.group == group and k in (api_resource.kind.lower(), api_resource.name):
+                return api_resource
+        return None
+
+    api_resource = _api_resource_lookup.get(kind, None)
+    if api_resource is None and kind.endswith('s'):
+        api_resource = _api_resource_lookup.get(kind[:-1], None)
+
+    if api_resource is not None and api_resource.group:
+        # Like oc, prefer the core group when a kind is defined in several groups (e.g. Event)
+        for candidate in _api_resources:
+            if not candidate.group and candidate.kind == api_resource.kind:
+                return candidate
+
+    return api_resource
+
+
+def is_known_kind(kind):
+    """
+    Answers whether a kind can be resolved using openshift-client-python's view of api resources
+    (see update_api_resources). Group qualified kinds (e.g. 'deployment.apps') are never considered
+    known since normalize_kind passes them through untouched.
+    :param kind: A kind, shortname, or plural (e.g. 'po', 'pods', 'Pod').
+    :return: Returns True if the kind is known.
+    """
+    kind = kind.strip().lower()
+
+    if '.' in kind:
+        return False
+
+    if kind in _api_resource_lookup:
+        return True
+
+    return kind.endswith('s') and kind[:-1] in _api_resource_lookup
+
+
 def kind_matches(k1, k2_or_list):
     k1 = normalize_kind(k1)
 
@@ -140,10 +189,14 @@ def qname_matches(qn1, qn2_or_list):
     if isinstance(qn2_or_list, six.string_types):
         qn2_or_list = [qn2_or_list]
 
-    _, kind1, name1 = split_fqn(qn1)
+    ns1, kind1, name1 = split_fqn(qn1)
 
     for qn2e in qn2_or_list:
-        _, kind2, name2 = split_fqn(qn2e)
+        ns2, kind2, name2 = split_fqn(qn2e)
+
+        # Namespaces are only compared if both names are namespace qualified (ns:kind/name)
+        if ns1 and ns2 and ns1 != ns2:
+            continue
 
         if name1 == name2 and kind_matches(kind1, kind2):
             return True
@@ -172,7 +225,8 @@ def split_fqn(fqn, default_name=None, default_kind=None, default_namespace=None)
     """
     remainder = fqn
     ns = default_namespace
-    if ':' in remainder:
+    # Only a ':' before the kind is a namespace separator; names can contain ':' (e.g. clusterrole/system:admin)
+    if ':' in remainder.split('/', 1)[0]:
         ns_test, remainder = remainder.split(':', 1)
         if ns_test:
             ns = ns_test
@@ -0,0 +1,349 @@
+"""
+Selector set operations (union, intersect, subtract, narrow by kind) do not query the server
+when they are called. Instead, they record a tree of plan nodes. The first time the names
+selected by the resulting selector are needed, the tree is compiled into the smallest set of
+`oc get -o=name` invocations which can answer it:
+  - narrow(kind) is pushed down into the queries beneath it so that other kinds are never requested.
+  - queries which differ only by kind are merged into a single invocation (e.g. get pod,service).
+  - identical queries appearing multiple times in the tree are only executed once.
+  - narrow(where(...)) adds what it can to the --selector / --field-selector of those queries.
+"""
+
+from __future__ import absolute_import
+
+import json
+
+from .naming import is_known_kind, kind_matches, qname_matches, split_fqn
+
+
+def _kind_of(qname):
+    return split_fqn(qname)[1]
+
+
+def _freeze(d):
+    if d is None:
+        return None
+    return json.dumps(d, sort_keys=True, default=sorted)
+
+
+def _can_merge(kinds):
+    # A merged query splits its output back up by kind. That is only reliable when every
+    # kind can be resolved locally (e.g. not 'all' or an unknown CRD shortname).
+    for kind in kinds:
+        if not is_known_kind(kind):
+            return False
+    return True
+
+
+class PlanNode(object):
+
+    def queries(self):
+        """
+        :return: Returns a list of all QueryNodes in this subtree.
+        """
+        return []
+
+    def evaluate(self, results):
+        """
+        :param results: A dict mapping each QueryNode in the tree to the qnames it selected.
+        :return: Returns the list of qnames selected by this node.
+        """
+        raise NotImplementedError()
+
+    def explain_lines(self, query_ids, indent):
+        raise NotImplementedError()
+
+
+class StaticNode(PlanNode):
+
+    def __init__(self, qnames):
+        self.qnames = list(qnames)
+
+    def evaluate(self, results):
+        return list(self.qnames)
+
+    def explain_lines(self, query_ids, indent):
+        return ['{}static: {} name(s)'.format(indent, len(self.qnames))]
+
+
+class QueryNode(PlanNode):
+
+    def __init__(self, context, kinds, labels=None, field_selectors=None, all_namespaces=False):
+        self.context = context
+        self.kinds = list(kinds)
+        self.labels = labels
+        self.field_selectors = field_selectors
+        self.all_namespaces = all_namespaces
+
+    def with_kinds(self, kinds):
+        return QueryNode(self.context, kinds, labels=self.labels, field_selectors=self.field_selectors,
+                         all_namespaces=self.all_namespaces)
+
+    def group_key(self):
+        """
+        :return: QueryNodes with the same group key can be answered by a single invocation.
+        """
+        key = (id(self.context), self.all_namespaces, _freeze(self.labels), _freeze(self.field_selectors))
+        if not _can_merge(self.kinds):
+            # Not mergeable with other kinds, but identical queries can still share an invocation.
+            key += (tuple(self.kinds),)
+        return key
+
+    def queries(self):
+        return [self]
+
+    def evaluate(self, results):
+        return list(results[self])
+
+    def explain_lines(self, query_ids, indent):
+        return ['{}query #{}: {}'.format(indent, query_ids[self], ','.join(self.kinds))]
+
+
+class UnionNode(PlanNode):
+
+    def __init__(self, children):
+        self.children = children
+
+    def queries(self):
+        return [q for child in self.children for q in child.queries()]
+
+    def evaluate(self, results):
+        new_set = self.children[0].evaluate(results)
+        for child in self.children[1:]:
+            for qname in child.evaluate(results):
+                # Only add if not already in the union
+                if not qname_matches(qname, new_set):
+                    new_set.append(qname)
+        return new_set
+
+    def explain_lines(self, query_ids, indent):
+        lines = ['{}union'.format(indent)]
+        for child in self.children:
+            lines.extend(child.explain_lines(query_ids, indent + '  '))
+        return lines
+
+
+class IntersectNode(PlanNode):
+
+    def __init__(self, base, others):
+        self.base = base
+        self.others = others
+
+    def queries(self):
+        return self.base.queries() + [q for other in self.others for q in other.queries()]
+
+    def evaluate(self, results):
+        new_set = self.base.evaluate(results)
+        for other in self.others:
+            to_intersect = other.evaluate(results)
+            new_set = [qname for qname in new_set if qname_matches(qname, to_intersect)]
+        return new_set
+
+    def explain_lines(self, query_ids, indent):
+        lines = ['{}intersect'.format(indent)]
+        lines.extend(self.base.explain_lines(query_ids, indent + '  '))
+        for other in self.others:
+            lines.extend(other.explain_lines(query_ids, indent + '  '))
+        return lines
+
+
+class SubtractNode(PlanNode):
+
+    def __init__(self, base, other):
+        self.base = base
+        self.other = other
+
+    def queries(self):
+        return self.base.queries() + self.other.queries()
+
+    def evaluate(self, results):
+        to_subtract = self.other.evaluate(results)
+        return [qname for qname in self.base.evaluate(results) if not qname_matches(qname, to_subtract)]
+
+    def explain_lines(self, query_ids, indent):
+        lines = ['{}subtract'.format(indent)]
+        lines.extend(self.base.explain_lines(query_ids, indent + '  '))
+        lines.extend(self.other.explain_lines(query_ids, indent + '  '))
+        return lines
+
+
+class KindFilterNode(PlanNode):
+
+    def __init__(self, child, kind):
+        self.child = child
+        self.kind = kind
+
+    def queries(self):
+        return self.child.queries()
+
+    def evaluate(self, results):
+        return [n for n in self.child.evaluate(results) if kind_matches(_kind_of(n), self.kind)]
+
+    def explain_lines(self, query_ids, indent):
+        lines = ['{}narrow: {}'.format(indent, self.kind)]
+        lines.extend(self.child.explain_lines(query_ids, indent + '  '))
+        return lines
+
+
+def narrow_kind(node, kind):
+    """
+    Returns a plan node which selects only the names of the specified (normalized) kind
+    selected by node. Where possible, the kind is pushed down into the underlying queries
+    rather than filtering their output.
+    """
+
+    if isinstance(node, StaticNode):
+        return StaticNode(KindFilterNode(node, kind).evaluate({}))
+
+    if isinstance(node, QueryNode):
+        if not _can_merge(node.kinds):
+            return KindFilterNode(node, kind)
+        # Kinds match with or without a group (e.g. deployment and deployment.apps). The more specific
+        # of the two is queried.
+        kinds = [kind if kind.startswith(k + '.') else k for k in node.kinds if kind_matches(k, kind)]
+        if not kinds:
+            if not is_known_kind(kind):
+                # e.g. a CRD which the server may know by a name other than the query's kinds
+                return KindFilterNode(node, kind)
+            # The query could never select this kind; no need to ask the server.
+            return StaticNode([])
+        return node.with_kinds(kinds)
+
+    if isinstance(node, UnionNode):
+        return UnionNode([narrow_kind(child, kind) for child in node.children])
+
+    # The results of these operations are subsets of their base
+    if isinstance(node, IntersectNode):
+        return IntersectNode(narrow_kind(node.base, kind), node.others)
+
+    if isinstance(node, SubtractNode):
+        return SubtractNode(narrow_kind(node.base, kind), node.other)
+
+    return KindFilterNode(node, kind)
+
+
+def narrow_predicate(node, predicate):
+    """
+    Pushes the parts of a predicates.Where which the server can evaluate into the queries
+    beneath node.
+    :return: Returns (node, complete). complete is True if every name selected by the returned
+        node is known to satisfy the predicate without evaluating it client side.
+    """
+
+    if isinstance(node, StaticNode):
+        return node, not node.qnames
+
+    if isinstance(node, QueryNode):
+        labels, field_selectors, residual = predicate.split(node.kinds, node.labels, node.field_selectors)
+        return QueryNode(node.context, node.kinds, labels=labels, field_selectors=field_selectors,
+                         all_namespaces=node.all_namespaces), not residual
+
+    if isinstance(node, UnionNode):
+        children = []
+        complete = True
+        for child in node.children:
+            child, child_complete = narrow_predicate(child, predicate)
+            children.append(child)
+            complete = complete and child_complete
+        return UnionNode(children), complete
+
+    if isinstance(node, IntersectNode):
+        base, complete = narrow_predicate(node.base, predicate)
+        return IntersectNode(base, node.others), complete
+
+    if isinstance(node, SubtractNode):
+        base, complete = narrow_predicate(node.base, predicate)
+        return SubtractNode(base, node.other), complete
+
+    if isinstance(node, KindFilterNode):
+        child, complete = narrow_predicate(node.child, predicate)
+        return KindFilterNode(child, node.kind), complete
+
+    return node, False
+
+
+class CompiledQuery(object):
+
+    def __init__(self, node):
+        self.context = node.context
+        self.labels = node.labels
+        self.field_selectors = node.field_selectors
+        self.all_namespaces = node.all_namespaces
+        self.kinds = []
+        self.nodes = []
+
+    def add(self, node):
+        self.nodes.append(node)
+        for kind in node.kinds:
+            if kind not in self.kinds:
+                self.kinds.append(kind)
+
+    def selector(self):
+        # Imported here to avoid a circular import
+        from .selector import Selector
+        return Selector('plan', self.kinds, labels=self.labels, field_selectors=self.field_selectors,
+                        all_namespaces=self.all_namespaces, static_context=self.context)
+
+    def split(self, qnames):
+        """
+        Splits the output of this query back into the names selected by each node it answers.
+        :return: dict of QueryNode -> list<qname>
+        """
+        results = {}
+        for node in self.nodes:
+            if node.kinds == self.kinds:
+                results[node] = list(qnames)
+                continue
+
+            # Reassemble in the order the node's own query would have returned them (by kind).
+            selected = []
+            seen = set()
+            for kind in node.kinds:
+                for n in qnames:
+                    if n not in seen and kind_matches(_kind_of(n), kind):
+                        seen.add(n)
+                        selected.append(n)
+            results[node] = selected
+        return results
+
+
+class Plan(object):
+
+    def __init__(self, root):
+        self.root = root
+        self.compiled = []
+        groups = {}
+        for node in root.queries():
+            key = node.group_key()
+            if key not in groups:
+                groups[key] = CompiledQuery(node)
+                self.compiled.append(groups[key])
+            groups[key].add(node)
+
+    def query_ids(self):
+        ids = {}
+        for i, compiled in enumerate(self.compiled):
+            for node in compiled.nodes:
+                ids[node] = i + 1
+        return ids
+
+    def execute(self):
+        """
+        Runs the compiled queries and evaluates the plan tree.
+        :return: Returns the list of qnames selected by the plan.
+        """
+        results = {}
+        for compiled in self.compiled:
+            results.update(compiled.split(compiled.selector()._query_names()))
+        return self.root.evaluate(results)
+
+    def explain(self):
+        query_ids = self.query_ids()
+        lines = self.root.explain_lines(query_ids, '')
+        lines.append('oc invocations: {}'.format(len(self.compiled)))
+        for i, compiled in enumerate(self.compiled):
+            args = ['get', '-o=name'] + compiled.selector()._selection_args()
+            if compiled.all_namespaces:
+                args.append('--all-namespaces')
+            lines.append('  #{}: {}'.format(i + 1, ' '.join(args)))
+        return '\n'.join(lines)
@@ -0,0 +1,288 @@
+"""
+Declarative predicates for narrowing selectors. Unlike an arbitrary callable, a predicate built with
+where(), label() and field() can be compiled into --selector / --field-selector arguments so that the
+server performs the filtering:
+
+    oc.selector('pods', all_namespaces=True).narrow(
+        oc.where(oc.label('app') == 'x', oc.field('status.phase') != 'Running'))
+
+Parts of a predicate which the server cannot evaluate are evaluated against the selected objects
+in Python instead.
+"""
+
+from __future__ import absolute_import
+
+from .model import Missing
+
+# Fields supported by --field-selector for any kind.
+_universal_field_selectors = ('metadata.name', 'metadata.namespace')
+
+# Additional fields supported by --field-selector for specific (normalized) kinds.
+_kind_field_selectors = {
+    'pod': ('spec.nodeName', 'spec.restartPolicy', 'spec.schedulerName', 'spec.serviceAccountName',
+            'status.phase', 'status.podIP', 'status.nominatedNodeName'),
+    'event': ('involvedObject.kind', 'involvedObject.namespace', 'involvedObject.name', 'involvedObject.uid',
+              'involvedObject.apiVersion', 'involvedObject.resourceVersion', 'involvedObject.fieldPath',
+              'reason', 'reportingComponent', 'source', 'type'),
+    'secret': ('type',),
+    'namespace': ('status.phase',),
+    'node': ('spec.unschedulable',),
+    'replicaset': ('status.replicas',),
+    'replicationcontroller': ('status.replicas',),
+    'job': ('status.successful',),
+}
+
+
+def _supports_field_selector(kinds, path):
+    if path in _universal_field_selectors:
+        return True
+    for kind in kinds:
+        if path not in _kind_field_selectors.get(kind, ()):
+            return False
+    return True
+
+
+def _render(v):
+    if isinstance(v, bool):  # booleans in json/yaml need to be lowercase
+        return '{}'.format(v).lower()
+    return '{}'.format(v)
+
+
+class Predicate(object):
+
+    def matches(self, apiobj):
+        """
+        :param apiobj: The APIObject to test.
+        :return: Returns True if the object satisfies this predicate.
+        """
+        raise NotImplementedError()
+
+    def push(self, kinds, labels, field_selectors):
+        """
+        Attempts to express this predicate as part of a query's label or field selectors.
+        :param kinds: The normalized kinds the query selects.
+        :param labels: A labels dict (in the format accepted by selector()) which will be updated in place.
+        :param field_selectors: A field_selectors dict which will be updated in place.
+        :return: Returns True if the predicate was added to the selectors; False if it must be evaluated
+            client side.
+        """
+        return False
+
+    def __call__(self, apiobj):
+        return self.matches(apiobj)
+
+    def __and__(self, other):
+        return where(self, other)
+
+
+class LabelPredicate(Predicate):
+
+    def __init__(self, name, op, value=None):
+        self.name = name
+        self.op = op
+        self.value = value
+
+    def matches(self, apiobj):
+        v = apiobj.get_label(self.name)
+        if self.op == '==':
+            return v is not None and v == _render(self.value)
+        if self.op == '!=':
+            return v is None or v != _render(self.value)
+        if self.op == 'in':
+            return v is not None and v in [_render(e) for e in self.value]
+        if self.op == 'notin':
+            return v is None or v not in [_render(e) for e in self.value]
+        if self.op == 'exists':
+            return v is not None
+        return v is None  # absent
+
+    def push(self, kinds, labels, field_selectors):
+        if self.op == '==':
+            key, value = self.name, _render(self.value)
+        elif self.op == '!=':
+            key, value = '!' + self.name, _render(self.value)
+        elif self.op == 'in':
+            key, value = self.name, [_render(e) for e in self.value]
+        elif self.op == 'notin':
+            key, value = '!' + self.name, [_render(e) for e in self.value]
+        elif self.op == 'exists':
+            key, value = '!' + self.name, None
+        else:
+            key, value = self.name, None
+
+        if key in labels:
+            # The labels dict can only express one requirement per key
+            return False
+
+        labels[key] = value
+        return True
+
+    def __repr__(self):
+        if self.op in ('exists', 'absent'):
+            return 'label({!r}).{}()'.format(self.name, self.op)
+        return 'label({!r}) {} {!r}'.format(self.name, self.op, self.value)
+
+
+class FieldPredicate(Predicate):
+
+    def __init__(self, path, op, value):
+        self.path = path
+        self.op = op
+        self.value = value
+
+    def _field_value(self, apiobj):
+        v = apiobj.model
+        for e in self.path.split('.'):
+            v = v[e]
+            if v is Missing:
+                return None
+        return v
+
+    def matches(self, apiobj):
+        v = self._field_value(apiobj)
+        # Like the server, compare string forms and treat absent fields as empty
+        equal = _render(v if v is not None else '') == _render(self.value)
+        if self.op == '==':
+            return equal
+        return not equal
+
+    def push(self, kinds, labels, field_selectors):
+        if not _supports_field_selector(kinds, self.path):
+            return False
+
+        key = self.path if self.op == '==' else '!' + self.path
+        if key in field_selectors:
+            return False
+
+        field_selectors[key] = _render(self.value)
+        return True
+
+    def __repr__(self):
+        return 'field({!r}) {} {!r}'.format(self.path, self.op, self.value)
+
+
+class Where(Predicate):
+
+    def __init__(self, predicates):
+        self.predicates = predicates
+
+    def matches(self, apiobj):
+        for p in self.predicates:
+            if not p.matches(apiobj):
+                return False
+        return True
+
+    def split(self, kinds, labels, field_selectors):
+        """
+        Separates the parts of this predicate which can be evaluated by the server from those
+        which cannot.
+        :param kinds: The normalized kinds the query selects.
+        :param labels: The labels dict of the query (may be None). It is not modified.
+        :param field_selectors: The field_selectors dict of the query (may be None). It is not modified.
+        :return: Returns (labels, field_selectors, residual) where labels and field_selectors are new
+            dicts which include everything that could be pushed down and residual is a list of predicates
+            which must be evaluated client side.
+        """
+        labels = dict(labels or {})
+        field_selectors = dict(field_selectors or {})
+        residual = []
+        for p in self.predicates:
+            if isinstance(p, Where):
+                labels, field_selectors, r = p.split(kinds, labels, field_selectors)
+                residual.extend(r)
+            elif not p.push(kinds, labels, field_selectors):
+                residual.append(p)
+        return labels or None, field_selectors or None, residual
+
+    def __repr__(self):
+        return 'where({})'.format(', '.join([repr(p) for p in self.predicates]))
+
+
+class _LabelRef(object):
+
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, value):
+        if value is None:
+            return self.absent()
+        return LabelPredicate(self.name, '==', value)
+
+    def __ne__(self, value):
+        if value is None:
+            return self.exists()
+        return LabelPredicate(self.name, '!=', value)
+
+    def __hash__(self):
+        return hash(('label', self.name))
+
+    def in_(self, values):
+        """
+        :return: A predicate requiring the label to be present with one of the specified values.
+        """
+        return LabelPredicate(self.name, 'in', list(values))
+
+    def not_in(self, values):
+        """
+        :return: A predicate requiring the label to be absent or have a value not in the values specified.
+        """
+        return LabelPredicate(self.name, 'notin', list(values))
+
+    def exists(self):
+        return LabelPredicate(self.name, 'exists')
+
+    def absent(self):
+        return LabelPredicate(self.name, 'absent')
+
+
+class _FieldRef(object):
+
+    def __init__(self, path):
+        self.path = path
+
+    def __eq__(self, value):
+        return FieldPredicate(self.path, '==', value)
+
+    def __ne__(self, value):
+        return FieldPredicate(self.path, '!=', value)
+
+    def __hash__(self):
+        return hash(('field', self.path))
+
+
+def label(name):
+    """
+    label('app') == 'x'
+    label('app') != 'x'
+    label('app').in_(['x', 'y'])
+    label('app').not_in(['x', 'y'])
+    label('app').exists()
+    label('app').absent()
+    :param name: The name of an object label.
+    :return: A reference which can be compared to build a predicate for where().
+    """
+    return _LabelRef(name)
+
+
+def field(path):
+    """
+    field('status.phase') == 'Running'
+    field('spec.nodeName') != ''
+    :param path: A dotted path into the object (e.g. 'status.phase'). Absent fields compare as ''.
+    :return: A reference which can be compared to build a predicate for where().
+    """
+    return _FieldRef(path)
+
+
+def where(*predicates):
+    """
+    Combines predicates (AND logic is applied) into a predicate which can be passed to Selector.narrow.
+    :param predicates: Predicates built with label() and field().
+    :return: A Where predicate. It is also a callable accepting an APIObject.
+    """
+    flat = []
+    for p in predicates:
+        if not isinstance(p, Predicate):
+            raise ValueError('Expected predicate built with label() or field(); found: {}'.format(p))
+        flat.append(p)
+    return Where(flat)
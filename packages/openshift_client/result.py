@@ -32,8 +32,9 @@ class Result(object):
     def out(self):
         s = u''
         for action in self.__actions:
-            if action.out:
-                s += action.out
+            out = action.out  # may be read from disk
+            if out:
+                s += out
                 if not s.endswith("\n"):
                     s += u'\n'
         return s
@@ -52,8 +53,9 @@ class Result(object):
     def err(self):
         s = u''
         for action in self.__actions:
-            if action.err:
-                s += action.err
+            err = action.err  # may be read from disk
+            if err:
+                s += err
                 if not s.endswith("\n"):
                     s += u'\n'
         return s
@@ -1,27 +1,231 @@
 from __future__ import absolute_import
 
+import base64
+import collections
 import json
+import re
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from six.moves.urllib.parse import urlencode
 
 from .result import Result
-from .naming import normalize_kinds, normalize_kind, qname_matches
+from .naming import normalize_kinds, normalize_kind, qname_matches, get_api_resource, kind_matches, split_fqn
 from .model import *
 from .util import split_names, is_collection_type
 from .action import oc_action
-from .context import cur_context
+from .context import cur_context, context, parallel_map, bind_context
+from .planner import Plan, QueryNode, StaticNode, UnionNode, IntersectNode, SubtractNode, narrow_kind, \
+    narrow_predicate
+from .predicates import Predicate, Where, where
 from . import util
+from . import jsoncodec
+from . import logstream
+
+
+def _split_namespace(qname):
+    """
+    :param qname: A qualified name (kind/name) or namespace qualified name (namespace:kind/name)
+    :return: Returns (namespace, kind/name). namespace is None if qname is not namespace qualified.
+    """
+    if ':' in qname.split('/', 1)[0]:
+        ns, qname = qname.split(':', 1)
+        return ns or None, qname
+    return None, qname
 
 
 def _normalize_object_list(ol):
     new_ol = []
     for qname in ol:
-        kind, name = str(qname).split("/")
+        ns, qname = _split_namespace(str(qname))
+        kind, name = qname.split("/")
         kind = normalize_kind(kind)
-        new_ol.append('{}/{}'.format(kind, name))
+        if ns:
+            new_ol.append('{}:{}/{}'.format(ns, kind, name))
+        else:
+            new_ol.append('{}/{}'.format(kind, name))
     return new_ol
 
 
+# Scalar metadata fields retrieved by Selector.metadata()
+_metadata_fields = ['name', 'namespace', 'uid', 'resourceVersion', 'generation',
+                    'creationTimestamp', 'deletionTimestamp']
+
+_metadata_paths = ['apiVersion', 'kind', 'metadata.labels', 'metadata.ownerReferences'] + \
+                  ['metadata.{}'.format(f) for f in _metadata_fields]
+
+
+# Static selectors are split into several oc invocations, run in parallel, when they select more
+# names than this or when their names would make the command line longer than _chunk_max_bytes.
+_chunk_max_names = 250
+_chunk_max_bytes = 32 * 1024
+
+
+def _chunk_names(names):
+    """
+    Splits a list of names into consecutive chunks which can each be passed on a single command line.
+    :return: A list of lists of names. Empty if names is empty.
+    """
+    chunks = []
+    chunk = []
+    size = 0
+    for name in names:
+        if chunk and (len(chunk) >= _chunk_max_names or size + len(name) + 1 > _chunk_max_bytes):
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+        chunk.append(name)
+        size += len(name) + 1
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+# oc describe output for an object begins with a line naming it. When several objects are described
+# by one invocation, their sections are separated by blank lines.
+_describe_name_line = re.compile(r'^Name:\s+(\S+)\s*$')
+
+
+def _split_describe_output(out, names):
+    """
+    Splits the output of an oc describe invocation for several objects of a single kind into the section
+    for each object.
+    :param out: The output of oc describe.
+    :param names: The names (without kind) of the objects described.
+    :return: A dict mapping each name to its section, or None if the output cannot be split unambiguously
+        (e.g. a description contains an unexpected Name: line or an object is missing from the output).
+    """
+    lines = out.split('\n')
+    starts = []
+    for i, line in enumerate(lines):
+        match = _describe_name_line.match(line)
+        if match and (i == 0 or not lines[i - 1].strip()):
+            starts.append((i, match.group(1)))
+
+    if sorted(name for _, name in starts) != sorted(set(names)):
+        return None
+
+    # Nothing may precede the first section
+    if any(line.strip() for line in lines[:starts[0][0]]):
+        return None
+
+    sections = {}
+    for (start, name), (end, _) in zip(starts, starts[1:] + [(len(lines), None)]):
+        sections[name] = '\n'.join(lines[start:end]).strip()
+    return sections
+
+
+def _context_key(ctx):
+    """
+    :return: A key which is equal for contexts that differ only in their project (e.g. the copies held by the
+        APIObjects read by a selector), so that oc can be run once on behalf of all of them.
+    """
+    key = []
+    for name, value in sorted(vars(ctx).items()):
+        if name in ('project_name', 'frame_info'):
+            continue
+        try:
+            hash(value)
+        except TypeError:
+            value = id(value)
+        key.append((name, value))
+    return tuple(key)
+
+
+def describe_objects(objs, parallelism=None):
+    """
+    Collects oc describe output for many objects. Rather than running oc describe for each object,
+    objects are grouped by kind and namespace and each group is described by a single invocation
+    (or one per chunk of names, for large groups). The output is then split into the section for
+    each object. Groups for which oc describe reports an error (e.g. an object has since been deleted)
+    or whose output cannot be split unambiguously are described again an object at a time, in parallel.
+    :param objs: A list of APIObjects. Only their names are required (see Selector.metadata()).
+    :param parallelism: The maximum number of concurrent oc invocations. Defaults to the thread's default
+        parallelism (see set_default_parallelism).
+    :return: A list of strings in the order of objs, each as returned by APIObject.describe(auto_raise=False).
+    """
+    # (context key, namespace, kind) -> {qname: [index in objs, ...]}
+    groups = collections.OrderedDict()
+    for i, obj in enumerate(objs):
+        kind, _ = obj.qname().split('/', 1)
+        key = (_context_key(obj.context), obj.namespace(if_missing=None), kind)
+        groups.setdefault(key, collections.OrderedDict()).setdefault(obj.qname(), []).append(i)
+
+    batches = []
+    for (_, namespace, _), indices in groups.items():
+        # Any of the group's contexts will do
+        ctx = objs[next(iter(indices.values()))[0]].context
+        for qnames in _chunk_names(list(indices.keys())):
+            batches.append((ctx, namespace, qnames, indices))
+
+    def describe_batch(batch):
+        ctx, namespace, qnames, _ = batch
+        r = Result('describe')
+        r.add_action(oc_action(ctx, 'describe', cmd_args=qnames, namespace=namespace))
+        if r.status() != 0:
+            return None
+        return _split_describe_output(r.out(), [qname.split('/', 1)[1] for qname in qnames])
+
+    descriptions = [None] * len(objs)
+    fallback = []
+    for (_, _, qnames, indices), sections in zip(batches, parallel_map(describe_batch, batches, parallelism)):
+        for qname in qnames:
+            if sections is None:
+                fallback.append(indices[qname])
+            else:
+                for i in indices[qname]:
+                    descriptions[i] = sections[qname.split('/', 1)[1]]
+
+    def describe_object(object_indices):
+        return objs[object_indices[0]].describe(auto_raise=False)
+
+    for object_indices, description in zip(fallback, parallel_map(describe_object, fallback, parallelism)):
+        for i in object_indices:
+            descriptions[i] = description
+
+    return descriptions
+
+
+# Selector.iter_report() collects objects in windows of this many objects. Objects in a window are described
+# together (see describe_objects()) and the windows are collected in parallel.
+_report_window = 10
+
+
+# Maps (kubeconfig, server, group) -> the preferred groupVersion discovered for the group.
+# Used to build raw list paths for Selector.pages().
+_group_versions = {}
+
+
+def _encode_continue_token(state):
+    return base64.urlsafe_b64encode(json.dumps(state, sort_keys=True).encode('utf-8')).decode('utf-8')
+
+
+def _decode_continue_token(token):
+    try:
+        return json.loads(base64.urlsafe_b64decode(token.encode('utf-8')).decode('utf-8'))
+    except (TypeError, ValueError):
+        raise ValueError('Invalid continue token: {}'.format(token))
+
+
+class SelectorPage(object):
+    """
+    A page of objects returned by Selector.pages(). Iterating a page iterates its objects.
+    """
+
+    def __init__(self, objects, continue_token):
+        # The APIObjects in this page
+        self.objects = objects
+        # Pass to Selector.pages() to resume after this page; None if this is the last page.
+        self.continue_token = continue_token
+
+    def __iter__(self):
+        return iter(self.objects)
+
+    def __len__(self):
+        return len(self.objects)
+
+
 class Selector(Result):
 
     def __init__(self, high_level_operation,
@@ -32,12 +236,14 @@ class Selector(Result):
                  object_action=None,
                  filter_func=None,
                  all_namespaces=False,
-                 static_context=None):
+                 static_context=None,
+                 plan=None):
 
         super(self.__class__, self).__init__(high_level_operation)
 
         self.context_override = static_context
-        self.object_list = object_list
+        self._plan = plan
+        self._object_list = object_list
         self.labels = labels
         self.field_selectors = field_selectors
         self.filter_func = filter_func
@@ -48,7 +254,7 @@ class Selector(Result):
             action_output = object_action.out
             self.object_list = action_output.strip().split()
 
-        if self.object_list is not None:
+        if self._object_list is not None or self._plan is not None:
             if labels or kind_or_kinds_or_qname_or_qnames:
                 raise ValueError("Kind(s)/labels cannot be specified in conjunction with object_list")
             return
@@ -99,6 +305,49 @@ class Selector(Result):
     def context(self):
         return self.context_override if self.context_override else cur_context()
 
+    @property
+    def object_list(self):
+        """
+        The list of names selected by a static selector (None for dynamic selectors). Selectors
+        created by set operations are static, but their names are not computed until first needed.
+        """
+        if self._object_list is None and self._plan is not None:
+            self._object_list = Plan(self._plan).execute()
+        return self._object_list
+
+    @object_list.setter
+    def object_list(self, value):
+        self._object_list = value
+
+    def _plan_node(self):
+        """
+        :return: Returns a plan node which selects what this receiver selects without querying the server.
+        """
+        if self._object_list is not None:
+            return StaticNode(self._object_list)
+
+        if self._plan is not None:
+            return self._plan
+
+        return QueryNode(self.context, self.kinds, labels=self.labels, field_selectors=self.field_selectors,
+                         all_namespaces=self.all_namespaces)
+
+    def _planned(self, high_level_operation, plan_node):
+        return Selector(high_level_operation,
+                        plan=plan_node,
+                        static_context=self.context,
+                        all_namespaces=self.all_namespaces)
+
+    def explain(self):
+        """
+        Describes how the names selected by this receiver will be computed: the tree of set operations
+        and the oc invocations it compiles into. Static selectors which have already computed their
+        names require no invocations.
+        :return: A human readable string. The format is subject to change.
+        """
+        node = self._plan if self._plan is not None else self._plan_node()
+        return Plan(node).explain()
+
     def _selection_args(self, needs_all=False):
 
         """
@@ -167,6 +416,93 @@ class Selector(Result):
 
         return args
 
+    def _selection_chunks(self, needs_all=False):
+        """
+        :param needs_all: Set to True to include --all
+        :return: Returns a list of (namespace, selection arguments) tuples (see _selection_args) which,
+        together, select the objects selected by this selector. namespace is None unless the arguments
+        select namespace qualified names (namespace:kind/name), which are grouped by namespace. Large
+        static selectors are split into chunks; within a namespace, chunks are consecutive. An empty
+        static selector returns an empty list.
+        """
+        if self.object_list is None:
+            return [(None, self._selection_args(needs_all=needs_all))]
+
+        groups = collections.OrderedDict()
+        for qname in self.object_list:
+            ns, qname = _split_namespace(qname)
+            groups.setdefault(ns, []).append(qname)
+
+        chunks = []
+        for ns, names in six.iteritems(groups):
+            chunks.extend([(ns, chunk) for chunk in _chunk_names(names)])
+        return chunks
+
+    def _is_multi_namespace(self):
+        """
+        :return: Returns True if this is a static selector with names from more than one namespace. Results
+            gathered from such a selector must be reordered with _restore_order.
+        """
+        if self.object_list is None:
+            return False
+        return len(set([_split_namespace(qname)[0] for qname in self.object_list])) > 1
+
+    def _restore_order(self, entries, key_func):
+        """
+        Sorts results gathered from a static selector into the order of the names in its object_list.
+        :param entries: The results to sort.
+        :param key_func: A callable returning (namespace, kind, name) for an entry.
+        :return: A new list. Entries which do not correspond to a name are placed last.
+        """
+        positions = {}
+        for i, qname in enumerate(self.object_list):
+            ns, kind, name = split_fqn(qname)
+            positions.setdefault(name, []).append((i, ns, kind))
+
+        def position(entry):
+            ns, kind, name = key_func(entry)
+            for i, candidate_ns, candidate_kind in positions.get(name, []):
+                if (candidate_ns is None or candidate_ns == ns) and kind_matches(kind, candidate_kind):
+                    return i
+            return len(self.object_list)
+
+        return sorted(entries, key=position)
+
+    def _chunked_actions(self, verb, args_func, needs_all=False, **kwargs):
+        """
+        Runs an oc verb against each chunk of the receiver's selection in parallel.
+        :param verb: The verb to execute
+        :param args_func: A callable which accepts the selection arguments of a chunk and returns the
+            arguments for its invocation.
+        :param needs_all: Set to True to include --all for dynamic selectors
+        :param kwargs: Passed along to oc_action
+        :return: A list of (namespace, Action) tuples in the order of the chunks. namespace is None unless the
+            chunk selected namespace qualified names.
+        """
+        def run(chunk):
+            ns, selection_args = chunk
+            # Names cannot be retrieved across all namespaces (e.g. oc get --all-namespaces pod/xyz)
+            all_namespaces = self.all_namespaces and self.object_list is None
+            return ns, oc_action(self.context, verb, all_namespaces=all_namespaces, namespace=ns,
+                                 cmd_args=args_func(selection_args), **kwargs)
+
+        return parallel_map(run, self._selection_chunks(needs_all=needs_all))
+
+    def _qualified_names(self, chunked_actions):
+        """
+        :return: Returns the names output (-o=name) by chunked actions, namespace qualifying those which
+            came from namespace qualified chunks.
+        """
+        names = []
+        for ns, action in chunked_actions:
+            for name in split_names(action.out):
+                names.append('{}:{}'.format(ns, name) if ns else name)
+
+        if self._is_multi_namespace():
+            names = self._restore_order(names, split_fqn)
+
+        return names
+
     def qnames(self):
         """
         :return: Returns the qualified object names (kind/name) selected by this selector. List may be empty.
@@ -207,8 +543,18 @@ class Selector(Result):
         return qnames[0]
 
     def raw_action(self, verb, *args, **kwargs):
-        return oc_action(self.context, verb, all_namespaces=self.all_namespaces,
-                         cmd_args=[self._selection_args(), args], **kwargs)
+        """
+        Runs an arbitrary oc verb against the objects selected by the receiver. Like other verbs, static
+        selections of namespace qualified names (namespace:kind/name) are run once per namespace.
+        :param verb: The verb to execute
+        :param args: Additional arguments, which follow the selection
+        :param kwargs: Passed along to oc_action
+        :return: A Result containing an Action for each invocation.
+        """
+        r = Result(verb)
+        for _, action in self._chunked_actions(verb, lambda selection_args: [selection_args, args], **kwargs):
+            r.add_action(action)
+        return r
 
     def _query_names(self):
 
@@ -217,40 +563,66 @@ class Selector(Result):
         :return: Returns a list of qualified names (list may be empty).
         """
 
-        result = Result("query_names")
-        result.add_action(oc_action(self.context, 'get', all_namespaces=self.all_namespaces,
-                                    cmd_args=['-o=name', self._selection_args()]))
+        found = []
+        for ns, action in self._chunked_actions('get', lambda selection_args: ['-o=name', selection_args]):
+            result = Result("query_names")
+            result.add_action(action)
 
-        # TODO: This check is necessary until --ignore-not-found is implemented and prevalent
-        if result.status() != 0 and "(NotFound)" in result.err():
-            return []
+            # TODO: This check is necessary until --ignore-not-found is implemented and prevalent
+            if result.status() != 0 and "(NotFound)" in result.err():
+                continue
+
+            # Otherwise, errors are fatal
+            result.fail_if("Unable to retrieve object names")
+            found.append((ns, action))
 
-        # Otherwise, errors are fatal
-        result.fail_if("Unable to retrieve object names")
-        return split_names(result.out())
+        return self._qualified_names(found)
 
     def narrow(self, kind_or_func):
         """
         Creates a new selector by filtering out objects from the receiver selector.
-        Filtering can be done by kind or by a user specified callable.
+        Filtering can be done by kind, by a declarative predicate or by a user specified callable.
         Example:
             sel.create(...).narrow("pod") - Return selector of pods recently created
+            selector("pods").narrow(where(label("app") == "x", field("status.phase") != "Running"))
             selector("projects").narrow(lambda project: project.metadata.annotations["xyz"] is not Missing)
         :param kind_or_func: A string specifying the kind to include in the resulting
-          selector OR a callable which should return True for objects to be included
-          in the resulting selector. The callable will be called once for each
+          selector OR a predicate built with where() OR a callable which should return True for
+          objects to be included in the resulting selector. The callable will be called once for each
           object selected by the receiver. The argument to the callable will be an APIObject.
-        :return: A new static selector which selects a subset of the receiver's selection.
+        :return: A new static selector which selects a subset of the receiver's selection. When narrowing by
+          kind, the server is not queried until the names are needed and only that kind will be requested.
+          When narrowing by predicate, as much of the predicate as possible is sent to the server as label
+          and field selectors; the remainder is evaluated against the objects returned. If the receiver is
+          a dynamic selector and the entire predicate can be evaluated by the server, the new selector
+          is also dynamic.
         """
 
+        if isinstance(kind_or_func, Predicate) and not isinstance(kind_or_func, Where):
+            kind_or_func = where(kind_or_func)
+
         ns = []
-        if callable(kind_or_func):
+        if isinstance(kind_or_func, Where):
+            plan_node, complete = narrow_predicate(self._plan_node(), kind_or_func)
+            if isinstance(plan_node, QueryNode):
+                # Remain a dynamic selector so that all_namespaces queries can still be serviced.
+                narrowed = Selector("narrow", plan_node.kinds, labels=plan_node.labels,
+                                    field_selectors=plan_node.field_selectors,
+                                    all_namespaces=self.all_namespaces,
+                                    static_context=self.context)
+            else:
+                narrowed = self._planned("narrow", plan_node)
+            if complete:
+                return narrowed
+            for obj in narrowed.objects():
+                if kind_or_func.matches(obj):
+                    ns.append(self._static_name(obj))
+        elif callable(kind_or_func):
             for obj in self.objects():
                 if kind_or_func(obj):
-                    ns.append(obj.qname())
+                    ns.append(self._static_name(obj))
         elif isinstance(kind_or_func, six.string_types):
-            kind = normalize_kind(kind_or_func)
-            ns = [n for n in self.qnames() if (n.startswith(kind + "/") or n.startswith(kind + "."))]
+            return self._planned("narrow", narrow_kind(self._plan_node(), normalize_kind(kind_or_func)))
         else:
             raise ValueError("Don't know how to narrow with type: " + type(kind_or_func))
 
@@ -260,21 +632,38 @@ class Selector(Result):
                      all_namespaces=self.all_namespaces)
         return s
 
+    def _static_name(self, apiobj):
+        """
+        :return: Returns the name a static selector derived from the receiver should use for apiobj. This is
+            namespace qualified (namespace:kind/name) if the receiver selects from all namespaces.
+        """
+        if self.all_namespaces and apiobj.namespace(if_missing=None):
+            return '{}:{}'.format(apiobj.namespace(), apiobj.qname())
+        return apiobj.qname()
+
     def freeze(self):
         """
         :return: Returns a new static Selector with the set of objects currently selected by this receiver.
         This is useful if business logic needs the underlying objects being selected to not change between
         queries (i.e. qnames() will always return the same thing even if objects are deleted from the server).
 
-        If you try to freeze an all_namespaces selector, an exception will be raised. All namespace queries
-        cannot be static because oc does not support queries like: oc get --all-namespaces pod/xyz
+        Freezing an all_namespaces selector produces namespace qualified names (namespace:kind/name). Reading
+        the frozen selector requires one oc invocation per namespace; these are run in parallel.
         """
 
-        if self.all_namespaces:
-            raise ValueError('You cannot freeze all_namespaces selectors.')
+        if self.all_namespaces and self.object_list is None:
+            names = []
+            for ns, kind, api_version, name in self.columns(['metadata.namespace', 'kind', 'apiVersion',
+                                                             'metadata.name']):
+                qkind = kind.lower()
+                if api_version and '/' in api_version:
+                    qkind += '.' + api_version.split('/')[0]
+                names.append('{}{}/{}'.format(ns + ':' if ns else '', qkind, name))
+        else:
+            names = self.qnames()
 
         return Selector("freeze",
-                        object_list=self.qnames(),
+                        object_list=names,
                         static_context=self.context,
                         all_namespaces=self.all_namespaces)
 
@@ -282,57 +671,29 @@ class Selector(Result):
         """
         :param args: One or more selectors to union with.
         :return: Returns a static selector which will select the objects selected by the receiver and any of the
-            selectors passed in as arguments.
+            selectors passed in as arguments. The server is not queried until the names are needed.
         """
-
-        # start with the base set of names
-        new_set = self.qnames()
-        for with_selector in args:
-            to_union = with_selector.qnames()
-            for qname in to_union:
-                # Only add if not already in the union
-                if not qname_matches(qname, new_set):
-                    new_set.append(qname)
-
-        return Selector("union",
-                        object_list=new_set,
-                        static_context=self.context,
-                        all_namespaces=self.all_namespaces)
+        children = [self._plan_node()]
+        children.extend([with_selector._plan_node() for with_selector in args])
+        return self._planned("union", UnionNode(children))
 
     def intersect(self, *args):
         """
         :param args: One or more selectors to intersect with.
         :return: Returns a static selector which will select the object names selected by the
-            receiver AND ALL arguments.
+            receiver AND ALL arguments. The server is not queried until the names are needed.
         """
-
-        new_set = list()
-        for with_selector in args:
-            to_intersect = with_selector.qnames()
-            for qname in self.qnames():
-                if qname_matches(qname, to_intersect):
-                    new_set.append(qname)
-
-        return Selector("intersect",
-                        object_list=new_set,
-                        static_context=self.context,
-                        all_namespaces=self.all_namespaces)
+        return self._planned("intersect",
+                             IntersectNode(self._plan_node(),
+                                           [with_selector._plan_node() for with_selector in args]))
 
     def subtract(self, with_selector):
         """
         :param with_selector: A selector to subtract
-        :return: Returns a static selector which selects names of this receiver minus names selected by the argument
+        :return: Returns a static selector which selects names of this receiver minus names selected by the
+            argument. The server is not queried until the names are needed.
         """
-        to_subtract = with_selector.qnames()
-        new_set = list()
-        for qname in self.qnames():
-            if not qname_matches(qname, to_subtract):
-                new_set.append(qname)
-
-        return Selector("subtract",
-                        object_list=new_set,
-                        static_context=self.context,
-                        all_namespaces=self.all_namespaces)
+        return self._planned("subtract", SubtractNode(self._plan_node(), with_selector._plan_node()))
 
     def subset(self, start=None, end=None):
         """
@@ -361,7 +722,7 @@ class Selector(Result):
 
         # If the selector is static and empty return an empty list object
         if self.object_list is not None and len(self.object_list) == 0:
-            return json.dumps({
+            return jsoncodec.dumps({
                 "apiVersion": "v1",
                 "kind": "List",
                 "metadata": {},
@@ -370,26 +731,166 @@ class Selector(Result):
 
         verb = "get"
 
-        cmd_args = ["-o=json",
-                    self._selection_args()]
+        def args_func(selection_args):
+            cmd_args = ["-o=json",
+                        selection_args]
 
-        if ignore_not_found:
-            cmd_args.append("--ignore-not-found")
+            if ignore_not_found:
+                cmd_args.append("--ignore-not-found")
+            return cmd_args
+
+        actions = [action for _, action in self._chunked_actions(verb, args_func)]
 
         r = Result(verb)
-        r.add_action(oc_action(self.context, verb, all_namespaces=self.all_namespaces, cmd_args=cmd_args))
+        for action in actions:
+            r.add_action(action)
         r.fail_if("Unable to read object")
 
-        # --ignore-not-found returns an empty string instead of an error if nothing is found
-        if not r.out().strip():
-            return json.dumps({
-                "apiVersion": "v1",
-                "kind": "List",
-                "metadata": {},
-                "items": []
-            })
+        if len(actions) == 1:
+            # --ignore-not-found returns an empty string instead of an error if nothing is found
+            if not r.out().strip():
+                return jsoncodec.dumps({
+                    "apiVersion": "v1",
+                    "kind": "List",
+                    "metadata": {},
+                    "items": []
+                })
+
+            return r.out()
+
+        # Merge the output of each chunk into a single List
+        items = []
+        for action in actions:
+            if not action.out.strip():
+                continue
+            obj = jsoncodec.loads(action.out)
+            if obj.get('kind', None) == 'List':
+                items.extend(obj.get('items', None) or [])
+            else:
+                # A chunk containing a single name returns the object itself
+                items.append(obj)
+
+        if self._is_multi_namespace():
+            items = self._restore_order(items, lambda item: (item['metadata'].get('namespace', None),
+                                                             item['kind'], item['metadata']['name']))
+
+        return jsoncodec.dumps({
+            "apiVersion": "v1",
+            "kind": "List",
+            "metadata": {},
+            "items": items
+        })
+
+    def columns(self, paths, ignore_not_found=True):
+        """
+        Retrieves only the specified fields of the selected objects. Unlike objects(), the full objects
+        are never parsed or modeled in python; oc projects the fields using a jsonpath template.
+        Example:
+            for name, node, phase in selector('pods').columns(['metadata.name', 'spec.nodeName', 'status.phase']):
+                ...
+        :param paths: A list of jsonpath expressions relative to each object (e.g. 'metadata.name' or
+            '.status.conditions[?(@.type=="Ready")].status'). Paths should select scalar values; values
+            containing tabs or newlines cannot be represented.
+        :param ignore_not_found: If true, missing named resources will not raise an exception.
+        :return: A list of tuples, one per selected object, with one string element per path. Fields
+            absent from an object are None.
+        """
 
-        return r.out()
+        if self.object_list is not None and len(self.object_list) == 0:
+            return []
+
+        exprs = []
+        for path in paths:
+            path = path.strip()
+            if path.startswith('{') and path.endswith('}'):
+                path = path[1:-1]
+            if not path.startswith('.'):
+                path = '.' + path
+            exprs.append('{' + path + '}')
+
+        # Results from several namespaces must be put back in order; identify the object in each row.
+        reorder = self._is_multi_namespace()
+        if reorder:
+            exprs = ['{.metadata.namespace}', '{.kind}', '{.metadata.name}'] + exprs
+
+        row = '{"\\t"}'.join(exprs) + '{"\\n"}'
+
+        def args_func(selection_args):
+            # oc returns the object itself rather than a List when a single name is requested.
+            if self.object_list is not None and len(selection_args) == 1:
+                template = row
+            else:
+                template = '{range .items[*]}' + row + '{end}'
+
+            cmd_args = ['-o=jsonpath={}'.format(template), selection_args]
+            if ignore_not_found:
+                cmd_args.append("--ignore-not-found")
+            return cmd_args
+
+        out = ''
+        for _, action in self._chunked_actions('get', args_func):
+            r = Result("columns")
+            r.add_action(action)
+            r.fail_if("Unable to read object columns")
+            out += r.out()
+
+        rows = []
+        for line in out.split('\n'):
+            if not line:
+                continue
+            values = [v if v else None for v in line.split('\t')]
+            values.extend([None] * (len(exprs) - len(values)))
+            rows.append(tuple(values))
+
+        if reorder:
+            rows = [r[3:] for r in self._restore_order(rows, lambda r: (r[0], r[1], r[2]))]
+
+        return rows
+
+    def metadata(self, ignore_not_found=True):
+        """
+        Returns lightweight APIObjects which contain only the apiVersion, kind and the commonly used
+        metadata of each selected object (name, namespace, uid, resourceVersion, generation,
+        creationTimestamp, deletionTimestamp, labels, ownerReferences). This is substantially cheaper
+        than objects() for large selections and is sufficient for methods like qname(), fqname(),
+        uid(), get_label() and do_i_own(). Annotations, spec and status are not included.
+        :param ignore_not_found: If true, missing named resources will not raise an exception.
+        :return: A list of APIObjects.
+        """
+        from .apiobject import APIObject
+
+        def _json_or_none(v):
+            if v is None:
+                return None
+            try:
+                return jsoncodec.loads(v)
+            except ValueError:
+                return None
+
+        objs = []
+        for row in self.columns(_metadata_paths, ignore_not_found=ignore_not_found):
+            api_version, kind, labels, owner_references = row[0:4]
+            metadata = {}
+            for key, value in zip(_metadata_fields, row[4:]):
+                if value is not None:
+                    metadata[key] = value
+            labels = _json_or_none(labels)
+            if labels:
+                metadata['labels'] = labels
+            owner_references = _json_or_none(owner_references)
+            if owner_references:
+                metadata['ownerReferences'] = owner_references
+            if 'generation' in metadata:
+                metadata['generation'] = int(metadata['generation'])
+            # Only the fields read are compared with the model when changes are applied, so changes to
+            # these lightweight objects can be applied as patches too.
+            objs.append(APIObject(dict_to_model={
+                'apiVersion': api_version,
+                'kind': kind,
+                'metadata': metadata,
+            }, context=self.context)._mark_server_state())
+
+        return objs
 
     def object(self, ignore_not_found=False, cls=None):
         """
@@ -420,14 +921,142 @@ class Selector(Result):
         """
         from .apiobject import APIObject
 
-        obj = json.loads(self.object_json(ignore_not_found=ignore_not_found))
+        obj = jsoncodec.loads(self.object_json(ignore_not_found=ignore_not_found))
 
         if cls is not None:
             api_objects = cls(obj).elements(cls)
         else:
             api_objects = APIObject(obj).elements()
 
-        return api_objects
+        return [api_object._mark_server_state() for api_object in api_objects]
+
+    def _group_version(self, group):
+        if not group:
+            return 'v1'
+
+        key = (self.context.get_kubeconfig_path(), self.context.get_api_server(), group)
+        if key not in _group_versions:
+            r = Result("api-group")
+            r.add_action(oc_action(self.context, 'get', cmd_args=['--raw', '/apis/{}'.format(group)],
+                                   no_namespace=True))
+            r.fail_if("Unable to discover version for API group: {}".format(group))
+            _group_versions[key] = jsoncodec.loads(r.out())['preferredVersion']['groupVersion']
+
+        return _group_versions[key]
+
+    def _namespace_for_raw(self):
+        project = self.context.get_project()
+        if project:
+            return project
+
+        r = Result("project-name")
+        r.add_action(oc_action(self.context, "project", cmd_args=["-q"]))
+        r.fail_if("Unable to determine current project")
+        return r.out().strip()
+
+    def pages(self, page_size=500, continue_token=None, cls=None):
+        """
+        Generator which retrieves the selected objects a page at a time instead of in a single response.
+        Dynamic selectors issue raw list calls (limit / continue) for each kind in turn, so memory use on
+        both sides is bounded by the page size; pages may be smaller than page_size at the boundary
+        between kinds. Kinds unknown to openshift-client-python (see update_api_resources) are
+        retrieved in a single page. Static selectors retrieve page_size names per page.
+        Example:
+            for page in selector('events', all_namespaces=True).pages(page_size=200):
+                process(page.objects)
+                checkpoint(page.continue_token)
+        :param page_size: The maximum number of objects to request per page.
+        :param continue_token: A continue_token from a page previously yielded by an equivalent selector. Iteration
+            will resume with the page following it. Server continue tokens expire after several minutes.
+        :param cls: Custom APIObject class to return
+        :return: Yields SelectorPage objects.
+        """
+        from .apiobject import APIObject
+
+        state = _decode_continue_token(continue_token) if continue_token else {}
+
+        if self.object_list is not None:
+            names = self.object_list
+            index = state.get('index', 0)
+            while index < len(names):
+                chunk = names[index:index + page_size]
+                index += len(chunk)
+                objs = Selector("pages", object_list=chunk, static_context=self.context).objects(cls=cls)
+                token = _encode_continue_token({'index': index}) if index < len(names) else None
+                yield SelectorPage(objs, token)
+            return
+
+        params = []
+        for arg in self._selection_args()[1:]:
+            if arg.startswith('--selector='):
+                params.append(('labelSelector', arg[len('--selector='):]))
+            elif arg.startswith('--field-selector='):
+                params.append(('fieldSelector', arg[len('--field-selector='):]))
+
+        namespace = None
+        kind_index = state.get('kind', 0)
+        cont = state.get('continue', None)
+        while kind_index < len(self.kinds):
+            kind = self.kinds[kind_index]
+            api_resource = get_api_resource(kind)
+
+            if api_resource is None:
+                # The raw path for this kind cannot be determined; let oc find it.
+                objs = Selector("pages", kind, labels=self.labels, field_selectors=self.field_selectors,
+                                all_namespaces=self.all_namespaces, static_context=self.context).objects(cls=cls)
+                kind_index += 1
+                cont = None
+            else:
+                group_version = self._group_version(api_resource.group)
+                path = '/api/v1' if group_version == 'v1' else '/apis/{}'.format(group_version)
+                if api_resource.namespaced and not self.all_namespaces:
+                    if namespace is None:
+                        namespace = self._namespace_for_raw()
+                    path += '/namespaces/{}'.format(namespace)
+                path += '/{}'.format(api_resource.name)
+
+                query = [('limit', page_size)] + params
+                if cont:
+                    query.append(('continue', cont))
+                path += '?' + urlencode(query)
+
+                r = Result("pages")
+                r.add_action(oc_action(self.context, 'get', cmd_args=['--raw', path], no_namespace=True))
+                r.fail_if("Unable to retrieve page of {}".format(kind))
+
+                obj = jsoncodec.loads(r.out())
+                # Items in a list response do not carry apiVersion
+                for item in obj.get('items', []):
+                    item.setdefault('apiVersion', obj.get('apiVersion', group_version))
+
+                if cls is not None:
+                    objs = cls(obj).elements(cls)
+                else:
+                    objs = APIObject(obj).elements()
+                objs = [o._mark_server_state() for o in objs]
+
+                cont = (obj.get('metadata') or {}).get('continue') or None
+                if not cont:
+                    kind_index += 1
+
+            token = None
+            if kind_index < len(self.kinds):
+                token = _encode_continue_token({'kind': kind_index, 'continue': cont})
+
+            if objs:
+                yield SelectorPage(objs, token)
+
+    def iter_objects(self, page_size=500, cls=None):
+        """
+        Generator which yields the selected objects one at a time, retrieving them from the server
+        a page at a time (see pages()).
+        :param page_size: The maximum number of objects to request per page.
+        :param cls: Custom APIObject class to return
+        :return: Yields APIObjects
+        """
+        for page in self.pages(page_size=page_size, cls=cls):
+            for obj in page:
+                yield obj
 
     def start_build(self, cmd_args=None):
         r = Selector('start_build')
@@ -436,11 +1065,15 @@ class Selector(Result):
         base_args = list()
         base_args.append("-o=name")
 
-        for name in self.qnames():
-            r.add_action(oc_action(self.context, "start-build", cmd_args=[name, base_args, cmd_args]))
+        names = []
+        for qname in self.qnames():
+            ns, name = _split_namespace(qname)
+            action = oc_action(self.context, "start-build", namespace=ns, cmd_args=[name, base_args, cmd_args])
+            r.add_action(action)
+            names.extend('{}:{}'.format(ns, build) if ns else build for build in split_names(action.out))
 
         r.fail_if("Error running start-build on at least one item: " + str(self.qnames()))
-        r.object_list = split_names(r.out())
+        r.object_list = names
         return r
 
     def report(self, timestamps=True, logs_since=None, try_longshots=False):
@@ -460,31 +1093,70 @@ class Selector(Result):
                     }
                  }
         """
-        d = {}
-        for obj in self.objects():
-            key = obj.fqname()
-            obj_dict = dict()
-            obj_dict['object'] = obj.as_dict()
-            obj_dict['describe'] = obj.describe(auto_raise=False)
-
-            # A report on something like a 'configmap' should not contain a logs
-            # entry. So don't try longshots and don't include an entry if it doesn't support logs.
-            logs_dict = obj.logs(timestamps=timestamps, since=logs_since, try_longshots=try_longshots)
-            if logs_dict:
-                obj_dict['logs'] = logs_dict
-            d[key] = obj_dict
+        return dict(self.iter_report(timestamps=timestamps, logs_since=logs_since, try_longshots=try_longshots))
 
-        return d
+    def iter_report(self, timestamps=True, logs_since=None, try_longshots=False, parallelism=None):
+        """
+        Generates the entries of report() one object at a time. The selected objects are read up front, but
+        their descriptions and logs, which make up the bulk of a report, are only collected for up to
+        parallelism windows of objects ahead of the consumer. Entries are collected in parallel, but are
+        generated in the order of the selected objects. Closing the generator stops the collection.
+        :param parallelism: The number of windows of objects to collect concurrently. Defaults to the thread's
+        default parallelism (see set_default_parallelism).
+        :return: A generator of (<fqname>, <report entry>) tuples.
+        """
+        if parallelism is None:
+            parallelism = context.default_parallelism
+        parallelism = max(1, parallelism)
+
+        objs = self.objects()
+        windows = [objs[i:i + _report_window] for i in range(0, len(objs), _report_window)]
+
+        def collect(window):
+            entries = []
+            for obj, description in zip(window, describe_objects(window, parallelism=1)):
+                obj_dict = dict()
+                obj_dict['object'] = obj.as_dict()
+                obj_dict['describe'] = description
+
+                # A report on something like a 'configmap' should not contain a logs
+                # entry. So don't try longshots and don't include an entry if it doesn't support logs.
+                logs_dict = obj.logs(timestamps=timestamps, since=logs_since, try_longshots=try_longshots)
+                if logs_dict:
+                    obj_dict['logs'] = logs_dict
+                entries.append((obj.fqname(), obj_dict))
+            return entries
+
+        run_collect = bind_context(collect)
+        executor = ThreadPoolExecutor(max_workers=parallelism)
+        futures = collections.deque()
+        try:
+            for window in windows:
+                # Collect no further ahead of the consumer than necessary to keep the workers busy
+                if len(futures) >= parallelism:
+                    for entry in futures.popleft().result():
+                        yield entry
+                futures.append(executor.submit(run_collect, window))
+            while futures:
+                for entry in futures.popleft().result():
+                    yield entry
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
 
     def print_report(self, stream=sys.stderr, timestamps=True, logs_since=None, try_longshots=False):
         """
-        Pretty prints a report to an output stream (see report() method).
+        Pretty prints a report to an output stream (see report() method). Each object's entry is written
+        as soon as it has been collected (see iter_report()).
         :param stream: Output stream to send pretty printed report (defaults to sys.stderr)..
         :return: n/a
         """
-        util.print_report(stream, self.report(timestamps=timestamps, logs_since=logs_since, try_longshots=try_longshots))
+        util.print_report_entries(stream, self.iter_report(timestamps=timestamps, logs_since=logs_since,
+                                                            try_longshots=try_longshots))
 
-    def logs(self, timestamps=False, previous=False, since=None, limit_bytes=None, tail=-1, cmd_args=None, try_longshots=False):
+    def logs(self, timestamps=False, previous=False, since=None, limit_bytes=None, tail=-1, cmd_args=None, try_longshots=False,
+             cursors=None):
         """
         Builds a dict of logs for selected resources. Keys are fully qualified names for the source of the
         logs (format of this fqn is subject to change). Each value is the log extracted from the resource.
@@ -495,6 +1167,8 @@ class Selector(Result):
         :param cmd_args: An optional list of additional arguments to pass on the command line
         :param try_longshots: Defaults to False. This allows broad selectors that select things without logs to
         not throw errors during this method.
+        :param cursors: An optional LogCursors. If specified, only lines written since the last time logs were
+        collected with the same LogCursors are returned (see APIObject.logs()).
         :return: {
                     <pod fqname for each container>: <log_string> ,
                     <build fqname>: <log_string>,
@@ -503,18 +1177,80 @@ class Selector(Result):
         """
         d = {}
         for obj in self.objects():
-            d.update(obj.logs(timestamps=timestamps, previous=previous, since=since, limit_bytes=limit_bytes, tail=tail, try_longshots=try_longshots, cmd_args=cmd_args))
+            d.update(obj._collect_logs(timestamps=timestamps, previous=previous, since=since, limit_bytes=limit_bytes, tail=tail, try_longshots=try_longshots, cmd_args=cmd_args,
+                                       cursors=cursors))
+
+        # Positions are saved once for all objects rather than once per object
+        if cursors is not None:
+            cursors.save()
 
         return d
 
-    def print_logs(self, stream=sys.stderr, timestamps=False, previous=False, since=None, limit_bytes=None, tail=-1, try_longshots=False, cmd_args=None):
+    def print_logs(self, stream=sys.stderr, timestamps=False, previous=False, since=None, limit_bytes=None, tail=-1, try_longshots=False, cmd_args=None,
+                   cursors=None):
         """
         Pretty prints logs from selected objects to an output stream (see logs() method).
         :param stream: Output stream to send pretty printed logs (defaults to sys.stderr)..
         :param cmd_args: An optional list of additional arguments to pass on the command line
         :return: n/a
         """
-        util.print_logs(stream, self.logs(timestamps=timestamps, previous=previous, since=since, limit_bytes=limit_bytes, tail=tail, try_longshots=try_longshots, cmd_args=cmd_args))
+        util.print_logs(stream, self.logs(timestamps=timestamps, previous=previous, since=since, limit_bytes=limit_bytes, tail=tail, try_longshots=try_longshots, cmd_args=cmd_args,
+                                          cursors=cursors))
+
+    def stream_logs(self, follow=True, since_time=None, timestamps=False, previous=False, since=None,
+                    limit_bytes=None, tail=-1, cmd_args=None, try_longshots=False,
+                    max_buffered_lines=logstream.DEFAULT_MAX_BUFFERED_LINES):
+        """
+        Streams logs from all selected resources concurrently (see APIObject.stream_logs()). The pods
+        of every selected resource are determined before streaming begins.
+        :param follow: If True, continue to stream logs as they are written.
+        :param since_time: Only stream lines written after this time. An RFC3339 string or a datetime.
+        :param cmd_args: An optional list of additional arguments to pass on the command line
+        :param try_longshots: Defaults to False. This allows broad selectors that select things without logs to
+        not throw errors during this method.
+        :param max_buffered_lines: The number of lines which may be read but not yet consumed.
+        :return: A generator of (<fully-qualified-name>, <line>) tuples. Keys are the same as those of logs().
+        """
+        base_args = logstream.log_args(timestamps=timestamps, previous=previous, since=since,
+                                       limit_bytes=limit_bytes, tail=tail, follow=follow, since_time=since_time)
+        return logstream.stream_log_sources(self._log_stream_sources(base_args, cmd_args, try_longshots),
+                                            max_buffered_lines=max_buffered_lines)
+
+    def _log_stream_sources(self, base_args, cmd_args, try_longshots):
+        sources = []
+        for obj in self.objects():
+            sources.extend(obj._log_stream_sources(base_args, cmd_args, try_longshots))
+        return sources
+
+    def merged_logs(self, since_time=None, previous=False, since=None, limit_bytes=None, tail=-1, cmd_args=None,
+                    try_longshots=False, max_buffered_lines=logstream.DEFAULT_MERGE_BUFFERED_LINES):
+        """
+        Collects logs from all selected resources and merges them into a single sequence of lines in
+        timestamp order (see APIObject.merged_logs()). Useful for correlating events across many replicas.
+        :param since_time: Only include lines written after this time. An RFC3339 string or a datetime.
+        :param cmd_args: An optional list of additional arguments to pass on the command line
+        :param try_longshots: Defaults to False. This allows broad selectors that select things without logs to
+        not throw errors during this method.
+        :param max_buffered_lines: The number of lines which may be buffered for each container.
+        :return: A generator of (<timestamp>, <fully-qualified-name>, <line>) tuples. Keys are the same as
+        those of logs().
+        """
+        base_args = logstream.log_args(timestamps=True, previous=previous, since=since, limit_bytes=limit_bytes,
+                                       tail=tail, since_time=since_time)
+        return logstream.merge_log_sources(self._log_stream_sources(base_args, cmd_args, try_longshots),
+                                           max_buffered_lines=max_buffered_lines)
+
+    def print_merged_logs(self, stream=sys.stderr, since_time=None, previous=False, since=None, limit_bytes=None,
+                          tail=-1, try_longshots=False, cmd_args=None):
+        """
+        Prints logs from selected objects, merged in timestamp order, to an output stream (see merged_logs() method).
+        :param stream: Output stream to send merged logs (defaults to sys.stderr).
+        :param cmd_args: An optional list of additional arguments to pass on the command line
+        :return: n/a
+        """
+        logstream.write_merged_logs(stream, self.merged_logs(since_time=since_time, previous=previous, since=since,
+                                                             limit_bytes=limit_bytes, tail=tail,
+                                                             try_longshots=try_longshots, cmd_args=cmd_args))
 
     def describe(self, auto_raise=True, cmd_args=None):
         """
@@ -525,13 +1261,24 @@ class Selector(Result):
         :return: A string containing the oc describe output.
         """
         r = Result("describe")
-        r.add_action(oc_action(self.context, "describe", all_namespaces=self.all_namespaces,
-                               cmd_args=[self._selection_args(), cmd_args]))
+        for _, action in self._chunked_actions("describe", lambda selection_args: [selection_args, cmd_args]):
+            r.add_action(action)
         if auto_raise:
             r.fail_if('Error during describe')
 
         return (r.out() + "\n" + r.err()).strip()
 
+    def describe_each(self):
+        """
+        Runs oc describe against the selected objects and returns the output for each object separately.
+        Objects are described with one invocation per kind and namespace rather than one per object
+        (see describe_objects()).
+        :return: A dict mapping the fqname of each selected object to its oc describe output. Errors
+        describing an object are included in its output rather than raised.
+        """
+        objs = self.metadata()
+        return dict(zip([obj.fqname() for obj in objs], describe_objects(objs)))
+
     def delete(self, ignore_not_found=True, cmd_args=None):
         """
         :param ignore_not_found: If True, named resources which are not present will not raise an error.
@@ -552,11 +1299,14 @@ class Selector(Result):
             base_args.append("--ignore-not-found")
         base_args.append("-o=name")
 
-        r.add_action(oc_action(self.context, "delete", all_namespaces=self.all_namespaces,
-                               cmd_args=[self._selection_args(needs_all=True), base_args, cmd_args]))
+        chunked_actions = self._chunked_actions("delete",
+                                                lambda selection_args: [selection_args, base_args, cmd_args],
+                                                needs_all=True)
+        for _, action in chunked_actions:
+            r.add_action(action)
 
         r.fail_if("Error deleting objects")
-        return split_names(r.out())
+        return self._qualified_names(chunked_actions)
 
     def label(self, labels, overwrite=True, cmd_args=None):
 
@@ -582,8 +1332,10 @@ class Selector(Result):
             else:
                 base_args.append('{}={}'.format(l, v))
 
-        r.add_action(oc_action(self.context, "label", all_namespaces=self.all_namespaces,
-                               cmd_args=[self._selection_args(needs_all=True), base_args, cmd_args]))
+        for _, action in self._chunked_actions("label",
+                                               lambda selection_args: [selection_args, base_args, cmd_args],
+                                               needs_all=True):
+            r.add_action(action)
 
         r.fail_if("Error running label")
         return self
@@ -611,8 +1363,10 @@ class Selector(Result):
             else:
                 base_args.append('{}={}'.format(l, v))
 
-        r.add_action(oc_action(self.context, "annotate", all_namespaces=self.all_namespaces,
-                               cmd_args=[self._selection_args(needs_all=True), base_args, cmd_args]))
+        for _, action in self._chunked_actions("annotate",
+                                               lambda selection_args: [selection_args, base_args, cmd_args],
+                                               needs_all=True):
+            r.add_action(action)
 
         r.fail_if("Error running annotate")
         return self
@@ -635,8 +1389,9 @@ class Selector(Result):
         r = Result("scale")
         base_args = list()
         base_args.append('--replicas={}'.format(replicas))
-        r.add_action(oc_action(self.context, "scale", all_namespaces=self.all_namespaces,
-                               cmd_args=[self._selection_args(needs_all=False), base_args, cmd_args]))
+        for _, action in self._chunked_actions("scale",
+                                               lambda selection_args: [selection_args, base_args, cmd_args]):
+            r.add_action(action)
 
         r.fail_if("Error running scale")
         return self
@@ -775,8 +1530,10 @@ def selector(kind_or_kinds_or_qname_or_qnames=None, labels=None,
     selector( ["kind", "kind2", ...], labels={ 'k': 'v' } )
     selector( ["kind/name1", "kind/name2", ...] )
     selector( "kind/name" )
+    selector( ["namespace:kind/name1", "namespace2:kind/name2", ...] )
     :param kind_or_kinds_or_qname_or_qnames: A kind ('pod'), qualified name ('pod/some_name') or
-        a list of qualified names ['pod/abc', 'pod/def'].
+        a list of qualified names ['pod/abc', 'pod/def']. Qualified names may be prefixed with a namespace
+        ('ns1:pod/abc') to select objects outside of the current project.
     :param labels: labels to require for the specified kind (AND logic is applied). Do not use in conjunction with
         qnames.
         - If label name starts with '!', not-equal logic will be applied (label!=value).
@@ -0,0 +1,226 @@
+"""
+Support for reusing ssh connections to cluster nodes (see base_verbs.node_ssh_client).
+"""
+
+from __future__ import absolute_import
+
+import atexit
+import os
+import threading
+import time
+
+# Pooled connections which have not been used for this many seconds are closed.
+DEFAULT_SSH_IDLE_SECONDS = int(os.getenv("OPENSHIFT_CLIENT_PYTHON_DEFAULT_SSH_IDLE_SECONDS", "300"))
+
+# Interval at which keepalive packets are sent on pooled connections, so that idle connections are
+# not dropped by firewalls or the server. 0 disables keepalives.
+DEFAULT_SSH_KEEPALIVE_SECONDS = int(os.getenv("OPENSHIFT_CLIENT_PYTHON_DEFAULT_SSH_KEEPALIVE_SECONDS", "30"))
+
+# Node addresses are resolved again after this many seconds.
+DEFAULT_NODE_ADDRESS_TTL_SECONDS = int(os.getenv("OPENSHIFT_CLIENT_PYTHON_DEFAULT_NODE_ADDRESS_TTL_SECONDS", "600"))
+
+
+def _is_active(ssh_client):
+    if ssh_client is None:
+        return False
+    transport = ssh_client.get_transport()
+    return transport is not None and transport.is_active()
+
+
+class _PoolEntry(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()  # Held while connecting
+        self.client = None
+        self.users = 0
+        self.last_used = time.time()
+        self.stale = False  # Set when a user discards the client while others are using it
+
+    def close(self):
+        if self.client is not None:
+            try:
+                self.client.close()
+            except Exception:
+                pass
+            self.client = None
+        self.stale = False
+
+
+class SSHConnectionPool(object):
+    """
+    Holds open paramiko ssh clients so that they can be reused by subsequent commands. Clients are
+    identified by a key describing how they were connected (e.g. the node, port and username). paramiko
+    clients can run several commands concurrently, so a client is shared by all threads acquiring its key.
+
+    A client whose connection has been lost is reconnected when it is next acquired. Clients which have not
+    been used for idle_seconds are closed by a daemon timer thread, which only runs while the pool holds
+    released clients, or when the pool is next used; all clients are closed at exit.
+    """
+
+    def __init__(self, idle_seconds=DEFAULT_SSH_IDLE_SECONDS, keepalive_seconds=DEFAULT_SSH_KEEPALIVE_SECONDS):
+        self.idle_seconds = idle_seconds
+        self.keepalive_seconds = keepalive_seconds
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.reaper = None  # threading.Timer which closes idle clients
+        atexit.register(self.close)
+
+    def acquire(self, key, connect):
+        """
+        Returns the client for key, connecting it if it is not open. Each call must be paired with a call
+        to release(key).
+        :param key: A hashable key identifying the connection.
+        :param connect: A callable which returns a newly connected paramiko SSHClient for key.
+        :return: A connected paramiko SSHClient. It must not be closed by the caller.
+        """
+        with self.lock:
+            self._evict_idle()
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = _PoolEntry()
+            entry.users += 1
+
+        try:
+            with entry.lock:
+                if not _is_active(entry.client):
+                    entry.close()
+                    entry.client = connect()
+                    if self.keepalive_seconds:
+                        entry.client.get_transport().set_keepalive(self.keepalive_seconds)
+                return entry.client
+        except Exception:
+            self.release(key)
+            raise
+
+    def checkout(self, key, connect):
+        """
+        Like acquire(), but returns an object which behaves like the client and releases it when closed
+        (e.g. by using it as a context manager).
+        """
+        return _PooledClient(self, key, self.acquire(key, connect))
+
+    def release(self, key, discard=False):
+        """
+        :param key: The key passed to acquire().
+        :param discard: If True, the client is closed (e.g. because its connection appears to have failed)
+        and will be reconnected when it is next acquired. A client whose connection is still active may only
+        have failed to open a channel (e.g. because the server limits the sessions per connection), so it is
+        not closed until no other thread is using it.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return
+            entry.users -= 1
+            entry.last_used = time.time()
+            if discard:
+                if _is_active(entry.client):
+                    entry.stale = True
+                else:
+                    entry.close()
+            if entry.stale and entry.users == 0:
+                entry.close()
+            self._schedule_reaper()
+
+    def _evict_idle(self):
+        now = time.time()
+        for key, entry in list(self.entries.items()):
+            if entry.users == 0 and now - entry.last_used > self.idle_seconds:
+                entry.close()
+                del self.entries[key]
+
+    def _schedule_reaper(self):
+        # Must be called with self.lock held. Clients in use are not evicted, so the timer is only
+        # needed while some client has been released.
+        if self.reaper is not None:
+            return
+        released = [entry.last_used for entry in self.entries.values() if entry.users == 0]
+        if not released:
+            return
+        delay = max(min(released) + self.idle_seconds - time.time(), 0) + 0.01
+        self.reaper = threading.Timer(delay, self._reap)
+        self.reaper.daemon = True
+        self.reaper.start()
+
+    def _reap(self):
+        with self.lock:
+            self.reaper = None
+            self._evict_idle()
+            self._schedule_reaper()
+
+    def close(self):
+        """
+        Closes all pooled clients, including those in use.
+        """
+        with self.lock:
+            if self.reaper is not None:
+                self.reaper.cancel()
+                self.reaper = None
+            for entry in self.entries.values():
+                entry.close()
+            self.entries.clear()
+
+    def __len__(self):
+        with self.lock:
+            return len(self.entries)
+
+
+class NodeAddressCache(object):
+    """
+    Caches the addresses of nodes so that they need not be read from the cluster for every connection.
+    """
+
+    def __init__(self, ttl_seconds=DEFAULT_NODE_ADDRESS_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self.lock = threading.Lock()
+        self.addresses = {}  # key -> (time resolved, addresses)
+
+    def get(self, key, resolve):
+        """
+        :param key: A hashable key identifying the node (e.g. its cluster and qualified name).
+        :param resolve: A callable which returns the addresses of the node if they are not cached.
+        :return: The addresses of the node.
+        """
+        with self.lock:
+            cached = self.addresses.get(key)
+        if cached is not None and time.time() - cached[0] < self.ttl_seconds:
+            return cached[1]
+        addresses = resolve()
+        with self.lock:
+            self.addresses[key] = (time.time(), addresses)
+        return addresses
+
+    def invalidate(self, key):
+        with self.lock:
+            self.addresses.pop(key, None)
+
+
+class _PooledClient(object):
+    """
+    Stands in for a pooled paramiko SSHClient. Closing it, or exiting it as a context manager, releases
+    the client to the pool rather than closing its connection.
+    """
+
+    def __init__(self, pool, key, client):
+        self._pool = pool
+        self._key = key
+        self._client = client
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def close(self, discard=False):
+        """
+        :param discard: If True, the connection is closed and will be reestablished when it is next used
+            (see SSHConnectionPool.release).
+        """
+        if not self._released:
+            self._released = True
+            self._pool.release(self._key, discard=discard)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
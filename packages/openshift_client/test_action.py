@@ -0,0 +1,100 @@
+from __future__ import absolute_import
+
+import gc
+import hashlib
+import json
+import io
+import os
+import tempfile
+import unittest
+
+from .action import oc_action, STDIN_PREVIEW_BYTES
+from .context import context, cur_context, set_default_oc_path, stdin_retention, max_output_memory
+
+
+class TestAction(unittest.TestCase):
+
+    def test_stdin_retention(self):
+        items = [{'kind': 'ConfigMap', 'metadata': {'name': 'cm-{}'.format(i)}} for i in range(2000)]
+        obj = {'kind': 'List', 'items': items}
+
+        # sh -c cat echoes the input back so that what oc would have received can be inspected
+        previous = context.default_oc_path
+        set_default_oc_path('/bin/sh')
+        try:
+            a = oc_action(cur_context(), '-c', cmd_args=['cat'], stdin_obj=obj)
+            self.assertEqual(json.loads(a.out), obj)
+            self.assertEqual(json.loads(a.stdin_str), obj)
+
+            with stdin_retention('preview'):
+                a = oc_action(cur_context(), '-c', cmd_args=['cat'], stdin_obj=obj)
+            self.assertEqual(json.loads(a.out), obj)
+            self.assertTrue(a.stdin_str.startswith(a.out[:STDIN_PREVIEW_BYTES]))
+            self.assertTrue(a.stdin_str.endswith('...truncated...'))
+            self.assertEqual(a.references['.stdin_bytes'], len(a.out))
+            self.assertEqual(a.references['.stdin_sha256'], hashlib.sha256(a.out.encode('utf-8')).hexdigest())
+
+            with stdin_retention('digest'):
+                a = oc_action(cur_context(), '-c', cmd_args=['cat'], stdin_str='hello')
+            self.assertEqual(a.out, 'hello')
+            self.assertIsNone(a.stdin_str)
+            self.assertEqual(a.references['.stdin_bytes'], 5)
+        finally:
+            set_default_oc_path(previous)
+
+    def test_output_spill(self):
+        previous = context.default_oc_path
+        set_default_oc_path('/bin/sh')
+        try:
+            with max_output_memory(100):
+                small = oc_action(cur_context(), '-c', cmd_args=['echo hello'])
+                large = oc_action(cur_context(), '-c', cmd_args=['cat'], stdin_str=u'\u00e9' * 1000)
+        finally:
+            set_default_oc_path(previous)
+
+        self.assertEqual(small.out, 'hello\n')
+        self.assertIsNone(small._out.path)
+
+        path = large._out.path
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(large.out, u'\u00e9' * 1000)
+        with large.open_out() as f:
+            self.assertEqual(f.read(), (u'\u00e9' * 1000).encode('utf-8'))
+
+        # The spill file is removed with the Action
+        del large
+        gc.collect()
+        self.assertFalse(os.path.exists(path))
+
+    def test_stream_binary(self):
+        data = bytes(bytearray(range(256))) * 1000
+        previous = context.default_oc_path
+        set_default_oc_path('/bin/sh')
+        try:
+            # Through a pipe into a file-like object without a file descriptor
+            sink = io.BytesIO()
+            a = oc_action(cur_context(), '-c', cmd_args=['cat'], stdin_file=io.BytesIO(data), stdout_sink=sink)
+            self.assertEqual(sink.getvalue(), data)
+            self.assertEqual(a.out, '')
+            self.assertEqual(a.references['.stdout_bytes'], len(data))
+            self.assertEqual(a.references['.stdin_bytes'], len(data))
+
+            # Directly into a file
+            with tempfile.TemporaryFile() as f:
+                f.write(b'header')
+                a = oc_action(cur_context(), '-c', cmd_args=['cat'], stdin_file=io.BytesIO(data), stdout_sink=f)
+                f.seek(0)
+                self.assertEqual(f.read(), b'header' + data)
+                self.assertEqual(a.references['.stdout_bytes'], len(data))
+
+            # To a callable
+            chunks = []
+            a = oc_action(cur_context(), '-c', cmd_args=['printf abc; exit 3'], stdout_sink=chunks.append)
+            self.assertEqual(b''.join(chunks), b'abc')
+            self.assertEqual(a.status, 3)
+        finally:
+            set_default_oc_path(previous)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,21 @@
+import json
 import unittest
 
 from openshift_client import Context
 from .apiobject import APIObject
+from .fakeoc import FakeOc
+
+# Stands in for oc apply and oc patch. Records the verb, the --patch argument and stdin, and prints
+# the object with an incremented resourceVersion.
+FAKE_OC = '''#!/bin/sh
+dir="$(dirname "$0")"
+echo "$1" >> "$dir/calls"
+for arg in "$@"; do
+    case "$arg" in --patch=*) echo "${arg#--patch=}" >> "$dir/calls" ;; esac
+done
+[ "$1" = "apply" ] && cat >> "$dir/calls" && echo >> "$dir/calls"
+echo '{"kind": "Pod", "apiVersion": "v1", "metadata": {"name": "p", "resourceVersion": "6"}}'
+'''
 
 
 class TestModel(unittest.TestCase):
@@ -19,6 +33,94 @@ class TestModel(unittest.TestCase):
         obj = APIObject(context=context)
         self.assertEqual(obj.context.project_name, context.project_name)
 
+    def test_cached_views(self):
+        content = {'kind': 'Pod', 'metadata': {'name': 'p', 'labels': {'a': '1', 'b': '2'}},
+                   'spec': {'l': [3, 1, 2], 'containers': [{'name': 'c'}]}}
+        obj = APIObject(dict_to_model=content)
+        model = obj.model
+
+        def l_slice(l):
+            l[1:2] = [7, 8]
+
+        def l_delslice(l):
+            del l[0:1]
+
+        def l_imul(l):
+            l *= 2
+
+        def l_iadd(l):
+            l += [5]
+
+        def m_ior(m):
+            m |= {'c': '3'}
+
+        # Each mutator is applied to the model and to an equivalent plain structure
+        mutations = [
+            (lambda d: d['spec']['l'], lambda m: m.spec.l, [
+                lambda l: l.append(4), lambda l: l.extend([6]), lambda l: l.insert(0, 0), lambda l: l.pop(),
+                lambda l: l.remove(0), lambda l: l.sort(), lambda l: l.reverse(), l_slice, l_delslice,
+                l_imul, l_iadd, lambda l: l.__setitem__(0, 9), lambda l: l.__delitem__(0), lambda l: l.clear(),
+            ]),
+            (lambda d: d['spec']['containers'][0], lambda m: m.spec.containers[0], [
+                lambda c: c.__setitem__('image', 'i'), lambda c: c.update(name='d'),
+            ]),
+            (lambda d: d['metadata']['labels'], lambda m: m.metadata.labels, [
+                lambda m: m.__setitem__('z', '1'), lambda m: m.__delitem__('a'), lambda m: m.update(y='2'),
+                m_ior, lambda m: m.setdefault('x', '4'), lambda m: m.pop('b'), lambda m: m.popitem(),
+                lambda m: m.clear(),
+            ]),
+            (lambda d: d, lambda m: m, [
+                lambda m: m.__setitem__('status', {'phase': 'Running'}), lambda m: m.pop('spec'),
+            ]),
+        ]
+
+        for plain_node, model_node, mutators in mutations:
+            for mutate in mutators:
+                # Populate the cached representations before each modification
+                obj.as_dict()
+                obj.as_json()
+                model._json()
+                mutate(plain_node(content))
+                mutate(model_node(model))
+                self.assertEqual(obj.as_dict(), content)
+                self.assertEqual(json.loads(obj.as_json()), content)
+                self.assertEqual(json.loads(model._json()), content)
+
+        # Attribute assignment and deletion
+        model.metadata.name = 'q'
+        del model.status
+        self.assertEqual(obj.as_dict(), {'kind': 'Pod', 'metadata': {'name': 'q', 'labels': {}}})
+        self.assertEqual(json.loads(obj.as_json()), obj.as_dict())
+
+    def test_apply(self):
+        with FakeOc(FAKE_OC) as oc:
+            def pod():
+                return APIObject(dict_to_model={'kind': 'Pod', 'apiVersion': 'v1',
+                                                'metadata': {'name': 'p', 'resourceVersion': '5',
+                                                             'labels': {'a': '1', 'b': '2'}}})
+
+            # Changes to an object read from the server are sent as a patch
+            obj = pod()._mark_server_state()
+            obj.model.metadata.labels = {'z': '1'}
+            obj.apply()
+            verb, patch = oc.lines()
+            self.assertEqual(verb, 'patch')
+            self.assertEqual(json.loads(patch), {'metadata': {'resourceVersion': '5',
+                                                              'labels': {'a': None, 'b': None, 'z': '1'}}})
+            self.assertEqual(obj.resource_version(), '6')
+
+            # The whole object is applied if no change can be found
+            obj.apply()
+            self.assertEqual(oc.lines()[0], 'apply')
+
+            # Objects built locally are applied whole, even if they carry a resourceVersion
+            obj = pod()
+            obj.model.metadata.labels.c = '3'
+            obj.apply()
+            verb, stdin = oc.lines()
+            self.assertEqual(verb, 'apply')
+            self.assertEqual(json.loads(stdin)['metadata']['labels'], {'a': '1', 'b': '2', 'c': '3'})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,68 @@
+from __future__ import absolute_import
+
+import unittest
+
+from .base_verbs import _content_hash, _fetch_resource_versions, apply, CONTENT_HASH_ANNOTATION
+from .context import tracking
+from .fakeoc import FakeCluster, configmap
+
+
+class TestBaseVerbs(unittest.TestCase):
+
+    def test_content_hash(self):
+        a = {'apiVersion': 'v1', 'kind': 'ConfigMap', 'metadata': {'name': 'x'}, 'data': {'a': '1', 'b': '2'}}
+        b = {'kind': 'ConfigMap', 'apiVersion': 'v1', 'data': {'b': '2', 'a': '1'},
+             'metadata': {'name': 'x', 'resourceVersion': '5', 'annotations': {CONTENT_HASH_ANNOTATION: 'abc'}}}
+        self.assertEqual(_content_hash(a), _content_hash(b))
+        self.assertEqual(b['metadata']['annotations'][CONTENT_HASH_ANNOTATION], 'abc')  # not modified
+
+        a['data']['a'] = '3'
+        self.assertNotEqual(_content_hash(a), _content_hash(b))
+
+    def test_fetch_resource_versions(self):
+        def versioned(item, version):
+            item['metadata']['resourceVersion'] = version
+            return item
+
+        secret = {'apiVersion': 'v1', 'kind': 'Secret', 'metadata': {'name': 'a', 'namespace': 'ns1'}}
+        objects = [versioned(configmap('a', 'ns1'), '3'), versioned(configmap('a', 'ns2'), '7'),
+                   versioned(dict(secret, metadata=dict(secret['metadata'])), '9')]
+        with FakeCluster(objects) as cluster:
+            items = [configmap('a', 'ns2'), configmap('a', 'ns1'), secret, configmap('missing', 'ns1'),
+                     {'apiVersion': 'v1', 'kind': 'ConfigMap', 'metadata': {'generateName': 'x-'}}]
+            _fetch_resource_versions(items)
+
+            # Objects are matched to their server copies by kind, name and namespace
+            self.assertEqual([item['metadata'].get('resourceVersion') for item in items],
+                             ['7', '3', '9', None, None])
+            # The objects in each namespace are read with a single invocation
+            self.assertEqual(sorted([call[0]] + [arg for arg in call if arg.startswith('--namespace=')]
+                                    for call in cluster.calls()),
+                             [['get', '--namespace=ns1'], ['get', '--namespace=ns2']])
+
+    def test_apply_skip_unchanged(self):
+        with FakeCluster([]) as cluster:
+            apply([configmap('a', 'ns1', x='1'), configmap('b', 'ns2', x='1')], skip_unchanged=True)
+            self.assertEqual(len(cluster.objects()), 2)
+            cluster.calls()
+
+            # Only changed objects are applied; skipped ones are recorded with their namespaces
+            with tracking() as tracker:
+                sel = apply([configmap('a', 'ns1', x='1'), configmap('b', 'ns2', x='2')], skip_unchanged=True)
+            self.assertEqual([call[0] for call in cluster.calls()], ['get', 'get', 'apply'])
+            self.assertEqual(sorted(sel.qnames()), ['configmap/b', 'ns1:configmap/a'])
+            apply_actions = [a for a in tracker.get_result().actions() if a.verb == 'apply']
+            self.assertEqual(apply_actions[0].references['.content_hash_skipped'], ['ns1:configmap/a'])
+
+            # When every object is skipped, the skip is still recorded as an action
+            with tracking() as tracker:
+                sel = apply([configmap('a', 'ns1', x='1'), configmap('b', 'ns2', x='2')], skip_unchanged=True)
+            self.assertEqual([call[0] for call in cluster.calls()], ['get', 'get'])
+            self.assertEqual(sel.qnames(), ['ns1:configmap/a', 'ns2:configmap/b'])
+            self.assertEqual(sel.actions()[0].references['.content_hash_skipped'], sel.qnames())
+            apply_actions = [a for a in tracker.get_result().actions() if a.verb == 'apply']
+            self.assertEqual(apply_actions[0].references['.content_hash_skipped'], sel.qnames())
+
+
+if __name__ == '__main__':
+    unittest.main()
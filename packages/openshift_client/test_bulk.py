@@ -0,0 +1,84 @@
+from __future__ import absolute_import
+
+import unittest
+
+from .bulk import bulk_apply, _parse_apply, _take_reported, _tier, BulkOutcome, FAILED, SUCCESS, UNCHANGED
+from .fakeoc import FakeCluster, configmap
+
+
+def summary(call):
+    """
+    :return: Returns the verb, namespace and object names of an invocation recorded by FakeCluster.
+    """
+    namespace = [arg.split('=', 1)[1] for arg in call if arg.startswith('--namespace=')]
+    return [call[0], namespace[0] if namespace else 'default'] + [arg for arg in call if '/' in arg]
+
+
+class TestBulk(unittest.TestCase):
+
+    def test_parse_apply(self):
+        out = '''namespace/abc unchanged
+deployment.apps/frontend configured
+Warning: something noteworthy
+configmap/settings created
+'''
+        reported = _parse_apply(out)
+        self.assertEqual(reported, [('namespace/abc', UNCHANGED),
+                                    ('deployment.apps/frontend', SUCCESS),
+                                    ('configmap/settings', SUCCESS)])
+
+        deployment = {'apiVersion': 'apps/v1', 'kind': 'Deployment', 'metadata': {'name': 'frontend'}}
+        self.assertEqual(_take_reported(reported, deployment), SUCCESS)
+        # Each report is only matched once
+        self.assertIsNone(_take_reported(reported, deployment))
+        self.assertEqual(len(reported), 2)
+
+    def test_tiers(self):
+        ns = {'apiVersion': 'v1', 'kind': 'Namespace', 'metadata': {'name': 'abc'}}
+        crd = {'apiVersion': 'apiextensions.k8s.io/v1', 'kind': 'CustomResourceDefinition',
+               'metadata': {'name': 'widgets.example.com'}}
+        sa = {'apiVersion': 'v1', 'kind': 'ServiceAccount', 'metadata': {'name': 'x', 'namespace': 'abc'}}
+        pod = {'apiVersion': 'v1', 'kind': 'Pod', 'metadata': {'name': 'x', 'namespace': 'abc'}}
+        self.assertEqual(_tier(ns), _tier(crd))
+        self.assertTrue(_tier(ns) < _tier(sa) < _tier(pod))
+
+    def test_outcome_names(self):
+        outcome = BulkOutcome({'apiVersion': 'apps/v1', 'kind': 'Deployment',
+                               'metadata': {'name': 'frontend', 'namespace': 'abc'}}, SUCCESS)
+        self.assertEqual(outcome.qname(), 'deployment.apps/frontend')
+        self.assertEqual(outcome.fqname(), 'abc:deployment.apps/frontend')
+
+    def test_bulk_apply(self):
+        with FakeCluster([]) as cluster:
+            namespace = {'apiVersion': 'v1', 'kind': 'Namespace', 'metadata': {'name': 'ns1'}}
+            items = [configmap('a', 'ns1'), configmap('bad', 'ns1'), configmap('b', 'ns1'), configmap('c', 'ns1'),
+                     configmap('d', 'ns2'), configmap('e', 'ns2'), namespace]
+            report = bulk_apply(items, chunk_size=3, parallelism=2)
+
+            # Namespaces are applied first. Each chunk holds at most chunk_size objects from a single namespace.
+            calls = [summary(call) for call in cluster.calls()]
+            self.assertEqual(calls[0], ['apply', 'default', 'namespace/ns1'])
+            # The failing chunk's unreported objects are applied one at a time to find which failed
+            self.assertEqual(sorted(calls[1:]), [
+                ['apply', 'ns1', 'configmap/a', 'configmap/bad', 'configmap/b'], ['apply', 'ns1', 'configmap/b'],
+                ['apply', 'ns1', 'configmap/bad'], ['apply', 'ns1', 'configmap/c'],
+                ['apply', 'ns2', 'configmap/d', 'configmap/e']])
+            self.assertEqual([(outcome.fqname(), outcome.status) for outcome in report.outcomes],
+                             [('ns1:configmap/a', SUCCESS), ('ns1:configmap/bad', FAILED),
+                              ('ns1:configmap/b', SUCCESS), ('ns1:configmap/c', SUCCESS),
+                              ('ns2:configmap/d', SUCCESS), ('ns2:configmap/e', SUCCESS),
+                              ('namespace/ns1', SUCCESS)])
+            self.assertIn('configmap/bad is invalid', report.failed()[0].message)
+            self.assertEqual(report.counts(), {SUCCESS: 6, FAILED: 1, UNCHANGED: 0})
+            self.assertEqual(len(report.actions()), 6)
+            self.assertEqual(len([a for a in report.actions() if not a.last_attempt]), 1)
+            self.assertNotIn('ns1:configmap/bad', report.selector().qnames())
+
+            # Objects oc reports as unchanged
+            report = bulk_apply([configmap('a', 'ns1'), configmap('f', 'ns1')], chunk_size=3)
+            self.assertEqual([outcome.status for outcome in report.outcomes], [UNCHANGED, SUCCESS])
+            self.assertEqual(len(cluster.objects()), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
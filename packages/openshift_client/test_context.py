@@ -0,0 +1,27 @@
+from __future__ import absolute_import
+
+import unittest
+
+from .context import project, cur_context, parallel_map
+
+
+class TestContext(unittest.TestCase):
+
+    def test_parallel_map(self):
+        items = list(range(20))
+        self.assertEqual(parallel_map(lambda i: i * 2, items, parallelism=4), [i * 2 for i in items])
+        self.assertEqual(parallel_map(lambda i: i, [], parallelism=4), [])
+
+        # Workers must observe the context of the calling thread
+        with project('abc'):
+            projects = parallel_map(lambda i: cur_context().get_project(), items, parallelism=4)
+        self.assertEqual(projects, ['abc'] * len(items))
+
+        def fail(i):
+            raise ValueError(i)
+
+        self.assertRaises(ValueError, parallel_map, fail, items, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
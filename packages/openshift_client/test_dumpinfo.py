@@ -0,0 +1,254 @@
+from __future__ import absolute_import
+
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+import unittest
+
+from .apiobject import APIObject
+from .base_verbs import dumpinfo_system
+from .context import set_default_oc_path
+from .dumpinfo import DumpProgress, DumpManifest, ArchiveSink, dump_sink, MANIFEST_FILENAME, MANIFEST_JOURNAL_FILENAME
+from .fakeoc import FakeCluster
+
+# Handles the oc invocations of dumpinfo_system other than get (see FakeCluster). While a file named slow
+# exists beside it, oc logs pod/slow does not complete; it creates a file named waiting while it waits.
+DUMPINFO_SCRIPT = '''
+import time
+objs = selected()
+if verb == 'describe':
+    print('\\n\\n'.join('Name:         {}\\nEvents:       <none>'.format(o['metadata']['name']) for o in objs))
+elif verb == 'logs':
+    while objs[0]['metadata']['name'] == 'slow' and os.path.exists(os.path.join(here, 'slow')):
+        open(os.path.join(here, 'waiting'), 'w').close()
+        time.sleep(0.05)
+    print('log of {}'.format(objs[0]['metadata']['name']))
+elif verb == 'version' and output == 'json':
+    print(json.dumps({'clientVersion': {'gitVersion': 'v4.1.0'}}))
+elif verb == 'version':
+    print('Server Version: 4.2.0')
+elif verb == 'status':
+    print('In project {}'.format(namespace))
+else:
+    sys.exit(1)
+sys.exit(0)
+'''
+
+CLUSTER = [
+    {'apiVersion': 'v1', 'kind': 'Node', 'metadata': {'name': 'n1', 'uid': 'n1', 'resourceVersion': '1',
+                                                      'labels': {'node-role.kubernetes.io/master': ''}}},
+    {'apiVersion': 'project.openshift.io/v1', 'kind': 'Project', 'metadata': {'name': 'p1'}},
+    {'apiVersion': 'project.openshift.io/v1', 'kind': 'Project', 'metadata': {'name': 'p2'}},
+    {'apiVersion': 'v1', 'kind': 'Pod', 'metadata': {'name': 'a', 'namespace': 'p1', 'uid': 'a', 'resourceVersion': '1'},
+     'spec': {'containers': [{'name': 'main'}]}},
+    {'apiVersion': 'v1', 'kind': 'ConfigMap', 'metadata': {'name': 'c', 'namespace': 'p1', 'uid': 'c',
+                                                           'resourceVersion': '1'}},
+    {'apiVersion': 'v1', 'kind': 'Pod', 'metadata': {'name': 'slow', 'namespace': 'p2', 'uid': 's',
+                                                     'resourceVersion': '1'},
+     'spec': {'containers': [{'name': 'main'}]}},
+]
+
+
+class TestDumpInfo(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_progress(self):
+        path = os.path.join(self.dir, 'progress')
+        with DumpProgress(path) as progress:
+            progress.complete('node:a')
+            progress.complete('object:ns:pod/p')
+            progress.complete('node:a')
+
+        # Simulate an interruption while a task was being recorded
+        with open(path, 'a') as f:
+            f.write('object:ns:pod/q')
+
+        with DumpProgress(path, resume=True) as progress:
+            self.assertTrue(progress.is_complete('node:a'))
+            self.assertTrue(progress.is_complete('object:ns:pod/p'))
+            self.assertFalse(progress.is_complete('object:ns:pod/q'))
+            progress.complete('object:ns:pod/r')
+
+        with DumpProgress(path, resume=True) as progress:
+            self.assertTrue(progress.is_complete('object:ns:pod/r'))
+
+        with DumpProgress(path) as progress:
+            self.assertFalse(progress.is_complete('node:a'))
+
+    def test_directory_sink(self):
+        sink = dump_sink(self.dir).child('project', 'x')
+        sink.write('status.txt', u'\u00e9')
+        with sink.child('pod').open('p.logs.txt') as f:
+            f.write(u'logs')
+        self.assertEqual(sink.local_path('status.txt'), os.path.join(self.dir, 'project', 'x', 'status.txt'))
+        with io.open(os.path.join(self.dir, 'project', 'x', 'pod', 'p.logs.txt'), encoding='utf-8') as f:
+            self.assertEqual(f.read(), u'logs')
+
+    def test_archive_sink(self):
+        path = os.path.join(self.dir, 'dump.tar.gz')
+        with ArchiveSink(path) as sink:
+            self.assertIsNone(sink.local_path('status.txt'))
+            sink.child('a').write('cm.json', u'{"data": 1}')
+            sink.child('b').write('cm.json', u'{"data": 1}')
+            with sink.child('node', 'n').open('journal.export', binary=True) as f:
+                f.write(b'\x00' * 100)
+
+        with tarfile.open(path, mode='r:gz') as tar:
+            members = tar.getmembers()
+            self.assertEqual([m.name for m in members], ['a/cm.json', 'b/cm.json', 'node/n/journal.export'])
+            self.assertTrue(members[1].islnk())
+            self.assertEqual(members[1].linkname, 'a/cm.json')
+            self.assertEqual(tar.extractfile('b/cm.json').read(), b'{"data": 1}')
+            self.assertEqual(tar.extractfile('node/n/journal.export').read(), b'\x00' * 100)
+
+    def test_manifest(self):
+        def pod(uid, resource_version):
+            return APIObject(dict_to_model={'apiVersion': 'v1', 'kind': 'Pod',
+                                            'metadata': {'name': 'p', 'namespace': 'ns', 'uid': uid,
+                                                         'resourceVersion': resource_version}})
+
+        sink = dump_sink(self.dir)
+        sink.child('pod').write('p.json', u'{}')
+        manifest = DumpManifest()
+        manifest.record(pod('u1', '5'), [sink.child('pod').entry_name('p.json')])
+        manifest.save(sink)
+
+        previous = DumpManifest.load(self.dir)
+        self.assertEqual(previous.unchanged_files(pod('u1', '5')), [os.path.join(self.dir, 'pod', 'p.json')])
+        self.assertIsNone(previous.unchanged_files(pod('u1', '6')))
+        self.assertIsNone(previous.unchanged_files(pod('u2', '5')))
+
+        # Files missing from the previous dump must be collected again
+        os.remove(os.path.join(self.dir, 'pod', 'p.json'))
+        self.assertIsNone(previous.unchanged_files(pod('u1', '5')))
+
+        # Unchanged files are hard linked into the next dump
+        source = os.path.join(self.dir, MANIFEST_FILENAME)
+        dump_sink(os.path.join(self.dir, 'next')).child('pod').link('p.json', source)
+        self.assertTrue(os.path.samefile(os.path.join(self.dir, 'next', 'pod', 'p.json'), source))
+
+    def test_manifest_journal(self):
+        def pod(name):
+            return APIObject(dict_to_model={'apiVersion': 'v1', 'kind': 'Pod',
+                                            'metadata': {'name': name, 'namespace': 'ns', 'uid': name,
+                                                         'resourceVersion': '1'}})
+
+        journal_path = os.path.join(self.dir, MANIFEST_JOURNAL_FILENAME)
+        manifest = DumpManifest()
+        manifest.open_journal(journal_path)
+        manifest.record(pod('a'), ['pod/a.json'])
+        manifest.record(pod('b'), ['pod/b.json'])
+        manifest.close()
+
+        # Simulate a dump killed while an entry was written and before the manifest was saved
+        with io.open(journal_path, mode='a', encoding='utf-8') as f:
+            f.write(u'["pod:ns/c", {"uid"')
+        self.assertFalse(os.path.exists(os.path.join(self.dir, MANIFEST_FILENAME)))
+
+        resumed = DumpManifest.load(self.dir)
+        self.assertEqual(sorted(resumed.objects), [pod('a').fqname(), pod('b').fqname()])
+
+        resumed.open_journal(journal_path, resume=True)
+        with resumed.saving(dump_sink(self.dir)):
+            resumed.record(pod('c'), ['pod/c.json'])
+        loaded = DumpManifest.load(self.dir)
+        self.assertEqual(len(loaded.objects), 3)
+        self.assertEqual(loaded.objects[pod('c').fqname()]['files'], ['pod/c.json'])
+
+        # Not resuming starts a new journal
+        manifest = DumpManifest()
+        manifest.open_journal(journal_path)
+        manifest.close()
+        self.assertEqual(os.path.getsize(journal_path), 0)
+
+    def test_dumpinfo_system(self):
+        dump_dir = os.path.join(self.dir, 'dump')
+
+        def calls():
+            return [' '.join(a for a in call if not a.startswith('-')) for call in oc.calls()]
+
+        def read(name):
+            with io.open(os.path.join(dump_dir, name), encoding='utf-8') as f:
+                return f.read()
+
+        def fail_configmap(message):
+            if message == 'Gathering information for p1:configmap/c':
+                raise IOError('disk full')
+
+        def wait_for(condition):
+            # Only bounds how long a broken test takes to fail
+            deadline = time.time() + 60
+            while not condition():
+                self.assertLess(time.time(), deadline)
+                time.sleep(0.05)
+
+        def progress(directory):
+            path = os.path.join(directory, 'dumpinfo.progress')
+            if not os.path.exists(path):
+                return []
+            with io.open(path, encoding='utf-8') as f:
+                return sorted(f.read().split())
+
+        partial = ['node:n1', 'object:p1:pod/a', 'overview']
+        with FakeCluster(CLUSTER, script=DUMPINFO_SCRIPT) as oc:
+            open(oc.file('slow'), 'w').close()
+            errors = []
+
+            def run():
+                # The default oc path is thread local
+                set_default_oc_path(oc.path)
+                try:
+                    dumpinfo_system(dump_dir, dump_core_projects=False, additional_projects=['p1', 'p2', 'p3'],
+                                    parallelism=2, status_printer=fail_configmap)
+                except Exception as e:
+                    errors.append(e)
+
+            thread = threading.Thread(target=run)
+            thread.start()
+
+            # What is on disk while pod/slow is being collected is what an interrupted dump leaves behind: the
+            # object whose collection failed, and the one still being collected, are not recorded. Neither are
+            # their projects, nor p3, which is recorded after p2.
+            wait_for(lambda: os.path.exists(oc.file('waiting')) and
+                     set(partial) <= set(progress(dump_dir)))
+            self.assertEqual(progress(dump_dir), partial)
+            self.assertIn('log of a', read('project/p1/pod/a.logs.txt'))
+            interrupted_dir = os.path.join(self.dir, 'interrupted')
+            shutil.copytree(dump_dir, interrupted_dir)
+
+            os.remove(oc.file('slow'))
+            thread.join()
+            self.assertEqual(errors, [])
+            self.assertEqual(sorted(DumpManifest.load(dump_dir).objects), ['p1:pod/a', 'p2:pod/slow'])
+            self.assertEqual(progress(dump_dir), ['node:n1', 'object:p1:pod/a', 'object:p2:pod/slow', 'overview',
+                                                  'project:project/p2', 'project:project/p3'])
+            calls()
+
+            # Resuming the interrupted dump collects only what is missing
+            self.assertEqual(list(DumpManifest.load(interrupted_dir).objects), ['p1:pod/a'])
+            dump_dir = interrupted_dir
+            dumpinfo_system(dump_dir, dump_core_projects=False, additional_projects=['p1', 'p2', 'p3'],
+                            parallelism=2, status_printer=None, resume=True)
+            resumed = calls()
+            self.assertEqual(sorted(c for c in resumed if c.startswith(('describe', 'logs'))),
+                             ['describe configmap/c', 'describe pod/slow', 'logs pod/slow main'])
+            self.assertNotIn('describe node/n1', resumed)
+
+            self.assertEqual(sorted(DumpManifest.load(dump_dir).objects), ['p1:configmap/c', 'p1:pod/a', 'p2:pod/slow'])
+            self.assertEqual(progress(dump_dir),
+                             ['node:n1', 'object:p1:configmap/c', 'object:p1:pod/a', 'object:p2:pod/slow', 'overview',
+                              'project:project/p1', 'project:project/p2', 'project:project/p3'])
+            self.assertIn('log of slow', read('project/p2/pod/slow.logs.txt'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+from __future__ import absolute_import
+
+import sys
+import unittest
+import warnings
+
+from . import jsoncodec
+from .model import Model
+
+
+class TestJSONCodec(unittest.TestCase):
+
+    def _codecs(self):
+        codecs = [jsoncodec.StdlibJSONCodec()]
+        try:
+            codecs.append(jsoncodec.OrjsonCodec())
+        except ImportError:
+            pass
+        return codecs
+
+    def test_round_trip(self):
+        obj = {'kind': 'List', 'items': [{'metadata': {'name': u'é'}, 'spec': {'replicas': 2, 'paused': False}}]}
+        for codec in self._codecs():
+            for indent in (None, 2, 4):
+                self.assertEqual(codec.loads(codec.dumps(obj, indent=indent)), obj)
+                self.assertEqual(codec.loads(codec.dumpb(obj, indent=indent)), obj)
+            self.assertEqual(codec.loads(codec.dumps(Model(obj))), obj)
+
+            # Values outside of what a fast codec supports should still be handled
+            self.assertEqual(codec.loads(codec.dumps({1: 2 ** 70})), {'1': 2 ** 70})
+            self.assertRaises(ValueError, codec.loads, '{not json')
+
+    def test_set_codec(self):
+        previous = jsoncodec.set_json_codec('json')
+        try:
+            self.assertEqual(jsoncodec.get_json_codec().name, 'json')
+            self.assertEqual(jsoncodec.dumps({'a': 1}), '{"a": 1}')
+        finally:
+            jsoncodec.set_json_codec(previous)
+        self.assertIs(jsoncodec.get_json_codec(), previous)
+
+        self.assertRaises(ValueError, jsoncodec.set_json_codec, 'yaml')
+        self.assertIs(jsoncodec.get_json_codec(), previous)
+
+    def test_default_codec(self):
+        default = jsoncodec.DEFAULT_JSON_CODEC
+        orjson = sys.modules.get('orjson')
+        try:
+            # Unknown codecs fall back to the json module rather than failing the import
+            jsoncodec.DEFAULT_JSON_CODEC = 'yaml'
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                self.assertEqual(jsoncodec._default_codec().name, 'json')
+            self.assertIn('yaml', str(caught[0].message))
+
+            # As do codecs which cannot be imported
+            jsoncodec.DEFAULT_JSON_CODEC = 'orjson'
+            sys.modules['orjson'] = None
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                self.assertEqual(jsoncodec._default_codec().name, 'json')
+            self.assertIn('unavailable', str(caught[0].message))
+        finally:
+            jsoncodec.DEFAULT_JSON_CODEC = default
+            if orjson is None:
+                del sys.modules['orjson']
+            else:
+                sys.modules['orjson'] = orjson
+
+
+if __name__ == '__main__':
+    unittest.main()
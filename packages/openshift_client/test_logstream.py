@@ -0,0 +1,116 @@
+from __future__ import absolute_import
+
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from .context import cur_context, timeout
+from .fakeoc import FakeOc
+from .logstream import log_args, stream_log_sources, merge_log_sources, parse_timestamp, LogCursors, _LineSplitter
+
+# Stands in for oc. Prints the name of the container it is asked for, a line at a time, and does not
+# exit when --follow is specified. With --timestamps, the line for each second has a fraction which
+# depends on the container (e.g. container '12' writes at 0.12s, 1.12s, ...).
+FAKE_OC = '''#!/bin/sh
+for arg in "$@"; do
+    [ "$prev" = "-c" ] && container="$arg"
+    [ "$arg" = "--follow" ] && follow=1
+    [ "$arg" = "--timestamps" ] && timestamps=1
+    prev="$arg"
+done
+[ "$container" = "bad" ] && { echo "container is waiting" >&2; exit 1; }
+i=0
+while [ -n "$follow" ] || [ $i -lt 3 ]; do
+    [ -n "$timestamps" ] && printf "2024-01-01T00:00:0$i.${container}Z "
+    echo "$container $i"
+    i=$((i + 1))
+    sleep 0.05
+done
+'''
+
+
+class TestLogStream(unittest.TestCase):
+
+    def setUp(self):
+        self.oc = FakeOc(FAKE_OC)
+
+    def tearDown(self):
+        self.oc.close()
+
+    def sources(self, containers, follow=False, timestamps=False):
+        args = log_args(follow=follow, timestamps=timestamps)
+        return [(c, cur_context(), dict(cmd_args=[args, 'pod/p', '-c', c], no_namespace=True)) for c in containers]
+
+    def test_log_args(self):
+        since_time = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=1)))
+        self.assertEqual(log_args(follow=True, since_time=since_time, timestamps=True),
+                         ['--follow', '--since-time=2024-01-02T02:04:05.000000Z', '--timestamps', '--tail=-1'])
+
+    def test_line_splitter(self):
+        lines = []
+        splitter = _LineSplitter(lines.append)
+        for chunk in (b'a\nb', b'c\n\nd', b''):
+            splitter(chunk)
+        splitter.flush()
+        self.assertEqual(lines, [b'a', b'bc', b'', b'd'])
+
+    def test_stream(self):
+        received = {}
+        for name, line in stream_log_sources(self.sources(['a', 'b', 'bad'], follow=False), max_buffered_lines=1):
+            received.setdefault(name, []).append(line)
+        self.assertEqual(received['a'], ['a 0', 'a 1', 'a 2'])
+        self.assertEqual(received['b'], ['b 0', 'b 1', 'b 2'])
+        self.assertEqual(received['bad'], ['>>>>Error during log collection rc=1<<<<', 'container is waiting'])
+
+    def test_parse_timestamp(self):
+        self.assertEqual(parse_timestamp('2024-01-02T02:04:05.5Z'), parse_timestamp('2024-01-02T03:04:05.500+01:00'))
+        self.assertLess(parse_timestamp('2024-01-02T02:04:05.1Z'), parse_timestamp('2024-01-02T02:04:05.12Z'))
+        self.assertIsNone(parse_timestamp('line'))
+
+    def test_merge(self):
+        records = list(merge_log_sources(self.sources(['12', '1', 'bad', '2'], timestamps=True),
+                                         max_buffered_lines=1))
+        self.assertEqual(records[:2], [(None, 'bad', '>>>>Error during log collection rc=1<<<<'),
+                                       (None, 'bad', 'container is waiting')])
+        self.assertEqual([line for _, _, line in records[2:]],
+                         ['1 0', '12 0', '2 0', '1 1', '12 1', '2 1', '1 2', '12 2', '2 2'])
+        self.assertEqual(records[2], ('2024-01-01T00:00:00.1Z', '1', '1 0'))
+
+    def test_cursors(self):
+        path = self.oc.file('cursors.json')
+        cursors = LogCursors(path)
+        self.assertEqual(cursors.log_args('uid/c', ['--since=1h', '--tail=-1']),
+                         ['--since=1h', '--tail=-1', '--timestamps'])
+        self.assertEqual(cursors.advance('uid/c', '2024-01-01T00:00:00.5Z a\n2024-01-01T00:00:01.2Z b\n'), 'a\nb')
+        cursors.save()
+
+        # The server returns the whole second of the last line again
+        cursors = LogCursors(path)
+        self.assertEqual(cursors.log_args('uid/c', ['--since=1h', '--tail=-1']),
+                         ['--tail=-1', '--timestamps', '--since-time=2024-01-01T00:00:01.000000Z'])
+        output = '2024-01-01T00:00:01.2Z b\n2024-01-01T00:00:01.7Z c\n2024-01-01T00:00:02Z d\n'
+        self.assertEqual(cursors.advance('uid/c', output, timestamps=True),
+                         '2024-01-01T00:00:01.7Z c\n2024-01-01T00:00:02Z d')
+        self.assertEqual(cursors.advance('uid/c', output), '')
+
+        # Unused cursors are discarded
+        cursors.retention_seconds = -1
+        cursors.save()
+        self.assertEqual(LogCursors(path).cursors, {})
+
+    def test_follow_cancellation(self):
+        start = time.time()
+        with timeout(1):
+            received = list(stream_log_sources(self.sources(['a', 'b'], follow=True)))
+        self.assertIn(('a', 'a 0'), received)
+        self.assertLess(time.time() - start, 10)
+
+        stream = stream_log_sources(self.sources(['a', 'b'], follow=True), max_buffered_lines=2)
+        self.assertEqual(next(stream)[1][2:], '0')
+        start = time.time()
+        stream.close()
+        self.assertLess(time.time() - start, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
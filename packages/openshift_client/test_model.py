@@ -1,5 +1,7 @@
 from __future__ import absolute_import
 
+import copy
+import json
 import unittest
 
 from .model import *
@@ -439,6 +441,84 @@ class TestModel(unittest.TestCase):
             }
         ))
 
+    def test_dirty_tracking(self):
+        m = Model({
+            'metadata': {'name': 'x', 'resourceVersion': '5', 'labels': {'a': '1', 'b': '2'}},
+            'spec': {'replicas': 1, 'containers': [{'name': 'c', 'image': 'i1'}]},
+        })
+        self.assertEqual(m._dirty_paths(), [])
+        self.assertEqual(m._merge_patch(), {})
+
+        m.spec.replicas = 3
+        m.metadata.labels.a = '9'
+        del m.metadata.labels['b']
+        m.spec.containers[0].image = 'i2'
+        self.assertEqual(m._dirty_paths(), [('metadata', 'labels', 'a'), ('metadata', 'labels', 'b'),
+                                            ('spec', 'containers'), ('spec', 'replicas')])
+        self.assertEqual(m._merge_patch(), {
+            'metadata': {'labels': {'a': '9', 'b': None}},
+            'spec': {'replicas': 3, 'containers': [{'name': 'c', 'image': 'i2'}]},
+        })
+        self.assertEqual(m._json_patch()[1], {'op': 'remove', 'path': '/metadata/labels/b'})
+
+        # Paths nested within a modified path are not reported separately
+        m.metadata.labels = {'z': '1'}
+        self.assertEqual(m._dirty_paths()[0], ('metadata', 'labels'))
+        m.metadata.labels.y = '2'
+        # Keys dropped by replacing a dict are removed
+        self.assertEqual(m._merge_patch()['metadata'], {'labels': {'a': None, 'b': None, 'z': '1', 'y': '2'}})
+
+        m._clear_dirty()
+        self.assertEqual(m._merge_patch(), {})
+
+        # Copies start without recorded modifications
+        m.spec.containers.append({'name': 'd'})
+        self.assertEqual(copy.deepcopy(m)._dirty_paths(), [])
+        self.assertEqual(copy.deepcopy(m), m)
+
+    def test_merge_patch(self):
+        m = Model({'a': {'x': 1}, 'spec': {'l': [1, 2, 3], 'keep': True}})
+
+        m.spec.l.clear()
+        self.assertEqual(m._merge_patch(), {'spec': {'l': []}})
+
+        # Assigning a subtree copies it, so the two positions are modified independently
+        m.b = m.a
+        m.a.x = 2
+        self.assertEqual(m._merge_patch(), {'a': {'x': 2}, 'b': {'x': 1}, 'spec': {'l': []}})
+        self.assertEqual(m.b.x, 1)
+
+        m._clear_dirty()
+        self.assertEqual(m._merge_patch(), {})
+        m.spec.l *= 2
+        m.spec.l[0:0] = [{'n': 1}]
+        m.spec.l[0].n = 2
+        self.assertEqual(m._merge_patch(), {'spec': {'l': [{'n': 2}]}})
+        del m.spec.l[:]
+        m.spec.l.extend([1])
+        self.assertEqual(m._merge_patch(), {'spec': {'l': [1]}})
+
+        # Restoring the original content leaves nothing to patch
+        m.spec.l.clear()
+        self.assertEqual(m._merge_patch(), {})
+
+    def test_primitive_cache(self):
+        m = Model({'spec': {'containers': [{'name': 'c', 'env': [{'name': 'a', 'value': '1'}]}]}})
+        d = m._primitive()
+        self.assertIs(m._primitive_view(), m._primitive_view())
+        self.assertIs(m._json(indent=4), m._json(indent=4))
+
+        # Copies returned by _primitive can be modified without affecting the cache
+        d['spec']['containers'][0]['name'] = 'x'
+        self.assertEqual(m._primitive()['spec']['containers'][0]['name'], 'c')
+
+        # Modifications anywhere in the tree invalidate cached forms
+        m.spec.containers[0].env[0].value = '2'
+        self.assertEqual(m._primitive()['spec']['containers'][0]['env'][0]['value'], '2')
+        self.assertEqual(json.loads(m._json(indent=4)), m._primitive())
+        del m.spec['containers']
+        self.assertEqual(json.loads(m._json()), {'spec': {}})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,71 @@
+from __future__ import absolute_import
+
+import unittest
+
+from .apiobject import APIObject
+from .predicates import where, label, field
+from .selector import selector
+
+
+def _pod(name, labels=None, phase='Running'):
+    return APIObject(dict_to_model={
+        'apiVersion': 'v1',
+        'kind': 'Pod',
+        'metadata': {
+            'name': name,
+            'labels': labels or {},
+        },
+        'status': {
+            'phase': phase,
+        }
+    })
+
+
+class TestPredicates(unittest.TestCase):
+
+    def test_matches(self):
+        p = _pod('a', labels={'app': 'x', 'enabled': 'true'}, phase='Pending')
+        self.assertTrue(where(label('app') == 'x', field('status.phase') != 'Running')(p))
+        self.assertFalse(where(label('app') == 'x', field('status.phase') == 'Running')(p))
+        self.assertTrue(where(label('app').in_(['x', 'y']), label('tier').absent())(p))
+        self.assertFalse(where(label('app').not_in(['x']))(p))
+        self.assertTrue(where(label('enabled') == True)(p))
+        self.assertTrue(where(label('tier') != 'web', label('tier') == None)(p))
+
+        # Absent fields compare as empty, like the server
+        self.assertTrue(where(field('spec.nodeName') == '')(p))
+
+    def test_split(self):
+        labels, fields, residual = where(label('app') == 'x',
+                                         label('app') != 'y',
+                                         label('tier').exists(),
+                                         field('status.phase') != 'Running',
+                                         field('spec.replicas') == 2).split(['pod'], {'region': 'east'}, None)
+        self.assertEqual(labels, {'region': 'east', 'app': 'x', '!app': 'y', '!tier': None})
+        self.assertEqual(fields, {'!status.phase': 'Running'})
+        # Unsupported field selectors are evaluated client side
+        self.assertEqual(len(residual), 1)
+
+        # A field is only pushed down if every kind supports it
+        labels, fields, residual = where(field('status.phase') == 'Running').split(['pod', 'service'], None, None)
+        self.assertIsNone(fields)
+        self.assertEqual(len(residual), 1)
+
+        # A second requirement for the same key cannot be expressed in the labels dict
+        labels, fields, residual = where(label('app') == 'y').split(['pod'], {'app': 'x'}, None)
+        self.assertEqual(labels, {'app': 'x'})
+        self.assertEqual(len(residual), 1)
+
+    def test_narrow_pushdown(self):
+        sel = selector('pods', labels={'app': 'x'}, all_namespaces=True)
+        narrowed = sel.narrow(where(label('tier') == 'web', field('status.phase') != 'Running'))
+        self.assertTrue(narrowed.all_namespaces)
+        self.assertEqual(narrowed._selection_args(),
+                         ['pod', '--field-selector=status.phase!=Running', '--selector=app=x,tier=web'])
+
+        plan = selector('pods').union(selector('services')).narrow(label('app').exists()).explain()
+        self.assertIn('get -o=name pod,service --selector=app', plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
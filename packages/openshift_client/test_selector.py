@@ -2,8 +2,88 @@ from __future__ import absolute_import
 
 import unittest
 
-from .selector import selector
-from .naming import qname_matches
+from .apiobject import APIObject
+from .context import project
+from .fakeoc import FakeCluster, FakeOc
+from .logstream import LogCursors
+from .selector import selector, _encode_continue_token, _decode_continue_token, _chunk_names, \
+    _split_describe_output, describe_objects
+from .naming import qname_matches, split_fqn
+
+# Stands in for oc describe, separating the description of each object named like oc does. The description
+# of pod/tricky contains a line which looks like the start of another description, and pod/gone does not exist.
+FAKE_OC = '''#!/bin/sh
+qnames=
+for arg in "$@"; do
+    case "$arg" in */*) qnames="$qnames $arg" ;; esac
+done
+echo $qnames >> "$(dirname "$0")/calls"
+rc=0
+first=1
+for qname in $qnames; do
+    name="${qname#*/}"
+    if [ "$name" = "gone" ]; then
+        echo "Error from server (NotFound): pods \\"gone\\" not found" >&2
+        rc=1
+        continue
+    fi
+    [ -z "$first" ] && printf "\\n\\n"
+    first=
+    printf "Name:         %s\\nNamespace:    ns\\n" "$name"
+    [ "$name" = "tricky" ] && printf "Data\\n====\\n\\nName: a\\n"
+    printf "Events:       <none>\\n"
+done
+exit $rc
+'''
+
+PODS = [{'kind': 'Pod', 'apiVersion': 'v1', 'metadata': {'name': name, 'namespace': 'ns', 'uid': 'u' + name},
+         'spec': {'containers': [{'name': 'c'}]}} for name in ('a', 'b')]
+
+# Handles oc logs for FakeCluster, printing a line identifying the pod and whether -p (previous) was given.
+LOGS_SCRIPT = '''
+if verb == 'logs':
+    pod = [target for target in targets if target.startswith('pod/')][0]
+    print('2024-01-01T00:00:01Z ' + pod + (' previous' if '-p' in args else ''))
+    sys.exit(0)
+'''
+
+CONFIGMAPS = [{'kind': 'ConfigMap', 'apiVersion': 'v1', 'metadata': {'name': 'cm{:02d}'.format(i), 'namespace': 'ns'}}
+              for i in range(25)]
+
+# Handles oc describe for FakeCluster. The first object of each invocation is written to described when it
+# starts and ends. Describing configmap/cm00 is slow.
+REPORT_SCRIPT = '''
+import time
+if verb == 'describe':
+    with open(os.path.join(here, 'described'), 'a') as f:
+        f.write('start {}\\n'.format(targets[0]))
+    if targets[0] == 'configmap/cm00':
+        time.sleep(0.5)
+    print('\\n\\n'.join('Name:         {}\\nNamespace:    {}\\nEvents:       <none>'.format(o['metadata']['name'],
+                                                                                     namespace) for o in selected()))
+    with open(os.path.join(here, 'described'), 'a') as f:
+        f.write('end {}\\n'.format(targets[0]))
+    sys.exit(0)
+'''
+
+# Stands in for any oc verb, writing its arguments to calls. start-build prints the name of a build.
+FAKE_VERBS_OC = '''#!/bin/sh
+echo "$@" >> "$(dirname "$0")/calls"
+if [ "$1" = "start-build" ]; then
+    for arg in "$@"; do
+        case "$arg" in */*) echo "build/${arg#*/}-1" ;; esac
+    done
+fi
+'''
+
+
+class _CountingCursors(LogCursors):
+
+    saves = 0
+
+    def save(self):
+        self.saves += 1
+        super(_CountingCursors, self).save()
 
 
 class TestSelector(unittest.TestCase):
@@ -28,6 +108,7 @@ class TestSelector(unittest.TestCase):
         s1 = selector([])
         s2 = selector(['pod/abc', 'pod/xyz'])
         self.assertEqual(s1.subtract(s2).qnames(), [])
+        self.assertEqual(s1.columns(['metadata.name']), [])
         self.assertEqual(s1.union(s2).qnames(), ['pod/abc', 'pod/xyz'])
 
         s3 = selector(['pod/abc2', 'pod/xyz'])
@@ -48,6 +129,174 @@ class TestSelector(unittest.TestCase):
         self.assertEqual(len(t1.intersect(t2).qnames()), 1)
         self.assertEqual(len(t1.subtract(t2).qnames()), 0)
 
+    def test_chunk_names(self):
+        self.assertEqual(_chunk_names([]), [])
+        names = ['pod/p{}'.format(i) for i in range(1000)]
+        chunks = _chunk_names(names)
+        self.assertTrue(len(chunks) > 1)
+        # Chunks are consecutive so that results can be concatenated in order
+        self.assertEqual([n for chunk in chunks for n in chunk], names)
+        self.assertEqual(len(selector(names)._selection_chunks()), len(chunks))
+        self.assertEqual(len(selector('pods')._selection_chunks()), 1)
+
+    def test_namespace_qualified(self):
+        self.assertTrue(qname_matches('ns1:pod/x', ['pod/x']))
+        self.assertTrue(qname_matches('ns1:pod/x', ['ns1:pod/x']))
+        self.assertFalse(qname_matches('ns1:pod/x', ['ns2:pod/x']))
+        self.assertTrue(qname_matches('clusterrole/system:admin', ['clusterrole/system:admin']))
+
+        sel = selector(['ns2:pods/b', 'ns1:po/a', 'svc/c', 'ns2:pod/d'])
+        self.assertEqual(sel.qnames(), ['ns2:pod/b', 'ns1:pod/a', 'service/c', 'ns2:pod/d'])
+        self.assertEqual(sel._selection_chunks(),
+                         [('ns2', ['pod/b', 'pod/d']), ('ns1', ['pod/a']), (None, ['service/c'])])
+
+        # Results gathered per namespace are returned in the order of the selector's names
+        self.assertEqual(sel._qualified_names([]), [])
+        found = ['ns2:pod/d', 'service/c', 'ns1:pod/a', 'ns2:pod/b']
+        self.assertEqual(sel._restore_order(found, split_fqn), sel.qnames())
+
+        self.assertEqual(sel.narrow('pod').qnames(), ['ns2:pod/b', 'ns1:pod/a', 'ns2:pod/d'])
+        self.assertEqual(sel.subtract(selector(['ns2:pod/b', 'ns2:pod/a'])).qnames(),
+                         ['ns1:pod/a', 'service/c', 'ns2:pod/d'])
+
+    def test_pages(self):
+        self.assertEqual(list(selector([]).pages()), [])
+
+        state = {'kind': 1, 'continue': 'eyJ2IjoibWV0YS5rOHMuaW8vdjEiLCJydiI6MX0'}
+        self.assertEqual(_decode_continue_token(_encode_continue_token(state)), state)
+        self.assertRaises(ValueError, _decode_continue_token, 'not a token')
+
+    def test_lazy_plan(self):
+        pods = selector('pods', labels={'app': 'x'})
+        others = selector(['service', 'configmap'], labels={'app': 'x'})
+
+        # Queries differing only by kind should compile into a single invocation
+        plan = pods.union(others).explain()
+        self.assertIn('oc invocations: 1', plan)
+        self.assertIn('get -o=name pod,service,configmap --selector=app=x', plan)
+
+        # Identical subqueries should only be executed once
+        self.assertIn('oc invocations: 1', pods.union(others).subtract(pods).explain())
+
+        # narrow by kind should be pushed down into the query
+        plan = pods.union(others).narrow('svc').explain()
+        self.assertIn('get -o=name service --selector=app=x', plan)
+
+        # A kind which cannot be selected should not require any invocation
+        self.assertIn('oc invocations: 0', pods.narrow('configmap').explain())
+        self.assertEqual(pods.narrow('configmap').qnames(), [])
+
+        # Different label selectors cannot be merged
+        self.assertIn('oc invocations: 2', pods.union(selector('service', labels={'app': 'y'})).explain())
+
+        # Kinds which cannot be resolved locally are not merged
+        self.assertIn('oc invocations: 2', pods.union(selector('all', labels={'app': 'x'})).explain())
+
+        static = selector(['pod/abc', 'service/xyz'])
+        self.assertEqual(static.union(pods).narrow('service').qnames(), ['service/xyz'])
+
+        # Kinds match with or without their group
+        plan = selector('deployment').narrow('deployment.apps').explain()
+        self.assertIn('oc invocations: 1', plan)
+        self.assertIn('get -o=name deployment.apps', plan)
+        plan = selector('deployment.apps').narrow('deployment').explain()
+        self.assertIn('oc invocations: 1', plan)
+        self.assertIn('narrow: deployment', plan)
+        self.assertEqual(selector(['deployment/a', 'pod/b']).narrow('deployment.apps').qnames(), ['deployment/a'])
+        self.assertEqual(selector(['deployment.apps/a', 'pod/b']).narrow('deployment').qnames(),
+                         ['deployment.apps/a'])
+
+        # Kinds which cannot be resolved locally are filtered client side rather than assumed absent
+        plan = pods.narrow('widget').explain()
+        self.assertIn('oc invocations: 1', plan)
+        self.assertIn('narrow: widget', plan)
+
+    def test_split_describe_output(self):
+        out = 'Name:   a\nEvents: <none>\n\n\nName:   b\n  Name:  x\nEvents: <none>\n'
+        self.assertEqual(_split_describe_output(out, ['b', 'a']),
+                         {'a': 'Name:   a\nEvents: <none>', 'b': 'Name:   b\n  Name:  x\nEvents: <none>'})
+        self.assertIsNone(_split_describe_output(out, ['a']))
+        self.assertIsNone(_split_describe_output(out, ['a', 'b', 'c']))
+        self.assertIsNone(_split_describe_output('Warning: x\n' + out, ['a', 'b']))
+
+    def test_describe_objects(self):
+        with FakeOc(FAKE_OC) as oc:
+            def objs(*names):
+                return [APIObject(dict_to_model={'apiVersion': 'v1', 'kind': 'Pod',
+                                                 'metadata': {'name': name, 'namespace': 'ns'}}) for name in names]
+
+            # A single invocation for all objects of a kind and namespace
+            self.assertEqual(describe_objects(objs('a', 'b', 'a')),
+                             ['Name:         a\nNamespace:    ns\nEvents:       <none>',
+                              'Name:         b\nNamespace:    ns\nEvents:       <none>',
+                              'Name:         a\nNamespace:    ns\nEvents:       <none>'])
+            self.assertEqual(oc.lines(), ['pod/a pod/b'])
+
+            # Errors and ambiguous output fall back to describing objects individually
+            descriptions = describe_objects(objs('a', 'tricky', 'gone'))
+            self.assertEqual(descriptions[0], 'Name:         a\nNamespace:    ns\nEvents:       <none>')
+            self.assertIn('Name: a', descriptions[1])
+            self.assertIn('(NotFound)', descriptions[2])
+            self.assertEqual(sorted(oc.lines()), ['pod/a', 'pod/a pod/tricky pod/gone', 'pod/gone', 'pod/tricky'])
+
+    def test_logs_cursors(self):
+        with FakeCluster(PODS, script=LOGS_SCRIPT) as oc, project('ns'):
+            cursors = _CountingCursors(oc.file('cursors.json'))
+            logs = selector('pod').logs(timestamps=True, cursors=cursors)
+            stamp = '2024-01-01T00:00:01Z '
+            self.assertEqual(sorted(logs.values()), [stamp + 'pod/a', stamp + 'pod/b'])
+            # Positions are saved once per call, not once per object
+            self.assertEqual(cursors.saves, 1)
+
+            # The logs of previous container instances are tracked separately
+            logs = selector('pod').logs(timestamps=True, previous=True, cursors=cursors)
+            self.assertEqual(sorted(logs.values()), [stamp + 'pod/a previous', stamp + 'pod/b previous'])
+            self.assertEqual(sorted(cursors.cursors), ['ua/c', 'ua/c#previous', 'ub/c', 'ub/c#previous'])
+            self.assertEqual(selector('pod').logs(timestamps=True, cursors=cursors), {
+                'ns:pod/a->pod/a(c)': '', 'ns:pod/b->pod/b(c)': ''})
+
+            pod = selector('pod').objects()[0]
+            pod.logs(timestamps=True, cursors=cursors)
+            self.assertEqual(cursors.saves, 4)
+
+    def test_iter_report(self):
+        with FakeCluster(CONFIGMAPS, script=REPORT_SCRIPT) as oc, project('ns'):
+            # Objects are described in windows of 10. The second window is collected before the first, but
+            # entries are still generated in the order of the selected objects.
+            entries = list(selector('configmap').iter_report(parallelism=2))
+            self.assertEqual([fqname for fqname, _ in entries], ['ns:configmap/cm{:02d}'.format(i) for i in range(25)])
+            self.assertEqual(entries[11][1]['describe'], 'Name:         cm11\nNamespace:    ns\nEvents:       <none>')
+            self.assertNotIn('logs', entries[0][1])
+            lines = oc.lines('described')
+            self.assertLess(lines.index('end configmap/cm10'), lines.index('end configmap/cm00'))
+            self.assertEqual(len(lines), 6)
+
+            # Collection runs no more than parallelism windows ahead of the consumer, and stops when the
+            # generator is closed
+            report = selector('configmap').iter_report(parallelism=2)
+            self.assertEqual(next(report)[0], 'ns:configmap/cm00')
+            report.close()
+            self.assertEqual(sorted(oc.lines('described')), ['end configmap/cm00', 'end configmap/cm10',
+                                                             'start configmap/cm00', 'start configmap/cm10'])
+
+    def test_namespace_qualified_verbs(self):
+        with FakeOc(FAKE_VERBS_OC) as oc:
+            # e.g. a frozen all_namespaces selector; each namespace's names are passed with --namespace
+            sel = selector(['ns1:deployment/a', 'ns2:deployment/b', 'ns1:deployment/c'], all_namespaces=True)
+            sel.scale(3)
+            self.assertEqual(sorted(oc.lines()), ['scale --namespace=ns1 deployment/a deployment/c --replicas=3',
+                                                  'scale --namespace=ns2 deployment/b --replicas=3'])
+
+            r = sel.raw_action('annotate', 'x=y')
+            self.assertEqual(len(r.actions()), 2)
+            self.assertEqual(sorted(oc.lines()), ['annotate --namespace=ns1 deployment/a deployment/c x=y',
+                                                  'annotate --namespace=ns2 deployment/b x=y'])
+
+            builds = selector(['ns1:bc/a', 'ns2:bc/b'], all_namespaces=True).start_build()
+            self.assertEqual(builds.qnames(), ['ns1:build/a-1', 'ns2:build/b-1'])
+            self.assertEqual(sorted(oc.lines()), ['start-build --namespace=ns1 buildconfig/a -o=name',
+                                                  'start-build --namespace=ns2 buildconfig/b -o=name'])
+
 
 if __name__ == '__main__':
     unittest.main()
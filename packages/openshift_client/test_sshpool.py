@@ -0,0 +1,170 @@
+from __future__ import absolute_import
+
+import time
+import unittest
+
+from .base_verbs import node_ssh_exec_many
+from .fakeoc import FakeCluster
+from .sshpool import SSHConnectionPool, NodeAddressCache
+
+# The only node. It has no addresses, so it cannot be reached.
+NODE = {'kind': 'Node', 'apiVersion': 'v1', 'metadata': {'name': 'a'}, 'status': {'addresses': []}}
+
+
+class _Transport(object):
+
+    def __init__(self):
+        self.active = True
+        self.keepalive = None
+
+    def is_active(self):
+        return self.active
+
+    def set_keepalive(self, interval):
+        self.keepalive = interval
+
+
+class _Client(object):
+    """
+    Stands in for a paramiko SSHClient.
+    """
+
+    def __init__(self):
+        self.transport = _Transport()
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.transport.active = False
+
+
+class TestSSHPool(unittest.TestCase):
+
+    def test_reuse(self):
+        pool = SSHConnectionPool(keepalive_seconds=15)
+        connected = []
+
+        def connect():
+            connected.append(_Client())
+            return connected[-1]
+
+        with pool.checkout('a', connect) as client:
+            self.assertEqual(client.get_transport().keepalive, 15)
+        with pool.checkout('a', connect), pool.checkout('a', connect):
+            pass
+        self.assertEqual(len(connected), 1)
+
+        pool.checkout('b', connect).close()
+        self.assertEqual(len(connected), 2)
+
+        # Lost and discarded connections are reestablished
+        connected[0].transport.active = False
+        pool.checkout('a', connect).close(discard=True)
+        self.assertEqual(len(connected), 3)
+        self.assertFalse(connected[2].transport.is_active())
+        pool.checkout('a', connect).close()
+        self.assertEqual(len(connected), 4)
+
+        pool.close()
+        self.assertEqual(len(pool), 0)
+        self.assertFalse(connected[3].transport.is_active())
+
+    def test_discard_shared(self):
+        pool = SSHConnectionPool()
+        connected = []
+
+        def connect():
+            connected.append(_Client())
+            return connected[-1]
+
+        # A client discarded while another thread uses it is closed once that thread is done with it
+        in_use = pool.checkout('a', connect)
+        pool.checkout('a', connect).close(discard=True)
+        self.assertTrue(connected[0].transport.is_active())
+        in_use.close()
+        self.assertFalse(connected[0].transport.is_active())
+        pool.checkout('a', connect).close()
+        self.assertEqual(len(connected), 2)
+
+        # A client whose connection has been lost is closed immediately
+        in_use = pool.checkout('a', connect)
+        failed = pool.checkout('a', connect)
+        connected[1].transport.active = False
+        failed.close(discard=True)
+        self.assertIsNone(pool.entries['a'].client)
+        in_use.close()
+        self.assertEqual(len(connected), 2)
+        pool.close()
+
+    def test_idle_eviction(self):
+        pool = SSHConnectionPool(idle_seconds=-1)
+        idle = _Client()
+        pool.checkout('idle', lambda: idle).close()
+        in_use = pool.checkout('in_use', _Client)
+
+        pool.checkout('other', _Client).close()
+        self.assertFalse(idle.get_transport().is_active())
+        self.assertTrue(in_use.get_transport().is_active())
+        in_use.close()
+        pool.close()
+
+    def test_idle_reaper(self):
+        pool = SSHConnectionPool(idle_seconds=0.05)
+        idle = _Client()
+        pool.checkout('idle', lambda: idle).close()
+        in_use = pool.checkout('in_use', _Client)
+
+        # Idle clients are closed even if the pool is not used again
+        for _ in range(100):
+            if not idle.get_transport().is_active():
+                break
+            time.sleep(0.01)
+        self.assertFalse(idle.get_transport().is_active())
+        self.assertTrue(in_use.get_transport().is_active())
+        self.assertEqual(len(pool), 1)
+        self.assertIsNone(pool.reaper)
+
+        in_use.close()
+        pool.close()
+        self.assertIsNone(pool.reaper)
+
+    def test_failed_connect(self):
+        pool = SSHConnectionPool()
+
+        def connect():
+            raise IOError('unreachable')
+
+        self.assertRaises(IOError, pool.checkout, 'a', connect)
+        self.assertEqual(pool.entries['a'].users, 0)
+        pool.close()
+
+    def test_node_address_cache(self):
+        cache = NodeAddressCache()
+        resolved = []
+
+        def resolve():
+            resolved.append(1)
+            return [('Hostname', 'node-1')]
+
+        self.assertEqual(cache.get('node/n', resolve), [('Hostname', 'node-1')])
+        self.assertEqual(cache.get('node/n', resolve), [('Hostname', 'node-1')])
+        self.assertEqual(len(resolved), 1)
+
+        cache.invalidate('node/n')
+        cache.get('node/n', resolve)
+        self.assertEqual(len(resolved), 2)
+
+    def test_exec_many_missing_nodes(self):
+        with FakeCluster([NODE]):
+            results = node_ssh_exec_many(['a', 'node/gone'], 'uptime')
+            self.assertEqual(sorted(results), ['node/a', 'node/gone'])
+            rc, _, err = results['node/gone']
+            self.assertIsNone(rc)
+            self.assertIn('not found', err)
+            # Other errors are also reported per node
+            self.assertIsNone(results['node/a'][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
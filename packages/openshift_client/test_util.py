@@ -1,8 +1,9 @@
 from __future__ import absolute_import
 
+import io
 import unittest
 
-from .util import extract_numerical_value
+from .util import extract_numerical_value, print_report, print_report_entries
 from .model import Missing
 
 
@@ -48,6 +49,22 @@ class TestSelector(unittest.TestCase):
         # test oc.Missing
         self.assertTrue(isclose(extract_numerical_value(Missing), 0.0))
 
+    def test_print_report_entries(self):
+        report = {'ns:pod/a': {'describe': 'Name: a'}, 'ns:pod/b': {'describe': 'Name: b'}}
+        expected = io.StringIO()
+        print_report(expected, report)
+
+        stream = io.StringIO()
+
+        def entries():
+            for fqn, details in report.items():
+                yield fqn, details
+                # Each entry is written before the next is requested
+                self.assertIn(u'[report:end]{}'.format(fqn), stream.getvalue())
+
+        print_report_entries(stream, entries())
+        self.assertEqual(stream.getvalue(), expected.getvalue())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -124,8 +124,17 @@ def print_report_entry(stream, d, initial_indent_count=0, encoding='utf-8'):
 
 
 def print_report(stream, report_dict, initial_indent_count=0, encoding='utf-8'):
+    print_report_entries(stream, six.iteritems(report_dict), initial_indent_count=initial_indent_count,
+                         encoding=encoding)
+
+
+def print_report_entries(stream, entries, initial_indent_count=0, encoding='utf-8'):
+    """
+    Like print_report, but accepts an iterable of (fqn, details) tuples (e.g. from Selector.iter_report())
+    so that each entry is written as soon as it is available.
+    """
     indent = ' ' * initial_indent_count
-    for fqn, details in six.iteritems(report_dict):
+    for fqn, details in entries:
         stream.write(u'\n{}[report:begin]{}========\n'.format(indent, fqn))
         print_report_entry(stream, details, initial_indent_count + 2, encoding=encoding)
         stream.write(u'\n{}[report:end]{}========\n'.format(indent, fqn))